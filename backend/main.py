@@ -1,8 +1,11 @@
 """Hub Chantier - Application FastAPI principale."""
 
 import logging
+import time
 from datetime import datetime
 
+_IMPORTS_STARTED_AT = time.perf_counter()
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -11,7 +14,7 @@ from slowapi.errors import RateLimitExceeded
 from sqlalchemy import text
 
 from shared.infrastructure import settings, init_db
-from shared.infrastructure.database import SessionLocal
+from shared.infrastructure.database import SessionLocal, dispose_async_engine
 
 # P2-3: Configuration logging
 logging.basicConfig(
@@ -23,8 +26,20 @@ from shared.infrastructure.rate_limiter import limiter
 from shared.infrastructure.web.security_middleware import SecurityHeadersMiddleware
 from shared.infrastructure.web.csrf_middleware import CSRFMiddleware
 from shared.infrastructure.web.rate_limit_middleware import RateLimitMiddleware
+from shared.infrastructure.web.read_your_writes_middleware import ReadYourWritesMiddleware
+from shared.infrastructure.web.metrics_middleware import MetricsMiddleware
+from shared.infrastructure.web.metrics_routes import router as metrics_router
+from shared.infrastructure.metrics import enable_metrics
 from shared.infrastructure.scheduler import get_scheduler
-from shared.infrastructure.scheduler.jobs import RappelReservationJob, CheckSignalementsRetardJob
+from shared.infrastructure.scheduler.jobs import (
+    RappelReservationJob,
+    CheckSignalementsRetardJob,
+    FlushAPIKeyUsageJob,
+    FlushNotificationDigestsJob,
+    PurgeUploadSessionsJob,
+    PurgeOrphanBlobsJob,
+)
+from shared.infrastructure.notifications import stop_push_queue
 from shared.infrastructure.notifications.register_push_handlers import register_push_notification_handlers
 from modules.auth.infrastructure.web import router as auth_router, users_router
 from modules.auth.infrastructure.web.api_keys_routes import router as api_keys_router
@@ -57,6 +72,10 @@ from shared.infrastructure.webhooks import (
 )
 from shared.infrastructure.event_bus import event_bus
 from shared.infrastructure.api_v1 import configure_openapi, get_custom_openapi_schema
+from shared.infrastructure.startup_timing import StartupTimer
+
+# Durée des imports (routers, modèles) : première phase du démarrage à froid
+IMPORTS_DURATION_S = time.perf_counter() - _IMPORTS_STARTED_AT
 
 # Créer l'application
 app = FastAPI(
@@ -93,6 +112,15 @@ app.add_middleware(CSRFMiddleware)
 # Middleware Rate Limiting avancé (L-01) - Backoff exponentiel
 app.add_middleware(RateLimitMiddleware)
 
+# Réplica de lecture : les lectures suivant une écriture restent sur la base principale
+if settings.DATABASE_READ_URL:
+    app.add_middleware(ReadYourWritesMiddleware)
+
+# Métriques de performance (ajouté en dernier : mesure toute la pile)
+if settings.METRICS_ENABLED:
+    enable_metrics()
+    app.add_middleware(MetricsMiddleware)
+
 
 # P2-8: Global exception handler
 @app.exception_handler(Exception)
@@ -135,40 +163,56 @@ async def startup_event():
     """Initialisation au démarrage."""
     logger.info(f"Démarrage de {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Mode DEBUG: {settings.DEBUG}")
-    init_db()
-    logger.info("Base de données initialisée")
-
-    # Enregistrer les handlers de notifications (comment, like, heures, chantier)
-    register_notification_handlers()
-
-    # Câbler l'intégration Planning → Pointages (FDH-10)
-    setup_planning_integration(SessionLocal)
-    logger.info("Intégration Planning → Pointages câblée")
+    timer = StartupTimer()
+    timer.record("imports", IMPORTS_DURATION_S)
 
-    # Enregistrer handlers Planning → Chantiers (GAP-CHT-002)
-    from modules.planning.infrastructure.event_handlers import register_planning_event_handlers
-    register_planning_event_handlers()
-    logger.info("Planning integration configured")
-
-    # Enregistrer handlers push (SIG-13, SIG-17, FEED-17, PLN-23)
-    register_push_notification_handlers()
-    logger.info("Handlers push notifications enregistrés (SIG-13/17, FEED-17, PLN-23)")
+    with timer.phase("schema"):
+        init_db()
+    logger.info("Base de données initialisée")
 
-    # Enregistrer le webhook event handler sur tous les événements
-    # Cela permet aux webhooks de se déclencher automatiquement à chaque événement
-    event_bus.subscribe_all(webhook_event_handler)
-    logger.info("Webhook listener enregistré sur tous les événements")
+    with timer.phase("event handlers"):
+        # Enregistrer les handlers de notifications (comment, like, heures, chantier)
+        register_notification_handlers()
+
+        # Câbler l'intégration Planning → Pointages (FDH-10)
+        setup_planning_integration(SessionLocal)
+        logger.info("Intégration Planning → Pointages câblée")
+
+        # Enregistrer handlers Planning → Chantiers (GAP-CHT-002)
+        from modules.planning.infrastructure.event_handlers import register_planning_event_handlers
+        register_planning_event_handlers()
+        logger.info("Planning integration configured")
+
+        # Enregistrer handlers push (SIG-13, SIG-17, FEED-17, PLN-23)
+        register_push_notification_handlers()
+        logger.info("Handlers push notifications enregistrés (SIG-13/17, FEED-17, PLN-23)")
+
+        # Enregistrer le webhook event handler sur tous les événements
+        # Cela permet aux webhooks de se déclencher automatiquement à chaque événement
+        event_bus.subscribe_all(webhook_event_handler)
+        logger.info("Webhook listener enregistré sur tous les événements")
+
+    with timer.phase("scheduler"):
+        # Démarrer le scheduler et enregistrer les jobs
+        scheduler = get_scheduler()
+        RappelReservationJob.register(scheduler, SessionLocal)
+        CheckSignalementsRetardJob.register(scheduler, SessionLocal)
+        FlushAPIKeyUsageJob.register(scheduler, SessionLocal)
+        FlushNotificationDigestsJob.register(scheduler, SessionLocal)
+        PurgeUploadSessionsJob.register(scheduler, SessionLocal)
+        PurgeOrphanBlobsJob.register(scheduler, SessionLocal)
+        scheduler.start()
+        logger.info(
+            "Scheduler démarré avec jobs planifiés "
+            "(rappels + retards signalements + usage clés API + digests notifications"
+            " + purge uploads)"
+        )
 
-    # Démarrer le scheduler et enregistrer les jobs
-    scheduler = get_scheduler()
-    RappelReservationJob.register(scheduler, SessionLocal)
-    CheckSignalementsRetardJob.register(scheduler, SessionLocal)
-    scheduler.start()
-    logger.info("Scheduler démarré avec jobs planifiés (rappels + retards signalements)")
+        # Démarrer le nettoyage automatique des webhook deliveries (GDPR)
+        start_cleanup_scheduler()
+        logger.info("Webhook cleanup scheduler démarré (rétention: 90 jours)")
 
-    # Démarrer le nettoyage automatique des webhook deliveries (GDPR)
-    start_cleanup_scheduler()
-    logger.info("Webhook cleanup scheduler démarré (rétention: 90 jours)")
+    logger.info(timer.summary())
 
 
 @app.on_event("shutdown")
@@ -182,6 +226,16 @@ async def shutdown_event():
     scheduler = get_scheduler()
     scheduler.shutdown(wait=True)
     logger.info("Scheduler arrêté")
+
+    # Écrire l'usage des clés API encore en mémoire
+    FlushAPIKeyUsageJob(SessionLocal).execute()
+
+    # Publier les notifications regroupées et vider la file push
+    FlushNotificationDigestsJob(SessionLocal).execute(force=True)
+    stop_push_queue()
+
+    # Fermer le pool du moteur asynchrone
+    await dispose_async_engine()
     logger.info("Arrêt de l'application")
 
 
@@ -258,5 +312,8 @@ app.include_router(notifications_sse_router, prefix="/api")
 app.include_router(notifications_router, prefix="/api")
 app.include_router(webhooks_router, prefix="/api/v1")
 
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
+
 # Futurs modules à ajouter:
 # app.include_router(employes_router, prefix="/api")
@@ -0,0 +1,33 @@
+"""add_api_keys_request_count
+
+Revision ID: 20260216_0001
+Revises: 20260215_0001
+Create Date: 2026-02-16
+
+Ajoute le compteur cumulé de requêtes par clé API. Il est alimenté par
+lots (avec last_used_at) par le tracker d'usage du middleware API v1.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '20260216_0001'
+down_revision = '20260215_0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'api_keys',
+        sa.Column(
+            'request_count',
+            sa.Integer(),
+            nullable=False,
+            server_default='0',
+            comment='Nombre cumulé de requêtes authentifiées (audit)',
+        ),
+    )
+
+
+def downgrade():
+    op.drop_column('api_keys', 'request_count')
@@ -0,0 +1,105 @@
+"""add_signalements_date_limite_resolution
+
+Revision ID: 20260217_0001
+Revises: 20260216_0001
+Create Date: 2026-02-17
+
+Persiste les échéances SLA des signalements (SIG-16) :
+- date_limite_resolution : date souhaitée, sinon création + délai de la priorité
+- date_alerte_escalade : mi-délai (première escalade)
+
+Index composites (statut, échéance) pour filtrer les retards et les
+escalades en SQL. Les lignes existantes sont renseignées par lots.
+"""
+from datetime import timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '20260217_0001'
+down_revision = '20260216_0001'
+branch_labels = None
+depends_on = None
+
+# Copie figée de Priorite.delai_traitement au moment de la migration
+DELAIS_PRIORITE = {
+    'critique': timedelta(hours=4),
+    'haute': timedelta(hours=24),
+    'moyenne': timedelta(hours=48),
+    'basse': timedelta(hours=72),
+}
+
+TAILLE_LOT = 1000
+
+
+def upgrade():
+    op.add_column(
+        'signalements',
+        sa.Column('date_limite_resolution', sa.DateTime(), nullable=True),
+    )
+    op.add_column(
+        'signalements',
+        sa.Column('date_alerte_escalade', sa.DateTime(), nullable=True),
+    )
+
+    bind = op.get_bind()
+    signalements = sa.table(
+        'signalements',
+        sa.column('id', sa.Integer),
+        sa.column('priorite', sa.String),
+        sa.column('created_at', sa.DateTime),
+        sa.column('date_resolution_souhaitee', sa.DateTime),
+        sa.column('date_limite_resolution', sa.DateTime),
+        sa.column('date_alerte_escalade', sa.DateTime),
+    )
+    stmt = (
+        signalements.update()
+        .where(signalements.c.id == sa.bindparam('b_id'))
+        .values(
+            date_limite_resolution=sa.bindparam('b_limite'),
+            date_alerte_escalade=sa.bindparam('b_alerte'),
+        )
+    )
+
+    rows = bind.execute(
+        sa.select(
+            signalements.c.id,
+            signalements.c.priorite,
+            signalements.c.created_at,
+            signalements.c.date_resolution_souhaitee,
+        ).where(signalements.c.created_at.isnot(None))
+    ).fetchall()
+
+    lot = []
+    for sig_id, priorite, created_at, date_souhaitee in rows:
+        limite = date_souhaitee or created_at + DELAIS_PRIORITE.get(
+            priorite, DELAIS_PRIORITE['moyenne']
+        )
+        lot.append({
+            'b_id': sig_id,
+            'b_limite': limite,
+            'b_alerte': created_at + (limite - created_at) / 2,
+        })
+        if len(lot) >= TAILLE_LOT:
+            bind.execute(stmt, lot)
+            lot = []
+    if lot:
+        bind.execute(stmt, lot)
+
+    op.create_index(
+        'ix_signalements_statut_date_limite',
+        'signalements',
+        ['statut', 'date_limite_resolution'],
+    )
+    op.create_index(
+        'ix_signalements_statut_date_alerte',
+        'signalements',
+        ['statut', 'date_alerte_escalade'],
+    )
+
+
+def downgrade():
+    op.drop_index('ix_signalements_statut_date_alerte', table_name='signalements')
+    op.drop_index('ix_signalements_statut_date_limite', table_name='signalements')
+    op.drop_column('signalements', 'date_alerte_escalade')
+    op.drop_column('signalements', 'date_limite_resolution')
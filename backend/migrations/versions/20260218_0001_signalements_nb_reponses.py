@@ -0,0 +1,52 @@
+"""add_signalements_nb_reponses
+
+Revision ID: 20260218_0001
+Revises: 20260217_0001
+Create Date: 2026-02-18
+
+Compteur de réponses dénormalisé sur les signalements (SIG-07) :
+nb_reponses et derniere_reponse_at, maintenus par les use cases de
+réponses. Les lignes existantes sont renseignées depuis
+reponses_signalements.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '20260218_0001'
+down_revision = '20260217_0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'signalements',
+        sa.Column('nb_reponses', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.add_column(
+        'signalements',
+        sa.Column('derniere_reponse_at', sa.DateTime(), nullable=True),
+    )
+
+    op.execute(
+        """
+        UPDATE signalements SET
+            nb_reponses = (
+                SELECT COUNT(*) FROM reponses_signalements r
+                WHERE r.signalement_id = signalements.id
+            ),
+            derniere_reponse_at = (
+                SELECT MAX(r.created_at) FROM reponses_signalements r
+                WHERE r.signalement_id = signalements.id
+            )
+        WHERE EXISTS (
+            SELECT 1 FROM reponses_signalements r
+            WHERE r.signalement_id = signalements.id
+        )
+        """
+    )
+
+
+def downgrade():
+    op.drop_column('signalements', 'derniere_reponse_at')
+    op.drop_column('signalements', 'nb_reponses')
@@ -0,0 +1,76 @@
+"""add_reference_data_versions
+
+Revision ID: 20260219_0001
+Revises: 20260218_0001
+Create Date: 2026-02-19
+
+Compteur de versions des données de référence (users, chantiers) utilisé
+par l'annuaire en mémoire (shared/infrastructure/reference_directory.py)
+pour invalider son contenu entre workers. Sur PostgreSQL, un trigger par
+instruction incrémente le compteur de la table modifiée, quel que soit le
+chemin d'écriture (ORM, SQL brut, scripts). Les UPDATE ne comptent que s'ils
+touchent une colonne servie par l'annuaire : les mises à jour de connexion
+(tentatives, jetons) ne provoquent pas de rechargement.
+
+Sans trigger, le compteur ne changerait jamais : la table n'est créée que
+sur PostgreSQL. Ailleurs, l'annuaire se recharge après un âge maximal.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '20260219_0001'
+down_revision = '20260218_0001'
+branch_labels = None
+depends_on = None
+
+# Colonnes servies par l'annuaire (COLONNES_REFERENCE)
+COLONNES = {
+    'users': (
+        'prenom', 'nom', 'email', 'role', 'couleur', 'metiers', 'photo_profil',
+        'type_utilisateur', 'is_active', 'deleted_at',
+    ),
+    'chantiers': ('code', 'nom', 'couleur', 'heures_estimees', 'statut', 'deleted_at'),
+}
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.create_table(
+        'reference_data_versions',
+        sa.Column('nom', sa.String(50), primary_key=True),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'),
+    )
+    op.bulk_insert(
+        sa.table('reference_data_versions', sa.column('nom'), sa.column('version')),
+        [{'nom': table, 'version': 0} for table in COLONNES],
+    )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_reference_data_version()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE reference_data_versions
+               SET version = version + 1
+             WHERE nom = TG_TABLE_NAME;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    for table, colonnes in COLONNES.items():
+        op.execute(f"""
+            CREATE TRIGGER {table}_bump_reference_version
+                AFTER INSERT OR DELETE OR UPDATE OF {', '.join(colonnes)} ON {table}
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION bump_reference_data_version();
+        """)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        for table in COLONNES:
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_reference_version ON {table};")
+        op.execute("DROP FUNCTION IF EXISTS bump_reference_data_version();")
+    # Peut exister hors PostgreSQL (bases créées par une version antérieure)
+    op.execute("DROP TABLE IF EXISTS reference_data_versions")
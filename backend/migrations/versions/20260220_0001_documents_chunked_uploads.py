@@ -0,0 +1,69 @@
+"""add_documents_chunked_uploads
+
+Revision ID: 20260220_0001
+Revises: 20260219_0001
+Create Date: 2026-02-20
+
+Uploads découpés et reprenables de la GED (GED-06, GED-07) :
+- table upload_sessions (fichier annoncé, propriétaire, expiration) ;
+- documents.contenu_hash : empreinte SHA-256 du contenu, le stockage est
+  partagé entre documents identiques ;
+- index sur documents.chemin_stockage pour compter les références avant
+  suppression physique ;
+- documents.taille en BIGINT (fichiers jusqu'à 10 Go).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '20260220_0001'
+down_revision = '20260219_0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'upload_sessions',
+        sa.Column('id', sa.String(32), primary_key=True),
+        sa.Column(
+            'chantier_id', sa.Integer(),
+            sa.ForeignKey('chantiers.id', ondelete='CASCADE'), nullable=False,
+        ),
+        sa.Column(
+            'dossier_id', sa.Integer(),
+            sa.ForeignKey('dossiers.id', ondelete='CASCADE'), nullable=False,
+        ),
+        sa.Column(
+            'uploaded_by', sa.Integer(),
+            sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False,
+        ),
+        sa.Column('nom_original', sa.String(255), nullable=False),
+        sa.Column('taille', sa.BigInteger(), nullable=False),
+        sa.Column('mime_type', sa.String(100), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('niveau_acces', sa.String(50), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_upload_sessions_expires_at', 'upload_sessions', ['expires_at'])
+
+    with op.batch_alter_table('documents') as batch_op:
+        batch_op.add_column(sa.Column('contenu_hash', sa.String(64), nullable=True))
+        batch_op.alter_column(
+            'taille', existing_type=sa.Integer(), type_=sa.BigInteger(), existing_nullable=False
+        )
+    op.create_index('ix_documents_contenu_hash', 'documents', ['contenu_hash'])
+    op.create_index('ix_documents_chemin_stockage', 'documents', ['chemin_stockage'])
+
+
+def downgrade():
+    op.drop_index('ix_documents_chemin_stockage', table_name='documents')
+    op.drop_index('ix_documents_contenu_hash', table_name='documents')
+    with op.batch_alter_table('documents') as batch_op:
+        batch_op.alter_column(
+            'taille', existing_type=sa.BigInteger(), type_=sa.Integer(), existing_nullable=False
+        )
+        batch_op.drop_column('contenu_hash')
+
+    op.drop_index('ix_upload_sessions_expires_at', table_name='upload_sessions')
+    op.drop_table('upload_sessions')
@@ -1,7 +1,7 @@
 """Interface UserRepository - Abstraction pour la persistence des utilisateurs."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Iterable, Optional, List
 
 from ..entities import User
 from ..value_objects import Email, Role, TypeUtilisateur
@@ -31,6 +31,19 @@ class UserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_by_ids(self, user_ids: Iterable[int]) -> List[User]:
+        """
+        Trouve plusieurs utilisateurs par leurs IDs en une requête.
+
+        Args:
+            user_ids: Les identifiants des utilisateurs.
+
+        Returns:
+            Les utilisateurs trouvés (les IDs inconnus sont ignorés).
+        """
+        pass
+
     @abstractmethod
     def find_by_email(self, email: Email) -> Optional[User]:
         """
@@ -81,6 +81,13 @@ class APIKeyModel(Base):
     last_used_at = Column(
         DateTime, nullable=True, comment="Dernière utilisation (audit)"
     )
+    request_count = Column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        default=0,
+        comment="Nombre cumulé de requêtes authentifiées (audit)",
+    )
     expires_at = Column(
         DateTime, nullable=True, index=True, comment="Date d'expiration (NULL = jamais)"
     )
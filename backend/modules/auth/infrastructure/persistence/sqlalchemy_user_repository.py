@@ -1,7 +1,7 @@
 """Implementation SQLAlchemy du UserRepository."""
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Iterable, Optional, List
 
 from sqlalchemy.orm import Session
 
@@ -53,6 +53,27 @@ class SQLAlchemyUserRepository(UserRepository):
         )
         return self._to_entity(model) if model else None
 
+    def find_by_ids(self, user_ids: Iterable[int]) -> List[User]:
+        """
+        Trouve plusieurs utilisateurs par leurs IDs (excluant les supprimes).
+
+        Args:
+            user_ids: Les identifiants.
+
+        Returns:
+            Liste des entites User trouvees.
+        """
+        ids = set(user_ids)
+        if not ids:
+            return []
+        models = (
+            self.session.query(UserModel)
+            .filter(UserModel.id.in_(ids))
+            .filter(self._not_deleted())
+            .all()
+        )
+        return [self._to_entity(m) for m in models]
+
     def find_by_email(self, email: Email) -> Optional[User]:
         """
         Trouve un utilisateur par son email (excluant les supprimes).
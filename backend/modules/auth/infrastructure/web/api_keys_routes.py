@@ -8,6 +8,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from shared.infrastructure.database import get_db
+from shared.infrastructure.api_v1.api_key_cache import get_api_key_cache
 from modules.auth.infrastructure.web.dependencies import get_current_user
 from modules.auth.infrastructure.persistence.user_model import UserModel
 
@@ -227,6 +228,9 @@ async def revoke_api_key(
 
     try:
         use_case.execute(dto)
+        # Retrait immédiat du cache de ce worker ; les autres workers revérifient
+        # en base l'état d'une clé servie par leur cache (middleware API v1)
+        get_api_key_cache().invalidate_key(str(key_id))
         return None  # 204 No Content
 
     except APIKeyNotFoundError:
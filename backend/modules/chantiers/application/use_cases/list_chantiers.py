@@ -3,6 +3,8 @@
 import logging
 from typing import Optional, List
 
+from shared.application.instrumentation import timed
+
 from ...domain.entities import Chantier
 
 logger = logging.getLogger(__name__)
@@ -67,6 +69,7 @@ class ListChantiersUseCase:
         paginated = all_items[skip : skip + limit]
         return paginated, total
 
+    @timed
     def execute(
         self,
         skip: int = 0,
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 
 from ..entities import Chantier, ContactChantierEntity, PhaseChantierEntity
 from ..value_objects import CodeChantier, StatutChantier
@@ -232,6 +232,17 @@ class ChantierRepository(ABC):
         """Liste les IDs des ouvriers assignés à un chantier."""
         pass
 
+    @abstractmethod
+    def list_ouvrier_ids_by_chantier(
+        self, chantier_ids: Iterable[int]
+    ) -> Dict[int, List[int]]:
+        """Liste les IDs des ouvriers de plusieurs chantiers en une requête.
+
+        Returns:
+            Dictionnaire {chantier_id: [user_id, ...]} (chantiers sans ouvrier absents).
+        """
+        pass
+
     @abstractmethod
     def assign_ouvrier(self, chantier_id: int, user_id: int) -> bool:
         """Assigne un ouvrier au chantier. Retourne False si déjà assigné."""
@@ -251,6 +262,17 @@ class ChantierRepository(ABC):
         """Liste tous les contacts d'un chantier."""
         pass
 
+    @abstractmethod
+    def list_contacts_by_chantier(
+        self, chantier_ids: Iterable[int]
+    ) -> Dict[int, List[ContactChantierEntity]]:
+        """Liste les contacts de plusieurs chantiers en une requête.
+
+        Returns:
+            Dictionnaire {chantier_id: [contact, ...]} (chantiers sans contact absents).
+        """
+        pass
+
     @abstractmethod
     def create_contact(
         self, chantier_id: int, nom: str, telephone: str, profession: Optional[str] = None
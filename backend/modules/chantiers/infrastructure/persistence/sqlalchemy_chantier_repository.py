@@ -1,7 +1,8 @@
 """Implémentation SQLAlchemy du ChantierRepository."""
 
+from collections import defaultdict
 from datetime import date, datetime
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import or_
@@ -48,15 +49,12 @@ class SQLAlchemyChantierRepository(ChantierRepository):
     def _eager_options(self) -> tuple:
         """Options de chargement eager pour éviter N+1 queries.
 
-        Note: Utilise joinedload au lieu de selectinload car les relations
-        utilisent des listes Python (conducteur_ids, chef_chantier_ids)
-        plutôt que des relations ORM.
+        Note: Les relations conducteurs_rel/chefs_rel sont en lazy="dynamic"
+        (incompatibles avec selectinload) : les responsables sont préchargés
+        par lot dans _to_entities(), en une requête par table de jointure.
 
         Gap: GAP-CHT-004 - Optimisation N+1 queries
         """
-        # Les relations conducteurs/chefs sont stockées comme arrays d'IDs
-        # donc pas de eager loading ORM nécessaire ici
-        # L'optimisation viendra de la réduction des requêtes dans _to_entity()
         return ()
 
     def _not_deleted(self) -> ColumnElement[bool]:
@@ -218,7 +216,7 @@ class SQLAlchemyChantierRepository(ChantierRepository):
             .limit(limit)
             .all()
         )
-        return [self._to_entity(m) for m in models]
+        return self._to_entities(models)
 
     def count(self) -> int:
         """
@@ -253,7 +251,7 @@ class SQLAlchemyChantierRepository(ChantierRepository):
             .limit(limit)
             .all()
         )
-        return [self._to_entity(m) for m in models]
+        return self._to_entities(models)
 
     def find_active(self, skip: int = 0, limit: int = 100) -> List[Chantier]:
         """
@@ -276,7 +274,7 @@ class SQLAlchemyChantierRepository(ChantierRepository):
             .limit(limit)
             .all()
         )
-        return [self._to_entity(m) for m in models]
+        return self._to_entities(models)
 
     def find_by_conducteur(
         self, conducteur_id: int, skip: int = 0, limit: int = 100
@@ -310,7 +308,7 @@ class SQLAlchemyChantierRepository(ChantierRepository):
             .limit(limit)
             .all()
         )
-        return [self._to_entity(m) for m in models]
+        return self._to_entities(models)
 
     def find_by_chef_chantier(
         self, chef_id: int, skip: int = 0, limit: int = 100
@@ -344,7 +342,7 @@ class SQLAlchemyChantierRepository(ChantierRepository):
             .limit(limit)
             .all()
         )
-        return [self._to_entity(m) for m in models]
+        return self._to_entities(models)
 
     def find_by_responsable(
         self, user_id: int, skip: int = 0, limit: int = 100
@@ -391,7 +389,7 @@ class SQLAlchemyChantierRepository(ChantierRepository):
             .limit(limit)
             .all()
         )
-        return [self._to_entity(m) for m in models]
+        return self._to_entities(models)
 
     def sync_responsables(self, chantier_id: int, conducteur_ids: List[int], chef_ids: List[int]) -> None:
         """
@@ -497,14 +495,61 @@ class SQLAlchemyChantierRepository(ChantierRepository):
             .limit(limit)
             .all()
         )
-        return [self._to_entity(m) for m in models]
+        return self._to_entities(models)
 
-    def _to_entity(self, model: ChantierModel) -> Chantier:
+    def _to_entities(self, models: List[ChantierModel]) -> List[Chantier]:
+        """
+        Convertit des modèles en entités, responsables préchargés par lot.
+
+        Deux requêtes au total (conducteurs, chefs), quel que soit le nombre
+        de chantiers, au lieu de deux par chantier via les relations dynamiques.
+
+        Args:
+            models: Les modèles SQLAlchemy.
+
+        Returns:
+            Les entités Chantier, dans le même ordre.
+        """
+        if not models:
+            return []
+        ids = [m.id for m in models]
+        conducteurs = self._responsable_ids_by_chantier(ChantierConducteurModel, ids)
+        chefs = self._responsable_ids_by_chantier(ChantierChefModel, ids)
+        return [
+            self._to_entity(m, conducteurs.get(m.id, []), chefs.get(m.id, []))
+            for m in models
+        ]
+
+    def _responsable_ids_by_chantier(
+        self, join_model, chantier_ids: List[int]
+    ) -> Dict[int, List[int]]:
+        """Lit une table de jointure pour plusieurs chantiers en une requête."""
+        rows = (
+            self.session.query(join_model.chantier_id, join_model.user_id)
+            .filter(join_model.chantier_id.in_(chantier_ids))
+            .order_by(join_model.id)
+            .all()
+        )
+        result: Dict[int, List[int]] = defaultdict(list)
+        for chantier_id, user_id in rows:
+            result[chantier_id].append(user_id)
+        return result
+
+    def _to_entity(
+        self,
+        model: ChantierModel,
+        conducteur_ids: Optional[List[int]] = None,
+        chef_ids: Optional[List[int]] = None,
+    ) -> Chantier:
         """
         Convertit un modèle SQLAlchemy en entité Domain.
 
         Args:
             model: Le modèle SQLAlchemy.
+            conducteur_ids: IDs préchargés depuis chantier_conducteurs
+                (sinon lus via la relation conducteurs_rel).
+            chef_ids: IDs préchargés depuis chantier_chefs
+                (sinon lus via la relation chefs_rel).
 
         Returns:
             L'entité Chantier.
@@ -526,11 +571,14 @@ class SQLAlchemyChantierRepository(ChantierRepository):
             )
 
         # Lire depuis les tables de jointure (source de vérité)
-        # Fallback sur JSON si tables vides (données legacy)
-        conducteur_ids = [r.user_id for r in model.conducteurs_rel] if model.conducteurs_rel else []
-        chef_ids = [r.user_id for r in model.chefs_rel] if model.chefs_rel else []
-
-        # Fallback sur colonnes JSON si tables de jointure vides
+        if conducteur_ids is None:
+            conducteur_ids = [r.user_id for r in model.conducteurs_rel] if model.conducteurs_rel else []
+        if chef_ids is None:
+            chef_ids = [r.user_id for r in model.chefs_rel] if model.chefs_rel else []
+
+        # Fallback sur colonnes JSON si tables de jointure vides (données legacy)
+        conducteur_ids = list(conducteur_ids)
+        chef_ids = list(chef_ids)
         if not conducteur_ids and model.conducteur_ids:
             conducteur_ids = list(model.conducteur_ids)
         if not chef_ids and model.chef_chantier_ids:
@@ -616,6 +664,14 @@ class SQLAlchemyChantierRepository(ChantierRepository):
         ).all()
         return [r.user_id for r in records]
 
+    def list_ouvrier_ids_by_chantier(
+        self, chantier_ids: Iterable[int]
+    ) -> Dict[int, List[int]]:
+        ids = list(set(chantier_ids))
+        if not ids:
+            return {}
+        return dict(self._responsable_ids_by_chantier(ChantierOuvrierModel, ids))
+
     def assign_ouvrier(self, chantier_id: int, user_id: int) -> bool:
         existing = self.session.query(ChantierOuvrierModel).filter(
             ChantierOuvrierModel.chantier_id == chantier_id,
@@ -651,6 +707,25 @@ class SQLAlchemyChantierRepository(ChantierRepository):
             for m in models
         ]
 
+    def list_contacts_by_chantier(
+        self, chantier_ids: Iterable[int]
+    ) -> Dict[int, List[ContactChantierEntity]]:
+        ids = list(set(chantier_ids))
+        if not ids:
+            return {}
+        models = self.session.query(ContactChantierModel).filter(
+            ContactChantierModel.chantier_id.in_(ids)
+        ).order_by(ContactChantierModel.ordre, ContactChantierModel.id).all()
+        result: Dict[int, List[ContactChantierEntity]] = defaultdict(list)
+        for m in models:
+            result[m.chantier_id].append(
+                ContactChantierEntity(
+                    id=m.id, chantier_id=m.chantier_id,
+                    nom=m.nom, telephone=m.telephone, profession=m.profession,
+                )
+            )
+        return dict(result)
+
     def create_contact(
         self, chantier_id: int, nom: str, telephone: str, profession: Optional[str] = None
     ) -> ContactChantierEntity:
@@ -1,9 +1,19 @@
 """Presenter pour transformer les entités Chantier en réponses API."""
 
-from typing import Optional, List, Dict, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Iterable, Set
 
 from .chantier_schemas import ChantierResponse, ContactResponse, UserPublicSummary
 
+if TYPE_CHECKING:
+    from modules.auth.domain.entities import User
+    from modules.auth.domain.repositories import UserRepository
+    from ...adapters.controllers import ChantierController
+    from ...application.dtos import ChantierDTO
+    from ...domain.entities import ContactChantierEntity
+
+# Champs de ChantierResponse qui nécessitent des requêtes supplémentaires
+CHAMPS_PERSONNES = ("conducteurs", "chefs", "ouvriers")
+
 
 def chantier_dto_to_dict(dto: "ChantierDTO") -> Dict[str, Any]:
     """Convertit un ChantierDTO en dictionnaire pour le presenter."""
@@ -59,20 +69,39 @@ def get_user_summary(
         UserPublicSummary avec les données publiques, ou None si non trouvé.
     """
     try:
-        user = user_repo.find_by_id(user_id)
-        if user:
-            return UserPublicSummary(
-                id=str(user.id),
-                nom=user.nom,
-                prenom=user.prenom,
-                role=user.role.value,
-                type_utilisateur=user.type_utilisateur.value,
-                metier=user.metier,
-                couleur=str(user.couleur) if user.couleur else None,
-                telephone=user.telephone if include_telephone else None,
-                is_active=user.is_active,
-            )
+        return user_to_summary(user_repo.find_by_id(user_id), include_telephone)
+    except (AttributeError, ValueError, TypeError):
+        # Erreurs de conversion de types ou attributs manquants
         return None
+
+
+def user_to_summary(
+    user: Optional["User"], include_telephone: bool = False
+) -> Optional[UserPublicSummary]:
+    """
+    Convertit une entité User déjà chargée en UserPublicSummary.
+
+    Args:
+        user: Utilisateur (None si non trouvé).
+        include_telephone: Si True, inclut le numéro de téléphone (chefs uniquement).
+
+    Returns:
+        UserPublicSummary, ou None si l'utilisateur est absent ou invalide.
+    """
+    if not user:
+        return None
+    try:
+        return UserPublicSummary(
+            id=str(user.id),
+            nom=user.nom,
+            prenom=user.prenom,
+            role=user.role.value,
+            type_utilisateur=user.type_utilisateur.value,
+            metier=user.metier,
+            couleur=str(user.couleur) if user.couleur else None,
+            telephone=user.telephone if include_telephone else None,
+            is_active=user.is_active,
+        )
     except (AttributeError, ValueError, TypeError):
         # Erreurs de conversion de types ou attributs manquants
         return None
@@ -88,7 +117,140 @@ def transform_chantier_response(
     Transforme un dictionnaire chantier du controller en ChantierResponse.
 
     Convertit les IDs des conducteurs/chefs/ouvriers en objets User complets.
+    Les contacts sont lus dans ``contacts_chantier``, comme pour la liste
+    (transform_chantiers_list), quand le repository chantiers est fourni.
+    """
+    # Récupérer les IDs des ouvriers et les contacts via le repository
+    ouvrier_ids = []
+    if chantier_repo:
+        chantier_id = chantier_dict.get("id")
+        ouvrier_ids = chantier_repo.list_ouvrier_ids(chantier_id)
+        chantier_dict = _avec_contacts(
+            chantier_dict,
+            chantier_repo.list_contacts_by_chantier([chantier_id]).get(chantier_id),
+        )
+
+    # Récupérer les objets User complets si le repo est disponible
+    conducteurs = []
+    chefs = []
+    ouvriers = []
+
+    if user_repo:
+        for uid in chantier_dict.get("conducteur_ids", []):
+            user_summary = get_user_summary(uid, user_repo)
+            if user_summary:
+                conducteurs.append(user_summary)
+
+        for uid in chantier_dict.get("chef_chantier_ids", []):
+            user_summary = get_user_summary(uid, user_repo, include_telephone=True)
+            if user_summary:
+                chefs.append(user_summary)
+
+        for uid in ouvrier_ids:
+            user_summary = get_user_summary(uid, user_repo)
+            if user_summary:
+                ouvriers.append(user_summary)
+
+    return _build_chantier_response(chantier_dict, conducteurs, chefs, ouvriers)
+
+
+def transform_chantiers_list(
+    chantiers_data: List[dict],
+    user_repo: Optional["UserRepository"] = None,
+    chantier_repo=None,
+    fields: Optional[Set[str]] = None,
+) -> List[ChantierResponse]:
     """
+    Transforme une page de chantiers en ChantierResponse, par lots.
+
+    Ouvriers, contacts et utilisateurs (conducteurs, chefs, ouvriers) sont
+    chargés en une requête chacun pour toute la page, au lieu de plusieurs
+    requêtes par chantier avec transform_chantier_response.
+
+    Args:
+        chantiers_data: Dictionnaires chantier du controller.
+        user_repo: Repository utilisateurs.
+        chantier_repo: Repository chantiers (ouvriers, contacts).
+        fields: Champs demandés (sparse fieldset). Les listes de personnes
+            et les contacts non demandés ne sont pas chargés. None = tous.
+
+    Returns:
+        Liste de ChantierResponse, dans l'ordre de chantiers_data.
+    """
+    def demande(champ: str) -> bool:
+        return fields is None or champ in fields
+
+    chantier_ids = [c.get("id") for c in chantiers_data]
+
+    ouvrier_ids_by_chantier: Dict[int, List[int]] = {}
+    contacts_by_chantier: Dict[int, list] = {}
+    if chantier_repo and chantier_ids:
+        if demande("ouvriers"):
+            ouvrier_ids_by_chantier = chantier_repo.list_ouvrier_ids_by_chantier(chantier_ids)
+        if demande("contacts"):
+            contacts_by_chantier = chantier_repo.list_contacts_by_chantier(chantier_ids)
+
+    # Un seul chargement des utilisateurs référencés par la page
+    user_ids: Set[int] = set()
+    for c in chantiers_data:
+        if demande("conducteurs"):
+            user_ids.update(c.get("conducteur_ids", []))
+        if demande("chefs"):
+            user_ids.update(c.get("chef_chantier_ids", []))
+    for ids in ouvrier_ids_by_chantier.values():
+        user_ids.update(ids)
+    users = {}
+    if user_repo and user_ids:
+        users = {u.id: u for u in user_repo.find_by_ids(user_ids)}
+
+    def summaries(ids: Iterable[int], include_telephone: bool = False) -> List[UserPublicSummary]:
+        result = []
+        for uid in ids:
+            summary = user_to_summary(users.get(uid), include_telephone)
+            if summary:
+                result.append(summary)
+        return result
+
+    responses = []
+    for c in chantiers_data:
+        chantier_id = c.get("id")
+        c = _avec_contacts(c, contacts_by_chantier.get(chantier_id))
+        responses.append(
+            _build_chantier_response(
+                c,
+                conducteurs=summaries(c.get("conducteur_ids", [])) if demande("conducteurs") else [],
+                chefs=(
+                    summaries(c.get("chef_chantier_ids", []), include_telephone=True)
+                    if demande("chefs") else []
+                ),
+                ouvriers=summaries(ouvrier_ids_by_chantier.get(chantier_id, [])),
+            )
+        )
+    return responses
+
+
+def _avec_contacts(
+    chantier_dict: dict, contacts: Optional[List["ContactChantierEntity"]]
+) -> dict:
+    """Remplace les contacts du dictionnaire par ceux de ``contacts_chantier``, s'il y en a."""
+    if not contacts:
+        return chantier_dict
+    return {
+        **chantier_dict,
+        "contacts": [
+            {"nom": c.nom, "profession": c.profession, "telephone": c.telephone}
+            for c in contacts
+        ],
+    }
+
+
+def _build_chantier_response(
+    chantier_dict: dict,
+    conducteurs: List[UserPublicSummary],
+    chefs: List[UserPublicSummary],
+    ouvriers: List[UserPublicSummary],
+) -> ChantierResponse:
+    """Construit la ChantierResponse à partir des personnes déjà résolues."""
     # Récupérer les coordonnées GPS
     coords = chantier_dict.get("coordonnees_gps") or {}
     latitude = coords.get("latitude") if coords else None
@@ -118,36 +280,6 @@ def transform_chantier_response(
             telephone=contact_telephone,
         )]
 
-    # Récupérer les IDs des conducteurs et chefs
-    conducteur_ids = chantier_dict.get("conducteur_ids", [])
-    chef_chantier_ids = chantier_dict.get("chef_chantier_ids", [])
-
-    # Récupérer les IDs des ouvriers via le repository
-    ouvrier_ids = []
-    if chantier_repo:
-        ouvrier_ids = chantier_repo.list_ouvrier_ids(chantier_dict.get("id"))
-
-    # Récupérer les objets User complets si le repo est disponible
-    conducteurs = []
-    chefs = []
-    ouvriers = []
-
-    if user_repo:
-        for uid in conducteur_ids:
-            user_summary = get_user_summary(uid, user_repo)
-            if user_summary:
-                conducteurs.append(user_summary)
-
-        for uid in chef_chantier_ids:
-            user_summary = get_user_summary(uid, user_repo, include_telephone=True)
-            if user_summary:
-                chefs.append(user_summary)
-
-        for uid in ouvrier_ids:
-            user_summary = get_user_summary(uid, user_repo)
-            if user_summary:
-                ouvriers.append(user_summary)
-
     return ChantierResponse(
         id=str(chantier_dict.get("id", "")),
         code=chantier_dict.get("code", ""),
@@ -3,11 +3,14 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from ...adapters.controllers import ChantierController
-from shared.infrastructure.database import get_db
+from shared.infrastructure.database import get_async_db, get_db, run_in_session
 from ...application.use_cases import (
     CodeChantierAlreadyExistsError,
     InvalidDatesError,
@@ -21,8 +24,18 @@ from ...application.use_cases import (
     FermetureForceeNonAutoriseeError,
 )
 from ...domain.events.chantier_created import ChantierCreatedEvent
-from .dependencies import get_chantier_controller, get_chantier_repository, get_user_repository, get_fermer_chantier_use_case
-from .chantier_presenter import transform_chantier_response, chantier_dto_to_dict
+from .dependencies import (
+    build_chantier_controller,
+    get_chantier_controller,
+    get_chantier_repository,
+    get_user_repository,
+    get_fermer_chantier_use_case,
+)
+from .chantier_presenter import (
+    transform_chantier_response,
+    transform_chantiers_list,
+    chantier_dto_to_dict,
+)
 from .chantier_schemas import (
     CoordonneesGPSResponse, ContactResponse, ContactRequest,
     ContactChantierResponse, ContactChantierCreate, ContactChantierUpdate,
@@ -57,6 +70,7 @@ async def create_chantier(
     request: CreateChantierRequest,
     event_bus: EventBus = Depends(get_event_bus),
     controller: ChantierController = Depends(get_chantier_controller),
+    chantier_repo=Depends(get_chantier_repository),
     user_repo: "UserRepository" = Depends(get_user_repository),
     current_user_id: int = Depends(get_current_user_id),
     _role: str = Depends(require_conducteur_or_admin),  # RBAC: conducteur ou admin requis
@@ -72,6 +86,7 @@ async def create_chantier(
         event_bus: Event bus for publishing domain events.
         controller: Controller des chantiers.
         user_repo: Repository utilisateurs.
+        chantier_repo: Repository chantiers (ouvriers, contacts).
         current_user_id: ID de l'utilisateur connecté.
 
     Returns:
@@ -124,7 +139,7 @@ async def create_chantier(
             }
         ))
 
-        return transform_chantier_response(result, controller, user_repo)
+        return transform_chantier_response(result, controller, user_repo, chantier_repo)
     except CodeChantierAlreadyExistsError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -147,39 +162,73 @@ CHANTIERS_SPECIAUX_CODES = ['CONGES', 'MALADIE', 'FORMATION', 'RTT', 'ABSENT']
 
 
 @router.get("", response_model=ChantierListResponse)
-def list_chantiers(
+async def list_chantiers(
     page: int = Query(1, ge=1, description="Numéro de page"),
     size: int = Query(100, ge=1, le=500, description="Nombre d'éléments par page"),
     statut: Optional[str] = Query(None, description="Filtrer par statut"),
     search: Optional[str] = Query(None, max_length=100, description="Recherche par nom ou code"),
     exclude_special: bool = Query(True, description="Exclure les chantiers spéciaux (absences)"),
-    controller: ChantierController = Depends(get_chantier_controller),
-    chantier_repo=Depends(get_chantier_repository),
-    user_repo: "UserRepository" = Depends(get_user_repository),
+    fields: Optional[str] = Query(
+        None,
+        max_length=500,
+        description=(
+            "Champs à retourner, séparés par des virgules (ex: id,code,nom,statut). "
+            "Les listes de personnes non demandées ne sont pas chargées."
+        ),
+    ),
+    db: AsyncSession = Depends(get_async_db),
     current_user_id: int = Depends(get_current_user_id),
 ) -> ChantierListResponse:
     """Liste les chantiers avec pagination et filtres."""
+    champs = None
+    if fields:
+        champs = {f.strip() for f in fields.split(",") if f.strip()} | {"id"}
+        inconnus = champs - set(ChantierResponse.model_fields)
+        if inconnus:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Champs inconnus: {', '.join(sorted(inconnus))}",
+            )
+
     # Convertir page/size en skip/limit
     skip = (page - 1) * size
 
     # Codes à exclure si exclude_special est True
     exclude_codes = CHANTIERS_SPECIAUX_CODES if exclude_special else None
 
-    result = controller.list(
-        skip=skip,
-        limit=size,
-        statut=statut,
-        search=search,
-        exclude_codes=exclude_codes,
-    )
+    def charger_page(session: Session):
+        result = build_chantier_controller(session).list(
+            skip=skip,
+            limit=size,
+            statut=statut,
+            search=search,
+            exclude_codes=exclude_codes,
+        )
+        items = transform_chantiers_list(
+            result.get("chantiers", []),
+            get_user_repository(session),
+            get_chantier_repository(session),
+            fields=champs,
+        )
+        return result.get("total", 0), items
+
+    total, items = await run_in_session(db, charger_page)
 
     # Convertir au format frontend
-    total = result.get("total", 0)
     pages = (total + size - 1) // size if size > 0 else 0
-    chantiers_data = result.get("chantiers", [])
+
+    if champs is not None:
+        # Réponse partielle : hors du modèle de réponse complet
+        return JSONResponse(jsonable_encoder({
+            "items": [item.model_dump(include=champs) for item in items],
+            "total": total,
+            "page": page,
+            "size": size,
+            "pages": pages,
+        }))
 
     return ChantierListResponse(
-        items=[transform_chantier_response(c, controller, user_repo, chantier_repo) for c in chantiers_data],
+        items=items,
         total=total,
         page=page,
         size=size,
@@ -210,6 +259,7 @@ def get_chantier(
 def get_chantier_by_code(
     code: str,
     controller: ChantierController = Depends(get_chantier_controller),
+    chantier_repo=Depends(get_chantier_repository),
     user_repo: "UserRepository" = Depends(get_user_repository),
     current_user_id: int = Depends(get_current_user_id),
 ) -> ChantierResponse:
@@ -220,6 +270,7 @@ def get_chantier_by_code(
         code: Code du chantier (ex: A001).
         controller: Controller des chantiers.
         user_repo: Repository utilisateurs.
+        chantier_repo: Repository chantiers (ouvriers, contacts).
         current_user_id: ID de l'utilisateur connecté.
 
     Returns:
@@ -230,7 +281,7 @@ def get_chantier_by_code(
     """
     try:
         result = controller.get_by_code(code)
-        return transform_chantier_response(result, controller, user_repo)
+        return transform_chantier_response(result, controller, user_repo, chantier_repo)
     except ChantierNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -243,6 +294,7 @@ def update_chantier(
     chantier_id: int,
     request: UpdateChantierRequest,
     controller: ChantierController = Depends(get_chantier_controller),
+    chantier_repo=Depends(get_chantier_repository),
     user_repo: "UserRepository" = Depends(get_user_repository),
     current_user_id: int = Depends(get_current_user_id),
     _role: str = Depends(require_conducteur_or_admin),  # RBAC: conducteur ou admin requis
@@ -257,6 +309,7 @@ def update_chantier(
         request: Données de mise à jour.
         controller: Controller des chantiers.
         user_repo: Repository utilisateurs.
+        chantier_repo: Repository chantiers (ouvriers, contacts).
         current_user_id: ID de l'utilisateur connecté.
 
     Returns:
@@ -297,7 +350,7 @@ def update_chantier(
             batiment_plus_2ans=request.batiment_plus_2ans,
             usage_habitation=request.usage_habitation,
         )
-        response = transform_chantier_response(result, controller, user_repo)
+        response = transform_chantier_response(result, controller, user_repo, chantier_repo)
         return response
     except ChantierNotFoundError as e:
         raise HTTPException(
@@ -377,6 +430,7 @@ def change_statut(
     chantier_id: int,
     request: ChangeStatutRequest,
     controller: ChantierController = Depends(get_chantier_controller),
+    chantier_repo=Depends(get_chantier_repository),
     user_repo: "UserRepository" = Depends(get_user_repository),
     current_user_id: int = Depends(get_current_user_id),
     _role: str = Depends(require_conducteur_or_admin),  # RBAC: conducteur ou admin requis
@@ -397,6 +451,7 @@ def change_statut(
         request: Nouveau statut.
         controller: Controller des chantiers.
         user_repo: Repository utilisateurs.
+        chantier_repo: Repository chantiers (ouvriers, contacts).
         current_user_id: ID de l'utilisateur connecté.
 
     Returns:
@@ -409,7 +464,7 @@ def change_statut(
     """
     try:
         result = controller.change_statut(chantier_id, request.statut)
-        return transform_chantier_response(result, controller, user_repo)
+        return transform_chantier_response(result, controller, user_repo, chantier_repo)
     except PrerequisReceptionNonRemplisError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -441,6 +496,7 @@ def change_statut(
 def demarrer_chantier(
     chantier_id: int,
     controller: ChantierController = Depends(get_chantier_controller),
+    chantier_repo=Depends(get_chantier_repository),
     user_repo: "UserRepository" = Depends(get_user_repository),
     current_user_id: int = Depends(get_current_user_id),
     _role: str = Depends(require_conducteur_or_admin),  # RBAC
@@ -448,7 +504,7 @@ def demarrer_chantier(
     """Passe le chantier en statut 'En cours'. RBAC: conducteur ou admin requis."""
     try:
         result = controller.demarrer(chantier_id)
-        return transform_chantier_response(result, controller, user_repo)
+        return transform_chantier_response(result, controller, user_repo, chantier_repo)
     except ChantierNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -465,6 +521,7 @@ def demarrer_chantier(
 def receptionner_chantier(
     chantier_id: int,
     controller: ChantierController = Depends(get_chantier_controller),
+    chantier_repo=Depends(get_chantier_repository),
     user_repo: "UserRepository" = Depends(get_user_repository),
     current_user_id: int = Depends(get_current_user_id),
     _role: str = Depends(require_conducteur_or_admin),  # RBAC
@@ -472,7 +529,7 @@ def receptionner_chantier(
     """Passe le chantier en statut 'Réceptionné'. RBAC: conducteur ou admin requis."""
     try:
         result = controller.receptionner(chantier_id)
-        return transform_chantier_response(result, controller, user_repo)
+        return transform_chantier_response(result, controller, user_repo, chantier_repo)
     except ChantierNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -490,6 +547,7 @@ def fermer_chantier(
     chantier_id: int,
     force: bool = Query(False, description="Forcer la fermeture sans verification des pre-requis"),
     use_case: FermerChantierUseCase = Depends(get_fermer_chantier_use_case),
+    chantier_repo=Depends(get_chantier_repository),
     user_repo: "UserRepository" = Depends(get_user_repository),
     current_user_id: int = Depends(get_current_user_id),
     _role: str = Depends(require_conducteur_or_admin),  # RBAC
@@ -509,6 +567,7 @@ def fermer_chantier(
         force: Si True, ignore les verifications de pre-requis.
         use_case: Use case de fermeture.
         user_repo: Repository utilisateurs.
+        chantier_repo: Repository chantiers (ouvriers, contacts).
         current_user_id: ID de l'utilisateur connecte.
 
     Returns:
@@ -528,7 +587,7 @@ def fermer_chantier(
             user_id=current_user_id,
         )
         chantier_dict = chantier_dto_to_dict(result.chantier)
-        return transform_chantier_response(chantier_dict, None, user_repo)
+        return transform_chantier_response(chantier_dict, None, user_repo, chantier_repo)
     except FermetureForceeNonAutoriseeError as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -566,6 +625,7 @@ def assigner_conducteur(
     chantier_id: int,
     request: AssignResponsableRequest,
     controller: ChantierController = Depends(get_chantier_controller),
+    chantier_repo=Depends(get_chantier_repository),
     user_repo: "UserRepository" = Depends(get_user_repository),
     current_user_id: int = Depends(get_current_user_id),
     _role: str = Depends(require_conducteur_or_admin),  # RBAC
@@ -580,6 +640,7 @@ def assigner_conducteur(
         request: ID du conducteur à assigner.
         controller: Controller des chantiers.
         user_repo: Repository utilisateurs.
+        chantier_repo: Repository chantiers (ouvriers, contacts).
         current_user_id: ID de l'utilisateur connecté.
 
     Returns:
@@ -587,7 +648,7 @@ def assigner_conducteur(
     """
     try:
         result = controller.assigner_conducteur(chantier_id, request.user_id)
-        return transform_chantier_response(result, controller, user_repo)
+        return transform_chantier_response(result, controller, user_repo, chantier_repo)
     except ChantierNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -600,6 +661,7 @@ def retirer_conducteur(
     chantier_id: int,
     user_id: int,
     controller: ChantierController = Depends(get_chantier_controller),
+    chantier_repo=Depends(get_chantier_repository),
     user_repo: "UserRepository" = Depends(get_user_repository),
     current_user_id: int = Depends(get_current_user_id),
     _role: str = Depends(require_conducteur_or_admin),  # RBAC
@@ -607,7 +669,7 @@ def retirer_conducteur(
     """Retire un conducteur du chantier. RBAC: conducteur ou admin requis."""
     try:
         result = controller.retirer_conducteur(chantier_id, user_id)
-        return transform_chantier_response(result, controller, user_repo)
+        return transform_chantier_response(result, controller, user_repo, chantier_repo)
     except ChantierNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -620,6 +682,7 @@ def assigner_chef_chantier(
     chantier_id: int,
     request: AssignResponsableRequest,
     controller: ChantierController = Depends(get_chantier_controller),
+    chantier_repo=Depends(get_chantier_repository),
     user_repo: "UserRepository" = Depends(get_user_repository),
     current_user_id: int = Depends(get_current_user_id),
     _role: str = Depends(require_conducteur_or_admin),  # RBAC
@@ -634,6 +697,7 @@ def assigner_chef_chantier(
         request: ID du chef à assigner.
         controller: Controller des chantiers.
         user_repo: Repository utilisateurs.
+        chantier_repo: Repository chantiers (ouvriers, contacts).
         current_user_id: ID de l'utilisateur connecté.
 
     Returns:
@@ -641,7 +705,7 @@ def assigner_chef_chantier(
     """
     try:
         result = controller.assigner_chef_chantier(chantier_id, request.user_id)
-        return transform_chantier_response(result, controller, user_repo)
+        return transform_chantier_response(result, controller, user_repo, chantier_repo)
     except ChantierNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -654,6 +718,7 @@ def retirer_chef_chantier(
     chantier_id: int,
     user_id: int,
     controller: ChantierController = Depends(get_chantier_controller),
+    chantier_repo=Depends(get_chantier_repository),
     user_repo: "UserRepository" = Depends(get_user_repository),
     current_user_id: int = Depends(get_current_user_id),
     _role: str = Depends(require_conducteur_or_admin),  # RBAC
@@ -661,7 +726,7 @@ def retirer_chef_chantier(
     """Retire un chef de chantier. RBAC: conducteur ou admin requis."""
     try:
         result = controller.retirer_chef_chantier(chantier_id, user_id)
-        return transform_chantier_response(result, controller, user_repo)
+        return transform_chantier_response(result, controller, user_repo, chantier_repo)
     except ChantierNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
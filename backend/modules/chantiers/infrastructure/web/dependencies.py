@@ -181,3 +181,21 @@ def get_chantier_controller(
         change_statut_use_case=change_statut_use_case,
         assign_responsable_use_case=assign_responsable_use_case,
     )
+
+
+def build_chantier_controller(db: Session) -> ChantierController:
+    """Construit le controller des chantiers sur une session donnée.
+
+    Utilisé par les routes asynchrones (get_async_db), qui exécutent le
+    controller dans run_in_session au lieu de passer par Depends(get_db).
+    """
+    chantier_repo = get_chantier_repository(db)
+    return get_chantier_controller(
+        create_use_case=get_create_chantier_use_case(chantier_repo),
+        get_use_case=get_get_chantier_use_case(chantier_repo),
+        list_use_case=get_list_chantiers_use_case(chantier_repo),
+        update_use_case=get_update_chantier_use_case(chantier_repo),
+        delete_use_case=get_delete_chantier_use_case(chantier_repo),
+        change_statut_use_case=get_change_statut_use_case(chantier_repo, db),
+        assign_responsable_use_case=get_assign_responsable_use_case(chantier_repo),
+    )
@@ -2,6 +2,8 @@
 
 from typing import Optional, List
 
+from shared.application.instrumentation import timed
+
 from ...domain.repositories import PostRepository, LikeRepository, CommentRepository
 from ..dtos import PostDTO, PostListDTO
 
@@ -41,6 +43,7 @@ class GetFeedUseCase:
         self.like_repo = like_repo
         self.comment_repo = comment_repo
 
+    @timed
     def execute(
         self,
         user_id: int,
@@ -80,24 +83,22 @@ class GetFeedUseCase:
         if has_next:
             posts = posts[:limit]  # Ne retourner que limit posts
 
+        # Compteurs de toute la page en une requête chacun
+        post_ids = [post.id for post in posts]
+        likes_counts = self.like_repo.count_by_posts(post_ids) if self.like_repo else {}
+        comments_counts = (
+            self.comment_repo.count_by_posts(post_ids) if self.comment_repo else {}
+        )
+
         # Convertir en DTOs avec compteurs
-        post_dtos = []
-        for post in posts:
-            likes_count = 0
-            comments_count = 0
-
-            if self.like_repo:
-                likes_count = self.like_repo.count_by_post(post.id)
-            if self.comment_repo:
-                comments_count = self.comment_repo.count_by_post(post.id)
-
-            post_dtos.append(
-                PostDTO.from_entity(
-                    post,
-                    likes_count=likes_count,
-                    comments_count=comments_count,
-                )
+        post_dtos = [
+            PostDTO.from_entity(
+                post,
+                likes_count=likes_counts.get(post.id, 0),
+                comments_count=comments_counts.get(post.id, 0),
             )
+            for post in posts
+        ]
 
         # Total approximatif (has_next est plus fiable pour infinite scroll)
         total = offset + len(posts) + (1 if has_next else 0)
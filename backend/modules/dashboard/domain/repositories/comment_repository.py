@@ -1,7 +1,7 @@
 """Interface CommentRepository - Contrat pour la persistance des commentaires."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from ..entities import Comment
 
@@ -81,6 +81,19 @@ class CommentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def count_by_posts(self, post_ids: List[int]) -> Dict[int, int]:
+        """
+        Compte les commentaires de plusieurs posts en une requête.
+
+        Args:
+            post_ids: IDs des posts.
+
+        Returns:
+            Nombre de commentaires par ID de post (0 pour les posts sans commentaire).
+        """
+        pass
+
     @abstractmethod
     def delete(self, comment_id: int) -> bool:
         """
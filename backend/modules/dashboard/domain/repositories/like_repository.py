@@ -1,7 +1,7 @@
 """Interface LikeRepository - Contrat pour la persistance des likes."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from ..entities import Like
 
@@ -94,6 +94,19 @@ class LikeRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def count_by_posts(self, post_ids: List[int]) -> Dict[int, int]:
+        """
+        Compte les likes de plusieurs posts en une requête.
+
+        Args:
+            post_ids: IDs des posts.
+
+        Returns:
+            Nombre de likes par ID de post (0 pour les posts sans like).
+        """
+        pass
+
     @abstractmethod
     def delete(self, like_id: int) -> bool:
         """
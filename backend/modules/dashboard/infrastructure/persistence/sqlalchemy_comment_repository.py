@@ -1,7 +1,8 @@
 """Implémentation SQLAlchemy du CommentRepository."""
 
-from typing import Optional, List
+from typing import Dict, Optional, List
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ...domain.entities import Comment
@@ -86,6 +87,20 @@ class SQLAlchemyCommentRepository(CommentRepository):
             .count()
         )
 
+    def count_by_posts(self, post_ids: List[int]) -> Dict[int, int]:
+        """Compte les commentaires de plusieurs posts (GROUP BY post_id)."""
+        counts = dict.fromkeys(post_ids, 0)
+        if post_ids:
+            rows = (
+                self.session.query(CommentModel.post_id, func.count(CommentModel.id))
+                .filter(CommentModel.post_id.in_(post_ids))
+                .filter(CommentModel.is_deleted == False)
+                .group_by(CommentModel.post_id)
+                .all()
+            )
+            counts.update(rows)
+        return counts
+
     def delete(self, comment_id: int) -> bool:
         """Supprime physiquement un commentaire."""
         model = (
@@ -1,7 +1,8 @@
 """Implémentation SQLAlchemy du LikeRepository."""
 
-from typing import Optional, List
+from typing import Dict, Optional, List
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ...domain.entities import Like
@@ -75,6 +76,19 @@ class SQLAlchemyLikeRepository(LikeRepository):
             .count()
         )
 
+    def count_by_posts(self, post_ids: List[int]) -> Dict[int, int]:
+        """Compte les likes de plusieurs posts (GROUP BY post_id)."""
+        counts = dict.fromkeys(post_ids, 0)
+        if post_ids:
+            rows = (
+                self.session.query(LikeModel.post_id, func.count(LikeModel.id))
+                .filter(LikeModel.post_id.in_(post_ids))
+                .group_by(LikeModel.post_id)
+                .all()
+            )
+            counts.update(rows)
+        return counts
+
     def delete(self, like_id: int) -> bool:
         """Supprime un like."""
         model = (
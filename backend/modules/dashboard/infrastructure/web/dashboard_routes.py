@@ -6,7 +6,6 @@ from typing import Optional, List
 
 from ...application.use_cases import (
     PublishPostUseCase,
-    GetFeedUseCase,
     GetPostUseCase,
     DeletePostUseCase,
     PinPostUseCase,
@@ -23,7 +22,7 @@ from ...application.use_cases.remove_like import LikeNotFoundError
 from ...application.dtos import CreatePostDTO, CreateCommentDTO, PostDTO
 from .dependencies import (
     get_publish_post_use_case,
-    get_feed_use_case,
+    build_feed_use_case,
     get_post_use_case,
     get_delete_post_use_case,
     get_pin_post_use_case,
@@ -32,8 +31,9 @@ from .dependencies import (
     get_remove_like_use_case,
 )
 from shared.infrastructure.web import get_current_user_id, get_is_moderator, get_current_user_chantier_ids
-from shared.infrastructure.database import get_db
+from shared.infrastructure.database import get_async_db, get_db, run_in_session
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
@@ -139,13 +139,12 @@ class CreateCommentRequest(BaseModel):
 
 
 @router.get("/feed", response_model=PostListResponse)
-def get_feed(
+async def get_feed(
     page: int = Query(default=1, ge=1, description="Numéro de page"),
     size: int = Query(default=20, ge=1, le=100, description="Nombre d'éléments par page"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user_id: int = Depends(get_current_user_id),
     user_chantier_ids: list[int] | None = Depends(get_current_user_chantier_ids),
-    use_case: GetFeedUseCase = Depends(get_feed_use_case),
 ):
     """
     Récupère le fil d'actualités de l'utilisateur (FEED-09, FEED-18).
@@ -160,17 +159,19 @@ def get_feed(
     # Convertir page/size en offset/limit
     offset = (page - 1) * size
 
-    result = use_case.execute(
-        user_id=current_user_id,
-        user_chantier_ids=user_chantier_ids,
-        limit=size,
-        offset=offset,
-        include_archived=False,
-    )
+    def charger_feed(session: Session):
+        result = build_feed_use_case(session).execute(
+            user_id=current_user_id,
+            user_chantier_ids=user_chantier_ids,
+            limit=size,
+            offset=offset,
+            include_archived=False,
+        )
+        # Charger les données utilisateur pour tous les auteurs des posts
+        author_ids = list({p.author_id for p in result.posts})
+        return result, _load_users_by_ids(author_ids, session)
 
-    # Charger les données utilisateur pour tous les auteurs des posts
-    author_ids = list({p.author_id for p in result.posts})
-    users_cache = _load_users_by_ids(author_ids, db)
+    result, users_cache = await run_in_session(db, charger_feed)
 
     # Convertir au format frontend
     total = result.total
@@ -67,6 +67,15 @@ def get_feed_use_case(
     )
 
 
+def build_feed_use_case(db: Session) -> GetFeedUseCase:
+    """Construit le use case du feed sur une session donnée (routes asynchrones)."""
+    return get_feed_use_case(
+        post_repo=get_post_repository(db),
+        like_repo=get_like_repository(db),
+        comment_repo=get_comment_repository(db),
+    )
+
+
 def get_post_use_case(
     post_repo: SQLAlchemyPostRepository = Depends(get_post_repository),
     like_repo: SQLAlchemyLikeRepository = Depends(get_like_repository),
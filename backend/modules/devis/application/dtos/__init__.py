@@ -7,7 +7,13 @@ from .devis_dtos import (
 from .lot_dtos import LotDevisDTO, LotDevisCreateDTO, LotDevisUpdateDTO
 from .ligne_dtos import LigneDevisDTO, LigneDevisCreateDTO, LigneDevisUpdateDTO
 from .debourse_dtos import DebourseDetailDTO, DebourseDetailCreateDTO
-from .dashboard_dtos import KPIDevisDTO, DevisRecentDTO, DashboardDevisDTO
+from .dashboard_dtos import (
+    KPIDevisDTO,
+    DevisRecentDTO,
+    DashboardDevisDTO,
+    TendancePipelineDTO,
+    TendancesPipelineDTO,
+)
 from .attestation_tva_dtos import AttestationTVACreateDTO, AttestationTVADTO, EligibiliteTVADTO
 from .frais_chantier_dtos import FraisChantierCreateDTO, FraisChantierUpdateDTO, FraisChantierDTO
 from .convertir_devis_dto import ConvertirDevisOptionsDTO, ConvertirDevisResultDTO
@@ -49,6 +55,8 @@ __all__ = [
     "KPIDevisDTO",
     "DevisRecentDTO",
     "DashboardDevisDTO",
+    "TendancePipelineDTO",
+    "TendancesPipelineDTO",
     "AttestationTVACreateDTO",
     "AttestationTVADTO",
     "EligibiliteTVADTO",
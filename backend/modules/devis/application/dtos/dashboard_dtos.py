@@ -85,3 +85,45 @@ class DashboardDevisDTO:
             "kpi": self.kpi.to_dict(),
             "derniers_devis": [d.to_dict() for d in self.derniers_devis],
         }
+
+
+@dataclass
+class TendancePipelineDTO:
+    """DTO pour une periode des tendances du pipeline commercial."""
+
+    periode: str
+    nb_crees: int = 0
+    montant_cree_ht: str = "0"
+    nb_pipeline: int = 0
+    montant_pipeline_ht: str = "0"
+    nb_accepte: int = 0
+    montant_accepte_ht: str = "0"
+    taux_conversion: str = "0"
+
+    def to_dict(self) -> dict:
+        """Convertit le DTO en dictionnaire."""
+        return {
+            "periode": self.periode,
+            "nb_crees": self.nb_crees,
+            "montant_cree_ht": self.montant_cree_ht,
+            "nb_pipeline": self.nb_pipeline,
+            "montant_pipeline_ht": self.montant_pipeline_ht,
+            "nb_accepte": self.nb_accepte,
+            "montant_accepte_ht": self.montant_accepte_ht,
+            "taux_conversion": self.taux_conversion,
+        }
+
+
+@dataclass
+class TendancesPipelineDTO:
+    """DTO des tendances du pipeline commercial par periode (DEV-17)."""
+
+    granularite: str
+    periodes: List[TendancePipelineDTO] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Convertit le DTO en dictionnaire."""
+        return {
+            "granularite": self.granularite,
+            "periodes": [p.to_dict() for p in self.periodes],
+        }
@@ -6,6 +6,7 @@ Ce port definit l'interface abstraite pour la generation de PDF.
 L'implementation concrete (fpdf2, reportlab, etc.) est dans infrastructure/pdf/.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from ..dtos.devis_dtos import DevisDetailDTO
@@ -29,3 +30,28 @@ class IPDFGenerator(ABC):
             Le contenu du PDF en bytes.
         """
         ...
+
+    async def generate_async(self, devis: DevisDetailDTO) -> bytes:
+        """Genere le PDF sans bloquer la boucle d'evenements.
+
+        Par defaut, generate s'execute dans un thread ; les implementations
+        qui rendent dans un pool de processus peuvent l'attendre directement.
+
+        Args:
+            devis: Le DTO detaille du devis (vue client, sans debourses/marges).
+
+        Returns:
+            Le contenu du PDF en bytes.
+        """
+        return await asyncio.to_thread(self.generate, devis)
+
+    def prerender(self, devis: DevisDetailDTO) -> None:
+        """Prepare le PDF du devis sans attendre le rendu.
+
+        Appele lors d'un changement d'etat (ex: devis envoye) pour que le
+        premier telechargement soit immediat. Par defaut, ne fait rien.
+
+        Args:
+            devis: Le DTO detaille du devis (vue client).
+        """
+        return None
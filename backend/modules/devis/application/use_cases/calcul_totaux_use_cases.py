@@ -10,6 +10,7 @@ from decimal import Decimal
 from typing import Dict, List, Optional, TYPE_CHECKING
 
 from shared.domain.calcul_financier import arrondir_montant, calculer_ttc, calculer_tva
+from shared.application.instrumentation import timed
 
 if TYPE_CHECKING:
     from ...domain.entities.devis import Devis
@@ -54,6 +55,7 @@ class CalculerTotauxDevisUseCase:
         self._journal_repository = journal_repository
         self._frais_chantier_repository = frais_chantier_repository
 
+    @timed
     def execute(self, devis_id: int, updated_by: int) -> dict:
         """Recalcule tous les totaux du devis.
 
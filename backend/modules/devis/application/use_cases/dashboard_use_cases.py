@@ -3,11 +3,46 @@
 DEV-17: Tableau de bord devis - KPI pipeline commercial.
 """
 
+from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Optional, Tuple
 
 from ...domain.value_objects import StatutDevis
 from ...domain.repositories.devis_repository import DevisRepository
-from ..dtos.dashboard_dtos import DashboardDevisDTO, KPIDevisDTO, DevisRecentDTO
+from ..dtos.dashboard_dtos import (
+    DashboardDevisDTO,
+    KPIDevisDTO,
+    DevisRecentDTO,
+    TendancePipelineDTO,
+    TendancesPipelineDTO,
+)
+
+# Statuts du pipeline = devis en cours (pas brouillon, pas final)
+STATUTS_PIPELINE = (
+    StatutDevis.EN_VALIDATION.value,
+    StatutDevis.ENVOYE.value,
+    StatutDevis.VU.value,
+    StatutDevis.EN_NEGOCIATION.value,
+)
+
+# Statuts decides, base du taux de conversion
+STATUTS_DECIDES = (
+    StatutDevis.ACCEPTE.value,
+    StatutDevis.REFUSE.value,
+    StatutDevis.PERDU.value,
+)
+
+GRANULARITES = ("mois", "trimestre")
+
+
+def _taux_conversion(nb_accepte: int, nb_decides: int) -> str:
+    """Taux conversion = acceptes / (acceptes + refuses + perdus), en %."""
+    taux = (
+        Decimal(str(nb_accepte)) / Decimal(str(nb_decides)) * Decimal("100")
+        if nb_decides > 0
+        else Decimal("0")
+    )
+    return str(taux.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
 
 
 class GetDashboardDevisUseCase:
@@ -25,34 +60,21 @@ class GetDashboardDevisUseCase:
         Returns:
             Le DTO du dashboard avec KPI et devis recents.
         """
-        # Compter par statut
-        counts = self._devis_repository.count_by_statut()
-        totaux = self._devis_repository.somme_montant_by_statut()
+        # Nombre et montant par statut en une seule requete groupee
+        stats = self._devis_repository.stats_by_statut()
+        counts = {statut: nb for statut, (nb, _) in stats.items()}
+        totaux = {statut: montant for statut, (_, montant) in stats.items()}
 
         nb_total = sum(counts.values())
         nb_accepte = counts.get(StatutDevis.ACCEPTE.value, 0)
         nb_refuse = counts.get(StatutDevis.REFUSE.value, 0)
         nb_perdu = counts.get(StatutDevis.PERDU.value, 0)
 
-        # Pipeline = devis en cours (pas brouillon, pas final)
-        statuts_pipeline = [
-            StatutDevis.EN_VALIDATION.value,
-            StatutDevis.ENVOYE.value,
-            StatutDevis.VU.value,
-            StatutDevis.EN_NEGOCIATION.value,
-        ]
         total_pipeline = sum(
-            Decimal(str(totaux.get(s, 0))) for s in statuts_pipeline
+            Decimal(str(totaux.get(s, 0))) for s in STATUTS_PIPELINE
         )
         total_accepte = Decimal(str(totaux.get(StatutDevis.ACCEPTE.value, 0)))
-
-        # Taux conversion = acceptes / (acceptes + refuses + perdus)
         nb_decides = nb_accepte + nb_refuse + nb_perdu
-        taux_conversion = (
-            Decimal(str(nb_accepte)) / Decimal(str(nb_decides)) * Decimal("100")
-            if nb_decides > 0
-            else Decimal("0")
-        )
 
         kpi = KPIDevisDTO(
             nb_brouillon=counts.get(StatutDevis.BROUILLON.value, 0),
@@ -66,23 +88,108 @@ class GetDashboardDevisUseCase:
             nb_expire=counts.get(StatutDevis.EXPIRE.value, 0),
             total_pipeline_ht=str(total_pipeline),
             total_accepte_ht=str(total_accepte),
-            taux_conversion=str(taux_conversion.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)),
+            taux_conversion=_taux_conversion(nb_accepte, nb_decides),
             nb_total=nb_total,
         )
 
-        # Devis recents
-        recents = self._devis_repository.find_all(limit=10, offset=0)
+        # Devis recents (colonnes du resume uniquement, sans hydrater les entites)
+        recents = self._devis_repository.find_recents_resume(limit=10)
         derniers_devis = [
             DevisRecentDTO(
-                id=d.id,
-                numero=d.numero,
-                client_nom=d.client_nom,
-                objet=d.objet,
-                statut=d.statut.value,
-                montant_total_ht=str(d.montant_total_ht),
-                date_creation=d.date_creation.isoformat() if d.date_creation else "",
+                id=d["id"],
+                numero=d["numero"],
+                client_nom=d["client_nom"],
+                objet=d["objet"],
+                statut=d["statut"],
+                montant_total_ht=str(d["montant_total_ht"]),
+                date_creation=d["date_creation"].isoformat() if d["date_creation"] else "",
             )
             for d in recents
         ]
 
         return DashboardDevisDTO(kpi=kpi, derniers_devis=derniers_devis)
+
+
+class GetTendancesPipelineDevisUseCase:
+    """Use case pour les tendances du pipeline commercial par periode.
+
+    DEV-17: Devis crees, montants et taux de conversion par mois ou
+    par trimestre de creation (cohortes : le statut est le statut actuel
+    des devis crees sur la periode).
+    """
+
+    def __init__(self, devis_repository: DevisRepository):
+        self._devis_repository = devis_repository
+
+    def execute(
+        self,
+        granularite: str = "mois",
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+    ) -> TendancesPipelineDTO:
+        """Calcule les tendances du pipeline a partir d'une requete groupee.
+
+        Args:
+            granularite: "mois" ou "trimestre".
+            date_min: Date de creation minimale (optionnel).
+            date_max: Date de creation maximale (optionnel).
+
+        Returns:
+            Le DTO des tendances, periodes triees chronologiquement.
+
+        Raises:
+            ValueError: Si la granularite est inconnue.
+        """
+        if granularite not in GRANULARITES:
+            raise ValueError(
+                f"Granularite invalide: {granularite}. "
+                f"Valeurs possibles: {', '.join(GRANULARITES)}"
+            )
+
+        rows = self._devis_repository.stats_by_mois_et_statut(
+            date_min=date_min, date_max=date_max
+        )
+
+        buckets: Dict[Tuple[int, int], Dict[str, Tuple[int, Decimal]]] = {}
+        for row in rows:
+            if granularite == "trimestre":
+                cle = (row["annee"], (row["mois"] - 1) // 3 + 1)
+            else:
+                cle = (row["annee"], row["mois"])
+            par_statut = buckets.setdefault(cle, {})
+            nb, montant = par_statut.get(row["statut"], (0, Decimal("0")))
+            par_statut[row["statut"]] = (
+                nb + row["count"],
+                montant + Decimal(str(row["somme_montant_ht"])),
+            )
+
+        periodes = []
+        for (annee, numero), par_statut in sorted(buckets.items()):
+            periode = (
+                f"{annee}-T{numero}" if granularite == "trimestre"
+                else f"{annee}-{numero:02d}"
+            )
+            nb_accepte, montant_accepte = par_statut.get(
+                StatutDevis.ACCEPTE.value, (0, Decimal("0"))
+            )
+            nb_decides = sum(
+                par_statut.get(s, (0, Decimal("0")))[0] for s in STATUTS_DECIDES
+            )
+            periodes.append(
+                TendancePipelineDTO(
+                    periode=periode,
+                    nb_crees=sum(nb for nb, _ in par_statut.values()),
+                    montant_cree_ht=str(sum(m for _, m in par_statut.values())),
+                    nb_pipeline=sum(
+                        par_statut.get(s, (0, Decimal("0")))[0] for s in STATUTS_PIPELINE
+                    ),
+                    montant_pipeline_ht=str(sum(
+                        par_statut.get(s, (0, Decimal("0")))[1] for s in STATUTS_PIPELINE
+                    )),
+                    nb_accepte=nb_accepte,
+                    montant_accepte_ht=str(montant_accepte),
+                    taux_conversion=_taux_conversion(nb_accepte, nb_decides),
+                )
+            )
+
+        return TendancesPipelineDTO(granularite=granularite, periodes=periodes)
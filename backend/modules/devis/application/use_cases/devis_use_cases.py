@@ -5,10 +5,13 @@ DEV-18: Historique modifications (avant/apres).
 DEV-TVA: Ventilation TVA multi-taux et mention TVA reduite.
 """
 
+from collections import defaultdict
 from datetime import date, datetime
 from decimal import Decimal, ROUND_HALF_UP
 from typing import Any, Callable, Optional, Protocol, Tuple
 
+from shared.application.instrumentation import timed
+
 from ...domain.entities.devis import Devis
 from ...domain.entities.journal_devis import JournalDevis
 from ...domain.value_objects import StatutDevis
@@ -274,6 +277,7 @@ class GetDevisUseCase:
         self._ligne_repository = ligne_repository
         self._debourse_repository = debourse_repository
 
+    @timed
     def execute(self, devis_id: int) -> DevisDetailDTO:
         """Recupere un devis avec ses lots, lignes et debourses.
 
@@ -288,12 +292,22 @@ class GetDevisUseCase:
         lot_dtos = []
         ventilation: dict[str, Decimal] = {}  # taux -> base_ht
 
+        # Lignes et debourses de tout le devis en une requete chacun
+        lignes = self._ligne_repository.find_by_devis(devis_id) if lots else []
+        lignes_par_lot: dict[int, list] = defaultdict(list)
+        for ligne in lignes:
+            lignes_par_lot[ligne.lot_devis_id].append(ligne)
+        debourses_par_ligne: dict[int, list] = defaultdict(list)
+        if lignes:
+            for debourse in self._debourse_repository.find_by_lignes([ligne.id for ligne in lignes]):
+                debourses_par_ligne[debourse.ligne_devis_id].append(debourse)
+
         for lot in lots:
-            lignes = self._ligne_repository.find_by_lot(lot.id)
             ligne_dtos = []
-            for ligne in lignes:
-                debourses = self._debourse_repository.find_by_ligne(ligne.id)
-                debourse_dtos = [DebourseDetailDTO.from_entity(d) for d in debourses]
+            for ligne in lignes_par_lot[lot.id]:
+                debourse_dtos = [
+                    DebourseDetailDTO.from_entity(d) for d in debourses_par_ligne[ligne.id]
+                ]
                 ligne_dtos.append(LigneDevisDTO.from_entity(ligne, debourse_dtos))
                 # DEV-TVA: Accumuler base HT par taux
                 taux_key = str(ligne.taux_tva)
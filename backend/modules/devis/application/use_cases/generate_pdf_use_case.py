@@ -3,6 +3,8 @@
 DEV-12: Generation PDF devis client.
 """
 
+import asyncio
+
 from ..dtos.devis_dtos import DevisDetailDTO
 from ..ports.pdf_generator import IPDFGenerator
 from .devis_use_cases import GetDevisUseCase
@@ -72,3 +74,44 @@ class GenerateDevisPDFUseCase:
         filename = f"{devis_detail.numero}.pdf"
 
         return pdf_bytes, filename
+
+    async def execute_async(self, devis_id: int) -> tuple[bytes, str]:
+        """Genere le PDF du devis depuis une route async.
+
+        La lecture du devis s'execute dans un thread et le rendu est attendu
+        via le port : la boucle d'evenements n'est jamais bloquee.
+
+        Args:
+            devis_id: L'ID du devis a generer en PDF.
+
+        Returns:
+            Un tuple (contenu_pdf_bytes, nom_fichier).
+
+        Raises:
+            DevisNotFoundError: Si le devis n'existe pas.
+            GenerateDevisPDFError: Si la generation echoue.
+        """
+        devis_detail: DevisDetailDTO = await asyncio.to_thread(
+            self._get_devis_use_case.execute, devis_id
+        )
+
+        try:
+            pdf_bytes = await self._pdf_generator.generate_async(devis_detail)
+        except Exception as e:
+            raise GenerateDevisPDFError(
+                f"Erreur lors de la generation du PDF pour le devis {devis_detail.numero}: {e}"
+            )
+
+        return pdf_bytes, f"{devis_detail.numero}.pdf"
+
+    def prerender(self, devis_id: int) -> None:
+        """Prepare le PDF du devis en arriere-plan.
+
+        Args:
+            devis_id: L'ID du devis.
+
+        Raises:
+            DevisNotFoundError: Si le devis n'existe pas.
+        """
+        devis_detail: DevisDetailDTO = self._get_devis_use_case.execute(devis_id)
+        self._pdf_generator.prerender(devis_detail)
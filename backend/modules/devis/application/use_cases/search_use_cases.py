@@ -55,7 +55,8 @@ class SearchDevisUseCase:
         Returns:
             Liste paginee des devis correspondants.
         """
-        devis_list = self._devis_repository.find_all(
+        # Page et total dans la meme requete, avec les memes filtres
+        devis_list, total = self._devis_repository.search(
             client_nom=client_nom,
             statut=statut,
             statuts=statuts,
@@ -69,11 +70,6 @@ class SearchDevisUseCase:
             limit=limit,
             offset=offset,
         )
-        total = self._devis_repository.count(
-            statut=statut,
-            statuts=statuts,
-            commercial_id=commercial_id,
-        )
 
         return DevisListDTO(
             items=[DevisDTO.from_entity(d) for d in devis_list],
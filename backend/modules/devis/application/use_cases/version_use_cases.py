@@ -9,9 +9,7 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from ...domain.entities.devis import Devis, DevisValidationError
-from ...domain.entities.lot_devis import LotDevis
 from ...domain.entities.ligne_devis import LigneDevis
-from ...domain.entities.debourse_detail import DebourseDetail
 from ...domain.entities.comparatif_devis import ComparatifDevis
 from ...domain.entities.comparatif_ligne import ComparatifLigne
 from ...domain.entities.journal_devis import JournalDevis
@@ -63,8 +61,6 @@ class VersionFigeeError(Exception):
 def _copie_profonde_devis(
     devis_source: Devis,
     lot_repository: LotDevisRepository,
-    ligne_repository: LigneDevisRepository,
-    debourse_repository: DebourseDetailRepository,
     devis_repository: DevisRepository,
     nouveau_numero: str,
     type_version: TypeVersion,
@@ -76,11 +72,12 @@ def _copie_profonde_devis(
 ) -> Devis:
     """Effectue une copie profonde atomique d'un devis avec lots, lignes et debourses.
 
+    L'arborescence (lots, lignes, debourses) est copiee en masse par le
+    repository, dans la meme transaction que le nouveau devis.
+
     Args:
         devis_source: Le devis a copier.
         lot_repository: Repository des lots.
-        ligne_repository: Repository des lignes.
-        debourse_repository: Repository des debourses.
         devis_repository: Repository des devis.
         nouveau_numero: Le numero du nouveau devis.
         type_version: Le type de version (revision/variante).
@@ -136,132 +133,14 @@ def _copie_profonde_devis(
 
     nouveau_devis = devis_repository.save(nouveau_devis)
 
-    # 2. Copier les lots (avec mapping ancien_id -> nouveau_id pour les parents)
-    lots_source = lot_repository.find_by_devis(devis_source.id)
-    lot_id_mapping: Dict[int, int] = {}
-
-    # Trier pour traiter les parents avant les enfants
-    lots_racine = [l for l in lots_source if l.parent_id is None]
-    lots_enfants = [l for l in lots_source if l.parent_id is not None]
-
-    for lot_source in lots_racine:
-        nouveau_lot = LotDevis(
-            devis_id=nouveau_devis.id,
-            code_lot=lot_source.code_lot,
-            libelle=lot_source.libelle,
-            ordre=lot_source.ordre,
-            taux_marge_lot=lot_source.taux_marge_lot,
-            parent_id=None,
-            montant_debourse_ht=lot_source.montant_debourse_ht,
-            montant_vente_ht=lot_source.montant_vente_ht,
-            montant_vente_ttc=lot_source.montant_vente_ttc,
-            created_at=now,
-            updated_at=now,
-            created_by=created_by,
-        )
-        nouveau_lot = lot_repository.save(nouveau_lot)
-        lot_id_mapping[lot_source.id] = nouveau_lot.id
-
-        # Copier les lignes de ce lot
-        _copier_lignes_lot(
-            lot_source.id,
-            nouveau_lot.id,
-            ligne_repository,
-            debourse_repository,
-            created_by,
-            now,
-        )
-
-    for lot_source in lots_enfants:
-        nouveau_parent_id = lot_id_mapping.get(lot_source.parent_id)
-        nouveau_lot = LotDevis(
-            devis_id=nouveau_devis.id,
-            code_lot=lot_source.code_lot,
-            libelle=lot_source.libelle,
-            ordre=lot_source.ordre,
-            taux_marge_lot=lot_source.taux_marge_lot,
-            parent_id=nouveau_parent_id,
-            montant_debourse_ht=lot_source.montant_debourse_ht,
-            montant_vente_ht=lot_source.montant_vente_ht,
-            montant_vente_ttc=lot_source.montant_vente_ttc,
-            created_at=now,
-            updated_at=now,
-            created_by=created_by,
-        )
-        nouveau_lot = lot_repository.save(nouveau_lot)
-        lot_id_mapping[lot_source.id] = nouveau_lot.id
-
-        _copier_lignes_lot(
-            lot_source.id,
-            nouveau_lot.id,
-            ligne_repository,
-            debourse_repository,
-            created_by,
-            now,
-        )
+    # 2. Copier lots (parents avant enfants), lignes et debourses en masse
+    lot_repository.copier_arborescence(
+        devis_source.id, nouveau_devis.id, created_by=created_by
+    )
 
     return nouveau_devis
 
 
-def _copier_lignes_lot(
-    lot_source_id: int,
-    lot_cible_id: int,
-    ligne_repository: LigneDevisRepository,
-    debourse_repository: DebourseDetailRepository,
-    created_by: int,
-    now: datetime,
-) -> None:
-    """Copie toutes les lignes et debourses d'un lot source vers un lot cible.
-
-    Args:
-        lot_source_id: L'ID du lot source.
-        lot_cible_id: L'ID du lot cible.
-        ligne_repository: Repository des lignes.
-        debourse_repository: Repository des debourses.
-        created_by: L'ID de l'utilisateur createur.
-        now: Timestamp actuel.
-    """
-    lignes_source = ligne_repository.find_by_lot(lot_source_id)
-    for ligne_source in lignes_source:
-        nouvelle_ligne = LigneDevis(
-            lot_devis_id=lot_cible_id,
-            article_id=ligne_source.article_id,
-            libelle=ligne_source.libelle,
-            unite=ligne_source.unite,
-            quantite=ligne_source.quantite,
-            prix_unitaire_ht=ligne_source.prix_unitaire_ht,
-            taux_marge_ligne=ligne_source.taux_marge_ligne,
-            taux_tva=ligne_source.taux_tva,
-            ordre=ligne_source.ordre,
-            verrouille=False,  # Deverrouiller dans la copie
-            total_ht=ligne_source.total_ht,
-            montant_ttc=ligne_source.montant_ttc,
-            debourse_sec=ligne_source.debourse_sec,
-            prix_revient=ligne_source.prix_revient,
-            created_at=now,
-            updated_at=now,
-            created_by=created_by,
-        )
-        nouvelle_ligne = ligne_repository.save(nouvelle_ligne)
-
-        # Copier les debourses
-        debourses_source = debourse_repository.find_by_ligne(ligne_source.id)
-        for deb_source in debourses_source:
-            nouveau_debourse = DebourseDetail(
-                ligne_devis_id=nouvelle_ligne.id,
-                type_debourse=deb_source.type_debourse,
-                libelle=deb_source.libelle,
-                quantite=deb_source.quantite,
-                prix_unitaire=deb_source.prix_unitaire,
-                metier=deb_source.metier,
-                taux_horaire=deb_source.taux_horaire,
-                total=deb_source.total,
-                created_at=now,
-                updated_at=now,
-            )
-            debourse_repository.save(nouveau_debourse)
-
-
 def _get_parent_id(devis: Devis) -> int:
     """Retourne l'ID du devis parent (original) de la famille.
 
@@ -401,8 +280,6 @@ class CreerRevisionUseCase:
         nouveau_devis = _copie_profonde_devis(
             devis_source=devis_source,
             lot_repository=self._lot_repository,
-            ligne_repository=self._ligne_repository,
-            debourse_repository=self._debourse_repository,
             devis_repository=self._devis_repository,
             nouveau_numero=nouveau_numero,
             type_version=TypeVersion.REVISION,
@@ -501,8 +378,6 @@ class CreerVarianteUseCase:
         nouveau_devis = _copie_profonde_devis(
             devis_source=devis_source,
             lot_repository=self._lot_repository,
-            ligne_repository=self._ligne_repository,
-            debourse_repository=self._debourse_repository,
             devis_repository=self._devis_repository,
             nouveau_numero=nouveau_numero,
             type_version=TypeVersion.VARIANTE,
@@ -785,16 +660,21 @@ class GenererComparatifUseCase:
     ) -> List[Tuple[str, str, Optional[int], LigneDevis]]:
         """Collecte les lignes d'un devis avec le titre du lot parent.
 
+        L'arborescence est chargee en deux requetes (lots, puis lignes du
+        devis) quel que soit le nombre de lots.
+
         Returns:
             Liste de tuples (lot_titre, designation, article_id, ligne).
         """
-        lots = self._lot_repository.find_by_devis(devis_id)
-        result = []
-        for lot in lots:
-            lignes = self._ligne_repository.find_by_lot(lot.id)
-            for ligne in lignes:
-                result.append((lot.libelle, ligne.libelle, ligne.article_id, ligne))
-        return result
+        titres_lots = {
+            lot.id: lot.libelle
+            for lot in self._lot_repository.find_all_by_devis(devis_id)
+        }
+        return [
+            (titres_lots[ligne.lot_devis_id], ligne.libelle, ligne.article_id, ligne)
+            for ligne in self._ligne_repository.find_by_devis(devis_id)
+            if ligne.lot_devis_id in titres_lots
+        ]
 
     def _indexer_lignes(
         self,
@@ -50,6 +50,18 @@ class DebourseDetailRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_by_lignes(self, ligne_devis_ids: List[int]) -> List[DebourseDetail]:
+        """Liste les debourses de plusieurs lignes en une requete.
+
+        Args:
+            ligne_devis_ids: Les IDs des lignes.
+
+        Returns:
+            Liste des debourses, ordonnee par ID.
+        """
+        pass
+
     @abstractmethod
     def find_by_ligne_and_type(
         self,
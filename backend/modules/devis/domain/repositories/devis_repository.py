@@ -10,7 +10,7 @@ DEV-19: Recherche et filtres - Filtres avances.
 from abc import ABC, abstractmethod
 from datetime import date
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..entities import Devis
 from ..value_objects import StatutDevis
@@ -101,6 +101,35 @@ class DevisRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def search(
+        self,
+        statut: Optional[StatutDevis] = None,
+        statuts: Optional[List[StatutDevis]] = None,
+        commercial_id: Optional[int] = None,
+        conducteur_id: Optional[int] = None,
+        client_nom: Optional[str] = None,
+        date_creation_min: Optional[date] = None,
+        date_creation_max: Optional[date] = None,
+        montant_min: Optional[Decimal] = None,
+        montant_max: Optional[Decimal] = None,
+        search: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Tuple[List[Devis], int]:
+        """Recherche paginee avec le total des devis correspondant aux filtres (DEV-19).
+
+        Le total applique exactement les memes filtres que la page
+        et est calcule dans la meme requete.
+
+        Args:
+            Memes filtres que find_all.
+
+        Returns:
+            Tuple (devis de la page, nombre total de devis correspondants).
+        """
+        pass
+
     @abstractmethod
     def count(
         self,
@@ -138,6 +167,47 @@ class DevisRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def stats_by_statut(self) -> Dict[str, Tuple[int, Decimal]]:
+        """Nombre et somme des montants HT par statut en une requete (DEV-17).
+
+        Returns:
+            Dictionnaire {statut: (count, somme_montant_ht)}.
+        """
+        pass
+
+    @abstractmethod
+    def find_recents_resume(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Liste les derniers devis crees sous forme resumee (DEV-17).
+
+        Ne charge que les colonnes affichees par le dashboard.
+
+        Args:
+            limit: Nombre maximum de devis.
+
+        Returns:
+            Liste de dictionnaires (id, numero, client_nom, objet, statut,
+            montant_total_ht, date_creation), du plus recent au plus ancien.
+        """
+        pass
+
+    @abstractmethod
+    def stats_by_mois_et_statut(
+        self,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """Nombre et montant HT des devis par mois de creation et statut (DEV-17).
+
+        Args:
+            date_min: Date de creation minimale (optionnel).
+            date_max: Date de creation maximale (optionnel).
+
+        Returns:
+            Liste de dictionnaires (annee, mois, statut, count, somme_montant_ht).
+        """
+        pass
+
     @abstractmethod
     def find_expires(self) -> List[Devis]:
         """Trouve les devis dont la date de validite est depassee
@@ -4,7 +4,7 @@ DEV-03: Creation devis structure - CRUD des lots/chapitres.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from ..entities import LotDevis
 
@@ -53,6 +53,18 @@ class LotDevisRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_all_by_devis(self, devis_id: int) -> List[LotDevis]:
+        """Liste tous les lots d'un devis, tous niveaux confondus.
+
+        Args:
+            devis_id: L'ID du devis.
+
+        Returns:
+            Liste des lots ordonnee par le champ ordre.
+        """
+        pass
+
     @abstractmethod
     def find_children(self, parent_id: int) -> List[LotDevis]:
         """Liste les sous-chapitres d'un lot.
@@ -89,3 +101,25 @@ class LotDevisRepository(ABC):
             True si supprime, False si non trouve.
         """
         pass
+
+    @abstractmethod
+    def copier_arborescence(
+        self,
+        devis_source_id: int,
+        devis_cible_id: int,
+        created_by: Optional[int] = None,
+    ) -> Dict[int, int]:
+        """Copie en masse les lots, lignes et debourses d'un devis vers un autre.
+
+        DEV-08: Utilise pour les revisions et variantes. Les lignes copiees
+        sont deverrouillees. La copie se fait dans la transaction courante.
+
+        Args:
+            devis_source_id: L'ID du devis source.
+            devis_cible_id: L'ID du devis cible (deja cree).
+            created_by: L'ID de l'utilisateur createur.
+
+        Returns:
+            Correspondance ancien ID de lot -> nouvel ID de lot.
+        """
+        pass
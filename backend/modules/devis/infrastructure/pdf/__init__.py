@@ -1,5 +1,6 @@
 """Infrastructure PDF pour le module Devis."""
 
 from .devis_pdf_generator import DevisPDFGenerator
+from .cached_devis_pdf_generator import CachedDevisPDFGenerator
 
-__all__ = ["DevisPDFGenerator"]
+__all__ = ["DevisPDFGenerator", "CachedDevisPDFGenerator"]
@@ -0,0 +1,98 @@
+"""Generateur PDF de devis avec cache de rendu.
+
+DEV-12: Generation PDF devis client.
+
+Decorateur du port IPDFGenerator : le PDF est identifie par le contenu du
+DTO et la version du generateur (empreinte du module de mise en page).
+Un PDF deja rendu est relu depuis le disque ; sinon le rendu fpdf2
+s'execute dans le pool de rendu partage (shared.infrastructure.pdf).
+"""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+from shared.infrastructure.pdf import PdfRenderCache
+
+from ...application.dtos.devis_dtos import DevisDetailDTO
+from ...application.ports.pdf_generator import IPDFGenerator
+from . import devis_pdf_generator
+from .devis_pdf_generator import DevisPDFGenerator
+
+TYPE_DOCUMENT_DEVIS = "devis"
+
+
+def render_devis_pdf(devis: DevisDetailDTO) -> bytes:
+    """Rend le PDF d'un devis (fonction picklable pour le pool de rendu).
+
+    Args:
+        devis: Le DTO detaille du devis.
+
+    Returns:
+        Le contenu du PDF en bytes.
+    """
+    return bytes(DevisPDFGenerator().generate(devis))
+
+
+@lru_cache(maxsize=1)
+def devis_pdf_version() -> str:
+    """Version du generateur : empreinte du module de mise en page."""
+    source = Path(devis_pdf_generator.__file__).read_bytes()
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+class CachedDevisPDFGenerator(IPDFGenerator):
+    """Generateur PDF devis servant les rendus depuis le cache disque.
+
+    Attributes:
+        _render_cache: Cache de rendu PDF partage.
+    """
+
+    def __init__(self, render_cache: PdfRenderCache):
+        """Initialise le generateur.
+
+        Args:
+            render_cache: Cache de rendu PDF.
+        """
+        self._render_cache = render_cache
+
+    def generate(self, devis: DevisDetailDTO) -> bytes:
+        """Retourne le PDF du devis depuis le cache ou le rend.
+
+        Args:
+            devis: Le DTO detaille du devis (vue client).
+
+        Returns:
+            Le contenu du PDF en bytes.
+        """
+        cle = self._render_cache.cle(TYPE_DOCUMENT_DEVIS, devis_pdf_version(), devis)
+        pdf_bytes = self._render_cache.get(cle)
+        if pdf_bytes is None:
+            pdf_bytes = self._render_cache.render(cle, render_devis_pdf, devis)
+        return pdf_bytes
+
+    async def generate_async(self, devis: DevisDetailDTO) -> bytes:
+        """Retourne le PDF du devis depuis le cache ou attend son rendu.
+
+        Le rendu du pool est attendu sans bloquer la boucle d'evenements.
+
+        Args:
+            devis: Le DTO detaille du devis (vue client).
+
+        Returns:
+            Le contenu du PDF en bytes.
+        """
+        cle = self._render_cache.cle(TYPE_DOCUMENT_DEVIS, devis_pdf_version(), devis)
+        pdf_bytes = self._render_cache.get(cle)
+        if pdf_bytes is None:
+            pdf_bytes = await self._render_cache.render_async(cle, render_devis_pdf, devis)
+        return pdf_bytes
+
+    def prerender(self, devis: DevisDetailDTO) -> None:
+        """Lance le rendu du PDF du devis sans l'attendre.
+
+        Args:
+            devis: Le DTO detaille du devis (vue client).
+        """
+        cle = self._render_cache.cle(TYPE_DOCUMENT_DEVIS, devis_pdf_version(), devis)
+        self._render_cache.prerender(cle, render_devis_pdf, devis)
@@ -10,15 +10,16 @@ Format: A4 portrait, police Helvetica, montants en EUR.
 """
 
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional
-
-from fpdf import FPDF
+from typing import Optional, TYPE_CHECKING
 
 from ...application.dtos.devis_dtos import DevisDetailDTO, VentilationTVADTO
 from ...application.dtos.lot_dtos import LotDevisDTO
 from ...application.dtos.ligne_dtos import LigneDevisDTO
 from ...application.ports.pdf_generator import IPDFGenerator
 
+if TYPE_CHECKING:
+    from fpdf import FPDF
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Constantes entreprise (a externaliser en config si besoin)
@@ -154,6 +155,8 @@ class DevisPDFGenerator(IPDFGenerator):
         Returns:
             Le contenu du PDF en bytes.
         """
+        from fpdf import FPDF  # Import differe : fpdf2 est lourd a charger au demarrage
+
         pdf = FPDF(orientation="P", unit="mm", format="A4")
         pdf.set_auto_page_break(auto=True, margin=25)
         pdf.set_margins(left=MARGE_GAUCHE, top=15, right=MARGE_DROITE)
@@ -178,7 +181,7 @@ class DevisPDFGenerator(IPDFGenerator):
     # Sections du PDF
     # ─────────────────────────────────────────────────────────────────
 
-    def _draw_header(self, pdf: FPDF, devis: DevisDetailDTO) -> None:
+    def _draw_header(self, pdf: "FPDF", devis: DevisDetailDTO) -> None:
         """Dessine l'en-tete avec les infos entreprise et le numero de devis."""
         y_start = pdf.get_y()
 
@@ -232,7 +235,7 @@ class DevisPDFGenerator(IPDFGenerator):
         pdf.line(MARGE_GAUCHE, pdf.get_y(), 210 - MARGE_DROITE, pdf.get_y())
         pdf.ln(5)
 
-    def _draw_client_block(self, pdf: FPDF, devis: DevisDetailDTO) -> None:
+    def _draw_client_block(self, pdf: "FPDF", devis: DevisDetailDTO) -> None:
         """Dessine le bloc d'informations client."""
         pdf.set_font("Helvetica", "B", 10)
         pdf.set_text_color(*COULEUR_PRIMAIRE)
@@ -266,7 +269,7 @@ class DevisPDFGenerator(IPDFGenerator):
 
         pdf.ln(8)
 
-    def _draw_objet(self, pdf: FPDF, devis: DevisDetailDTO) -> None:
+    def _draw_objet(self, pdf: "FPDF", devis: DevisDetailDTO) -> None:
         """Dessine la section objet des travaux."""
         pdf.set_font("Helvetica", "B", 10)
         pdf.set_text_color(*COULEUR_PRIMAIRE)
@@ -277,7 +280,7 @@ class DevisPDFGenerator(IPDFGenerator):
         pdf.multi_cell(w=LARGEUR_UTILE - 30, h=6, text=devis.objet or "-")
         pdf.ln(5)
 
-    def _draw_lots_table(self, pdf: FPDF, devis: DevisDetailDTO) -> None:
+    def _draw_lots_table(self, pdf: "FPDF", devis: DevisDetailDTO) -> None:
         """Dessine le tableau des lots et lignes (vue client)."""
         # En-tete du tableau
         pdf.set_font("Helvetica", "B", 10)
@@ -309,7 +312,7 @@ class DevisPDFGenerator(IPDFGenerator):
 
     def _draw_lot(
         self,
-        pdf: FPDF,
+        pdf: "FPDF",
         lot: LotDevisDTO,
         col_widths: list[int],
         col_aligns: list[str],
@@ -351,7 +354,7 @@ class DevisPDFGenerator(IPDFGenerator):
 
     def _draw_ligne(
         self,
-        pdf: FPDF,
+        pdf: "FPDF",
         ligne: LigneDevisDTO,
         col_widths: list[int],
         col_aligns: list[str],
@@ -385,7 +388,7 @@ class DevisPDFGenerator(IPDFGenerator):
                      new_x="RIGHT" if i < len(col_widths) - 1 else "LMARGIN",
                      new_y="TOP" if i < len(col_widths) - 1 else "NEXT")
 
-    def _redraw_table_header(self, pdf: FPDF, col_widths: list[int]) -> None:
+    def _redraw_table_header(self, pdf: "FPDF", col_widths: list[int]) -> None:
         """Re-dessine l'en-tete du tableau apres un saut de page."""
         col_headers = ["Designation", "Unite", "Qte", "PU HT", "Total HT"]
         col_aligns = ["L", "C", "R", "R", "R"]
@@ -403,7 +406,7 @@ class DevisPDFGenerator(IPDFGenerator):
         pdf.set_text_color(*COULEUR_TEXTE)
         pdf.set_font("Helvetica", "", 8)
 
-    def _draw_recapitulatif(self, pdf: FPDF, devis: DevisDetailDTO) -> None:
+    def _draw_recapitulatif(self, pdf: "FPDF", devis: DevisDetailDTO) -> None:
         """Dessine le bloc recapitulatif (HT, TVA, TTC, retenue, net a payer)."""
         # Verifier saut de page
         if pdf.get_y() > 230:
@@ -482,7 +485,7 @@ class DevisPDFGenerator(IPDFGenerator):
 
         pdf.ln(8)
 
-    def _draw_conditions(self, pdf: FPDF, devis: DevisDetailDTO) -> None:
+    def _draw_conditions(self, pdf: "FPDF", devis: DevisDetailDTO) -> None:
         """Dessine les conditions de paiement et informations complementaires."""
         # Verifier saut de page
         if pdf.get_y() > 240:
@@ -545,7 +548,7 @@ class DevisPDFGenerator(IPDFGenerator):
 
         pdf.ln(5)
 
-    def _draw_mention_tva_reduite(self, pdf: FPDF, mention: str) -> None:
+    def _draw_mention_tva_reduite(self, pdf: "FPDF", mention: str) -> None:
         """Dessine la mention legale TVA reduite.
 
         Obligation legale pour les taux de TVA < 20% (reforme 01/2025).
@@ -575,7 +578,7 @@ class DevisPDFGenerator(IPDFGenerator):
 
         pdf.ln(5)
 
-    def _draw_signature_block(self, pdf: FPDF, devis: DevisDetailDTO) -> None:
+    def _draw_signature_block(self, pdf: "FPDF", devis: DevisDetailDTO) -> None:
         """Dessine le bloc de signature client."""
         # Verifier si besoin de nouvelle page pour la signature
         needed_height = 50
@@ -615,7 +618,7 @@ class DevisPDFGenerator(IPDFGenerator):
         pdf.rect(sig_x, pdf.get_y() + 1, sig_w, 25)
         pdf.ln(28)
 
-    def _draw_footer(self, pdf: FPDF) -> None:
+    def _draw_footer(self, pdf: "FPDF") -> None:
         """Dessine le pied de page sur toutes les pages."""
         total_pages = pdf.pages_count
         for page_num in range(1, total_pages + 1):
@@ -135,6 +135,24 @@ class SQLAlchemyDebourseDetailRepository(DebourseDetailRepository):
         )
         return [self._to_entity(model) for model in query.all()]
 
+    def find_by_lignes(self, ligne_devis_ids: List[int]) -> List[DebourseDetail]:
+        """Liste les debourses de plusieurs lignes en une requete.
+
+        Args:
+            ligne_devis_ids: Les IDs des lignes.
+
+        Returns:
+            Liste des debourses, ordonnee par ID.
+        """
+        if not ligne_devis_ids:
+            return []
+        query = (
+            self._session.query(DebourseDetailModel)
+            .filter(DebourseDetailModel.ligne_devis_id.in_(ligne_devis_ids))
+            .order_by(DebourseDetailModel.id)
+        )
+        return [self._to_entity(model) for model in query.all()]
+
     def find_by_ligne_and_type(
         self,
         ligne_devis_id: int,
@@ -9,7 +9,7 @@ DEV-19: Recherche et filtres - Filtres avances.
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import extract, func, or_, and_
 from sqlalchemy.orm import Session
@@ -327,8 +327,9 @@ class SQLAlchemyDevisRepository(DevisRepository):
         )
         return self._to_entity(model) if model else None
 
-    def find_all(
+    def _apply_filters(
         self,
+        query,
         statut: Optional[StatutDevis] = None,
         statuts: Optional[List[StatutDevis]] = None,
         commercial_id: Optional[int] = None,
@@ -339,31 +340,16 @@ class SQLAlchemyDevisRepository(DevisRepository):
         montant_min: Optional[Decimal] = None,
         montant_max: Optional[Decimal] = None,
         search: Optional[str] = None,
-        limit: int = 100,
-        offset: int = 0,
-    ) -> List[Devis]:
-        """Liste les devis avec filtres avances (DEV-19).
+    ):
+        """Applique les filtres avances (DEV-19) et exclut les devis supprimes.
 
-        Args:
-            statut: Filtrer par statut unique (optionnel).
-            statuts: Filtrer par liste de statuts (optionnel).
-            commercial_id: Filtrer par commercial assigne (optionnel).
-            conducteur_id: Filtrer par conducteur assigne (optionnel).
-            client_nom: Filtrer par nom client (recherche partielle).
-            date_creation_min: Date de creation minimale.
-            date_creation_max: Date de creation maximale.
-            montant_min: Montant HT minimum.
-            montant_max: Montant HT maximum.
-            search: Recherche textuelle sur numero/client/objet.
-            limit: Nombre maximum de resultats.
-            offset: Decalage pour pagination.
+        Partage par find_all et search pour que la page et le total
+        appliquent exactement les memes criteres.
 
         Returns:
-            Liste des devis.
+            La requete filtree.
         """
-        query = self._session.query(DevisModel).filter(
-            DevisModel.deleted_at.is_(None)
-        )
+        query = query.filter(DevisModel.deleted_at.is_(None))
 
         if statut is not None:
             query = query.filter(DevisModel.statut == statut.value)
@@ -409,11 +395,136 @@ class SQLAlchemyDevisRepository(DevisRepository):
                 )
             )
 
+        return query
+
+    def find_all(
+        self,
+        statut: Optional[StatutDevis] = None,
+        statuts: Optional[List[StatutDevis]] = None,
+        commercial_id: Optional[int] = None,
+        conducteur_id: Optional[int] = None,
+        client_nom: Optional[str] = None,
+        date_creation_min: Optional[date] = None,
+        date_creation_max: Optional[date] = None,
+        montant_min: Optional[Decimal] = None,
+        montant_max: Optional[Decimal] = None,
+        search: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Devis]:
+        """Liste les devis avec filtres avances (DEV-19).
+
+        Args:
+            statut: Filtrer par statut unique (optionnel).
+            statuts: Filtrer par liste de statuts (optionnel).
+            commercial_id: Filtrer par commercial assigne (optionnel).
+            conducteur_id: Filtrer par conducteur assigne (optionnel).
+            client_nom: Filtrer par nom client (recherche partielle).
+            date_creation_min: Date de creation minimale.
+            date_creation_max: Date de creation maximale.
+            montant_min: Montant HT minimum.
+            montant_max: Montant HT maximum.
+            search: Recherche textuelle sur numero/client/objet.
+            limit: Nombre maximum de resultats.
+            offset: Decalage pour pagination.
+
+        Returns:
+            Liste des devis.
+        """
+        query = self._apply_filters(
+            self._session.query(DevisModel),
+            statut=statut,
+            statuts=statuts,
+            commercial_id=commercial_id,
+            conducteur_id=conducteur_id,
+            client_nom=client_nom,
+            date_creation_min=date_creation_min,
+            date_creation_max=date_creation_max,
+            montant_min=montant_min,
+            montant_max=montant_max,
+            search=search,
+        )
         query = query.order_by(DevisModel.created_at.desc())
         query = query.offset(offset).limit(limit)
 
         return [self._to_entity(model) for model in query.all()]
 
+    def search(
+        self,
+        statut: Optional[StatutDevis] = None,
+        statuts: Optional[List[StatutDevis]] = None,
+        commercial_id: Optional[int] = None,
+        conducteur_id: Optional[int] = None,
+        client_nom: Optional[str] = None,
+        date_creation_min: Optional[date] = None,
+        date_creation_max: Optional[date] = None,
+        montant_min: Optional[Decimal] = None,
+        montant_max: Optional[Decimal] = None,
+        search: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Tuple[List[Devis], int]:
+        """Recherche paginee avec total calcule par fonction fenetre (DEV-19).
+
+        COUNT(*) OVER () renvoie le total filtre sur chaque ligne de la page :
+        une seule requete pour la page et le total.
+
+        Returns:
+            Tuple (devis de la page, nombre total de devis correspondants).
+        """
+        total_col = func.count(DevisModel.id).over().label("total")
+        query = self._apply_filters(
+            self._session.query(DevisModel, total_col),
+            statut=statut,
+            statuts=statuts,
+            commercial_id=commercial_id,
+            conducteur_id=conducteur_id,
+            client_nom=client_nom,
+            date_creation_min=date_creation_min,
+            date_creation_max=date_creation_max,
+            montant_min=montant_min,
+            montant_max=montant_max,
+            search=search,
+        )
+        rows = (
+            query.order_by(DevisModel.created_at.desc())
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+
+        if not rows:
+            # Page au-dela du dernier resultat : le total reste necessaire
+            total = self._count_filtered(
+                statut=statut,
+                statuts=statuts,
+                commercial_id=commercial_id,
+                conducteur_id=conducteur_id,
+                client_nom=client_nom,
+                date_creation_min=date_creation_min,
+                date_creation_max=date_creation_max,
+                montant_min=montant_min,
+                montant_max=montant_max,
+                search=search,
+            ) if offset > 0 else 0
+            return [], total
+
+        return [self._to_entity(model) for model, _ in rows], rows[0].total
+
+    def _count_filtered(self, **filters) -> int:
+        """Compte les devis correspondant aux filtres avances (DEV-19).
+
+        Args:
+            **filters: Memes filtres que find_all (hors pagination).
+
+        Returns:
+            Le nombre de devis.
+        """
+        query = self._apply_filters(
+            self._session.query(func.count(DevisModel.id)), **filters
+        )
+        return query.scalar() or 0
+
     def count(
         self,
         statut: Optional[StatutDevis] = None,
@@ -480,6 +591,103 @@ class SQLAlchemyDevisRepository(DevisRepository):
         )
         return {statut: Decimal(str(total)) for statut, total in results}
 
+    def stats_by_statut(self) -> Dict[str, Tuple[int, Decimal]]:
+        """Nombre et somme des montants HT par statut en une requete (DEV-17).
+
+        Returns:
+            Dictionnaire {statut: (count, somme_montant_ht)}.
+        """
+        results = (
+            self._session.query(
+                DevisModel.statut,
+                func.count(DevisModel.id),
+                func.coalesce(func.sum(DevisModel.total_ht), 0),
+            )
+            .filter(DevisModel.deleted_at.is_(None))
+            .group_by(DevisModel.statut)
+            .all()
+        )
+        return {
+            statut: (count, Decimal(str(total)))
+            for statut, count, total in results
+        }
+
+    def find_recents_resume(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Liste les derniers devis crees sous forme resumee (DEV-17).
+
+        Args:
+            limit: Nombre maximum de devis.
+
+        Returns:
+            Liste de dictionnaires, du plus recent au plus ancien.
+        """
+        results = (
+            self._session.query(
+                DevisModel.id,
+                DevisModel.numero,
+                DevisModel.client_nom,
+                DevisModel.objet,
+                DevisModel.statut,
+                DevisModel.total_ht,
+                DevisModel.date_creation,
+            )
+            .filter(DevisModel.deleted_at.is_(None))
+            .order_by(DevisModel.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+        return [
+            {
+                "id": row.id,
+                "numero": row.numero,
+                "client_nom": row.client_nom,
+                "objet": row.objet or "",
+                "statut": row.statut,
+                "montant_total_ht": Decimal(str(row.total_ht or 0)),
+                "date_creation": row.date_creation,
+            }
+            for row in results
+        ]
+
+    def stats_by_mois_et_statut(
+        self,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """Nombre et montant HT des devis par mois de creation et statut (DEV-17).
+
+        Args:
+            date_min: Date de creation minimale (optionnel).
+            date_max: Date de creation maximale (optionnel).
+
+        Returns:
+            Liste de dictionnaires (annee, mois, statut, count, somme_montant_ht).
+        """
+        annee = extract("year", DevisModel.created_at)
+        mois = extract("month", DevisModel.created_at)
+        query = self._apply_filters(
+            self._session.query(
+                annee.label("annee"),
+                mois.label("mois"),
+                DevisModel.statut,
+                func.count(DevisModel.id),
+                func.coalesce(func.sum(DevisModel.total_ht), 0),
+            ),
+            date_creation_min=date_min,
+            date_creation_max=date_max,
+        )
+        results = query.group_by(annee, mois, DevisModel.statut).all()
+        return [
+            {
+                "annee": int(row_annee),
+                "mois": int(row_mois),
+                "statut": statut,
+                "count": count,
+                "somme_montant_ht": Decimal(str(total)),
+            }
+            for row_annee, row_mois, statut, count, total in results
+        ]
+
     def find_expires(self) -> List[Devis]:
         """Trouve les devis dont la date de validite est depassee
         et qui sont dans un statut pouvant expirer.
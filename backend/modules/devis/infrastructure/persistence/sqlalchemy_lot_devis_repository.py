@@ -5,13 +5,14 @@ DEV-03: Creation devis structure - CRUD des lots/chapitres.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from ...domain.entities import LotDevis
 from ...domain.repositories.lot_devis_repository import LotDevisRepository
-from .models import LotDevisModel
+from .models import DebourseDetailModel, LigneDevisModel, LotDevisModel
 
 
 class SQLAlchemyLotDevisRepository(LotDevisRepository):
@@ -146,6 +147,23 @@ class SQLAlchemyLotDevisRepository(LotDevisRepository):
         query = query.order_by(LotDevisModel.ordre)
         return [self._to_entity(model) for model in query.all()]
 
+    def find_all_by_devis(self, devis_id: int) -> List[LotDevis]:
+        """Liste tous les lots d'un devis, tous niveaux confondus.
+
+        Args:
+            devis_id: L'ID du devis.
+
+        Returns:
+            Liste des lots ordonnee par le champ ordre.
+        """
+        query = (
+            self._session.query(LotDevisModel)
+            .filter(LotDevisModel.devis_id == devis_id)
+            .filter(LotDevisModel.deleted_at.is_(None))
+            .order_by(LotDevisModel.ordre, LotDevisModel.id)
+        )
+        return [self._to_entity(model) for model in query.all()]
+
     def find_children(self, parent_id: int) -> List[LotDevis]:
         """Liste les sous-chapitres d'un lot.
 
@@ -202,3 +220,191 @@ class SQLAlchemyLotDevisRepository(LotDevisRepository):
         model.deleted_by = deleted_by
         self._session.flush()
         return True
+
+    def copier_arborescence(
+        self,
+        devis_source_id: int,
+        devis_cible_id: int,
+        created_by: Optional[int] = None,
+    ) -> Dict[int, int]:
+        """Copie en masse les lots, lignes et debourses d'un devis vers un autre.
+
+        Chaque niveau de l'arborescence est lu en une requete puis insere
+        en un seul INSERT multi-lignes (RETURNING des nouveaux IDs dans
+        l'ordre des parametres), ce qui fournit la table de correspondance
+        des IDs pour le niveau suivant. Les lots sont inseres par profondeur
+        pour remapper parent_id. Les elements supprimes (soft delete) ne sont
+        pas copies.
+
+        Args:
+            devis_source_id: L'ID du devis source.
+            devis_cible_id: L'ID du devis cible (deja cree).
+            created_by: L'ID de l'utilisateur createur.
+
+        Returns:
+            Correspondance ancien ID de lot -> nouvel ID de lot.
+        """
+        now = datetime.utcnow()
+
+        # 1. Lots, niveau par niveau (parents avant enfants)
+        lots = self._session.execute(
+            select(
+                LotDevisModel.id,
+                LotDevisModel.parent_id,
+                LotDevisModel.titre,
+                LotDevisModel.numero,
+                LotDevisModel.ordre,
+                LotDevisModel.marge_lot_pct,
+                LotDevisModel.total_ht,
+                LotDevisModel.total_ttc,
+                LotDevisModel.debourse_sec,
+            )
+            .where(LotDevisModel.devis_id == devis_source_id)
+            .where(LotDevisModel.deleted_at.is_(None))
+            .order_by(LotDevisModel.ordre, LotDevisModel.id)
+        ).all()
+
+        lot_mapping: Dict[int, int] = {}
+        restants = list(lots)
+        while restants:
+            niveau = [
+                lot for lot in restants
+                if lot.parent_id is None or lot.parent_id in lot_mapping
+            ]
+            if not niveau:
+                # Sous-lots d'un lot supprime : non copies
+                break
+            nouveaux_ids = self._inserer_en_masse(
+                LotDevisModel,
+                [
+                    {
+                        "devis_id": devis_cible_id,
+                        "parent_id": lot_mapping.get(lot.parent_id),
+                        "titre": lot.titre,
+                        "numero": lot.numero,
+                        "ordre": lot.ordre,
+                        "marge_lot_pct": lot.marge_lot_pct,
+                        "total_ht": lot.total_ht,
+                        "total_ttc": lot.total_ttc,
+                        "debourse_sec": lot.debourse_sec,
+                        "created_at": now,
+                        "created_by": created_by,
+                    }
+                    for lot in niveau
+                ],
+            )
+            lot_mapping.update(zip((lot.id for lot in niveau), nouveaux_ids))
+            restants = [lot for lot in restants if lot.id not in lot_mapping]
+
+        if not lot_mapping:
+            return lot_mapping
+
+        # 2. Lignes de tous les lots copies (deverrouillees)
+        lignes = self._session.execute(
+            select(
+                LigneDevisModel.id,
+                LigneDevisModel.lot_devis_id,
+                LigneDevisModel.article_id,
+                LigneDevisModel.designation,
+                LigneDevisModel.unite,
+                LigneDevisModel.quantite,
+                LigneDevisModel.prix_unitaire_ht,
+                LigneDevisModel.taux_tva,
+                LigneDevisModel.ordre,
+                LigneDevisModel.marge_ligne_pct,
+                LigneDevisModel.montant_ht,
+                LigneDevisModel.montant_ttc,
+                LigneDevisModel.debourse_sec,
+                LigneDevisModel.prix_revient,
+            )
+            .join(LotDevisModel, LigneDevisModel.lot_devis_id == LotDevisModel.id)
+            .where(LotDevisModel.devis_id == devis_source_id)
+            .where(LigneDevisModel.deleted_at.is_(None))
+            .order_by(LigneDevisModel.lot_devis_id, LigneDevisModel.ordre, LigneDevisModel.id)
+        ).all()
+        lignes = [ligne for ligne in lignes if ligne.lot_devis_id in lot_mapping]
+        nouveaux_ids = self._inserer_en_masse(
+            LigneDevisModel,
+            [
+                {
+                    "lot_devis_id": lot_mapping[ligne.lot_devis_id],
+                    "article_id": ligne.article_id,
+                    "designation": ligne.designation,
+                    "unite": ligne.unite,
+                    "quantite": ligne.quantite,
+                    "prix_unitaire_ht": ligne.prix_unitaire_ht,
+                    "taux_tva": ligne.taux_tva,
+                    "ordre": ligne.ordre,
+                    "verrouille": False,
+                    "marge_ligne_pct": ligne.marge_ligne_pct,
+                    "montant_ht": ligne.montant_ht,
+                    "montant_ttc": ligne.montant_ttc,
+                    "debourse_sec": ligne.debourse_sec,
+                    "prix_revient": ligne.prix_revient,
+                    "created_at": now,
+                    "created_by": created_by,
+                }
+                for ligne in lignes
+            ],
+        )
+        ligne_mapping = dict(zip((ligne.id for ligne in lignes), nouveaux_ids))
+        if not ligne_mapping:
+            return lot_mapping
+
+        # 3. Debourses de toutes les lignes copiees
+        debourses = self._session.execute(
+            select(
+                DebourseDetailModel.ligne_devis_id,
+                DebourseDetailModel.type_debourse,
+                DebourseDetailModel.designation,
+                DebourseDetailModel.quantite,
+                DebourseDetailModel.prix_unitaire,
+                DebourseDetailModel.unite,
+                DebourseDetailModel.metier,
+                DebourseDetailModel.taux_horaire,
+                DebourseDetailModel.montant,
+            )
+            .join(LigneDevisModel, DebourseDetailModel.ligne_devis_id == LigneDevisModel.id)
+            .join(LotDevisModel, LigneDevisModel.lot_devis_id == LotDevisModel.id)
+            .where(LotDevisModel.devis_id == devis_source_id)
+            .order_by(DebourseDetailModel.id)
+        ).all()
+        self._inserer_en_masse(
+            DebourseDetailModel,
+            [
+                {
+                    "ligne_devis_id": ligne_mapping[deb.ligne_devis_id],
+                    "type_debourse": deb.type_debourse,
+                    "designation": deb.designation,
+                    "quantite": deb.quantite,
+                    "prix_unitaire": deb.prix_unitaire,
+                    "unite": deb.unite,
+                    "metier": deb.metier,
+                    "taux_horaire": deb.taux_horaire,
+                    "montant": deb.montant,
+                    "created_at": now,
+                }
+                for deb in debourses
+                if deb.ligne_devis_id in ligne_mapping
+            ],
+        )
+
+        return lot_mapping
+
+    def _inserer_en_masse(self, model: Any, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insere des lignes en masse et retourne leurs IDs dans l'ordre.
+
+        Args:
+            model: Le modele SQLAlchemy cible.
+            rows: Les valeurs a inserer (memes cles pour chaque ligne).
+
+        Returns:
+            Les IDs generes, dans l'ordre de ``rows``.
+        """
+        if not rows:
+            return []
+        result = self._session.execute(
+            insert(model).returning(model.id, sort_by_parameter_order=True),
+            rows,
+        )
+        return list(result.scalars())
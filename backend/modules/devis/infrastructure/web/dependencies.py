@@ -48,7 +48,10 @@ from ...application.use_cases.workflow_use_cases import (
     GetWorkflowInfoUseCase,
 )
 from ...application.use_cases.search_use_cases import SearchDevisUseCase
-from ...application.use_cases.dashboard_use_cases import GetDashboardDevisUseCase
+from ...application.use_cases.dashboard_use_cases import (
+    GetDashboardDevisUseCase,
+    GetTendancesPipelineDevisUseCase,
+)
 from ...application.use_cases.lot_use_cases import (
     CreateLotDevisUseCase,
     UpdateLotDevisUseCase,
@@ -357,6 +360,12 @@ def get_dashboard_devis_use_case(
     return GetDashboardDevisUseCase(devis_repo)
 
 
+def get_tendances_pipeline_devis_use_case(
+    devis_repo: DevisRepository = Depends(get_devis_repository),
+) -> GetTendancesPipelineDevisUseCase:
+    return GetTendancesPipelineDevisUseCase(devis_repo)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Use Cases - Lots
 # ─────────────────────────────────────────────────────────────────────────────
@@ -793,7 +802,8 @@ def get_toggle_visibilite_use_case(
 # ─────────────────────────────────────────────────────────────────────────────
 
 from ...application.use_cases.generate_pdf_use_case import GenerateDevisPDFUseCase
-from ..pdf.devis_pdf_generator import DevisPDFGenerator
+from ..pdf.cached_devis_pdf_generator import CachedDevisPDFGenerator
+from shared.infrastructure.pdf import get_pdf_render_cache
 
 
 def get_generate_pdf_use_case(
@@ -803,5 +813,5 @@ def get_generate_pdf_use_case(
     debourse_repo: DebourseDetailRepository = Depends(get_debourse_detail_repository),
 ) -> GenerateDevisPDFUseCase:
     get_devis_uc = GetDevisUseCase(devis_repo, lot_repo, ligne_repo, debourse_repo)
-    pdf_generator = DevisPDFGenerator()
+    pdf_generator = CachedDevisPDFGenerator(get_pdf_render_cache())
     return GenerateDevisPDFUseCase(get_devis_uc, pdf_generator)
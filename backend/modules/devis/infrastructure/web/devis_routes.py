@@ -13,6 +13,7 @@ DEV-24: Relances automatiques
 DEV-25: Frais de chantier
 """
 
+import logging
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
@@ -61,7 +62,10 @@ from ...application.dtos.article_dtos import ArticleCreateDTO
 from ...application.use_cases.lot_use_cases import LotDevisNotFoundError
 from ...application.use_cases.ligne_use_cases import LigneDevisNotFoundError
 from ...application.use_cases.article_use_cases import ArticleNotFoundError
-from ...application.use_cases.dashboard_use_cases import GetDashboardDevisUseCase
+from ...application.use_cases.dashboard_use_cases import (
+    GetDashboardDevisUseCase,
+    GetTendancesPipelineDevisUseCase,
+)
 from ...application.use_cases.search_use_cases import SearchDevisUseCase
 from ...application.use_cases.calcul_totaux_use_cases import CalculerTotauxDevisUseCase
 from ...application.use_cases.journal_use_cases import GetJournalDevisUseCase
@@ -200,6 +204,7 @@ from .dependencies import (
     get_workflow_info_use_case,
     get_search_devis_use_case,
     get_dashboard_devis_use_case,
+    get_tendances_pipeline_devis_use_case,
     get_calculer_totaux_use_case,
     get_journal_devis_use_case,
     get_create_lot_use_case,
@@ -301,6 +306,8 @@ from .devis_schemas import (
 # Router
 # ─────────────────────────────────────────────────────────────────────────────
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/devis", tags=["devis"])
 
 
@@ -318,6 +325,23 @@ async def get_dashboard(
     return result.to_dict()
 
 
+@router.get("/dashboard/tendances")
+async def get_dashboard_tendances(
+    granularite: str = Query("mois", pattern="^(mois|trimestre)$"),
+    date_min: Optional[date] = None,
+    date_max: Optional[date] = None,
+    _role: str = Depends(require_conducteur_or_admin),
+    use_case: GetTendancesPipelineDevisUseCase = Depends(
+        get_tendances_pipeline_devis_use_case
+    ),
+):
+    """Tendances du pipeline commercial par mois ou trimestre (DEV-17)."""
+    result = use_case.execute(
+        granularite=granularite, date_min=date_min, date_max=date_max
+    )
+    return result.to_dict()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Templates de presentation (DEV-11) - route statique avant /{devis_id}
 # ─────────────────────────────────────────────────────────────────────────────
@@ -557,17 +581,27 @@ async def valider_devis(
     _role: str = Depends(require_conducteur_or_admin),
     current_user_id: int = Depends(get_current_user_id),
     use_case: ValiderDevisUseCase = Depends(get_valider_devis_use_case),
+    pdf_use_case: GenerateDevisPDFUseCase = Depends(get_generate_pdf_use_case),
 ):
-    """Valide et envoie un devis (en_validation -> envoye)."""
+    """Valide et envoie un devis (en_validation -> envoye).
+
+    Le PDF client est pre-rendu en arriere-plan (DEV-12) pour etre
+    disponible immediatement une fois le devis envoye.
+    """
     try:
         result = use_case.execute(devis_id, current_user_id)
         db.commit()
-        return result.to_dict()
     except DevisNotFoundError:
         raise HTTPException(status_code=404, detail=f"Devis {devis_id} non trouve")
     except TransitionStatutDevisInvalideError as e:
         raise HTTPException(status_code=409, detail=str(e))
 
+    try:
+        pdf_use_case.prerender(devis_id)
+    except Exception as e:
+        logger.warning("Pre-rendu PDF devis %s impossible: %s", devis_id, e)
+    return result.to_dict()
+
 
 @router.post("/{devis_id}/retourner-brouillon")
 async def retourner_brouillon(
@@ -1820,18 +1854,14 @@ async def generate_devis_pdf(
         HTTPException 404: Si le devis n'existe pas.
         HTTPException 500: Si la generation du PDF echoue.
     """
-    import asyncio
     import re
     import logging
 
     logger = logging.getLogger(__name__)
 
     try:
-        # Generation PDF synchrone → run_in_executor pour ne pas bloquer l'event loop
-        loop = asyncio.get_event_loop()
-        pdf_bytes, filename = await loop.run_in_executor(
-            None, use_case.execute, devis_id
-        )
+        # Rendu attendu sans bloquer l'event loop (pool de rendu PDF)
+        pdf_bytes, filename = await use_case.execute_async(devis_id)
     except DevisNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -24,6 +24,11 @@ from ...application.use_cases import (
     ListAutorisationsUseCase,
     RevokeAutorisationUseCase,
     CheckAccessUseCase,
+    InitUploadUseCase,
+    GetUploadStatusUseCase,
+    AppendUploadChunkUseCase,
+    FinalizeUploadUseCase,
+    AbortUploadUseCase,
 )
 from ...application.dtos import (
     DocumentDTO,
@@ -39,6 +44,8 @@ from ...application.dtos import (
     AutorisationDTO,
     AutorisationCreateDTO,
     AutorisationListDTO,
+    UploadInitDTO,
+    UploadSessionDTO,
 )
 
 
@@ -68,6 +75,11 @@ class DocumentController:
         list_autorisations: ListAutorisationsUseCase,
         revoke_autorisation: RevokeAutorisationUseCase,
         check_access: CheckAccessUseCase,
+        init_upload: InitUploadUseCase,
+        get_upload_status: GetUploadStatusUseCase,
+        append_upload_chunk: AppendUploadChunkUseCase,
+        finalize_upload: FinalizeUploadUseCase,
+        abort_upload: AbortUploadUseCase,
     ):
         """Initialise le controller avec les use cases."""
         self._upload_document = upload_document
@@ -91,6 +103,11 @@ class DocumentController:
         self._list_autorisations = list_autorisations
         self._revoke_autorisation = revoke_autorisation
         self._check_access = check_access
+        self._init_upload = init_upload
+        self._get_upload_status = get_upload_status
+        self._append_upload_chunk = append_upload_chunk
+        self._finalize_upload = finalize_upload
+        self._abort_upload = abort_upload
 
     # Document operations
     def upload_document(
@@ -118,6 +135,29 @@ class DocumentController:
             niveau_acces=niveau_acces,
         )
 
+    # Chunked upload operations
+    def init_upload(self, dto: UploadInitDTO, uploaded_by: int) -> UploadSessionDTO:
+        """Ouvre une session d'upload découpé."""
+        return self._init_upload.execute(dto, uploaded_by)
+
+    def get_upload_status(self, upload_id: str, user_id: int) -> UploadSessionDTO:
+        """Récupère l'offset de reprise d'un upload."""
+        return self._get_upload_status.execute(upload_id, user_id)
+
+    def append_upload_chunk(
+        self, upload_id: str, offset: int, data: bytes, user_id: int
+    ) -> UploadSessionDTO:
+        """Ajoute un morceau à un upload."""
+        return self._append_upload_chunk.execute(upload_id, offset, data, user_id)
+
+    def finalize_upload(self, upload_id: str, user_id: int) -> DocumentDTO:
+        """Finalise un upload et crée le document."""
+        return self._finalize_upload.execute(upload_id, user_id)
+
+    def abort_upload(self, upload_id: str, user_id: int) -> None:
+        """Abandonne un upload."""
+        self._abort_upload.execute(upload_id, user_id)
+
     def get_document(self, document_id: int) -> DocumentDTO:
         """Récupère un document."""
         return self._get_document.execute(document_id)
@@ -174,9 +214,14 @@ class DocumentController:
         """Liste les dossiers."""
         return self._list_dossiers.execute(chantier_id, parent_id)
 
-    def get_arborescence(self, chantier_id: int) -> ArborescenceDTO:
-        """Récupère l'arborescence complète."""
-        return self._get_arborescence.execute(chantier_id)
+    def get_arborescence(
+        self,
+        chantier_id: int,
+        dossier_id: Optional[int] = None,
+        profondeur: Optional[int] = None,
+    ) -> ArborescenceDTO:
+        """Récupère l'arborescence (ou un sous-arbre)."""
+        return self._get_arborescence.execute(chantier_id, dossier_id, profondeur)
 
     def update_dossier(
         self, dossier_id: int, dto: DossierUpdateDTO
@@ -1,19 +1,37 @@
 """Implémentation locale du service de stockage de fichiers."""
 
+import fcntl
+import hashlib
 import io
 import logging
+import os
+import re
 import shutil
+import threading
 import zipfile
-from typing import BinaryIO, Dict, Optional
+from contextlib import contextmanager
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterator, List, Optional
 from pathlib import Path
 import uuid
 
-from PIL import Image
-
-from ...domain.services import FileStorageService
+from ...domain.services import ChunkOffsetError, FileStorageService
 
 logger = logging.getLogger(__name__)
 
+# Uploads découpés en cours, puis contenus rangés par empreinte SHA-256
+INCOMING_DIR = "incoming"
+BLOBS_DIR = "blobs"
+BLOB_LOCKS_DIR = ".locks"
+HASH_BLOCK_SIZE = 1024 * 1024
+_UPLOAD_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+# Empreintes en cours par upload : (octets hachés, hasher). Propre au
+# processus : si un morceau arrive sur un autre worker, l'empreinte est
+# recalculée depuis le disque à la finalisation.
+_upload_hashers: Dict[str, tuple] = {}
+_upload_hashers_lock = threading.Lock()
+
 
 class LocalFileStorageService(FileStorageService):
     """
@@ -147,6 +165,168 @@ class LocalFileStorageService(FileStorageService):
         shutil.copy2(str(source), str(dest))
         return True
 
+    def save_by_content(self, file_content: BinaryIO, extension: str) -> tuple[str, str]:
+        """Copie le fichier par blocs en le hachant, puis le range sous blobs/<sha256>."""
+        incoming = self._base_path / INCOMING_DIR
+        incoming.mkdir(parents=True, exist_ok=True)
+        temporaire = incoming / f"{uuid.uuid4().hex}.tmp"
+        hasher = hashlib.sha256()
+        try:
+            with open(temporaire, "wb") as f:
+                for bloc in iter(lambda: file_content.read(HASH_BLOCK_SIZE), b""):
+                    hasher.update(bloc)
+                    f.write(bloc)
+            empreinte = hasher.hexdigest()
+            return self._store_blob(temporaire, empreinte, extension), empreinte
+        finally:
+            temporaire.unlink(missing_ok=True)
+
+    def get_upload_offset(self, upload_id: str) -> int:
+        """Retourne le nombre d'octets déjà reçus (taille du fichier partiel)."""
+        partial = self._partial_path(upload_id)
+        return partial.stat().st_size if partial.exists() else 0
+
+    def append_chunk(self, upload_id: str, offset: int, data: bytes) -> int:
+        """Écrit un morceau à offset, sous verrou exclusif de l'upload."""
+        partial = self._partial_path(upload_id)
+        with self._upload_lock(upload_id):
+            # Taille revérifiée sous verrou : un morceau rejoué pendant que
+            # le premier envoi s'écrit encore est refusé, pas ajouté en double
+            recu = partial.stat().st_size if partial.exists() else 0
+            if offset != recu:
+                raise ChunkOffsetError(recu)
+
+            fd = os.open(partial, os.O_WRONLY | os.O_CREAT, 0o640)
+            try:
+                os.pwrite(fd, data, offset)
+            finally:
+                os.close(fd)
+
+            with _upload_hashers_lock:
+                etat = _upload_hashers.pop(upload_id, None)
+            if etat is None and offset == 0:
+                etat = (0, hashlib.sha256())
+            if etat is not None and etat[0] == offset:
+                etat[1].update(data)
+                with _upload_hashers_lock:
+                    _upload_hashers[upload_id] = (offset + len(data), etat[1])
+
+        return offset + len(data)
+
+    def finalize_upload(self, upload_id: str, extension: str) -> tuple[str, str]:
+        """Range le fichier partiel sous blobs/<sha256>, une seule fois par contenu."""
+        partial = self._partial_path(upload_id)
+        with self._upload_lock(upload_id):
+            if not partial.exists():
+                raise FileNotFoundError(f"Aucun contenu reçu pour l'upload {upload_id}")
+
+            taille = partial.stat().st_size
+            with _upload_hashers_lock:
+                etat = _upload_hashers.pop(upload_id, None)
+            if etat is not None and etat[0] == taille:
+                empreinte = etat[1].hexdigest()
+            else:
+                empreinte = self._hash_file(partial)
+
+            relatif = self._store_blob(partial, empreinte, extension)
+        self._lock_path(upload_id).unlink(missing_ok=True)
+        return relatif, empreinte
+
+    def abort_upload(self, upload_id: str) -> None:
+        """Supprime le fichier partiel et l'empreinte en cours."""
+        with self._upload_lock(upload_id):
+            with _upload_hashers_lock:
+                _upload_hashers.pop(upload_id, None)
+            self._partial_path(upload_id).unlink(missing_ok=True)
+        self._lock_path(upload_id).unlink(missing_ok=True)
+
+    def _store_blob(self, source: Path, empreinte: str, extension: str) -> str:
+        """Déplace un fichier vers blobs/<h[:2]>/<h[2:4]>/<h>.<ext> et retourne ce chemin."""
+        safe_ext = "".join(c for c in extension.lower() if c.isalnum())
+        nom = f"{empreinte}.{safe_ext}" if safe_ext else empreinte
+        relatif = Path(BLOBS_DIR) / empreinte[:2] / empreinte[2:4] / nom
+        destination = self._base_path / relatif
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        with self._blob_lock(empreinte):
+            # Contenu identique déjà stocké : le remplacement atomique le
+            # conserve en un seul exemplaire. La date d'écriture est remise à
+            # maintenant pour que delete_blob ne le supprime pas avant que le
+            # document qui le référence soit validé en base.
+            os.replace(source, destination)
+            os.utime(destination)
+        return str(relatif)
+
+    def list_blobs(self, modifies_avant: datetime) -> List[str]:
+        """Liste les contenus de blobs/ non modifiés depuis modifies_avant."""
+        blobs = self._base_path / BLOBS_DIR
+        if not blobs.exists():
+            return []
+        seuil = modifies_avant.timestamp()
+        chemins = []
+        for racine, dossiers, fichiers in os.walk(blobs):
+            dossiers[:] = [d for d in dossiers if d not in (BLOB_LOCKS_DIR, "webp")]
+            for nom in fichiers:
+                chemin = Path(racine) / nom
+                if chemin.stat().st_mtime < seuil:
+                    chemins.append(str(chemin.relative_to(self._base_path)))
+        return chemins
+
+    def delete_blob(self, chemin_stockage: str, modifies_avant: datetime) -> bool:
+        """Supprime un contenu et ses thumbnails WebP, sous le verrou du contenu."""
+        file_path = self._validate_path(chemin_stockage)
+        if not file_path or Path(BLOBS_DIR) not in Path(chemin_stockage).parents:
+            return False
+        with self._blob_lock(file_path.name.split(".", 1)[0]):
+            if not file_path.exists() or file_path.stat().st_mtime >= modifies_avant.timestamp():
+                return False
+            file_path.unlink()
+            for variante in (file_path.parent / "webp").glob(f"{file_path.stem}_*.webp"):
+                variante.unlink(missing_ok=True)
+        return True
+
+    @contextmanager
+    def _upload_lock(self, upload_id: str) -> Iterator[None]:
+        """Verrou exclusif d'un upload, partagé entre threads et workers (flock)."""
+        lock_path = self._lock_path(upload_id)
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _blob_lock(self, empreinte: str) -> Iterator[None]:
+        """Verrou d'un contenu rangé par empreinte (256 verrous répartis par préfixe)."""
+        lock_dir = self._base_path / BLOBS_DIR / BLOB_LOCKS_DIR
+        lock_dir.mkdir(parents=True, exist_ok=True)
+        with open(lock_dir / f"{empreinte[:2]}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _lock_path(self, upload_id: str) -> Path:
+        """Chemin du fichier verrou d'un upload."""
+        return self._partial_path(upload_id).with_suffix(".lock")
+
+    def _partial_path(self, upload_id: str) -> Path:
+        """Chemin du fichier partiel d'un upload (ID validé contre path traversal)."""
+        if not _UPLOAD_ID_PATTERN.match(upload_id):
+            raise ValueError(f"Identifiant d'upload invalide: {upload_id}")
+        return self._base_path / INCOMING_DIR / f"{upload_id}.part"
+
+    @staticmethod
+    def _hash_file(file_path: Path) -> str:
+        """Calcule l'empreinte SHA-256 d'un fichier par blocs."""
+        hasher = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for bloc in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                hasher.update(bloc)
+        return hasher.hexdigest()
+
     def _sanitize_filename(self, filename: str) -> str:
         """
         Nettoie un nom de fichier pour le stockage.
@@ -206,6 +386,8 @@ class LocalFileStorageService(FileStorageService):
         if ext not in self.IMAGE_EXTENSIONS:
             return {}
 
+        from PIL import Image  # Import différé : Pillow n'est chargé qu'au premier traitement d'image
+
         try:
             img = Image.open(file_path)
             if img.mode in ("RGBA", "P"):
@@ -16,6 +16,10 @@ from .dossier_dtos import (
     DossierTreeDTO,
     ArborescenceDTO,
 )
+from .upload_dtos import (
+    UploadInitDTO,
+    UploadSessionDTO,
+)
 from .autorisation_dtos import (
     AutorisationDTO,
     AutorisationCreateDTO,
@@ -37,6 +41,9 @@ __all__ = [
     "DossierUpdateDTO",
     "DossierTreeDTO",
     "ArborescenceDTO",
+    # Upload DTOs
+    "UploadInitDTO",
+    "UploadSessionDTO",
     # Autorisation DTOs
     "AutorisationDTO",
     "AutorisationCreateDTO",
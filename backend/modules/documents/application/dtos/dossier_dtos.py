@@ -56,6 +56,8 @@ class DossierTreeDTO:
     chemin_complet: str
     nombre_documents: int
     children: List["DossierTreeDTO"]
+    taille_documents: int = 0
+    nombre_sous_dossiers: int = 0
 
 
 @dataclass
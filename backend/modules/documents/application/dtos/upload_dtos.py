@@ -0,0 +1,59 @@
+"""DTOs pour les uploads découpés et reprenables."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ...domain.entities import UploadSession
+
+
+@dataclass
+class UploadInitDTO:
+    """DTO pour l'ouverture d'une session d'upload."""
+
+    chantier_id: int
+    dossier_id: int
+    nom_original: str
+    taille: int
+    mime_type: str = "application/octet-stream"
+    description: Optional[str] = None
+    niveau_acces: Optional[str] = None
+
+
+@dataclass
+class UploadSessionDTO:
+    """DTO représentant l'état d'une session d'upload."""
+
+    id: str
+    chantier_id: int
+    dossier_id: int
+    nom_original: str
+    taille: int
+    offset: int
+    complet: bool
+    expires_at: datetime
+
+    @classmethod
+    def from_entity(cls, entity: UploadSession, offset: int) -> UploadSessionDTO:
+        """Convertit une entité UploadSession en DTO.
+
+        Args:
+            entity: La session source.
+            offset: Octets déjà reçus par le stockage.
+
+        Returns:
+            Le DTO correspondant.
+        """
+        return cls(
+            id=entity.id,
+            chantier_id=entity.chantier_id,
+            dossier_id=entity.dossier_id,
+            nom_original=entity.nom_original,
+            taille=entity.taille,
+            offset=offset,
+            complet=offset >= entity.taille,
+            expires_at=entity.expires_at,  # type: ignore
+        )
@@ -19,6 +19,7 @@ from .document_use_cases import (
     SearchDocumentsUseCase,
     UpdateDocumentUseCase,
     DeleteDocumentUseCase,
+    PurgeOrphanBlobsUseCase,
     DownloadDocumentUseCase,
     DownloadMultipleDocumentsUseCase,
     GetDocumentPreviewUseCase,
@@ -29,6 +30,19 @@ from .document_use_cases import (
     DuplicateDocumentNameError,
     AccessDeniedError,
 )
+from .upload_use_cases import (
+    InitUploadUseCase,
+    GetUploadStatusUseCase,
+    AppendUploadChunkUseCase,
+    FinalizeUploadUseCase,
+    AbortUploadUseCase,
+    PurgeExpiredUploadsUseCase,
+    UploadSessionNotFoundError,
+    UploadSessionExpiredError,
+    UploadOffsetMismatchError,
+    UploadSizeExceededError,
+    UploadIncompleteError,
+)
 from .autorisation_use_cases import (
     CreateAutorisationUseCase,
     ListAutorisationsUseCase,
@@ -55,10 +69,18 @@ __all__ = [
     "SearchDocumentsUseCase",
     "UpdateDocumentUseCase",
     "DeleteDocumentUseCase",
+    "PurgeOrphanBlobsUseCase",
     "DownloadDocumentUseCase",
     "DownloadMultipleDocumentsUseCase",
     "GetDocumentPreviewUseCase",
     "GetDocumentPreviewContentUseCase",
+    # Upload Use Cases
+    "InitUploadUseCase",
+    "GetUploadStatusUseCase",
+    "AppendUploadChunkUseCase",
+    "FinalizeUploadUseCase",
+    "AbortUploadUseCase",
+    "PurgeExpiredUploadsUseCase",
     # Autorisation Use Cases
     "CreateAutorisationUseCase",
     "ListAutorisationsUseCase",
@@ -73,6 +95,11 @@ __all__ = [
     "InvalidFileTypeError",
     "DuplicateDocumentNameError",
     "AccessDeniedError",
+    "UploadSessionNotFoundError",
+    "UploadSessionExpiredError",
+    "UploadOffsetMismatchError",
+    "UploadSizeExceededError",
+    "UploadIncompleteError",
     "AutorisationAlreadyExistsError",
     "AutorisationNotFoundError",
     "InvalidTargetError",
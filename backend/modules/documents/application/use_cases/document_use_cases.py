@@ -1,6 +1,7 @@
 """Use Cases pour la gestion des documents."""
 
 import mimetypes
+from datetime import datetime, timedelta
 from typing import Optional, BinaryIO
 
 from ..dtos import (
@@ -61,6 +62,71 @@ ALLOWED_EXTENSIONS = {
 }
 
 
+def valider_fichier_upload(filename: str, taille: int, mime_type: str) -> str:
+    """
+    Valide un fichier avant upload (GED-07, GED-12).
+
+    Args:
+        filename: Nom du fichier.
+        taille: Taille en bytes.
+        mime_type: Type MIME déclaré.
+
+    Returns:
+        L'extension du fichier, en minuscules.
+
+    Raises:
+        FileTooLargeError: Si le fichier est trop gros.
+        InvalidFileTypeError: Si le type n'est pas supporté.
+    """
+    # Valider la taille (GED-07: max 10 Go)
+    if not Document.valider_taille(taille):
+        raise FileTooLargeError("Le fichier dépasse la limite de 10 Go")
+
+    # Valider l'extension (GED-12)
+    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if not extension or extension not in ALLOWED_EXTENSIONS:
+        raise InvalidFileTypeError(f"Type de fichier non supporté: .{extension}")
+
+    # Valider la cohérence MIME type / extension
+    guessed_type, _ = mimetypes.guess_type(filename)
+    if guessed_type and mime_type != "application/octet-stream":
+        # Vérifier que le MIME déclaré est cohérent avec l'extension
+        expected_type, _ = mimetypes.guess_type(f"file.{extension}")
+        if expected_type and guessed_type != mime_type and expected_type != mime_type:
+            raise InvalidFileTypeError(
+                f"Le type MIME '{mime_type}' ne correspond pas à l'extension '.{extension}'"
+            )
+
+    return extension
+
+
+def resoudre_nom_unique(
+    document_repository: DocumentRepository, filename: str, dossier_id: int
+) -> str:
+    """
+    Retourne un nom libre dans le dossier (suffixe _1, _2... en cas de doublon).
+
+    Args:
+        document_repository: Repository des documents.
+        filename: Nom souhaité.
+        dossier_id: ID du dossier.
+
+    Returns:
+        Le nom à utiliser.
+    """
+    nom = filename
+    if document_repository.exists_by_nom_in_dossier(nom, dossier_id):
+        base, ext = nom.rsplit(".", 1) if "." in nom else (nom, "")
+        counter = 1
+        while document_repository.exists_by_nom_in_dossier(
+            f"{base}_{counter}.{ext}" if ext else f"{base}_{counter}",
+            dossier_id,
+        ):
+            counter += 1
+        nom = f"{base}_{counter}.{ext}" if ext else f"{base}_{counter}"
+    return nom
+
+
 class UploadDocumentUseCase:
     """Use case pour uploader un document (GED-06, GED-07, GED-08)."""
 
@@ -116,49 +182,20 @@ class UploadDocumentUseCase:
             InvalidFileTypeError: Si le type n'est pas supporté.
             DossierNotFoundError: Si le dossier n'existe pas.
         """
-        # Valider la taille (GED-07: max 10 Go)
-        if not Document.valider_taille(taille):
-            raise FileTooLargeError("Le fichier dépasse la limite de 10 Go")
-
-        # Valider l'extension (GED-12)
-        extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
-        if not extension or extension not in ALLOWED_EXTENSIONS:
-            raise InvalidFileTypeError(f"Type de fichier non supporté: .{extension}")
-
-        # Valider la cohérence MIME type / extension
-        guessed_type, _ = mimetypes.guess_type(filename)
-        if guessed_type and mime_type != "application/octet-stream":
-            # Vérifier que le MIME déclaré est cohérent avec l'extension
-            expected_type, _ = mimetypes.guess_type(f"file.{extension}")
-            if expected_type and guessed_type != mime_type and expected_type != mime_type:
-                raise InvalidFileTypeError(
-                    f"Le type MIME '{mime_type}' ne correspond pas à l'extension '.{extension}'"
-                )
+        extension = valider_fichier_upload(filename, taille, mime_type)
 
         # Vérifier que le dossier existe
         dossier = self._dossier_repo.find_by_id(dossier_id)
         if not dossier:
             raise DossierNotFoundError(f"Dossier {dossier_id} non trouvé")
 
-        # Gérer les doublons de nom
-        nom = filename
-        if self._document_repo.exists_by_nom_in_dossier(nom, dossier_id):
-            base, ext = nom.rsplit(".", 1) if "." in nom else (nom, "")
-            counter = 1
-            while self._document_repo.exists_by_nom_in_dossier(
-                f"{base}_{counter}.{ext}" if ext else f"{base}_{counter}",
-                dossier_id,
-            ):
-                counter += 1
-            nom = f"{base}_{counter}.{ext}" if ext else f"{base}_{counter}"
-
-        # Sauvegarder le fichier
-        chemin_stockage = self._file_storage.save(
-            file_content, nom, chantier_id, dossier_id
-        )
+        nom = resoudre_nom_unique(self._document_repo, filename, dossier_id)
 
-        # 2.5.4: Generer thumbnails WebP pour les images
-        self._file_storage.generate_webp_thumbnails(chemin_stockage)
+        # Sauvegarder le fichier, une seule fois par contenu (même jeu de
+        # plans envoyé sur plusieurs chantiers)
+        chemin_stockage, empreinte = self._file_storage.save_by_content(
+            file_content, extension
+        )
 
         # Créer l'entité document
         document = Document(
@@ -173,11 +210,16 @@ class UploadDocumentUseCase:
             type_document=TypeDocument.from_extension(extension) if extension else TypeDocument.AUTRE,
             niveau_acces=NiveauAcces.from_string(niveau_acces) if niveau_acces else None,
             description=description,
+            contenu_hash=empreinte,
         )
 
         # Persister
         document = self._document_repo.save(document)
 
+        # 2.5.4: Generer thumbnails WebP pour les images, une fois par contenu
+        if self._document_repo.count_by_chemin_stockage(chemin_stockage) == 1:
+            self._file_storage.generate_webp_thumbnails(chemin_stockage)
+
         return DocumentDTO.from_entity(document)
 
 
@@ -366,8 +408,12 @@ class DeleteDocumentUseCase:
         if not document:
             raise DocumentNotFoundError(f"Document {document_id} non trouvé")
 
-        # Supprimer le fichier physique
-        self._file_storage.delete(document.chemin_stockage)
+        # Supprimer le fichier physique. Un contenu rangé par empreinte peut
+        # être partagé avec d'autres documents, ou en train d'être référencé
+        # par un upload non encore validé : il est supprimé après commit par
+        # PurgeOrphanBlobsUseCase, quand plus aucun document ne le référence.
+        if not document.contenu_hash:
+            self._file_storage.delete(document.chemin_stockage)
 
         # Supprimer les autorisations liées
         self._autorisation_repo.delete_by_document(document_id)
@@ -376,6 +422,46 @@ class DeleteDocumentUseCase:
         return self._document_repo.delete(document_id)
 
 
+class PurgeOrphanBlobsUseCase:
+    """Use case pour supprimer les contenus plus référencés par aucun document."""
+
+    # Délai de grâce entre l'écriture d'un contenu et la validation en base
+    # du document qui le référence
+    DELAI_GRACE = timedelta(hours=1)
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        file_storage: FileStorageService,
+    ):
+        """Initialise le use case."""
+        self._document_repo = document_repository
+        self._file_storage = file_storage
+
+    def execute(self, maintenant: Optional[datetime] = None) -> int:
+        """
+        Supprime les contenus orphelins.
+
+        Seuls les contenus écrits depuis plus de DELAI_GRACE sont candidats,
+        et la date est revérifiée par le stockage sous le verrou du contenu :
+        un upload finalisé entre le comptage et la suppression le réécrit
+        et le conserve.
+
+        Args:
+            maintenant: Date de référence (défaut: maintenant).
+
+        Returns:
+            Nombre de contenus supprimés.
+        """
+        seuil = (maintenant or datetime.now()) - self.DELAI_GRACE
+        supprimes = 0
+        for chemin in self._file_storage.list_blobs(seuil):
+            if self._document_repo.count_by_chemin_stockage(chemin) == 0:
+                if self._file_storage.delete_blob(chemin, seuil):
+                    supprimes += 1
+        return supprimes
+
+
 class DownloadDocumentUseCase:
     """Use case pour télécharger un document."""
 
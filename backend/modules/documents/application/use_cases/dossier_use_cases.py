@@ -1,6 +1,7 @@
 """Use Cases pour la gestion des dossiers."""
 
-from typing import Optional, List
+from collections import defaultdict
+from typing import Dict, Optional, List, Tuple
 
 from ..dtos import DossierDTO, DossierCreateDTO, DossierUpdateDTO, DossierTreeDTO, ArborescenceDTO
 from ...domain.entities import Dossier
@@ -186,7 +187,13 @@ class ListDossiersUseCase:
 
 
 class GetArborescenceUseCase:
-    """Use case pour récupérer l'arborescence complète (GED-02)."""
+    """Use case pour récupérer l'arborescence complète (GED-02).
+
+    L'arbre est construit en une passe à partir d'un index parent -> enfants,
+    avec les nombres et tailles de documents de tous les dossiers obtenus en
+    une seule requête groupée. Un sous-arbre seul (navigation profonde) et une
+    profondeur maximale (chargement paresseux) peuvent être demandés.
+    """
 
     def __init__(
         self,
@@ -197,55 +204,91 @@ class GetArborescenceUseCase:
         self._dossier_repo = dossier_repository
         self._document_repo = document_repository
 
-    def execute(self, chantier_id: int) -> ArborescenceDTO:
+    def execute(
+        self,
+        chantier_id: int,
+        dossier_id: Optional[int] = None,
+        profondeur: Optional[int] = None,
+    ) -> ArborescenceDTO:
         """
-        Récupère l'arborescence complète d'un chantier.
+        Récupère l'arborescence d'un chantier.
 
         Args:
             chantier_id: ID du chantier.
+            dossier_id: Racine du sous-arbre à renvoyer (défaut: tout l'arbre).
+            profondeur: Nombre de niveaux renvoyés (défaut: tous). Les dossiers
+                du dernier niveau ont leurs enfants vides mais conservent
+                nombre_sous_dossiers, pour charger la suite à la demande.
 
         Returns:
-            L'arborescence avec statistiques.
+            L'arborescence avec statistiques (limitées au sous-arbre demandé).
+
+        Raises:
+            DossierNotFoundError: Si dossier_id n'appartient pas au chantier.
         """
         all_dossiers = self._dossier_repo.get_arborescence(chantier_id)
+        stats = self._document_repo.get_stats_by_dossier(chantier_id)
 
-        # Construire l'arbre et accumuler le total des documents
-        {d.id: d for d in all_dossiers}
-        root_dossiers = []
-        total_docs_count = 0
-
-        def build_tree(dossier: Dossier) -> DossierTreeDTO:
-            nonlocal total_docs_count
-            children = [
-                build_tree(d) for d in all_dossiers if d.parent_id == dossier.id
-            ]
-            nb_docs = self._document_repo.count_by_dossier(dossier.id)  # type: ignore
-            total_docs_count += nb_docs
-            return DossierTreeDTO(
-                id=dossier.id,  # type: ignore
-                chantier_id=dossier.chantier_id,
-                nom=dossier.nom,
-                type_dossier=dossier.type_dossier.value,
-                niveau_acces=dossier.niveau_acces.value,
-                parent_id=dossier.parent_id,
-                ordre=dossier.ordre,
-                chemin_complet=dossier.chemin_complet,
-                nombre_documents=nb_docs,
-                children=sorted(children, key=lambda x: x.ordre),
-            )
-
+        enfants: Dict[Optional[int], List[Dossier]] = defaultdict(list)
+        par_id: Dict[int, Dossier] = {}
         for dossier in all_dossiers:
-            if dossier.parent_id is None:
-                root_dossiers.append(build_tree(dossier))
+            enfants[dossier.parent_id].append(dossier)
+            par_id[dossier.id] = dossier  # type: ignore
+        for freres in enfants.values():
+            freres.sort(key=lambda d: d.ordre)
+
+        if dossier_id is None:
+            racines = enfants[None]
+        elif dossier_id in par_id:
+            racines = [par_id[dossier_id]]
+        else:
+            raise DossierNotFoundError(f"Dossier {dossier_id} non trouvé")
 
-        # Trier par ordre/numéro
-        root_dossiers.sort(key=lambda x: x.ordre)
+        # Totaux du sous-arbre complet, indépendamment de la profondeur renvoyée
+        total_docs_count = 0
+        total_taille = 0
+        a_visiter = list(racines)
+        while a_visiter:
+            dossier = a_visiter.pop()
+            nombre, taille = stats.get(dossier.id, (0, 0))  # type: ignore
+            total_docs_count += nombre
+            total_taille += taille
+            a_visiter.extend(enfants[dossier.id])
 
         return ArborescenceDTO(
             chantier_id=chantier_id,
-            dossiers=root_dossiers,
+            dossiers=[self._build_tree(d, enfants, stats, profondeur) for d in racines],
             total_documents=total_docs_count,
-            total_taille=self._document_repo.get_total_size_by_chantier(chantier_id),
+            total_taille=total_taille,
+        )
+
+    def _build_tree(
+        self,
+        dossier: Dossier,
+        enfants: Dict[Optional[int], List[Dossier]],
+        stats: Dict[int, Tuple[int, int]],
+        profondeur: Optional[int],
+    ) -> DossierTreeDTO:
+        """Construit le nœud d'un dossier et de ses descendants."""
+        sous_dossiers = enfants.get(dossier.id, [])
+        children = []
+        if profondeur is None or profondeur > 1:
+            reste = None if profondeur is None else profondeur - 1
+            children = [self._build_tree(d, enfants, stats, reste) for d in sous_dossiers]
+        nombre, taille = stats.get(dossier.id, (0, 0))  # type: ignore
+        return DossierTreeDTO(
+            id=dossier.id,  # type: ignore
+            chantier_id=dossier.chantier_id,
+            nom=dossier.nom,
+            type_dossier=dossier.type_dossier.value,
+            niveau_acces=dossier.niveau_acces.value,
+            parent_id=dossier.parent_id,
+            ordre=dossier.ordre,
+            chemin_complet=dossier.chemin_complet,
+            nombre_documents=nombre,
+            children=children,
+            taille_documents=taille,
+            nombre_sous_dossiers=len(sous_dossiers),
         )
 
 
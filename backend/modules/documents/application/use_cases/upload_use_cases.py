@@ -0,0 +1,374 @@
+"""Use Cases pour les uploads découpés et reprenables (GED-06, GED-07).
+
+Protocole : ouverture de session (nom, taille, type), envoi des morceaux
+dans l'ordre à l'offset courant, puis finalisation. Après une coupure, le
+client relit l'offset de la session et reprend l'envoi à partir de là.
+
+À la finalisation, le contenu est rangé par empreinte SHA-256 : un même jeu
+de plans envoyé sur plusieurs chantiers n'est stocké qu'une fois, et le
+fichier n'est supprimé qu'avec le dernier document qui le référence.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from ..dtos import DocumentDTO, UploadInitDTO, UploadSessionDTO
+from ...domain.entities import Document, UploadSession
+from ...domain.repositories import (
+    DocumentRepository,
+    DossierRepository,
+    UploadSessionRepository,
+)
+from ...domain.services import ChunkOffsetError, FileStorageService
+from ...domain.value_objects import NiveauAcces, TypeDocument
+from .document_use_cases import (
+    FileTooLargeError,
+    resoudre_nom_unique,
+    valider_fichier_upload,
+)
+from .dossier_use_cases import DossierNotFoundError
+
+# Taille maximale d'un morceau (le corps de la requête est lu en mémoire)
+TAILLE_MAX_MORCEAU = 16 * 1024 * 1024
+
+
+class UploadSessionNotFoundError(Exception):
+    """Erreur levée quand une session d'upload n'est pas trouvée."""
+
+    pass
+
+
+class UploadSessionExpiredError(Exception):
+    """Erreur levée quand une session d'upload a expiré."""
+
+    pass
+
+
+class UploadOffsetMismatchError(Exception):
+    """Erreur levée quand un morceau n'arrive pas à l'offset attendu."""
+
+    def __init__(self, offset: int):
+        """
+        Args:
+            offset: Offset auquel le client doit reprendre.
+        """
+        self.offset = offset
+        super().__init__(f"Morceau hors séquence : reprise attendue à l'octet {offset}")
+
+
+class UploadSizeExceededError(Exception):
+    """Erreur levée quand les morceaux dépassent la taille annoncée."""
+
+    pass
+
+
+class UploadIncompleteError(Exception):
+    """Erreur levée quand on finalise un upload incomplet."""
+
+    pass
+
+
+def _charger_session(
+    upload_session_repository: UploadSessionRepository,
+    session_id: str,
+    user_id: int,
+    verifier_expiration: bool = True,
+) -> UploadSession:
+    """
+    Charge une session d'upload de l'utilisateur.
+
+    Raises:
+        UploadSessionNotFoundError: Si la session n'existe pas ou appartient
+            à un autre utilisateur.
+        UploadSessionExpiredError: Si la session a expiré.
+    """
+    upload_session = upload_session_repository.find_by_id(session_id)
+    if not upload_session or not upload_session.appartient_a(user_id):
+        raise UploadSessionNotFoundError(f"Upload {session_id} non trouvé")
+    if verifier_expiration and upload_session.est_expiree():
+        raise UploadSessionExpiredError(f"Upload {session_id} expiré")
+    return upload_session
+
+
+class InitUploadUseCase:
+    """Use case pour ouvrir une session d'upload découpé."""
+
+    def __init__(
+        self,
+        dossier_repository: DossierRepository,
+        upload_session_repository: UploadSessionRepository,
+    ):
+        """
+        Initialise le use case.
+
+        Args:
+            dossier_repository: Repository des dossiers.
+            upload_session_repository: Repository des sessions d'upload.
+        """
+        self._dossier_repo = dossier_repository
+        self._upload_session_repo = upload_session_repository
+
+    def execute(self, dto: UploadInitDTO, uploaded_by: int) -> UploadSessionDTO:
+        """
+        Ouvre une session d'upload.
+
+        Args:
+            dto: Fichier annoncé (nom, taille, type) et destination.
+            uploaded_by: ID de l'utilisateur.
+
+        Returns:
+            La session ouverte (offset 0).
+
+        Raises:
+            FileTooLargeError: Si le fichier est trop gros.
+            InvalidFileTypeError: Si le type n'est pas supporté.
+            DossierNotFoundError: Si le dossier n'existe pas dans ce chantier.
+        """
+        valider_fichier_upload(dto.nom_original, dto.taille, dto.mime_type)
+        if dto.niveau_acces:
+            NiveauAcces.from_string(dto.niveau_acces)
+
+        dossier = self._dossier_repo.find_by_id(dto.dossier_id)
+        if not dossier or dossier.chantier_id != dto.chantier_id:
+            raise DossierNotFoundError(f"Dossier {dto.dossier_id} non trouvé")
+
+        upload_session = self._upload_session_repo.save(
+            UploadSession(
+                chantier_id=dto.chantier_id,
+                dossier_id=dto.dossier_id,
+                uploaded_by=uploaded_by,
+                nom_original=dto.nom_original,
+                taille=dto.taille,
+                mime_type=dto.mime_type,
+                description=dto.description,
+                niveau_acces=dto.niveau_acces,
+            )
+        )
+        return UploadSessionDTO.from_entity(upload_session, 0)
+
+
+class GetUploadStatusUseCase:
+    """Use case pour connaître l'offset de reprise d'un upload."""
+
+    def __init__(
+        self,
+        upload_session_repository: UploadSessionRepository,
+        file_storage: FileStorageService,
+    ):
+        """Initialise le use case."""
+        self._upload_session_repo = upload_session_repository
+        self._file_storage = file_storage
+
+    def execute(self, session_id: str, user_id: int) -> UploadSessionDTO:
+        """
+        Récupère l'état d'une session d'upload.
+
+        Args:
+            session_id: ID de la session.
+            user_id: ID de l'utilisateur.
+
+        Returns:
+            La session et les octets déjà reçus.
+
+        Raises:
+            UploadSessionNotFoundError: Si la session n'existe pas.
+            UploadSessionExpiredError: Si la session a expiré.
+        """
+        upload_session = _charger_session(self._upload_session_repo, session_id, user_id)
+        offset = self._file_storage.get_upload_offset(session_id)
+        return UploadSessionDTO.from_entity(upload_session, offset)
+
+
+class AppendUploadChunkUseCase:
+    """Use case pour ajouter un morceau à un upload."""
+
+    def __init__(
+        self,
+        upload_session_repository: UploadSessionRepository,
+        file_storage: FileStorageService,
+    ):
+        """Initialise le use case."""
+        self._upload_session_repo = upload_session_repository
+        self._file_storage = file_storage
+
+    def execute(
+        self, session_id: str, offset: int, data: bytes, user_id: int
+    ) -> UploadSessionDTO:
+        """
+        Ajoute un morceau à l'offset courant.
+
+        Args:
+            session_id: ID de la session.
+            offset: Position du morceau dans le fichier.
+            data: Octets du morceau.
+            user_id: ID de l'utilisateur.
+
+        Returns:
+            La session et le nouvel offset.
+
+        Raises:
+            UploadSessionNotFoundError: Si la session n'existe pas.
+            UploadSessionExpiredError: Si la session a expiré.
+            UploadOffsetMismatchError: Si l'offset n'est pas celui attendu.
+            FileTooLargeError: Si le morceau dépasse TAILLE_MAX_MORCEAU.
+            UploadSizeExceededError: Si le morceau dépasse la taille annoncée.
+        """
+        upload_session = _charger_session(self._upload_session_repo, session_id, user_id)
+
+        actuel = self._file_storage.get_upload_offset(session_id)
+        if offset != actuel:
+            raise UploadOffsetMismatchError(actuel)
+        if len(data) > TAILLE_MAX_MORCEAU:
+            raise FileTooLargeError("Le morceau dépasse la limite de 16 Mo")
+        if actuel + len(data) > upload_session.taille:
+            raise UploadSizeExceededError(
+                f"Le morceau dépasse la taille annoncée ({upload_session.taille} octets)"
+            )
+
+        try:
+            nouvel_offset = self._file_storage.append_chunk(session_id, offset, data)
+        except ChunkOffsetError as e:
+            # Même morceau reçu en parallèle (renvoi d'un client mobile)
+            raise UploadOffsetMismatchError(e.offset)
+        return UploadSessionDTO.from_entity(upload_session, nouvel_offset)
+
+
+class FinalizeUploadUseCase:
+    """Use case pour créer le document d'un upload terminé."""
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        dossier_repository: DossierRepository,
+        upload_session_repository: UploadSessionRepository,
+        file_storage: FileStorageService,
+    ):
+        """Initialise le use case."""
+        self._document_repo = document_repository
+        self._dossier_repo = dossier_repository
+        self._upload_session_repo = upload_session_repository
+        self._file_storage = file_storage
+
+    def execute(self, session_id: str, user_id: int) -> DocumentDTO:
+        """
+        Finalise l'upload : range le contenu par empreinte et crée le document.
+
+        Args:
+            session_id: ID de la session.
+            user_id: ID de l'utilisateur.
+
+        Returns:
+            Le document créé.
+
+        Raises:
+            UploadSessionNotFoundError: Si la session n'existe pas.
+            UploadSessionExpiredError: Si la session a expiré.
+            UploadIncompleteError: Si tous les octets n'ont pas été reçus.
+            DossierNotFoundError: Si le dossier a été supprimé entre-temps.
+        """
+        upload_session = _charger_session(self._upload_session_repo, session_id, user_id)
+
+        recu = self._file_storage.get_upload_offset(session_id)
+        if recu != upload_session.taille:
+            raise UploadIncompleteError(
+                f"Upload incomplet : {recu} octets reçus sur {upload_session.taille}"
+            )
+        if not self._dossier_repo.find_by_id(upload_session.dossier_id):
+            raise DossierNotFoundError(f"Dossier {upload_session.dossier_id} non trouvé")
+
+        extension = valider_fichier_upload(
+            upload_session.nom_original, upload_session.taille, upload_session.mime_type
+        )
+        if upload_session.taille == 0:
+            # Fichier vide : aucun morceau n'a créé le fichier partiel
+            self._file_storage.append_chunk(session_id, 0, b"")
+        chemin_stockage, empreinte = self._file_storage.finalize_upload(session_id, extension)
+
+        document = self._document_repo.save(
+            Document(
+                chantier_id=upload_session.chantier_id,
+                dossier_id=upload_session.dossier_id,
+                nom=resoudre_nom_unique(
+                    self._document_repo, upload_session.nom_original, upload_session.dossier_id
+                ),
+                nom_original=upload_session.nom_original,
+                chemin_stockage=chemin_stockage,
+                taille=upload_session.taille,
+                mime_type=upload_session.mime_type,
+                uploaded_by=user_id,
+                type_document=TypeDocument.from_extension(extension),
+                niveau_acces=(
+                    NiveauAcces.from_string(upload_session.niveau_acces)
+                    if upload_session.niveau_acces else None
+                ),
+                description=upload_session.description,
+                contenu_hash=empreinte,
+            )
+        )
+        self._upload_session_repo.delete(session_id)
+
+        # 2.5.4: thumbnails WebP, une seule fois par contenu
+        if self._document_repo.count_by_chemin_stockage(chemin_stockage) == 1:
+            self._file_storage.generate_webp_thumbnails(chemin_stockage)
+
+        return DocumentDTO.from_entity(document)
+
+
+class AbortUploadUseCase:
+    """Use case pour abandonner un upload."""
+
+    def __init__(
+        self,
+        upload_session_repository: UploadSessionRepository,
+        file_storage: FileStorageService,
+    ):
+        """Initialise le use case."""
+        self._upload_session_repo = upload_session_repository
+        self._file_storage = file_storage
+
+    def execute(self, session_id: str, user_id: int) -> None:
+        """
+        Abandonne un upload et libère les octets reçus.
+
+        Args:
+            session_id: ID de la session.
+            user_id: ID de l'utilisateur.
+
+        Raises:
+            UploadSessionNotFoundError: Si la session n'existe pas.
+        """
+        _charger_session(
+            self._upload_session_repo, session_id, user_id, verifier_expiration=False
+        )
+        self._file_storage.abort_upload(session_id)
+        self._upload_session_repo.delete(session_id)
+
+
+class PurgeExpiredUploadsUseCase:
+    """Use case pour purger les uploads abandonnés."""
+
+    def __init__(
+        self,
+        upload_session_repository: UploadSessionRepository,
+        file_storage: FileStorageService,
+    ):
+        """Initialise le use case."""
+        self._upload_session_repo = upload_session_repository
+        self._file_storage = file_storage
+
+    def execute(self, maintenant: Optional[datetime] = None, limit: int = 100) -> int:
+        """
+        Supprime les sessions expirées et leurs octets reçus.
+
+        Args:
+            maintenant: Date de référence (défaut: maintenant).
+            limit: Nombre maximum de sessions purgées.
+
+        Returns:
+            Nombre de sessions purgées.
+        """
+        expirees = self._upload_session_repo.find_expired(maintenant or datetime.now(), limit)
+        for upload_session in expirees:
+            self._file_storage.abort_upload(upload_session.id)
+            self._upload_session_repo.delete(upload_session.id)
+        return len(expirees)
@@ -3,12 +3,15 @@
 from .document import Document, MAX_TAILLE_FICHIER, MAX_FICHIERS_UPLOAD
 from .dossier import Dossier
 from .autorisation import AutorisationDocument, TypeAutorisation
+from .upload_session import UploadSession, DUREE_SESSION_UPLOAD
 
 __all__ = [
     "Document",
     "Dossier",
     "AutorisationDocument",
     "TypeAutorisation",
+    "UploadSession",
+    "DUREE_SESSION_UPLOAD",
     "MAX_TAILLE_FICHIER",
     "MAX_FICHIERS_UPLOAD",
 ]
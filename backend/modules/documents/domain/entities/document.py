@@ -35,6 +35,7 @@ class Document:
         updated_at: Date de modification.
         description: Description optionnelle.
         version: Numéro de version (GED-08 historique).
+        contenu_hash: Empreinte SHA-256 du contenu (stockage adressé par contenu).
     """
 
     chantier_id: int
@@ -52,6 +53,7 @@ class Document:
     version: int = 1
     uploaded_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    contenu_hash: Optional[str] = None
 
     def __post_init__(self) -> None:
         """Valide les données à la création."""
@@ -0,0 +1,70 @@
+"""Entité UploadSession - Upload d'un document en plusieurs morceaux."""
+
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
+
+from .document import MAX_TAILLE_FICHIER
+
+# Durée de vie d'une session d'upload non finalisée
+DUREE_SESSION_UPLOAD = timedelta(hours=24)
+
+
+@dataclass
+class UploadSession:
+    """
+    Session d'upload découpé et reprenable (GED-06, GED-07).
+
+    Le client déclare le fichier (nom, taille, type), envoie les morceaux
+    dans l'ordre puis finalise. Les octets déjà reçus sont conservés par le
+    stockage : après une coupure réseau, le client reprend à l'offset
+    renvoyé au lieu de tout renvoyer.
+
+    Attributes:
+        id: Identifiant opaque de la session (hexadécimal).
+        chantier_id: Chantier du document.
+        dossier_id: Dossier de destination.
+        uploaded_by: Utilisateur propriétaire de la session.
+        nom_original: Nom du fichier envoyé.
+        taille: Taille totale annoncée en bytes.
+        mime_type: Type MIME annoncé.
+        description: Description du document.
+        niveau_acces: Niveau d'accès spécifique du document.
+        created_at: Date d'ouverture.
+        expires_at: Date au-delà de laquelle la session est abandonnée.
+    """
+
+    chantier_id: int
+    dossier_id: int
+    uploaded_by: int
+    nom_original: str
+    taille: int
+    mime_type: str
+    description: Optional[str] = None
+    niveau_acces: Optional[str] = None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    created_at: datetime = field(default_factory=datetime.now)
+    expires_at: Optional[datetime] = None
+
+    def __post_init__(self) -> None:
+        """Valide les données à la création."""
+        if not self.nom_original or not self.nom_original.strip():
+            raise ValueError("Le nom du fichier ne peut pas être vide")
+
+        if self.taille < 0:
+            raise ValueError("La taille ne peut pas être négative")
+
+        if self.taille > MAX_TAILLE_FICHIER:
+            raise ValueError("La taille dépasse la limite de 10 Go (GED-07)")
+
+        if self.expires_at is None:
+            self.expires_at = self.created_at + DUREE_SESSION_UPLOAD
+
+    def est_expiree(self, maintenant: Optional[datetime] = None) -> bool:
+        """Indique si la session a dépassé sa durée de vie."""
+        return (maintenant or datetime.now()) >= self.expires_at
+
+    def appartient_a(self, user_id: int) -> bool:
+        """Indique si la session a été ouverte par cet utilisateur."""
+        return self.uploaded_by == user_id
@@ -3,9 +3,11 @@
 from .document_repository import DocumentRepository
 from .dossier_repository import DossierRepository
 from .autorisation_repository import AutorisationRepository
+from .upload_session_repository import UploadSessionRepository
 
 __all__ = [
     "DocumentRepository",
     "DossierRepository",
     "AutorisationRepository",
+    "UploadSessionRepository",
 ]
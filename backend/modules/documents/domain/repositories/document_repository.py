@@ -1,7 +1,7 @@
 """Interface DocumentRepository - Abstraction pour la persistance des documents."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
 from ..entities import Document
 from ..value_objects import TypeDocument
@@ -101,6 +101,20 @@ class DocumentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_stats_by_dossier(self, chantier_id: int) -> Dict[int, Tuple[int, int]]:
+        """
+        Compte les documents et cumule leur taille par dossier, en une requête.
+
+        Args:
+            chantier_id: ID du chantier.
+
+        Returns:
+            Dict dossier_id -> (nombre de documents, taille totale en bytes).
+            Les dossiers sans document sont absents.
+        """
+        pass
+
     @abstractmethod
     def count_by_chantier(self, chantier_id: int) -> int:
         """
@@ -154,6 +168,22 @@ class DocumentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def count_by_chemin_stockage(self, chemin_stockage: str) -> int:
+        """
+        Compte les documents qui partagent un même fichier stocké.
+
+        Le stockage adressé par contenu est partagé entre documents
+        identiques : le fichier n'est supprimé qu'avec sa dernière référence.
+
+        Args:
+            chemin_stockage: Chemin du fichier stocké.
+
+        Returns:
+            Nombre de documents référençant ce fichier.
+        """
+        pass
+
     @abstractmethod
     def get_total_size_by_chantier(self, chantier_id: int) -> int:
         """
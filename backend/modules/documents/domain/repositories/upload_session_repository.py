@@ -0,0 +1,64 @@
+"""Interface UploadSessionRepository - Persistance des sessions d'upload."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from ..entities.upload_session import UploadSession
+
+
+class UploadSessionRepository(ABC):
+    """Interface abstraite pour la persistance des sessions d'upload."""
+
+    @abstractmethod
+    def find_by_id(self, session_id: str) -> Optional[UploadSession]:
+        """
+        Trouve une session d'upload par son ID.
+
+        Args:
+            session_id: ID de la session.
+
+        Returns:
+            La session ou None si non trouvée.
+        """
+        pass
+
+    @abstractmethod
+    def save(self, upload_session: UploadSession) -> UploadSession:
+        """
+        Persiste une session d'upload.
+
+        Args:
+            upload_session: Session à persister.
+
+        Returns:
+            La session persistée.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        """
+        Supprime une session d'upload.
+
+        Args:
+            session_id: ID de la session.
+
+        Returns:
+            True si supprimée.
+        """
+        pass
+
+    @abstractmethod
+    def find_expired(self, maintenant: datetime, limit: int = 100) -> List[UploadSession]:
+        """
+        Récupère les sessions expirées, à purger.
+
+        Args:
+            maintenant: Date de référence.
+            limit: Nombre maximum à retourner.
+
+        Returns:
+            Liste des sessions expirées.
+        """
+        pass
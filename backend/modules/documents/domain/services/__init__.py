@@ -1,7 +1,8 @@
 """Services du module Documents."""
 
-from .file_storage_service import FileStorageService
+from .file_storage_service import ChunkOffsetError, FileStorageService
 
 __all__ = [
+    "ChunkOffsetError",
     "FileStorageService",
 ]
@@ -1,7 +1,20 @@
 """Interface FileStorageService - Service de stockage de fichiers."""
 
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Dict, Optional
+from datetime import datetime
+from typing import BinaryIO, Dict, List, Optional
+
+
+class ChunkOffsetError(Exception):
+    """Erreur levée quand un morceau n'arrive pas à la taille courante du fichier partiel."""
+
+    def __init__(self, offset: int):
+        """
+        Args:
+            offset: Octets effectivement reçus (offset de reprise).
+        """
+        self.offset = offset
+        super().__init__(f"Morceau hors séquence : reprise attendue à l'octet {offset}")
 
 
 class FileStorageService(ABC):
@@ -164,6 +177,116 @@ class FileStorageService(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_by_content(self, file_content: BinaryIO, extension: str) -> tuple[str, str]:
+        """
+        Sauvegarde un fichier dans le stockage adressé par contenu.
+
+        Le contenu est lu par blocs et haché au fil de l'eau ; un contenu
+        déjà stocké (même empreinte) n'est conservé qu'une fois.
+
+        Args:
+            file_content: Contenu du fichier.
+            extension: Extension du fichier (sans le point).
+
+        Returns:
+            Tuple (chemin de stockage, empreinte SHA-256 hexadécimale).
+        """
+        pass
+
+    @abstractmethod
+    def list_blobs(self, modifies_avant: datetime) -> List[str]:
+        """
+        Liste les contenus rangés par empreinte non modifiés depuis une date.
+
+        Args:
+            modifies_avant: Date limite de dernière écriture.
+
+        Returns:
+            Chemins de stockage des contenus.
+        """
+        pass
+
+    @abstractmethod
+    def delete_blob(self, chemin_stockage: str, modifies_avant: datetime) -> bool:
+        """
+        Supprime un contenu rangé par empreinte s'il n'a pas été réécrit.
+
+        La date est revérifiée sous le verrou du contenu : un contenu que
+        finalize_upload ou save_by_content vient de (re)ranger est conservé,
+        même si le document qui le référence n'est pas encore validé en base.
+
+        Args:
+            chemin_stockage: Chemin du contenu.
+            modifies_avant: Date limite de dernière écriture.
+
+        Returns:
+            True si supprimé.
+        """
+        pass
+
+    @abstractmethod
+    def get_upload_offset(self, upload_id: str) -> int:
+        """
+        Retourne le nombre d'octets déjà reçus pour un upload découpé.
+
+        Args:
+            upload_id: ID de la session d'upload.
+
+        Returns:
+            Offset de reprise (0 si rien n'a été reçu).
+        """
+        pass
+
+    @abstractmethod
+    def append_chunk(self, upload_id: str, offset: int, data: bytes) -> int:
+        """
+        Écrit un morceau d'un upload découpé à la position indiquée.
+
+        L'écriture est exclusive par upload : la taille reçue est revérifiée
+        sous verrou, si bien qu'un morceau rejoué (ou envoyé deux fois en
+        parallèle) n'est écrit qu'une fois. L'empreinte SHA-256 est mise à
+        jour incrémentalement.
+
+        Args:
+            upload_id: ID de la session d'upload.
+            offset: Position du morceau, égale aux octets déjà reçus.
+            data: Octets du morceau.
+
+        Returns:
+            Le nouvel offset (octets reçus au total).
+
+        Raises:
+            ChunkOffsetError: Si offset ne correspond pas aux octets reçus.
+        """
+        pass
+
+    @abstractmethod
+    def finalize_upload(self, upload_id: str, extension: str) -> tuple[str, str]:
+        """
+        Range un upload terminé dans le stockage adressé par contenu.
+
+        Un contenu déjà stocké (même empreinte) n'est conservé qu'une fois.
+
+        Args:
+            upload_id: ID de la session d'upload.
+            extension: Extension du fichier (sans le point).
+
+        Returns:
+            Tuple (chemin de stockage, empreinte SHA-256 hexadécimale).
+        """
+        pass
+
+    @abstractmethod
+    def abort_upload(self, upload_id: str) -> None:
+        """
+        Abandonne un upload découpé et libère les octets reçus.
+
+        Args:
+            upload_id: ID de la session d'upload.
+        """
+        pass
+
     def generate_webp_thumbnails(self, chemin_stockage: str) -> Dict[str, str]:
         """Génère des thumbnails WebP pour un document image (2.5.4).
 
@@ -1,15 +1,18 @@
 """Persistence layer du module Documents."""
 
-from .models import DossierModel, DocumentModel, AutorisationDocumentModel
+from .models import DossierModel, DocumentModel, AutorisationDocumentModel, UploadSessionModel
 from .sqlalchemy_dossier_repository import SQLAlchemyDossierRepository
 from .sqlalchemy_document_repository import SQLAlchemyDocumentRepository
 from .sqlalchemy_autorisation_repository import SQLAlchemyAutorisationRepository
+from .sqlalchemy_upload_session_repository import SQLAlchemyUploadSessionRepository
 
 __all__ = [
     "DossierModel",
     "DocumentModel",
     "AutorisationDocumentModel",
+    "UploadSessionModel",
     "SQLAlchemyDossierRepository",
     "SQLAlchemyDocumentRepository",
     "SQLAlchemyAutorisationRepository",
+    "SQLAlchemyUploadSessionRepository",
 ]
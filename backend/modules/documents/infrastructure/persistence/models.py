@@ -1,7 +1,7 @@
 """Modèles SQLAlchemy pour le module Documents."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, ForeignKey, Text
 from sqlalchemy.orm import relationship
 
 from shared.infrastructure.database_base import Base
@@ -41,8 +41,9 @@ class DocumentModel(Base):
     nom = Column(String(255), nullable=False)
     nom_original = Column(String(255), nullable=False)
     type_document = Column(String(50), nullable=False, default="autre")
-    taille = Column(Integer, nullable=False)
-    chemin_stockage = Column(String(500), nullable=False)
+    taille = Column(BigInteger, nullable=False)
+    chemin_stockage = Column(String(500), nullable=False, index=True)
+    contenu_hash = Column(String(64), nullable=True, index=True)
     mime_type = Column(String(100), nullable=False)
     niveau_acces = Column(String(50), nullable=True)
     uploaded_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
@@ -77,3 +78,21 @@ class AutorisationDocumentModel(Base):
     accorde_par_user = relationship("UserModel", foreign_keys=[accorde_par])
     dossier = relationship("DossierModel", back_populates="autorisations")
     document = relationship("DocumentModel", back_populates="autorisations")
+
+
+class UploadSessionModel(Base):
+    """Modèle SQLAlchemy pour les sessions d'upload découpé."""
+
+    __tablename__ = "upload_sessions"
+
+    id = Column(String(32), primary_key=True)
+    chantier_id = Column(Integer, ForeignKey("chantiers.id", ondelete="CASCADE"), nullable=False)
+    dossier_id = Column(Integer, ForeignKey("dossiers.id", ondelete="CASCADE"), nullable=False)
+    uploaded_by = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    nom_original = Column(String(255), nullable=False)
+    taille = Column(BigInteger, nullable=False)
+    mime_type = Column(String(100), nullable=False)
+    description = Column(Text, nullable=True)
+    niveau_acces = Column(String(50), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+    expires_at = Column(DateTime, nullable=False, index=True)
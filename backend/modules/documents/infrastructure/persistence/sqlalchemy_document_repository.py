@@ -1,6 +1,6 @@
 """Implémentation SQLAlchemy du DocumentRepository."""
 
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
@@ -54,6 +54,7 @@ class SQLAlchemyDocumentRepository(DocumentRepository):
                 version=document.version,
                 uploaded_at=document.uploaded_at,
                 updated_at=document.updated_at,
+                contenu_hash=document.contenu_hash,
             )
             self._session.add(model)
 
@@ -105,6 +106,20 @@ class SQLAlchemyDocumentRepository(DocumentRepository):
             .count()
         )
 
+    def get_stats_by_dossier(self, chantier_id: int) -> Dict[int, Tuple[int, int]]:
+        """Compte les documents et cumule leur taille par dossier (GROUP BY)."""
+        rows = (
+            self._session.query(
+                DocumentModel.dossier_id,
+                func.count(DocumentModel.id),
+                func.coalesce(func.sum(DocumentModel.taille), 0),
+            )
+            .filter(DocumentModel.chantier_id == chantier_id)
+            .group_by(DocumentModel.dossier_id)
+            .all()
+        )
+        return {dossier_id: (nombre, taille) for dossier_id, nombre, taille in rows}
+
     def count_by_chantier(self, chantier_id: int) -> int:
         """Compte les documents d'un chantier."""
         return (
@@ -148,6 +163,14 @@ class SQLAlchemyDocumentRepository(DocumentRepository):
             is not None
         )
 
+    def count_by_chemin_stockage(self, chemin_stockage: str) -> int:
+        """Compte les documents qui partagent un même fichier stocké."""
+        return (
+            self._session.query(DocumentModel)
+            .filter_by(chemin_stockage=chemin_stockage)
+            .count()
+        )
+
     def get_total_size_by_chantier(self, chantier_id: int) -> int:
         """Calcule la taille totale."""
         result = (
@@ -189,4 +212,5 @@ class SQLAlchemyDocumentRepository(DocumentRepository):
             version=model.version,
             uploaded_at=model.uploaded_at,
             updated_at=model.updated_at,
+            contenu_hash=model.contenu_hash,
         )
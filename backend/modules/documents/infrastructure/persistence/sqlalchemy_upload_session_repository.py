@@ -0,0 +1,83 @@
+"""Implémentation SQLAlchemy du UploadSessionRepository."""
+
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy.orm import Session
+
+from ...domain.entities import UploadSession
+from ...domain.repositories import UploadSessionRepository
+from .models import UploadSessionModel
+
+
+class SQLAlchemyUploadSessionRepository(UploadSessionRepository):
+    """Implémentation SQLAlchemy du repository des sessions d'upload."""
+
+    def __init__(self, session: Session):
+        """
+        Initialise le repository.
+
+        Args:
+            session: Session SQLAlchemy.
+        """
+        self._session = session
+
+    def find_by_id(self, session_id: str) -> Optional[UploadSession]:
+        """Trouve une session d'upload par son ID."""
+        model = self._session.query(UploadSessionModel).filter_by(id=session_id).first()
+        return self._to_entity(model) if model else None
+
+    def save(self, upload_session: UploadSession) -> UploadSession:
+        """Persiste une session d'upload (création uniquement : elle est immuable)."""
+        model = UploadSessionModel(
+            id=upload_session.id,
+            chantier_id=upload_session.chantier_id,
+            dossier_id=upload_session.dossier_id,
+            uploaded_by=upload_session.uploaded_by,
+            nom_original=upload_session.nom_original,
+            taille=upload_session.taille,
+            mime_type=upload_session.mime_type,
+            description=upload_session.description,
+            niveau_acces=upload_session.niveau_acces,
+            created_at=upload_session.created_at,
+            expires_at=upload_session.expires_at,
+        )
+        self._session.add(model)
+        self._session.flush()
+        return self._to_entity(model)
+
+    def delete(self, session_id: str) -> bool:
+        """Supprime une session d'upload."""
+        deleted = (
+            self._session.query(UploadSessionModel)
+            .filter_by(id=session_id)
+            .delete(synchronize_session=False)
+        )
+        self._session.flush()
+        return deleted > 0
+
+    def find_expired(self, maintenant: datetime, limit: int = 100) -> List[UploadSession]:
+        """Récupère les sessions expirées."""
+        models = (
+            self._session.query(UploadSessionModel)
+            .filter(UploadSessionModel.expires_at <= maintenant)
+            .order_by(UploadSessionModel.expires_at)
+            .limit(limit)
+            .all()
+        )
+        return [self._to_entity(m) for m in models]
+
+    def _to_entity(self, model: UploadSessionModel) -> UploadSession:
+        """Convertit un modèle en entité."""
+        return UploadSession(
+            id=model.id,
+            chantier_id=model.chantier_id,
+            dossier_id=model.dossier_id,
+            uploaded_by=model.uploaded_by,
+            nom_original=model.nom_original,
+            taille=model.taille,
+            mime_type=model.mime_type,
+            description=model.description,
+            niveau_acces=model.niveau_acces,
+            created_at=model.created_at,
+            expires_at=model.expires_at,
+        )
@@ -30,11 +30,17 @@ from ...application.use_cases import (
     ListAutorisationsUseCase,
     RevokeAutorisationUseCase,
     CheckAccessUseCase,
+    InitUploadUseCase,
+    GetUploadStatusUseCase,
+    AppendUploadChunkUseCase,
+    FinalizeUploadUseCase,
+    AbortUploadUseCase,
 )
 from ..persistence import (
     SQLAlchemyDossierRepository,
     SQLAlchemyDocumentRepository,
     SQLAlchemyAutorisationRepository,
+    SQLAlchemyUploadSessionRepository,
 )
 
 
@@ -61,6 +67,7 @@ def get_document_controller(
     dossier_repo = SQLAlchemyDossierRepository(db)
     document_repo = SQLAlchemyDocumentRepository(db)
     autorisation_repo = SQLAlchemyAutorisationRepository(db)
+    upload_session_repo = SQLAlchemyUploadSessionRepository(db)
 
     # Use Cases - Documents
     upload_document = UploadDocumentUseCase(document_repo, dossier_repo, file_storage)
@@ -74,6 +81,15 @@ def get_document_controller(
     get_document_preview = GetDocumentPreviewUseCase(document_repo, file_storage)
     get_document_preview_content = GetDocumentPreviewContentUseCase(document_repo, file_storage)
 
+    # Use Cases - Uploads découpés
+    init_upload = InitUploadUseCase(dossier_repo, upload_session_repo)
+    get_upload_status = GetUploadStatusUseCase(upload_session_repo, file_storage)
+    append_upload_chunk = AppendUploadChunkUseCase(upload_session_repo, file_storage)
+    finalize_upload = FinalizeUploadUseCase(
+        document_repo, dossier_repo, upload_session_repo, file_storage
+    )
+    abort_upload = AbortUploadUseCase(upload_session_repo, file_storage)
+
     # Use Cases - Dossiers
     create_dossier = CreateDossierUseCase(dossier_repo, document_repo)
     get_dossier = GetDossierUseCase(dossier_repo, document_repo)
@@ -113,6 +129,11 @@ def get_document_controller(
         list_autorisations=list_autorisations,
         revoke_autorisation=revoke_autorisation,
         check_access=check_access,
+        init_upload=init_upload,
+        get_upload_status=get_upload_status,
+        append_upload_chunk=append_upload_chunk,
+        finalize_upload=finalize_upload,
+        abort_upload=abort_upload,
     )
 
 
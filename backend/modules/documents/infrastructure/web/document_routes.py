@@ -1,11 +1,13 @@
 """Routes FastAPI pour le module Documents."""
 
+import os
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, status, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from datetime import datetime
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from shared.infrastructure.database import get_db
 from shared.infrastructure.audit import AuditService
@@ -17,6 +19,7 @@ from ...application.dtos import (
     DocumentUpdateDTO,
     DocumentSearchDTO,
     AutorisationCreateDTO,
+    UploadInitDTO,
 )
 from ...application.use_cases import (
     DossierNotFoundError,
@@ -27,7 +30,13 @@ from ...application.use_cases import (
     InvalidFileTypeError,
     AutorisationAlreadyExistsError,
     AutorisationNotFoundError,
+    UploadSessionNotFoundError,
+    UploadSessionExpiredError,
+    UploadOffsetMismatchError,
+    UploadSizeExceededError,
+    UploadIncompleteError,
 )
+from ...application.use_cases.upload_use_cases import TAILLE_MAX_MORCEAU
 from ...domain.events.document_uploaded import DocumentUploadedEvent
 from shared.infrastructure.event_bus.dependencies import get_event_bus
 from shared.infrastructure.event_bus import EventBus
@@ -109,6 +118,32 @@ class AutorisationCreateRequest(BaseModel):
     expire_at: Optional[datetime] = None
 
 
+class UploadInitRequest(BaseModel):
+    """Request pour ouvrir un upload découpé (GED-06, GED-07)."""
+
+    nom_original: str = Field(..., min_length=1, max_length=255)
+    taille: int = Field(..., ge=0, description="Taille totale du fichier en octets")
+    mime_type: str = "application/octet-stream"
+    description: Optional[str] = None
+    niveau_acces: Optional[str] = None
+
+
+class UploadSessionResponse(BaseModel):
+    """Response pour l'état d'un upload découpé."""
+
+    id: str
+    chantier_id: int
+    dossier_id: int
+    nom_original: str
+    taille: int
+    offset: int = Field(..., description="Octets déjà reçus : reprendre l'envoi à cet offset")
+    complet: bool
+    expires_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class DossierResponse(BaseModel):
     """Response pour un dossier."""
 
@@ -300,11 +335,16 @@ def list_dossiers(
 @router.get("/chantiers/{chantier_id}/arborescence")
 def get_arborescence(
     chantier_id: int,
+    dossier_id: Optional[int] = Query(None, description="Racine du sous-arbre à renvoyer"),
+    profondeur: Optional[int] = Query(None, ge=1, description="Nombre de niveaux renvoyés"),
     controller: DocumentController = Depends(get_document_controller),
     current_user_id: int = Depends(get_current_user_id),
 ):
-    """Récupère l'arborescence complète d'un chantier (GED-02)."""
-    return controller.get_arborescence(chantier_id)
+    """Récupère l'arborescence d'un chantier, ou un sous-arbre (GED-02)."""
+    try:
+        return controller.get_arborescence(chantier_id, dossier_id, profondeur)
+    except DossierNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
 
 @router.put("/dossiers/{dossier_id}", response_model=DossierResponse)
@@ -375,14 +415,14 @@ async def upload_document(
 ):
     """Upload un document (GED-06, GED-07, GED-08)."""
     try:
-        # Lire le contenu du fichier
-        content = await file.read()
-        taille = len(content)
-
-        # Reset du curseur pour le stockage
-        await file.seek(0)
-
-        result = controller.upload_document(
+        # Taille mesurée sans charger le fichier en mémoire
+        file.file.seek(0, os.SEEK_END)
+        taille = file.file.tell()
+        file.file.seek(0)
+
+        # Copie et thumbnails hors de la boucle d'événements
+        result = await run_in_threadpool(
+            controller.upload_document,
             file_content=file.file,
             filename=file.filename or "document",
             chantier_id=chantier_id,
@@ -431,6 +471,170 @@ async def upload_document(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+# ============ UPLOADS DÉCOUPÉS ============
+
+def _erreur_upload(e: Exception) -> HTTPException:
+    """Traduit une erreur d'upload découpé en réponse HTTP."""
+    if isinstance(e, (UploadSessionNotFoundError, DossierNotFoundError)):
+        return HTTPException(status_code=404, detail=str(e))
+    if isinstance(e, UploadSessionExpiredError):
+        return HTTPException(status_code=410, detail=str(e))
+    if isinstance(e, UploadOffsetMismatchError):
+        return HTTPException(status_code=409, detail={"message": str(e), "offset": e.offset})
+    if isinstance(e, UploadIncompleteError):
+        return HTTPException(status_code=409, detail=str(e))
+    if isinstance(e, FileTooLargeError):
+        return HTTPException(status_code=413, detail=str(e))
+    if isinstance(e, InvalidFileTypeError):
+        return HTTPException(status_code=415, detail=str(e))
+    return HTTPException(status_code=400, detail=str(e))
+
+
+_ERREURS_UPLOAD = (
+    UploadSessionNotFoundError,
+    UploadSessionExpiredError,
+    UploadOffsetMismatchError,
+    UploadSizeExceededError,
+    UploadIncompleteError,
+    FileTooLargeError,
+    InvalidFileTypeError,
+    DossierNotFoundError,
+    ValueError,
+)
+
+
+@router.post(
+    "/dossiers/{dossier_id}/uploads",
+    response_model=UploadSessionResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def init_upload(
+    dossier_id: int,
+    request: UploadInitRequest,
+    chantier_id: int = Query(...),
+    db: Session = Depends(get_db),
+    controller: DocumentController = Depends(get_document_controller),
+    current_user_id: int = Depends(get_current_user_id),
+):
+    """Ouvre un upload découpé et reprenable (GED-06, GED-07)."""
+    try:
+        dto = UploadInitDTO(
+            chantier_id=chantier_id,
+            dossier_id=dossier_id,
+            nom_original=request.nom_original,
+            taille=request.taille,
+            mime_type=request.mime_type,
+            description=request.description,
+            niveau_acces=request.niveau_acces,
+        )
+        result = controller.init_upload(dto, current_user_id)
+        db.commit()
+        return result
+    except _ERREURS_UPLOAD as e:
+        raise _erreur_upload(e)
+
+
+@router.get("/uploads/{upload_id}", response_model=UploadSessionResponse)
+def get_upload_status(
+    upload_id: str,
+    controller: DocumentController = Depends(get_document_controller),
+    current_user_id: int = Depends(get_current_user_id),
+):
+    """Renvoie l'offset de reprise d'un upload découpé."""
+    try:
+        return controller.get_upload_status(upload_id, current_user_id)
+    except _ERREURS_UPLOAD as e:
+        raise _erreur_upload(e)
+
+
+@router.put("/uploads/{upload_id}", response_model=UploadSessionResponse)
+async def append_upload_chunk(
+    upload_id: str,
+    http_request: Request,
+    offset: int = Query(..., ge=0, description="Position du morceau dans le fichier"),
+    controller: DocumentController = Depends(get_document_controller),
+    current_user_id: int = Depends(get_current_user_id),
+):
+    """Ajoute un morceau (corps brut de la requête) à un upload découpé."""
+    content_length = http_request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > TAILLE_MAX_MORCEAU:
+        raise HTTPException(status_code=413, detail="Le morceau dépasse la limite de 16 Mo")
+
+    data = await http_request.body()
+    try:
+        return await run_in_threadpool(
+            controller.append_upload_chunk, upload_id, offset, data, current_user_id
+        )
+    except _ERREURS_UPLOAD as e:
+        raise _erreur_upload(e)
+
+
+@router.post(
+    "/uploads/{upload_id}/finalize",
+    response_model=DocumentResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def finalize_upload(
+    upload_id: str,
+    http_request: Request,
+    db: Session = Depends(get_db),
+    event_bus: EventBus = Depends(get_event_bus),
+    controller: DocumentController = Depends(get_document_controller),
+    current_user_id: int = Depends(get_current_user_id),
+    audit: AuditService = Depends(get_audit_service),
+):
+    """Finalise un upload découpé et crée le document (GED-06, GED-07, GED-08)."""
+    try:
+        result = await run_in_threadpool(controller.finalize_upload, upload_id, current_user_id)
+    except _ERREURS_UPLOAD as e:
+        raise _erreur_upload(e)
+
+    # Audit Trail
+    audit.log_action(
+        entity_type="document",
+        entity_id=result.id,
+        action="uploaded",
+        user_id=current_user_id,
+        new_values={
+            "nom": result.nom,
+            "chantier_id": result.chantier_id,
+            "dossier_id": result.dossier_id,
+            "taille": result.taille,
+            "type_document": result.type_document,
+        },
+        ip_address=http_request.client.host if http_request.client else None,
+    )
+
+    # Commit the transaction before publishing events
+    db.commit()
+
+    # Publish event after database commit
+    await event_bus.publish(DocumentUploadedEvent(
+        document_id=result.id,
+        nom=result.nom,
+        type_document=result.type_document,
+        chantier_id=result.chantier_id,
+        user_id=current_user_id,
+    ))
+
+    return result
+
+
+@router.delete("/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+def abort_upload(
+    upload_id: str,
+    db: Session = Depends(get_db),
+    controller: DocumentController = Depends(get_document_controller),
+    current_user_id: int = Depends(get_current_user_id),
+):
+    """Abandonne un upload découpé."""
+    try:
+        controller.abort_upload(upload_id, current_user_id)
+        db.commit()
+    except _ERREURS_UPLOAD as e:
+        raise _erreur_upload(e)
+
+
 @router.get("/documents/{document_id}", response_model=DocumentResponse)
 def get_document(
     document_id: int,
@@ -5,7 +5,7 @@ Le use case depend uniquement de cette interface, pas de l'implementation concre
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, List
 
 from ..dtos.suggestions_dtos import SuggestionDTO
 
@@ -40,3 +40,19 @@ class AISuggestionPort(ABC):
             Liste vide en cas d'erreur (fallback silencieux).
         """
         pass
+
+    def generate_consolidated_analysis(self, consolidated_data: dict) -> Dict[str, Any]:
+        """Genere une analyse IA consolidee multi-chantiers.
+
+        Implementation par defaut : aucune analyse (le caller bascule
+        sur le fallback algorithmique).
+
+        Args:
+            consolidated_data: Dictionnaire de la vue consolidee
+                (kpi_globaux, chantiers, top_rentables, top_derives).
+
+        Returns:
+            Dictionnaire d'analyse (synthese, alertes, recommandations,
+            tendance, score_sante). Dictionnaire vide si indisponible.
+        """
+        return {}
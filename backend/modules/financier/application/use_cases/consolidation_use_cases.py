@@ -28,6 +28,8 @@ from shared.domain.calcul_financier import (
 logger = logging.getLogger(__name__)
 
 from shared.application.ports.chantier_info_port import ChantierInfoPort, ChantierInfoDTO
+from shared.application.instrumentation import timed
+from shared.application.read_only import read_only
 
 from ...domain.repositories import (
     BudgetRepository,
@@ -47,6 +49,7 @@ from ..dtos.consolidation_dtos import (
 )
 
 
+@read_only
 class GetVueConsolideeFinancesUseCase:
     """Use case pour construire la vue consolidee multi-chantiers.
 
@@ -96,6 +99,7 @@ class GetVueConsolideeFinancesUseCase:
         self._cout_materiel_repository = cout_materiel_repository
         self._config_repository = config_repository
 
+    @timed
     def execute(
         self,
         user_accessible_chantier_ids: List[int],
@@ -38,6 +38,8 @@ from ..dtos.dashboard_dtos import (
     DashboardFinancierDTO,
 )
 from .budget_use_cases import BudgetNotFoundError
+from shared.application.instrumentation import timed
+from shared.application.read_only import read_only
 from shared.domain.calcul_financier import (
     calculer_marge_chantier,
     calculer_quote_part_frais_generaux,
@@ -52,6 +54,7 @@ logger = logging.getLogger(__name__)
 STATUTS_FACTURE_CA = {"emise", "envoyee", "payee"}
 
 
+@read_only
 class GetDashboardFinancierUseCase:
     """Use case pour construire le tableau de bord financier d'un chantier.
 
@@ -79,6 +82,7 @@ class GetDashboardFinancierUseCase:
         self._facture_repository = facture_repository
         self._config_repository = config_repository
 
+    @timed
     def execute(
         self,
         chantier_id: int,
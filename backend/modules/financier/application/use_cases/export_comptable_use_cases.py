@@ -17,6 +17,7 @@ from ...domain.repositories.facture_repository import FactureRepository
 from ...domain.repositories.fournisseur_repository import FournisseurRepository
 from ...domain.repositories.lot_budgetaire_repository import LotBudgetaireRepository
 from ..dtos.export_dtos import ExportComptableDTO, LigneExportComptableDTO
+from shared.application.read_only import read_only
 from shared.domain.calcul_financier import calculer_tva, arrondir_montant
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,7 @@ class ExportComptableError(Exception):
         super().__init__(self.message)
 
 
+@read_only
 class ExportComptableUseCase:
     """Cas d'utilisation : Generer un export comptable pour un chantier.
 
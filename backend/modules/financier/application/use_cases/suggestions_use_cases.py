@@ -169,6 +169,7 @@ class GetSuggestionsFinancieresUseCase:
         if self._ai_provider is not None:
             try:
                 kpi_data = {
+                    "chantier_id": chantier_id,
                     "montant_revise": str(arrondir_montant(montant_revise)),
                     "total_engage": str(arrondir_montant(total_engage)),
                     "total_realise": str(arrondir_montant(total_realise + cout_mo + cout_materiel)),
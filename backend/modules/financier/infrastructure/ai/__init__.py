@@ -1,8 +1,15 @@
 """Infrastructure AI pour le module Financier.
 
-FIN-21: Providers de suggestions IA (Gemini).
+FIN-21: Providers de suggestions IA (Gemini, stub local) et cache.
 """
 
 from .gemini_provider import GeminiSuggestionProvider
+from .stub_provider import StubSuggestionProvider
+from .cached_provider import CachedAISuggestionProvider, fingerprint_payload
 
-__all__ = ["GeminiSuggestionProvider"]
+__all__ = [
+    "GeminiSuggestionProvider",
+    "StubSuggestionProvider",
+    "CachedAISuggestionProvider",
+    "fingerprint_payload",
+]
@@ -0,0 +1,304 @@
+"""Cache des reponses IA avec rafraichissement en arriere-plan.
+
+FIN-21: Decorateur du port AISuggestionPort qui evite d'appeler le modele
+(Gemini) a chaque requete lorsque les KPI n'ont pas change.
+
+- Cle de cache : empreinte SHA-256 du JSON canonique des KPI.
+- TTL : une reponse fraiche est servie directement.
+- Stale-while-revalidate : au-dela du TTL (dans la fenetre de peremption),
+  la reponse perimee est servie et un rafraichissement est lance en
+  arriere-plan.
+- Invalidation : quand les chiffres d'un chantier (ou d'un perimetre de
+  consolidation) changent, l'ancienne entree est supprimee.
+- Miss : l'appel part dans le pool de threads ; on attend au plus
+  ``attente_max_seconds`` puis on retourne un resultat vide (le caller
+  bascule sur le fallback algorithmique), la reponse sera servie au
+  prochain appel.
+
+Layer: Infrastructure (depend du port Application via AISuggestionPort).
+"""
+
+import hashlib
+import json
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from ...application.ports.ai_suggestion_port import AISuggestionPort
+from ...application.dtos.suggestions_dtos import SuggestionDTO
+
+logger = logging.getLogger(__name__)
+
+# Valeurs par defaut (surchargees via variables d'environnement dans dependencies)
+AI_CACHE_TTL_SECONDS = 900  # 15 min : reponse consideree fraiche
+AI_CACHE_STALE_SECONDS = 3600  # 1h supplementaire : servie en attendant le refresh
+AI_CACHE_ATTENTE_MAX_SECONDS = 2.0  # Attente max sur un miss avant fallback
+AI_CACHE_MAX_ENTRIES = 500
+AI_CACHE_MAX_WORKERS = 2
+
+TYPE_SUGGESTIONS = "suggestions"
+TYPE_CONSOLIDATION = "consolidation"
+
+
+def fingerprint_payload(type_appel: str, payload: dict) -> str:
+    """Calcule l'empreinte canonique d'un payload KPI.
+
+    Le JSON est serialise avec cles triees et sans espaces, les valeurs
+    non JSON (Decimal, date) via str(), pour que deux dictionnaires
+    equivalents produisent la meme empreinte.
+
+    Args:
+        type_appel: Type d'appel IA (suggestions, consolidation).
+        payload: Donnees envoyees au modele.
+
+    Returns:
+        Empreinte hexadecimale SHA-256.
+    """
+    canonical = json.dumps(
+        {"type": type_appel, "data": payload},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _EntreeCache:
+    """Reponse IA memorisee.
+
+    Attributes:
+        valeur: Reponse du provider (liste de suggestions ou analyse).
+        calcule_a: Horodatage (horloge monotone) du calcul.
+    """
+
+    valeur: Any
+    calcule_a: float
+
+
+class CachedAISuggestionProvider(AISuggestionPort):
+    """Provider IA avec cache par empreinte et rafraichissement asynchrone.
+
+    Attributes:
+        _inner: Provider reel (Gemini, stub...).
+        _ttl: Duree de fraicheur d'une entree (secondes).
+        _stale: Fenetre pendant laquelle une entree perimee reste servie.
+        _attente_max: Attente maximale sur un miss (0 = jamais bloquant).
+        _entrees: Entrees par empreinte.
+        _scopes: Derniere empreinte connue par perimetre (chantier, consolidation).
+        _en_cours: Rafraichissements en cours par empreinte (dedoublonnage).
+    """
+
+    def __init__(
+        self,
+        inner: AISuggestionPort,
+        ttl_seconds: float = AI_CACHE_TTL_SECONDS,
+        stale_seconds: float = AI_CACHE_STALE_SECONDS,
+        attente_max_seconds: float = AI_CACHE_ATTENTE_MAX_SECONDS,
+        max_entries: int = AI_CACHE_MAX_ENTRIES,
+        max_workers: int = AI_CACHE_MAX_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise le cache autour d'un provider.
+
+        Args:
+            inner: Provider IA a decorer.
+            ttl_seconds: Duree de fraicheur d'une reponse.
+            stale_seconds: Duree supplementaire pendant laquelle une reponse
+                perimee est servie pendant son rafraichissement.
+            attente_max_seconds: Attente maximale sur un miss.
+            max_entries: Nombre maximal d'entrees conservees.
+            max_workers: Taille du pool de rafraichissement.
+            clock: Horloge (injectable pour les tests).
+        """
+        self._inner = inner
+        self._ttl = ttl_seconds
+        self._stale = stale_seconds
+        self._attente_max = attente_max_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ai-refresh"
+        )
+        self._lock = Lock()
+        self._entrees: Dict[str, _EntreeCache] = {}
+        self._scopes: Dict[Tuple[str, Hashable], str] = {}
+        self._en_cours: Dict[str, Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+
+    # =========================================================================
+    # AISuggestionPort
+    # =========================================================================
+
+    def generate_suggestions(self, kpi_data: dict) -> List[SuggestionDTO]:
+        """Retourne les suggestions IA en cache ou lance leur calcul.
+
+        Args:
+            kpi_data: Dictionnaire des KPI du chantier. La cle optionnelle
+                ``chantier_id`` sert de perimetre d'invalidation.
+
+        Returns:
+            Liste de SuggestionDTO (vide si le calcul n'est pas termine).
+        """
+        resultat = self._lire(
+            TYPE_SUGGESTIONS,
+            kpi_data.get("chantier_id"),
+            kpi_data,
+            lambda: self._inner.generate_suggestions(kpi_data),
+        )
+        return list(resultat) if resultat else []
+
+    def generate_consolidated_analysis(self, consolidated_data: dict) -> Dict[str, Any]:
+        """Retourne l'analyse consolidee en cache ou lance son calcul.
+
+        Args:
+            consolidated_data: Dictionnaire de la vue consolidee. Les
+                chantier_id de ``chantiers`` forment le perimetre d'invalidation.
+
+        Returns:
+            Dictionnaire d'analyse (vide si le calcul n'est pas termine).
+        """
+        scope = tuple(
+            sorted(
+                str(c.get("chantier_id"))
+                for c in consolidated_data.get("chantiers", [])
+            )
+        )
+        resultat = self._lire(
+            TYPE_CONSOLIDATION,
+            scope,
+            consolidated_data,
+            lambda: self._inner.generate_consolidated_analysis(consolidated_data),
+        )
+        return dict(resultat) if resultat else {}
+
+    # =========================================================================
+    # Gestion du cache
+    # =========================================================================
+
+    def invalidate(self) -> int:
+        """Vide le cache.
+
+        Returns:
+            Nombre d'entrees supprimees.
+        """
+        with self._lock:
+            nb = len(self._entrees)
+            self._entrees.clear()
+            self._scopes.clear()
+            return nb
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Arrete le pool de rafraichissement.
+
+        Args:
+            wait: Attendre la fin des rafraichissements en cours.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def _lire(
+        self,
+        type_appel: str,
+        scope: Optional[Hashable],
+        payload: dict,
+        calculer: Callable[[], Any],
+    ) -> Any:
+        """Sert une entree fraiche/perimee ou planifie son calcul.
+
+        Args:
+            type_appel: Type d'appel IA.
+            scope: Perimetre d'invalidation (None = pas d'invalidation).
+            payload: Donnees envoyees au modele.
+            calculer: Appel au provider reel.
+
+        Returns:
+            Reponse du provider, ou None si indisponible a temps.
+        """
+        empreinte = fingerprint_payload(type_appel, payload)
+        maintenant = self._clock()
+
+        with self._lock:
+            if scope is not None:
+                self._invalider_scope(type_appel, scope, empreinte)
+
+            entree = self._entrees.get(empreinte)
+            if entree is not None:
+                age = maintenant - entree.calcule_a
+                if age <= self._ttl:
+                    self.hits += 1
+                    return entree.valeur
+                if age <= self._ttl + self._stale:
+                    self.stale_hits += 1
+                    self._planifier(empreinte, calculer)
+                    return entree.valeur
+                del self._entrees[empreinte]
+
+            self.misses += 1
+            future = self._planifier(empreinte, calculer)
+
+        if self._attente_max <= 0:
+            return None
+        try:
+            return future.result(timeout=self._attente_max)
+        except FutureTimeout:
+            logger.info(
+                "Reponse IA %s non disponible apres %.1fs, fallback en attendant",
+                type_appel,
+                self._attente_max,
+            )
+            return None
+        except Exception as e:
+            logger.warning("Erreur provider IA %s: %s", type_appel, str(e))
+            return None
+
+    def _invalider_scope(self, type_appel: str, scope: Hashable, empreinte: str) -> None:
+        """Supprime l'entree precedente d'un perimetre dont les chiffres ont change.
+
+        Doit etre appele sous verrou.
+        """
+        cle = (type_appel, scope)
+        precedente = self._scopes.get(cle)
+        if precedente is not None and precedente != empreinte:
+            self._entrees.pop(precedente, None)
+            logger.debug("Cache IA invalide pour %s %s (KPI modifies)", type_appel, scope)
+        self._scopes[cle] = empreinte
+
+    def _planifier(self, empreinte: str, calculer: Callable[[], Any]) -> Future:
+        """Lance un rafraichissement, sauf s'il y en a deja un pour l'empreinte.
+
+        Doit etre appele sous verrou.
+        """
+        future = self._en_cours.get(empreinte)
+        if future is None:
+            future = self._executor.submit(self._rafraichir, empreinte, calculer)
+            self._en_cours[empreinte] = future
+        return future
+
+    def _rafraichir(self, empreinte: str, calculer: Callable[[], Any]) -> Any:
+        """Appelle le provider et memorise la reponse non vide."""
+        try:
+            valeur = calculer()
+            # Une reponse vide correspond a une erreur du provider : non memorisee
+            if valeur:
+                with self._lock:
+                    if len(self._entrees) >= self._max_entries:
+                        self._evincer_plus_anciennes()
+                    self._entrees[empreinte] = _EntreeCache(
+                        valeur=valeur, calcule_a=self._clock()
+                    )
+            return valeur
+        finally:
+            with self._lock:
+                self._en_cours.pop(empreinte, None)
+
+    def _evincer_plus_anciennes(self) -> None:
+        """Supprime les 10% d'entrees les plus anciennes. Sous verrou."""
+        tri = sorted(self._entrees, key=lambda k: self._entrees[k].calcule_a)
+        for cle in tri[: max(1, len(tri) // 10)]:
+            del self._entrees[cle]
@@ -0,0 +1,165 @@
+"""Provider IA local (stub) pour les suggestions financieres.
+
+FIN-21: Implementation deterministe du port AISuggestionPort, sans appel
+reseau. Permet de tester hors-ligne le cache et le rafraichissement en
+arriere-plan, et de faire tourner l'application sans GEMINI_API_KEY
+(variable d'environnement AI_PROVIDER=stub).
+
+Layer: Infrastructure (depend du port Application via AISuggestionPort).
+"""
+
+import logging
+import time
+from typing import Any, Dict, List
+
+from ...application.ports.ai_suggestion_port import AISuggestionPort
+from ...application.dtos.suggestions_dtos import SuggestionDTO
+
+logger = logging.getLogger(__name__)
+
+# Seuils utilises pour produire des suggestions plausibles
+SEUIL_ENGAGE_CRITIQUE = 100.0
+SEUIL_ENGAGE_ATTENTION = 80.0
+SEUIL_MARGE_FAIBLE = 5.0
+
+
+def _to_float(value: Any) -> float:
+    """Convertit une valeur KPI (str/Decimal/int) en float, 0.0 si invalide."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class StubSuggestionProvider(AISuggestionPort):
+    """Provider IA deterministe, sans dependance externe.
+
+    Les reponses ne dependent que des KPI recus : deux appels avec les
+    memes donnees retournent le meme resultat.
+
+    Attributes:
+        delai_seconds: Latence simulee par appel (0 par defaut).
+        nb_appels: Nombre d'appels effectues (suggestions + analyses).
+    """
+
+    def __init__(self, delai_seconds: float = 0.0) -> None:
+        """Initialise le provider stub.
+
+        Args:
+            delai_seconds: Latence artificielle pour simuler un modele distant.
+        """
+        self.delai_seconds = delai_seconds
+        self.nb_appels = 0
+
+    def _simuler_latence(self) -> None:
+        """Compte l'appel et applique la latence simulee."""
+        self.nb_appels += 1
+        if self.delai_seconds > 0:
+            time.sleep(self.delai_seconds)
+
+    def generate_suggestions(self, kpi_data: dict) -> List[SuggestionDTO]:
+        """Genere des suggestions a partir de seuils fixes sur les KPI.
+
+        Args:
+            kpi_data: Dictionnaire des KPI du chantier.
+
+        Returns:
+            Liste de SuggestionDTO (au moins une suggestion INFO).
+        """
+        self._simuler_latence()
+
+        pct_engage = _to_float(kpi_data.get("pct_engage"))
+        marge_pct = _to_float(
+            kpi_data.get("marge_pct", kpi_data.get("marge_budgetaire_pct"))
+        )
+        suggestions: List[SuggestionDTO] = []
+
+        if pct_engage >= SEUIL_ENGAGE_CRITIQUE:
+            suggestions.append(
+                SuggestionDTO(
+                    type="CREATE_AVENANT",
+                    severity="CRITICAL",
+                    titre="Budget depasse",
+                    description=(
+                        f"Le budget est engage a {pct_engage:.1f}%. "
+                        "Un avenant doit etre negocie avec le client."
+                    ),
+                    impact_estime_eur=str(kpi_data.get("reste_a_depenser", "0.00")),
+                )
+            )
+        elif pct_engage >= SEUIL_ENGAGE_ATTENTION:
+            suggestions.append(
+                SuggestionDTO(
+                    type="REDUCE_COSTS",
+                    severity="WARNING",
+                    titre="Engagement eleve",
+                    description=(
+                        f"Le budget est engage a {pct_engage:.1f}%. "
+                        "Verifier les prochains achats avant validation."
+                    ),
+                    impact_estime_eur="0.00",
+                )
+            )
+
+        if marge_pct < SEUIL_MARGE_FAIBLE:
+            suggestions.append(
+                SuggestionDTO(
+                    type="RENEGOCIATE_SUPPLIERS",
+                    severity="WARNING",
+                    titre="Marge faible",
+                    description=(
+                        f"La marge estimee est de {marge_pct:.1f}%. "
+                        "Renegocier les conditions fournisseurs."
+                    ),
+                    impact_estime_eur="0.00",
+                )
+            )
+
+        if not suggestions:
+            suggestions.append(
+                SuggestionDTO(
+                    type="REVIEW_PLANNING",
+                    severity="INFO",
+                    titre="Chantier sous controle",
+                    description="Les indicateurs financiers sont dans les seuils.",
+                    impact_estime_eur="0.00",
+                )
+            )
+
+        return suggestions
+
+    def generate_consolidated_analysis(self, consolidated_data: dict) -> Dict[str, Any]:
+        """Genere une analyse consolidee deterministe.
+
+        Args:
+            consolidated_data: Dictionnaire de la vue consolidee.
+
+        Returns:
+            Dictionnaire au meme format que GeminiSuggestionProvider.
+        """
+        self._simuler_latence()
+
+        kpi = consolidated_data.get("kpi_globaux", {})
+        nb_chantiers = kpi.get("nb_chantiers", 0)
+        nb_depassement = kpi.get("nb_chantiers_depassement", 0)
+        nb_attention = kpi.get("nb_chantiers_attention", 0)
+        marge_moyenne = _to_float(kpi.get("marge_moyenne_pct"))
+
+        score = 90 - 20 * nb_depassement - 5 * nb_attention
+        alertes = []
+        if nb_depassement:
+            alertes.append(f"{nb_depassement} chantier(s) en depassement")
+        if nb_attention:
+            alertes.append(f"{nb_attention} chantier(s) a surveiller")
+
+        return {
+            "synthese": (
+                f"{nb_chantiers} chantiers suivis, marge moyenne {marge_moyenne:.1f}%."
+            ),
+            "alertes": alertes,
+            "recommandations": ["Suivre l'engagement des chantiers a risque"],
+            "tendance": "stable",
+            "score_sante": min(100, max(0, score)),
+            "source": "stub",
+            "ai_available": True,
+        }
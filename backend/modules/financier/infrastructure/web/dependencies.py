@@ -7,7 +7,7 @@ from typing import Optional
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
-from shared.infrastructure.database import get_db
+from shared.infrastructure.database import get_db, session_for
 from shared.infrastructure.event_bus import EventBus as CoreEventBus
 from ...application.ports.event_bus import EventBus
 from ...application.ports.ai_suggestion_port import AISuggestionPort
@@ -789,23 +789,21 @@ def get_cout_materiel_use_case(
 
 
 def get_dashboard_financier_use_case(
-    budget_repository: BudgetRepository = Depends(get_budget_repository),
-    lot_repository: LotBudgetaireRepository = Depends(get_lot_budgetaire_repository),
-    achat_repository: AchatRepository = Depends(get_achat_repository),
-    situation_repository: SituationRepository = Depends(get_situation_repository),
-    cout_mo_repository: CoutMainOeuvreRepository = Depends(get_cout_main_oeuvre_repository),
-    cout_materiel_repository: CoutMaterielRepository = Depends(get_cout_materiel_repository),
-    facture_repository: FactureRepository = Depends(get_facture_repository),
-    config_repository: ConfigurationEntrepriseRepository = Depends(get_configuration_entreprise_repository),
+    db: Session = Depends(session_for(GetDashboardFinancierUseCase)),
 ) -> GetDashboardFinancierUseCase:
     """Retourne le use case GetDashboardFinancier.
 
     Les coefficients financiers sont lus depuis ConfigurationEntreprise (SSOT).
     """
+    config_repository = get_configuration_entreprise_repository(db)
     return GetDashboardFinancierUseCase(
-        budget_repository, lot_repository, achat_repository,
-        situation_repository, cout_mo_repository, cout_materiel_repository,
-        facture_repository=facture_repository,
+        get_budget_repository(db),
+        get_lot_budgetaire_repository(db),
+        get_achat_repository(db),
+        get_situation_repository(db),
+        get_cout_main_oeuvre_repository(db, config_repository),
+        get_cout_materiel_repository(db),
+        facture_repository=get_facture_repository(db),
         config_repository=config_repository,
     )
 
@@ -865,14 +863,7 @@ def get_list_alertes_use_case(
 
 
 def get_vue_consolidee_use_case(
-    budget_repository: BudgetRepository = Depends(get_budget_repository),
-    lot_repository: LotBudgetaireRepository = Depends(get_lot_budgetaire_repository),
-    achat_repository: AchatRepository = Depends(get_achat_repository),
-    alerte_repository: AlerteRepository = Depends(get_alerte_repository),
-    situation_repository: SituationRepository = Depends(get_situation_repository),
-    cout_mo_repository: CoutMainOeuvreRepository = Depends(get_cout_main_oeuvre_repository),
-    cout_materiel_repository: CoutMaterielRepository = Depends(get_cout_materiel_repository),
-    db: Session = Depends(get_db),
+    db: Session = Depends(session_for(GetVueConsolideeFinancesUseCase)),
 ) -> GetVueConsolideeFinancesUseCase:
     """Retourne le use case GetVueConsolideeFinances.
 
@@ -889,16 +880,17 @@ def get_vue_consolidee_use_case(
     chantier_repo = SQLAlchemyChantierRepository(db)
     chantier_info_port = ChantierInfoAdapter(chantier_repo)
 
-    from ...domain.repositories import ConfigurationEntrepriseRepository as _ConfigRepo
-    from ..persistence import SQLAlchemyConfigurationEntrepriseRepository as _SQLConfigRepo
-    config_repo = _SQLConfigRepo(db)
+    config_repo = get_configuration_entreprise_repository(db)
 
     return GetVueConsolideeFinancesUseCase(
-        budget_repository, lot_repository, achat_repository, alerte_repository,
+        get_budget_repository(db),
+        get_lot_budgetaire_repository(db),
+        get_achat_repository(db),
+        get_alerte_repository(db),
         chantier_info_port=chantier_info_port,
-        situation_repository=situation_repository,
-        cout_mo_repository=cout_mo_repository,
-        cout_materiel_repository=cout_materiel_repository,
+        situation_repository=get_situation_repository(db),
+        cout_mo_repository=get_cout_main_oeuvre_repository(db, config_repo),
+        cout_materiel_repository=get_cout_materiel_repository(db),
         config_repository=config_repo,
     )
 
@@ -914,14 +906,20 @@ _ai_provider_initialized: bool = False
 
 
 def get_ai_suggestion_provider() -> Optional[AISuggestionPort]:
-    """Retourne le provider IA Gemini si GEMINI_API_KEY est configuree.
+    """Retourne le provider IA (Gemini ou stub) encapsule dans le cache IA.
 
     Utilise un singleton pour eviter de re-initialiser le client Gemini
     a chaque requete. Si la cle n'est pas configuree ou si l'initialisation
     echoue, retourne None (fallback aux regles algorithmiques).
 
+    Variables d'environnement :
+        AI_PROVIDER: "gemini" (defaut) ou "stub" (provider local, hors-ligne).
+        AI_CACHE_TTL_SECONDS: Duree de fraicheur des reponses en cache.
+        AI_CACHE_STALE_SECONDS: Fenetre de service des reponses perimees.
+        AI_CACHE_ATTENTE_MAX_SECONDS: Attente max sur un miss (0 = non bloquant).
+
     Returns:
-        GeminiSuggestionProvider si configure, None sinon.
+        CachedAISuggestionProvider si configure, None sinon.
     """
     global _ai_provider_instance, _ai_provider_initialized
 
@@ -930,28 +928,52 @@ def get_ai_suggestion_provider() -> Optional[AISuggestionPort]:
 
     _ai_provider_initialized = True
 
-    api_key = os.environ.get("GEMINI_API_KEY", "")
-    if not api_key:
-        logger.info(
-            "GEMINI_API_KEY non configuree. "
-            "Suggestions IA desactivees (mode algorithmique uniquement)."
-        )
-        return None
-
+    provider_name = os.environ.get("AI_PROVIDER", "gemini").lower()
     try:
-        from ..ai.gemini_provider import GeminiSuggestionProvider
-
-        _ai_provider_instance = GeminiSuggestionProvider()
-        logger.info("Provider IA Gemini initialise avec succes.")
-        return _ai_provider_instance
+        if provider_name == "stub":
+            from ..ai.stub_provider import StubSuggestionProvider
+
+            inner: AISuggestionPort = StubSuggestionProvider()
+            logger.info("Provider IA stub initialise (mode hors-ligne).")
+        else:
+            api_key = os.environ.get("GEMINI_API_KEY", "")
+            if not api_key:
+                logger.info(
+                    "GEMINI_API_KEY non configuree. "
+                    "Suggestions IA desactivees (mode algorithmique uniquement)."
+                )
+                return None
+
+            from ..ai.gemini_provider import GeminiSuggestionProvider
+
+            inner = GeminiSuggestionProvider()
+            logger.info("Provider IA Gemini initialise avec succes.")
     except Exception as e:
         logger.warning(
-            "Impossible d'initialiser le provider Gemini: %s. "
+            "Impossible d'initialiser le provider IA %s: %s. "
             "Fallback aux regles algorithmiques.",
+            provider_name,
             str(e),
         )
         return None
 
+    from ..ai.cached_provider import (
+        AI_CACHE_ATTENTE_MAX_SECONDS,
+        AI_CACHE_STALE_SECONDS,
+        AI_CACHE_TTL_SECONDS,
+        CachedAISuggestionProvider,
+    )
+
+    _ai_provider_instance = CachedAISuggestionProvider(
+        inner,
+        ttl_seconds=float(os.environ.get("AI_CACHE_TTL_SECONDS", AI_CACHE_TTL_SECONDS)),
+        stale_seconds=float(os.environ.get("AI_CACHE_STALE_SECONDS", AI_CACHE_STALE_SECONDS)),
+        attente_max_seconds=float(
+            os.environ.get("AI_CACHE_ATTENTE_MAX_SECONDS", AI_CACHE_ATTENTE_MAX_SECONDS)
+        ),
+    )
+    return _ai_provider_instance
+
 
 # =============================================================================
 # Use Cases - Suggestions (FIN-21/22)
@@ -1030,17 +1052,16 @@ def get_affectations_by_tache_use_case(
 
 
 def get_export_comptable_use_case(
-    budget_repository: BudgetRepository = Depends(get_budget_repository),
-    achat_repository: AchatRepository = Depends(get_achat_repository),
-    situation_repository: SituationRepository = Depends(get_situation_repository),
-    facture_repository: FactureRepository = Depends(get_facture_repository),
-    fournisseur_repository: FournisseurRepository = Depends(get_fournisseur_repository),
-    lot_repository: LotBudgetaireRepository = Depends(get_lot_budgetaire_repository),
+    db: Session = Depends(session_for(ExportComptableUseCase)),
 ) -> ExportComptableUseCase:
     """Retourne le use case ExportComptable."""
     return ExportComptableUseCase(
-        budget_repository, achat_repository, situation_repository,
-        facture_repository, fournisseur_repository, lot_repository,
+        get_budget_repository(db),
+        get_achat_repository(db),
+        get_situation_repository(db),
+        get_facture_repository(db),
+        get_fournisseur_repository(db),
+        get_lot_budgetaire_repository(db),
     )
 
 
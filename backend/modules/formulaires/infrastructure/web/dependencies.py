@@ -4,6 +4,7 @@ from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from shared.infrastructure.database import get_db
+from shared.infrastructure.pdf import PdfGeneratorService, get_pdf_render_cache
 from shared.infrastructure.web.dependencies import get_current_user_id  # noqa: F401
 from ...adapters.controllers import FormulaireController
 from ...application.use_cases import (
@@ -55,5 +56,9 @@ def get_formulaire_controller(
         get_formulaire_uc=GetFormulaireUseCase(formulaire_repo),
         list_formulaires_uc=ListFormulairesUseCase(formulaire_repo),
         get_history_uc=GetFormulaireHistoryUseCase(formulaire_repo),
-        export_pdf_uc=ExportFormulairePDFUseCase(formulaire_repo, template_repo),
+        export_pdf_uc=ExportFormulairePDFUseCase(
+            formulaire_repo,
+            template_repo,
+            PdfGeneratorService(render_cache=get_pdf_render_cache()),
+        ),
     )
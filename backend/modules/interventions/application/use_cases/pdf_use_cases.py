@@ -107,6 +107,70 @@ class GenerateInterventionPDFUseCase:
         if options is None:
             options = InterventionPDFOptionsDTO()
 
+        intervention, techniciens, messages, signatures = self._collecter(
+            intervention_id, options
+        )
+
+        # 5. Generer le PDF
+        try:
+            pdf_bytes = self._pdf_generator.generate_intervention_pdf(
+                intervention=intervention,
+                techniciens=techniciens,
+                messages=messages,
+                signatures=signatures,
+                options=options,
+            )
+        except Exception as e:
+            raise GenerateInterventionPDFError(
+                f"Erreur lors de la generation du rapport PDF pour "
+                f"l'intervention {intervention.code}: {e}"
+            )
+
+        # 6. Construire le nom de fichier
+        code = intervention.code or f"INT-{intervention_id}"
+        filename = f"rapport_{code}.pdf"
+
+        return pdf_bytes, filename
+
+    def prerender(self, intervention_id: int) -> None:
+        """Prepare le rapport PDF (options par defaut) sans attendre le rendu.
+
+        Appele apres un changement d'etat (ex: signature) pour que le
+        premier telechargement soit servi depuis le cache.
+
+        Args:
+            intervention_id: L'ID de l'intervention.
+
+        Raises:
+            ValueError: Si l'intervention n'existe pas.
+        """
+        options = InterventionPDFOptionsDTO()
+        intervention, techniciens, messages, signatures = self._collecter(
+            intervention_id, options
+        )
+        self._pdf_generator.prerender_intervention_pdf(
+            intervention=intervention,
+            techniciens=techniciens,
+            messages=messages,
+            signatures=signatures,
+            options=options,
+        )
+
+    def _collecter(
+        self,
+        intervention_id: int,
+        options: InterventionPDFOptionsDTO,
+    ) -> tuple[
+        Intervention,
+        List[AffectationIntervention],
+        List[InterventionMessage],
+        List[SignatureIntervention],
+    ]:
+        """Recupere les donnees du rapport selon les options.
+
+        Raises:
+            ValueError: Si l'intervention n'existe pas.
+        """
         # 1. Recuperer l'intervention
         intervention = self._intervention_repo.get_by_id(intervention_id)
         if not intervention:
@@ -131,23 +195,4 @@ class GenerateInterventionPDFUseCase:
         if options.inclure_signatures:
             signatures = self._signature_repo.list_by_intervention(intervention_id)
 
-        # 5. Generer le PDF
-        try:
-            pdf_bytes = self._pdf_generator.generate_intervention_pdf(
-                intervention=intervention,
-                techniciens=techniciens,
-                messages=messages,
-                signatures=signatures,
-                options=options,
-            )
-        except Exception as e:
-            raise GenerateInterventionPDFError(
-                f"Erreur lors de la generation du rapport PDF pour "
-                f"l'intervention {intervention.code}: {e}"
-            )
-
-        # 6. Construire le nom de fichier
-        code = intervention.code or f"INT-{intervention_id}"
-        filename = f"rapport_{code}.pdf"
-
-        return pdf_bytes, filename
+        return intervention, techniciens, messages, signatures
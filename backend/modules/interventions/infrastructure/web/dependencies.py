@@ -4,7 +4,7 @@ from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from shared.infrastructure.database import get_db
-from shared.infrastructure.pdf import PdfGeneratorService
+from shared.infrastructure.pdf import PdfGeneratorService, get_pdf_render_cache
 from ...domain.repositories import (
     InterventionRepository,
     AffectationInterventionRepository,
@@ -203,7 +203,7 @@ def get_generate_intervention_pdf_use_case(
 
     INT-14: Rapport PDF - Generation automatique.
     """
-    pdf_generator = PdfGeneratorService()
+    pdf_generator = PdfGeneratorService(render_cache=get_pdf_render_cache())
     return GenerateInterventionPDFUseCase(
         intervention_repo=intervention_repo,
         affectation_repo=affectation_repo,
@@ -548,9 +548,16 @@ def add_signature(
     request: Request,
     db: Session = Depends(get_db),
     use_case: AddSignatureUseCase = Depends(get_add_signature_use_case),
+    pdf_use_case: GenerateInterventionPDFUseCase = Depends(
+        get_generate_intervention_pdf_use_case
+    ),
     current_user_id: int = Depends(get_current_user_id),
 ) -> SignatureResponseDTO:
-    """Ajoute une signature a l'intervention."""
+    """Ajoute une signature a l'intervention.
+
+    Le rapport PDF est pre-rendu en arriere-plan pour etre disponible
+    immediatement apres la signature.
+    """
     # Recuperer l'IP pour la tracabilite
     ip_address = request.client.host if request.client else None
 
@@ -569,6 +576,11 @@ def add_signature(
 
     db.commit()
 
+    try:
+        pdf_use_case.prerender(intervention_id)
+    except Exception as e:
+        logger.warning("Pre-rendu PDF intervention %s impossible: %s", intervention_id, e)
+
     return SignatureResponseDTO(
         id=signature.id,
         intervention_id=signature.intervention_id,
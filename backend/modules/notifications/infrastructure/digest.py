@@ -0,0 +1,233 @@
+"""Regroupement (digest) des notifications repetitives.
+
+Une rafale d'evenements identiques (ex: 30 pointages soumis sur un meme
+chantier) ne doit pas produire 30 notifications par validateur. Les
+notifications sont mises en attente par (categorie, destinataire, chantier)
+pendant une fenetre ; a l'expiration, le job FlushNotificationDigestsJob
+insere une seule notification de synthese par groupe, en une requete.
+
+Le tampon est en memoire : la livraison est au plus une fois. A l'arret
+normal, l'application publie tout le tampon (flush force) ; si le worker
+plante ou est tue (SIGKILL), les notifications en attente sont perdues.
+La fenetre est courte pour limiter cette perte a quelques secondes.
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..domain.entities import Notification
+from .persistence import SQLAlchemyNotificationRepository
+
+# Duree de la fenetre de regroupement (secondes, 0 = desactive)
+DIGEST_WINDOW_SECONDS = 10.0
+
+# Categorie de digest des heures soumises pour validation (GAP-FDH-007)
+DIGEST_POINTAGES_SOUMIS = "pointages_soumis"
+
+# Nombre de noms cites dans un message de synthese
+NOMS_CITES_MAX = 3
+
+_CleDigest = Tuple[str, int, Optional[int]]
+
+
+@dataclass
+class _Groupe:
+    """Notifications en attente d'un meme groupe."""
+
+    ouvert_a: float
+    notifications: List[Notification] = field(default_factory=list)
+
+
+def _message_pointages_soumis(notifications: List[Notification]) -> str:
+    """Message de synthese des heures soumises."""
+    noms: List[str] = []
+    for notification in notifications:
+        nom = notification.metadata.get("compagnon_nom")
+        if nom and nom not in noms:
+            noms.append(nom)
+
+    cites = ", ".join(noms[:NOMS_CITES_MAX])
+    if len(noms) > NOMS_CITES_MAX:
+        cites += f" et {len(noms) - NOMS_CITES_MAX} autre(s)"
+    return f"{len(notifications)} saisies d'heures soumises par {cites}"
+
+
+# Message de synthese par categorie
+MESSAGES_DIGEST: Dict[str, Callable[[List[Notification]], str]] = {
+    DIGEST_POINTAGES_SOUMIS: _message_pointages_soumis,
+}
+
+
+def build_digest(categorie: str, notifications: List[Notification]) -> Notification:
+    """
+    Construit la notification de synthese d'un groupe.
+
+    Un groupe d'une seule notification est publie tel quel.
+
+    Args:
+        categorie: Categorie du digest.
+        notifications: Notifications du groupe (non vide).
+
+    Returns:
+        La notification a inserer.
+    """
+    premiere = notifications[0]
+    if len(notifications) == 1:
+        return premiere
+
+    declencheurs = {n.triggered_by_user_id for n in notifications}
+    return Notification(
+        user_id=premiere.user_id,
+        type=premiere.type,
+        title=premiere.title,
+        message=MESSAGES_DIGEST[categorie](notifications),
+        related_chantier_id=premiere.related_chantier_id,
+        triggered_by_user_id=premiere.triggered_by_user_id if len(declencheurs) == 1 else None,
+        metadata={"digest": categorie, "count": len(notifications)},
+    )
+
+
+class NotificationDigestBuffer:
+    """
+    Tampon des notifications a regrouper, partage par le processus.
+
+    La fenetre d'un groupe s'ouvre a sa premiere notification ; les
+    suivantes s'y ajoutent jusqu'a expiration.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = DIGEST_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialise le tampon.
+
+        Args:
+            window_seconds: Duree de la fenetre de regroupement.
+            clock: Horloge monotone (injectable pour les tests).
+        """
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._lock = Lock()
+        self._groupes: Dict[_CleDigest, _Groupe] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Indique si le regroupement est actif."""
+        return self.window_seconds > 0
+
+    def add(self, categorie: str, notifications: List[Notification]) -> None:
+        """
+        Met des notifications en attente de regroupement.
+
+        Args:
+            categorie: Categorie du digest (cle de MESSAGES_DIGEST).
+            notifications: Notifications a regrouper.
+        """
+        now = self._clock()
+        with self._lock:
+            for notification in notifications:
+                cle = (categorie, notification.user_id, notification.related_chantier_id)
+                groupe = self._groupes.setdefault(cle, _Groupe(ouvert_a=now))
+                groupe.notifications.append(notification)
+
+    def pending(self) -> int:
+        """Nombre de groupes en attente."""
+        with self._lock:
+            return len(self._groupes)
+
+    def pop_due(self, force: bool = False) -> List[Notification]:
+        """
+        Retire les groupes dont la fenetre est expiree.
+
+        Args:
+            force: Retire tous les groupes (arret de l'application).
+
+        Returns:
+            Une notification de synthese par groupe retire.
+        """
+        return [
+            build_digest(cle[0], groupe.notifications)
+            for cle, groupe in self._pop_groupes_dus(force)
+        ]
+
+    def flush(self, db: Session, force: bool = False) -> int:
+        """
+        Insere les syntheses des groupes expires en une requete.
+
+        Si l'insertion echoue, les groupes retires sont remis en attente et
+        seront publies au passage suivant : aucune notification n'est perdue.
+
+        Args:
+            db: Session de base de donnees.
+            force: Vide tout le tampon.
+
+        Returns:
+            Nombre de notifications inserees.
+
+        Raises:
+            Exception: Erreur de l'insertion (groupes remis en attente).
+        """
+        groupes = self._pop_groupes_dus(force)
+        if not groupes:
+            return 0
+
+        digests = [build_digest(cle[0], groupe.notifications) for cle, groupe in groupes]
+        try:
+            SQLAlchemyNotificationRepository(db).save_many(digests)
+        except Exception:
+            db.rollback()
+            self._remettre(groupes)
+            raise
+        return len(digests)
+
+    def _pop_groupes_dus(self, force: bool) -> List[Tuple[_CleDigest, _Groupe]]:
+        """Retire les groupes dont la fenetre est expiree (tous si force)."""
+        limite = self._clock() - self.window_seconds
+        with self._lock:
+            dus = [
+                cle for cle, groupe in self._groupes.items()
+                if force or groupe.ouvert_a <= limite
+            ]
+            return [(cle, self._groupes.pop(cle)) for cle in dus]
+
+    def _remettre(self, groupes: List[Tuple[_CleDigest, _Groupe]]) -> None:
+        """Remet des groupes en attente, fusionnes avec ceux rouverts entre-temps."""
+        with self._lock:
+            for cle, groupe in groupes:
+                rouvert = self._groupes.get(cle)
+                if rouvert is not None:
+                    groupe.notifications.extend(rouvert.notifications)
+                self._groupes[cle] = groupe
+
+
+_buffer_instance: Optional[NotificationDigestBuffer] = None
+_buffer_lock = Lock()
+
+
+def get_notification_digest_buffer() -> NotificationDigestBuffer:
+    """
+    Retourne le tampon de regroupement partage par le processus.
+
+    Variables d'environnement :
+        NOTIFICATION_DIGEST_WINDOW_SECONDS: Fenetre de regroupement (0 = desactive).
+
+    Returns:
+        Instance unique de NotificationDigestBuffer.
+    """
+    global _buffer_instance
+
+    with _buffer_lock:
+        if _buffer_instance is None:
+            _buffer_instance = NotificationDigestBuffer(
+                window_seconds=float(
+                    os.environ.get("NOTIFICATION_DIGEST_WINDOW_SECONDS", DIGEST_WINDOW_SECONDS)
+                ),
+            )
+        return _buffer_instance
@@ -4,6 +4,8 @@ import re
 import logging
 from typing import List, Optional
 
+from sqlalchemy import select, union
+
 from shared.infrastructure.event_bus import event_handler
 from shared.infrastructure.database import SessionLocal
 from shared.infrastructure.entity_info_impl import SQLAlchemyEntityInfoService
@@ -16,6 +18,7 @@ from modules.pointages.domain.events import (
 from ..domain.entities import Notification
 from ..domain.value_objects import NotificationType
 from .persistence import SQLAlchemyNotificationRepository
+from .digest import DIGEST_POINTAGES_SOUMIS, get_notification_digest_buffer
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +71,12 @@ def get_comment_content(db, comment_id: int) -> str | None:
     return comment.content if comment else None
 
 
+def _publier(repo, notifications: List[Notification]) -> None:
+    """Insere les notifications d'un evenement en une seule transaction."""
+    if notifications:
+        repo.save_many(notifications)
+
+
 @event_handler(CommentAddedEvent)
 def handle_comment_added(event: CommentAddedEvent) -> None:
     """
@@ -83,6 +92,7 @@ def handle_comment_added(event: CommentAddedEvent) -> None:
         repo = SQLAlchemyNotificationRepository(db)
         author_name = get_user_name(db, event.author_id)
         comment_content = get_comment_content(db, event.comment_id)
+        notifications = []
 
         # 1. Notifier l'auteur du post (sauf s'il commente son propre post)
         if event.post_author_id != event.author_id:
@@ -95,8 +105,7 @@ def handle_comment_added(event: CommentAddedEvent) -> None:
                 related_comment_id=event.comment_id,
                 triggered_by_user_id=event.author_id,
             )
-            repo.save(notification)
-            logger.info(f"Created notification for post author {event.post_author_id}")
+            notifications.append(notification)
 
         # 2. Parser les mentions @ dans le commentaire
         if comment_content:
@@ -114,8 +123,10 @@ def handle_comment_added(event: CommentAddedEvent) -> None:
                         related_comment_id=event.comment_id,
                         triggered_by_user_id=event.author_id,
                     )
-                    repo.save(notification)
-                    logger.info(f"Created mention notification for user {mentioned_user_id}")
+                    notifications.append(notification)
+
+        _publier(repo, notifications)
+        logger.info(f"Created {len(notifications)} notification(s) for comment {event.comment_id}")
 
     except Exception as e:
         logger.error(f"Error handling CommentAddedEvent: {e}")
@@ -217,25 +228,14 @@ def _get_chantier_users(db, chantier_id: int) -> list[int]:
         ChantierChefModel,
     )
 
-    user_ids = set()
-
-    conducteurs = (
-        db.query(ChantierConducteurModel.user_id)
-        .filter(ChantierConducteurModel.chantier_id == chantier_id)
-        .all()
+    # Une seule requete ; UNION elimine les doublons (conducteur et chef)
+    stmt = union(
+        select(ChantierConducteurModel.user_id)
+        .where(ChantierConducteurModel.chantier_id == chantier_id),
+        select(ChantierChefModel.user_id)
+        .where(ChantierChefModel.chantier_id == chantier_id),
     )
-    for (uid,) in conducteurs:
-        user_ids.add(uid)
-
-    chefs = (
-        db.query(ChantierChefModel.user_id)
-        .filter(ChantierChefModel.chantier_id == chantier_id)
-        .all()
-    )
-    for (uid,) in chefs:
-        user_ids.add(uid)
-
-    return list(user_ids)
+    return list(db.execute(stmt).scalars())
 
 
 @event_handler('chantier.created')
@@ -259,8 +259,8 @@ def handle_chantier_created(event) -> None:
         chef_ids = metadata.get('chef_chantier_ids', [])
         destinataires = set(conducteur_ids + chef_ids) - {created_by}
 
-        for user_id in destinataires:
-            notification = Notification(
+        notifications = [
+            Notification(
                 user_id=user_id,
                 type=NotificationType.CHANTIER_ASSIGNMENT,
                 title="Nouveau chantier",
@@ -268,8 +268,10 @@ def handle_chantier_created(event) -> None:
                 related_chantier_id=chantier_id,
                 triggered_by_user_id=created_by if created_by else None,
             )
-            repo.save(notification)
-            logger.info(f"Created chantier assignment notification for user {user_id}")
+            for user_id in destinataires
+        ]
+        _publier(repo, notifications)
+        logger.info(f"Created {len(notifications)} chantier assignment notification(s)")
 
     except Exception as e:
         logger.error(f"Error handling chantier.created: {e}")
@@ -305,8 +307,8 @@ def handle_chantier_statut_changed(event) -> None:
         except ValueError:
             label = nouveau_statut
 
-        for user_id in destinataires:
-            notification = Notification(
+        _publier(repo, [
+            Notification(
                 user_id=user_id,
                 type=NotificationType.SYSTEM,
                 title="Changement de statut chantier",
@@ -314,7 +316,8 @@ def handle_chantier_statut_changed(event) -> None:
                 related_chantier_id=chantier_id,
                 triggered_by_user_id=changed_by if changed_by else None,
             )
-            repo.save(notification)
+            for user_id in destinataires
+        ])
 
     except Exception as e:
         logger.error(f"Error handling chantier.statut_changed: {e}")
@@ -328,7 +331,8 @@ def handle_pointage_submitted(event: PointageSubmittedEvent) -> None:
     Gere l'evenement PointageSubmittedEvent (GAP-FDH-007).
 
     Notifie le chef de chantier ou conducteur de travaux qu'un compagnon
-    a soumis ses heures pour validation.
+    a soumis ses heures pour validation. Les soumissions en rafale sont
+    regroupees en une notification de synthese par validateur (voir digest).
     """
     logger.info(
         f"Handling PointageSubmittedEvent: pointage_id={event.pointage_id}, "
@@ -348,17 +352,26 @@ def handle_pointage_submitted(event: PointageSubmittedEvent) -> None:
 
         date_str = event.date_pointage.strftime("%d/%m/%Y")
 
-        for user_id in destinataires:
-            notification = Notification(
+        notifications = [
+            Notification(
                 user_id=user_id,
                 type=NotificationType.SYSTEM,
                 title="Heures soumises pour validation",
                 message=f"{compagnon_name} a soumis ses heures du {date_str}",
                 related_chantier_id=event.chantier_id,
                 triggered_by_user_id=event.utilisateur_id,
+                metadata={"compagnon_nom": compagnon_name},
             )
-            repo.save(notification)
-            logger.info(f"Created pointage submitted notification for user {user_id}")
+            for user_id in destinataires
+        ]
+
+        digest_buffer = get_notification_digest_buffer()
+        if digest_buffer.enabled:
+            digest_buffer.add(DIGEST_POINTAGES_SOUMIS, notifications)
+            logger.info(f"Queued {len(notifications)} pointage submitted notification(s) for digest")
+        else:
+            _publier(repo, notifications)
+            logger.info(f"Created {len(notifications)} pointage submitted notification(s)")
 
     except Exception as e:
         logger.error(f"Error handling PointageSubmittedEvent: {e}")
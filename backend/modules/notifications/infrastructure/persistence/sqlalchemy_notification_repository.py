@@ -78,13 +78,18 @@ class SQLAlchemyNotificationRepository(NotificationRepository):
         return self._to_entity(model)
 
     def save_many(self, notifications: List[Notification]) -> List[Notification]:
-        """Persiste plusieurs notifications en une transaction."""
+        """
+        Persiste plusieurs notifications en une transaction.
+
+        Les INSERT sont groupes au flush (RETURNING des IDs) ; les entites
+        sont construites avant le commit pour eviter un SELECT par ligne.
+        """
         models = [self._to_model(n) for n in notifications]
         self._db.add_all(models)
+        self._db.flush()
+        saved = [self._to_entity(m) for m in models]
         self._db.commit()
-        for model in models:
-            self._db.refresh(model)
-        return [self._to_entity(m) for m in models]
+        return saved
 
     def delete(self, notification_id: int) -> bool:
         """Supprime une notification."""
@@ -27,6 +27,11 @@ def get_notifications_use_case(
     return GetNotificationsUseCase(repository=repository)
 
 
+def build_notifications_use_case(db: Session) -> GetNotificationsUseCase:
+    """Construit GetNotifications sur une session donnee (routes asynchrones)."""
+    return get_notifications_use_case(get_notification_repository(db))
+
+
 def get_mark_as_read_use_case(
     repository: SQLAlchemyNotificationRepository = Depends(get_notification_repository),
 ) -> MarkAsReadUseCase:
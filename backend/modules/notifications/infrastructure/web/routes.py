@@ -3,19 +3,19 @@
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from shared.infrastructure.web import get_current_user_id
-from shared.infrastructure.database import get_db
+from shared.infrastructure.database import get_async_db, get_db, run_in_session
 from shared.infrastructure.config import settings
 from ...application.dtos import NotificationListDTO, MarkAsReadDTO
 from ...application.use_cases import (
-    GetNotificationsUseCase,
     MarkAsReadUseCase,
     DeleteNotificationUseCase,
 )
 from .dependencies import (
-    get_notifications_use_case,
+    build_notifications_use_case,
     get_mark_as_read_use_case,
     get_delete_notification_use_case,
 )
@@ -33,7 +33,7 @@ async def get_notifications(
     skip: int = Query(0, ge=0, description="Nombre d'elements a sauter"),
     limit: int = Query(50, ge=1, le=100, description="Nombre maximum d'elements"),
     current_user_id: int = Depends(get_current_user_id),
-    use_case: GetNotificationsUseCase = Depends(get_notifications_use_case),
+    db: AsyncSession = Depends(get_async_db),
 ) -> NotificationListDTO:
     """
     Recupere les notifications de l'utilisateur connecte.
@@ -42,21 +42,29 @@ async def get_notifications(
     - **skip**: Pagination - nombre d'elements a sauter
     - **limit**: Pagination - nombre maximum d'elements (max 100)
     """
-    return use_case.execute(
-        user_id=current_user_id,
-        unread_only=unread_only,
-        skip=skip,
-        limit=limit,
+    return await run_in_session(
+        db,
+        lambda session: build_notifications_use_case(session).execute(
+            user_id=current_user_id,
+            unread_only=unread_only,
+            skip=skip,
+            limit=limit,
+        ),
     )
 
 
 @router.get("/unread-count")
 async def get_unread_count(
     current_user_id: int = Depends(get_current_user_id),
-    use_case: GetNotificationsUseCase = Depends(get_notifications_use_case),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict[str, int]:
     """Retourne le nombre de notifications non lues."""
-    result = use_case.execute(user_id=current_user_id, limit=0)
+    result = await run_in_session(
+        db,
+        lambda session: build_notifications_use_case(session).execute(
+            user_id=current_user_id, limit=0
+        ),
+    )
     return {"unread_count": result.unread_count}
 
 
@@ -26,6 +26,7 @@ from .domain.events import (
     AffectationUpdatedEvent,
     AffectationDeletedEvent,
     AffectationBulkCreatedEvent,
+    AffectationBulkDuplicatedEvent,
     AffectationBulkDeletedEvent,
 )
 
@@ -88,6 +89,7 @@ __all__ = [
     "AffectationUpdatedEvent",
     "AffectationDeletedEvent",
     "AffectationBulkCreatedEvent",
+    "AffectationBulkDuplicatedEvent",
     "AffectationBulkDeletedEvent",
     # Application - Use Cases
     "CreateAffectationUseCase",
@@ -11,6 +11,8 @@ from .planning_schemas import (
     AffectationResponse,
     PlanningFiltersRequest,
     DuplicateAffectationsRequest,
+    DuplicateAffectationsEquipeRequest,
+    DuplicationEquipeResponse,
     DeleteResponse,
     NonPlanifiesResponse,
 )
@@ -24,6 +26,8 @@ __all__ = [
     "AffectationResponse",
     "PlanningFiltersRequest",
     "DuplicateAffectationsRequest",
+    "DuplicateAffectationsEquipeRequest",
+    "DuplicationEquipeResponse",
     "DeleteResponse",
     "NonPlanifiesResponse",
 ]
@@ -275,4 +275,7 @@ class PlanningChargeController:
             capacite_totale=dto.capacite_totale,
             a_recruter=dto.a_recruter,
             a_placer=dto.a_placer,
+            effectif=dto.effectif,
+            absences_heures=dto.absences_heures,
+            disponible_heures=dto.disponible_heures,
         )
@@ -141,6 +141,9 @@ class OccupationDetailsResponse(BaseModel):
     capacite_totale: float
     a_recruter: int
     a_placer: int
+    effectif: int = 0
+    absences_heures: float = 0.0
+    disponible_heures: float = 0.0
 
 
 class ListeBesoinResponse(BaseModel):
@@ -20,6 +20,7 @@ from ...application.dtos import (
     UpdateAffectationDTO,
     PlanningFiltersDTO,
     DuplicateAffectationsDTO,
+    DuplicateAffectationsEquipeDTO,
     AffectationDTO,
 )
 from .planning_schemas import (
@@ -28,6 +29,7 @@ from .planning_schemas import (
     UpdateAffectationNoteRequest,
     PlanningFiltersRequest,
     DuplicateAffectationsRequest,
+    DuplicateAffectationsEquipeRequest,
     ResizeAffectationRequest,
 )
 from ..presenters import AffectationPresenter
@@ -522,6 +524,72 @@ class PlanningController:
 
         return [self._entity_to_response(a) for a in affectations]
 
+    def duplicate_equipe(
+        self,
+        request: DuplicateAffectationsEquipeRequest,
+        current_user_id: int,
+    ) -> Dict[str, Any]:
+        """
+        Duplique en masse les affectations d'une equipe (ou en donne l'apercu).
+
+        Args:
+            request: Donnees de duplication d'equipe.
+            current_user_id: ID de l'utilisateur createur.
+
+        Returns:
+            Dictionnaire compatible avec DuplicationEquipeResponse.
+
+        Raises:
+            NoAffectationsToDuplicateError: Si aucune affectation source.
+            AffectationConflictError: Si conflit et ignorer_conflits=False.
+        """
+        dto = DuplicateAffectationsEquipeDTO(
+            utilisateur_ids=tuple(request.utilisateur_ids),
+            source_date_debut=request.source_date_debut,
+            source_date_fin=request.source_date_fin,
+            target_date_debut=request.target_date_debut,
+            chantier_ids=(
+                tuple(request.chantier_ids) if request.chantier_ids is not None else None
+            ),
+            dry_run=request.dry_run,
+            ignorer_conflits=request.ignorer_conflits,
+        )
+
+        result = self.duplicate_affectations_uc.execute_equipe(dto, current_user_id)
+
+        logger.debug(
+            f"Duplication equipe: {result.nb_affectations} affectation(s), "
+            f"{len(result.conflits)} conflit(s), dry_run={result.dry_run}"
+        )
+
+        response: Dict[str, Any] = {
+            "dry_run": result.dry_run,
+            "nb_affectations": result.nb_affectations,
+            "affectations": [],
+            "apercu": [],
+            "conflits": [
+                {"utilisateur_id": uid, "date": jour.isoformat()}
+                for uid, jour in result.conflits
+            ],
+        }
+        if result.dry_run:
+            response["apercu"] = [
+                {
+                    "utilisateur_id": a.utilisateur_id,
+                    "chantier_id": a.chantier_id,
+                    "date": a.date.isoformat(),
+                    "heures_prevues": a.heures_prevues,
+                    "heure_debut": str(a.heure_debut) if a.heure_debut else None,
+                    "heure_fin": str(a.heure_fin) if a.heure_fin else None,
+                }
+                for a in result.affectations
+            ]
+        else:
+            response["affectations"] = [
+                self._entity_to_response(a) for a in result.affectations
+            ]
+        return response
+
     def get_non_planifies(
         self,
         date_debut: date,
@@ -506,6 +506,117 @@ class DuplicateAffectationsRequest(BaseModel):
     }
 
 
+class DuplicateAffectationsEquipeRequest(BaseModel):
+    """
+    Schema de requete pour dupliquer les affectations d'une equipe.
+
+    Attributes:
+        utilisateur_ids: IDs des utilisateurs de l'equipe.
+        source_date_debut: Date de debut de la periode source.
+        source_date_fin: Date de fin de la periode source.
+        target_date_debut: Date de debut de la periode cible.
+        chantier_ids: Limiter aux affectations de ces chantiers (optionnel).
+        dry_run: Apercu sans enregistrement.
+        ignorer_conflits: Ignorer les dates deja occupees au lieu d'echouer.
+    """
+
+    utilisateur_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="IDs des utilisateurs de l'equipe",
+    )
+    source_date_debut: datetime.date = Field(
+        ...,
+        description="Date de debut de la periode source",
+    )
+    source_date_fin: datetime.date = Field(
+        ...,
+        description="Date de fin de la periode source",
+    )
+    target_date_debut: datetime.date = Field(
+        ...,
+        description="Date de debut de la periode cible",
+    )
+    chantier_ids: Optional[List[int]] = Field(
+        None,
+        description="Limiter aux affectations de ces chantiers",
+    )
+    dry_run: bool = Field(
+        False,
+        description="Calculer l'apercu sans rien enregistrer",
+    )
+    ignorer_conflits: bool = Field(
+        False,
+        description="Ignorer les dates deja occupees au lieu d'echouer",
+    )
+
+    @field_validator("source_date_fin")
+    @classmethod
+    def validate_source_date_fin(cls, v: datetime.date, info) -> datetime.date:
+        """Valide que la date de fin source est >= date de debut source."""
+        if "source_date_debut" in info.data and v < info.data["source_date_debut"]:
+            raise ValueError(
+                "La date de fin source doit etre posterieure ou egale a la date de debut"
+            )
+        return v
+
+    @field_validator("target_date_debut")
+    @classmethod
+    def validate_target_date_debut(cls, v: datetime.date, info) -> datetime.date:
+        """Valide que la date cible est posterieure a la date de fin source."""
+        if "source_date_fin" in info.data and v <= info.data["source_date_fin"]:
+            raise ValueError(
+                "La date cible doit etre posterieure a la date de fin source"
+            )
+        return v
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "utilisateur_ids": [3, 5, 7],
+                "source_date_debut": "2026-01-05",
+                "source_date_fin": "2026-01-30",
+                "target_date_debut": "2026-02-02",
+                "dry_run": True,
+            }
+        }
+    }
+
+
+class AffectationPrevueResponse(BaseModel):
+    """Schema d'une affectation prevue par une duplication (apercu)."""
+
+    utilisateur_id: int
+    chantier_id: int
+    date: str
+    heures_prevues: float
+    heure_debut: Optional[str] = None
+    heure_fin: Optional[str] = None
+
+
+class ConflitAffectationResponse(BaseModel):
+    """Schema d'une date cible deja occupee."""
+
+    utilisateur_id: int
+    date: str
+
+
+class DuplicationEquipeResponse(BaseModel):
+    """
+    Schema de reponse pour la duplication d'equipe.
+
+    En dry_run, ``apercu`` liste les affectations prevues et
+    ``affectations`` est vide.
+    """
+
+    dry_run: bool
+    nb_affectations: int
+    affectations: List[AffectationResponse] = []
+    apercu: List[AffectationPrevueResponse] = []
+    conflits: List[ConflitAffectationResponse] = []
+
+
 class ResizeAffectationRequest(BaseModel):
     """
     Schema de requete pour redimensionner une affectation.
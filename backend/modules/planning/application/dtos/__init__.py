@@ -4,7 +4,11 @@ from .create_affectation_dto import CreateAffectationDTO
 from .update_affectation_dto import UpdateAffectationDTO
 from .affectation_dto import AffectationDTO, AffectationListDTO
 from .planning_filters_dto import PlanningFiltersDTO
-from .duplicate_affectations_dto import DuplicateAffectationsDTO
+from .duplicate_affectations_dto import (
+    DuplicateAffectationsDTO,
+    DuplicateAffectationsEquipeDTO,
+    DuplicationResultDTO,
+)
 from .charge import (
     CreateBesoinDTO,
     UpdateBesoinDTO,
@@ -21,6 +25,8 @@ __all__ = [
     "AffectationListDTO",
     "PlanningFiltersDTO",
     "DuplicateAffectationsDTO",
+    "DuplicateAffectationsEquipeDTO",
+    "DuplicationResultDTO",
     "CreateBesoinDTO",
     "UpdateBesoinDTO",
     "BesoinChargeDTO",
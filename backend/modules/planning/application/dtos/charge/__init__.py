@@ -9,7 +9,7 @@ from .planning_charge_dto import (
     FooterChargeDTO,
     PlanningChargeDTO,
 )
-from .occupation_dto import OccupationDetailsDTO, TypeOccupationDTO
+from .occupation_dto import OccupationDetailsDTO, OccupationSemaineDTO, TypeOccupationDTO
 
 __all__ = [
     "BesoinChargeDTO",
@@ -22,5 +22,6 @@ __all__ = [
     "FooterChargeDTO",
     "PlanningChargeDTO",
     "OccupationDetailsDTO",
+    "OccupationSemaineDTO",
     "TypeOccupationDTO",
 ]
@@ -19,6 +19,33 @@ class TypeOccupationDTO:
     alerte: bool
 
 
+@dataclass
+class OccupationSemaineDTO:
+    """
+    DTO de l'occupation globale d'une semaine.
+
+    Element de la serie hebdomadaire partagee par la grille du planning
+    de charge (PDC-12 a PDC-15) et les details d'occupation (PDC-17).
+    """
+
+    semaine_code: str
+    effectif: int  # Utilisateurs presents sur la semaine (entres, non sortis)
+    utilisateurs_planifies: int  # Utilisateurs ayant au moins une affectation
+    jours_absence: int  # Affectations sur CONGES/MALADIE/RTT/FORMATION
+    capacite_heures: float  # effectif * heures par semaine
+    absences_heures: float = 0.0
+
+    @property
+    def disponible_heures(self) -> float:
+        """Capacite nette des absences."""
+        return max(self.capacite_heures - self.absences_heures, 0.0)
+
+    @property
+    def non_planifies(self) -> int:
+        """Utilisateurs presents sans aucune affectation (PDC-15)."""
+        return max(self.effectif - self.utilisateurs_planifies, 0)
+
+
 @dataclass
 class OccupationDetailsDTO:
     """
@@ -47,3 +74,8 @@ class OccupationDetailsDTO:
     # Indicateurs (PDC-14, PDC-15)
     a_recruter: int = 0
     a_placer: int = 0
+
+    # Effectif et absences de la semaine
+    effectif: int = 0
+    absences_heures: float = 0.0
+    disponible_heures: float = 0.0
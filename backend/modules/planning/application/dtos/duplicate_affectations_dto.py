@@ -1,7 +1,10 @@
 """DTO pour la duplication d'affectations."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
+from typing import List, Optional, Tuple
+
+from ...domain.entities import Affectation
 
 
 @dataclass(frozen=True)
@@ -97,3 +100,84 @@ class DuplicateAffectationsDTO:
             source_date_fin=source_week_start + timedelta(days=4),  # Lun-Ven
             target_date_debut=target_week_start,
         )
+
+
+@dataclass(frozen=True)
+class DuplicateAffectationsEquipeDTO:
+    """
+    Data Transfer Object pour la duplication des affectations d'une equipe.
+
+    Copie en masse les affectations de plusieurs utilisateurs d'une periode
+    source vers une periode cible (ex: le mois d'une equipe vers le mois
+    suivant), avec apercu sans ecriture (dry_run).
+
+    Selon CDC Section 5 - Planning Operationnel (PLN-13, PLN-14).
+
+    Attributes:
+        utilisateur_ids: IDs des utilisateurs de l'equipe.
+        source_date_debut: Date de debut de la periode source.
+        source_date_fin: Date de fin de la periode source.
+        target_date_debut: Date de debut de la periode cible.
+        chantier_ids: Limiter aux affectations de ces chantiers (optionnel).
+        dry_run: Calculer l'apercu sans rien enregistrer.
+        ignorer_conflits: Ignorer les dates deja occupees au lieu d'echouer.
+    """
+
+    utilisateur_ids: Tuple[int, ...]
+    source_date_debut: date
+    source_date_fin: date
+    target_date_debut: date
+    chantier_ids: Optional[Tuple[int, ...]] = None
+    dry_run: bool = False
+    ignorer_conflits: bool = False
+
+    def __post_init__(self) -> None:
+        """Valide les donnees a la creation."""
+        if not self.utilisateur_ids:
+            raise ValueError("Au moins un utilisateur est requis")
+
+        if any(uid <= 0 for uid in self.utilisateur_ids):
+            raise ValueError("Les IDs utilisateurs doivent etre positifs")
+
+        if self.source_date_fin < self.source_date_debut:
+            raise ValueError(
+                f"La date de fin source ({self.source_date_fin}) doit etre "
+                f"posterieure ou egale a la date de debut ({self.source_date_debut})"
+            )
+
+        if self.target_date_debut <= self.source_date_fin:
+            raise ValueError(
+                f"La date cible ({self.target_date_debut}) doit etre "
+                f"posterieure a la date de fin source ({self.source_date_fin})"
+            )
+
+    @property
+    def days_offset(self) -> int:
+        """
+        Calcule le decalage en jours entre source et cible.
+
+        Returns:
+            Le nombre de jours de decalage.
+        """
+        return (self.target_date_debut - self.source_date_debut).days
+
+
+@dataclass
+class DuplicationResultDTO:
+    """
+    Resultat d'une duplication en masse.
+
+    Attributes:
+        affectations: Affectations creees (ou prevues si dry_run, sans ID).
+        conflits: Couples (utilisateur_id, date) deja occupes, non copies.
+        dry_run: True si rien n'a ete enregistre.
+    """
+
+    affectations: List[Affectation] = field(default_factory=list)
+    conflits: List[Tuple[int, date]] = field(default_factory=list)
+    dry_run: bool = False
+
+    @property
+    def nb_affectations(self) -> int:
+        """Nombre d'affectations creees (ou prevues)."""
+        return len(self.affectations)
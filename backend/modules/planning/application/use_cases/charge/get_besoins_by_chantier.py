@@ -2,12 +2,15 @@
 
 from typing import List
 
+from shared.application.read_only import read_only
+
 from ....domain.repositories import BesoinChargeRepository
 from ....domain.value_objects.charge import Semaine
 from ...dtos.charge import BesoinChargeDTO
 from .exceptions import InvalidSemaineRangeError
 
 
+@read_only
 class GetBesoinsByChantierUseCase:
     """
     Cas d'utilisation : Recuperation des besoins d'un chantier.
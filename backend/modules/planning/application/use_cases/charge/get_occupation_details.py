@@ -3,9 +3,11 @@
 from typing import List, Dict, Optional
 from abc import ABC, abstractmethod
 
+from shared.application.read_only import read_only
+
 from ....domain.repositories import BesoinChargeRepository
 from ....domain.value_objects.charge import Semaine, TypeMetier, TauxOccupation
-from ...dtos.charge import OccupationDetailsDTO, TypeOccupationDTO
+from ...dtos.charge import OccupationDetailsDTO, OccupationSemaineDTO, TypeOccupationDTO
 
 
 class UtilisateurProvider(ABC):
@@ -57,7 +59,25 @@ class AffectationProviderForOccupation(ABC):
         """
         pass
 
+    def get_occupation_semaine(
+        self,
+        semaine: Semaine,
+    ) -> Optional[OccupationSemaineDTO]:
+        """
+        Recupere l'occupation globale de la semaine (effectif, absences).
 
+        Implementation par defaut : non disponible.
+
+        Args:
+            semaine: La semaine concernee.
+
+        Returns:
+            OccupationSemaineDTO ou None si non disponible.
+        """
+        return None
+
+
+@read_only
 class GetOccupationDetailsUseCase:
     """
     Cas d'utilisation : Details d'occupation par type (PDC-17).
@@ -122,8 +142,10 @@ class GetOccupationDetailsUseCase:
 
         # Recuperer les heures planifiees par type
         planifie_par_type: Dict[str, float] = {}
+        occupation: Optional[OccupationSemaineDTO] = None
         if self.affectation_provider:
             planifie_par_type = self.affectation_provider.get_heures_planifiees_par_type_metier(semaine)
+            occupation = self.affectation_provider.get_occupation_semaine(semaine)
 
         # Construire les DTOs par type
         types_dto = []
@@ -170,6 +192,16 @@ class GetOccupationDetailsUseCase:
         surplus_heures = max(capacite_totale - planifie_total, 0.0)
         a_placer = int(surplus_heures / self.HEURES_PAR_SEMAINE)
 
+        # Meme serie hebdomadaire que le footer du planning de charge (PDC-15)
+        effectif = 0
+        absences_heures = 0.0
+        disponible_heures = 0.0
+        if occupation is not None:
+            a_placer = occupation.non_planifies
+            effectif = occupation.effectif
+            absences_heures = occupation.absences_heures
+            disponible_heures = occupation.disponible_heures
+
         return OccupationDetailsDTO(
             semaine_code=semaine_code,
             semaine_label=str(semaine),
@@ -182,4 +214,7 @@ class GetOccupationDetailsUseCase:
             capacite_totale=capacite_totale,
             a_recruter=a_recruter,
             a_placer=a_placer,
+            effectif=effectif,
+            absences_heures=absences_heures,
+            disponible_heures=disponible_heures,
         )
@@ -3,6 +3,9 @@
 from typing import List, Dict, Optional, Tuple
 from abc import ABC, abstractmethod
 
+from shared.application.instrumentation import timed
+from shared.application.read_only import read_only
+
 from ....domain.repositories import BesoinChargeRepository
 from ....domain.value_objects.charge import Semaine, TypeMetier, TauxOccupation, UniteCharge
 from ...dtos.charge import (
@@ -12,6 +15,7 @@ from ...dtos.charge import (
     SemaineChargeDTO,
     CelluleChargeDTO,
     FooterChargeDTO,
+    OccupationSemaineDTO,
 )
 
 
@@ -93,7 +97,29 @@ class AffectationProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_occupation_par_semaine(
+        self,
+        semaine_debut: Semaine,
+        semaine_fin: Semaine,
+    ) -> List[OccupationSemaineDTO]:
+        """
+        Calcule la serie d'occupation hebdomadaire sur l'horizon.
+
+        Chaque element regroupe l'effectif present, les utilisateurs
+        planifies, les absences et la capacite de la semaine.
+
+        Args:
+            semaine_debut: Premiere semaine.
+            semaine_fin: Derniere semaine.
+
+        Returns:
+            Liste de OccupationSemaineDTO, une par semaine, dans l'ordre.
+        """
+        pass
+
 
+@read_only
 class GetPlanningChargeUseCase:
     """
     Cas d'utilisation : Recuperation du planning de charge.
@@ -130,6 +156,7 @@ class GetPlanningChargeUseCase:
         self.chantier_provider = chantier_provider
         self.affectation_provider = affectation_provider
 
+    @timed
     def execute(self, filters: PlanningChargeFiltersDTO) -> PlanningChargeDTO:
         """
         Execute la recuperation du planning de charge.
@@ -182,16 +209,17 @@ class GetPlanningChargeUseCase:
                 chantier_ids, semaine_debut, semaine_fin
             )
 
-        # Recuperer les capacites et non planifies
+        # Recuperer les capacites (nettes des absences) et non planifies
         capacites: Dict[str, float] = {}
         non_planifies: Dict[str, int] = {}
         if self.affectation_provider:
-            capacites = self.affectation_provider.get_capacite_par_semaine(
-                semaine_debut, semaine_fin
-            )
-            non_planifies = self.affectation_provider.get_utilisateurs_non_planifies_par_semaine(
+            occupation = self.affectation_provider.get_occupation_par_semaine(
                 semaine_debut, semaine_fin
             )
+            for occupation_semaine in occupation:
+                code = occupation_semaine.semaine_code
+                capacites[code] = occupation_semaine.disponible_heures
+                non_planifies[code] = occupation_semaine.non_planifies
 
         # Unite pour conversion
         unite = UniteCharge.from_string(filters.unite)
@@ -263,33 +263,20 @@ class CreateAffectationUseCase:
                 "Aucune date ne correspond aux jours de recurrence specifies"
             )
 
-        # Verifier les conflits pour toutes les dates
+        # Verifier les conflits pour toutes les dates (une seule requete)
+        occupes = self.affectation_repo.find_creneaux_occupes(
+            [dto.utilisateur_id], dates_affectation[0], dates_affectation[-1]
+        )
         for date_aff in dates_affectation:
-            if self.affectation_repo.exists_for_utilisateur_and_date(
-                dto.utilisateur_id, date_aff
-            ):
+            if (dto.utilisateur_id, date_aff) in occupes:
                 raise AffectationConflictError(dto.utilisateur_id, date_aff)
 
-        # RG-PLN-007: Verifier conflit avec absences (CONGES, MALADIE, RTT, FORMATION)
-        # Si c'est une affectation réelle, vérifier qu'il n'y a pas d'absence ce jour-là
-        if self.chantier_repo:
-            CHANTIERS_ABSENCES = {'CONGES', 'MALADIE', 'RTT', 'FORMATION'}
-            chantier_cible = self.chantier_repo.find_by_id(dto.chantier_id)
-            if chantier_cible and chantier_cible.code not in CHANTIERS_ABSENCES:
-                # C'est une affectation réelle, vérifier absences
-                for date_aff in dates_affectation:
-                    affectations_jour = self.affectation_repo.find_by_utilisateur_and_date(
-                        dto.utilisateur_id, date_aff
-                    )
-                    for aff_existante in affectations_jour:
-                        chantier_existant = self.chantier_repo.find_by_id(aff_existante.chantier_id)
-                        if chantier_existant and chantier_existant.code in CHANTIERS_ABSENCES:
-                            raise AffectationConflictError(dto.utilisateur_id, date_aff)
+        # RG-PLN-007 (absences) : couvert par la verification ci-dessus,
+        # toute affectation existante sur une date cible etant un conflit.
 
-        # Creer les affectations
-        affectations = []
-        for date_aff in dates_affectation:
-            affectation = Affectation(
+        # Creer les affectations en un seul lot
+        affectations = self.affectation_repo.save_many([
+            Affectation(
                 utilisateur_id=dto.utilisateur_id,
                 chantier_id=dto.chantier_id,
                 date=date_aff,
@@ -300,8 +287,8 @@ class CreateAffectationUseCase:
                 jours_recurrence=jours_recurrence,
                 created_by=created_by,
             )
-            affectation = self.affectation_repo.save(affectation)
-            affectations.append(affectation)
+            for date_aff in dates_affectation
+        ])
 
         # Publier l'evenement bulk
         if self.event_bus and affectations:
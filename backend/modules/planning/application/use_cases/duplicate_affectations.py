@@ -1,12 +1,16 @@
 """Use Case DuplicateAffectations - Duplication d'affectations."""
 
-from datetime import timedelta
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
 
 from ...domain.entities import Affectation
 from ...domain.repositories import AffectationRepository
-from ...domain.events import AffectationBulkCreatedEvent
-from ..dtos import DuplicateAffectationsDTO
+from ...domain.events import AffectationBulkCreatedEvent, AffectationBulkDuplicatedEvent
+from ..dtos import (
+    DuplicateAffectationsDTO,
+    DuplicateAffectationsEquipeDTO,
+    DuplicationResultDTO,
+)
 from ..ports import EventBus
 from .exceptions import AffectationConflictError, NoAffectationsToDuplicateError
 
@@ -15,8 +19,12 @@ class DuplicateAffectationsUseCase:
     """
     Cas d'utilisation : Duplication d'affectations.
 
-    Copie les affectations d'un utilisateur d'une periode source
-    vers une periode cible en conservant la structure relative des jours.
+    Copie les affectations d'un utilisateur (ou d'une equipe) d'une periode
+    source vers une periode cible en conservant la structure relative des jours.
+
+    La duplication se fait en masse : les dates cibles sont calculees pour
+    toute la periode, les conflits detectes en une requete, et les nouvelles
+    affectations inserees en un seul lot.
 
     Selon CDC Section 5 - Planning Operationnel (PLN-13, PLN-14).
 
@@ -80,41 +88,14 @@ class DuplicateAffectationsUseCase:
                 dto.source_date_fin,
             )
 
-        # Calculer le decalage de jours
-        days_offset = dto.days_offset
+        copies = self._planifier(source_affectations, dto.days_offset, created_by)
 
-        # Verifier les conflits pour toutes les dates cibles
-        for affectation in source_affectations:
-            target_date = affectation.date + timedelta(days=days_offset)
-            if self.affectation_repo.exists_for_utilisateur_and_date(
-                dto.utilisateur_id, target_date
-            ):
-                raise AffectationConflictError(dto.utilisateur_id, target_date)
-
-        # Dupliquer les affectations
-        new_affectations = []
-        for affectation in source_affectations:
-            target_date = affectation.date + timedelta(days=days_offset)
-
-            # Utiliser la methode dupliquer de l'entite
-            new_affectation = affectation.dupliquer(target_date)
-
-            # Changer le createur
-            new_affectation = Affectation(
-                utilisateur_id=new_affectation.utilisateur_id,
-                chantier_id=new_affectation.chantier_id,
-                date=new_affectation.date,
-                heure_debut=new_affectation.heure_debut,
-                heure_fin=new_affectation.heure_fin,
-                note=new_affectation.note,
-                type_affectation=new_affectation.type_affectation,
-                jours_recurrence=new_affectation.jours_recurrence,
-                created_by=created_by,
-            )
+        # Verifier les conflits pour toutes les dates cibles (une requete)
+        conflits = self._detecter_conflits(copies)
+        if conflits:
+            raise AffectationConflictError(*conflits[0])
 
-            # Sauvegarder
-            new_affectation = self.affectation_repo.save(new_affectation)
-            new_affectations.append(new_affectation)
+        new_affectations = self.affectation_repo.save_many(copies)
 
         # Publier l'evenement bulk
         if self.event_bus and new_affectations:
@@ -136,3 +117,127 @@ class DuplicateAffectationsUseCase:
             self.event_bus.publish(event)
 
         return new_affectations
+
+    def execute_equipe(
+        self,
+        dto: DuplicateAffectationsEquipeDTO,
+        created_by: int,
+    ) -> DuplicationResultDTO:
+        """
+        Duplique les affectations d'une equipe sur une periode.
+
+        En mode dry_run, retourne les affectations prevues et les conflits
+        sans rien enregistrer ni publier.
+
+        Args:
+            dto: Les donnees de duplication d'equipe.
+            created_by: ID de l'utilisateur qui lance la duplication.
+
+        Returns:
+            Le resultat (affectations creees ou prevues, conflits).
+
+        Raises:
+            NoAffectationsToDuplicateError: Si aucune affectation source.
+            AffectationConflictError: Si conflit et ignorer_conflits=False
+                (hors dry_run).
+        """
+        utilisateur_ids = sorted(set(dto.utilisateur_ids))
+        source_affectations = self.affectation_repo.find_filtered(
+            dto.source_date_debut,
+            dto.source_date_fin,
+            utilisateur_ids=utilisateur_ids,
+            chantier_ids=list(dto.chantier_ids) if dto.chantier_ids is not None else None,
+        )
+
+        if not source_affectations:
+            raise NoAffectationsToDuplicateError(
+                utilisateur_ids[0],
+                dto.source_date_debut,
+                dto.source_date_fin,
+            )
+
+        copies = self._planifier(source_affectations, dto.days_offset, created_by)
+        conflits = self._detecter_conflits(copies)
+
+        if conflits and not dto.dry_run and not dto.ignorer_conflits:
+            raise AffectationConflictError(*conflits[0])
+
+        occupes = set(conflits)
+        copies = [a for a in copies if (a.utilisateur_id, a.date) not in occupes]
+
+        if dto.dry_run or not copies:
+            return DuplicationResultDTO(
+                affectations=copies, conflits=conflits, dry_run=dto.dry_run
+            )
+
+        new_affectations = self.affectation_repo.save_many(copies)
+
+        # Un seul evenement agrege pour toute la duplication
+        if self.event_bus and new_affectations:
+            target_dates = [a.date for a in new_affectations]
+            event = AffectationBulkDuplicatedEvent(
+                affectation_ids=tuple(a.id for a in new_affectations),
+                utilisateur_ids=tuple(sorted({a.utilisateur_id for a in new_affectations})),
+                chantier_ids=tuple(sorted({a.chantier_id for a in new_affectations})),
+                source_date_debut=dto.source_date_debut,
+                source_date_fin=dto.source_date_fin,
+                date_debut=min(target_dates),
+                date_fin=max(target_dates),
+                created_by=created_by,
+                count=len(new_affectations),
+                nb_conflits=len(conflits),
+            )
+            self.event_bus.publish(event)
+
+        return DuplicationResultDTO(affectations=new_affectations, conflits=conflits)
+
+    def _planifier(
+        self,
+        source_affectations: List[Affectation],
+        days_offset: int,
+        created_by: int,
+    ) -> List[Affectation]:
+        """
+        Calcule les affectations cibles (sans ID) a partir des sources.
+
+        Args:
+            source_affectations: Affectations de la periode source.
+            days_offset: Decalage en jours vers la periode cible.
+            created_by: ID du createur des copies.
+
+        Returns:
+            Liste des copies, dans l'ordre des sources.
+        """
+        copies = []
+        for affectation in source_affectations:
+            target_date = affectation.date + timedelta(days=days_offset)
+
+            # Utiliser la methode dupliquer de l'entite
+            copie = affectation.dupliquer(target_date)
+            copie.created_by = created_by
+            copies.append(copie)
+        return copies
+
+    def _detecter_conflits(
+        self,
+        copies: List[Affectation],
+    ) -> List[Tuple[int, date]]:
+        """
+        Detecte les dates cibles deja occupees en une seule requete.
+
+        Args:
+            copies: Affectations cibles prevues.
+
+        Returns:
+            Couples (utilisateur_id, date) en conflit, tries par date.
+        """
+        if not copies:
+            return []
+
+        cibles = {(a.utilisateur_id, a.date) for a in copies}
+        occupes = self.affectation_repo.find_creneaux_occupes(
+            sorted({uid for uid, _ in cibles}),
+            min(d for _, d in cibles),
+            max(d for _, d in cibles),
+        )
+        return sorted(cibles & occupes, key=lambda c: (c[1], c[0]))
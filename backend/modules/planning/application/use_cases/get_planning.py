@@ -1,6 +1,6 @@
 """Use Case GetPlanning - Recuperation du planning."""
 
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Set, Tuple
 
 from ...domain.entities import Affectation
 from ...domain.repositories import AffectationRepository
@@ -23,6 +23,8 @@ class GetPlanningUseCase:
         get_user_info: Fonction pour recuperer les infos utilisateur.
         get_chantier_info: Fonction pour recuperer les infos chantier.
         get_user_chantiers: Fonction pour recuperer les chantiers d'un chef.
+        get_users_info: Fonction pour recuperer les infos de plusieurs users.
+        get_chantiers_info: Fonction pour recuperer les infos de plusieurs chantiers.
     """
 
     def __init__(
@@ -31,6 +33,8 @@ class GetPlanningUseCase:
         get_user_info: Optional[Callable[[int], Dict[str, Any]]] = None,
         get_chantier_info: Optional[Callable[[int], Dict[str, Any]]] = None,
         get_user_chantiers: Optional[Callable[[int], List[int]]] = None,
+        get_users_info: Optional[Callable[[List[int]], Dict[int, Dict[str, Any]]]] = None,
+        get_chantiers_info: Optional[Callable[[List[int]], Dict[int, Dict[str, Any]]]] = None,
     ):
         """
         Initialise le use case.
@@ -40,11 +44,15 @@ class GetPlanningUseCase:
             get_user_info: Fonction pour recuperer nom, couleur, metier d'un user.
             get_chantier_info: Fonction pour recuperer nom, couleur d'un chantier.
             get_user_chantiers: Fonction pour recuperer les IDs chantiers d'un chef.
+            get_users_info: Variante par lot de get_user_info (une requete).
+            get_chantiers_info: Variante par lot de get_chantier_info (une requete).
         """
         self.affectation_repo = affectation_repo
         self.get_user_info = get_user_info
         self.get_chantier_info = get_chantier_info
         self.get_user_chantiers = get_user_chantiers
+        self.get_users_info = get_users_info
+        self.get_chantiers_info = get_chantiers_info
 
     def execute(
         self,
@@ -96,6 +104,9 @@ class GetPlanningUseCase:
         """
         Recupere les affectations selon les filtres et le role.
 
+        Le perimetre du role et les filtres d'IDs sont combines puis
+        appliques en base (un seul SELECT filtre sur la periode).
+
         Args:
             filters: Les filtres a appliquer.
             current_user_id: ID de l'utilisateur courant.
@@ -104,69 +115,78 @@ class GetPlanningUseCase:
         Returns:
             Liste des affectations filtrees.
         """
-        # Recuperer toutes les affectations de la periode
-        all_affectations = self.affectation_repo.find_by_date_range(
-            filters.date_debut, filters.date_fin
+        scope_users, scope_chantiers = self._get_role_scope(
+            current_user_id, current_user_role
         )
 
-        # Appliquer le filtre de role
-        affectations = self._filter_by_role(
-            all_affectations, current_user_id, current_user_role
+        utilisateur_ids = self._intersect(
+            scope_users,
+            filters.utilisateur_ids if filters.has_utilisateur_filter else None,
+        )
+        chantier_ids = self._intersect(
+            scope_chantiers,
+            filters.chantier_ids if filters.has_chantier_filter else None,
         )
 
-        # Appliquer le filtre utilisateur
-        if filters.has_utilisateur_filter:
-            affectations = [
-                a for a in affectations
-                if a.utilisateur_id in filters.utilisateur_ids
-            ]
-
-        # Appliquer le filtre chantier
-        if filters.has_chantier_filter:
-            affectations = [
-                a for a in affectations
-                if a.chantier_id in filters.chantier_ids
-            ]
-
-        return affectations
+        return self.affectation_repo.find_filtered(
+            filters.date_debut,
+            filters.date_fin,
+            utilisateur_ids=utilisateur_ids,
+            chantier_ids=chantier_ids,
+        )
 
-    def _filter_by_role(
+    def _get_role_scope(
         self,
-        affectations: List[Affectation],
         current_user_id: int,
         current_user_role: str,
-    ) -> List[Affectation]:
+    ) -> Tuple[Optional[List[int]], Optional[List[int]]]:
         """
-        Filtre les affectations selon le role de l'utilisateur.
+        Determine le perimetre visible selon le role de l'utilisateur.
 
         Args:
-            affectations: Liste des affectations a filtrer.
             current_user_id: ID de l'utilisateur courant.
             current_user_role: Role de l'utilisateur.
 
         Returns:
-            Liste filtree selon les droits.
+            Tuple (utilisateur_ids, chantier_ids) autorises, None = sans restriction.
         """
         role_lower = current_user_role.lower()
 
         # Admin et conducteur voient tout
         if role_lower in ("admin", "administrateur", "conducteur", "conducteur_travaux"):
-            return affectations
+            return None, None
 
         # Chef de chantier voit ses chantiers
         if role_lower in ("chef_chantier", "chef_equipe"):
             if self.get_user_chantiers:
-                chantier_ids = self.get_user_chantiers(current_user_id)
-                return [a for a in affectations if a.chantier_id in chantier_ids]
+                return None, list(self.get_user_chantiers(current_user_id))
             # Sans fonction, on retourne tout (fallback)
-            return affectations
+            return None, None
+
+        # Compagnon (ou role inconnu, par securite) voit uniquement son planning
+        return [current_user_id], None
+
+    @staticmethod
+    def _intersect(
+        scope: Optional[List[int]],
+        requested: Optional[List[int]],
+    ) -> Optional[List[int]]:
+        """
+        Combine un perimetre de role et un filtre demande.
 
-        # Compagnon voit uniquement son planning
-        if role_lower in ("compagnon", "ouvrier"):
-            return [a for a in affectations if a.utilisateur_id == current_user_id]
+        Args:
+            scope: IDs autorises par le role (None = sans restriction).
+            requested: IDs demandes par le filtre (None = pas de filtre).
 
-        # Role inconnu : ne voir que son planning (securite)
-        return [a for a in affectations if a.utilisateur_id == current_user_id]
+        Returns:
+            IDs a appliquer en base (None = aucun filtre).
+        """
+        if scope is None:
+            return list(requested) if requested is not None else None
+        if requested is None:
+            return list(scope)
+        requested_set = set(requested)
+        return [i for i in scope if i in requested_set]
 
     def _enrich_affectations(
         self,
@@ -181,9 +201,15 @@ class GetPlanningUseCase:
         Returns:
             Liste de DTOs enrichis.
         """
-        # Cache pour eviter les appels multiples
+        # Cache pour eviter les appels multiples, pre-rempli par lot si possible
         user_cache: Dict[int, Dict[str, Any]] = {}
         chantier_cache: Dict[int, Dict[str, Any]] = {}
+        self._prefetch(
+            self.get_users_info, {a.utilisateur_id for a in affectations}, user_cache
+        )
+        self._prefetch(
+            self.get_chantiers_info, {a.chantier_id for a in affectations}, chantier_cache
+        )
 
         dtos = []
         for affectation in affectations:
@@ -214,6 +240,29 @@ class GetPlanningUseCase:
 
         return dtos
 
+    @staticmethod
+    def _prefetch(
+        batch_fn: Optional[Callable[[List[int]], Dict[int, Dict[str, Any]]]],
+        ids: Set[int],
+        cache: Dict[int, Dict[str, Any]],
+    ) -> None:
+        """
+        Charge en une fois les infos d'un ensemble d'IDs dans le cache.
+
+        Les IDs absents du resultat sont memorises vides pour ne pas
+        declencher d'appel unitaire ensuite.
+
+        Args:
+            batch_fn: Fonction de recuperation par lot (optionnelle).
+            ids: IDs a charger.
+            cache: Cache a remplir.
+        """
+        if not batch_fn or not ids:
+            return
+        infos = batch_fn(sorted(ids)) or {}
+        for entity_id in ids:
+            cache[entity_id] = infos.get(entity_id) or {}
+
     def _get_cached_user_info(
         self,
         user_id: int,
@@ -20,6 +20,7 @@ from .affectation_events import (
     AffectationUpdatedEvent,
     AffectationDeletedEvent,
     AffectationBulkCreatedEvent,
+    AffectationBulkDuplicatedEvent,
     AffectationBulkDeletedEvent,
 )
 
@@ -32,5 +33,6 @@ __all__ = [
     "AffectationDeletedEvent",
     "AffectationCancelledEvent",
     "AffectationBulkCreatedEvent",
+    "AffectationBulkDuplicatedEvent",
     "AffectationBulkDeletedEvent",
 ]
@@ -230,6 +230,63 @@ class AffectationBulkCreatedEvent:
         }
 
 
+@dataclass(frozen=True)
+class AffectationBulkDuplicatedEvent:
+    """
+    Evenement emis une seule fois lors d'une duplication en masse.
+
+    Agrege toutes les affectations copiees pour une equipe et une periode
+    (PLN-13, PLN-14), au lieu d'un evenement par ligne ou par utilisateur.
+
+    Attributes:
+        affectation_ids: IDs des affectations creees.
+        utilisateur_ids: IDs des utilisateurs concernes.
+        chantier_ids: IDs des chantiers concernes.
+        source_date_debut: Date de debut de la periode source.
+        source_date_fin: Date de fin de la periode source.
+        date_debut: Premiere date cible creee.
+        date_fin: Derniere date cible creee.
+        created_by: ID de l'utilisateur qui a lance la duplication.
+        count: Nombre d'affectations creees.
+        nb_conflits: Nombre de dates ignorees car deja occupees.
+        timestamp: Moment de l'evenement.
+    """
+
+    affectation_ids: tuple  # Utilise tuple pour frozen=True
+    utilisateur_ids: tuple
+    chantier_ids: tuple
+    source_date_debut: date
+    source_date_fin: date
+    date_debut: date
+    date_fin: date
+    created_by: int
+    count: int
+    nb_conflits: int = 0
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convertit l'evenement en dictionnaire.
+
+        Returns:
+            Dictionnaire representant l'evenement.
+        """
+        return {
+            "event_type": "AffectationBulkDuplicated",
+            "affectation_ids": list(self.affectation_ids),
+            "utilisateur_ids": list(self.utilisateur_ids),
+            "chantier_ids": list(self.chantier_ids),
+            "source_date_debut": self.source_date_debut.isoformat(),
+            "source_date_fin": self.source_date_fin.isoformat(),
+            "date_debut": self.date_debut.isoformat(),
+            "date_fin": self.date_fin.isoformat(),
+            "created_by": self.created_by,
+            "count": self.count,
+            "nb_conflits": self.nb_conflits,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+
 @dataclass(frozen=True)
 class AffectationBulkDeletedEvent:
     """
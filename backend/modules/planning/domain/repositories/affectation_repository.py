@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Optional, List
+from typing import Optional, List, Set, Tuple
 
 from ..entities import Affectation
 
@@ -36,6 +36,22 @@ class AffectationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_many(self, affectations: List[Affectation]) -> List[Affectation]:
+        """
+        Persiste plusieurs nouvelles affectations en un seul lot.
+
+        Utilise pour la duplication et l'expansion des recurrences
+        (PLN-13, PLN-14) : une seule insertion et un seul commit.
+
+        Args:
+            affectations: Les nouvelles affectations (sans ID).
+
+        Returns:
+            Les affectations creees avec leur ID, dans le meme ordre.
+        """
+        pass
+
     @abstractmethod
     def find_by_id(self, id: int) -> Optional[Affectation]:
         """
@@ -113,6 +129,54 @@ class AffectationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_filtered(
+        self,
+        date_debut: date,
+        date_fin: date,
+        utilisateur_ids: Optional[List[int]] = None,
+        chantier_ids: Optional[List[int]] = None,
+    ) -> List[Affectation]:
+        """
+        Trouve les affectations d'une periode avec filtres appliques en base.
+
+        Utilise pour le planning filtre par role et par IDs (PLN-01 a PLN-03).
+        None signifie "pas de filtre" ; une liste vide ne correspond a rien.
+
+        Args:
+            date_debut: Date de debut de la periode (incluse).
+            date_fin: Date de fin de la periode (incluse).
+            utilisateur_ids: IDs utilisateurs autorises (optionnel).
+            chantier_ids: IDs chantiers autorises (optionnel).
+
+        Returns:
+            Liste des affectations correspondantes, triees par date et utilisateur.
+        """
+        pass
+
+    @abstractmethod
+    def find_creneaux_occupes(
+        self,
+        utilisateur_ids: List[int],
+        date_debut: date,
+        date_fin: date,
+    ) -> Set[Tuple[int, date]]:
+        """
+        Trouve les couples (utilisateur, date) deja affectes sur une periode.
+
+        Detection des conflits en masse (PLN-12) en une seule requete,
+        au lieu d'un exists_for_utilisateur_and_date par date cible.
+
+        Args:
+            utilisateur_ids: IDs des utilisateurs a verifier.
+            date_debut: Date de debut de la periode (incluse).
+            date_fin: Date de fin de la periode (incluse).
+
+        Returns:
+            Ensemble des couples (utilisateur_id, date) occupes.
+        """
+        pass
+
     @abstractmethod
     def find_by_utilisateur_and_date(
         self,
@@ -1,7 +1,7 @@
 """Implementation SQLAlchemy du AffectationRepository."""
 
 from datetime import date
-from typing import Optional, List
+from typing import Optional, List, Set, Tuple
 
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
@@ -76,6 +76,29 @@ class SQLAlchemyAffectationRepository(AffectationRepository):
         self.session.refresh(model)
         return self._to_entity(model)
 
+    def save_many(self, affectations: List[Affectation]) -> List[Affectation]:
+        """
+        Persiste plusieurs nouvelles affectations en un seul lot.
+
+        Les IDs et valeurs par defaut sont recuperes au flush (insertion
+        groupee), sans refresh ligne par ligne apres le commit.
+
+        Args:
+            affectations: Les nouvelles affectations (sans ID).
+
+        Returns:
+            Les affectations creees avec leur ID, dans le meme ordre.
+        """
+        if not affectations:
+            return []
+
+        models = [self._to_model(a) for a in affectations]
+        self.session.add_all(models)
+        self.session.flush()
+        created = [self._to_entity(m) for m in models]
+        self.session.commit()
+        return created
+
     def find_by_id(self, id: int) -> Optional[Affectation]:
         """
         Trouve une affectation par son ID.
@@ -187,6 +210,80 @@ class SQLAlchemyAffectationRepository(AffectationRepository):
         )
         return [self._to_entity(m) for m in models]
 
+    def find_filtered(
+        self,
+        date_debut: date,
+        date_fin: date,
+        utilisateur_ids: Optional[List[int]] = None,
+        chantier_ids: Optional[List[int]] = None,
+    ) -> List[Affectation]:
+        """
+        Trouve les affectations d'une periode avec filtres appliques en base.
+
+        Args:
+            date_debut: Date de debut de la periode (incluse).
+            date_fin: Date de fin de la periode (incluse).
+            utilisateur_ids: IDs utilisateurs autorises (None = tous).
+            chantier_ids: IDs chantiers autorises (None = tous).
+
+        Returns:
+            Liste des affectations correspondantes.
+        """
+        if utilisateur_ids is not None and not utilisateur_ids:
+            return []
+        if chantier_ids is not None and not chantier_ids:
+            return []
+
+        query = self.session.query(AffectationModel).filter(
+            and_(
+                AffectationModel.date >= date_debut,
+                AffectationModel.date <= date_fin,
+            )
+        )
+        if utilisateur_ids is not None:
+            query = query.filter(AffectationModel.utilisateur_id.in_(utilisateur_ids))
+        if chantier_ids is not None:
+            query = query.filter(AffectationModel.chantier_id.in_(chantier_ids))
+
+        models = query.order_by(
+            AffectationModel.date,
+            AffectationModel.utilisateur_id,
+            AffectationModel.heure_debut,
+        ).all()
+        return [self._to_entity(m) for m in models]
+
+    def find_creneaux_occupes(
+        self,
+        utilisateur_ids: List[int],
+        date_debut: date,
+        date_fin: date,
+    ) -> Set[Tuple[int, date]]:
+        """
+        Trouve les couples (utilisateur, date) deja affectes sur une periode.
+
+        Args:
+            utilisateur_ids: IDs des utilisateurs a verifier.
+            date_debut: Date de debut de la periode (incluse).
+            date_fin: Date de fin de la periode (incluse).
+
+        Returns:
+            Ensemble des couples (utilisateur_id, date) occupes.
+        """
+        if not utilisateur_ids:
+            return set()
+
+        rows = (
+            self.session.query(AffectationModel.utilisateur_id, AffectationModel.date)
+            .filter(
+                AffectationModel.utilisateur_id.in_(utilisateur_ids),
+                AffectationModel.date >= date_debut,
+                AffectationModel.date <= date_fin,
+            )
+            .distinct()
+            .all()
+        )
+        return {(utilisateur_id, jour) for utilisateur_id, jour in rows}
+
     def find_by_utilisateur_and_date(
         self,
         utilisateur_id: int,
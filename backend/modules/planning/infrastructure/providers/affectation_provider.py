@@ -3,13 +3,20 @@
 from typing import Dict, List, Tuple
 from datetime import date, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import case, column, distinct, func, table, text
 
+from ...application.dtos.charge import OccupationSemaineDTO
 from ...application.use_cases.charge.get_planning_charge import AffectationProvider
 from ...application.use_cases.charge.get_occupation_details import AffectationProviderForOccupation
 from ...domain.value_objects import Semaine
 
-from shared.infrastructure.user_queries import count_active_users
+from shared.infrastructure.user_queries import count_users_by_presence_period
+
+# RG-PLN-007: chantiers systeme representant une absence
+CHANTIERS_ABSENCES = ('CONGES', 'MALADIE', 'RTT', 'FORMATION')
+
+# Table chantiers reduite aux colonnes utiles (evite l'import de ChantierModel)
+_chantiers = table("chantiers", column("id"), column("code"))
 
 
 class SQLAlchemyAffectationProvider(AffectationProvider, AffectationProviderForOccupation):
@@ -34,6 +41,9 @@ class SQLAlchemyAffectationProvider(AffectationProvider, AffectationProviderForO
             session: Session SQLAlchemy.
         """
         self.session = session
+        # Serie d'occupation memorisee par horizon (le provider vit le temps
+        # d'une requete HTTP, la serie sert au footer et aux details)
+        self._occupation_cache: Dict[Tuple[str, str], List[OccupationSemaineDTO]] = {}
 
     # =========================================================================
     # Implementation AffectationProvider (get_planning_charge)
@@ -97,7 +107,7 @@ class SQLAlchemyAffectationProvider(AffectationProvider, AffectationProviderForO
         """
         Calcule la capacite disponible par semaine.
 
-        La capacite = nombre_utilisateurs_actifs * heures_travail_semaine.
+        La capacite = effectif present sur la semaine * heures_travail_semaine.
 
         Args:
             semaine_debut: Premiere semaine.
@@ -106,16 +116,10 @@ class SQLAlchemyAffectationProvider(AffectationProvider, AffectationProviderForO
         Returns:
             Dict {semaine_code: capacite_heures}.
         """
-        # Use shared helper instead of UserModel
-        count_actifs = count_active_users(self.session)
-
-        # Generer les semaines
-        semaines = self._generate_semaines(semaine_debut, semaine_fin)
-
-        # Capacite = nb utilisateurs * 35h pour chaque semaine
-        capacite = count_actifs * self.HEURES_PAR_SEMAINE
-
-        return {s.code: capacite for s in semaines}
+        return {
+            o.semaine_code: o.capacite_heures
+            for o in self.get_occupation_par_semaine(semaine_debut, semaine_fin)
+        }
 
     def get_utilisateurs_non_planifies_par_semaine(
         self,
@@ -132,29 +136,109 @@ class SQLAlchemyAffectationProvider(AffectationProvider, AffectationProviderForO
         Returns:
             Dict {semaine_code: nombre_non_planifies}.
         """
+        return {
+            o.semaine_code: o.non_planifies
+            for o in self.get_occupation_par_semaine(semaine_debut, semaine_fin)
+        }
+
+    def get_occupation_par_semaine(
+        self,
+        semaine_debut: Semaine,
+        semaine_fin: Semaine,
+    ) -> List[OccupationSemaineDTO]:
+        """
+        Calcule la serie d'occupation hebdomadaire sur l'horizon.
+
+        Le nombre de requetes ne depend pas de la longueur de l'horizon :
+        une requete groupee par semaine sur les affectations (planifies,
+        jours d'absence) et une requete groupee sur les periodes de
+        presence des utilisateurs (effectif).
+
+        Args:
+            semaine_debut: Premiere semaine.
+            semaine_fin: Derniere semaine.
+
+        Returns:
+            Liste de OccupationSemaineDTO, une par semaine, dans l'ordre.
+        """
+        cle = (semaine_debut.code, semaine_fin.code)
+        if cle in self._occupation_cache:
+            return self._occupation_cache[cle]
+
         semaines = self._generate_semaines(semaine_debut, semaine_fin)
+        if not semaines:
+            return []
+        bornes = [s.date_range() for s in semaines]
+
+        affectations_par_semaine = self._compter_affectations_par_semaine(bornes)
+        presences = count_users_by_presence_period(self.session, bornes[0][0])
+
+        occupation = []
+        for index, (semaine, (debut, fin)) in enumerate(zip(semaines, bornes)):
+            effectif = sum(
+                count
+                for entree, sortie, count in presences
+                if entree <= fin and (sortie is None or sortie >= debut)
+            )
+            planifies, jours_absence = affectations_par_semaine.get(index, (0, 0))
+            occupation.append(OccupationSemaineDTO(
+                semaine_code=semaine.code,
+                effectif=effectif,
+                utilisateurs_planifies=planifies,
+                jours_absence=jours_absence,
+                capacite_heures=effectif * self.HEURES_PAR_SEMAINE,
+                absences_heures=jours_absence * self.HEURES_PAR_JOUR,
+            ))
+
+        self._occupation_cache[cle] = occupation
+        return occupation
+
+    def _compter_affectations_par_semaine(
+        self,
+        bornes: List[Tuple[date, date]],
+    ) -> Dict[int, Tuple[int, int]]:
+        """
+        Compte planifies et jours d'absence par semaine en une requete.
 
-        # Total active users via shared helper
-        total_actifs = count_active_users(self.session)
+        Les semaines sont numerotees par un CASE sur leurs bornes, ce qui
+        reste portable entre SQLite et PostgreSQL.
 
-        result = {}
-        for semaine in semaines:
-            date_debut, date_fin = semaine.date_range()
+        Args:
+            bornes: (lundi, dimanche) de chaque semaine, dans l'ordre.
 
-            # Count distinct users with affectations this week (raw SQL)
-            utilisateurs_planifies = self.session.execute(
-                text(
-                    "SELECT COUNT(DISTINCT utilisateur_id) FROM affectations "
-                    "WHERE date >= :debut AND date <= :fin"
-                ),
-                {"debut": date_debut, "fin": date_fin},
-            ).scalar() or 0
+        Returns:
+            Dict {index_semaine: (utilisateurs_planifies, jours_absence)}.
+        """
+        from ..persistence import AffectationModel
 
-            # Non planifies = total - planifies
-            non_planifies = max(total_actifs - utilisateurs_planifies, 0)
-            result[semaine.code] = non_planifies
+        index_semaine = case(
+            *[
+                (AffectationModel.date.between(debut, fin), index)
+                for index, (debut, fin) in enumerate(bornes)
+            ],
+            else_=-1,
+        ).label("index_semaine")
+        est_absence = _chantiers.c.code.in_(CHANTIERS_ABSENCES)
+
+        rows = self.session.query(
+            index_semaine,
+            func.count(distinct(AffectationModel.utilisateur_id)),
+            func.sum(case((est_absence, 1), else_=0)),
+        ).outerjoin(
+            _chantiers, _chantiers.c.id == AffectationModel.chantier_id,
+        ).filter(
+            AffectationModel.date >= bornes[0][0],
+            AffectationModel.date <= bornes[-1][1],
+        ).group_by(
+            # Regroupement par alias : PostgreSQL ne reconnait pas deux CASE
+            # parametres comme la meme expression
+            text("index_semaine"),
+        ).all()
 
-        return result
+        return {
+            index: (planifies or 0, int(jours_absence or 0))
+            for index, planifies, jours_absence in rows
+        }
 
     # =========================================================================
     # Implementation AffectationProviderForOccupation (get_occupation_details)
@@ -198,6 +282,21 @@ class SQLAlchemyAffectationProvider(AffectationProvider, AffectationProviderForO
 
         return heures_par_type
 
+    def get_occupation_semaine(
+        self,
+        semaine: Semaine,
+    ) -> OccupationSemaineDTO:
+        """
+        Recupere l'occupation globale d'une semaine.
+
+        Args:
+            semaine: La semaine.
+
+        Returns:
+            OccupationSemaineDTO de la semaine.
+        """
+        return self.get_occupation_par_semaine(semaine, semaine)[0]
+
     # =========================================================================
     # Methodes utilitaires
     # =========================================================================
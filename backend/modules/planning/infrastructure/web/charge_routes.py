@@ -5,7 +5,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
-from shared.infrastructure.database import get_db
+from shared.infrastructure.database import get_db, session_for
 from shared.infrastructure.cache import cache_manager
 from shared.infrastructure.web.dependencies import (
     get_current_user_id,
@@ -73,15 +73,13 @@ def get_audit_service(db: Session = Depends(get_db)) -> AuditService:
     return AuditService(db)
 
 
-def get_controller(db: Session = Depends(get_db)) -> PlanningChargeController:
+def build_charge_controller(db: Session) -> PlanningChargeController:
     """
-    Factory pour le controller avec injection de dependances.
-
     Construit le controller avec toutes ses dependances (repositories,
     providers, use cases) pour les endpoints du planning de charge.
 
     Args:
-        db: Session de base de donnees injectee par FastAPI.
+        db: Session de base de donnees.
 
     Returns:
         Instance du PlanningChargeController completement configuree.
@@ -119,6 +117,37 @@ def get_controller(db: Session = Depends(get_db)) -> PlanningChargeController:
     )
 
 
+def get_controller(db: Session = Depends(get_db)) -> PlanningChargeController:
+    """
+    Factory pour le controller avec injection de dependances.
+
+    Args:
+        db: Session de base de donnees injectee par FastAPI.
+
+    Returns:
+        Instance du PlanningChargeController completement configuree.
+    """
+    return build_charge_controller(db)
+
+
+def get_read_controller(
+    db: Session = Depends(session_for(GetPlanningChargeUseCase)),
+) -> PlanningChargeController:
+    """
+    Factory du controller pour les endpoints de lecture.
+
+    Les use cases de lecture du planning de charge sont marques read_only :
+    la session vient du replica de lecture s'il est configure.
+
+    Args:
+        db: Session de lecture injectee par FastAPI.
+
+    Returns:
+        Instance du PlanningChargeController completement configuree.
+    """
+    return build_charge_controller(db)
+
+
 # =============================================================================
 # ENDPOINTS LECTURE (Chef de chantier+)
 # =============================================================================
@@ -137,7 +166,7 @@ def get_planning_charge(
     mode_avance: bool = Query(False, description="Mode avance"),
     unite: str = Query("heures", description="Unite: heures ou jours_homme"),
     _role: str = Depends(require_chef_or_above),  # RBAC: Chef+ peut voir
-    controller: PlanningChargeController = Depends(get_controller),
+    controller: PlanningChargeController = Depends(get_read_controller),
 ) -> PlanningChargeResponse:
     """
     Endpoint principal du planning de charge.
@@ -175,7 +204,7 @@ def get_planning_charge(
 def get_occupation_details(
     semaine_code: str,
     _role: str = Depends(require_chef_or_above),  # RBAC: Chef+ peut voir
-    controller: PlanningChargeController = Depends(get_controller),
+    controller: PlanningChargeController = Depends(get_read_controller),
 ) -> OccupationDetailsResponse:
     """
     Modal details occupation.
@@ -204,7 +233,7 @@ def get_besoins_by_chantier(
     page: int = Query(1, ge=1, description="Numero de page"),
     page_size: int = Query(50, ge=1, le=100, description="Taille de la page"),
     _role: str = Depends(require_chef_or_above),  # RBAC: Chef+ peut voir
-    controller: PlanningChargeController = Depends(get_controller),
+    controller: PlanningChargeController = Depends(get_read_controller),
 ) -> ListeBesoinResponse:
     """
     Recupere les besoins pour un chantier specifique.
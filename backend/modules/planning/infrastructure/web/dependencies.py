@@ -8,7 +8,7 @@ ARCHITECTURE CLEAN RESPECTEE:
 - EventBus actif pour la communication par evenements
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from fastapi import Depends
 from sqlalchemy.orm import Session
@@ -165,6 +165,32 @@ def _wrap_chantier_info(entity_info: EntityInfoService):
     return get_chantier_info
 
 
+def _wrap_users_info(entity_info: EntityInfoService):
+    """Wrap EntityInfoService.get_users_info (lot) pour retourner des dicts."""
+    def get_users_info(user_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        return {
+            user_id: {
+                "nom": info.nom,
+                "couleur": info.couleur,
+                "metier": info.metier,
+                "role": info.role,
+                "type_utilisateur": info.type_utilisateur,
+            }
+            for user_id, info in entity_info.get_users_info(user_ids).items()
+        }
+    return get_users_info
+
+
+def _wrap_chantiers_info(entity_info: EntityInfoService):
+    """Wrap EntityInfoService.get_chantiers_info (lot) pour retourner des dicts."""
+    def get_chantiers_info(chantier_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        return {
+            chantier_id: {"nom": info.nom, "couleur": info.couleur}
+            for chantier_id, info in entity_info.get_chantiers_info(chantier_ids).items()
+        }
+    return get_chantiers_info
+
+
 def get_get_planning_use_case(
     affectation_repo: SQLAlchemyAffectationRepository = Depends(get_affectation_repository),
     entity_info: EntityInfoService = Depends(get_entity_info),
@@ -175,13 +201,16 @@ def get_get_planning_use_case(
     Note: L'enrichissement reste dans le Use Case car le filtre
     par metier necessite cette information. C'est un compromis
     documente pour eviter une refactorisation majeure.
-    Les infos sont recuperees via le service shared EntityInfoService.
+    Les infos sont recuperees via le service shared EntityInfoService,
+    par lot (une requete users + une requete chantiers par appel).
     """
     return GetPlanningUseCase(
         affectation_repo=affectation_repo,
         get_user_info=_wrap_user_info(entity_info),
         get_chantier_info=_wrap_chantier_info(entity_info),
         get_user_chantiers=entity_info.get_user_chantier_ids,
+        get_users_info=_wrap_users_info(entity_info),
+        get_chantiers_info=_wrap_chantiers_info(entity_info),
     )
 
 
@@ -253,3 +282,32 @@ def get_planning_controller(
         resize_affectation_uc=resize_uc,
         presenter=presenter,
     )
+
+
+def build_planning_controller(db: Session) -> PlanningController:
+    """
+    Construit le controller du planning sur une session donnee.
+
+    Utilise par les routes asynchrones (get_async_db), qui executent le
+    controller dans run_in_session au lieu de passer par Depends(get_db).
+
+    Args:
+        db: Session SQLAlchemy synchrone.
+
+    Returns:
+        Instance du PlanningController.
+    """
+    affectation_repo = get_affectation_repository(db)
+    event_bus = get_event_bus()
+    entity_info = get_entity_info(db)
+    return get_planning_controller(
+        create_uc=get_create_affectation_use_case(affectation_repo, event_bus),
+        update_uc=get_update_affectation_use_case(affectation_repo, event_bus),
+        update_note_uc=get_update_affectation_note_use_case(affectation_repo, event_bus),
+        delete_uc=get_delete_affectation_use_case(affectation_repo, event_bus),
+        get_planning_uc=get_get_planning_use_case(affectation_repo, entity_info),
+        duplicate_uc=get_duplicate_affectations_use_case(affectation_repo, event_bus),
+        get_non_planifies_uc=get_get_non_planifies_use_case(affectation_repo, entity_info),
+        resize_uc=get_resize_affectation_use_case(affectation_repo),
+        presenter=get_affectation_presenter(entity_info),
+    )
@@ -8,7 +8,8 @@ import logging
 from datetime import date
 from typing import Optional, List
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,8 @@ from ...adapters.controllers.planning_schemas import (
     AffectationResponse,
     PlanningFiltersRequest,
     DuplicateAffectationsRequest,
+    DuplicateAffectationsEquipeRequest,
+    DuplicationEquipeResponse,
     DeleteResponse,
     NonPlanifiesResponse,
     ResizeAffectationRequest,
@@ -33,8 +36,10 @@ from ...application.use_cases import (
     UtilisateurInactifError,
 )
 from ...domain.events.affectation_created import AffectationCreatedEvent
-from .dependencies import get_planning_controller, get_entity_info
+from .dependencies import build_planning_controller, get_planning_controller, get_entity_info
+from shared.infrastructure.database import get_async_db, run_in_session
 from shared.infrastructure.web import get_current_user_id, get_current_user_role
+from shared.infrastructure.web.etag import ETAG_CACHE_CONTROL, compute_etag, etag_matches
 from shared.infrastructure.event_bus.dependencies import get_event_bus
 from shared.infrastructure.event_bus import EventBus
 from shared.application.ports import EntityInfoService
@@ -138,9 +143,12 @@ async def create_affectation(
     summary="Recuperer le planning",
     responses={
         200: {"description": "Liste des affectations"},
+        304: {"description": "Planning inchange depuis l'ETag fourni"},
     },
 )
-def get_planning(
+async def get_planning(
+    request: Request,
+    response: Response,
     date_debut: date = Query(..., description="Date de debut de la periode"),
     date_fin: date = Query(..., description="Date de fin de la periode"),
     utilisateur_ids: Optional[List[int]] = Query(
@@ -152,7 +160,7 @@ def get_planning(
     metiers: Optional[List[str]] = Query(None, description="Filtrer par metiers"),
     current_user_id: int = Depends(get_current_user_id),
     current_user_role: str = Depends(get_current_user_role),
-    controller: PlanningController = Depends(get_planning_controller),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Recupere le planning pour une periode (PLN-01 a PLN-03).
@@ -162,7 +170,12 @@ def get_planning(
     - **Chef de chantier**: Voit uniquement ses chantiers.
     - **Compagnon**: Voit uniquement son planning.
 
+    La reponse porte un ETag : un client qui renvoie If-None-Match avec
+    l'ETag recu recoit 304 Not Modified si le planning n'a pas change.
+
     Args:
+        request: Requete HTTP (en-tete If-None-Match).
+        response: Reponse HTTP (en-tetes ETag / Cache-Control).
         date_debut: Date de debut de la periode (incluse).
         date_fin: Date de fin de la periode (incluse).
         utilisateur_ids: Liste d'IDs utilisateurs a filtrer (optionnel).
@@ -170,7 +183,7 @@ def get_planning(
         metiers: Liste de metiers a filtrer (optionnel).
         current_user_id: ID de l'utilisateur connecte.
         current_user_role: Role de l'utilisateur.
-        controller: Controller du planning.
+        db: Session asynchrone (lecture hors du pool de threads).
 
     Returns:
         Liste des affectations avec enrichissement (noms, couleurs).
@@ -185,7 +198,12 @@ def get_planning(
             planifies_only=False,
             non_planifies_only=False,
         )
-        return controller.get_planning(filters, current_user_id, current_user_role)
+        affectations = await run_in_session(
+            db,
+            lambda session: build_planning_controller(session).get_planning(
+                filters, current_user_id, current_user_role
+            ),
+        )
     except Exception as e:
         logger.exception(f"Erreur lors du chargement du planning: {e}")
         raise HTTPException(
@@ -193,6 +211,16 @@ def get_planning(
             detail="Erreur lors du chargement du planning"
         )
 
+    etag = compute_etag(affectations)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL},
+        )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = ETAG_CACHE_CONTROL
+    return affectations
+
 
 @router.get(
     "/affectations/{affectation_id}",
@@ -584,6 +612,63 @@ def duplicate_affectations(
         )
 
 
+@router.post(
+    "/affectations/duplicate-equipe",
+    response_model=DuplicationEquipeResponse,
+    summary="Dupliquer les affectations d'une equipe",
+    responses={
+        200: {"description": "Affectations dupliquees (ou apercu si dry_run)"},
+        400: {"description": "Conflit ou aucune affectation source"},
+        403: {"description": "Non autorise"},
+    },
+)
+def duplicate_affectations_equipe(
+    request: DuplicateAffectationsEquipeRequest,
+    current_user_id: int = Depends(get_current_user_id),
+    current_user_role: str = Depends(get_current_user_role),
+    controller: PlanningController = Depends(get_planning_controller),
+):
+    """
+    Duplique en masse les affectations d'une equipe (PLN-13, PLN-14).
+
+    Les conflits sont detectes en une requete et les affectations inserees
+    en un seul lot. Avec dry_run=true, retourne l'apercu sans rien creer.
+
+    Seuls les admin et conducteur peuvent dupliquer des affectations.
+
+    Args:
+        request: Donnees de duplication d'equipe.
+        current_user_id: ID de l'utilisateur connecte.
+        current_user_role: Role de l'utilisateur.
+        controller: Controller du planning.
+
+    Returns:
+        Affectations creees (ou prevues) et conflits detectes.
+
+    Raises:
+        HTTPException 400: Conflit avec affectation existante ou aucune source.
+        HTTPException 403: Utilisateur non autorise.
+    """
+    if current_user_role not in ("admin", "conducteur"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Seuls les admin et conducteur peuvent dupliquer des affectations",
+        )
+
+    try:
+        return controller.duplicate_equipe(request, current_user_id)
+    except NoAffectationsToDuplicateError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        )
+    except AffectationConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        )
+
+
 # =============================================================================
 # Routes utilisateurs non planifies (PLN-10)
 # =============================================================================
@@ -1,7 +1,9 @@
 """Controller pour les pointages et feuilles d'heures."""
 
+import io
+import zipfile
 from datetime import date
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from ...application import (
     CreatePointageUseCase,
@@ -24,6 +26,7 @@ from ...application import (
     CompareEquipesUseCase,
     BulkValidatePointagesUseCase,
     GenerateMonthlyRecapUseCase,
+    GenerateMonthlyRecapBatchUseCase,
     LockMonthlyPeriodUseCase,
 )
 from ...application.dtos import (
@@ -41,6 +44,8 @@ from ...application.dtos import (
     FormatExport,
     BulkValidatePointagesDTO,
     GenerateMonthlyRecapDTO,
+    GenerateMonthlyRecapBatchDTO,
+    MonthlyRecapDTO,
     LockMonthlyPeriodDTO,
 )
 from ...domain.repositories import (
@@ -49,6 +54,8 @@ from ...domain.repositories import (
     VariablePaieRepository,
 )
 from ...application.ports import EventBus
+from shared.application.ports import PdfGeneratorPort
+from shared.application.ports.entity_info_service import EntityInfoService
 
 
 class PointageController:
@@ -64,7 +71,8 @@ class PointageController:
         feuille_repo: FeuilleHeuresRepository,
         variable_repo: VariablePaieRepository,
         event_bus: Optional[EventBus] = None,
-        entity_info_service: Optional["EntityInfoService"] = None,
+        entity_info_service: Optional[EntityInfoService] = None,
+        pdf_generator: Optional[PdfGeneratorPort] = None,
     ):
         """
         Initialise le controller.
@@ -75,6 +83,7 @@ class PointageController:
             variable_repo: Repository des variables de paie.
             event_bus: Bus d'événements (optionnel).
             entity_info_service: Service pour enrichir les données (noms utilisateurs/chantiers).
+            pdf_generator: Générateur PDF des récapitulatifs mensuels (optionnel).
         """
         self.pointage_repo = pointage_repo
         self.feuille_repo = feuille_repo
@@ -105,7 +114,12 @@ class PointageController:
         self._export_uc = ExportFeuilleHeuresUseCase(feuille_repo, pointage_repo, event_bus)
         self._jauge_uc = GetJaugeAvancementUseCase(pointage_repo)
         self._bulk_validate_uc = BulkValidatePointagesUseCase(pointage_repo, event_bus)
-        self._monthly_recap_uc = GenerateMonthlyRecapUseCase(pointage_repo, variable_repo)
+        self._monthly_recap_uc = GenerateMonthlyRecapUseCase(
+            pointage_repo, variable_repo, entity_info_service, pdf_generator
+        )
+        self._monthly_recap_batch_uc = GenerateMonthlyRecapBatchUseCase(
+            self._monthly_recap_uc
+        )
         self._lock_period_uc = LockMonthlyPeriodUseCase(event_bus)
         self._compare_uc = CompareEquipesUseCase(pointage_repo)
 
@@ -163,6 +177,16 @@ class PointageController:
         result = self._get_uc.execute(pointage_id)
         return self._pointage_to_dict(result) if result else None
 
+    def get_pointages_chantier_ids(self, pointage_ids: List[int]) -> Dict[int, int]:
+        """Récupère le chantier de plusieurs pointages (une requête).
+
+        Returns:
+            Dictionnaire {pointage_id: chantier_id} des pointages trouvés.
+        """
+        return {
+            p.id: p.chantier_id for p in self.pointage_repo.find_by_ids(pointage_ids)
+        }
+
     def list_pointages(
         self,
         utilisateur_id: Optional[int] = None,
@@ -656,7 +680,7 @@ class PointageController:
         }
 
     def generate_monthly_recap(
-        self, utilisateur_id: int, year: int, month: int, export_pdf: bool = False
+        self, utilisateur_id: int, year: int, month: int
     ) -> Dict[str, Any]:
         """
         Génère un récapitulatif mensuel (GAP-FDH-008).
@@ -665,16 +689,88 @@ class PointageController:
             utilisateur_id: ID de l'utilisateur.
             year: Année.
             month: Mois.
-            export_pdf: True pour générer un PDF.
 
         Returns:
             Dictionnaire avec le récapitulatif complet.
         """
+        dto = GenerateMonthlyRecapDTO(utilisateur_id=utilisateur_id, year=year, month=month)
+        result = self._monthly_recap_uc.execute(dto)
+        return self._format_monthly_recap(result)
+
+    def export_monthly_recap_pdf(
+        self, utilisateur_id: int, year: int, month: int
+    ) -> Tuple[bytes, str]:
+        """
+        Génère le PDF d'un récapitulatif mensuel (GAP-FDH-008).
+
+        Args:
+            utilisateur_id: ID de l'utilisateur.
+            year: Année.
+            month: Mois.
+
+        Returns:
+            Tuple (contenu PDF, nom de fichier).
+
+        Raises:
+            ValueError: Si l'export PDF n'est pas disponible.
+        """
         dto = GenerateMonthlyRecapDTO(
-            utilisateur_id=utilisateur_id, year=year, month=month, export_pdf=export_pdf
+            utilisateur_id=utilisateur_id, year=year, month=month, export_pdf=True
         )
         result = self._monthly_recap_uc.execute(dto)
+        if result.pdf_content is None:
+            raise ValueError("Export PDF des récapitulatifs indisponible")
+        return result.pdf_content, result.pdf_filename
+
+    def generate_monthly_recaps_batch(self, year: int, month: int) -> Dict[str, Any]:
+        """
+        Génère les récapitulatifs mensuels de tous les utilisateurs ayant pointé.
 
+        Args:
+            year: Année.
+            month: Mois.
+
+        Returns:
+            Dictionnaire avec un récapitulatif par utilisateur.
+        """
+        dto = GenerateMonthlyRecapBatchDTO(year=year, month=month)
+        result = self._monthly_recap_batch_uc.execute(dto)
+
+        return {
+            "year": result.year,
+            "month": result.month,
+            "month_label": result.month_label,
+            "total": len(result.recaps),
+            "recaps": [self._format_monthly_recap(recap) for recap in result.recaps],
+        }
+
+    def export_monthly_recaps_zip(self, year: int, month: int) -> Tuple[bytes, str]:
+        """
+        Génère les PDF des récapitulatifs du mois, regroupés dans une archive ZIP.
+
+        Args:
+            year: Année.
+            month: Mois.
+
+        Returns:
+            Tuple (contenu ZIP, nom de fichier), un PDF par utilisateur.
+
+        Raises:
+            ValueError: Si l'export PDF n'est pas disponible.
+        """
+        dto = GenerateMonthlyRecapBatchDTO(year=year, month=month, export_pdf=True)
+        result = self._monthly_recap_batch_uc.execute(dto)
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for recap in result.recaps:
+                if recap.pdf_content is None:
+                    raise ValueError("Export PDF des récapitulatifs indisponible")
+                archive.writestr(recap.pdf_filename, recap.pdf_content)
+        return buffer.getvalue(), f"recaps_mensuels_{year}_{month:02d}.zip"
+
+    def _format_monthly_recap(self, result: MonthlyRecapDTO) -> Dict[str, Any]:
+        """Formate un récapitulatif mensuel pour l'API."""
         return {
             "utilisateur_id": result.utilisateur_id,
             "utilisateur_nom": result.utilisateur_nom,
@@ -725,7 +821,6 @@ class PointageController:
                 for a in result.absences
             ],
             "all_validated": result.all_validated,
-            "pdf_path": result.pdf_path,
         }
 
     def lock_monthly_period(
@@ -26,6 +26,7 @@ from .use_cases import (
     # Phase 2
     BulkValidatePointagesUseCase,
     GenerateMonthlyRecapUseCase,
+    GenerateMonthlyRecapBatchUseCase,
     LockMonthlyPeriodUseCase,
 )
 
@@ -77,6 +78,7 @@ __all__ = [
     # Phase 2
     "BulkValidatePointagesUseCase",
     "GenerateMonthlyRecapUseCase",
+    "GenerateMonthlyRecapBatchUseCase",
     "LockMonthlyPeriodUseCase",
     # DTOs
     "CreatePointageDTO",
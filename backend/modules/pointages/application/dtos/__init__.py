@@ -56,7 +56,9 @@ from .bulk_validate_dtos import (
 
 from .monthly_recap_dtos import (
     GenerateMonthlyRecapDTO,
+    GenerateMonthlyRecapBatchDTO,
     MonthlyRecapDTO,
+    MonthlyRecapBatchDTO,
     WeeklySummary,
     VariablePaieSummary,
     AbsenceSummary,
@@ -116,7 +118,9 @@ __all__ = [
     "PointageValidationResult",
     # Monthly recap DTOs (GAP-FDH-008)
     "GenerateMonthlyRecapDTO",
+    "GenerateMonthlyRecapBatchDTO",
     "MonthlyRecapDTO",
+    "MonthlyRecapBatchDTO",
     "WeeklySummary",
     "VariablePaieSummary",
     "AbsenceSummary",
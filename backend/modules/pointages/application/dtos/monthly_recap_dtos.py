@@ -114,7 +114,7 @@ class MonthlyRecapDTO:
         variables_paie_total: Montant total des variables.
         absences: Résumé des absences.
         all_validated: True si tous les pointages sont validés.
-        pdf_path: Chemin du PDF généré (si export_pdf=True).
+        pdf_content: Contenu du PDF généré (si export_pdf=True).
     """
 
     utilisateur_id: int
@@ -133,4 +133,43 @@ class MonthlyRecapDTO:
     variables_paie_total: Decimal
     absences: List[AbsenceSummary]
     all_validated: bool
-    pdf_path: Optional[str] = None
+    pdf_content: Optional[bytes] = None
+
+    @property
+    def pdf_filename(self) -> str:
+        """Nom du fichier PDF proposé au téléchargement."""
+        return f"recap_mensuel_user{self.utilisateur_id}_{self.year}_{self.month:02d}.pdf"
+
+
+@dataclass
+class GenerateMonthlyRecapBatchDTO:
+    """
+    DTO pour la génération des récapitulatifs mensuels de toute l'entreprise.
+
+    Attributes:
+        year: Année.
+        month: Mois (1-12).
+        export_pdf: True pour générer un PDF par utilisateur (optionnel).
+    """
+
+    year: int
+    month: int
+    export_pdf: bool = False
+
+
+@dataclass
+class MonthlyRecapBatchDTO:
+    """
+    Récapitulatifs mensuels de tous les utilisateurs ayant pointé sur le mois.
+
+    Attributes:
+        year: Année.
+        month: Mois.
+        month_label: Libellé du mois (ex: "Janvier 2026").
+        recaps: Récapitulatifs, triés par ID utilisateur.
+    """
+
+    year: int
+    month: int
+    month_label: str
+    recaps: List[MonthlyRecapDTO]
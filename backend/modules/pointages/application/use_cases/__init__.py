@@ -19,7 +19,10 @@ from .export_feuille_heures import ExportFeuilleHeuresUseCase
 from .get_jauge_avancement import GetJaugeAvancementUseCase
 from .compare_equipes import CompareEquipesUseCase
 from .bulk_validate_pointages import BulkValidatePointagesUseCase
-from .generate_monthly_recap import GenerateMonthlyRecapUseCase
+from .generate_monthly_recap import (
+    GenerateMonthlyRecapUseCase,
+    GenerateMonthlyRecapBatchUseCase,
+)
 from .lock_monthly_period import LockMonthlyPeriodUseCase
 
 __all__ = [
@@ -50,5 +53,6 @@ __all__ = [
     # Phase 2 GAPs
     "BulkValidatePointagesUseCase",  # GAP-FDH-004
     "GenerateMonthlyRecapUseCase",   # GAP-FDH-008
+    "GenerateMonthlyRecapBatchUseCase",
     "LockMonthlyPeriodUseCase",      # GAP-FDH-009
 ]
@@ -1,11 +1,15 @@
 """Use Case: Validation par lot de pointages (GAP-FDH-004)."""
 
-from typing import Optional
+from datetime import date, datetime
+from typing import Dict, Optional
 
+from ...domain.entities import Pointage
 from ...domain.repositories import PointageRepository
-from ...domain.value_objects import PeriodePaie
-from ...domain.events import PointageValidatedEvent
-from ...domain.events.pointages_bulk_validated import PointagesBulkValidatedEvent
+from ...domain.value_objects import PeriodePaie, StatutPointage
+from ...domain.events.pointages_bulk_validated import (
+    PointagesBulkValidatedEvent,
+    PointageValide,
+)
 from ..dtos.bulk_validate_dtos import (
     BulkValidatePointagesDTO,
     BulkValidatePointagesResultDTO,
@@ -30,14 +34,21 @@ class BulkValidatePointagesUseCase:
     plusieurs pointages en une seule opération (ex: tous les pointages d'une
     feuille d'heures hebdomadaire).
 
-    Comportement transactionnel : all-or-nothing au niveau de la persistance,
-    mais retour détaillé avec succès/échecs individuels pour traçabilité.
+    Comportement transactionnel : all-or-nothing au niveau de la persistance
+    (une seule instruction UPDATE), mais retour détaillé avec succès/échecs
+    individuels pour traçabilité.
 
     Attributes:
         pointage_repo: Repository pour accéder aux pointages.
         event_bus: Bus d'événements pour publier les events.
     """
 
+    # Statuts depuis lesquels un pointage peut être validé
+    STATUTS_SOURCE = [
+        statut for statut in StatutPointage
+        if statut.can_transition_to(StatutPointage.VALIDE)
+    ]
+
     def __init__(
         self,
         pointage_repo: PointageRepository,
@@ -57,6 +68,12 @@ class BulkValidatePointagesUseCase:
         """
         Exécute la validation par lot de pointages.
 
+        Les pointages sont chargés en une requête, les règles métier
+        (transition de statut, verrouillage de période) sont vérifiées en
+        mémoire, puis la transition est appliquée en une seule instruction
+        UPDATE. Un unique événement PointagesBulkValidatedEvent est publié.
+        Un ID en double dans la requête est traité et rapporté une seule fois.
+
         Args:
             dto: Les données de validation par lot.
 
@@ -70,87 +87,92 @@ class BulkValidatePointagesUseCase:
         if not dto.pointage_ids:
             raise BulkValidatePointagesError("La liste de pointages ne peut pas être vide")
 
-        # 2. Traitement de chaque pointage
-        validated_ids = []
-        failed_results = []
+        # 2. Chargement des pointages (une requête), IDs dédoublonnés
+        pointage_ids = list(dict.fromkeys(dto.pointage_ids))
+        pointages = {p.id: p for p in self.pointage_repo.find_by_ids(pointage_ids)}
+
+        # 3. Vérification des règles métier en mémoire
+        candidats: Dict[int, Pointage] = {}
+        errors: Dict[int, str] = {}
+        periodes_verrouillees: Dict[date, bool] = {}
+
+        for pointage_id in pointage_ids:
+            pointage = pointages.get(pointage_id)
+            if not pointage:
+                errors[pointage_id] = f"Pointage {pointage_id} non trouvé"
+                continue
+
+            # Vérifie le verrouillage mensuel
+            if pointage.date_pointage not in periodes_verrouillees:
+                periodes_verrouillees[pointage.date_pointage] = PeriodePaie.is_locked(
+                    pointage.date_pointage
+                )
+            if periodes_verrouillees[pointage.date_pointage]:
+                errors[pointage_id] = "La période de paie est verrouillée"
+                continue
 
-        for pointage_id in dto.pointage_ids:
+            # Vérifie la transition (erreur métier : statut incompatible)
             try:
-                # Récupère le pointage
-                pointage = self.pointage_repo.find_by_id(pointage_id)
-                if not pointage:
-                    failed_results.append(
-                        PointageValidationResult(
-                            pointage_id=pointage_id,
-                            success=False,
-                            error=f"Pointage {pointage_id} non trouvé",
-                        )
-                    )
-                    continue
-
-                # Vérifie le verrouillage mensuel
-                if PeriodePaie.is_locked(pointage.date_pointage):
-                    failed_results.append(
-                        PointageValidationResult(
-                            pointage_id=pointage_id,
-                            success=False,
-                            error="La période de paie est verrouillée",
-                        )
-                    )
-                    continue
-
-                # Valide le pointage
                 pointage.valider(dto.validateur_id)
+            except ValueError as e:
+                errors[pointage_id] = str(e)
+                continue
 
-                # Persiste
-                pointage = self.pointage_repo.save(pointage)
-
-                # Publie l'événement individuel
-                event = PointageValidatedEvent(
-                    pointage_id=pointage.id,
-                    utilisateur_id=pointage.utilisateur_id,
-                    chantier_id=pointage.chantier_id,
-                    date_pointage=pointage.date_pointage,
-                    validateur_id=dto.validateur_id,
-                )
-                self.event_bus.publish(event)
-
-                validated_ids.append(pointage_id)
+            candidats[pointage_id] = pointage
 
-            except ValueError as e:
-                # Erreur de validation métier (statut incompatible, etc.)
-                failed_results.append(
-                    PointageValidationResult(
-                        pointage_id=pointage_id,
-                        success=False,
-                        error=str(e),
+        # 4. Transition en une instruction (gardée par le statut courant)
+        validated_set = set()
+        if candidats:
+            try:
+                validated_set = set(
+                    self.pointage_repo.bulk_validate(
+                        list(candidats),
+                        dto.validateur_id,
+                        datetime.now(),
+                        self.STATUTS_SOURCE,
                     )
                 )
             except Exception as e:
-                # Erreur inattendue
-                failed_results.append(
-                    PointageValidationResult(
-                        pointage_id=pointage_id,
-                        success=False,
-                        error=f"Erreur inattendue: {str(e)}",
-                    )
-                )
-
-        # 3. Publie l'événement de validation par lot
+                for pointage_id in candidats:
+                    errors[pointage_id] = f"Erreur inattendue: {str(e)}"
+                candidats = {}
+
+            for pointage_id in candidats:
+                if pointage_id not in validated_set:
+                    errors[pointage_id] = "Le statut du pointage a changé pendant la validation"
+
+        # 5. Résultats dans l'ordre de la requête (succès et échecs)
+        validated_ids = [pid for pid in candidats if pid in validated_set]
+        failed_results = [
+            PointageValidationResult(pointage_id=pid, success=False, error=errors[pid])
+            for pid in pointage_ids
+            if pid in errors
+        ]
+
+        # 6. Publie l'événement de validation par lot
         if validated_ids:
             bulk_event = PointagesBulkValidatedEvent(
                 pointage_ids=tuple(validated_ids),
                 validateur_id=dto.validateur_id,
                 success_count=len(validated_ids),
                 failure_count=len(failed_results),
+                pointages=tuple(
+                    PointageValide(
+                        pointage_id=pid,
+                        utilisateur_id=candidats[pid].utilisateur_id,
+                        chantier_id=candidats[pid].chantier_id,
+                        date_pointage=candidats[pid].date_pointage,
+                    )
+                    for pid in validated_ids
+                ),
             )
             self.event_bus.publish(bulk_event)
 
-        # 4. Retourne le résultat détaillé
+        # 7. Retourne le résultat détaillé
         return BulkValidatePointagesResultDTO(
             validated=validated_ids,
             failed=failed_results,
-            total_count=len(dto.pointage_ids),
+            total_count=len(pointage_ids),
             success_count=len(validated_ids),
             failure_count=len(failed_results),
         )
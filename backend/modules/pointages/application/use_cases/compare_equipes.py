@@ -1,7 +1,6 @@
 """Use Case: Comparer les équipes (FDH-15)."""
 
 from datetime import date, timedelta
-from collections import defaultdict
 
 from ...domain.repositories import PointageRepository
 from ..dtos import ComparaisonEquipesDTO, EquipeStatsDTO, EcartDTO
@@ -47,31 +46,24 @@ class CompareEquipesUseCase:
 
         semaine_fin = semaine_debut + timedelta(days=6)
 
-        # Récupère tous les pointages de la semaine
-        pointages, _ = self.pointage_repo.search(
+        # Totaux de la semaine par chantier (agrégés en SQL)
+        totaux = self.pointage_repo.totaux(
             date_debut=semaine_debut,
             date_fin=semaine_fin,
-            skip=0,
-            limit=100000,
+            grouper_par=("chantier_id",),
         )
 
-        # Groupe par chantier
-        by_chantier = defaultdict(list)
-        for p in pointages:
-            by_chantier[p.chantier_id].append(p)
-
         # Calcule les stats par équipe (chantier)
         equipes = []
         ecarts = []
 
-        for chantier_id, chantier_pointages in by_chantier.items():
-            # Nom du chantier
-            first_p = chantier_pointages[0]
-            chantier_nom = first_p.chantier_nom or f"Chantier {chantier_id}"
+        for total in totaux:
+            chantier_id = total["chantier_id"]
+            chantier_nom = f"Chantier {chantier_id}"
+            nombre_utilisateurs = total["nombre_utilisateurs"]
 
             # Calcule les heures réalisées
-            total_minutes = sum(p.total_heures.total_minutes for p in chantier_pointages)
-            heures_realisees = total_minutes / 60.0
+            heures_realisees = total["total_minutes"] / 60.0
 
             # Heures planifiées (depuis paramètre ou estimation)
             heures_planifiees = 0.0
@@ -79,17 +71,13 @@ class CompareEquipesUseCase:
                 heures_planifiees = heures_planifiees_par_chantier[chantier_id]
             else:
                 # Estimation: 35h * nombre d'utilisateurs uniques
-                utilisateurs_uniques = len(set(p.utilisateur_id for p in chantier_pointages))
-                heures_planifiees = 35.0 * utilisateurs_uniques
+                heures_planifiees = 35.0 * nombre_utilisateurs
 
             # Taux de complétion
             taux_completion = 0.0
             if heures_planifiees > 0:
                 taux_completion = (heures_realisees / heures_planifiees) * 100
 
-            # Nombre d'utilisateurs
-            nombre_utilisateurs = len(set(p.utilisateur_id for p in chantier_pointages))
-
             equipes.append(
                 EquipeStatsDTO(
                     chantier_id=chantier_id,
@@ -5,6 +5,8 @@ import io
 from datetime import date, timedelta
 from typing import Optional, List
 
+from shared.application.instrumentation import timed
+
 from ...domain.repositories import PointageRepository, FeuilleHeuresRepository
 from ...domain.events import FeuilleHeuresExportedEvent
 from ..dtos import (
@@ -48,6 +50,7 @@ class ExportFeuilleHeuresUseCase:
         self.pointage_repo = pointage_repo
         self.event_bus = event_bus or NullEventBus()
 
+    @timed
     def execute(
         self, dto: ExportFeuilleHeuresDTO, exported_by: int
     ) -> ExportResultDTO:
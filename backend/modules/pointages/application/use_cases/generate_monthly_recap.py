@@ -1,17 +1,22 @@
 """Use Case: Générer un récapitulatif mensuel (GAP-FDH-008)."""
 
 import calendar
-from datetime import date, timedelta
-from typing import Optional, Dict, List
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from decimal import Decimal
 from collections import defaultdict
 
+from shared.application.ports import PdfGeneratorPort
+from shared.application.ports.entity_info_service import EntityInfoService
+from shared.application.instrumentation import timed
+
 from ...domain.repositories import PointageRepository, VariablePaieRepository
-from ...domain.entities import Pointage
 from ...domain.value_objects import Duree, StatutPointage, TypeVariablePaie
 from ..dtos.monthly_recap_dtos import (
     GenerateMonthlyRecapDTO,
+    GenerateMonthlyRecapBatchDTO,
     MonthlyRecapDTO,
+    MonthlyRecapBatchDTO,
     WeeklySummary,
     VariablePaieSummary,
     AbsenceSummary,
@@ -34,11 +39,17 @@ class GenerateMonthlyRecapUseCase:
     heures supplémentaires, variables de paie et absences pour un
     utilisateur sur un mois donné.
 
+    Les données proviennent de deux requêtes agrégées (totaux des pointages
+    par semaine et statut, variables de paie par type), quel que soit le
+    nombre de pointages du mois.
+
     Le récapitulatif peut optionnellement être exporté en PDF.
 
     Attributes:
         pointage_repo: Repository pour accéder aux pointages.
         variable_paie_repo: Repository pour les variables de paie.
+        entity_info: Service d'informations utilisateurs (optionnel).
+        pdf_generator: Générateur PDF (optionnel, pas d'export sinon).
     """
 
     MONTH_LABELS = [
@@ -61,6 +72,8 @@ class GenerateMonthlyRecapUseCase:
         self,
         pointage_repo: PointageRepository,
         variable_paie_repo: VariablePaieRepository,
+        entity_info: Optional[EntityInfoService] = None,
+        pdf_generator: Optional[PdfGeneratorPort] = None,
     ):
         """
         Initialise le use case.
@@ -68,10 +81,15 @@ class GenerateMonthlyRecapUseCase:
         Args:
             pointage_repo: Repository pointages (interface).
             variable_paie_repo: Repository variables de paie (interface).
+            entity_info: Service d'informations utilisateurs (optionnel).
+            pdf_generator: Générateur PDF (optionnel).
         """
         self.pointage_repo = pointage_repo
         self.variable_paie_repo = variable_paie_repo
+        self.entity_info = entity_info
+        self.pdf_generator = pdf_generator
 
+    @timed
     def execute(self, dto: GenerateMonthlyRecapDTO) -> MonthlyRecapDTO:
         """
         Exécute la génération du récapitulatif mensuel.
@@ -82,72 +100,123 @@ class GenerateMonthlyRecapUseCase:
         Returns:
             MonthlyRecapDTO contenant le récapitulatif complet.
 
+        Raises:
+            GenerateMonthlyRecapError: Si les paramètres sont invalides.
+        """
+        recaps = self.generate_month(
+            dto.year, dto.month, dto.export_pdf, utilisateur_id=dto.utilisateur_id
+        )
+        return recaps[0]
+
+    def generate_month(
+        self,
+        year: int,
+        month: int,
+        export_pdf: bool,
+        utilisateur_id: Optional[int] = None,
+    ) -> List[MonthlyRecapDTO]:
+        """
+        Génère les récapitulatifs d'un mois, pour un utilisateur ou pour tous.
+
+        Args:
+            year: Année.
+            month: Mois.
+            export_pdf: True pour générer les PDF.
+            utilisateur_id: Utilisateur ciblé (None = tous ceux ayant pointé).
+
+        Returns:
+            Liste des récapitulatifs, triés par ID utilisateur.
+
         Raises:
             GenerateMonthlyRecapError: Si les paramètres sont invalides.
         """
         # 1. Validation des paramètres
-        if dto.month < 1 or dto.month > 12:
+        if month < 1 or month > 12:
             raise GenerateMonthlyRecapError("Le mois doit être compris entre 1 et 12")
-        if dto.year < 2000 or dto.year > 2100:
+        if year < 2000 or year > 2100:
             raise GenerateMonthlyRecapError("L'année doit être comprise entre 2000 et 2100")
 
         # 2. Calcule les dates de début et fin du mois
-        date_debut = date(dto.year, dto.month, 1)
-        last_day = calendar.monthrange(dto.year, dto.month)[1]
-        date_fin = date(dto.year, dto.month, last_day)
-
-        # 3. Récupère tous les pointages du mois
-        pointages, _ = self.pointage_repo.search(
-            utilisateur_id=dto.utilisateur_id,
-            date_debut=date_debut,
-            date_fin=date_fin,
-            skip=0,
-            limit=10000,  # Aucune limite pour le récap mensuel
+        date_debut = date(year, month, 1)
+        last_day = calendar.monthrange(year, month)[1]
+        date_fin = date(year, month, last_day)
+
+        # 3. Agrégats du mois (une requête par source)
+        totaux_semaines = self.pointage_repo.totaux_par_semaine(
+            date_debut, date_fin, utilisateur_id=utilisateur_id
+        )
+        totaux_variables = self.variable_paie_repo.totaux_par_type(
+            date_debut, date_fin, utilisateur_id=utilisateur_id
         )
 
-        # 4. Groupe les pointages par semaine
-        weekly_summaries = self._build_weekly_summaries(pointages, dto.year, dto.month)
+        semaines_par_user: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        for ligne in totaux_semaines:
+            semaines_par_user[ligne["utilisateur_id"]].append(ligne)
+        variables_par_user: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        for ligne in totaux_variables:
+            variables_par_user[ligne["utilisateur_id"]].append(ligne)
+
+        if utilisateur_id is not None:
+            user_ids = [utilisateur_id]
+        else:
+            user_ids = sorted(semaines_par_user)
+
+        # 4. Construit les récapitulatifs
+        noms = self._get_user_names(user_ids)
+        recaps = [
+            self._build_recap(
+                user_id,
+                noms.get(user_id, f"Utilisateur {user_id}"),
+                year,
+                month,
+                semaines_par_user.get(user_id, []),
+                variables_par_user.get(user_id, []),
+            )
+            for user_id in user_ids
+        ]
 
-        # 5. Calcule les totaux mensuels
-        heures_normales_total = Duree.zero()
-        heures_supplementaires_total = Duree.zero()
+        # 5. Génère les PDF si demandé
+        if export_pdf:
+            self._generate_pdfs(recaps)
+
+        return recaps
 
-        for summary in weekly_summaries:
-            heures_normales_total += Duree.from_string(summary.heures_normales)
-            heures_supplementaires_total += Duree.from_string(summary.heures_supplementaires)
+    def _build_recap(
+        self,
+        utilisateur_id: int,
+        utilisateur_nom: str,
+        year: int,
+        month: int,
+        totaux_semaines: List[Dict[str, Any]],
+        totaux_variables: List[Dict[str, Any]],
+    ) -> MonthlyRecapDTO:
+        """Construit le récapitulatif d'un utilisateur à partir des agrégats."""
+        weekly_summaries = self._build_weekly_summaries(totaux_semaines)
 
+        heures_normales_total = Duree.zero()
+        heures_supplementaires_total = Duree.zero()
+        for ligne in totaux_semaines:
+            heures_normales_total += Duree.from_minutes(ligne["heures_normales_minutes"])
+            heures_supplementaires_total += Duree.from_minutes(
+                ligne["heures_supplementaires_minutes"]
+            )
         total_heures_month = heures_normales_total + heures_supplementaires_total
 
-        # 6. Récupère et agrège les variables de paie
         variables_paie_summaries, variables_total = self._build_variables_paie_summaries(
-            pointages
+            totaux_variables
         )
+        absences_summaries = self._build_absences_summaries(totaux_variables)
 
-        # 7. Récupère et agrège les absences
-        absences_summaries = self._build_absences_summaries(pointages)
-
-        # 8. Vérifie si tous les pointages sont validés
-        all_validated = all(p.statut == StatutPointage.VALIDE for p in pointages)
-
-        # 9. Génère le PDF si demandé
-        pdf_path = None
-        if dto.export_pdf:
-            pdf_path = self._generate_pdf(
-                dto.utilisateur_id,
-                dto.year,
-                dto.month,
-                weekly_summaries,
-                variables_paie_summaries,
-                absences_summaries,
-            )
+        all_validated = all(
+            ligne["statut"] == StatutPointage.VALIDE.value for ligne in totaux_semaines
+        )
 
-        # 10. Construit le DTO de sortie
         return MonthlyRecapDTO(
-            utilisateur_id=dto.utilisateur_id,
-            utilisateur_nom=self._get_user_name(dto.utilisateur_id),
-            year=dto.year,
-            month=dto.month,
-            month_label=f"{self.MONTH_LABELS[dto.month]} {dto.year}",
+            utilisateur_id=utilisateur_id,
+            utilisateur_nom=utilisateur_nom,
+            year=year,
+            month=month,
+            month_label=f"{self.MONTH_LABELS[month]} {year}",
             weekly_summaries=weekly_summaries,
             heures_normales_total=str(heures_normales_total),
             heures_supplementaires_total=str(heures_supplementaires_total),
@@ -159,48 +228,36 @@ class GenerateMonthlyRecapUseCase:
             variables_paie_total=variables_total,
             absences=absences_summaries,
             all_validated=all_validated,
-            pdf_path=pdf_path,
         )
 
     def _build_weekly_summaries(
-        self, pointages: List[Pointage], year: int, month: int
+        self, totaux_semaines: List[Dict[str, Any]]
     ) -> List[WeeklySummary]:
         """
-        Construit les résumés hebdomadaires à partir des pointages.
+        Construit les résumés hebdomadaires à partir des totaux par statut.
 
         Args:
-            pointages: Liste des pointages du mois.
-            year: Année.
-            month: Mois.
+            totaux_semaines: Totaux (semaine, statut) d'un utilisateur.
 
         Returns:
             Liste des résumés hebdomadaires.
         """
-        # Groupe les pointages par semaine
-        weeks_dict: Dict[date, List[Pointage]] = defaultdict(list)
-
-        for pointage in pointages:
-            # Calcule le lundi de la semaine du pointage
-            semaine_debut = self._get_monday(pointage.date_pointage)
-            weeks_dict[semaine_debut].append(pointage)
+        weeks_dict: Dict[date, List[Dict[str, Any]]] = defaultdict(list)
+        for ligne in totaux_semaines:
+            weeks_dict[ligne["semaine_debut"]].append(ligne)
 
-        # Construit les résumés
         summaries = []
         for semaine_debut in sorted(weeks_dict.keys()):
-            pointages_semaine = weeks_dict[semaine_debut]
-
-            heures_normales = Duree.zero()
-            heures_sup = Duree.zero()
-
-            for p in pointages_semaine:
-                heures_normales += p.heures_normales
-                heures_sup += p.heures_supplementaires
+            lignes = weeks_dict[semaine_debut]
 
+            heures_normales = Duree.from_minutes(
+                sum(ligne["heures_normales_minutes"] for ligne in lignes)
+            )
+            heures_sup = Duree.from_minutes(
+                sum(ligne["heures_supplementaires_minutes"] for ligne in lignes)
+            )
             total_heures = heures_normales + heures_sup
 
-            # Détermine le statut global de la semaine
-            statut = self._calculate_weekly_status(pointages_semaine)
-
             summaries.append(
                 WeeklySummary(
                     semaine_debut=semaine_debut,
@@ -211,172 +268,174 @@ class GenerateMonthlyRecapUseCase:
                     heures_normales_decimal=heures_normales.decimal,
                     heures_supplementaires_decimal=heures_sup.decimal,
                     total_heures_decimal=total_heures.decimal,
-                    statut=statut,
+                    statut=self._calculate_weekly_status(
+                        [ligne["statut"] for ligne in lignes]
+                    ),
                 )
             )
 
         return summaries
 
     def _build_variables_paie_summaries(
-        self, pointages: List[Pointage]
-    ) -> tuple[List[VariablePaieSummary], Decimal]:
+        self, totaux_variables: List[Dict[str, Any]]
+    ) -> Tuple[List[VariablePaieSummary], Decimal]:
         """
-        Construit les résumés des variables de paie.
+        Construit les résumés des variables de paie (montants).
 
         Args:
-            pointages: Liste des pointages du mois.
+            totaux_variables: Totaux par type d'un utilisateur.
 
         Returns:
             Tuple (liste des résumés, montant total).
         """
-        # Récupère toutes les variables de paie pour les pointages du mois
-        pointage_ids = [p.id for p in pointages if p.id]
-        if not pointage_ids:
-            return [], Decimal("0.00")
-
-        variables_dict: Dict[str, Dict] = defaultdict(
-            lambda: {"count": 0, "values": [], "total": Decimal("0.00")}
-        )
-
-        for pointage_id in pointage_ids:
-            variables = self.variable_paie_repo.find_by_pointage(pointage_id)
-            for var in variables:
-                # Ne comptabiliser que les variables de type montant (pas heures)
-                type_var = TypeVariablePaie.from_string(var.type_variable)
-                if type_var.is_amount:
-                    variables_dict[var.type_variable]["count"] += 1
-                    variables_dict[var.type_variable]["values"].append(var.valeur)
-                    variables_dict[var.type_variable]["total"] += var.valeur
-
-        # Construit les résumés
         summaries = []
         montant_total = Decimal("0.00")
 
-        for type_var, data in sorted(variables_dict.items()):
-            type_vo = TypeVariablePaie.from_string(type_var)
+        for ligne, type_vo in self._lignes_typees(totaux_variables):
+            # Ne comptabiliser que les indemnités (montants, pas heures)
+            if not type_vo.is_allowance_type():
+                continue
 
-            # Vérifie si la valeur unitaire est constante
-            values = data["values"]
-            valeur_unitaire = values[0] if len(set(values)) == 1 else None
+            # Valeur unitaire si constante sur le mois
+            valeur_unitaire = (
+                ligne["valeur_min"] if ligne["valeur_min"] == ligne["valeur_max"] else None
+            )
 
             summaries.append(
                 VariablePaieSummary(
-                    type_variable=type_var,
+                    type_variable=ligne["type_variable"],
                     type_variable_libelle=type_vo.libelle,
-                    nombre_occurrences=data["count"],
+                    nombre_occurrences=ligne["nombre"],
                     valeur_unitaire=valeur_unitaire,
-                    montant_total=data["total"],
+                    montant_total=ligne["total"],
                 )
             )
-
-            montant_total += data["total"]
+            montant_total += ligne["total"]
 
         return summaries, montant_total
 
-    def _build_absences_summaries(self, pointages: List[Pointage]) -> List[AbsenceSummary]:
+    def _build_absences_summaries(
+        self, totaux_variables: List[Dict[str, Any]]
+    ) -> List[AbsenceSummary]:
         """
         Construit les résumés des absences.
 
         Args:
-            pointages: Liste des pointages du mois.
+            totaux_variables: Totaux par type d'un utilisateur.
 
         Returns:
             Liste des résumés d'absences.
         """
-        # Récupère toutes les variables de paie de type absence
-        pointage_ids = [p.id for p in pointages if p.id]
-        if not pointage_ids:
-            return []
-
-        absences_dict: Dict[str, Dict] = defaultdict(
-            lambda: {"count": 0, "total_heures": Duree.zero()}
-        )
-
-        for pointage_id in pointage_ids:
-            variables = self.variable_paie_repo.find_by_pointage(pointage_id)
-            for var in variables:
-                type_var = TypeVariablePaie.from_string(var.type_variable)
-                if type_var.is_absence:
-                    absences_dict[var.type_variable]["count"] += 1
-                    # Convertit la valeur en Duree (valeur stockée en décimal)
-                    heures = Duree.from_decimal(float(var.valeur))
-                    absences_dict[var.type_variable]["total_heures"] += heures
-
-        # Construit les résumés
         summaries = []
-        for type_abs, data in sorted(absences_dict.items()):
-            type_vo = TypeVariablePaie.from_string(type_abs)
+        for ligne, type_vo in self._lignes_typees(totaux_variables):
+            if not type_vo.is_absence_type():
+                continue
 
+            # Valeur stockée en heures décimales
+            total_heures = Duree.from_decimal(float(ligne["total"]))
             summaries.append(
                 AbsenceSummary(
-                    type_absence=type_abs,
+                    type_absence=ligne["type_variable"],
                     type_absence_libelle=type_vo.libelle,
-                    nombre_jours=data["count"],
-                    total_heures=str(data["total_heures"]),
-                    total_heures_decimal=data["total_heures"].decimal,
+                    nombre_jours=ligne["nombre"],
+                    total_heures=str(total_heures),
+                    total_heures_decimal=total_heures.decimal,
                 )
             )
 
         return summaries
 
-    def _calculate_weekly_status(self, pointages: List[Pointage]) -> str:
+    def _lignes_typees(
+        self, totaux_variables: List[Dict[str, Any]]
+    ) -> Iterable[Tuple[Dict[str, Any], TypeVariablePaie]]:
+        """Associe chaque total à son type, triés par type (types inconnus ignorés)."""
+        for ligne in sorted(totaux_variables, key=lambda t: t["type_variable"]):
+            try:
+                yield ligne, TypeVariablePaie.from_string(ligne["type_variable"])
+            except ValueError:
+                continue
+
+    def _calculate_weekly_status(self, statuts: List[str]) -> str:
         """Calcule le statut global d'une semaine selon les règles métier."""
-        if not pointages:
+        if not statuts:
             return "vide"
 
-        has_rejected = any(p.statut == StatutPointage.REJETE for p in pointages)
-        has_brouillon = any(p.statut == StatutPointage.BROUILLON for p in pointages)
-        has_soumis = any(p.statut == StatutPointage.SOUMIS for p in pointages)
-        all_validated = all(p.statut == StatutPointage.VALIDE for p in pointages)
-
-        if has_rejected:
+        presents = set(statuts)
+        if StatutPointage.REJETE.value in presents:
             return "rejete"
-        if has_brouillon:
+        if StatutPointage.BROUILLON.value in presents:
             return "brouillon"
-        if has_soumis:
+        if StatutPointage.SOUMIS.value in presents:
             return "soumis"
-        if all_validated:
+        if presents == {StatutPointage.VALIDE.value}:
             return "valide"
         return "inconnu"
 
-    def _get_monday(self, d: date) -> date:
-        """Retourne le lundi de la semaine contenant la date donnée."""
-        # weekday(): 0 = lundi, 6 = dimanche
-        days_since_monday = d.weekday()
-        return d - timedelta(days=days_since_monday)
+    def _get_user_names(self, user_ids: List[int]) -> Dict[int, str]:
+        """Récupère les noms complets des utilisateurs (une requête)."""
+        if not self.entity_info or not user_ids:
+            return {}
+        infos = self.entity_info.get_users_info(user_ids)
+        return {user_id: info.nom for user_id, info in infos.items()}
 
-    def _get_user_name(self, utilisateur_id: int) -> str:
-        """Récupère le nom complet d'un utilisateur."""
-        # TODO: Implémenter via EntityInfoService quand disponible
-        return f"Utilisateur {utilisateur_id}"
+    def _generate_pdfs(self, recaps: List[MonthlyRecapDTO]) -> None:
+        """
+        Génère les exports PDF des récapitulatifs et renseigne pdf_content.
 
-    def _generate_pdf(
-        self,
-        utilisateur_id: int,
-        year: int,
-        month: int,
-        weekly_summaries: List[WeeklySummary],
-        variables_paie: List[VariablePaieSummary],
-        absences: List[AbsenceSummary],
-    ) -> Optional[str]:
+        Les rendus sont confiés au générateur en un seul lot (rendus
+        parallèles). Les PDF contiennent des données de paie : ils restent en
+        mémoire et sont renvoyés au client, jamais écrits sur le disque.
+        Sans générateur configuré, pdf_content reste à None.
+
+        Args:
+            recaps: Récapitulatifs à exporter.
+        """
+        if self.pdf_generator is None or not recaps:
+            return
+
+        contenus = self.pdf_generator.generate_recaps_mensuels_pdf(recaps)
+        for recap, contenu in zip(recaps, contenus):
+            recap.pdf_content = contenu
+
+
+class GenerateMonthlyRecapBatchUseCase:
+    """
+    Cas d'utilisation : Récapitulatifs mensuels de toute l'entreprise.
+
+    Génère en une passe le récapitulatif de chaque utilisateur ayant pointé
+    sur le mois : mêmes deux requêtes agrégées que pour un utilisateur,
+    sans filtre, et rendus PDF parallèles.
+
+    Attributes:
+        recap_use_case: Use case du récapitulatif individuel.
+    """
+
+    def __init__(self, recap_use_case: GenerateMonthlyRecapUseCase):
         """
-        Génère un export PDF du récapitulatif.
+        Initialise le use case.
 
         Args:
-            utilisateur_id: ID de l'utilisateur.
-            year: Année.
-            month: Mois.
-            weekly_summaries: Résumés hebdomadaires.
-            variables_paie: Variables de paie.
-            absences: Absences.
+            recap_use_case: Use case du récapitulatif individuel.
+        """
+        self.recap_use_case = recap_use_case
+
+    def execute(self, dto: GenerateMonthlyRecapBatchDTO) -> MonthlyRecapBatchDTO:
+        """
+        Exécute la génération des récapitulatifs du mois.
+
+        Args:
+            dto: Les données de génération.
 
         Returns:
-            Chemin du fichier PDF généré.
+            MonthlyRecapBatchDTO contenant un récapitulatif par utilisateur.
 
-        Note:
-            Pour l'instant, retourne None (fonctionnalité optionnelle à implémenter).
-            Peut utiliser reportlab ou weasyprint pour la génération PDF.
+        Raises:
+            GenerateMonthlyRecapError: Si les paramètres sont invalides.
         """
-        # TODO: Implémenter génération PDF avec reportlab ou weasyprint
-        # Exemple: /tmp/recap_mensuel_user7_2026_01.pdf
-        return None
+        recaps = self.recap_use_case.generate_month(dto.year, dto.month, dto.export_pdf)
+        return MonthlyRecapBatchDTO(
+            year=dto.year,
+            month=dto.month,
+            month_label=f"{GenerateMonthlyRecapUseCase.MONTH_LABELS[dto.month]} {dto.year}",
+            recaps=recaps,
+        )
@@ -49,14 +49,15 @@ class GetJaugeAvancementUseCase:
         if heures_planifiees is None:
             heures_planifiees = 35.0
 
-        # Récupère les pointages de la semaine
-        pointages = self.pointage_repo.find_by_utilisateur_and_semaine(
+        # Total de la semaine (agrégé en SQL)
+        totaux = self.pointage_repo.totaux(
+            date_debut=semaine_debut,
+            date_fin=semaine_debut + timedelta(days=6),
             utilisateur_id=utilisateur_id,
-            semaine_debut=semaine_debut,
         )
 
         # Calcule les heures réalisées
-        total_minutes = sum(p.total_heures.total_minutes for p in pointages)
+        total_minutes = totaux[0]["total_minutes"] if totaux else 0
         heures_realisees = total_minutes / 60.0
 
         # Calcule le taux de complétion
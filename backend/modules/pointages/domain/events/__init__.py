@@ -17,7 +17,7 @@ from .heures_created import HeuresCreatedEvent
 from .heures_updated import HeuresUpdatedEvent
 from .heures_validated import HeuresValidatedEvent
 from .heures_rejected import HeuresRejectedEvent
-from .pointages_bulk_validated import PointagesBulkValidatedEvent
+from .pointages_bulk_validated import PointagesBulkValidatedEvent, PointageValide
 from .periode_paie_locked import PeriodePaieLockedEvent
 
 __all__ = [
@@ -37,5 +37,6 @@ __all__ = [
     "HeuresValidatedEvent",
     "HeuresRejectedEvent",
     "PointagesBulkValidatedEvent",
+    "PointageValide",
     "PeriodePaieLockedEvent",
 ]
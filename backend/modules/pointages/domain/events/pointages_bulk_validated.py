@@ -1,8 +1,26 @@
 """Domain Event pour la validation par lot de pointages (GAP-FDH-004)."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List
+from datetime import date, datetime
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class PointageValide:
+    """
+    Pointage validé au sein d'une validation par lot.
+
+    Attributes:
+        pointage_id: ID du pointage.
+        utilisateur_id: ID du compagnon.
+        chantier_id: ID du chantier.
+        date_pointage: Date du pointage.
+    """
+
+    pointage_id: int
+    utilisateur_id: int
+    chantier_id: int
+    date_pointage: date
 
 
 @dataclass(frozen=True)
@@ -11,14 +29,17 @@ class PointagesBulkValidatedEvent:
     Événement émis lors de la validation par lot de pointages.
 
     Cet événement est publié après la validation réussie d'un ensemble de pointages
-    en une seule transaction. Il permet aux autres modules (notifications, dashboard)
-    de réagir à cette validation groupée.
+    en une seule transaction. Aucun PointageValidatedEvent individuel n'est
+    publié pour une validation par lot : un futur abonné devra s'inscrire à
+    cet événement, qui porte le détail de chaque pointage. Aucun module n'y
+    est abonné à ce jour.
 
     Attributes:
         pointage_ids: Liste des IDs de pointages validés.
         validateur_id: ID du validateur (chef/conducteur/admin).
         success_count: Nombre de pointages validés avec succès.
         failure_count: Nombre de pointages en échec.
+        pointages: Détail (utilisateur, chantier, date) des pointages validés.
         timestamp: Moment de l'événement.
     """
 
@@ -26,4 +47,15 @@ class PointagesBulkValidatedEvent:
     validateur_id: int
     success_count: int
     failure_count: int
+    pointages: Tuple[PointageValide, ...] = ()
     timestamp: datetime = field(default_factory=datetime.now)
+
+    @property
+    def chantier_ids(self) -> Tuple[int, ...]:
+        """IDs des chantiers concernés (sans doublon, triés)."""
+        return tuple(sorted({p.chantier_id for p in self.pointages}))
+
+    @property
+    def utilisateur_ids(self) -> Tuple[int, ...]:
+        """IDs des compagnons concernés (sans doublon, triés)."""
+        return tuple(sorted({p.utilisateur_id for p in self.pointages}))
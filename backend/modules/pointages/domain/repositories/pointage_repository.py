@@ -1,8 +1,8 @@
 """Interface PointageRepository - Abstraction pour la persistence des pointages."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple
-from datetime import date
+from typing import Any, Dict, Iterable, Optional, List, Tuple
+from datetime import date, datetime
 
 from ..entities import Pointage
 from ..value_objects import StatutPointage
@@ -16,6 +16,9 @@ class PointageRepository(ABC):
     L'implémentation concrète se trouve dans la couche Infrastructure.
     """
 
+    # Axes de regroupement acceptés par totaux()
+    AXES_TOTAUX = ("chantier_id", "utilisateur_id", "semaine_debut", "statut")
+
     @abstractmethod
     def find_by_id(self, pointage_id: int) -> Optional[Pointage]:
         """
@@ -29,6 +32,19 @@ class PointageRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_by_ids(self, pointage_ids: Iterable[int]) -> List[Pointage]:
+        """
+        Trouve plusieurs pointages en une seule requête.
+
+        Args:
+            pointage_ids: Les identifiants des pointages.
+
+        Returns:
+            Liste des pointages trouvés (les IDs inconnus sont ignorés).
+        """
+        pass
+
     @abstractmethod
     def save(self, pointage: Pointage) -> Pointage:
         """
@@ -197,6 +213,58 @@ class PointageRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def totaux(
+        self,
+        date_debut: date,
+        date_fin: date,
+        grouper_par: Tuple[str, ...] = (),
+        utilisateur_id: Optional[int] = None,
+        chantier_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Agrège les pointages d'une période sans charger les entités.
+
+        Args:
+            date_debut: Date de début de période.
+            date_fin: Date de fin de période.
+            grouper_par: Axes de regroupement, parmi AXES_TOTAUX
+                (semaine_debut = lundi de la semaine). Vide = une seule ligne.
+            utilisateur_id: Filtrer par utilisateur (optionnel).
+            chantier_id: Filtrer par chantier (optionnel).
+
+        Returns:
+            Liste de dicts triés par axes, avec les clés des axes demandés et
+            nombre, nombre_utilisateurs (distincts), heures_normales_minutes,
+            heures_supplementaires_minutes, total_minutes. Aucune ligne si
+            aucun pointage ne correspond.
+
+        Raises:
+            ValueError: Si un axe de regroupement est inconnu.
+        """
+        pass
+
+    @abstractmethod
+    def totaux_par_semaine(
+        self,
+        date_debut: date,
+        date_fin: date,
+        utilisateur_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Agrège les heures par utilisateur, semaine et statut sur une période.
+
+        Args:
+            date_debut: Date de début de période.
+            date_fin: Date de fin de période.
+            utilisateur_id: Filtrer par utilisateur (optionnel, sinon tous).
+
+        Returns:
+            Liste de dicts avec les clés utilisateur_id, semaine_debut (lundi),
+            statut, nombre, heures_normales_minutes, heures_supplementaires_minutes.
+        """
+        pass
+
     @abstractmethod
     def count_by_utilisateur_semaine(
         self, utilisateur_id: int, semaine_debut: date
@@ -213,6 +281,31 @@ class PointageRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def bulk_validate(
+        self,
+        pointage_ids: List[int],
+        validateur_id: int,
+        validation_date: datetime,
+        statuts_source: List[StatutPointage],
+    ) -> List[int]:
+        """
+        Passe plusieurs pointages au statut validé en une seule instruction.
+
+        Seuls les pointages encore dans un des statuts source sont modifiés,
+        pour ne pas écraser une transition concurrente.
+
+        Args:
+            pointage_ids: IDs des pointages à valider.
+            validateur_id: ID du validateur.
+            validation_date: Date de validation.
+            statuts_source: Statuts depuis lesquels la validation est permise.
+
+        Returns:
+            IDs des pointages effectivement validés.
+        """
+        pass
+
     @abstractmethod
     def bulk_save(self, pointages: List[Pointage]) -> List[Pointage]:
         """
@@ -1,7 +1,7 @@
 """Interface VariablePaieRepository - Abstraction pour la persistence des variables de paie."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from datetime import date
 
 from ..entities import VariablePaie
@@ -110,6 +110,29 @@ class VariablePaieRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def totaux_par_type(
+        self,
+        date_debut: date,
+        date_fin: date,
+        utilisateur_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Agrège les variables par utilisateur et type sur une période.
+
+        La période porte sur la date des pointages rattachés.
+
+        Args:
+            date_debut: Date de début.
+            date_fin: Date de fin.
+            utilisateur_id: Filtrer par utilisateur (optionnel, sinon tous).
+
+        Returns:
+            Liste de dicts avec les clés utilisateur_id, type_variable,
+            nombre, total, valeur_min, valeur_max.
+        """
+        pass
+
     @abstractmethod
     def bulk_save(self, variables: List[VariablePaie]) -> List[VariablePaie]:
         """
@@ -1,8 +1,9 @@
 """Implémentation SQLAlchemy du PointageRepository."""
 
-from datetime import date, timedelta
-from typing import Optional, List, Tuple
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, List, Tuple
 
+from sqlalchemy import Date, cast, func, update
 from sqlalchemy.orm import Session
 
 from ...domain.entities import Pointage
@@ -30,6 +31,16 @@ class SQLAlchemyPointageRepository(PointageRepository):
         ).first()
         return self._to_entity(model) if model else None
 
+    def find_by_ids(self, pointage_ids: Iterable[int]) -> List[Pointage]:
+        """Trouve plusieurs pointages (une requête IN)."""
+        ids = list(set(pointage_ids))
+        if not ids:
+            return []
+        models = self.session.query(PointageModel).filter(
+            PointageModel.id.in_(ids)
+        ).all()
+        return [self._to_entity(m) for m in models]
+
     def save(self, pointage: Pointage) -> Pointage:
         """Persiste un pointage."""
         if pointage.id:
@@ -164,6 +175,72 @@ class SQLAlchemyPointageRepository(PointageRepository):
         models = query.order_by(PointageModel.date_pointage.desc()).offset(skip).limit(limit).all()
         return [self._to_entity(m) for m in models], total
 
+    def totaux(
+        self,
+        date_debut: date,
+        date_fin: date,
+        grouper_par: Tuple[str, ...] = (),
+        utilisateur_id: Optional[int] = None,
+        chantier_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Agrège les pointages d'une période (GROUP BY SQL, sans entités)."""
+        inconnus = set(grouper_par) - set(self.AXES_TOTAUX)
+        if inconnus:
+            raise ValueError(f"Axes de regroupement inconnus: {sorted(inconnus)}")
+
+        axes = [self._colonne_axe(axe) for axe in grouper_par]
+        normales = func.coalesce(func.sum(PointageModel.heures_normales_minutes), 0)
+        sup = func.coalesce(func.sum(PointageModel.heures_supplementaires_minutes), 0)
+        query = self.session.query(
+            *axes,
+            func.count(PointageModel.id),
+            func.count(PointageModel.utilisateur_id.distinct()),
+            normales,
+            sup,
+        ).filter(
+            PointageModel.date_pointage >= date_debut,
+            PointageModel.date_pointage <= date_fin,
+        )
+        if utilisateur_id:
+            query = query.filter(PointageModel.utilisateur_id == utilisateur_id)
+        if chantier_id:
+            query = query.filter(PointageModel.chantier_id == chantier_id)
+        if axes:
+            query = query.group_by(*axes).order_by(*axes)
+
+        totaux = []
+        for row in query.all():
+            nombre, nombre_utilisateurs, minutes_normales, minutes_sup = row[len(axes):]
+            if not nombre:
+                # Agrégat global sans pointage : pas de ligne
+                continue
+            ligne: Dict[str, Any] = dict(zip(grouper_par, row[:len(axes)]))
+            if "semaine_debut" in ligne:
+                ligne["semaine_debut"] = self._as_date(ligne["semaine_debut"])
+            ligne.update(
+                nombre=nombre,
+                nombre_utilisateurs=nombre_utilisateurs,
+                heures_normales_minutes=int(minutes_normales),
+                heures_supplementaires_minutes=int(minutes_sup),
+                total_minutes=int(minutes_normales) + int(minutes_sup),
+            )
+            totaux.append(ligne)
+        return totaux
+
+    def totaux_par_semaine(
+        self,
+        date_debut: date,
+        date_fin: date,
+        utilisateur_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Agrège les heures par utilisateur, semaine et statut."""
+        return self.totaux(
+            date_debut,
+            date_fin,
+            grouper_par=("utilisateur_id", "semaine_debut", "statut"),
+            utilisateur_id=utilisateur_id,
+        )
+
     def count_by_utilisateur_semaine(
         self, utilisateur_id: int, semaine_debut: date
     ) -> int:
@@ -175,6 +252,37 @@ class SQLAlchemyPointageRepository(PointageRepository):
             PointageModel.date_pointage <= semaine_fin,
         ).count()
 
+    def bulk_validate(
+        self,
+        pointage_ids: List[int],
+        validateur_id: int,
+        validation_date: datetime,
+        statuts_source: List[StatutPointage],
+    ) -> List[int]:
+        """Valide plusieurs pointages (UPDATE ... WHERE id IN ... RETURNING id)."""
+        if not pointage_ids:
+            return []
+
+        stmt = (
+            update(PointageModel)
+            .where(
+                PointageModel.id.in_(pointage_ids),
+                PointageModel.statut.in_([s.value for s in statuts_source]),
+            )
+            .values(
+                statut=StatutPointage.VALIDE.value,
+                validateur_id=validateur_id,
+                validation_date=validation_date,
+                motif_rejet=None,
+                updated_at=validation_date,
+            )
+            .returning(PointageModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        validated_ids = list(self.session.execute(stmt).scalars())
+        self.session.commit()
+        return validated_ids
+
     def bulk_save(self, pointages: List[Pointage]) -> List[Pointage]:
         """Sauvegarde plusieurs pointages."""
         models = []
@@ -192,6 +300,26 @@ class SQLAlchemyPointageRepository(PointageRepository):
 
     # ===== Helpers =====
 
+    def _colonne_axe(self, axe: str):
+        """Expression SQL d'un axe de regroupement de totaux()."""
+        if axe != "semaine_debut":
+            return getattr(PointageModel, axe)
+        colonne = PointageModel.date_pointage
+        if self.session.get_bind().dialect.name == "postgresql":
+            return cast(func.date_trunc("week", colonne), Date)
+        # SQLite : recule de 6 jours puis avance au lundi suivant
+        # (un lundi reste inchangé, un dimanche revient au lundi précédent)
+        return func.date(colonne, "-6 days", "weekday 1")
+
+    @staticmethod
+    def _as_date(value) -> date:
+        """Normalise un lundi calculé en SQL (date, datetime ou chaîne SQLite)."""
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return date.fromisoformat(str(value)[:10])
+
     def _to_entity(self, model: PointageModel) -> Pointage:
         """Convertit un modèle en entité."""
         return Pointage(
@@ -2,14 +2,15 @@
 
 from datetime import date
 from decimal import Decimal
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ...domain.entities import VariablePaie
 from ...domain.repositories import VariablePaieRepository
 from ...domain.value_objects import TypeVariablePaie
-from .models import VariablePaieModel
+from .models import PointageModel, VariablePaieModel
 
 
 class SQLAlchemyVariablePaieRepository(VariablePaieRepository):
@@ -94,8 +95,6 @@ class SQLAlchemyVariablePaieRepository(VariablePaieRepository):
         date_fin: date,
     ) -> List[VariablePaie]:
         """Trouve toutes les variables d'un utilisateur sur une période."""
-        from .models import PointageModel
-
         models = self.session.query(VariablePaieModel).join(
             PointageModel
         ).filter(
@@ -106,6 +105,49 @@ class SQLAlchemyVariablePaieRepository(VariablePaieRepository):
 
         return [self._to_entity(m) for m in models]
 
+    def totaux_par_type(
+        self,
+        date_debut: date,
+        date_fin: date,
+        utilisateur_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Agrège les variables par utilisateur et type (une requête)."""
+        query = self.session.query(
+            PointageModel.utilisateur_id,
+            VariablePaieModel.type_variable,
+            func.count(VariablePaieModel.id),
+            func.sum(VariablePaieModel.valeur),
+            func.min(VariablePaieModel.valeur),
+            func.max(VariablePaieModel.valeur),
+        ).join(
+            PointageModel, VariablePaieModel.pointage_id == PointageModel.id
+        ).filter(
+            PointageModel.date_pointage >= date_debut,
+            PointageModel.date_pointage <= date_fin,
+        )
+        if utilisateur_id:
+            query = query.filter(PointageModel.utilisateur_id == utilisateur_id)
+
+        rows = query.group_by(
+            PointageModel.utilisateur_id,
+            VariablePaieModel.type_variable,
+        ).order_by(
+            PointageModel.utilisateur_id,
+            VariablePaieModel.type_variable,
+        ).all()
+
+        return [
+            {
+                "utilisateur_id": user_id,
+                "type_variable": type_variable,
+                "nombre": nombre,
+                "total": Decimal(str(total)),
+                "valeur_min": Decimal(str(valeur_min)),
+                "valeur_max": Decimal(str(valeur_max)),
+            }
+            for user_id, type_variable, nombre, total, valeur_min, valeur_max in rows
+        ]
+
     def bulk_save(self, variables: List[VariablePaie]) -> List[VariablePaie]:
         """Sauvegarde plusieurs variables."""
         models = []
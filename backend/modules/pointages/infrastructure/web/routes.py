@@ -17,6 +17,7 @@ from shared.infrastructure.web.dependencies import (
     get_current_user_role,
 )
 from shared.infrastructure.entity_info_impl import SQLAlchemyEntityInfoService
+from shared.infrastructure.pdf import PdfGeneratorService, get_pdf_render_cache
 from ..persistence import (
     SQLAlchemyPointageRepository,
     SQLAlchemyFeuilleHeuresRepository,
@@ -219,6 +220,7 @@ def get_controller(db: Session = Depends(get_db)) -> PointageController:
         variable_repo=variable_repo,
         event_bus=event_bus,
         entity_info_service=entity_info_service,
+        pdf_generator=PdfGeneratorService(render_cache=get_pdf_render_cache()),
     )
 
 
@@ -784,13 +786,13 @@ def bulk_validate_pointages(
 
     # Pour les chefs : vérifier que tous les pointages sont dans leurs chantiers
     if current_user_role == "chef_chantier" and chef_chantier_ids is not None:
+        chantier_par_pointage = controller.get_pointages_chantier_ids(request.pointage_ids)
         for pid in request.pointage_ids:
-            pointage = controller.get_pointage(pid)
-            if not pointage:
+            if pid not in chantier_par_pointage:
                 continue  # sera géré par le controller
             if not PointagePermissionService.can_validate(
                 current_user_role,
-                pointage_chantier_id=pointage.get("chantier_id"),
+                pointage_chantier_id=chantier_par_pointage[pid],
                 user_chantier_ids=chef_chantier_ids,
             ):
                 raise HTTPException(
@@ -824,7 +826,7 @@ def get_monthly_recap(
     - Absences
     - Statut de validation
 
-    Optionnel: Génération d'un export PDF.
+    Optionnel: export PDF, renvoyé directement en application/pdf.
     """
     # SEC-PTG-P2-002: Un compagnon ne peut consulter que son propre récapitulatif
     if current_user_role == "compagnon" and current_user_id != utilisateur_id:
@@ -834,7 +836,50 @@ def get_monthly_recap(
         )
 
     try:
-        return controller.generate_monthly_recap(utilisateur_id, year, month, export_pdf)
+        if export_pdf:
+            contenu, filename = controller.export_monthly_recap_pdf(utilisateur_id, year, month)
+            return Response(
+                content=contenu,
+                media_type="application/pdf",
+                headers={"Content-Disposition": f"attachment; filename={filename}"},
+            )
+        return controller.generate_monthly_recap(utilisateur_id, year, month)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/recap/{year}/{month}/batch")
+def generate_monthly_recaps_batch(
+    year: int,
+    month: int,
+    export_pdf: bool = Query(False, description="Générer un PDF par utilisateur"),
+    current_user_role: str = Depends(get_current_user_role),
+    controller: PointageController = Depends(get_controller),
+):
+    """
+    Récapitulatifs mensuels de toute l'entreprise (GAP-FDH-008).
+
+    Génère en une passe le récapitulatif de chaque utilisateur ayant pointé
+    sur le mois. Avec export_pdf, renvoie une archive ZIP contenant un PDF
+    par utilisateur (rendus parallèles).
+
+    Réservé aux administrateurs et conducteurs de travaux.
+    """
+    if current_user_role not in ["admin", "conducteur"]:
+        raise HTTPException(
+            status_code=403,
+            detail="Seuls les administrateurs et conducteurs peuvent générer les récapitulatifs de l'entreprise",
+        )
+
+    try:
+        if export_pdf:
+            contenu, filename = controller.export_monthly_recaps_zip(year, month)
+            return Response(
+                content=contenu,
+                media_type="application/zip",
+                headers={"Content-Disposition": f"attachment; filename={filename}"},
+            )
+        return controller.generate_monthly_recaps_batch(year, month)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -259,5 +259,5 @@ class SignalementController:
         user_role: str,
     ) -> bool:
         """Supprime une réponse."""
-        use_case = DeleteReponseUseCase(self._reponse_repo)
+        use_case = DeleteReponseUseCase(self._reponse_repo, self._signalement_repo)
         return use_case.execute(reponse_id, user_id, user_role)
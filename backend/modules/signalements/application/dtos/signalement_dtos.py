@@ -41,29 +41,34 @@ class SignalementDTO:
     pourcentage_temps: float
     nb_reponses: int
     nb_escalades: int
+    derniere_reponse_at: Optional[datetime] = None
 
     @classmethod
     def from_entity(
         cls,
         entity: Signalement,
-        nb_reponses: int = 0,
+        nb_reponses: Optional[int] = None,
         get_user_name: Optional[Callable[[int], Optional[str]]] = None,
     ) -> SignalementDTO:
         """Convertit une entité Signalement en DTO.
 
+        Les noms déjà chargés sur l'entité (listes) sont utilisés tels quels ;
+        get_user_name n'est appelé que pour les noms manquants.
+
         Args:
             entity: L'entité Signalement source.
-            nb_reponses: Nombre de réponses associées.
+            nb_reponses: Nombre de réponses (défaut: compteur de l'entité).
             get_user_name: Fonction optionnelle pour résoudre les noms d'utilisateurs.
 
         Returns:
             Le DTO correspondant.
         """
-        cree_par_nom = None
-        assigne_a_nom = None
+        cree_par_nom = entity.cree_par_nom
+        assigne_a_nom = entity.assigne_a_nom
         if get_user_name:
-            cree_par_nom = get_user_name(entity.cree_par)
-            if entity.assigne_a:
+            if cree_par_nom is None:
+                cree_par_nom = get_user_name(entity.cree_par)
+            if entity.assigne_a and assigne_a_nom is None:
                 assigne_a_nom = get_user_name(entity.assigne_a)
 
         return cls(
@@ -92,8 +97,9 @@ class SignalementDTO:
             est_en_retard=entity.est_en_retard,
             temps_restant=entity.temps_restant_formatte if not entity.statut.est_resolu else None,
             pourcentage_temps=entity.pourcentage_temps_ecoule,
-            nb_reponses=nb_reponses,
+            nb_reponses=entity.nb_reponses if nb_reponses is None else nb_reponses,
             nb_escalades=entity.nb_escalades,
+            derniere_reponse_at=entity.derniere_reponse_at,
         )
 
 
@@ -7,7 +7,7 @@ les alertes et escalades correspondantes.
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from ...domain.entities import Signalement, EscaladeHistorique
 from ...domain.repositories import SignalementRepository, EscaladeRepository
@@ -70,9 +70,14 @@ class CheckSignalementsRetardUseCase:
             # Déterminer les escalades nécessaires
             escalades = self._escalade_service.determiner_escalades(signalements)
 
+            # Dernière escalade de tous les candidats en une seule requête
+            dernieres_escalades = self._escalade_repo.find_last_by_signalements(
+                [e.signalement.id for e in escalades]
+            ) if escalades else {}
+
             for escalade_info in escalades:
                 try:
-                    self._traiter_escalade(escalade_info, result)
+                    self._traiter_escalade(escalade_info, result, dernieres_escalades)
                 except Exception as e:
                     logger.error(
                         f"Erreur escalade signalement #{escalade_info.signalement.id}: {e}",
@@ -97,6 +102,7 @@ class CheckSignalementsRetardUseCase:
         self,
         escalade_info: EscaladeInfo,
         result: RetardAlertResult,
+        dernieres_escalades: Dict[int, EscaladeHistorique],
     ) -> None:
         """
         Traite une escalade individuelle.
@@ -106,11 +112,12 @@ class CheckSignalementsRetardUseCase:
         Args:
             escalade_info: Informations sur l'escalade à effectuer.
             result: Résultat en cours d'accumulation.
+            dernieres_escalades: Dernière escalade connue par signalement.
         """
         sig = escalade_info.signalement
 
         # Vérifier si cette escalade n'a pas déjà été faite
-        last_escalade = self._escalade_repo.find_last_by_signalement(sig.id)
+        last_escalade = dernieres_escalades.get(sig.id)
         if last_escalade and last_escalade.niveau == escalade_info.niveau:
             logger.debug(
                 f"Escalade {escalade_info.niveau} déjà effectuée pour #{sig.id}"
@@ -76,6 +76,7 @@ class CreateReponseUseCase:
         )
 
         reponse = self._reponse_repo.save(reponse)
+        self._signalement_repo.update_compteur_reponses(dto.signalement_id)
 
         return ReponseDTO.from_entity(reponse, self._get_user_name)
 
@@ -180,8 +181,13 @@ class UpdateReponseUseCase:
 class DeleteReponseUseCase:
     """Use case pour supprimer une réponse."""
 
-    def __init__(self, reponse_repository: ReponseRepository):
+    def __init__(
+        self,
+        reponse_repository: ReponseRepository,
+        signalement_repository: Optional[SignalementRepository] = None,
+    ):
         self._reponse_repo = reponse_repository
+        self._signalement_repo = signalement_repository
 
     def execute(
         self,
@@ -213,4 +219,7 @@ class DeleteReponseUseCase:
                 "Vous n'avez pas les droits pour supprimer cette réponse"
             )
 
-        return self._reponse_repo.delete(reponse_id)
+        supprimee = self._reponse_repo.delete(reponse_id)
+        if supprimee and self._signalement_repo:
+            self._signalement_repo.update_compteur_reponses(reponse.signalement_id)
+        return supprimee
@@ -108,9 +108,7 @@ class GetSignalementUseCase:
         if not signalement:
             raise SignalementNotFoundError(f"Signalement {signalement_id} non trouvé")
 
-        nb_reponses = self._reponse_repo.count_by_signalement(signalement_id)
-
-        return SignalementDTO.from_entity(signalement, nb_reponses, self._get_user_name)
+        return SignalementDTO.from_entity(signalement, get_user_name=self._get_user_name)
 
 
 class ListSignalementsUseCase:
@@ -155,10 +153,11 @@ class ListSignalementsUseCase:
         )
         total = self._signalement_repo.count_by_chantier(chantier_id, statut_vo, priorite_vo)
 
-        dtos = []
-        for sig in signalements:
-            nb_reponses = self._reponse_repo.count_by_signalement(sig.id)  # type: ignore
-            dtos.append(SignalementDTO.from_entity(sig, nb_reponses, self._get_user_name))
+        # Réponses et noms chargés par le repository avec la liste
+        dtos = [
+            SignalementDTO.from_entity(sig, get_user_name=self._get_user_name)
+            for sig in signalements
+        ]
 
         return SignalementListDTO(
             signalements=dtos,
@@ -212,6 +211,7 @@ class SearchSignalementsUseCase:
                 chantier_id=search_dto.chantier_id,
                 skip=search_dto.skip,
                 limit=search_dto.limit,
+                en_retard_only=search_dto.en_retard_only,
             )
         else:
             signalements, total = self._signalement_repo.find_all(
@@ -222,17 +222,14 @@ class SearchSignalementsUseCase:
                 priorite=priorite_vo,
                 date_debut=search_dto.date_debut,
                 date_fin=search_dto.date_fin,
+                en_retard_only=search_dto.en_retard_only,
             )
 
-        # Filtrer par en_retard si demandé
-        if search_dto.en_retard_only:
-            signalements = [s for s in signalements if s.est_en_retard]
-            total = len(signalements)
-
-        dtos = []
-        for sig in signalements:
-            nb_reponses = self._reponse_repo.count_by_signalement(sig.id)  # type: ignore
-            dtos.append(SignalementDTO.from_entity(sig, nb_reponses, self._get_user_name))
+        # Réponses et noms chargés par le repository avec la liste
+        dtos = [
+            SignalementDTO.from_entity(sig, get_user_name=self._get_user_name)
+            for sig in signalements
+        ]
 
         return SignalementListDTO(
             signalements=dtos,
@@ -307,9 +304,7 @@ class UpdateSignalementUseCase:
             signalement.localisation = dto.localisation.strip() if dto.localisation else None
 
         signalement = self._signalement_repo.save(signalement)
-        nb_reponses = self._reponse_repo.count_by_signalement(signalement_id)
-
-        return SignalementDTO.from_entity(signalement, nb_reponses, self._get_user_name)
+        return SignalementDTO.from_entity(signalement, get_user_name=self._get_user_name)
 
 
 class DeleteSignalementUseCase:
@@ -402,9 +397,7 @@ class AssignerSignalementUseCase:
 
         signalement.assigner(assigne_a)
         signalement = self._signalement_repo.save(signalement)
-        nb_reponses = self._reponse_repo.count_by_signalement(signalement_id)
-
-        return SignalementDTO.from_entity(signalement, nb_reponses, self._get_user_name)
+        return SignalementDTO.from_entity(signalement, get_user_name=self._get_user_name)
 
 
 class MarquerTraiteUseCase:
@@ -451,9 +444,7 @@ class MarquerTraiteUseCase:
             raise InvalidStatusTransitionError(str(e))
 
         signalement = self._signalement_repo.save(signalement)
-        nb_reponses = self._reponse_repo.count_by_signalement(signalement_id)
-
-        return SignalementDTO.from_entity(signalement, nb_reponses, self._get_user_name)
+        return SignalementDTO.from_entity(signalement, get_user_name=self._get_user_name)
 
 
 class CloturerSignalementUseCase:
@@ -502,9 +493,7 @@ class CloturerSignalementUseCase:
             raise InvalidStatusTransitionError(str(e))
 
         signalement = self._signalement_repo.save(signalement)
-        nb_reponses = self._reponse_repo.count_by_signalement(signalement_id)
-
-        return SignalementDTO.from_entity(signalement, nb_reponses, self._get_user_name)
+        return SignalementDTO.from_entity(signalement, get_user_name=self._get_user_name)
 
 
 class ReouvrirsignalementUseCase:
@@ -554,9 +543,7 @@ class ReouvrirsignalementUseCase:
             raise InvalidStatusTransitionError(str(e))
 
         signalement = self._signalement_repo.save(signalement)
-        nb_reponses = self._reponse_repo.count_by_signalement(signalement_id)
-
-        return SignalementDTO.from_entity(signalement, nb_reponses, self._get_user_name)
+        return SignalementDTO.from_entity(signalement, get_user_name=self._get_user_name)
 
 
 class GetStatistiquesUseCase:
@@ -631,10 +618,11 @@ class GetSignalementsEnRetardUseCase:
             chantier_id, skip, limit
         )
 
-        dtos = []
-        for sig in signalements:
-            nb_reponses = self._reponse_repo.count_by_signalement(sig.id)  # type: ignore
-            dtos.append(SignalementDTO.from_entity(sig, nb_reponses, self._get_user_name))
+        # Réponses et noms chargés par le repository avec la liste
+        dtos = [
+            SignalementDTO.from_entity(sig, get_user_name=self._get_user_name)
+            for sig in signalements
+        ]
 
         return SignalementListDTO(
             signalements=dtos,
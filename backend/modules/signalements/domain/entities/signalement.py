@@ -33,6 +33,8 @@ class Signalement:
         updated_at: Date de dernière modification.
         nb_escalades: Nombre d'escalades effectuées (SIG-16, SIG-17).
         derniere_escalade_at: Date de la dernière escalade.
+        nb_reponses: Nombre de réponses (dénormalisé, SIG-07).
+        derniere_reponse_at: Date de la dernière réponse.
     """
 
     chantier_id: int
@@ -53,6 +55,12 @@ class Signalement:
     updated_at: datetime = field(default_factory=datetime.now)
     nb_escalades: int = 0
     derniere_escalade_at: Optional[datetime] = None
+    nb_reponses: int = 0
+    derniere_reponse_at: Optional[datetime] = None
+
+    # Données chargées avec les listes
+    _cree_par_nom: Optional[str] = field(default=None, repr=False)
+    _assigne_a_nom: Optional[str] = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
         """Valide les données à la création."""
@@ -68,6 +76,26 @@ class Signalement:
         if self.localisation:
             self.localisation = self.localisation.strip()
 
+    @property
+    def cree_par_nom(self) -> Optional[str]:
+        """Nom du créateur (chargé avec les listes)."""
+        return self._cree_par_nom
+
+    @cree_par_nom.setter
+    def cree_par_nom(self, value: Optional[str]) -> None:
+        """Définit le nom du créateur."""
+        self._cree_par_nom = value
+
+    @property
+    def assigne_a_nom(self) -> Optional[str]:
+        """Nom de l'utilisateur assigné (chargé avec les listes)."""
+        return self._assigne_a_nom
+
+    @assigne_a_nom.setter
+    def assigne_a_nom(self, value: Optional[str]) -> None:
+        """Définit le nom de l'utilisateur assigné."""
+        self._assigne_a_nom = value
+
     @property
     def est_en_retard(self) -> bool:
         """
@@ -101,6 +129,20 @@ class Signalement:
             return self.date_resolution_souhaitee
         return self.created_at + self.priorite.delai_traitement
 
+    def date_seuil(self, pourcentage: float) -> datetime:
+        """
+        Retourne la date à laquelle un pourcentage du délai est atteint.
+
+        date_seuil(100) est la date limite de traitement ; date_seuil(50)
+        celle de la première escalade (SIG-16). Ces dates sont persistées
+        pour filtrer les retards et escalades en SQL.
+
+        Args:
+            pourcentage: Pourcentage du délai de traitement.
+        """
+        date_limite = self.date_limite_traitement
+        return self.created_at + (date_limite - self.created_at) * (pourcentage / 100)
+
     @property
     def pourcentage_temps_ecoule(self) -> float:
         """
@@ -1,7 +1,7 @@
 """Interface EscaladeRepository - Persistance de l'historique des escalades (SIG-17)."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from ..entities import EscaladeHistorique
 
@@ -34,6 +34,14 @@ class EscaladeRepository(ABC):
         """Récupère la dernière escalade d'un signalement."""
         pass
 
+    @abstractmethod
+    def find_last_by_signalements(
+        self,
+        signalement_ids: List[int],
+    ) -> Dict[int, EscaladeHistorique]:
+        """Récupère la dernière escalade de chaque signalement (une requête)."""
+        pass
+
     @abstractmethod
     def count_by_signalement(self, signalement_id: int) -> int:
         """Compte le nombre d'escalades d'un signalement."""
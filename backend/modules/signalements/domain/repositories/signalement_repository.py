@@ -75,7 +75,7 @@ class SignalementRepository(ABC):
             priorite: Filtrer par priorité (optionnel).
 
         Returns:
-            Liste des signalements.
+            Liste des signalements (réponses et noms chargés).
         """
         pass
 
@@ -89,6 +89,7 @@ class SignalementRepository(ABC):
         priorite: Optional[Priorite] = None,
         date_debut: Optional[datetime] = None,
         date_fin: Optional[datetime] = None,
+        en_retard_only: bool = False,
     ) -> Tuple[List[Signalement], int]:
         """
         Récupère tous les signalements avec filtres (vue globale admin/conducteur).
@@ -101,9 +102,10 @@ class SignalementRepository(ABC):
             priorite: Filtrer par priorité (optionnel).
             date_debut: Filtrer par date de création >= (optionnel).
             date_fin: Filtrer par date de création <= (optionnel).
+            en_retard_only: Uniquement les signalements en retard (SIG-16).
 
         Returns:
-            Tuple (liste des signalements, total count).
+            Tuple (liste des signalements avec réponses et noms chargés, total count).
         """
         pass
 
@@ -209,7 +211,7 @@ class SignalementRepository(ABC):
             limit: Nombre maximum d'éléments.
 
         Returns:
-            Liste des signalements en retard.
+            Liste des signalements en retard (réponses et noms chargés).
         """
         pass
 
@@ -236,6 +238,7 @@ class SignalementRepository(ABC):
         chantier_id: Optional[int] = None,
         skip: int = 0,
         limit: int = 100,
+        en_retard_only: bool = False,
     ) -> Tuple[List[Signalement], int]:
         """
         Recherche des signalements par texte (SIG-10).
@@ -245,9 +248,10 @@ class SignalementRepository(ABC):
             chantier_id: Filtrer par chantier (optionnel).
             skip: Nombre d'éléments à sauter.
             limit: Nombre maximum à retourner.
+            en_retard_only: Uniquement les signalements en retard (SIG-16).
 
         Returns:
-            Tuple (liste des signalements, total count).
+            Tuple (liste des signalements avec réponses et noms chargés, total count).
         """
         pass
 
@@ -270,3 +274,15 @@ class SignalementRepository(ABC):
             Dict avec les statistiques (total, par statut, par priorité, en retard, etc.).
         """
         pass
+
+    @abstractmethod
+    def update_compteur_reponses(self, signalement_id: int) -> None:
+        """
+        Recalcule le nombre de réponses et la date de la dernière réponse.
+
+        Appelé par les use cases de réponses après un ajout ou une suppression.
+
+        Args:
+            signalement_id: ID du signalement.
+        """
+        pass
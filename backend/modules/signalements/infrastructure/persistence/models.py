@@ -1,7 +1,7 @@
 """Modèles SQLAlchemy pour le module Signalements."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, Index
 from sqlalchemy.orm import relationship
 
 from shared.infrastructure.database_base import Base
@@ -11,6 +11,11 @@ class SignalementModel(Base):
     """Modèle SQLAlchemy pour les signalements."""
 
     __tablename__ = "signalements"
+    __table_args__ = (
+        # Filtres retard / escalade (SIG-16) : statut actif + échéance passée
+        Index("ix_signalements_statut_date_limite", "statut", "date_limite_resolution"),
+        Index("ix_signalements_statut_date_alerte", "statut", "date_alerte_escalade"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     chantier_id = Column(Integer, ForeignKey("chantiers.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -28,6 +33,12 @@ class SignalementModel(Base):
     localisation = Column(String(255), nullable=True)
     nb_escalades = Column(Integer, nullable=False, default=0)
     derniere_escalade_at = Column(DateTime, nullable=True)
+    # Échéances dérivées de la priorité et des dates (recalculées à chaque save)
+    date_limite_resolution = Column(DateTime, nullable=True)  # 100% du délai
+    date_alerte_escalade = Column(DateTime, nullable=True)  # 50% du délai
+    # Compteur de réponses dénormalisé (maintenu par les use cases réponses)
+    nb_reponses = Column(Integer, nullable=False, default=0, server_default="0")
+    derniere_reponse_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.now)
     updated_at = Column(DateTime, nullable=False, default=datetime.now, onupdate=datetime.now)
 
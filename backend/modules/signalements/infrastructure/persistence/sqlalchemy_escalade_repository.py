@@ -2,9 +2,10 @@
 
 import json
 import logging
-from typing import Optional, List
+from typing import Dict, Optional, List
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, aliased
 
 from .models import EscaladeHistoriqueModel
 from ...domain.entities import EscaladeHistorique
@@ -64,6 +65,34 @@ class SQLAlchemyEscaladeRepository(EscaladeRepository):
             return None
         return self._to_entity(model)
 
+    def find_last_by_signalements(
+        self,
+        signalement_ids: List[int],
+    ) -> Dict[int, EscaladeHistorique]:
+        """Récupère la dernière escalade de chaque signalement (une requête)."""
+        if not signalement_ids:
+            return {}
+
+        rang = (
+            func.row_number()
+            .over(
+                partition_by=EscaladeHistoriqueModel.signalement_id,
+                order_by=(
+                    EscaladeHistoriqueModel.created_at.desc(),
+                    EscaladeHistoriqueModel.id.desc(),
+                ),
+            )
+            .label("rang")
+        )
+        sous_requete = (
+            self._session.query(EscaladeHistoriqueModel, rang)
+            .filter(EscaladeHistoriqueModel.signalement_id.in_(set(signalement_ids)))
+            .subquery()
+        )
+        derniere = aliased(EscaladeHistoriqueModel, sous_requete)
+        models = self._session.query(derniere).filter(sous_requete.c.rang == 1).all()
+        return {m.signalement_id: self._to_entity(m) for m in models}
+
     def count_by_signalement(self, signalement_id: int) -> int:
         """Compte le nombre d'escalades d'un signalement."""
         return (
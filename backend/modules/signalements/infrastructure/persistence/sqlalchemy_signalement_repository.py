@@ -4,13 +4,19 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, case
+from sqlalchemy import func, or_, case, column, select, table
 
-from .models import SignalementModel
+from .models import SignalementModel, ReponseModel
 from ...domain.entities import Signalement
 from ...domain.repositories import SignalementRepository
 from ...domain.value_objects import Priorite, StatutSignalement
 
+# Statuts non résolus (seuls concernés par les retards et escalades)
+STATUTS_ACTIFS = [s.value for s in StatutSignalement if s.est_actif]
+
+# Table users en lecture seule (noms affichés dans les listes)
+_users = table("users", column("id"), column("prenom"), column("nom"))
+
 
 class SQLAlchemySignalementRepository(SignalementRepository):
     """Implémentation SQLAlchemy du repository Signalement."""
@@ -55,6 +61,8 @@ class SQLAlchemySignalementRepository(SignalementRepository):
                 localisation=signalement.localisation,
                 nb_escalades=signalement.nb_escalades,
                 derniere_escalade_at=signalement.derniere_escalade_at,
+                date_limite_resolution=signalement.date_limite_traitement,
+                date_alerte_escalade=signalement.date_seuil(50),
                 created_at=signalement.created_at,
                 updated_at=signalement.updated_at,
             )
@@ -82,6 +90,9 @@ class SQLAlchemySignalementRepository(SignalementRepository):
                 model.localisation = signalement.localisation
                 model.nb_escalades = signalement.nb_escalades
                 model.derniere_escalade_at = signalement.derniere_escalade_at
+                # Priorité ou date souhaitée ont pu changer : recalcul des échéances
+                model.date_limite_resolution = signalement.date_limite_traitement
+                model.date_alerte_escalade = signalement.date_seuil(50)
                 model.updated_at = datetime.now()
                 self._session.commit()
 
@@ -123,14 +134,10 @@ class SQLAlchemySignalementRepository(SignalementRepository):
             (SignalementModel.priorite == "basse", 4),
             else_=5
         )
-        query = query.order_by(
-            priority_order,
-            SignalementModel.created_at.desc(),
+        return self._charger_page(
+            query, (priority_order, SignalementModel.created_at.desc()), skip, limit
         )
 
-        models = query.offset(skip).limit(limit).all()
-        return [self._to_entity(m) for m in models]
-
     def find_all(
         self,
         skip: int = 0,
@@ -140,10 +147,16 @@ class SQLAlchemySignalementRepository(SignalementRepository):
         priorite: Optional[Priorite] = None,
         date_debut: Optional[datetime] = None,
         date_fin: Optional[datetime] = None,
+        en_retard_only: bool = False,
     ) -> Tuple[List[Signalement], int]:
         """Récupère tous les signalements avec filtres."""
         query = self._session.query(SignalementModel)
 
+        if en_retard_only:
+            query = self._filtrer_echeance_depassee(
+                query, SignalementModel.date_limite_resolution
+            )
+
         if chantier_ids:
             query = query.filter(SignalementModel.chantier_id.in_(chantier_ids))
 
@@ -161,10 +174,10 @@ class SQLAlchemySignalementRepository(SignalementRepository):
 
         total = query.count()
 
-        query = query.order_by(SignalementModel.created_at.desc())
-        models = query.offset(skip).limit(limit).all()
-
-        return [self._to_entity(m) for m in models], total
+        signalements = self._charger_page(
+            query, (SignalementModel.created_at.desc(),), skip, limit
+        )
+        return signalements, total
 
     def find_by_createur(
         self,
@@ -251,46 +264,46 @@ class SQLAlchemySignalementRepository(SignalementRepository):
         skip: int = 0,
         limit: int = 100,
     ) -> List[Signalement]:
-        """Récupère les signalements en retard."""
-        datetime.now()
-
-        # Signalements actifs (non résolus)
-        query = self._session.query(SignalementModel).filter(
-            SignalementModel.statut.in_(["ouvert", "en_cours"])
+        """Récupère les signalements en retard (échéance persistée dépassée)."""
+        query = self._filtrer_echeance_depassee(
+            self._session.query(SignalementModel),
+            SignalementModel.date_limite_resolution,
         )
 
         if chantier_id:
             query = query.filter(SignalementModel.chantier_id == chantier_id)
 
-        models = query.order_by(SignalementModel.created_at).all()
-
-        # Filtrer en retard côté Python pour la logique complexe
-        en_retard = []
-        for model in models:
-            entity = self._to_entity(model)
-            if entity.est_en_retard:
-                en_retard.append(entity)
-
-        return en_retard[skip:skip + limit]
+        return self._charger_page(query, (SignalementModel.created_at,), skip, limit)
 
     def find_a_escalader(
         self,
         seuil_pourcentage: float = 50.0,
     ) -> List[Signalement]:
-        """Récupère les signalements nécessitant une escalade."""
-        # Signalements actifs
-        models = self._session.query(SignalementModel).filter(
-            SignalementModel.statut.in_(["ouvert", "en_cours"])
-        ).all()
+        """
+        Récupère les signalements nécessitant une escalade.
 
-        # Filtrer selon le pourcentage
-        a_escalader = []
-        for model in models:
-            entity = self._to_entity(model)
-            if entity.pourcentage_temps_ecoule >= seuil_pourcentage:
-                a_escalader.append(entity)
+        Les seuils 50% et 100% correspondent exactement aux échéances
+        persistées (prédicat indexé). Pour un autre seuil, l'échéance
+        immédiatement inférieure sert de préfiltre SQL et le pourcentage
+        exact est vérifié sur les seuls candidats.
+        """
+        query = self._session.query(SignalementModel)
+
+        if seuil_pourcentage >= 100:
+            query = self._filtrer_echeance_depassee(
+                query, SignalementModel.date_limite_resolution
+            )
+        elif seuil_pourcentage >= 50:
+            query = self._filtrer_echeance_depassee(
+                query, SignalementModel.date_alerte_escalade
+            )
+        else:
+            query = query.filter(SignalementModel.statut.in_(STATUTS_ACTIFS))
 
-        return a_escalader
+        entities = [self._to_entity(m) for m in query.all()]
+        if seuil_pourcentage in (50.0, 100.0):
+            return entities
+        return [e for e in entities if e.pourcentage_temps_ecoule >= seuil_pourcentage]
 
     def search(
         self,
@@ -298,6 +311,7 @@ class SQLAlchemySignalementRepository(SignalementRepository):
         chantier_id: Optional[int] = None,
         skip: int = 0,
         limit: int = 100,
+        en_retard_only: bool = False,
     ) -> Tuple[List[Signalement], int]:
         """Recherche des signalements par texte."""
         search_query = self._session.query(SignalementModel).filter(
@@ -308,6 +322,11 @@ class SQLAlchemySignalementRepository(SignalementRepository):
             )
         )
 
+        if en_retard_only:
+            search_query = self._filtrer_echeance_depassee(
+                search_query, SignalementModel.date_limite_resolution
+            )
+
         if chantier_id:
             search_query = search_query.filter(
                 SignalementModel.chantier_id == chantier_id
@@ -315,11 +334,10 @@ class SQLAlchemySignalementRepository(SignalementRepository):
 
         total = search_query.count()
 
-        models = search_query.order_by(
-            SignalementModel.created_at.desc()
-        ).offset(skip).limit(limit).all()
-
-        return [self._to_entity(m) for m in models], total
+        signalements = self._charger_page(
+            search_query, (SignalementModel.created_at.desc(),), skip, limit
+        )
+        return signalements, total
 
     def get_statistiques(
         self,
@@ -392,6 +410,102 @@ class SQLAlchemySignalementRepository(SignalementRepository):
             "taux_resolution": taux_resolution,
         }
 
+    def update_compteur_reponses(self, signalement_id: int) -> None:
+        """Recalcule le compteur de réponses en une requête UPDATE."""
+        self._session.query(SignalementModel).filter(
+            SignalementModel.id == signalement_id
+        ).update(
+            {
+                SignalementModel.nb_reponses: (
+                    select(func.count(ReponseModel.id))
+                    .where(ReponseModel.signalement_id == signalement_id)
+                    .scalar_subquery()
+                ),
+                SignalementModel.derniere_reponse_at: (
+                    select(func.max(ReponseModel.created_at))
+                    .where(ReponseModel.signalement_id == signalement_id)
+                    .scalar_subquery()
+                ),
+                # Une réponse ne modifie pas le signalement lui-même
+                SignalementModel.updated_at: SignalementModel.updated_at,
+            },
+            synchronize_session=False,
+        )
+        self._session.commit()
+
+    def _charger_page(self, query, order_by: tuple, skip: int, limit: int) -> List[Signalement]:
+        """
+        Charge une page de signalements avec réponses et noms, en une requête.
+
+        La page (ids) est sélectionnée en sous-requête ; les réponses sont
+        agrégées (nombre, dernière date) sur cette seule page, et les noms
+        du créateur et de l'assigné sont joints depuis users.
+
+        Args:
+            query: Requête filtrée sur SignalementModel.
+            order_by: Critères de tri (appliqués à la page puis au résultat).
+            skip: Nombre d'éléments à sauter.
+            limit: Nombre maximum d'éléments.
+
+        Returns:
+            Liste des signalements de la page.
+        """
+        page = (
+            query.with_entities(SignalementModel.id)
+            .order_by(*order_by)
+            .offset(skip)
+            .limit(limit)
+            .subquery()
+        )
+        stats = (
+            select(
+                ReponseModel.signalement_id,
+                func.count(ReponseModel.id).label("nb_reponses"),
+                func.max(ReponseModel.created_at).label("derniere_reponse_at"),
+            )
+            .where(ReponseModel.signalement_id.in_(select(page.c.id)))
+            .group_by(ReponseModel.signalement_id)
+            .subquery()
+        )
+        createur = _users.alias("createur")
+        assigne = _users.alias("assigne")
+
+        rows = (
+            self._session.query(
+                SignalementModel,
+                stats.c.nb_reponses,
+                stats.c.derniere_reponse_at,
+                createur.c.prenom,
+                createur.c.nom,
+                assigne.c.prenom,
+                assigne.c.nom,
+            )
+            .join(page, page.c.id == SignalementModel.id)
+            .outerjoin(stats, stats.c.signalement_id == SignalementModel.id)
+            .outerjoin(createur, createur.c.id == SignalementModel.cree_par)
+            .outerjoin(assigne, assigne.c.id == SignalementModel.assigne_a)
+            .order_by(*order_by)
+            .all()
+        )
+
+        signalements = []
+        for model, nb_reponses, derniere_reponse_at, c_prenom, c_nom, a_prenom, a_nom in rows:
+            entity = self._to_entity(model)
+            entity.nb_reponses = nb_reponses or 0
+            entity.derniere_reponse_at = derniere_reponse_at
+            entity.cree_par_nom = f"{c_prenom} {c_nom}" if c_nom else None
+            entity.assigne_a_nom = f"{a_prenom} {a_nom}" if a_nom else None
+            signalements.append(entity)
+        return signalements
+
+    @staticmethod
+    def _filtrer_echeance_depassee(query, colonne_echeance):
+        """Restreint aux signalements actifs dont l'échéance est dépassée."""
+        return query.filter(
+            SignalementModel.statut.in_(STATUTS_ACTIFS),
+            colonne_echeance < datetime.now(),
+        )
+
     def _to_entity(self, model: SignalementModel) -> Signalement:
         """Convertit un modèle SQLAlchemy en entité de domaine."""
         return Signalement(
@@ -411,6 +525,8 @@ class SQLAlchemySignalementRepository(SignalementRepository):
             localisation=model.localisation,
             nb_escalades=model.nb_escalades,
             derniere_escalade_at=model.derniere_escalade_at,
+            nb_reponses=model.nb_reponses or 0,
+            derniere_reponse_at=model.derniere_reponse_at,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
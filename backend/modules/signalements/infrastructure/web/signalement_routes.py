@@ -106,6 +106,7 @@ class SignalementResponse(BaseModel):
     pourcentage_temps: float
     nb_reponses: int
     nb_escalades: int
+    derniere_reponse_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -4,7 +4,7 @@ from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from shared.infrastructure.database import get_db
-from shared.infrastructure.pdf import PdfGeneratorService
+from shared.infrastructure.pdf import PdfGeneratorService, get_pdf_render_cache
 from shared.infrastructure.audit import AuditService
 from ...adapters.controllers import TacheController
 from ..persistence import (
@@ -27,7 +27,7 @@ def get_tache_controller(db: Session = Depends(get_db)) -> TacheController:
     tache_repo = SQLAlchemyTacheRepository(db)
     template_repo = SQLAlchemyTemplateModeleRepository(db)
     feuille_repo = SQLAlchemyFeuilleTacheRepository(db)
-    pdf_service = PdfGeneratorService()
+    pdf_service = PdfGeneratorService(render_cache=get_pdf_render_cache())
     audit_service = AuditService(db)
 
     return TacheController(
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark des sessions synchrones et asynchrones sur une route de lecture.
+
+Exécute le use case GetNotifications (route GET /api/notifications) de deux
+façons, avec la même concurrence :
+- sync : Session synchrone dans un pool de threads borné, comme une route
+  ``def`` FastAPI (40 threads, la taille par défaut de Starlette) ;
+- async : AsyncSession via run_in_session, comme les routes ``async def``
+  branchées sur get_async_db.
+
+La base utilisée est celle de DATABASE_URL (PostgreSQL avec asyncpg, ou
+SQLite avec aiosqlite). Le pool de chaque moteur suit les réglages
+DB_POOL_SIZE / DB_ASYNC_POOL_SIZE de settings.
+
+Usage:
+    python scripts/benchmark_async_db.py [--requests 2000] [--concurrency 200] [--user-id 1]
+"""
+
+import sys
+import argparse
+import asyncio
+import statistics
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import anyio
+
+from shared.infrastructure.database import (
+    SessionLocal,
+    dispose_async_engine,
+    get_async_db,
+    run_in_session,
+)
+from modules.notifications.infrastructure.web.dependencies import build_notifications_use_case
+
+STARLETTE_THREADPOOL_SIZE = 40
+
+
+def _lire_sync(user_id: int) -> None:
+    db = SessionLocal()
+    try:
+        build_notifications_use_case(db).execute(user_id=user_id, limit=50)
+    finally:
+        db.close()
+
+
+async def _requete_sync(user_id: int, limiter: anyio.CapacityLimiter) -> float:
+    debut = time.perf_counter()
+    await anyio.to_thread.run_sync(_lire_sync, user_id, limiter=limiter)
+    return time.perf_counter() - debut
+
+
+async def _requete_async(user_id: int) -> float:
+    debut = time.perf_counter()
+    async for db in get_async_db():
+        await run_in_session(
+            db,
+            lambda session: build_notifications_use_case(session).execute(
+                user_id=user_id, limit=50
+            ),
+        )
+    return time.perf_counter() - debut
+
+
+async def _mesurer(nom: str, requete, nb_requetes: int, concurrence: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrence)
+
+    async def borne():
+        async with semaphore:
+            return await requete()
+
+    await requete()  # Préchauffage (connexions, imports)
+    debut = time.perf_counter()
+    latences = await asyncio.gather(*(borne() for _ in range(nb_requetes)))
+    duree = time.perf_counter() - debut
+    latences = sorted(latences)
+    return {
+        "mode": nom,
+        "req_s": nb_requetes / duree,
+        "p50_ms": statistics.median(latences) * 1000,
+        "p95_ms": latences[int(len(latences) * 0.95) - 1] * 1000,
+    }
+
+
+async def run_benchmark(nb_requetes: int, concurrence: int, user_id: int) -> list:
+    """Mesure le débit des deux modes et retourne les résultats."""
+    limiter = anyio.CapacityLimiter(STARLETTE_THREADPOOL_SIZE)
+    try:
+        return [
+            await _mesurer(
+                "sync (threadpool)", lambda: _requete_sync(user_id, limiter),
+                nb_requetes, concurrence,
+            ),
+            await _mesurer(
+                "async (get_async_db)", lambda: _requete_async(user_id),
+                nb_requetes, concurrence,
+            ),
+        ]
+    finally:
+        await dispose_async_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=2000, help="Nombre de requêtes par mode")
+    parser.add_argument("--concurrency", type=int, default=200, help="Requêtes simultanées")
+    parser.add_argument("--user-id", type=int, default=1, help="Utilisateur lu")
+    args = parser.parse_args()
+
+    resultats = asyncio.run(run_benchmark(args.requests, args.concurrency, args.user_id))
+
+    print(f"{'mode':<22} {'req/s':>10} {'p50 (ms)':>10} {'p95 (ms)':>10}")
+    for r in resultats:
+        print(f"{r['mode']:<22} {r['req_s']:>10.1f} {r['p50_ms']:>10.1f} {r['p95_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
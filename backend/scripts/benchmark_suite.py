@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks des parcours critiques sur un jeu de données synthétique.
+
+Scénarios mesurés (use cases appelés comme par les routes) :
+- planning_charge : planning de charge sur un trimestre (GET /api/planning-charge) ;
+- consolidation : vue consolidée des finances (GET /api/financier/finances/consolidation),
+  uniquement sur PostgreSQL ;
+- feed : première page du fil d'actualités (GET /api/dashboard/feed) ;
+- devis_recalcul : recalcul des totaux du devis le plus volumineux ;
+- export_feuilles : export CSV des pointages du dernier mois ;
+- chantiers_liste : liste paginée des chantiers avec responsables.
+
+Sans --database-url, une base SQLite temporaire est créée et remplie par
+scripts/synthetic_data.py à l'échelle demandée. Chaque scénario est exécuté
+dans une session annulée (rollback) après chaque tour.
+
+Les résultats (min / médiane / p95) sont écrits en JSON et peuvent être
+comparés à une référence : le script sort en erreur (code 1) si une médiane
+dépasse celle de la référence de plus de --tolerance.
+
+Usage:
+    python scripts/benchmark_suite.py --scale medium --output bench.json
+    python scripts/benchmark_suite.py --scale medium --baseline bench.json --tolerance 0.25
+    python scripts/benchmark_suite.py --database-url postgresql://... --only feed,consolidation
+"""
+
+import sys
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import sqlalchemy
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from scripts.synthetic_data import SCALES, generate_synthetic_data
+
+DEFAULT_ROUNDS = 10
+DEFAULT_TOLERANCE = 0.25
+
+
+def _contexte(db: Session) -> dict:
+    """Identifiants utilisés par les scénarios, lus dans la base."""
+    from modules.auth.infrastructure.persistence import UserModel
+    from modules.chantiers.infrastructure.persistence import ChantierModel
+    from modules.devis.infrastructure.persistence.models import LigneDevisModel, LotDevisModel
+    from modules.pointages.infrastructure.persistence import PointageModel
+
+    derniere_date = db.execute(select(func.max(PointageModel.date_pointage))).scalar()
+    devis_id = db.execute(
+        select(LotDevisModel.devis_id)
+        .join(LigneDevisModel, LigneDevisModel.lot_devis_id == LotDevisModel.id)
+        .group_by(LotDevisModel.devis_id)
+        .order_by(func.count(LigneDevisModel.id).desc())
+        .limit(1)
+    ).scalar()
+    return {
+        "admin_id": db.execute(
+            select(func.min(UserModel.id)).where(UserModel.role == "admin")
+        ).scalar(),
+        "chantier_ids": list(db.execute(select(ChantierModel.id)).scalars()),
+        "date_reference": derniere_date + timedelta(days=1) if derniere_date else None,
+        "devis_id": devis_id,
+    }
+
+
+def _planning_charge(db: Session, ctx: dict) -> None:
+    from modules.planning.adapters.controllers.charge.planning_charge_schemas import (
+        PlanningChargeFiltersRequest,
+    )
+    from modules.planning.infrastructure.web.charge_routes import build_charge_controller
+
+    debut = ctx["date_reference"].isocalendar()
+    fin = (ctx["date_reference"] + timedelta(weeks=12)).isocalendar()
+    build_charge_controller(db).get_planning_charge(PlanningChargeFiltersRequest(
+        semaine_debut=f"S{debut[1]:02d}-{debut[0]}",
+        semaine_fin=f"S{fin[1]:02d}-{fin[0]}",
+    ))
+
+
+def _consolidation(db: Session, ctx: dict) -> None:
+    from modules.financier.infrastructure.web.dependencies import get_vue_consolidee_use_case
+
+    get_vue_consolidee_use_case(db).execute(user_accessible_chantier_ids=ctx["chantier_ids"])
+
+
+def _feed(db: Session, ctx: dict) -> None:
+    from modules.dashboard.infrastructure.web.dependencies import build_feed_use_case
+
+    build_feed_use_case(db).execute(
+        user_id=ctx["admin_id"], user_chantier_ids=ctx["chantier_ids"], limit=20, offset=0,
+    )
+
+
+def _devis_recalcul(db: Session, ctx: dict) -> None:
+    from modules.devis.infrastructure.web import dependencies as devis
+
+    devis.get_calculer_totaux_use_case(
+        devis.get_devis_repository(db),
+        devis.get_lot_devis_repository(db),
+        devis.get_ligne_devis_repository(db),
+        devis.get_debourse_detail_repository(db),
+        devis.get_journal_devis_repository(db),
+        devis.get_frais_chantier_repository(db),
+    ).execute(ctx["devis_id"], updated_by=ctx["admin_id"])
+
+
+def _export_feuilles(db: Session, ctx: dict) -> None:
+    from modules.pointages.application.dtos.export_dtos import ExportFeuilleHeuresDTO, FormatExport
+    from modules.pointages.application.use_cases.export_feuille_heures import (
+        ExportFeuilleHeuresUseCase,
+    )
+    from modules.pointages.infrastructure.persistence import (
+        SQLAlchemyFeuilleHeuresRepository,
+        SQLAlchemyPointageRepository,
+    )
+
+    result = ExportFeuilleHeuresUseCase(
+        SQLAlchemyFeuilleHeuresRepository(db), SQLAlchemyPointageRepository(db),
+    ).execute(
+        ExportFeuilleHeuresDTO(
+            format_export=FormatExport.CSV,
+            date_debut=ctx["date_reference"] - timedelta(days=31),
+            date_fin=ctx["date_reference"],
+        ),
+        exported_by=ctx["admin_id"],
+    )
+    if not result.success:
+        raise RuntimeError(result.error_message)
+
+
+def _chantiers_liste(db: Session, ctx: dict) -> None:
+    from modules.auth.infrastructure.web.dependencies import get_user_repository
+    from modules.chantiers.infrastructure.web.chantier_presenter import transform_chantiers_list
+    from modules.chantiers.infrastructure.web.dependencies import (
+        build_chantier_controller,
+        get_chantier_repository,
+    )
+
+    result = build_chantier_controller(db).list(skip=0, limit=100)
+    transform_chantiers_list(
+        result["chantiers"], get_user_repository(db), get_chantier_repository(db),
+    )
+
+
+SCENARIOS: Dict[str, Callable[[Session, dict], None]] = {
+    "planning_charge": _planning_charge,
+    "consolidation": _consolidation,
+    "feed": _feed,
+    "devis_recalcul": _devis_recalcul,
+    "export_feuilles": _export_feuilles,
+    "chantiers_liste": _chantiers_liste,
+}
+
+# Scénarios reposant sur du SQL propre à PostgreSQL (coût main d'oeuvre : date_trunc)
+POSTGRESQL_ONLY = {"consolidation"}
+
+
+def _percentile(durees: List[float], pct: float) -> float:
+    durees = sorted(durees)
+    return durees[min(len(durees) - 1, max(0, round(len(durees) * pct) - 1))]
+
+
+def measure(
+    session_factory: Callable[[], Session],
+    scenario: Callable[[Session, dict], None],
+    ctx: dict,
+    rounds: int = DEFAULT_ROUNDS,
+) -> dict:
+    """
+    Exécute un scénario plusieurs fois et retourne ses statistiques (ms).
+
+    Un tour de préchauffage (imports, caches) n'est pas compté. Chaque tour
+    utilise une session neuve, annulée à la fin.
+    """
+    durees = []
+    for tour in range(rounds + 1):
+        db = session_factory()
+        try:
+            debut = time.perf_counter()
+            scenario(db, ctx)
+            duree = time.perf_counter() - debut
+        finally:
+            db.rollback()
+            db.close()
+        if tour:
+            durees.append(duree * 1000)
+    return {
+        "rounds": rounds,
+        "min_ms": round(min(durees), 3),
+        "median_ms": round(statistics.median(durees), 3),
+        "p95_ms": round(_percentile(durees, 0.95), 3),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> List[dict]:
+    """
+    Compare les médianes à une référence.
+
+    Args:
+        results: Résultats courants (clé "results" du JSON).
+        baseline: Résultats de référence (même format).
+        tolerance: Dégradation relative tolérée (0.25 = +25 %).
+
+    Returns:
+        Une entrée par scénario commun, avec le ratio et l'indicateur de régression.
+    """
+    comparaison = []
+    for nom, courant in results.items():
+        reference = baseline.get(nom)
+        if not reference or not reference.get("median_ms"):
+            continue
+        ratio = courant["median_ms"] / reference["median_ms"]
+        comparaison.append({
+            "scenario": nom,
+            "baseline_ms": reference["median_ms"],
+            "median_ms": courant["median_ms"],
+            "ratio": round(ratio, 3),
+            "regression": ratio > 1 + tolerance,
+        })
+    return comparaison
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=Path(__file__).parent, check=True,
+        ).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _base_synthetique(scale: str, dossier: Path) -> Engine:
+    """Crée une base SQLite temporaire remplie par le générateur."""
+    from shared.infrastructure.database_base import Base
+
+    engine = create_engine(f"sqlite:///{dossier / 'benchmark.db'}")
+    _charger_modeles()
+    Base.metadata.create_all(bind=engine)
+    debut = time.perf_counter()
+    counts = generate_synthetic_data(engine, SCALES[scale])
+    print(f"Jeu '{scale}' : {sum(counts.values())} lignes en {time.perf_counter() - debut:.1f} s")
+    return engine
+
+
+def _charger_modeles() -> None:
+    """Importe les modèles de tous les modules (métadonnées complètes)."""
+    import importlib
+    import pkgutil
+
+    import modules
+
+    for module in pkgutil.iter_modules(modules.__path__):
+        try:
+            importlib.import_module(f"modules.{module.name}.infrastructure.persistence")
+        except ModuleNotFoundError:
+            continue
+
+
+def run_suite(engine: Engine, scenarios: List[str], rounds: int) -> dict:
+    """Exécute les scénarios et retourne les résultats par scénario."""
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as db:
+        ctx = _contexte(db)
+    results = {}
+    for nom in scenarios:
+        if nom in POSTGRESQL_ONLY and engine.dialect.name != "postgresql":
+            print(f"{nom} ignoré : PostgreSQL requis ({engine.dialect.name})")
+            continue
+        results[nom] = measure(session_factory, SCENARIOS[nom], ctx, rounds)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small", help="Échelle du jeu généré")
+    parser.add_argument("--database-url", help="Base déjà remplie (pas de génération)")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="Tours mesurés par scénario")
+    parser.add_argument("--only", help="Scénarios à exécuter, séparés par des virgules")
+    parser.add_argument("--output", type=Path, help="Fichier JSON des résultats")
+    parser.add_argument("--baseline", type=Path, help="Fichier JSON de référence à comparer")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+        help="Dégradation tolérée de la médiane (0.25 = +25 %%)",
+    )
+    args = parser.parse_args()
+
+    scenarios = args.only.split(",") if args.only else list(SCENARIOS)
+    inconnus = set(scenarios) - set(SCENARIOS)
+    if inconnus:
+        parser.error(f"Scénarios inconnus : {', '.join(sorted(inconnus))}")
+
+    with tempfile.TemporaryDirectory() as dossier:
+        if args.database_url:
+            _charger_modeles()
+            engine = create_engine(args.database_url)
+        else:
+            engine = _base_synthetique(args.scale, Path(dossier))
+        try:
+            results = run_suite(engine, scenarios, args.rounds)
+        finally:
+            engine.dispose()
+
+    rapport = {
+        "meta": {
+            "commit": _git_commit(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "database": engine.dialect.name,
+            "scale": None if args.database_url else args.scale,
+            "spec": None if args.database_url else asdict(SCALES[args.scale]),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(rapport, indent=2, default=str) + "\n")
+
+    print(f"{'scenario':<18} {'min (ms)':>10} {'med (ms)':>10} {'p95 (ms)':>10}")
+    for nom, r in results.items():
+        print(f"{nom:<18} {r['min_ms']:>10.1f} {r['median_ms']:>10.1f} {r['p95_ms']:>10.1f}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        comparaison = compare(results, baseline, args.tolerance)
+        print(f"\n{'scenario':<18} {'ref (ms)':>10} {'med (ms)':>10} {'ratio':>8}")
+        for c in comparaison:
+            alerte = "  REGRESSION" if c["regression"] else ""
+            print(
+                f"{c['scenario']:<18} {c['baseline_ms']:>10.1f} {c['median_ms']:>10.1f} "
+                f"{c['ratio']:>8.2f}{alerte}"
+            )
+        if any(c["regression"] for c in comparaison):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+Générateur de données synthétiques à grande échelle (benchmarks, recette).
+
+Contrairement à seed_demo_data (entreprise de démo fixe, ``db.add`` ligne à
+ligne), ce générateur est paramétrable et insère en masse : INSERT
+multi-lignes par lots de BATCH_SIZE, sans passer par l'ORM ni par les
+événements de domaine. Le jeu produit est déterministe pour une graine donnée.
+
+Données générées :
+- utilisateurs (admin, conducteurs, chefs, compagnons avec métiers) ;
+- chantiers avec responsables et ouvriers (tables de jointure) ;
+- affectations et pointages sur plusieurs années, besoins de charge ;
+- fournisseurs, budgets, lots budgétaires, achats, situations et factures ;
+- devis avec lots, lignes et déboursés ;
+- posts du fil d'actualités, commentaires et likes.
+
+Usage:
+    python scripts/synthetic_data.py --scale medium --database-url sqlite:///./data/bench.db --create-schema
+    python scripts/synthetic_data.py --chantiers 200 --employes 800 --semaines 156 --achats 20000
+"""
+
+import sys
+import argparse
+import random
+import time
+from dataclasses import dataclass, field, fields, replace
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.engine import Connection, Engine
+
+from modules.auth.infrastructure.persistence import UserModel
+from modules.chantiers.infrastructure.persistence import ChantierModel
+from modules.chantiers.infrastructure.persistence.chantier_responsable_model import (
+    ChantierChefModel,
+    ChantierConducteurModel,
+    ChantierOuvrierModel,
+)
+from modules.dashboard.infrastructure.persistence import CommentModel, LikeModel, PostModel
+from modules.dashboard.infrastructure.persistence.models import PostTargetChantierModel
+from modules.devis.infrastructure.persistence.models import (
+    DebourseDetailModel,
+    DevisModel,
+    LigneDevisModel,
+    LotDevisModel,
+)
+from modules.financier.infrastructure.persistence import (
+    AchatModel,
+    BudgetModel,
+    FactureClientModel,
+    FournisseurModel,
+    LotBudgetaireModel,
+    SituationTravauxModel,
+)
+from modules.planning.infrastructure.persistence import AffectationModel, BesoinChargeModel
+from modules.pointages.infrastructure.persistence import PointageModel
+from shared.infrastructure.database_base import Base
+
+BATCH_SIZE = 5000
+
+METIERS = ["macon", "coffreur", "ferrailleur", "charpentier", "couvreur", "electricien"]
+STATUTS_CHANTIER = (["en_cours"] * 14) + (["ouvert"] * 3) + (["receptionne"] * 2) + ["ferme"]
+STATUTS_ACHAT = (["livre"] * 5) + (["facture"] * 3) + (["commande"] * 2) + ["valide", "demande"]
+TYPES_ACHAT = (["materiau"] * 6) + (["materiel"] * 2) + ["service", "sous_traitance"]
+TYPES_FOURNISSEUR = ["negoce_materiaux", "loueur", "sous_traitant", "service"]
+UNITES_LIGNE = ["m2", "m3", "ml", "u", "forfait"]
+
+
+@dataclass(frozen=True)
+class SyntheticDataSpec:
+    """Volumes du jeu de données synthétique."""
+
+    chantiers: int = 50
+    employes: int = 200
+    semaines: int = 104  # Historique d'affectations / pointages
+    semaines_charge: int = 26  # Besoins de charge à venir
+    achats: int = 5000
+    devis: int = 20
+    lignes_par_devis: int = 200
+    posts: int = 500
+    seed: int = 42
+    date_reference: date = field(default=date(2026, 1, 5))  # Un lundi
+
+
+# Échelles prédéfinies (--scale)
+SCALES: Dict[str, SyntheticDataSpec] = {
+    "small": SyntheticDataSpec(
+        chantiers=12, employes=40, semaines=13, semaines_charge=8,
+        achats=600, devis=3, lignes_par_devis=100, posts=120,
+    ),
+    "medium": SyntheticDataSpec(),
+    "large": SyntheticDataSpec(
+        chantiers=200, employes=800, semaines=156, semaines_charge=52,
+        achats=25000, devis=100, lignes_par_devis=400, posts=5000,
+    ),
+}
+
+
+class _Ids:
+    """Attribution d'identifiants à la suite des données existantes."""
+
+    def __init__(self, conn: Connection):
+        self._conn = conn
+        self._next: Dict[str, int] = {}
+
+    def take(self, table, count: int) -> range:
+        if table.name not in self._next:
+            current = self._conn.execute(select(func.max(table.c.id))).scalar() or 0
+            self._next[table.name] = current + 1
+        start = self._next[table.name]
+        self._next[table.name] = start + count
+        return range(start, start + count)
+
+
+def _insert(conn: Connection, table, rows: Iterable[dict]) -> int:
+    """Insère les lignes par lots (executemany) et retourne leur nombre."""
+    total = 0
+    batch: List[dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            conn.execute(insert(table), batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        conn.execute(insert(table), batch)
+        total += len(batch)
+    return total
+
+
+def _jours_ouvres(debut: date, fin: date) -> Iterator[date]:
+    jour = debut
+    while jour < fin:
+        if jour.weekday() < 5:
+            yield jour
+        jour += timedelta(days=1)
+
+
+def generate_synthetic_data(bind: Engine, spec: SyntheticDataSpec) -> Dict[str, int]:
+    """
+    Génère le jeu de données dans la base (les tables doivent exister).
+
+    Args:
+        bind: Moteur de la base cible.
+        spec: Volumes à générer.
+
+    Returns:
+        Nombre de lignes insérées par table.
+    """
+    rng = random.Random(spec.seed)
+    maintenant = datetime.combine(spec.date_reference, datetime.min.time())
+    debut_historique = spec.date_reference - timedelta(weeks=spec.semaines)
+    counts: Dict[str, int] = {}
+
+    with bind.begin() as conn:
+        ids = _Ids(conn)
+
+        # --- Utilisateurs ---------------------------------------------------
+        user_ids = list(ids.take(UserModel.__table__, spec.employes + 1))
+        admin_id = user_ids[0]
+        nb_conducteurs = max(1, spec.employes // 40)
+        nb_chefs = max(1, spec.employes // 10)
+        conducteurs = user_ids[1:1 + nb_conducteurs]
+        chefs = user_ids[1 + nb_conducteurs:1 + nb_conducteurs + nb_chefs]
+        compagnons = user_ids[1 + nb_conducteurs + nb_chefs:]
+
+        def role(user_id: int) -> str:
+            if user_id == admin_id:
+                return "admin"
+            if user_id in conducteurs:
+                return "conducteur"
+            return "chef_chantier" if user_id in chefs else "compagnon"
+
+        metier_par_user = {u: rng.choice(METIERS) for u in compagnons}
+        counts["users"] = _insert(conn, UserModel.__table__, (
+            {
+                "id": u, "email": f"u{u}@synthetic.test", "password_hash": "!",
+                "nom": f"Nom{u}", "prenom": f"Prenom{u}", "role": role(u),
+                "type_utilisateur": "employe", "couleur": f"#{rng.randrange(0x1000000):06X}",
+                "metiers": [metier_par_user[u]] if u in metier_par_user else None,
+                "code_utilisateur": f"S{u:06d}", "taux_horaire": rng.choice([16.5, 18.0, 21.5]),
+                "created_at": maintenant, "updated_at": maintenant,
+            }
+            for u in user_ids
+        ))
+
+        # --- Chantiers et responsables ---------------------------------------
+        chantier_ids = list(ids.take(ChantierModel.__table__, spec.chantiers))
+        statut_par_chantier = {c: rng.choice(STATUTS_CHANTIER) for c in chantier_ids}
+        conducteur_par_chantier = {c: rng.choice(conducteurs) for c in chantier_ids}
+        chef_par_chantier = {c: rng.choice(chefs) for c in chantier_ids}
+        counts["chantiers"] = _insert(conn, ChantierModel.__table__, (
+            {
+                "id": c, "code": f"{spec.date_reference.year}-{c:05d}-SYN", "nom": f"Chantier synthetique {c}",
+                "adresse": f"{c} avenue des Travaux, 69000 Lyon",
+                "statut": statut_par_chantier[c], "couleur": f"#{rng.randrange(0x1000000):06X}",
+                "heures_estimees": float(rng.randrange(500, 20000, 50)),
+                "date_debut": debut_historique + timedelta(days=rng.randrange(0, 60)),
+                "conducteur_ids": [conducteur_par_chantier[c]],
+                "chef_chantier_ids": [chef_par_chantier[c]],
+                "created_at": maintenant, "updated_at": maintenant,
+            }
+            for c in chantier_ids
+        ))
+        _insert(conn, ChantierConducteurModel.__table__, (
+            {"chantier_id": c, "user_id": u} for c, u in conducteur_par_chantier.items()
+        ))
+        _insert(conn, ChantierChefModel.__table__, (
+            {"chantier_id": c, "user_id": u} for c, u in chef_par_chantier.items()
+        ))
+
+        actifs = [c for c in chantier_ids if statut_par_chantier[c] in ("ouvert", "en_cours")]
+        actifs = actifs or chantier_ids
+        chantier_par_compagnon = {u: rng.choice(actifs) for u in compagnons}
+        _insert(conn, ChantierOuvrierModel.__table__, (
+            {"chantier_id": c, "user_id": u} for u, c in chantier_par_compagnon.items()
+        ))
+
+        # --- Planning : affectations, pointages, besoins de charge ------------
+        jours = list(_jours_ouvres(debut_historique, spec.date_reference + timedelta(weeks=2)))
+        affectations = []
+        for u in compagnons:
+            chantier = chantier_par_compagnon[u]
+            for jour in jours:
+                if rng.random() < 0.02:  # Changement de chantier
+                    chantier = rng.choice(actifs)
+                affectations.append((u, chantier, jour))
+        affectation_ids = ids.take(AffectationModel.__table__, len(affectations))
+        counts["affectations"] = _insert(conn, AffectationModel.__table__, (
+            {
+                "id": a_id, "utilisateur_id": u, "chantier_id": c, "date": jour,
+                "heures_prevues": 8.0, "heure_debut": "07:30", "heure_fin": "16:30",
+                "type_affectation": "unique", "created_by": admin_id,
+                "created_at": maintenant, "updated_at": maintenant,
+            }
+            for a_id, (u, c, jour) in zip(affectation_ids, affectations)
+        ))
+        counts["pointages"] = _insert(conn, PointageModel.__table__, (
+            {
+                "utilisateur_id": u, "chantier_id": c, "date_pointage": jour,
+                "heures_normales_minutes": rng.choice([420, 450, 480]),
+                "heures_supplementaires_minutes": rng.choice([0, 0, 0, 30, 60]),
+                "statut": "valide" if jour < spec.date_reference - timedelta(weeks=1) else "soumis",
+                "validateur_id": chef_par_chantier[c], "affectation_id": a_id,
+                "created_by": u, "created_at": maintenant, "updated_at": maintenant,
+            }
+            for a_id, (u, c, jour) in zip(affectation_ids, affectations)
+            if jour < spec.date_reference
+        ))
+        semaines_charge = [
+            (spec.date_reference + timedelta(weeks=s)).isocalendar()[:2]
+            for s in range(-4, spec.semaines_charge)
+        ]
+        counts["besoins_charge"] = _insert(conn, BesoinChargeModel.__table__, (
+            {
+                "chantier_id": c, "semaine_annee": annee, "semaine_numero": numero,
+                "type_metier": metier, "besoin_heures": float(rng.randrange(35, 280, 7)),
+                "is_deleted": False, "created_by": conducteur_par_chantier[c],
+                "created_at": maintenant, "updated_at": maintenant,
+            }
+            for c in actifs
+            for metier in rng.sample(METIERS, 3)
+            for annee, numero in semaines_charge
+        ))
+
+        # --- Financier --------------------------------------------------------
+        fournisseur_ids = list(ids.take(FournisseurModel.__table__, max(5, spec.achats // 200)))
+        counts["fournisseurs"] = _insert(conn, FournisseurModel.__table__, (
+            {
+                "id": f, "raison_sociale": f"Fournisseur synthetique {f}",
+                "type": rng.choice(TYPES_FOURNISSEUR), "actif": True,
+                "created_by": admin_id, "created_at": maintenant,
+            }
+            for f in fournisseur_ids
+        ))
+        budget_ids = dict(zip(chantier_ids, ids.take(BudgetModel.__table__, len(chantier_ids))))
+        montant_par_chantier = {c: float(rng.randrange(200_000, 3_000_000, 1000)) for c in chantier_ids}
+        counts["budgets"] = _insert(conn, BudgetModel.__table__, (
+            {
+                "id": b, "chantier_id": c, "montant_initial_ht": montant_par_chantier[c],
+                "montant_avenants_ht": 0.0, "retenue_garantie_pct": 5.0,
+                "seuil_alerte_pct": 90.0, "seuil_validation_achat": 5000.0,
+                "created_by": admin_id, "created_at": maintenant, "version": 1,
+            }
+            for c, b in budget_ids.items()
+        ))
+        lots_par_chantier: Dict[int, List[int]] = {}
+        lots = []
+        for c, b in budget_ids.items():
+            lot_ids = list(ids.take(LotBudgetaireModel.__table__, 8))
+            lots_par_chantier[c] = lot_ids
+            part = montant_par_chantier[c] / 8
+            lots.extend(
+                {
+                    "id": lot_id, "budget_id": b, "code_lot": f"LOT{ordre:02d}",
+                    "libelle": f"Lot {ordre}", "unite": "ENS", "quantite_prevue": 1.0,
+                    "prix_unitaire_ht": round(part, 2), "ordre": ordre,
+                    "created_by": admin_id, "created_at": maintenant,
+                }
+                for ordre, lot_id in enumerate(lot_ids, 1)
+            )
+        counts["lots_budgetaires"] = _insert(conn, LotBudgetaireModel.__table__, lots)
+
+        def achat(_):
+            c = rng.choice(chantier_ids)
+            type_achat = rng.choice(TYPES_ACHAT)
+            statut = rng.choice(STATUTS_ACHAT)
+            commande = debut_historique + timedelta(days=rng.randrange(spec.semaines * 7))
+            return {
+                "chantier_id": c, "fournisseur_id": rng.choice(fournisseur_ids),
+                "lot_budgetaire_id": rng.choice(lots_par_chantier[c]),
+                "type_achat": type_achat, "libelle": f"Achat {type_achat}",
+                "quantite": float(rng.randrange(1, 200)), "unite": "u",
+                "prix_unitaire_ht": float(rng.randrange(5, 900)),
+                "taux_tva": 0.0 if type_achat == "sous_traitance" else 20.0,
+                "date_commande": commande, "statut": statut,
+                "demandeur_id": chef_par_chantier[c],
+                "valideur_id": conducteur_par_chantier[c] if statut != "demande" else None,
+                "source_donnee": "HUB", "created_by": chef_par_chantier[c],
+                "created_at": datetime.combine(commande, datetime.min.time()),
+            }
+
+        counts["achats"] = _insert(conn, AchatModel.__table__, (achat(i) for i in range(spec.achats)))
+
+        situations = []
+        factures = []
+        nb_mois = max(1, spec.semaines // 4)
+        for c in chantier_ids:
+            cumul = 0.0
+            for mois in range(min(nb_mois, 24)):
+                fin = spec.date_reference - timedelta(days=30 * (min(nb_mois, 24) - mois - 1))
+                periode = round(montant_par_chantier[c] / 30, 2)
+                facturee = mois < min(nb_mois, 24) - 1
+                situations.append({
+                    "chantier_id": c, "budget_id": budget_ids[c], "numero": f"SIT-{mois + 1:03d}",
+                    "periode_debut": fin - timedelta(days=29), "periode_fin": fin,
+                    "montant_cumule_precedent_ht": cumul, "montant_periode_ht": periode,
+                    "montant_cumule_ht": round(cumul + periode, 2),
+                    "retenue_garantie_pct": 5.0, "taux_tva": 20.0,
+                    "statut": "facturee" if facturee else "emise",
+                    "created_by": admin_id, "created_at": maintenant, "version": 1,
+                })
+                cumul = round(cumul + periode, 2)
+        situation_ids = ids.take(SituationTravauxModel.__table__, len(situations))
+        for s_id, situation in zip(situation_ids, situations):
+            situation["id"] = s_id
+            if situation["statut"] == "facturee":
+                ht = situation["montant_periode_ht"]
+                tva = round(ht * 0.2, 2)
+                retenue = round((ht + tva) * 0.05, 2)
+                factures.append({
+                    "chantier_id": situation["chantier_id"], "situation_id": s_id,
+                    "numero_facture": f"FS{s_id:08d}", "type_facture": "situation",
+                    "montant_ht": ht, "taux_tva": 20.0, "montant_tva": tva,
+                    "montant_ttc": round(ht + tva, 2), "retenue_garantie_montant": retenue,
+                    "montant_net": round(ht + tva - retenue, 2),
+                    "date_emission": situation["periode_fin"],
+                    "date_echeance": situation["periode_fin"] + timedelta(days=30),
+                    "statut": "payee", "montant_encaisse": 0.0,
+                    "created_by": admin_id, "created_at": maintenant,
+                })
+        counts["situations_travaux"] = _insert(conn, SituationTravauxModel.__table__, situations)
+        counts["factures_client"] = _insert(conn, FactureClientModel.__table__, factures)
+
+        # --- Devis ------------------------------------------------------------
+        devis_ids = list(ids.take(DevisModel.__table__, spec.devis))
+        counts["devis"] = _insert(conn, DevisModel.__table__, (
+            {
+                "id": d, "numero": f"DEV-SYN-{d:06d}", "client_nom": f"Client {d}",
+                "chantier_id": rng.choice(chantier_ids), "objet": f"Devis synthetique {d}",
+                "statut": "brouillon", "date_creation": spec.date_reference,
+                "conducteur_id": rng.choice(conducteurs), "created_by": admin_id,
+                "created_at": maintenant,
+            }
+            for d in devis_ids
+        ))
+        nb_lots_devis = max(1, spec.lignes_par_devis // 20)
+        lots_devis = []
+        lignes = []
+        for d in devis_ids:
+            lot_ids = list(ids.take(LotDevisModel.__table__, nb_lots_devis))
+            lots_devis.extend(
+                {
+                    "id": lot_id, "devis_id": d, "titre": f"Lot {ordre}", "numero": str(ordre),
+                    "ordre": ordre, "created_by": admin_id, "created_at": maintenant,
+                }
+                for ordre, lot_id in enumerate(lot_ids, 1)
+            )
+            lignes.extend(
+                {
+                    "lot_devis_id": lot_ids[n % nb_lots_devis], "designation": f"Ouvrage {n + 1}",
+                    "unite": rng.choice(UNITES_LIGNE), "quantite": float(rng.randrange(1, 300)),
+                    "prix_unitaire_ht": 0.0, "taux_tva": 20.0, "ordre": n // nb_lots_devis,
+                    "created_by": admin_id, "created_at": maintenant,
+                }
+                for n in range(spec.lignes_par_devis)
+            )
+        counts["lots_devis"] = _insert(conn, LotDevisModel.__table__, lots_devis)
+        ligne_ids = ids.take(LigneDevisModel.__table__, len(lignes))
+        for ligne_id, ligne in zip(ligne_ids, lignes):
+            ligne["id"] = ligne_id
+        counts["lignes_devis"] = _insert(conn, LigneDevisModel.__table__, lignes)
+        counts["debourses_detail"] = _insert(conn, DebourseDetailModel.__table__, (
+            {
+                "ligne_devis_id": ligne["id"], "type_debourse": type_debourse,
+                "designation": f"{type_debourse} {ligne['designation']}",
+                "quantite": quantite, "prix_unitaire": prix, "unite": unite,
+                "montant": round(quantite * prix, 2), "created_at": maintenant,
+            }
+            for ligne in lignes
+            for type_debourse, quantite, prix, unite in (
+                ("moe", float(rng.randrange(1, 40)), 42.0, "heure"),
+                ("materiaux", float(rng.randrange(1, 50)), float(rng.randrange(3, 120)), "u"),
+            )
+        ))
+
+        # --- Fil d'actualités -------------------------------------------------
+        post_ids = list(ids.take(PostModel.__table__, spec.posts))
+        auteurs = [admin_id] + conducteurs + chefs
+        cibles = {p: rng.sample(chantier_ids, min(2, len(chantier_ids)))
+                  for p in post_ids if rng.random() < 0.3}
+        counts["posts"] = _insert(conn, PostModel.__table__, (
+            {
+                "id": p, "author_id": rng.choice(auteurs), "content": f"Message synthetique {p}",
+                "status": "published", "is_urgent": False,
+                "target_type": "specific_chantiers" if p in cibles else "everyone",
+                "target_chantier_ids": ",".join(map(str, cibles[p])) if p in cibles else None,
+                "created_at": maintenant - timedelta(minutes=len(post_ids) - i),
+                "updated_at": maintenant,
+            }
+            for i, p in enumerate(post_ids)
+        ))
+        _insert(conn, PostTargetChantierModel.__table__, (
+            {"post_id": p, "chantier_id": c} for p, chantiers in cibles.items() for c in chantiers
+        ))
+        counts["comments"] = _insert(conn, CommentModel.__table__, (
+            {
+                "post_id": p, "author_id": rng.choice(user_ids), "content": "Bien recu",
+                "is_deleted": False, "created_at": maintenant, "updated_at": maintenant,
+            }
+            for p in post_ids for _ in range(rng.randrange(0, 4))
+        ))
+        counts["likes"] = _insert(conn, LikeModel.__table__, (
+            {"post_id": p, "user_id": u, "created_at": maintenant}
+            for p in post_ids
+            for u in rng.sample(user_ids, min(len(user_ids), rng.randrange(0, 6)))
+        ))
+
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small", help="Échelle de base")
+    parser.add_argument("--database-url", help="Base cible (défaut: DATABASE_URL)")
+    parser.add_argument("--create-schema", action="store_true", help="Créer les tables manquantes")
+    for spec_field in fields(SyntheticDataSpec):
+        if spec_field.type in (int, "int"):
+            parser.add_argument(
+                f"--{spec_field.name.replace('_', '-')}", type=int, dest=spec_field.name,
+                help=f"Remplace la valeur de l'échelle ({spec_field.name})",
+            )
+    args = parser.parse_args()
+
+    overrides = {
+        f.name: getattr(args, f.name)
+        for f in fields(SyntheticDataSpec)
+        if getattr(args, f.name, None) is not None
+    }
+    spec = replace(SCALES[args.scale], **overrides)
+
+    if args.database_url:
+        engine = create_engine(args.database_url)
+    else:
+        from shared.infrastructure.database import engine
+    if args.create_schema:
+        from shared.infrastructure.database import _create_schema
+
+        Base.metadata.create_all(bind=engine) if args.database_url else _create_schema()
+
+    debut = time.perf_counter()
+    counts = generate_synthetic_data(engine, spec)
+    duree = time.perf_counter() - debut
+
+    for table, nombre in counts.items():
+        print(f"{table:<22} {nombre:>10}")
+    print(f"{sum(counts.values())} lignes en {duree:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
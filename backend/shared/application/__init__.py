@@ -5,9 +5,15 @@ from .ports import (
     UserBasicInfo,
     ChantierBasicInfo,
 )
+from .read_only import read_only, is_read_only
+from .instrumentation import timed, set_use_case_recorder
 
 __all__ = [
     "EntityInfoService",
     "UserBasicInfo",
     "ChantierBasicInfo",
+    "read_only",
+    "is_read_only",
+    "timed",
+    "set_use_case_recorder",
 ]
@@ -0,0 +1,53 @@
+"""Chronométrage des use cases.
+
+``@timed`` décore la méthode ``execute`` d'un use case : sa durée est
+transmise à l'enregistreur installé par l'infrastructure (métriques
+Prometheus, voir shared/infrastructure/metrics.py). Sans enregistreur, le
+décorateur appelle directement la méthode, sans mesure.
+"""
+
+import asyncio
+import time
+from functools import wraps
+from typing import Callable, Optional
+
+# (nom du use case, durée en secondes) -> None
+UseCaseRecorder = Callable[[str, float], None]
+
+_recorder: Optional[UseCaseRecorder] = None
+
+
+def set_use_case_recorder(recorder: Optional[UseCaseRecorder]) -> None:
+    """Installe (ou retire avec None) l'enregistreur des durées de use cases."""
+    global _recorder
+    _recorder = recorder
+
+
+def timed(execute: Callable) -> Callable:
+    """Mesure la durée d'exécution d'une méthode de use case (sync ou async)."""
+    if asyncio.iscoroutinefunction(execute):
+        @wraps(execute)
+        async def async_wrapper(self, *args, **kwargs):
+            recorder = _recorder
+            if recorder is None:
+                return await execute(self, *args, **kwargs)
+            debut = time.perf_counter()
+            try:
+                return await execute(self, *args, **kwargs)
+            finally:
+                recorder(type(self).__name__, time.perf_counter() - debut)
+
+        return async_wrapper
+
+    @wraps(execute)
+    def wrapper(self, *args, **kwargs):
+        recorder = _recorder
+        if recorder is None:
+            return execute(self, *args, **kwargs)
+        debut = time.perf_counter()
+        try:
+            return execute(self, *args, **kwargs)
+        finally:
+            recorder(type(self).__name__, time.perf_counter() - debut)
+
+    return wrapper
@@ -12,7 +12,7 @@ Conforme Clean Architecture:
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 
 
 @dataclass(frozen=True)
@@ -113,3 +113,41 @@ class EntityInfoService(ABC):
             Liste des IDs des chantiers.
         """
         pass
+
+    def get_users_info(self, user_ids: Iterable[int]) -> Dict[int, UserBasicInfo]:
+        """Recupere les informations de base de plusieurs utilisateurs.
+
+        Implementation par defaut : un appel a get_user_info par ID.
+        Les implementations concretes doivent la surcharger par une
+        requete unique.
+
+        Args:
+            user_ids: Identifiants des utilisateurs.
+
+        Returns:
+            Dictionnaire {user_id: UserBasicInfo} des utilisateurs trouves.
+        """
+        result: Dict[int, UserBasicInfo] = {}
+        for user_id in set(user_ids):
+            info = self.get_user_info(user_id)
+            if info:
+                result[user_id] = info
+        return result
+
+    def get_chantiers_info(self, chantier_ids: Iterable[int]) -> Dict[int, ChantierBasicInfo]:
+        """Recupere les informations de base de plusieurs chantiers.
+
+        Implementation par defaut : un appel a get_chantier_info par ID.
+
+        Args:
+            chantier_ids: Identifiants des chantiers.
+
+        Returns:
+            Dictionnaire {chantier_id: ChantierBasicInfo} des chantiers trouves.
+        """
+        result: Dict[int, ChantierBasicInfo] = {}
+        for chantier_id in set(chantier_ids):
+            info = self.get_chantier_info(chantier_id)
+            if info:
+                result[chantier_id] = info
+        return result
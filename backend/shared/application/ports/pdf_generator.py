@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from modules.interventions.application.use_cases.pdf_use_cases import (
         InterventionPDFOptionsDTO,
     )
+    from modules.pointages.application.dtos import MonthlyRecapDTO
 
 
 class PdfGeneratorPort(ABC):
@@ -82,3 +83,56 @@ class PdfGeneratorPort(ABC):
             RuntimeError: Si la generation PDF echoue.
         """
         pass
+
+    def prerender_intervention_pdf(
+        self,
+        intervention: "Intervention",
+        techniciens: List["AffectationIntervention"],
+        messages: List["InterventionMessage"],
+        signatures: List["SignatureIntervention"],
+        options: Optional["InterventionPDFOptionsDTO"] = None,
+    ) -> None:
+        """Lance le rendu du rapport d'intervention sans l'attendre.
+
+        Permet de preparer le PDF lors d'un changement d'etat (signature)
+        pour qu'il soit disponible immediatement au telechargement.
+        Par defaut, ne fait rien (pas de cache de rendu).
+
+        Args:
+            intervention: L'entite intervention.
+            techniciens: Liste des techniciens affectes.
+            messages: Messages a inclure dans le rapport.
+            signatures: Signatures (client + technicien).
+            options: Options de generation (sections a inclure).
+        """
+        return None
+
+    def generate_recap_mensuel_pdf(self, recap: "MonthlyRecapDTO") -> bytes:
+        """Génère le PDF d'un récapitulatif mensuel d'heures (GAP-FDH-008).
+
+        Args:
+            recap: Récapitulatif mensuel d'un utilisateur.
+
+        Returns:
+            Contenu PDF en bytes.
+
+        Raises:
+            NotImplementedError: Si le générateur ne gère pas ce document.
+        """
+        raise NotImplementedError("Récapitulatif mensuel PDF non supporté")
+
+    def generate_recaps_mensuels_pdf(
+        self, recaps: List["MonthlyRecapDTO"]
+    ) -> List[bytes]:
+        """Génère les PDF de plusieurs récapitulatifs mensuels.
+
+        Par défaut, rendus successifs ; les implémentations peuvent les
+        paralléliser.
+
+        Args:
+            recaps: Récapitulatifs mensuels.
+
+        Returns:
+            Contenus PDF, dans l'ordre des récapitulatifs.
+        """
+        return [self.generate_recap_mensuel_pdf(recap) for recap in recaps]
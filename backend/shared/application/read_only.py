@@ -0,0 +1,21 @@
+"""Marqueur des use cases en lecture seule.
+
+Un use case marqué ``@read_only`` ne fait que lire : l'infrastructure peut
+l'exécuter sur le réplica de lecture (voir ``session_for`` dans
+shared/infrastructure/database.py). Sa session refuse toute écriture.
+"""
+
+from typing import TypeVar
+
+T = TypeVar("T", bound=type)
+
+
+def read_only(cls: T) -> T:
+    """Marque une classe de use case comme étant en lecture seule."""
+    cls.READ_ONLY = True
+    return cls
+
+
+def is_read_only(use_case) -> bool:
+    """Indique si un use case (classe ou instance) est marqué en lecture seule."""
+    return getattr(use_case, "READ_ONLY", False) is True
@@ -0,0 +1,352 @@
+"""Cache des clés API vérifiées et suivi d'usage agrégé en mémoire.
+
+L'intégration ERP interroge l'API v1 en continu. Sans cache, chaque requête
+hash la clé, lit ``api_keys``, écrit ``last_used_at`` (UPDATE + commit) puis
+lit ``users``. Ce module supprime la lecture de la clé et l'écriture :
+
+- ``APIKeyVerificationCache`` : clés vérifiées gardées quelques secondes
+  (TTL court), invalidées explicitement à la révocation. Le cache est propre
+  au processus : pour une clé servie par le cache, le middleware vérifie en
+  base qu'elle est toujours active, dans la requête qui charge l'utilisateur
+  propriétaire. Une révocation faite sur un autre worker s'applique donc dès
+  la requête suivante, sans attendre le TTL.
+- ``APIKeyUsageTracker`` : dernière utilisation et nombre de requêtes par
+  clé, cumulés en mémoire et écrits en une seule requête groupée par
+  ``flush`` (job planifié). Les mêmes compteurs servent au quota horaire
+  ``rate_limit_per_hour`` de chaque clé.
+
+Les compteurs de quota sont propres au processus : avec N workers, une clé
+peut consommer jusqu'à N fois son quota sur une même heure.
+
+Usage:
+    from shared.infrastructure.api_v1.api_key_cache import (
+        get_api_key_cache,
+        get_api_key_usage_tracker,
+    )
+
+    cle = get_api_key_cache().get(key_hash)
+    autorise, retry_after = get_api_key_usage_tracker().record(
+        cle.key_id, cle.rate_limit_per_hour
+    )
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from modules.auth.infrastructure.persistence.api_key_model import APIKeyModel
+
+# Valeurs par défaut (surchargées via variables d'environnement)
+API_KEY_CACHE_TTL_SECONDS = 30.0
+API_KEY_CACHE_MAX_ENTRIES = 10000
+
+FENETRE_QUOTA_SECONDS = 3600
+
+
+@dataclass(frozen=True)
+class VerifiedAPIKey:
+    """Clé API vérifiée, telle que conservée en cache.
+
+    Attributes:
+        key_id: Identifiant de la clé (UUID en texte).
+        user_id: ID de l'utilisateur propriétaire.
+        rate_limit_per_hour: Quota de requêtes par heure.
+        expires_at: Date d'expiration (None = jamais).
+    """
+
+    key_id: str
+    user_id: int
+    rate_limit_per_hour: int
+    expires_at: Optional[datetime]
+
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        """Indique si la clé est expirée."""
+        if not self.expires_at:
+            return False
+        return (now or datetime.utcnow()) > self.expires_at
+
+
+class APIKeyVerificationCache:
+    """Cache à TTL court des clés API vérifiées, indexé par hash.
+
+    Attributes:
+        hits: Nombre de vérifications servies par le cache.
+        misses: Nombre de vérifications ayant nécessité la base.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = API_KEY_CACHE_TTL_SECONDS,
+        max_entries: int = API_KEY_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise le cache.
+
+        Args:
+            ttl_seconds: Durée de validité d'une entrée (0 = cache désactivé).
+            max_entries: Nombre maximal de clés en cache.
+            clock: Horloge monotone (injectable pour les tests).
+        """
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = Lock()
+        self._entrees: Dict[str, Tuple[float, VerifiedAPIKey]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key_hash: str) -> Optional[VerifiedAPIKey]:
+        """Retourne la clé vérifiée pour ce hash, ou None si absente/expirée.
+
+        Args:
+            key_hash: Hash SHA256 du secret.
+
+        Returns:
+            Clé vérifiée ou None.
+        """
+        with self._lock:
+            entree = self._entrees.get(key_hash)
+            if entree is None or self._clock() >= entree[0]:
+                if entree is not None:
+                    del self._entrees[key_hash]
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entree[1]
+
+    def put(self, key_hash: str, cle: VerifiedAPIKey) -> None:
+        """Mémorise une clé qui vient d'être vérifiée en base.
+
+        Args:
+            key_hash: Hash SHA256 du secret.
+            cle: Clé vérifiée.
+        """
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            if len(self._entrees) >= self._max_entries:
+                self._purger_expirees()
+                if len(self._entrees) >= self._max_entries:
+                    # Retirer la plus ancienne insertion (ordre du dict)
+                    self._entrees.pop(next(iter(self._entrees)))
+            self._entrees[key_hash] = (self._clock() + self._ttl, cle)
+
+    def invalidate_key(self, key_id: str) -> bool:
+        """Retire une clé du cache (révocation).
+
+        Args:
+            key_id: Identifiant de la clé.
+
+        Returns:
+            True si une entrée a été retirée.
+        """
+        with self._lock:
+            hashes = [h for h, (_, c) in self._entrees.items() if c.key_id == key_id]
+            for key_hash in hashes:
+                del self._entrees[key_hash]
+        return bool(hashes)
+
+    def invalidate(self) -> int:
+        """Vide le cache.
+
+        Returns:
+            Nombre d'entrées supprimées.
+        """
+        with self._lock:
+            nb = len(self._entrees)
+            self._entrees.clear()
+        return nb
+
+    def _purger_expirees(self) -> None:
+        now = self._clock()
+        for key_hash in [h for h, (exp, _) in self._entrees.items() if now >= exp]:
+            del self._entrees[key_hash]
+
+
+@dataclass
+class _UsageCle:
+    """Compteurs d'une clé : fenêtre de quota et usage à écrire en base."""
+
+    fenetre: int = -1
+    requetes_fenetre: int = 0
+    requetes_a_ecrire: int = 0
+    last_used_at: Optional[datetime] = None
+
+
+class APIKeyUsageTracker:
+    """Agrège l'usage des clés API en mémoire et l'écrit par lots.
+
+    Chaque requête acceptée incrémente le compteur de la fenêtre horaire
+    courante (quota) et le compteur à écrire, et met à jour la dernière
+    utilisation. ``flush`` écrit toutes les clés modifiées en une seule
+    requête UPDATE groupée (executemany).
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialise le tracker.
+
+        Args:
+            clock: Horloge (timestamp epoch, injectable pour les tests).
+        """
+        self._clock = clock
+        self._lock = Lock()
+        self._usages: Dict[str, _UsageCle] = {}
+
+    def record(self, key_id: str, rate_limit_per_hour: int) -> Tuple[bool, int]:
+        """Comptabilise une requête et applique le quota horaire de la clé.
+
+        Une requête refusée n'est pas comptée.
+
+        Args:
+            key_id: Identifiant de la clé.
+            rate_limit_per_hour: Quota de requêtes par heure (<= 0 = illimité).
+
+        Returns:
+            (autorisée, secondes avant la prochaine fenêtre si refusée).
+        """
+        now = self._clock()
+        fenetre = int(now // FENETRE_QUOTA_SECONDS)
+        with self._lock:
+            usage = self._usages.setdefault(key_id, _UsageCle())
+            if usage.fenetre != fenetre:
+                usage.fenetre = fenetre
+                usage.requetes_fenetre = 0
+            if 0 < rate_limit_per_hour <= usage.requetes_fenetre:
+                retry_after = int((fenetre + 1) * FENETRE_QUOTA_SECONDS - now) + 1
+                return False, retry_after
+            usage.requetes_fenetre += 1
+            usage.requetes_a_ecrire += 1
+            usage.last_used_at = datetime.fromtimestamp(now, tz=timezone.utc).replace(tzinfo=None)
+        return True, 0
+
+    def requests_in_window(self, key_id: str) -> int:
+        """Nombre de requêtes de la clé sur la fenêtre horaire courante."""
+        fenetre = int(self._clock() // FENETRE_QUOTA_SECONDS)
+        with self._lock:
+            usage = self._usages.get(key_id)
+            if usage is None or usage.fenetre != fenetre:
+                return 0
+            return usage.requetes_fenetre
+
+    def pending(self) -> int:
+        """Nombre de clés dont l'usage n'est pas encore écrit en base."""
+        with self._lock:
+            return sum(1 for u in self._usages.values() if u.requetes_a_ecrire)
+
+    def flush(self, session: Session) -> int:
+        """Écrit l'usage cumulé de toutes les clés en une requête groupée.
+
+        En cas d'erreur, les compteurs sont restitués pour le flush suivant.
+
+        Args:
+            session: Session SQLAlchemy (commit effectué ici).
+
+        Returns:
+            Nombre de clés mises à jour.
+        """
+        with self._lock:
+            lot = []
+            for key_id, usage in self._usages.items():
+                if usage.requetes_a_ecrire:
+                    lot.append(
+                        {
+                            "b_id": key_id,
+                            "b_last_used_at": usage.last_used_at,
+                            "b_requetes": usage.requetes_a_ecrire,
+                        }
+                    )
+                    usage.requetes_a_ecrire = 0
+            self._purger_inactives()
+        if not lot:
+            return 0
+
+        table = APIKeyModel.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(
+                last_used_at=bindparam("b_last_used_at"),
+                request_count=table.c.request_count + bindparam("b_requetes"),
+            )
+        )
+        try:
+            session.execute(stmt, lot)
+            session.commit()
+        except Exception:
+            session.rollback()
+            self._restituer(lot)
+            raise
+        return len(lot)
+
+    def reset(self) -> None:
+        """Oublie tous les compteurs (tests)."""
+        with self._lock:
+            self._usages.clear()
+
+    def _restituer(self, lot: list) -> None:
+        with self._lock:
+            for ligne in lot:
+                usage = self._usages.setdefault(ligne["b_id"], _UsageCle())
+                usage.requetes_a_ecrire += ligne["b_requetes"]
+                if usage.last_used_at is None or usage.last_used_at < ligne["b_last_used_at"]:
+                    usage.last_used_at = ligne["b_last_used_at"]
+
+    def _purger_inactives(self) -> None:
+        """Retire les clés sans usage à écrire et hors fenêtre courante."""
+        fenetre = int(self._clock() // FENETRE_QUOTA_SECONDS)
+        inactives = [
+            key_id
+            for key_id, u in self._usages.items()
+            if not u.requetes_a_ecrire and u.fenetre != fenetre
+        ]
+        for key_id in inactives:
+            del self._usages[key_id]
+
+
+_cache_instance: Optional[APIKeyVerificationCache] = None
+_tracker_instance: Optional[APIKeyUsageTracker] = None
+_instances_lock = Lock()
+
+
+def get_api_key_cache() -> APIKeyVerificationCache:
+    """Retourne le cache des clés vérifiées partagé par le processus.
+
+    Variables d'environnement :
+        API_KEY_CACHE_TTL_SECONDS: Durée de validité d'une entrée (0 = désactivé).
+
+    Returns:
+        Instance unique de APIKeyVerificationCache.
+    """
+    global _cache_instance
+
+    with _instances_lock:
+        if _cache_instance is None:
+            _cache_instance = APIKeyVerificationCache(
+                ttl_seconds=float(
+                    os.environ.get("API_KEY_CACHE_TTL_SECONDS", API_KEY_CACHE_TTL_SECONDS)
+                ),
+            )
+        return _cache_instance
+
+
+def get_api_key_usage_tracker() -> APIKeyUsageTracker:
+    """Retourne le tracker d'usage des clés API partagé par le processus.
+
+    Returns:
+        Instance unique de APIKeyUsageTracker.
+    """
+    global _tracker_instance
+
+    with _instances_lock:
+        if _tracker_instance is None:
+            _tracker_instance = APIKeyUsageTracker()
+        return _tracker_instance
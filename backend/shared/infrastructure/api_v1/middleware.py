@@ -1,13 +1,18 @@
 """Middleware d'authentification API v1 - Support JWT et API Key."""
 
 import hashlib
-from datetime import datetime
 from typing import Optional
 
 from fastapi import Header, HTTPException, Depends
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 
 from shared.infrastructure.database import get_db
+from shared.infrastructure.api_v1.api_key_cache import (
+    VerifiedAPIKey,
+    get_api_key_cache,
+    get_api_key_usage_tracker,
+)
 from modules.auth.infrastructure.persistence.api_key_model import APIKeyModel
 from modules.auth.infrastructure.persistence.user_model import UserModel
 
@@ -72,10 +77,13 @@ async def _verify_api_key(api_key: str, db: Session):
 
     Process:
     1. Hash le secret avec SHA256
-    2. Cherche le hash en DB
+    2. Cherche le hash dans le cache des clés vérifiées, sinon en DB
     3. Vérifie is_active et expiration
-    4. Met à jour last_used_at
-    5. Retourne l'utilisateur propriétaire
+    4. Comptabilise l'usage en mémoire et applique le quota horaire
+       (last_used_at est écrit par lots, voir FlushAPIKeyUsageJob)
+    5. Retourne l'utilisateur propriétaire ; pour une clé servie par le
+       cache, la même requête vérifie qu'elle n'a pas été révoquée entre-temps
+       (révocation faite par un autre worker)
 
     Args:
         api_key: Secret API Key (hbc_xxxxx...)
@@ -85,42 +93,78 @@ async def _verify_api_key(api_key: str, db: Session):
         UserModel de l'utilisateur
 
     Raises:
-        HTTPException: 401 si clé invalide/expirée/inactive
+        HTTPException: 401 si clé invalide/expirée/inactive,
+            429 si le quota horaire de la clé est atteint
     """
     # 1. Hasher le secret (même algo que création)
     key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
 
-    # 2. Chercher en DB (index unique sur key_hash = très rapide)
-    key_record = (
-        db.query(APIKeyModel)
-        .filter(
-            APIKeyModel.key_hash == key_hash,
-            APIKeyModel.is_active == True,  # Filtre clés révoquées
+    # 2. Cache des clés vérifiées (invalidé à la révocation), sinon DB
+    cache = get_api_key_cache()
+    cle = cache.get(key_hash)
+    depuis_cache = cle is not None
+
+    if cle is None:
+        # Index unique sur key_hash = très rapide
+        key_record = (
+            db.query(APIKeyModel)
+            .filter(
+                APIKeyModel.key_hash == key_hash,
+                APIKeyModel.is_active == True,  # Filtre clés révoquées
+            )
+            .first()
         )
-        .first()
-    )
 
-    if not key_record:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or revoked API key",
-            headers={"WWW-Authenticate": "Bearer"},
+        if not key_record:
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid or revoked API key",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        cle = VerifiedAPIKey(
+            key_id=str(key_record.id),
+            user_id=key_record.user_id,
+            rate_limit_per_hour=key_record.rate_limit_per_hour,
+            expires_at=key_record.expires_at,
         )
+        cache.put(key_hash, cle)
 
     # 3. Vérifier expiration
-    if key_record.expires_at and datetime.utcnow() > key_record.expires_at:
+    if cle.is_expired():
         raise HTTPException(
             status_code=401,
             detail="API key expired",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # 4. Mettre à jour last_used_at (audit)
-    key_record.last_used_at = datetime.utcnow()
-    db.commit()
+    # 4. Usage (last_used_at + compteur) et quota horaire, en mémoire
+    autorise, retry_after = get_api_key_usage_tracker().record(
+        cle.key_id, cle.rate_limit_per_hour
+    )
+    if not autorise:
+        raise HTTPException(
+            status_code=429,
+            detail="API key rate limit exceeded",
+            headers={"Retry-After": str(retry_after)},
+        )
 
-    # 5. Récupérer l'utilisateur propriétaire
-    user = db.query(UserModel).filter(UserModel.id == key_record.user_id).first()
+    # 5. Utilisateur propriétaire (+ révocation si la clé vient du cache)
+    conditions = [UserModel.id == cle.user_id]
+    if depuis_cache:
+        conditions.append(
+            exists().where(APIKeyModel.id == cle.key_id, APIKeyModel.is_active == True)
+        )
+    user = db.query(UserModel).filter(*conditions).first()
+
+    if user is None and depuis_cache:
+        # Révoquée depuis sa mise en cache (éventuellement par un autre worker)
+        cache.invalidate_key(cle.key_id)
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or revoked API key",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
     if not user or not user.is_active:
         raise HTTPException(
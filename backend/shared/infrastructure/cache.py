@@ -39,6 +39,8 @@ class TTLCache:
         self._cache: Dict[str, Tuple[Any, float]] = {}
         self._lock = Lock()
         self._max_size = max_size
+        self._hits = 0
+        self._misses = 0
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -52,14 +54,17 @@ class TTLCache:
         """
         with self._lock:
             if key not in self._cache:
+                self._misses += 1
                 return None
 
             value, expires_at = self._cache[key]
             if time.time() > expires_at:
                 # Expired
                 del self._cache[key]
+                self._misses += 1
                 return None
 
+            self._hits += 1
             return value
 
     def set(self, key: str, value: Any, ttl: int = 60) -> None:
@@ -116,6 +121,16 @@ class TTLCache:
         with self._lock:
             self._cache.clear()
 
+    def stats(self) -> Dict[str, int]:
+        """
+        Get hit/miss counters and current size (exposed by /metrics).
+
+        Returns:
+            Dict with "hits", "misses" and "size".
+        """
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "size": len(self._cache)}
+
     def _evict_expired_and_oldest(self) -> None:
         """Remove expired entries and oldest entries if still over limit."""
         now = time.time()
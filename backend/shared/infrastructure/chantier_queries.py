@@ -2,15 +2,25 @@
 
 These helpers use raw SQL so that modules like formulaires do not need
 to import modules.chantiers.infrastructure.persistence.ChantierModel.
+
+Lookups are served from the process-local reference directory (see
+reference_directory.py) when available, and fall back to SQL otherwise.
 """
 
 from sqlalchemy.orm import Session
 from sqlalchemy import text, bindparam
 from typing import Optional
 
+from shared.infrastructure.reference_directory import get_reference_directory
+
 
 def get_chantier_basic_info(db: Session, chantier_id: int) -> Optional[dict]:
     """Get basic chantier info without importing ChantierModel."""
+    directory = get_reference_directory(db)
+    if directory is not None:
+        chantier = directory.get_chantier(chantier_id)
+        return {"id": chantier["id"], "nom": chantier["nom"]} if chantier else None
+
     result = db.execute(
         text("SELECT id, nom FROM chantiers WHERE id = :id"),
         {"id": chantier_id},
@@ -30,6 +40,10 @@ def get_chantiers_actifs(db: Session, search: Optional[str] = None) -> list[dict
     Returns:
         List of dicts with id, code, nom, couleur, heures_estimees.
     """
+    directory = get_reference_directory(db)
+    if directory is not None:
+        return directory.get_chantiers_actifs(search)
+
     if search:
         search_term = f"%{search}%"
         rows = db.execute(
@@ -68,6 +82,10 @@ def get_chantier_by_id_dict(db: Session, chantier_id: int) -> Optional[dict]:
     Returns:
         Dict with id, code, nom, couleur, heures_estimees or None.
     """
+    directory = get_reference_directory(db)
+    if directory is not None:
+        return directory.get_chantier(chantier_id, include_deleted=False)
+
     row = db.execute(
         text(
             "SELECT id, code, nom, couleur, heures_estimees FROM chantiers "
@@ -95,6 +113,13 @@ def get_chantiers_basic_info_by_ids(db: Session, chantier_ids: list[int]) -> dic
     if not chantier_ids:
         return {}
 
+    directory = get_reference_directory(db)
+    if directory is not None:
+        return {
+            chantier_id: {"id": chantier_id, "nom": chantier["nom"]}
+            for chantier_id, chantier in directory.get_chantiers(chantier_ids).items()
+        }
+
     rows = db.execute(
         text("SELECT id, nom FROM chantiers WHERE id IN :ids").bindparams(
             bindparam("ids", expanding=True)
@@ -120,6 +145,10 @@ def get_chantiers_by_ids_full(db: Session, chantier_ids: list[int]) -> list[dict
     if not chantier_ids:
         return []
 
+    directory = get_reference_directory(db)
+    if directory is not None:
+        return list(directory.get_chantiers(chantier_ids, include_deleted=False).values())
+
     rows = db.execute(
         text(
             "SELECT id, code, nom, couleur, heures_estimees FROM chantiers "
@@ -2,6 +2,7 @@
 
 import os
 from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 
 # Charger les variables d'environnement depuis .env
@@ -24,6 +25,27 @@ class Settings:
 
     # Database
     DATABASE_URL: str = "sqlite:///./data/hub_chantier.db"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # Attente max pour une connexion du pool (s)
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # 0 = pas de limite (PostgreSQL)
+
+    # Database asynchrone (routes de lecture à fort trafic)
+    DB_ASYNC_POOL_SIZE: int = 10
+    DB_ASYNC_MAX_OVERFLOW: int = 20
+    DB_ASYNC_STATEMENT_TIMEOUT_MS: int = 10000
+
+    # Réplica de lecture (rapports, tableaux de bord) : None = base principale
+    DATABASE_READ_URL: str = None
+    DB_READ_YOUR_WRITES_SECONDS: int = 10  # Lectures sur la base principale après une écriture
+
+    # Schéma au démarrage : auto (create_all sauf si Alembic est à head), create, skip
+    DB_SCHEMA_INIT: str = "auto"
+
+    # Instrumentation (endpoint /metrics au format Prometheus)
+    METRICS_ENABLED: bool = False
+    METRICS_TOKEN: Optional[str] = None  # Bearer requis sur /metrics (obligatoire hors DEBUG)
+    SLOW_REQUEST_MS: int = 1000  # Seuil de journalisation des requêtes lentes (0 = désactivé)
 
     # Security
     SECRET_KEY: str = "dev-secret-key-change-in-production-min-32-chars"
@@ -47,6 +69,29 @@ class Settings:
         self.APP_NAME = os.getenv("APP_NAME", self.APP_NAME)
         self.DEBUG = os.getenv("DEBUG", "false").lower() == "true"  # P2-1: false par défaut
         self.DATABASE_URL = os.getenv("DATABASE_URL", self.DATABASE_URL)
+        self.DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", str(self.DB_POOL_SIZE)))
+        self.DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", str(self.DB_MAX_OVERFLOW)))
+        self.DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", str(self.DB_POOL_TIMEOUT)))
+        self.DB_STATEMENT_TIMEOUT_MS = int(
+            os.getenv("DB_STATEMENT_TIMEOUT_MS", str(self.DB_STATEMENT_TIMEOUT_MS))
+        )
+        self.DB_ASYNC_POOL_SIZE = int(
+            os.getenv("DB_ASYNC_POOL_SIZE", str(self.DB_ASYNC_POOL_SIZE))
+        )
+        self.DB_ASYNC_MAX_OVERFLOW = int(
+            os.getenv("DB_ASYNC_MAX_OVERFLOW", str(self.DB_ASYNC_MAX_OVERFLOW))
+        )
+        self.DB_ASYNC_STATEMENT_TIMEOUT_MS = int(
+            os.getenv("DB_ASYNC_STATEMENT_TIMEOUT_MS", str(self.DB_ASYNC_STATEMENT_TIMEOUT_MS))
+        )
+        self.DATABASE_READ_URL = os.getenv("DATABASE_READ_URL") or None
+        self.DB_READ_YOUR_WRITES_SECONDS = int(
+            os.getenv("DB_READ_YOUR_WRITES_SECONDS", str(self.DB_READ_YOUR_WRITES_SECONDS))
+        )
+        self.DB_SCHEMA_INIT = os.getenv("DB_SCHEMA_INIT", self.DB_SCHEMA_INIT).lower()
+        self.METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+        self.METRICS_TOKEN = os.getenv("METRICS_TOKEN") or None
+        self.SLOW_REQUEST_MS = int(os.getenv("SLOW_REQUEST_MS", str(self.SLOW_REQUEST_MS)))
         self.SECRET_KEY = os.getenv("SECRET_KEY", self.SECRET_KEY)
         self.ACCESS_TOKEN_EXPIRE_MINUTES = int(
             os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", str(self.ACCESS_TOKEN_EXPIRE_MINUTES))
@@ -104,6 +149,12 @@ class Settings:
                     "ERREUR CRITIQUE DE SECURITE: ENCRYPTION_KEY doit contenir exactement "
                     "32 caractères pour le chiffrement AES-256 (RGPD Art. 32)."
                 )
+            if self.METRICS_ENABLED and not self.METRICS_TOKEN:
+                raise RuntimeError(
+                    "ERREUR CRITIQUE DE SECURITE: METRICS_ENABLED exige METRICS_TOKEN "
+                    "en production, sinon /metrics est public. "
+                    "Définissez la variable d'environnement METRICS_TOKEN."
+                )
 
 
 # Instance globale
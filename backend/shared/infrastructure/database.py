@@ -1,50 +1,86 @@
 """Configuration de la base de données SQLAlchemy."""
 
+import hashlib
+import logging
 import os
-from sqlalchemy import create_engine
+import threading
+import time
+from typing import AsyncIterator, Callable, Optional, TypeVar
+
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import NullPool
 
+from shared.application.read_only import is_read_only
+
 from .config import settings
 
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
 # Créer le dossier data s'il n'existe pas
 os.makedirs("data", exist_ok=True)
 
-# Configuration du moteur SQLAlchemy
-# P2-7: Ajout de timeouts pour éviter les requêtes bloquantes
-if settings.DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        settings.DATABASE_URL,
-        connect_args={
-            "check_same_thread": False,
-            "timeout": 30,  # P2-7: SQLite busy timeout 30s
-        },
-        poolclass=NullPool,
-        echo=settings.DEBUG,
-    )
-else:
+
+def _set_sqlite_pragma(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
+def create_database_engine(url: str) -> Engine:
+    """
+    Crée un moteur synchrone, avec les réglages de pool de ``settings``.
+
+    Args:
+        url: URL SQLAlchemy (base principale ou réplica de lecture).
+
+    Returns:
+        Moteur synchrone.
+    """
+    # P2-7: Ajout de timeouts pour éviter les requêtes bloquantes
+    if url.startswith("sqlite"):
+        sqlite_engine = create_engine(
+            url,
+            connect_args={
+                "check_same_thread": False,
+                "timeout": 30,  # P2-7: SQLite busy timeout 30s
+            },
+            poolclass=NullPool,
+            echo=settings.DEBUG,
+        )
+        # Activer le mode WAL pour SQLite (lectures concurrentes)
+        event.listen(sqlite_engine, "connect", _set_sqlite_pragma)
+        return sqlite_engine
+
     # PostgreSQL ou autre DB
-    engine = create_engine(
-        settings.DATABASE_URL,
+    connect_args = {
+        "connect_timeout": 10,  # P2-7: Timeout connexion 10s
+    }
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+    return create_engine(
+        url,
         echo=settings.DEBUG,
-        pool_size=5,
-        max_overflow=10,
-        pool_timeout=30,  # P2-7: Attente max pour une connexion du pool
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,  # P2-7: Attente max pour une connexion du pool
         pool_recycle=1800,  # Recycle les connexions après 30min
-        connect_args={
-            "connect_timeout": 10,  # P2-7: Timeout connexion 10s
-        },
+        connect_args=connect_args,
     )
 
-# Activer le mode WAL pour SQLite (lectures concurrentes)
-if settings.DATABASE_URL.startswith("sqlite"):
-    from sqlalchemy import event
 
-    @event.listens_for(engine, "connect")
-    def _set_sqlite_pragma(dbapi_connection, connection_record):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA journal_mode=WAL")
-        cursor.close()
+# Configuration du moteur SQLAlchemy
+engine = create_database_engine(settings.DATABASE_URL)
 
 # Factory de sessions
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -69,13 +105,393 @@ def get_db() -> Session:
         db.close()
 
 
-def init_db() -> None:
+# =============================================================================
+# Sessions de lecture (réplica pour les rapports et tableaux de bord)
+# =============================================================================
+
+# Cookie posé après chaque écriture (voir ReadYourWritesMiddleware)
+LAST_WRITE_COOKIE = "last_write_at"
+
+
+class ReadOnlySessionError(RuntimeError):
+    """Écriture tentée sur une session de lecture."""
+
+
+@event.listens_for(Session, "before_flush")
+def _refuser_ecriture_en_lecture(session, flush_context, instances):
+    """Empêche un use case branché sur get_read_db d'écrire (le réplica est en lecture seule)."""
+    if not session.info.get("read_only"):
+        return
+    if session.new or session.deleted or any(session.is_modified(o) for o in session.dirty):
+        raise ReadOnlySessionError(
+            "Écriture sur une session de lecture : utiliser get_db pour ce use case"
+        )
+
+
+class ReadRouting:
+    """
+    Choisit la base interrogée par les sessions de lecture.
+
+    Les lectures vont sur le réplica s'il est configuré, sauf pendant
+    ``read_your_writes_seconds`` après une écriture de l'utilisateur : le
+    réplica peut être en retard, l'utilisateur relit alors la base principale.
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replica: Optional[Engine] = None,
+        read_your_writes_seconds: float = 10,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._primary_sessions = sessionmaker(
+            bind=primary, autoflush=False, info={"read_only": True},
+        )
+        self._replica_sessions = (
+            sessionmaker(bind=replica, autoflush=False, info={"read_only": True})
+            if replica is not None else None
+        )
+        self._read_your_writes_seconds = read_your_writes_seconds
+        self._clock = clock
+
+    @property
+    def has_replica(self) -> bool:
+        """Indique si un réplica de lecture est configuré."""
+        return self._replica_sessions is not None
+
+    def uses_replica(self, last_write_at: Optional[float] = None) -> bool:
+        """
+        Indique si une lecture peut être servie par le réplica.
+
+        Args:
+            last_write_at: Horodatage (epoch) de la dernière écriture de l'utilisateur.
+
+        Returns:
+            True si un réplica est configuré et hors fenêtre read-your-writes.
+        """
+        if not self.has_replica:
+            return False
+        if last_write_at is None:
+            return True
+        return self._clock() - last_write_at >= self._read_your_writes_seconds
+
+    def session(self, last_write_at: Optional[float] = None) -> Session:
+        """Ouvre une session de lecture sur la base choisie."""
+        if self.uses_replica(last_write_at):
+            return self._replica_sessions()
+        return self._primary_sessions()
+
+
+class RecentWrites:
+    """
+    Dernière écriture de chaque utilisateur, côté serveur.
+
+    Complète le cookie ``last_write_at`` pour les clients qui ne gardent pas
+    les cookies (SDK, application mobile en Bearer). Les entrées ne vivent que
+    le temps de la fenêtre read-your-writes. La table est propre au processus :
+    avec plusieurs workers, seul le worker qui a traité l'écriture la connaît.
+    """
+
+    def __init__(self, ttl_seconds: float, clock: Callable[[], float] = time.time):
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._writes: dict[int, float] = {}
+
+    def record(self, user_id: int) -> None:
+        """Enregistre une écriture de l'utilisateur et purge les entrées expirées."""
+        now = self._clock()
+        with self._lock:
+            self._writes[user_id] = now
+            expirees = [uid for uid, at in self._writes.items() if now - at >= self._ttl_seconds]
+            for uid in expirees:
+                del self._writes[uid]
+
+    def last_write_at(self, user_id: int) -> Optional[float]:
+        """Retourne l'horodatage de la dernière écriture encore dans la fenêtre, sinon None."""
+        with self._lock:
+            at = self._writes.get(user_id)
+        if at is None or self._clock() - at >= self._ttl_seconds:
+            return None
+        return at
+
+
+read_engine = (
+    create_database_engine(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else None
+)
+read_routing = ReadRouting(engine, read_engine, settings.DB_READ_YOUR_WRITES_SECONDS)
+recent_writes = RecentWrites(settings.DB_READ_YOUR_WRITES_SECONDS)
+
+
+def request_user_id(request: Request) -> Optional[int]:
+    """
+    Identifie l'utilisateur authentifié d'une requête, sans accès à la base.
+
+    Le JWT (cookie HttpOnly ou en-tête Bearer) est décodé ; une clé API
+    (hbc_...) est résolue par le cache des clés vérifiées.
+
+    Args:
+        request: Requête HTTP.
+
+    Returns:
+        ID de l'utilisateur, ou None si la requête n'est pas authentifiée.
+    """
+    # Imports différés : ces modules dépendent de get_db
+    from .api_v1.api_key_cache import get_api_key_cache
+    from .web.dependencies import AUTH_COOKIE_NAME, get_token_service
+
+    token = request.cookies.get(AUTH_COOKIE_NAME)
+    authorization = request.headers.get("Authorization", "")
+    if not token and authorization.startswith("Bearer "):
+        token = authorization[7:]
+    if not token:
+        return None
+
+    if token.startswith("hbc_"):
+        cle = get_api_key_cache().get(hashlib.sha256(token.encode("utf-8")).hexdigest())
+        return cle.user_id if cle is not None else None
+    return get_token_service().get_user_id(token)
+
+
+def _last_write_at(request: Request) -> Optional[float]:
+    if not read_routing.has_replica:
+        return None
+    try:
+        cookie = float(request.cookies[LAST_WRITE_COOKIE])
+    except (KeyError, ValueError):
+        cookie = None
+
+    user_id = request_user_id(request)
+    serveur = recent_writes.last_write_at(user_id) if user_id is not None else None
+    return max((at for at in (cookie, serveur) if at is not None), default=None)
+
+
+def get_read_db(request: Request) -> Session:
+    """
+    Générateur de session de lecture pour l'injection de dépendances FastAPI.
+
+    Sert les use cases marqués ``@read_only`` depuis le réplica de lecture
+    (DATABASE_READ_URL), ou depuis la base principale si aucun réplica n'est
+    configuré ou si l'utilisateur vient d'écrire (cookie ``last_write_at``
+    ou écriture enregistrée dans ``recent_writes``). Toute écriture ORM sur
+    cette session lève ReadOnlySessionError.
+
+    Yields:
+        Session SQLAlchemy en lecture seule.
+    """
+    db = read_routing.session(_last_write_at(request))
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def session_for(use_case_class: type) -> Callable:
+    """
+    Retourne la dépendance de session adaptée à un use case.
+
+    Args:
+        use_case_class: Classe du use case servi par la route.
+
+    Returns:
+        get_read_db si le use case est marqué ``@read_only``, sinon get_db.
+
+    Usage:
+        def get_use_case(db: Session = Depends(session_for(GetDashboardUseCase))):
+            ...
+    """
+    return get_read_db if is_read_only(use_case_class) else get_db
+
+
+# =============================================================================
+# Sessions asynchrones (routes de lecture à fort trafic)
+# =============================================================================
+
+# Pilote asynchrone par backend
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+_async_engine: Optional[AsyncEngine] = None
+_async_sessionmaker: Optional[async_sessionmaker] = None
+_async_lock = threading.Lock()
+
+
+def async_database_url(url: str) -> str:
+    """
+    Convertit une URL synchrone en URL du pilote asynchrone équivalent.
+
+    Args:
+        url: URL SQLAlchemy (ex: postgresql://..., sqlite:///...).
+
+    Returns:
+        URL avec le pilote asyncpg (PostgreSQL) ou aiosqlite (SQLite).
+
+    Raises:
+        ValueError: Si le backend n'a pas de pilote asynchrone connu.
+    """
+    parsed = make_url(url)
+    if parsed.get_dialect().is_async:
+        return url
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"Pas de pilote asynchrone pour {parsed.get_backend_name()}")
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def create_async_database_engine(url: str) -> AsyncEngine:
+    """
+    Crée le moteur asynchrone, avec les réglages de pool de ``settings``.
+
+    Args:
+        url: URL SQLAlchemy (synchrone ou asynchrone).
+
+    Returns:
+        Moteur asynchrone.
+    """
+    async_url = async_database_url(url)
+    if make_url(async_url).get_backend_name() == "sqlite":
+        async_engine = create_async_engine(
+            async_url,
+            connect_args={"timeout": 30},
+            poolclass=NullPool,
+            echo=settings.DEBUG,
+        )
+        event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragma)
+        return async_engine
+
+    server_settings = {}
+    if settings.DB_ASYNC_STATEMENT_TIMEOUT_MS > 0:
+        server_settings["statement_timeout"] = str(settings.DB_ASYNC_STATEMENT_TIMEOUT_MS)
+    return create_async_engine(
+        async_url,
+        echo=settings.DEBUG,
+        pool_size=settings.DB_ASYNC_POOL_SIZE,
+        max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        connect_args={"timeout": 10, "server_settings": server_settings},
+    )
+
+
+def get_async_engine() -> AsyncEngine:
+    """Retourne le moteur asynchrone du processus (créé au premier appel)."""
+    global _async_engine, _async_sessionmaker
+    if _async_engine is None:
+        with _async_lock:
+            if _async_engine is None:
+                from .reference_directory import register_reference_source
+
+                async_engine = create_async_database_engine(settings.DATABASE_URL)
+                # L'annuaire des données de référence est chargé via le moteur synchrone
+                register_reference_source(async_engine.sync_engine, engine)
+                _async_sessionmaker = async_sessionmaker(
+                    async_engine, autoflush=False, expire_on_commit=False,
+                )
+                _async_engine = async_engine
+    return _async_engine
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Générateur de session asynchrone pour l'injection de dépendances FastAPI.
+
+    La route s'exécute dans la boucle d'événements au lieu du pool de threads
+    de Starlette : l'attente porte sur la base, pas sur un thread libre. Les
+    repositories synchrones existants s'utilisent via ``run_in_session``.
+
+    Yields:
+        AsyncSession SQLAlchemy.
+
+    Usage:
+        @app.get("/")
+        async def route(db: AsyncSession = Depends(get_async_db)):
+            return await run_in_session(db, lambda session: Repo(session).find_all())
+    """
+    from .reference_directory import refresh_reference_source
+
+    async_engine = get_async_engine()
+    # Annuaire de référence rafraîchi hors de la boucle, avant les lectures
+    await refresh_reference_source(async_engine.sync_engine)
+    async with _async_sessionmaker() as session:
+        yield session
+
+
+async def run_in_session(db: AsyncSession, fn: Callable[[Session], T]) -> T:
+    """
+    Exécute du code ORM synchrone (repositories, use cases) sur une session asynchrone.
+
+    ``fn`` reçoit une Session synchrone dont les requêtes passent par la
+    connexion asynchrone, sans bloquer la boucle d'événements.
+
+    Args:
+        db: Session asynchrone de la requête.
+        fn: Fonction recevant la Session synchrone.
+
+    Returns:
+        Le résultat de ``fn``.
+    """
+    return await db.run_sync(fn)
+
+
+async def dispose_async_engine() -> None:
+    """Ferme les connexions du moteur asynchrone (arrêt de l'application)."""
+    global _async_engine, _async_sessionmaker
+    with _async_lock:
+        async_engine, _async_engine, _async_sessionmaker = _async_engine, None, None
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+# Modes d'initialisation du schéma au démarrage (settings.DB_SCHEMA_INIT)
+SCHEMA_INIT_MODES = ("auto", "create", "skip")
+
+
+def init_db(mode: Optional[str] = None) -> bool:
     """
     Initialise la base de données (crée les tables).
 
     À appeler au démarrage de l'application.
     Utilise une Base partagée pour que les ForeignKeys entre modules fonctionnent.
+
+    Modes :
+    - ``auto`` : ne fait rien si la base est à la dernière révision Alembic
+      (déploiement migré), sinon crée les tables manquantes ;
+    - ``create`` : crée toujours les tables manquantes ;
+    - ``skip`` : ne touche jamais au schéma.
+
+    Args:
+        mode: Mode d'initialisation (défaut: settings.DB_SCHEMA_INIT).
+
+    Returns:
+        True si create_all a été exécuté.
+
+    Raises:
+        ValueError: Si le mode est inconnu.
     """
+    mode = mode or settings.DB_SCHEMA_INIT
+    if mode not in SCHEMA_INIT_MODES:
+        raise ValueError(
+            f"DB_SCHEMA_INIT invalide: {mode} (attendu: {', '.join(SCHEMA_INIT_MODES)})"
+        )
+    if mode == "skip":
+        logger.info("Initialisation du schéma désactivée (DB_SCHEMA_INIT=skip)")
+        return False
+    if mode == "auto":
+        from .schema_state import schema_is_at_head
+
+        if schema_is_at_head(engine):
+            logger.info("Schéma à la dernière révision Alembic : create_all ignoré")
+            return False
+
+    _create_schema()
+    return True
+
+
+def _create_schema() -> None:
+    """Crée les tables de tous les modules puis migre les données legacy."""
     from .database_base import Base
 
     # Import des modèles pour les enregistrer dans la Base partagée
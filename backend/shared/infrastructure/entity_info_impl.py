@@ -10,7 +10,7 @@ Note architecture:
 - Si un module change, seul ce fichier doit etre modifie
 """
 
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 import logging
 
 from sqlalchemy.orm import Session
@@ -61,20 +61,7 @@ class SQLAlchemyEntityInfoService(EntityInfoService):
             ).first()
 
             if user:
-                nom = f"{user.prenom or ''} {user.nom or ''}".strip()
-                # Récupérer le premier métier si la liste existe et n'est pas vide
-                metier = None
-                if user.metiers and len(user.metiers) > 0:
-                    metier = user.metiers[0]
-
-                return UserBasicInfo(
-                    id=user.id,
-                    nom=nom or f"User {user.id}",
-                    couleur=user.couleur,
-                    metier=metier,
-                    role=user.role,
-                    type_utilisateur=user.type_utilisateur,
-                )
+                return self._to_user_info(user)
         except Exception as e:
             logger.warning(f"Erreur recuperation user {user_id}: {e}")
 
@@ -97,16 +84,87 @@ class SQLAlchemyEntityInfoService(EntityInfoService):
             ).first()
 
             if chantier:
-                return ChantierBasicInfo(
-                    id=chantier.id,
-                    nom=chantier.nom or f"Chantier {chantier.id}",
-                    couleur=chantier.couleur,
-                )
+                return self._to_chantier_info(chantier)
         except Exception as e:
             logger.warning(f"Erreur recuperation chantier {chantier_id}: {e}")
 
         return None
 
+    def get_users_info(self, user_ids: Iterable[int]) -> Dict[int, UserBasicInfo]:
+        """Recupere les informations de plusieurs utilisateurs en une requete.
+
+        Args:
+            user_ids: Identifiants des utilisateurs.
+
+        Returns:
+            Dictionnaire {user_id: UserBasicInfo} des utilisateurs trouves.
+        """
+        ids = set(user_ids)
+        if not ids:
+            return {}
+        try:
+            from modules.auth.infrastructure.persistence import UserModel
+
+            users = self._session.query(UserModel).filter(
+                UserModel.id.in_(ids)
+            ).all()
+            return {user.id: self._to_user_info(user) for user in users}
+        except Exception as e:
+            logger.warning(f"Erreur recuperation users {sorted(ids)}: {e}")
+
+        return {}
+
+    def get_chantiers_info(self, chantier_ids: Iterable[int]) -> Dict[int, ChantierBasicInfo]:
+        """Recupere les informations de plusieurs chantiers en une requete.
+
+        Args:
+            chantier_ids: Identifiants des chantiers.
+
+        Returns:
+            Dictionnaire {chantier_id: ChantierBasicInfo} des chantiers trouves.
+        """
+        ids = set(chantier_ids)
+        if not ids:
+            return {}
+        try:
+            from modules.chantiers.infrastructure.persistence import ChantierModel
+
+            chantiers = self._session.query(ChantierModel).filter(
+                ChantierModel.id.in_(ids)
+            ).all()
+            return {c.id: self._to_chantier_info(c) for c in chantiers}
+        except Exception as e:
+            logger.warning(f"Erreur recuperation chantiers {sorted(ids)}: {e}")
+
+        return {}
+
+    @staticmethod
+    def _to_user_info(user) -> UserBasicInfo:
+        """Convertit un UserModel en UserBasicInfo."""
+        nom = f"{user.prenom or ''} {user.nom or ''}".strip()
+        # Récupérer le premier métier si la liste existe et n'est pas vide
+        metier = None
+        if user.metiers and len(user.metiers) > 0:
+            metier = user.metiers[0]
+
+        return UserBasicInfo(
+            id=user.id,
+            nom=nom or f"User {user.id}",
+            couleur=user.couleur,
+            metier=metier,
+            role=user.role,
+            type_utilisateur=user.type_utilisateur,
+        )
+
+    @staticmethod
+    def _to_chantier_info(chantier) -> ChantierBasicInfo:
+        """Convertit un ChantierModel en ChantierBasicInfo."""
+        return ChantierBasicInfo(
+            id=chantier.id,
+            nom=chantier.nom or f"Chantier {chantier.id}",
+            couleur=chantier.couleur,
+        )
+
     def get_active_user_ids(self) -> List[int]:
         """Recupere les IDs de tous les utilisateurs actifs.
 
@@ -6,6 +6,7 @@ import asyncio
 import logging
 
 from .domain_event import DomainEvent
+from ..metrics import measure_event_handler, registry as metrics_registry
 
 logger = logging.getLogger(__name__)
 
@@ -138,11 +139,14 @@ class EventBus:
             try:
                 if asyncio.iscoroutinefunction(handler):
                     # Handler async
-                    tasks.append(handler(event))
+                    task = handler(event)
                 else:
                     # Handler synchrone → run in executor
                     loop = asyncio.get_event_loop()
-                    tasks.append(loop.run_in_executor(None, handler, event))
+                    task = loop.run_in_executor(None, handler, event)
+                if metrics_registry.enabled:
+                    task = measure_event_handler(task, event.event_type, handler.__name__)
+                tasks.append(task)
             except Exception as e:
                 logger.error(
                     f"Erreur création task pour {handler.__name__}: {e}",
@@ -3,10 +3,12 @@
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Tuple
-from PIL import Image
+from typing import Tuple, TYPE_CHECKING
 import io
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 
 class FileUploadError(Exception):
     """Erreur lors de l'upload d'un fichier."""
@@ -90,6 +92,7 @@ class FileService:
                 f"Extension non autorisée. Extensions acceptées: {', '.join(self.ALLOWED_IMAGE_EXTENSIONS)}"
             )
 
+        from PIL import Image
         try:
             img = Image.open(io.BytesIO(file_content))
             img.verify()
@@ -110,6 +113,7 @@ class FileService:
         if max_size_bytes is None:
             max_size_bytes = self.MAX_FILE_SIZE_BYTES
 
+        from PIL import Image
         img = Image.open(io.BytesIO(file_content))
         img = self._convert_to_rgb(img)
 
@@ -144,6 +148,7 @@ class FileService:
         Returns:
             Miniature de l'image.
         """
+        from PIL import Image
         img = Image.open(io.BytesIO(file_content))
         img = self._convert_to_rgb(img)
 
@@ -154,9 +159,11 @@ class FileService:
         img.save(output, format="JPEG", quality=85, optimize=True)
         return output.getvalue()
 
-    def _convert_to_rgb(self, img: Image.Image) -> Image.Image:
+    def _convert_to_rgb(self, img: "Image.Image") -> "Image.Image":
         """Convertit une image RGBA/P en RGB."""
         if img.mode in ("RGBA", "P"):
+            from PIL import Image
+
             background = Image.new("RGB", img.size, (255, 255, 255))
             if img.mode == "P":
                 img = img.convert("RGBA")
@@ -179,6 +186,7 @@ class FileService:
         Returns:
             Dict avec clés webp_thumbnail_url, webp_medium_url, webp_large_url.
         """
+        from PIL import Image
         img = Image.open(io.BytesIO(file_content))
         img = self._convert_to_rgb(img)
 
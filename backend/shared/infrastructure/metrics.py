@@ -0,0 +1,423 @@
+"""Métriques de performance des chemins critiques, au format Prometheus.
+
+Registre minimal en mémoire (compteurs et histogrammes avec labels) rendu au
+format d'exposition texte 0.0.4, lu par ``GET /metrics``. Les mesures
+couvrent :
+
+- les requêtes HTTP, par gabarit de route (``/api/devis/{devis_id}``) ;
+- les requêtes SQL de chaque requête HTTP (nombre et durée), via les
+  événements du moteur ;
+- les use cases décorés par ``@timed`` ;
+- les handlers de l'EventBus et les jobs du scheduler ;
+- les succès/échecs du cache applicatif (lus au moment du rendu).
+
+Tout est inactif tant que ``enable_metrics()`` n'a pas été appelé
+(METRICS_ENABLED) : aucun écouteur SQL, aucun enregistreur de use case, et
+les points d'instrumentation se limitent à un test de ``registry.enabled``.
+"""
+
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from shared.application.instrumentation import set_use_case_recorder
+
+from .query_counter import ExecutedStatement
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+JOB_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+# Requêtes conservées par requête HTTP pour le journal des requêtes lentes
+MAX_STATEMENTS_PER_REQUEST = 500
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    paires = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + paires + "}"
+
+
+class _Metric:
+    """Base commune : nom, aide, labels et verrou."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+
+class Counter(_Metric):
+    """Compteur monotone, par combinaison de labels."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lignes = self.header()
+        lignes.extend(
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}"
+            for key, v in values
+        )
+        return lignes
+
+
+class Gauge(Counter):
+    """Valeur instantanée, par combinaison de labels."""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Histogramme à seaux cumulés, par combinaison de labels."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [compte par seau..., somme, total]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            serie = self._values.get(key)
+            if serie is None:
+                serie = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            for i, borne in enumerate(self.buckets):
+                if value <= borne:
+                    serie[i] += 1
+                    break
+            serie[-2] += value
+            serie[-1] += 1
+
+    def count(self, **labels: str) -> float:
+        serie = self._values.get(self._key(labels))
+        return serie[-1] if serie else 0.0
+
+    def sum(self, **labels: str) -> float:
+        serie = self._values.get(self._key(labels))
+        return serie[-2] if serie else 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted((key, list(serie)) for key, serie in self._values.items())
+        lignes = self.header()
+        noms_le = self.labelnames + ("le",)
+        for key, serie in values:
+            cumul = 0.0
+            for borne, nombre in zip(self.buckets, serie):
+                cumul += nombre
+                labels = _format_labels(noms_le, key + (_format_value(borne),))
+                lignes.append(f"{self.name}_bucket{labels} {_format_value(cumul)}")
+            labels = _format_labels(noms_le, key + ("+Inf",))
+            lignes.append(f"{self.name}_bucket{labels} {_format_value(serie[-1])}")
+            labels = _format_labels(self.labelnames, key)
+            lignes.append(f"{self.name}_sum{labels} {_format_value(serie[-2])}")
+            lignes.append(f"{self.name}_count{labels} {_format_value(serie[-1])}")
+        return lignes
+
+
+# Collecteur : renvoie des métriques calculées au moment du rendu
+Collector = Callable[[], Iterable[_Metric]]
+
+
+class MetricsRegistry:
+    """Ensemble des métriques exposées par ``/metrics``."""
+
+    def __init__(self):
+        self.enabled = False
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Collector] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Collector) -> None:
+        self._collectors.append(collector)
+
+    def reset(self) -> None:
+        """Remet toutes les métriques à zéro (tests)."""
+        for metric in self._metrics:
+            metric.reset()
+
+    def render(self) -> str:
+        """Rend les métriques au format d'exposition texte Prometheus."""
+        lignes: List[str] = []
+        for metric in self._metrics:
+            lignes.extend(metric.render())
+        for collector in self._collectors:
+            try:
+                for metric in collector():
+                    lignes.extend(metric.render())
+            except Exception as e:
+                logger.error(f"Erreur du collecteur de métriques {collector.__name__}: {e}")
+        return "\n".join(lignes) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "Durée des requêtes HTTP, par gabarit de route.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_SQL_QUERIES = registry.histogram(
+    "http_request_sql_queries",
+    "Nombre de requêtes SQL par requête HTTP.",
+    ("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+HTTP_REQUEST_SQL_DURATION = registry.histogram(
+    "http_request_sql_duration_seconds",
+    "Durée cumulée des requêtes SQL par requête HTTP.",
+    ("method", "route"),
+)
+USE_CASE_DURATION = registry.histogram(
+    "use_case_duration_seconds",
+    "Durée d'exécution des use cases.",
+    ("use_case",),
+)
+EVENT_HANDLER_DURATION = registry.histogram(
+    "event_handler_duration_seconds",
+    "Durée des handlers de l'EventBus.",
+    ("event_type", "handler"),
+)
+EVENT_HANDLER_ERRORS = registry.counter(
+    "event_handler_errors_total",
+    "Handlers de l'EventBus terminés en erreur.",
+    ("event_type", "handler"),
+)
+SCHEDULER_JOB_DURATION = registry.histogram(
+    "scheduler_job_duration_seconds",
+    "Durée des jobs planifiés.",
+    ("job",),
+    buckets=JOB_BUCKETS,
+)
+SCHEDULER_JOB_ERRORS = registry.counter(
+    "scheduler_job_errors_total",
+    "Jobs planifiés terminés en erreur.",
+    ("job",),
+)
+
+
+def _cache_metrics() -> Iterable[_Metric]:
+    """Succès/échecs du cache applicatif, lus sur ``cache_manager``."""
+    from .cache import cache_manager
+
+    stats = cache_manager.stats()
+    requetes = Counter(
+        "cache_requests_total", "Lectures du cache applicatif, par résultat.", ("result",),
+    )
+    requetes.inc(stats["hits"], result="hit")
+    requetes.inc(stats["misses"], result="miss")
+    entrees = Gauge("cache_entries", "Entrées présentes dans le cache applicatif.")
+    entrees.set(stats["size"])
+    return [requetes, entrees]
+
+
+registry.add_collector(_cache_metrics)
+
+
+# =============================================================================
+# Requêtes SQL de la requête HTTP courante
+# =============================================================================
+
+_START_KEY = "metrics_started_at"
+
+
+@dataclass
+class RequestStats:
+    """Requêtes SQL exécutées pendant une requête HTTP."""
+
+    sql_count: int = 0
+    sql_seconds: float = 0.0
+    statements: List[ExecutedStatement] = field(default_factory=list)
+
+    def record(self, sql: str, duree_s: float) -> None:
+        self.sql_count += 1
+        self.sql_seconds += duree_s
+        if len(self.statements) < MAX_STATEMENTS_PER_REQUEST:
+            self.statements.append(ExecutedStatement(sql, duree_s * 1000))
+
+    def top_statements(self, limit: int = 5) -> List[ExecutedStatement]:
+        """Requêtes les plus lentes, de la plus lente à la plus rapide."""
+        return sorted(self.statements, key=lambda s: s.duration_ms, reverse=True)[:limit]
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def begin_request():
+    """Ouvre le suivi SQL d'une requête HTTP ; renvoie (stats, jeton)."""
+    stats = RequestStats()
+    return stats, _request_stats.set(stats)
+
+
+def end_request(token) -> None:
+    """Ferme le suivi SQL ouvert par ``begin_request``."""
+    _request_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_stats.get() is not None:
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_stats.get()
+    if stats is None:
+        return
+    debuts = conn.info.get(_START_KEY)
+    duree = time.perf_counter() - debuts.pop() if debuts else 0.0
+    stats.record(statement, duree)
+
+
+# =============================================================================
+# Use cases, handlers d'événements et jobs planifiés
+# =============================================================================
+
+def _record_use_case(nom: str, duree_s: float) -> None:
+    USE_CASE_DURATION.observe(duree_s, use_case=nom)
+
+
+async def measure_event_handler(awaitable: Awaitable, event_type: str, handler_name: str):
+    """Attend un handler de l'EventBus en mesurant sa durée (erreurs relancées)."""
+    debut = time.perf_counter()
+    try:
+        return await awaitable
+    except Exception:
+        EVENT_HANDLER_ERRORS.inc(event_type=event_type, handler=handler_name)
+        raise
+    finally:
+        EVENT_HANDLER_DURATION.observe(
+            time.perf_counter() - debut, event_type=event_type, handler=handler_name,
+        )
+
+
+def timed_job(job_id: str, func: Callable) -> Callable:
+    """Enveloppe un job planifié pour mesurer sa durée quand les métriques sont actives."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not registry.enabled:
+            return func(*args, **kwargs)
+        debut = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            SCHEDULER_JOB_ERRORS.inc(job=job_id)
+            raise
+        finally:
+            SCHEDULER_JOB_DURATION.observe(time.perf_counter() - debut, job=job_id)
+
+    return wrapper
+
+
+# =============================================================================
+# Activation
+# =============================================================================
+
+def enable_metrics() -> None:
+    """Active la collecte : écouteurs SQL et chronométrage des use cases."""
+    if registry.enabled:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    set_use_case_recorder(_record_use_case)
+    registry.enabled = True
+    logger.info("Métriques de performance activées (/metrics)")
+
+
+def disable_metrics() -> None:
+    """Désactive la collecte (les valeurs déjà mesurées sont conservées)."""
+    if not registry.enabled:
+        return
+    event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+    set_use_case_recorder(None)
+    registry.enabled = False
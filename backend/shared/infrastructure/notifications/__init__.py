@@ -5,6 +5,14 @@ from .notification_service import (
     get_notification_service,
     NotificationPayload,
 )
+from .push_queue import (
+    PushTransport,
+    FCMPushTransport,
+    FakePushTransport,
+    PushBatchQueue,
+    get_push_queue,
+    stop_push_queue,
+)
 from .handlers import (
     ReservationNotificationHandler,
     SignalementNotificationHandler,
@@ -16,6 +24,12 @@ __all__ = [
     "NotificationService",
     "get_notification_service",
     "NotificationPayload",
+    "PushTransport",
+    "FCMPushTransport",
+    "FakePushTransport",
+    "PushBatchQueue",
+    "get_push_queue",
+    "stop_push_queue",
     "ReservationNotificationHandler",
     "SignalementNotificationHandler",
     "FeedNotificationHandler",
@@ -8,6 +8,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from ..notification_service import NotificationPayload, get_notification_service
+from ..push_queue import get_push_queue
 
 if TYPE_CHECKING:
     from modules.logistique.domain.events import (
@@ -23,7 +24,8 @@ class ReservationNotificationHandler:
     """Handler des notifications pour les réservations de matériel.
 
     Ce handler est appelé par l'EventBus quand des events de réservation
-    sont publiés. Il envoie les notifications push appropriées.
+    sont publiés. Les push individuels sont déposés dans la file d'envoi
+    groupé (PushBatchQueue) plutôt qu'envoyés en ligne.
     """
 
     def __init__(self, user_repository=None):
@@ -33,6 +35,7 @@ class ReservationNotificationHandler:
             user_repository: Repository pour récupérer les tokens push des utilisateurs
         """
         self._notification_service = get_notification_service()
+        self._push_queue = get_push_queue()
         self._user_repository = user_repository
 
     def handle_reservation_created(self, event: "ReservationCreatedEvent") -> None:
@@ -99,7 +102,8 @@ class ReservationNotificationHandler:
         token = self._get_user_push_token(event.demandeur_id)
 
         if token:
-            success = self._notification_service.send_to_token(token, payload)
+            self._push_queue.enqueue([token], payload)
+            success = True
         else:
             # En mode dev/simulé, log seulement
             logger.info(
@@ -110,7 +114,7 @@ class ReservationNotificationHandler:
 
         if success:
             logger.info(
-                f"Notification validation envoyée pour réservation {event.reservation_id}"
+                f"Notification validation mise en file pour réservation {event.reservation_id}"
             )
 
     def handle_reservation_refusee(self, event: "ReservationRefuseeEvent") -> None:
@@ -141,7 +145,8 @@ class ReservationNotificationHandler:
         token = self._get_user_push_token(event.demandeur_id)
 
         if token:
-            success = self._notification_service.send_to_token(token, payload)
+            self._push_queue.enqueue([token], payload)
+            success = True
         else:
             logger.info(
                 f"[SIMULATED] Notification refus → User {event.demandeur_id}: "
@@ -151,7 +156,7 @@ class ReservationNotificationHandler:
 
         if success:
             logger.info(
-                f"Notification refus envoyée pour réservation {event.reservation_id}"
+                f"Notification refus mise en file pour réservation {event.reservation_id}"
             )
 
     def _get_user_push_token(self, user_id: int) -> str | None:
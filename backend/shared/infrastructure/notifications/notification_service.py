@@ -15,6 +15,9 @@ from typing import Optional, List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Nombre maximal de tokens par message multicast (limite FCM)
+MULTICAST_MAX_TOKENS = 500
+
 # Singleton
 _notification_service: Optional["NotificationService"] = None
 
@@ -171,6 +174,9 @@ class NotificationService:
     ) -> Dict[str, bool]:
         """Envoie une notification à plusieurs tokens.
 
+        Les tokens sont envoyés en multicast par lots de
+        MULTICAST_MAX_TOKENS (limite FCM).
+
         Args:
             tokens: Liste de tokens FCM
             payload: Contenu de la notification
@@ -187,6 +193,19 @@ class NotificationService:
             )
             return {token: True for token in tokens}
 
+        results = {}
+        for i in range(0, len(tokens), MULTICAST_MAX_TOKENS):
+            results.update(
+                self._send_multicast(tokens[i:i + MULTICAST_MAX_TOKENS], payload)
+            )
+        return results
+
+    def _send_multicast(
+        self,
+        tokens: List[str],
+        payload: NotificationPayload,
+    ) -> Dict[str, bool]:
+        """Envoie un lot multicast (au plus MULTICAST_MAX_TOKENS tokens)."""
         try:
             from firebase_admin import messaging
 
@@ -199,6 +218,12 @@ class NotificationService:
                 data=payload.data,
                 tokens=tokens,
             )
+            if payload.click_action:
+                message.webpush = messaging.WebpushConfig(
+                    fcm_options=messaging.WebpushFCMOptions(
+                        link=payload.click_action
+                    )
+                )
 
             response = messaging.send_multicast(message)
 
@@ -0,0 +1,256 @@
+"""File d'envoi groupé des notifications push.
+
+Les handlers n'appellent plus FCM en ligne : ils déposent (tokens, payload)
+dans la file, vidée par un worker en arrière-plan. Les messages de même
+contenu sont fusionnés et envoyés en multicast, par lots d'au plus
+500 tokens (limite FCM).
+
+Le transport est interchangeable :
+- FCMPushTransport : Firebase Cloud Messaging (production)
+- FakePushTransport : en mémoire, enregistre les lots (développement, tests)
+"""
+
+import logging
+import os
+from abc import ABC, abstractmethod
+from threading import Event, Lock, Thread
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .notification_service import NotificationPayload, get_notification_service
+
+logger = logging.getLogger(__name__)
+
+# Nombre maximal de tokens par message multicast FCM
+FCM_MULTICAST_MAX_TOKENS = 500
+
+# Intervalle entre deux vidages de la file (secondes)
+PUSH_FLUSH_INTERVAL_SECONDS = 1.0
+
+
+class PushTransport(ABC):
+    """Transport d'envoi multicast des notifications push."""
+
+    @abstractmethod
+    def send_multicast(
+        self, tokens: List[str], payload: NotificationPayload
+    ) -> Dict[str, bool]:
+        """Envoie un même message à plusieurs tokens.
+
+        Args:
+            tokens: Tokens destinataires (au plus FCM_MULTICAST_MAX_TOKENS)
+            payload: Contenu de la notification
+
+        Returns:
+            Dict avec status par token
+        """
+
+
+class FCMPushTransport(PushTransport):
+    """Transport Firebase Cloud Messaging (via NotificationService)."""
+
+    def __init__(self, notification_service=None):
+        """Initialise le transport.
+
+        Args:
+            notification_service: Service FCM (défaut: singleton)
+        """
+        self._notification_service = notification_service or get_notification_service()
+
+    def send_multicast(
+        self, tokens: List[str], payload: NotificationPayload
+    ) -> Dict[str, bool]:
+        return self._notification_service.send_to_tokens(tokens, payload)
+
+
+class FakePushTransport(PushTransport):
+    """Transport en mémoire : enregistre les lots au lieu de les envoyer."""
+
+    def __init__(self):
+        self.sent: List[Tuple[List[str], NotificationPayload]] = []
+
+    def send_multicast(
+        self, tokens: List[str], payload: NotificationPayload
+    ) -> Dict[str, bool]:
+        self.sent.append((list(tokens), payload))
+        return {token: True for token in tokens}
+
+
+def _cle_payload(payload: NotificationPayload) -> Hashable:
+    """Clé de fusion : deux payloads de même contenu partagent un multicast."""
+    return (
+        payload.title,
+        payload.body,
+        tuple(sorted(payload.data.items())),
+        payload.image_url,
+        payload.click_action,
+    )
+
+
+def _chunks(tokens: List[str], taille: int) -> Iterable[List[str]]:
+    """Découpe une liste de tokens en lots de `taille` au plus."""
+    for i in range(0, len(tokens), taille):
+        yield tokens[i:i + taille]
+
+
+class PushBatchQueue:
+    """File d'envoi push vidée par lots multicast.
+
+    Thread-safe : ``enqueue`` peut être appelé depuis n'importe quel
+    handler ; le worker (``start``) vide la file à intervalle régulier, ou
+    plus tôt quand un lot complet est disponible.
+    """
+
+    def __init__(
+        self,
+        transport: PushTransport,
+        max_batch_tokens: int = FCM_MULTICAST_MAX_TOKENS,
+        flush_interval_seconds: float = PUSH_FLUSH_INTERVAL_SECONDS,
+    ):
+        """Initialise la file.
+
+        Args:
+            transport: Transport d'envoi multicast
+            max_batch_tokens: Tokens maximum par envoi (1-500)
+            flush_interval_seconds: Intervalle de vidage du worker
+        """
+        if not 1 <= max_batch_tokens <= FCM_MULTICAST_MAX_TOKENS:
+            raise ValueError(
+                f"max_batch_tokens doit être entre 1 et {FCM_MULTICAST_MAX_TOKENS}"
+            )
+        self.transport = transport
+        self.max_batch_tokens = max_batch_tokens
+        self.flush_interval_seconds = flush_interval_seconds
+
+        self._lock = Lock()
+        # Clé payload -> (payload, tokens uniques dans l'ordre d'arrivée)
+        self._pending: Dict[Hashable, Tuple[NotificationPayload, Dict[str, None]]] = {}
+        self._wakeup = Event()
+        self._stopping = Event()
+        self._worker: Optional[Thread] = None
+
+    def enqueue(self, tokens: Iterable[str], payload: NotificationPayload) -> None:
+        """Dépose un message à envoyer aux tokens donnés.
+
+        Args:
+            tokens: Tokens FCM destinataires
+            payload: Contenu de la notification
+        """
+        tokens = [t for t in tokens if t]
+        if not tokens:
+            return
+
+        with self._lock:
+            _, en_attente = self._pending.setdefault(
+                _cle_payload(payload), (payload, {})
+            )
+            en_attente.update(dict.fromkeys(tokens))
+            lot_complet = len(en_attente) >= self.max_batch_tokens
+
+        if lot_complet:
+            self._wakeup.set()
+
+    def pending(self) -> int:
+        """Nombre de tokens en attente d'envoi."""
+        with self._lock:
+            return sum(len(tokens) for _, tokens in self._pending.values())
+
+    def flush(self) -> int:
+        """Envoie tous les messages en attente.
+
+        Returns:
+            Nombre d'envois multicast effectués
+        """
+        with self._lock:
+            lots = list(self._pending.values())
+            self._pending = {}
+
+        envois = 0
+        for payload, tokens in lots:
+            for chunk in _chunks(list(tokens), self.max_batch_tokens):
+                envois += 1
+                try:
+                    resultats = self.transport.send_multicast(chunk, payload)
+                except Exception as e:
+                    logger.error(f"Erreur envoi push ({len(chunk)} tokens): {e}")
+                    continue
+                echecs = sum(1 for ok in resultats.values() if not ok)
+                if echecs:
+                    logger.warning(
+                        f"Push '{payload.title}': {echecs}/{len(chunk)} échec(s)"
+                    )
+        return envois
+
+    def start(self) -> None:
+        """Démarre le worker d'envoi en arrière-plan."""
+        if self._worker and self._worker.is_alive():
+            return
+        self._stopping.clear()
+        self._worker = Thread(target=self._run, name="push-batch-queue", daemon=True)
+        self._worker.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Arrête le worker et envoie les messages restants.
+
+        Args:
+            timeout: Attente maximale de l'arrêt du worker (secondes)
+        """
+        self._stopping.set()
+        self._wakeup.set()
+        if self._worker:
+            self._worker.join(timeout)
+            self._worker = None
+        self.flush()
+
+    def _run(self) -> None:
+        """Boucle du worker : vide la file à chaque réveil."""
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval_seconds)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:  # pragma: no cover - filet de sécurité
+                logger.error(f"Erreur worker push: {e}", exc_info=True)
+
+
+# Singleton
+_push_queue: Optional[PushBatchQueue] = None
+_push_queue_lock = Lock()
+
+
+def get_push_queue() -> PushBatchQueue:
+    """Retourne la file d'envoi push du processus (worker démarré).
+
+    Variables d'environnement :
+        PUSH_TRANSPORT: "fcm" (défaut) ou "fake" (en mémoire, sans envoi)
+
+    Returns:
+        Instance unique de PushBatchQueue.
+    """
+    global _push_queue
+
+    with _push_queue_lock:
+        if _push_queue is None:
+            if os.environ.get("PUSH_TRANSPORT", "fcm").lower() == "fake":
+                transport: PushTransport = FakePushTransport()
+            else:
+                transport = FCMPushTransport()
+            _push_queue = PushBatchQueue(transport)
+            _push_queue.start()
+        return _push_queue
+
+
+def stop_push_queue(timeout: float = 5.0) -> None:
+    """Arrête la file d'envoi push du processus si elle a été créée.
+
+    Sans envoi pendant la vie du processus, rien n'est créé à l'arrêt
+    (pas de transport FCM initialisé pour rien).
+
+    Args:
+        timeout: Attente maximale de l'arrêt du worker (secondes)
+    """
+    global _push_queue
+
+    with _push_queue_lock:
+        queue, _push_queue = _push_queue, None
+    if queue is not None:
+        queue.stop(timeout)
@@ -1,5 +1,6 @@
 """Services PDF pour la génération de documents."""
 
 from .pdf_generator_service import PdfGeneratorService
+from .render_cache import PdfRenderCache, get_pdf_render_cache
 
-__all__ = ["PdfGeneratorService"]
+__all__ = ["PdfGeneratorService", "PdfRenderCache", "get_pdf_render_cache"]
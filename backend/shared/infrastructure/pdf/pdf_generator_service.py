@@ -4,9 +4,13 @@ Ce service centralise la logique de génération de PDF pour éviter
 la duplication de code HTML inline dans les use cases.
 """
 
+import dataclasses
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
@@ -14,6 +18,35 @@ from jinja2 import Environment, FileSystemLoader, select_autoescape
 from shared.application.ports import PdfGeneratorPort
 from shared.domain import CouleurProgression
 
+from .render_cache import PdfRenderCache
+
+
+def html_to_pdf_bytes(html_content: str) -> bytes:
+    """Convertit du HTML en PDF avec WeasyPrint.
+
+    Fonction de module (picklable) pour pouvoir s'exécuter dans le pool
+    de rendu du PdfRenderCache.
+
+    Args:
+        html_content: Contenu HTML à convertir.
+
+    Returns:
+        Contenu PDF en bytes.
+
+    Raises:
+        ImportError: Si WeasyPrint n'est pas installé.
+    """
+    try:
+        from weasyprint import HTML
+        pdf_buffer = BytesIO()
+        HTML(string=html_content).write_pdf(pdf_buffer)
+        return pdf_buffer.getvalue()
+    except ImportError as e:
+        raise ImportError(
+            "WeasyPrint est requis pour générer des PDF. "
+            "Installez-le avec: pip install weasyprint"
+        ) from e
+
 
 class PdfGeneratorService(PdfGeneratorPort):
     """Service de génération de PDF à partir de templates Jinja2.
@@ -21,17 +54,35 @@ class PdfGeneratorService(PdfGeneratorPort):
     Utilise Jinja2 pour générer le HTML puis WeasyPrint pour convertir en PDF.
     Les templates sont stockés dans backend/templates/pdf/.
 
+    Si un cache de rendu est fourni, le PDF est identifié par le template,
+    la version des templates et le contexte de rendu complet : un PDF déjà
+    rendu est relu depuis le disque, et les rendus WeasyPrint s'exécutent
+    dans le pool de processus du cache. La date de génération est exclue de
+    la clé (CLES_HORODATAGE) : un PDF relu du cache affiche l'heure à
+    laquelle il a été rendu.
+
     Attributes:
         template_dir: Répertoire contenant les templates Jinja2.
         env: Environnement Jinja2 configuré.
     """
 
-    def __init__(self, template_dir: Optional[Path] = None):
+    # Rendus de récapitulatifs mensuels soumis simultanément
+    RECAP_RENDUS_PARALLELES = 8
+
+    # Clés de contexte portant la date de génération, exclues de la clé de cache
+    CLES_HORODATAGE = frozenset({"generated_at", "generation_date"})
+
+    def __init__(
+        self,
+        template_dir: Optional[Path] = None,
+        render_cache: Optional[PdfRenderCache] = None,
+    ):
         """Initialise le service de génération PDF.
 
         Args:
             template_dir: Répertoire des templates (optionnel).
                          Par défaut: backend/templates/pdf/
+            render_cache: Cache de rendu PDF (optionnel, rendu direct sinon).
         """
         if template_dir is None:
             # Déterminer le chemin du répertoire templates
@@ -40,6 +91,8 @@ class PdfGeneratorService(PdfGeneratorPort):
             template_dir = backend_dir / "templates" / "pdf"
 
         self.template_dir = template_dir
+        self._render_cache = render_cache
+        self._template_version: Optional[str] = None
 
         # Configurer Jinja2
         self.env = Environment(
@@ -111,20 +164,16 @@ class PdfGeneratorService(PdfGeneratorPort):
         # Enrichir les tâches avec couleur_hex
         taches_enriched = self._enrich_taches_with_color(taches)
 
-        # Générer le HTML
-        template = self.env.get_template('taches_rapport.html')
-        html_content = template.render(
-            chantier_nom=chantier_nom,
-            generated_at=datetime.now().strftime("%d/%m/%Y %H:%M"),
-            stats=stats,
-            progression=progression,
-            couleur_progression=couleur,
-            label_progression=label_couleur,
-            taches=taches_enriched,
-        )
-
-        # Convertir en PDF
-        return self._html_to_pdf(html_content)
+        # Générer le HTML puis le PDF
+        return self._render('taches_rapport.html', {
+            "chantier_nom": chantier_nom,
+            "generated_at": self._horodatage_generation("%d/%m/%Y %H:%M"),
+            "stats": stats,
+            "progression": progression,
+            "couleur_progression": couleur,
+            "label_progression": label_couleur,
+            "taches": taches_enriched,
+        })
 
     def _enrich_taches_with_color(self, taches: list) -> list:
         """Enrichit les tâches avec des informations de couleur.
@@ -163,7 +212,7 @@ class PdfGeneratorService(PdfGeneratorPort):
             if hasattr(tache, 'sous_taches') and tache.sous_taches:
                 tache_dict['sous_taches'] = self._enrich_taches_with_color(tache.sous_taches)
 
-            enriched.append(type('TacheEnriched', (), tache_dict)())
+            enriched.append(SimpleNamespace(**tache_dict))
 
         return enriched
 
@@ -179,16 +228,71 @@ class PdfGeneratorService(PdfGeneratorPort):
         Raises:
             ImportError: Si WeasyPrint n'est pas installé.
         """
-        try:
-            from weasyprint import HTML
-            pdf_buffer = BytesIO()
-            HTML(string=html_content).write_pdf(pdf_buffer)
-            return pdf_buffer.getvalue()
-        except ImportError as e:
-            raise ImportError(
-                "WeasyPrint est requis pour générer des PDF. "
-                "Installez-le avec: pip install weasyprint"
-            ) from e
+        return html_to_pdf_bytes(html_content)
+
+    def _render(
+        self,
+        template_name: str,
+        context: Dict[str, Any],
+        attendre: bool = True,
+    ) -> bytes:
+        """Rend un template en PDF, via le cache de rendu s'il est configuré.
+
+        Args:
+            template_name: Nom du template Jinja2.
+            context: Contexte du template.
+            attendre: False pour un pré-rendu non bloquant (retourne b"").
+
+        Returns:
+            Contenu PDF en bytes (vide en pré-rendu).
+        """
+        if self._render_cache is None:
+            if not attendre:
+                return b""
+            html_content = self.env.get_template(template_name).render(**context)
+            return self._html_to_pdf(html_content)
+
+        cle = self._render_cache.cle(
+            f"html:{template_name}",
+            self._get_template_version(),
+            {k: v for k, v in context.items() if k not in self.CLES_HORODATAGE},
+        )
+        if not attendre:
+            if self._render_cache.get(cle) is None:
+                html_content = self.env.get_template(template_name).render(**context)
+                self._render_cache.prerender(cle, html_to_pdf_bytes, html_content)
+            return b""
+
+        pdf_bytes = self._render_cache.get(cle)
+        if pdf_bytes is None:
+            html_content = self.env.get_template(template_name).render(**context)
+            pdf_bytes = self._render_cache.render(cle, html_to_pdf_bytes, html_content)
+        return pdf_bytes
+
+    def _horodatage_generation(self, format_date: str) -> str:
+        """Date de génération affichée sur le document.
+
+        Le contexte la porte sous une clé de CLES_HORODATAGE, pour qu'elle
+        n'entre pas dans la clé du cache de rendu.
+
+        Args:
+            format_date: Format strftime (date et heure).
+
+        Returns:
+            Date de génération formatée.
+        """
+        return datetime.now().strftime(format_date)
+
+    def _get_template_version(self) -> str:
+        """Empreinte du contenu des templates (invalide le cache à chaque modification)."""
+        if self._template_version is None:
+            digest = hashlib.sha256()
+            for fichier in sorted(Path(self.template_dir).rglob("*")):
+                if fichier.is_file():
+                    digest.update(fichier.name.encode("utf-8"))
+                    digest.update(fichier.read_bytes())
+            self._template_version = digest.hexdigest()[:16]
+        return self._template_version
 
     def generate_formulaire_pdf(
         self,
@@ -250,17 +354,10 @@ class PdfGeneratorService(PdfGeneratorPort):
             "valideur_nom": valideur_nom,
             "champs": champs,
             "commentaires": commentaires,
-            "generation_date": datetime.now().strftime("%d/%m/%Y à %H:%M"),
+            "generation_date": self._horodatage_generation("%d/%m/%Y à %H:%M"),
         }
 
-        # Charger le template
-        template = self.env.get_template("formulaire_rapport.html")
-
-        # Générer le HTML
-        html_content = template.render(**context)
-
-        # Convertir en PDF
-        return self._html_to_pdf(html_content)
+        return self._render("formulaire_rapport.html", context)
 
     def generate_intervention_pdf(
         self,
@@ -285,6 +382,94 @@ class PdfGeneratorService(PdfGeneratorPort):
         Returns:
             Contenu PDF en bytes.
         """
+        context = self._contexte_intervention(
+            intervention, techniciens, messages, signatures, options
+        )
+        return self._render("intervention_rapport.html", context)
+
+    def prerender_intervention_pdf(
+        self,
+        intervention,
+        techniciens: list,
+        messages: list,
+        signatures: list,
+        options=None,
+    ) -> None:
+        """Lance le rendu du rapport d'intervention sans l'attendre.
+
+        Sans cache de rendu configure, ne fait rien.
+
+        Args:
+            intervention: L'entite Intervention.
+            techniciens: Liste des AffectationIntervention.
+            messages: Messages filtres pour le rapport.
+            signatures: Signatures (client + technicien).
+            options: InterventionPDFOptionsDTO (sections a inclure).
+        """
+        if self._render_cache is None:
+            return
+        context = self._contexte_intervention(
+            intervention, techniciens, messages, signatures, options
+        )
+        self._render("intervention_rapport.html", context, attendre=False)
+
+    def generate_recap_mensuel_pdf(self, recap) -> bytes:
+        """Génère le PDF d'un récapitulatif mensuel d'heures (GAP-FDH-008).
+
+        Args:
+            recap: MonthlyRecapDTO d'un utilisateur.
+
+        Returns:
+            Contenu PDF en bytes.
+        """
+        return self._render("recap_mensuel.html", self._contexte_recap_mensuel(recap))
+
+    def generate_recaps_mensuels_pdf(self, recaps: list) -> List[bytes]:
+        """Génère les PDF de plusieurs récapitulatifs mensuels en parallèle.
+
+        Les rendus sont soumis simultanément : avec un cache de rendu, ils
+        s'exécutent dans son pool de processus ; les récapitulatifs déjà
+        rendus sont relus depuis le disque.
+
+        Args:
+            recaps: Liste de MonthlyRecapDTO.
+
+        Returns:
+            Contenus PDF, dans l'ordre des récapitulatifs.
+        """
+        if len(recaps) <= 1:
+            return [self.generate_recap_mensuel_pdf(recap) for recap in recaps]
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(recaps), self.RECAP_RENDUS_PARALLELES),
+            thread_name_prefix="recap-pdf",
+        ) as executor:
+            return list(executor.map(self.generate_recap_mensuel_pdf, recaps))
+
+    def _contexte_recap_mensuel(self, recap) -> Dict[str, Any]:
+        """Construit le contexte du template recap_mensuel.html.
+
+        Returns:
+            Contexte du template (copie du DTO, sans le contenu PDF).
+        """
+        context = dataclasses.asdict(recap)
+        context.pop("pdf_content", None)
+        context["generated_at"] = self._horodatage_generation("%d/%m/%Y à %H:%M")
+        return context
+
+    def _contexte_intervention(
+        self,
+        intervention,
+        techniciens: list,
+        messages: list,
+        signatures: list,
+        options=None,
+    ) -> Dict[str, Any]:
+        """Construit le contexte du template de rapport d'intervention.
+
+        Returns:
+            Contexte du template intervention_rapport.html.
+        """
         # Importer ici pour eviter les imports circulaires
         from modules.interventions.application.use_cases.pdf_use_cases import (
             InterventionPDFOptionsDTO,
@@ -370,7 +555,7 @@ class PdfGeneratorService(PdfGeneratorPort):
         # Contexte du template
         context = {
             "intervention_code": intervention.code or f"INT-{intervention.id}",
-            "generated_at": datetime.now().strftime("%d/%m/%Y a %H:%M"),
+            "generated_at": self._horodatage_generation("%d/%m/%Y a %H:%M"),
             # Client
             "client_nom": intervention.client_nom,
             "client_adresse": intervention.client_adresse,
@@ -403,8 +588,4 @@ class PdfGeneratorService(PdfGeneratorPort):
             "signatures": signatures_enriched,
             "inclure_signatures": options.inclure_signatures,
         }
-
-        template = self.env.get_template("intervention_rapport.html")
-        html_content = template.render(**context)
-
-        return self._html_to_pdf(html_content)
+        return context
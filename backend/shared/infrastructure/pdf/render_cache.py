@@ -0,0 +1,402 @@
+"""Cache disque des PDF rendus, adressé par contenu, et pool de rendu.
+
+Le rendu d'un PDF (WeasyPrint, FPDF) coûte jusqu'à plusieurs secondes de
+CPU. Ce module évite de le refaire à chaque téléchargement :
+
+- Clé : empreinte SHA-256 du type de document, de la version des templates
+  et des données d'entrée (sérialisées de façon canonique).
+- Hit : les octets sont relus depuis le disque.
+- Miss : le rendu part dans un pool de processus borné (le worker HTTP
+  n'exécute pas le rendu lui-même), puis le résultat est écrit sur disque.
+- Pré-rendu : ``prerender`` soumet le rendu sans l'attendre, pour que le
+  PDF soit déjà prêt au premier téléchargement (ex: devis envoyé).
+- Routes async : ``render_async`` attend le rendu sans bloquer la boucle
+  d'événements ni occuper un thread.
+
+Usage:
+    from shared.infrastructure.pdf.render_cache import get_pdf_render_cache
+
+    cache = get_pdf_render_cache()
+    cle = cache.cle("devis", DEVIS_PDF_VERSION, devis_dto)
+    pdf_bytes = cache.get(cle)
+    if pdf_bytes is None:
+        pdf_bytes = cache.render(cle, render_devis_pdf, devis_dto)
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Valeurs par défaut (surchargées via variables d'environnement)
+PDF_CACHE_SOUS_REPERTOIRE = Path("cache") / "pdf"  # Sous le stockage (UPLOAD_DIR)
+PDF_RENDER_WORKERS = 2  # 0 = rendu dans le thread appelant
+PDF_RENDER_TIMEOUT_SECONDS = 60.0
+PDF_CACHE_MAX_FICHIERS = 2000
+
+
+def canonical_payload(value: Any) -> Any:
+    """Convertit des données de rendu en structure JSON déterministe.
+
+    Les dataclasses, objets simples, Decimal, dates et enums sont réduits à
+    des types JSON, pour que deux entrées équivalentes produisent la même
+    empreinte (l'adresse mémoire d'un objet n'intervient jamais).
+
+    Args:
+        value: Données d'entrée du rendu (DTO, entités, dictionnaires...).
+
+    Returns:
+        Structure composée de dict, list, str, int, float, bool et None.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return canonical_payload(value.value)
+    if isinstance(value, bytes):
+        return hashlib.sha256(value).hexdigest()
+    if isinstance(value, dict):
+        return {str(k): canonical_payload(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonical_payload(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((canonical_payload(v) for v in value), key=repr)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            f.name: canonical_payload(getattr(value, f.name))
+            for f in dataclasses.fields(value)
+        }
+    if hasattr(value, "__dict__"):
+        return {
+            k: canonical_payload(v)
+            for k, v in vars(value).items()
+            if not k.startswith("_")
+        }
+    return str(value)
+
+
+def fingerprint_render(type_document: str, version: str, payload: Any) -> str:
+    """Calcule l'empreinte d'un rendu PDF.
+
+    Args:
+        type_document: Type de document (ex: "devis", "html:taches_rapport.html").
+        version: Version des templates / du générateur.
+        payload: Données d'entrée du rendu.
+
+    Returns:
+        Empreinte hexadécimale SHA-256.
+    """
+    canonical = json.dumps(
+        {"type": type_document, "version": version, "data": canonical_payload(payload)},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class PdfRenderCache:
+    """Cache disque adressé par contenu avec pool de rendu borné.
+
+    Attributes:
+        cache_dir: Répertoire des PDF en cache (un fichier par empreinte).
+        hits: Nombre de PDF servis depuis le disque.
+        misses: Nombre de rendus effectués.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_workers: int = PDF_RENDER_WORKERS,
+        render_timeout_seconds: float = PDF_RENDER_TIMEOUT_SECONDS,
+        max_fichiers: int = PDF_CACHE_MAX_FICHIERS,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """Initialise le cache.
+
+        Args:
+            cache_dir: Répertoire de stockage (créé si absent).
+            max_workers: Taille du pool de processus (0 = rendu en ligne).
+            render_timeout_seconds: Attente maximale d'un rendu.
+            max_fichiers: Nombre maximal de PDF conservés sur disque.
+            executor: Pool de rendu à utiliser (injectable pour les tests).
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._max_workers = max_workers
+        self._timeout = render_timeout_seconds
+        self._max_fichiers = max_fichiers
+        self._executor = executor
+        self._lock = Lock()
+        self._en_cours: Dict[str, Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def cle(self, type_document: str, version: str, payload: Any) -> str:
+        """Retourne la clé de cache d'un rendu (voir fingerprint_render)."""
+        return fingerprint_render(type_document, version, payload)
+
+    def get(self, cle: str) -> Optional[bytes]:
+        """Retourne le PDF en cache pour cette clé, ou None.
+
+        Args:
+            cle: Empreinte du rendu.
+
+        Returns:
+            Contenu PDF ou None si absent.
+        """
+        try:
+            contenu = self._chemin(cle).read_bytes()
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            self.hits += 1
+        return contenu
+
+    def render(self, cle: str, fonction: Callable[..., bytes], *args: Any) -> bytes:
+        """Effectue le rendu (dans le pool) et le mémorise sur disque.
+
+        Un rendu déjà en cours pour la même clé est réutilisé.
+
+        Args:
+            cle: Empreinte du rendu.
+            fonction: Fonction de rendu (picklable : fonction de module).
+            *args: Arguments de la fonction (picklables).
+
+        Returns:
+            Contenu PDF.
+
+        Raises:
+            TimeoutError: Si le rendu dépasse le délai maximal.
+        """
+        with self._lock:
+            self.misses += 1
+        pool = self._pool()
+        if pool is None:
+            contenu = fonction(*args)
+            self._ecrire(cle, contenu)
+            return contenu
+
+        future = self._soumettre(pool, cle, fonction, args)
+        try:
+            return future.result(timeout=self._timeout)
+        except BrokenProcessPool:
+            logger.warning("Pool de rendu PDF interrompu, rendu en ligne")
+            self._reinitialiser_pool()
+            contenu = fonction(*args)
+            self._ecrire(cle, contenu)
+            return contenu
+
+    async def render_async(
+        self, cle: str, fonction: Callable[..., bytes], *args: Any
+    ) -> bytes:
+        """Variante de render pour les routes async.
+
+        Le rendu du pool est attendu via asyncio : la boucle d'événements
+        reste libre et aucun thread n'est bloqué pendant le rendu. Sans pool,
+        le rendu s'exécute dans l'executor par défaut de la boucle.
+
+        Args:
+            cle: Empreinte du rendu.
+            fonction: Fonction de rendu (picklable : fonction de module).
+            *args: Arguments de la fonction (picklables).
+
+        Returns:
+            Contenu PDF.
+
+        Raises:
+            TimeoutError: Si le rendu dépasse le délai maximal.
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._pool()
+        if pool is None:
+            return await loop.run_in_executor(None, self.render, cle, fonction, *args)
+
+        with self._lock:
+            self.misses += 1
+        try:
+            future = self._soumettre(pool, cle, fonction, args)
+            # shield : un délai dépassé n'annule pas un rendu partagé entre requêtes
+            return await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)), self._timeout
+            )
+        except BrokenProcessPool:
+            logger.warning("Pool de rendu PDF interrompu, rendu en ligne")
+            self._reinitialiser_pool()
+            contenu = await loop.run_in_executor(None, fonction, *args)
+            self._ecrire(cle, contenu)
+            return contenu
+
+    def prerender(self, cle: str, fonction: Callable[..., bytes], *args: Any) -> bool:
+        """Soumet un rendu au pool sans l'attendre.
+
+        Sans pool (max_workers=0), rien n'est fait : le rendu aura lieu au
+        premier téléchargement.
+
+        Args:
+            cle: Empreinte du rendu.
+            fonction: Fonction de rendu (picklable).
+            *args: Arguments de la fonction.
+
+        Returns:
+            True si un rendu a été planifié ou est déjà disponible.
+        """
+        if self._chemin(cle).exists():
+            return True
+        pool = self._pool()
+        if pool is None:
+            return False
+        try:
+            self._soumettre(pool, cle, fonction, args)
+        except BrokenProcessPool:
+            self._reinitialiser_pool()
+            return False
+        return True
+
+    def invalidate(self) -> int:
+        """Supprime tous les PDF en cache.
+
+        Returns:
+            Nombre de fichiers supprimés.
+        """
+        nb = 0
+        for fichier in self.cache_dir.glob("*.pdf"):
+            fichier.unlink(missing_ok=True)
+            nb += 1
+        return nb
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Arrête le pool de rendu.
+
+        Args:
+            wait: Attendre la fin des rendus en cours.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._max_workers = 0
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    # =========================================================================
+    # Interne
+    # =========================================================================
+
+    def _chemin(self, cle: str) -> Path:
+        return self.cache_dir / f"{cle}.pdf"
+
+    def _pool(self) -> Optional[Executor]:
+        """Retourne le pool de rendu (créé à la demande), None si désactivé."""
+        with self._lock:
+            if self._executor is None and self._max_workers > 0:
+                # spawn : pas de fork d'un processus multi-thread (serveur ASGI)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _reinitialiser_pool(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._en_cours.clear()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _soumettre(
+        self, pool: Executor, cle: str, fonction: Callable[..., bytes], args: tuple
+    ) -> Future:
+        """Soumet un rendu, sauf s'il y en a déjà un pour la clé."""
+        with self._lock:
+            future = self._en_cours.get(cle)
+            if future is not None:
+                return future
+            future = pool.submit(fonction, *args)
+            self._en_cours[cle] = future
+        # Hors verrou : le callback s'exécute immédiatement si déjà terminé
+        future.add_done_callback(lambda f: self._terminer(cle, f))
+        return future
+
+    def _terminer(self, cle: str, future: Future) -> None:
+        """Écrit le résultat d'un rendu terminé sur disque."""
+        try:
+            if not future.cancelled() and future.exception() is None:
+                self._ecrire(cle, future.result())
+            elif not future.cancelled():
+                logger.warning("Échec du rendu PDF %s: %s", cle[:12], future.exception())
+        finally:
+            with self._lock:
+                self._en_cours.pop(cle, None)
+
+    def _ecrire(self, cle: str, contenu: bytes) -> None:
+        """Écrit un PDF de façon atomique (fichier temporaire puis rename)."""
+        if not contenu:
+            return
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(contenu)
+            os.replace(tmp, self._chemin(cle))
+        except OSError as e:
+            logger.warning("Impossible d'écrire le PDF en cache: %s", e)
+            Path(tmp).unlink(missing_ok=True)
+            return
+        self._evincer_si_plein()
+
+    def _evincer_si_plein(self) -> None:
+        """Supprime les 10% de PDF les plus anciens au-delà de max_fichiers."""
+        fichiers = list(self.cache_dir.glob("*.pdf"))
+        if len(fichiers) <= self._max_fichiers:
+            return
+        fichiers.sort(key=lambda f: f.stat().st_mtime)
+        for fichier in fichiers[: max(1, len(fichiers) // 10)]:
+            fichier.unlink(missing_ok=True)
+
+
+_render_cache_instance: Optional[PdfRenderCache] = None
+_render_cache_lock = Lock()
+
+
+def get_pdf_render_cache() -> PdfRenderCache:
+    """Retourne le cache de rendu PDF partagé par le processus.
+
+    Variables d'environnement :
+        PDF_CACHE_DIR: Répertoire du cache disque (défaut: cache/pdf sous le
+            répertoire de stockage UPLOAD_DIR, jamais servi par /uploads).
+        PDF_RENDER_WORKERS: Taille du pool de processus (0 = rendu en ligne).
+        PDF_RENDER_TIMEOUT_SECONDS: Attente maximale d'un rendu.
+
+    Returns:
+        Instance unique de PdfRenderCache.
+    """
+    global _render_cache_instance
+
+    with _render_cache_lock:
+        if _render_cache_instance is None:
+            _render_cache_instance = PdfRenderCache(
+                Path(
+                    os.environ.get("PDF_CACHE_DIR")
+                    or Path(os.environ.get("UPLOAD_DIR", "uploads")) / PDF_CACHE_SOUS_REPERTOIRE
+                ),
+                max_workers=int(os.environ.get("PDF_RENDER_WORKERS", PDF_RENDER_WORKERS)),
+                render_timeout_seconds=float(
+                    os.environ.get("PDF_RENDER_TIMEOUT_SECONDS", PDF_RENDER_TIMEOUT_SECONDS)
+                ),
+            )
+        return _render_cache_instance
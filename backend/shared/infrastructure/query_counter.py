@@ -0,0 +1,103 @@
+"""Comptage et chronométrage des requêtes SQL via les événements du moteur.
+
+Le compteur écoute ``before_cursor_execute`` / ``after_cursor_execute`` sur
+la classe ``Engine`` par défaut : il voit donc toutes les connexions, y
+compris celles des sessions asynchrones (``AsyncEngine.sync_engine``).
+
+Utilisé par les tests de budget de requêtes pour détecter les motifs N+1 :
+une route dont le nombre de requêtes croît avec la taille du résultat.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_START_KEY = "query_counter_started_at"
+
+
+@dataclass(frozen=True)
+class ExecutedStatement:
+    """Requête SQL exécutée et sa durée."""
+
+    sql: str
+    duration_ms: float
+
+
+class QueryCounter:
+    """
+    Enregistre les requêtes SQL exécutées pendant un bloc de code.
+
+    Usage:
+        with QueryCounter() as counter:
+            client.get("/api/chantiers")
+        assert counter.count <= 6, counter.report()
+    """
+
+    def __init__(
+        self,
+        target: Union[Engine, type] = Engine,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Args:
+            target: Moteur à écouter (défaut: tous les moteurs).
+            clock: Horloge en secondes (injectable pour les tests).
+        """
+        self._target = target
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.statements: List[ExecutedStatement] = []
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_START_KEY, []).append(self._clock())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        debuts = conn.info.get(_START_KEY)
+        duree_ms = (self._clock() - debuts.pop()) * 1000 if debuts else 0.0
+        with self._lock:
+            self.statements.append(ExecutedStatement(statement, duree_ms))
+
+    def start(self) -> "QueryCounter":
+        """Commence l'écoute des requêtes."""
+        event.listen(self._target, "before_cursor_execute", self._before)
+        event.listen(self._target, "after_cursor_execute", self._after)
+        return self
+
+    def stop(self) -> None:
+        """Arrête l'écoute des requêtes (les résultats sont conservés)."""
+        event.remove(self._target, "before_cursor_execute", self._before)
+        event.remove(self._target, "after_cursor_execute", self._after)
+
+    def reset(self) -> None:
+        """Oublie les requêtes enregistrées."""
+        with self._lock:
+            self.statements = []
+
+    def __enter__(self) -> "QueryCounter":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    @property
+    def count(self) -> int:
+        """Nombre de requêtes exécutées."""
+        return len(self.statements)
+
+    @property
+    def total_ms(self) -> float:
+        """Durée cumulée des requêtes (millisecondes)."""
+        return sum(s.duration_ms for s in self.statements)
+
+    def report(self) -> str:
+        """Détail des requêtes, pour les messages d'échec."""
+        lignes = [f"{self.count} requêtes SQL ({self.total_ms:.1f} ms) :"]
+        lignes.extend(
+            f"  {i:>3}. [{s.duration_ms:6.1f} ms] {' '.join(s.sql.split())[:200]}"
+            for i, s in enumerate(self.statements, 1)
+        )
+        return "\n".join(lignes)
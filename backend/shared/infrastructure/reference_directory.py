@@ -0,0 +1,497 @@
+"""Annuaire en mémoire des données de référence (utilisateurs, chantiers).
+
+Les helpers de ``user_queries`` et ``chantier_queries`` sont appelés par les
+presenters, les handlers de notifications et les providers du planning pour
+des données qui changent quelques fois par jour. L'annuaire charge une fois
+les tables ``users`` et ``chantiers`` et sert ensuite les lectures depuis la
+mémoire du processus (accès O(1) par ID, listes pré-triées).
+
+Invalidation :
+- Dans le processus : un listener de session marque l'annuaire périmé dès
+  qu'un commit touche une colonne servie d'un ``UserModel`` ou d'un
+  ``ChantierModel``.
+- Entre workers : sur PostgreSQL, la table ``reference_data_versions`` porte
+  un compteur par table, incrémenté par des triggers (migration
+  20260219_0001). Le compteur est relu au plus toutes les
+  ``check_interval_seconds`` ; s'il a changé, l'annuaire est rechargé.
+- Sur les autres bases (SQLite de développement), il n'y a pas de trigger :
+  le compteur n'est pas lu et l'annuaire est rechargé au plus tard après
+  ``max_age_seconds``. Idem sur PostgreSQL si la table est absente.
+
+Le chargement passe par une connexion dédiée du moteur, jamais par la session
+de l'appelant : l'annuaire ne contient que des données commitées. Les moteurs
+à connexion DBAPI unique (StaticPool, SingletonThreadPool, typiquement SQLite
+en mémoire) ne sont pas pris en charge : les helpers interrogent alors
+directement la base. Les sessions asynchrones (``get_async_db``) lisent
+l'annuaire du moteur synchrone de la même base (``register_reference_source``) ;
+il est alors rafraîchi hors de la boucle d'événements
+(``refresh_reference_source``), jamais pendant la lecture.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+
+logger = logging.getLogger(__name__)
+
+# Colonnes servies par l'annuaire, par table (suivies par reference_data_versions).
+# Les autres colonnes (tentatives de connexion, jetons...) n'invalident rien.
+COLONNES_REFERENCE = {
+    "users": (
+        "prenom", "nom", "email", "role", "couleur", "metiers", "photo_profil",
+        "type_utilisateur", "is_active", "deleted_at",
+    ),
+    "chantiers": ("code", "nom", "couleur", "heures_estimees", "statut", "deleted_at"),
+}
+
+# Fréquence maximale de relecture du compteur de versions
+REFERENCE_CHECK_SECONDS = 5.0
+# Âge maximal d'un chargement quand le compteur n'est pas disponible
+REFERENCE_MAX_AGE_SECONDS = 300.0
+
+STATUTS_CHANTIER_ACTIFS = ("ouvert", "en_cours")
+COULEUR_CHANTIER_DEFAUT = "#3498DB"
+
+_SESSION_INFO_KEY = "reference_data_modifiee"
+
+
+def _premier_metier(metiers) -> Optional[str]:
+    """Extrait le premier métier du tableau JSON ``users.metiers``."""
+    if not metiers:
+        return None
+    try:
+        liste = json.loads(metiers) if isinstance(metiers, str) else metiers
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if isinstance(liste, list) and liste:
+        return liste[0]
+    return None
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """État chargé de l'annuaire, remplacé en bloc à chaque rechargement."""
+
+    users: Dict[int, dict]
+    users_supprimes: frozenset
+    chantiers: Dict[int, dict]
+    chantiers_supprimes: frozenset
+    chantiers_actifs: Tuple[dict, ...]
+    active_user_ids: frozenset
+    version: Optional[Tuple[Tuple[str, int], ...]]
+    charge_a: float
+
+
+class ReferenceDirectory:
+    """Annuaire des utilisateurs et chantiers d'un moteur SQLAlchemy.
+
+    Les méthodes de lecture retournent des copies des dictionnaires
+    internes : l'appelant peut les modifier sans altérer l'annuaire.
+
+    Args:
+        engine: Moteur à partir duquel charger les données.
+        check_interval_seconds: Délai minimal entre deux relectures du compteur.
+        max_age_seconds: Âge maximal d'un chargement sans compteur disponible.
+        clock: Horloge monotone (injectable pour les tests).
+        compteur_versions: Lire ``reference_data_versions`` (défaut : seulement
+            sur PostgreSQL, seule base où des triggers maintiennent le compteur).
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        check_interval_seconds: float = REFERENCE_CHECK_SECONDS,
+        max_age_seconds: float = REFERENCE_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        compteur_versions: Optional[bool] = None,
+    ):
+        self._engine = engine
+        self._compteur_versions = (
+            engine.dialect.name == "postgresql" if compteur_versions is None
+            else compteur_versions
+        )
+        self._check_interval = check_interval_seconds
+        self._max_age = max_age_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+        self._perime = False
+        self._derniere_verification = 0.0
+        self._dernier_echec: Optional[float] = None
+
+    # ─── Fraîcheur ─────────────────────────────────────────────────────────
+
+    def invalidate(self) -> None:
+        """Marque l'annuaire comme périmé (rechargé à la prochaine lecture)."""
+        self._perime = True
+
+    def est_pret(self) -> bool:
+        """Indique si l'annuaire peut être lu sans accès à la base."""
+        return self._snapshot is not None and not self._perime and self._dernier_echec is None
+
+    def doit_verifier(self) -> bool:
+        """Indique si ``refresh`` accéderait à la base (sans y accéder)."""
+        return (
+            not self.est_pret()
+            or self._clock() - self._derniere_verification >= self._check_interval
+        )
+
+    def refresh(self) -> bool:
+        """Garantit un état à jour avant une série de lectures.
+
+        Relit le compteur de versions si le délai de vérification est écoulé
+        et recharge l'annuaire si nécessaire.
+
+        Returns:
+            True si l'annuaire est utilisable, False si le chargement a échoué
+            (l'appelant doit alors interroger directement la base).
+        """
+        with self._lock:
+            maintenant = self._clock()
+            if (
+                self._dernier_echec is not None
+                and maintenant - self._dernier_echec < self._check_interval
+            ):
+                return False
+            try:
+                if self._doit_recharger(maintenant):
+                    self._charger(maintenant)
+            except SQLAlchemyError as e:
+                logger.warning(f"Annuaire de référence indisponible: {e}")
+                self._dernier_echec = maintenant
+                self._perime = True
+                return False
+            self._dernier_echec = None
+            return True
+
+    def _doit_recharger(self, maintenant: float) -> bool:
+        snapshot = self._snapshot
+        if snapshot is None or self._perime:
+            return True
+        if maintenant - self._derniere_verification < self._check_interval:
+            return False
+        self._derniere_verification = maintenant
+        version = self._lire_version()
+        if version is None:
+            return maintenant - snapshot.charge_a >= self._max_age
+        return version != snapshot.version
+
+    def _lire_version(self) -> Optional[Tuple[Tuple[str, int], ...]]:
+        """Lit le compteur de versions, None s'il n'est pas maintenu ou absent."""
+        if not self._compteur_versions:
+            return None
+        try:
+            with self._engine.connect() as conn:
+                rows = conn.execute(
+                    text("SELECT nom, version FROM reference_data_versions ORDER BY nom")
+                ).fetchall()
+        except SQLAlchemyError:
+            return None
+        return tuple((row[0], row[1]) for row in rows)
+
+    def _charger(self, maintenant: float) -> None:
+        # Le compteur est lu avant les données : une modification concurrente
+        # du chargement provoquera un nouveau rechargement.
+        self._perime = False
+        version = self._lire_version()
+        with self._engine.connect() as conn:
+            user_rows = conn.execute(
+                text(
+                    "SELECT id, prenom, nom, email, role, couleur, metiers, photo_profil, "
+                    "type_utilisateur, is_active, deleted_at FROM users"
+                )
+            ).fetchall()
+            chantier_rows = conn.execute(
+                text(
+                    "SELECT id, code, nom, couleur, heures_estimees, statut, deleted_at "
+                    "FROM chantiers"
+                )
+            ).fetchall()
+
+        users = {}
+        users_supprimes = set()
+        for row in user_rows:
+            users[row[0]] = {
+                "id": row[0],
+                "prenom": row[1],
+                "nom": row[2],
+                "email": row[3],
+                "role": row[4],
+                "couleur": row[5],
+                "metier": _premier_metier(row[6]),
+                "photo_profil": row[7],
+                "type_utilisateur": row[8],
+                "is_active": bool(row[9]),
+            }
+            if row[10] is not None:
+                users_supprimes.add(row[0])
+
+        chantiers = {}
+        chantiers_supprimes = set()
+        actifs = []
+        for row in chantier_rows:
+            chantier = {
+                "id": row[0],
+                "code": row[1],
+                "nom": row[2],
+                "couleur": row[3] or COULEUR_CHANTIER_DEFAUT,
+                "heures_estimees": row[4] or 0.0,
+            }
+            chantiers[row[0]] = chantier
+            if row[6] is not None:
+                chantiers_supprimes.add(row[0])
+            elif row[5] in STATUTS_CHANTIER_ACTIFS:
+                actifs.append(chantier)
+        actifs.sort(key=lambda c: (c["code"] is None, c["code"] or ""))
+
+        self._snapshot = _Snapshot(
+            users=users,
+            users_supprimes=frozenset(users_supprimes),
+            chantiers=chantiers,
+            chantiers_supprimes=frozenset(chantiers_supprimes),
+            chantiers_actifs=tuple(actifs),
+            active_user_ids=frozenset(
+                user_id for user_id, user in users.items() if user["is_active"]
+            ),
+            version=version,
+            charge_a=maintenant,
+        )
+        self._derniere_verification = maintenant
+        logger.debug(
+            f"Annuaire de référence chargé: {len(users)} utilisateurs, "
+            f"{len(chantiers)} chantiers"
+        )
+
+    # ─── Utilisateurs ─────────────────────────────────────────────────────
+
+    def get_user(self, user_id: int, include_deleted: bool = True) -> Optional[dict]:
+        """Retourne les informations de base d'un utilisateur."""
+        snapshot = self._snapshot
+        user = snapshot.users.get(user_id)
+        if user is None or (not include_deleted and user_id in snapshot.users_supprimes):
+            return None
+        return dict(user)
+
+    def get_users(self, user_ids: Iterable[int]) -> Dict[int, dict]:
+        """Retourne {user_id: infos} pour les utilisateurs trouvés."""
+        users = self._snapshot.users
+        return {
+            user_id: dict(users[user_id]) for user_id in set(user_ids) if user_id in users
+        }
+
+    def get_metiers(self, user_ids: Iterable[int]) -> Dict[int, Optional[str]]:
+        """Retourne {user_id: premier métier} pour les utilisateurs trouvés."""
+        users = self._snapshot.users
+        return {
+            user_id: users[user_id]["metier"] for user_id in set(user_ids) if user_id in users
+        }
+
+    def count_active_users(self, exclude_user_ids: Iterable[int] = ()) -> int:
+        """Compte les utilisateurs actifs, hors ``exclude_user_ids``."""
+        active = self._snapshot.active_user_ids
+        return len(active - set(exclude_user_ids))
+
+    def count_active_users_by_metier(self) -> Dict[Optional[str], int]:
+        """Compte les utilisateurs actifs par premier métier."""
+        snapshot = self._snapshot
+        return dict(
+            Counter(snapshot.users[user_id]["metier"] for user_id in snapshot.active_user_ids)
+        )
+
+    # ─── Chantiers ────────────────────────────────────────────────────────
+
+    def get_chantier(self, chantier_id: int, include_deleted: bool = True) -> Optional[dict]:
+        """Retourne les informations de base d'un chantier."""
+        snapshot = self._snapshot
+        chantier = snapshot.chantiers.get(chantier_id)
+        if chantier is None or (
+            not include_deleted and chantier_id in snapshot.chantiers_supprimes
+        ):
+            return None
+        return dict(chantier)
+
+    def get_chantiers(
+        self, chantier_ids: Iterable[int], include_deleted: bool = True
+    ) -> Dict[int, dict]:
+        """Retourne {chantier_id: infos} pour les chantiers trouvés."""
+        snapshot = self._snapshot
+        return {
+            chantier_id: dict(snapshot.chantiers[chantier_id])
+            for chantier_id in sorted(set(chantier_ids))
+            if chantier_id in snapshot.chantiers
+            and (include_deleted or chantier_id not in snapshot.chantiers_supprimes)
+        }
+
+    def get_chantiers_actifs(self, search: Optional[str] = None) -> List[dict]:
+        """Chantiers ouverts ou en cours, triés par code, filtrés sur nom/code."""
+        actifs = self._snapshot.chantiers_actifs
+        if search:
+            terme = search.lower()
+            actifs = [
+                c for c in actifs
+                if terme in (c["nom"] or "").lower() or terme in (c["code"] or "").lower()
+            ]
+        return [dict(c) for c in actifs]
+
+
+# ─── Registre par moteur ──────────────────────────────────────────────────
+
+_directories: "weakref.WeakKeyDictionary[Engine, ReferenceDirectory]" = (
+    weakref.WeakKeyDictionary()
+)
+_directories_lock = threading.Lock()
+# Moteur de chargement à utiliser pour un autre moteur (voir register_reference_source)
+_sources: "weakref.WeakKeyDictionary[Engine, Engine]" = weakref.WeakKeyDictionary()
+
+
+def register_reference_source(bind: Engine, source: Engine) -> None:
+    """Fait servir l'annuaire de ``source`` aux sessions liées à ``bind``.
+
+    Utilisé pour les sessions asynchrones : leur moteur synchrone sous-jacent
+    ne peut ouvrir de connexion que depuis la boucle d'événements, l'annuaire
+    est donc chargé par le moteur synchrone de la même base.
+
+    Args:
+        bind: Moteur des sessions appelantes (``AsyncEngine.sync_engine``).
+        source: Moteur synchrone utilisé pour charger l'annuaire.
+    """
+    with _directories_lock:
+        _sources[bind] = source
+
+
+def _is_enabled() -> bool:
+    return os.environ.get("REFERENCE_DIRECTORY_ENABLED", "true").lower() not in (
+        "0", "false", "no",
+    )
+
+
+def _directory_for(engine: Engine) -> Optional[ReferenceDirectory]:
+    """Retourne (en le créant) l'annuaire d'un moteur pris en charge."""
+    if not _is_enabled():
+        return None
+    if engine.dialect.is_async or isinstance(engine.pool, (StaticPool, SingletonThreadPool)):
+        return None
+
+    with _directories_lock:
+        directory = _directories.get(engine)
+        if directory is None:
+            directory = ReferenceDirectory(
+                engine,
+                check_interval_seconds=float(
+                    os.environ.get("REFERENCE_DIRECTORY_CHECK_SECONDS", REFERENCE_CHECK_SECONDS)
+                ),
+                max_age_seconds=float(
+                    os.environ.get("REFERENCE_DIRECTORY_MAX_AGE_SECONDS", REFERENCE_MAX_AGE_SECONDS)
+                ),
+            )
+            _directories[engine] = directory
+    return directory
+
+
+def get_reference_directory(db: Session) -> Optional[ReferenceDirectory]:
+    """Retourne l'annuaire à jour du moteur de la session, si utilisable.
+
+    Variables d'environnement :
+        REFERENCE_DIRECTORY_ENABLED: "false" pour désactiver l'annuaire.
+        REFERENCE_DIRECTORY_CHECK_SECONDS: Délai entre deux relectures du compteur.
+        REFERENCE_DIRECTORY_MAX_AGE_SECONDS: Âge maximal sans compteur disponible.
+
+    Args:
+        db: Session de l'appelant (seul son moteur est utilisé).
+
+    Returns:
+        ReferenceDirectory prêt à être lu, ou None si l'appelant doit
+        interroger directement la base (annuaire désactivé, moteur non pris en
+        charge ou chargement en échec). Pour une session asynchrone, l'annuaire
+        n'est jamais chargé ici (boucle d'événements) : il doit avoir été
+        rafraîchi par ``refresh_reference_source``.
+    """
+    if not _is_enabled():
+        return None
+    try:
+        bind = db.get_bind()
+    except Exception:
+        return None
+    if not isinstance(bind, Engine):
+        return None
+
+    source = _sources.get(bind)
+    if source is not None:
+        directory = _directory_for(source)
+        return directory if directory is not None and directory.est_pret() else None
+
+    directory = _directory_for(bind)
+    return directory if directory is not None and directory.refresh() else None
+
+
+async def refresh_reference_source(bind: Engine) -> None:
+    """Rafraîchit, dans un thread, l'annuaire servi aux sessions de ``bind``.
+
+    Le chargement passe par le moteur synchrone : il ne doit pas s'exécuter
+    dans la boucle d'événements. Aucun thread n'est sollicité tant que
+    l'annuaire est à jour.
+
+    Args:
+        bind: Moteur des sessions asynchrones (``AsyncEngine.sync_engine``).
+    """
+    source = _sources.get(bind)
+    directory = _directory_for(source) if source is not None else None
+    if directory is not None and directory.doit_verifier():
+        await asyncio.to_thread(directory.refresh)
+
+
+def invalidate_reference_directories() -> None:
+    """Marque périmés les annuaires de tous les moteurs du processus."""
+    with _directories_lock:
+        directories = list(_directories.values())
+    for directory in directories:
+        directory.invalidate()
+
+
+# ─── Invalidation locale sur commit ───────────────────────────────────────
+
+
+def _modifie_reference(obj) -> bool:
+    """Indique si un objet modifié touche une colonne servie par l'annuaire."""
+    colonnes = COLONNES_REFERENCE.get(getattr(obj, "__tablename__", None))
+    if colonnes is None:
+        return False
+    attrs = inspect(obj).attrs
+    return any(
+        colonne in attrs and attrs[colonne].history.has_changes() for colonne in colonnes
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _noter_modifications_reference(session, flush_context) -> None:
+    # L'historique des attributs est encore disponible dans after_flush
+    for obj in (*session.new, *session.deleted):
+        if getattr(obj, "__tablename__", None) in COLONNES_REFERENCE:
+            session.info[_SESSION_INFO_KEY] = True
+            return
+    if any(_modifie_reference(obj) for obj in session.dirty):
+        session.info[_SESSION_INFO_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalider_apres_commit(session) -> None:
+    if session.info.pop(_SESSION_INFO_KEY, False):
+        invalidate_reference_directories()
+
+
+@event.listens_for(Session, "after_rollback")
+def _oublier_modifications_reference(session) -> None:
+    session.info.pop(_SESSION_INFO_KEY, None)
@@ -2,5 +2,16 @@
 
 from .rappel_reservation_job import RappelReservationJob
 from .check_signalements_retard_job import CheckSignalementsRetardJob
+from .flush_api_key_usage_job import FlushAPIKeyUsageJob
+from .flush_notification_digests_job import FlushNotificationDigestsJob
+from .purge_upload_sessions_job import PurgeUploadSessionsJob
+from .purge_orphan_blobs_job import PurgeOrphanBlobsJob
 
-__all__ = ["RappelReservationJob", "CheckSignalementsRetardJob"]
+__all__ = [
+    "RappelReservationJob",
+    "CheckSignalementsRetardJob",
+    "FlushAPIKeyUsageJob",
+    "FlushNotificationDigestsJob",
+    "PurgeUploadSessionsJob",
+    "PurgeOrphanBlobsJob",
+]
@@ -0,0 +1,74 @@
+"""Job d'écriture groupée de l'usage des clés API.
+
+Exécuté toutes les minutes : écrit en une seule requête la dernière
+utilisation et le nombre de requêtes cumulés en mémoire par le middleware
+API v1 (voir shared.infrastructure.api_v1.api_key_cache).
+"""
+
+import logging
+
+from shared.infrastructure.api_v1.api_key_cache import get_api_key_usage_tracker
+
+logger = logging.getLogger(__name__)
+
+
+class FlushAPIKeyUsageJob:
+    """Job APScheduler d'écriture de l'usage des clés API."""
+
+    JOB_ID = "flush_api_key_usage"
+    DEFAULT_INTERVAL_SECONDS = 60
+
+    def __init__(self, db_session_factory, tracker=None):
+        """Initialise le job.
+
+        Args:
+            db_session_factory: Factory pour créer des sessions DB.
+            tracker: Tracker d'usage (défaut: instance du processus).
+        """
+        self._db_session_factory = db_session_factory
+        self._tracker = tracker or get_api_key_usage_tracker()
+
+    def execute(self) -> int:
+        """Écrit l'usage en attente.
+
+        Returns:
+            Nombre de clés mises à jour (0 en cas d'erreur).
+        """
+        if not self._tracker.pending():
+            return 0
+
+        session = self._db_session_factory()
+        try:
+            nb = self._tracker.flush(session)
+            logger.debug(f"Usage de {nb} clé(s) API enregistré")
+            return nb
+        except Exception as e:
+            logger.error(f"Erreur écriture usage clés API: {e}", exc_info=True)
+            return 0
+        finally:
+            session.close()
+
+    @classmethod
+    def register(cls, scheduler, db_session_factory) -> "FlushAPIKeyUsageJob":
+        """Enregistre le job dans le scheduler.
+
+        Args:
+            scheduler: SchedulerService.
+            db_session_factory: Factory pour sessions DB.
+
+        Returns:
+            Le job enregistré (pour un dernier flush à l'arrêt).
+        """
+        job = cls(db_session_factory)
+
+        scheduler.add_interval_job(
+            func=job.execute,
+            job_id=cls.JOB_ID,
+            seconds=cls.DEFAULT_INTERVAL_SECONDS,
+        )
+
+        logger.info(
+            f"Job '{cls.JOB_ID}' enregistré: toutes les "
+            f"{cls.DEFAULT_INTERVAL_SECONDS} secondes"
+        )
+        return job
@@ -0,0 +1,78 @@
+"""Job de publication des notifications regroupées (digests).
+
+Exécuté toutes les 5 secondes : insère en une requête une notification
+de synthèse par groupe dont la fenêtre de regroupement a expiré (voir
+modules.notifications.infrastructure.digest).
+"""
+
+import logging
+
+from modules.notifications.infrastructure.digest import get_notification_digest_buffer
+
+logger = logging.getLogger(__name__)
+
+
+class FlushNotificationDigestsJob:
+    """Job APScheduler de publication des digests de notifications."""
+
+    JOB_ID = "flush_notification_digests"
+    DEFAULT_INTERVAL_SECONDS = 5
+
+    def __init__(self, db_session_factory, digest_buffer=None):
+        """Initialise le job.
+
+        Args:
+            db_session_factory: Factory pour créer des sessions DB.
+            digest_buffer: Tampon de regroupement (défaut: instance du processus).
+        """
+        self._db_session_factory = db_session_factory
+        self._digest_buffer = digest_buffer or get_notification_digest_buffer()
+
+    def execute(self, force: bool = False) -> int:
+        """Publie les digests dont la fenêtre a expiré.
+
+        Args:
+            force: Publie tous les groupes en attente (arrêt de l'application).
+
+        Returns:
+            Nombre de notifications insérées (0 en cas d'erreur).
+        """
+        if not self._digest_buffer.pending():
+            return 0
+
+        session = self._db_session_factory()
+        try:
+            nb = self._digest_buffer.flush(session, force=force)
+            if nb:
+                logger.debug(f"{nb} notification(s) regroupée(s) publiée(s)")
+            return nb
+        except Exception as e:
+            logger.error(f"Erreur publication digests notifications: {e}", exc_info=True)
+            return 0
+        finally:
+            session.close()
+
+    @classmethod
+    def register(cls, scheduler, db_session_factory) -> "FlushNotificationDigestsJob":
+        """Enregistre le job dans le scheduler.
+
+        Args:
+            scheduler: SchedulerService.
+            db_session_factory: Factory pour sessions DB.
+
+        Returns:
+            Le job enregistré (pour un dernier flush à l'arrêt).
+        """
+        job = cls(db_session_factory)
+
+        scheduler.add_interval_job(
+            func=job.execute,
+            job_id=cls.JOB_ID,
+            seconds=cls.DEFAULT_INTERVAL_SECONDS,
+        )
+
+        logger.info(
+            f"Job '{cls.JOB_ID}' enregistré: toutes les "
+            f"{cls.DEFAULT_INTERVAL_SECONDS} secondes"
+        )
+        return job
@@ -0,0 +1,81 @@
+"""Job de suppression des contenus GED orphelins (stockage adressé par contenu).
+
+Exécuté toutes les heures : supprime les fichiers de blobs/ qui ne sont
+plus référencés par aucun document. La suppression d'un document ne
+supprime pas directement un contenu partagé : elle est faite ici, après
+commit, pour ne pas effacer un contenu qu'un upload concurrent vient de
+référencer.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PurgeOrphanBlobsJob:
+    """Job APScheduler de suppression des contenus orphelins."""
+
+    JOB_ID = "purge_orphan_blobs"
+    DEFAULT_INTERVAL_MINUTES = 60
+
+    def __init__(self, db_session_factory):
+        """Initialise le job.
+
+        Args:
+            db_session_factory: Factory pour créer des sessions DB.
+        """
+        self._db_session_factory = db_session_factory
+
+    def execute(self) -> int:
+        """Supprime les contenus orphelins.
+
+        Returns:
+            Nombre de contenus supprimés (0 en cas d'erreur).
+        """
+        session = self._db_session_factory()
+        try:
+            # Import ici pour éviter imports circulaires
+            from modules.documents.application.use_cases import PurgeOrphanBlobsUseCase
+            from modules.documents.infrastructure.persistence import (
+                SQLAlchemyDocumentRepository,
+            )
+            from modules.documents.infrastructure.web.dependencies import get_file_storage
+
+            use_case = PurgeOrphanBlobsUseCase(
+                SQLAlchemyDocumentRepository(session),
+                get_file_storage(),
+            )
+            nb = use_case.execute()
+            if nb:
+                logger.info(f"{nb} contenu(s) orphelin(s) supprimé(s)")
+            return nb
+        except Exception as e:
+            logger.error(f"Erreur suppression contenus orphelins: {e}", exc_info=True)
+            return 0
+        finally:
+            session.close()
+
+    @classmethod
+    def register(cls, scheduler, db_session_factory) -> "PurgeOrphanBlobsJob":
+        """Enregistre le job dans le scheduler.
+
+        Args:
+            scheduler: SchedulerService.
+            db_session_factory: Factory pour sessions DB.
+
+        Returns:
+            Le job enregistré.
+        """
+        job = cls(db_session_factory)
+
+        scheduler.add_interval_job(
+            func=job.execute,
+            job_id=cls.JOB_ID,
+            minutes=cls.DEFAULT_INTERVAL_MINUTES,
+        )
+
+        logger.info(
+            f"Job '{cls.JOB_ID}' enregistré: toutes les "
+            f"{cls.DEFAULT_INTERVAL_MINUTES} minutes"
+        )
+        return job
@@ -0,0 +1,80 @@
+"""Job de purge des uploads découpés abandonnés (GED-06, GED-07).
+
+Exécuté toutes les heures : supprime les sessions d'upload expirées et les
+octets déjà reçus, pour ne pas laisser de fichiers partiels sur le disque.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PurgeUploadSessionsJob:
+    """Job APScheduler de purge des sessions d'upload expirées."""
+
+    JOB_ID = "purge_upload_sessions"
+    DEFAULT_INTERVAL_MINUTES = 60
+
+    def __init__(self, db_session_factory):
+        """Initialise le job.
+
+        Args:
+            db_session_factory: Factory pour créer des sessions DB.
+        """
+        self._db_session_factory = db_session_factory
+
+    def execute(self) -> int:
+        """Purge les sessions d'upload expirées.
+
+        Returns:
+            Nombre de sessions purgées (0 en cas d'erreur).
+        """
+        session = self._db_session_factory()
+        try:
+            # Import ici pour éviter imports circulaires
+            from modules.documents.application.use_cases import PurgeExpiredUploadsUseCase
+            from modules.documents.infrastructure.persistence import (
+                SQLAlchemyUploadSessionRepository,
+            )
+            from modules.documents.infrastructure.web.dependencies import get_file_storage
+
+            use_case = PurgeExpiredUploadsUseCase(
+                SQLAlchemyUploadSessionRepository(session),
+                get_file_storage(),
+            )
+            nb = use_case.execute()
+            session.commit()
+            if nb:
+                logger.info(f"{nb} upload(s) abandonné(s) purgé(s)")
+            return nb
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Erreur purge uploads abandonnés: {e}", exc_info=True)
+            return 0
+        finally:
+            session.close()
+
+    @classmethod
+    def register(cls, scheduler, db_session_factory) -> "PurgeUploadSessionsJob":
+        """Enregistre le job dans le scheduler.
+
+        Args:
+            scheduler: SchedulerService.
+            db_session_factory: Factory pour sessions DB.
+
+        Returns:
+            Le job enregistré.
+        """
+        job = cls(db_session_factory)
+
+        scheduler.add_interval_job(
+            func=job.execute,
+            job_id=cls.JOB_ID,
+            minutes=cls.DEFAULT_INTERVAL_MINUTES,
+        )
+
+        logger.info(
+            f"Job '{cls.JOB_ID}' enregistré: toutes les "
+            f"{cls.DEFAULT_INTERVAL_MINUTES} minutes"
+        )
+        return job
@@ -10,7 +10,7 @@ import logging
 from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
-from shared.infrastructure.notifications import NotificationPayload, get_notification_service
+from shared.infrastructure.notifications import NotificationPayload, get_push_queue
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -23,7 +23,8 @@ class RappelReservationJob:
 
     Fonctionnement :
     1. Récupère toutes les réservations validées pour demain
-    2. Pour chaque réservation, envoie un push au demandeur
+    2. Pour chaque réservation, dépose un push pour le demandeur dans la
+       file d'envoi groupé (PushBatchQueue)
     3. Log les résultats
     """
 
@@ -38,7 +39,7 @@ class RappelReservationJob:
             db_session_factory: Factory pour créer des sessions DB
         """
         self._db_session_factory = db_session_factory
-        self._notification_service = get_notification_service()
+        self._push_queue = get_push_queue()
 
     def execute(self) -> dict:
         """Exécute le job de rappel.
@@ -116,7 +117,7 @@ class RappelReservationJob:
             session: Session DB
 
         Returns:
-            True si envoyé
+            True si mis en file d'envoi
         """
         # Récupérer le token push de l'utilisateur
         from modules.auth.infrastructure.persistence import UserModel
@@ -148,7 +149,8 @@ class RappelReservationJob:
         )
 
         if push_token:
-            return self._notification_service.send_to_token(push_token, payload)
+            self._push_queue.enqueue([push_token], payload)
+            return True
         else:
             # En mode dev, simuler l'envoi
             logger.info(
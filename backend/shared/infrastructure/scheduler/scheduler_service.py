@@ -16,6 +16,8 @@ from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.executors.pool import ThreadPoolExecutor
 
+from ..metrics import timed_job
+
 logger = logging.getLogger(__name__)
 
 # Singleton scheduler
@@ -95,7 +97,7 @@ class SchedulerService:
         )
 
         self._scheduler.add_job(
-            func,
+            timed_job(job_id, func),
             trigger=trigger,
             id=job_id,
             replace_existing=True,
@@ -131,7 +133,7 @@ class SchedulerService:
         )
 
         self._scheduler.add_job(
-            func,
+            timed_job(job_id, func),
             trigger=trigger,
             id=job_id,
             replace_existing=True,
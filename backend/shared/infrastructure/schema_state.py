@@ -0,0 +1,86 @@
+"""État du schéma de la base par rapport aux migrations Alembic.
+
+Permet au démarrage de savoir si la base est déjà à la dernière révision
+(``alembic upgrade head`` exécuté par le déploiement) : dans ce cas
+``init_db`` n'a pas à rejouer ``create_all`` sur tous les modèles.
+
+Les révisions sont lues directement dans les fichiers de
+``migrations/versions`` : Alembic n'est pas une dépendance d'exécution.
+"""
+
+import ast
+import re
+from pathlib import Path
+from typing import FrozenSet, Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+MIGRATIONS_VERSIONS_DIR = Path(__file__).resolve().parents[2] / "migrations" / "versions"
+
+ALEMBIC_VERSION_TABLE = "alembic_version"
+
+# revision = '...' / down_revision: Union[str, None] = '...'  # commentaire
+_REVISION_LINE = re.compile(
+    r"^(revision|down_revision)\s*(?::[^=]+)?=\s*(.+?)\s*(?:#.*)?$", re.MULTILINE
+)
+
+
+def head_revisions(versions_dir: Optional[Path] = None) -> FrozenSet[str]:
+    """
+    Calcule les têtes du graphe de migrations (révisions sans descendant).
+
+    Args:
+        versions_dir: Dossier des scripts de migration (défaut: migrations/versions).
+
+    Returns:
+        Identifiants des révisions de tête (vide si aucun script).
+    """
+    revisions = set()
+    parents = set()
+    for script in Path(versions_dir or MIGRATIONS_VERSIONS_DIR).glob("*.py"):
+        valeurs = {
+            nom: ast.literal_eval(valeur)
+            for nom, valeur in _REVISION_LINE.findall(script.read_text(encoding="utf-8"))
+        }
+        if not valeurs.get("revision"):
+            continue
+        revisions.add(valeurs["revision"])
+        down_revision = valeurs.get("down_revision")
+        if isinstance(down_revision, str):
+            parents.add(down_revision)
+        elif down_revision:
+            parents.update(down_revision)
+    return frozenset(revisions - parents)
+
+
+def current_revisions(bind: Engine) -> FrozenSet[str]:
+    """
+    Lit les révisions Alembic enregistrées dans la base.
+
+    Args:
+        bind: Moteur de la base à inspecter.
+
+    Returns:
+        Révisions de la table alembic_version (vide si la table n'existe pas).
+    """
+    with bind.connect() as conn:
+        if not inspect(conn).has_table(ALEMBIC_VERSION_TABLE):
+            return frozenset()
+        rows = conn.execute(text(f"SELECT version_num FROM {ALEMBIC_VERSION_TABLE}"))
+        return frozenset(row[0] for row in rows)
+
+
+def schema_is_at_head(bind: Engine, versions_dir: Optional[Path] = None) -> bool:
+    """
+    Indique si la base est à la dernière révision des migrations.
+
+    Args:
+        bind: Moteur de la base à inspecter.
+        versions_dir: Dossier des scripts de migration (défaut: migrations/versions).
+
+    Returns:
+        True si les révisions de la base sont exactement les têtes du graphe.
+    """
+    heads = head_revisions(versions_dir)
+    return bool(heads) and current_revisions(bind) == heads
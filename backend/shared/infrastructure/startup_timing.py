@@ -0,0 +1,62 @@
+"""Mesure des phases de démarrage de l'application.
+
+Chaque phase (imports, schéma, handlers, scheduler...) est chronométrée et
+journalisée, pour suivre le temps de démarrage à froid des workers.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Chronomètre les phases de démarrage et les journalise."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self.phases: Dict[str, float] = {}
+
+    def record(self, nom: str, duree_s: float) -> None:
+        """
+        Enregistre une phase mesurée ailleurs (ex: imports du module main).
+
+        Args:
+            nom: Nom de la phase.
+            duree_s: Durée en secondes.
+        """
+        self.phases[nom] = duree_s
+        logger.info(f"Démarrage - {nom}: {duree_s * 1000:.0f} ms")
+
+    @contextmanager
+    def phase(self, nom: str) -> Iterator[None]:
+        """
+        Chronomètre le bloc de code d'une phase.
+
+        Args:
+            nom: Nom de la phase.
+
+        Usage:
+            with timer.phase("schema"):
+                init_db()
+        """
+        debut = self._clock()
+        try:
+            yield
+        finally:
+            self.record(nom, self._clock() - debut)
+
+    @property
+    def total_s(self) -> float:
+        """Durée totale des phases enregistrées (secondes)."""
+        return sum(self.phases.values())
+
+    def summary(self) -> str:
+        """Résumé des phases, de la plus longue à la plus courte."""
+        details = ", ".join(
+            f"{nom} {duree * 1000:.0f} ms"
+            for nom, duree in sorted(self.phases.items(), key=lambda item: -item[1])
+        )
+        return f"Démarrage terminé en {self.total_s * 1000:.0f} ms ({details})"
@@ -3,15 +3,27 @@
 These helpers use raw SQL to look up user data, so that modules like
 dashboard, formulaires, and notifications do not need to import
 modules.auth.infrastructure.persistence.UserModel directly.
+
+Lookups by ID and active-user counts are served from the process-local
+reference directory (see reference_directory.py) when available, and fall
+back to SQL otherwise.
 """
 
 from sqlalchemy.orm import Session
 from sqlalchemy import text, bindparam
+from datetime import date, datetime
 from typing import Optional
 
+from shared.infrastructure.reference_directory import get_reference_directory
+
 
 def get_user_display_name(db: Session, user_id: int) -> Optional[str]:
     """Get user display name without importing UserModel."""
+    directory = get_reference_directory(db)
+    if directory is not None:
+        user = directory.get_user(user_id)
+        return f"{user['prenom']} {user['nom']}" if user else None
+
     result = db.execute(
         text("SELECT prenom, nom FROM users WHERE id = :id"),
         {"id": user_id},
@@ -23,6 +35,10 @@ def get_user_display_name(db: Session, user_id: int) -> Optional[str]:
 
 def get_user_basic_info(db: Session, user_id: int) -> Optional[dict]:
     """Get basic user info without importing UserModel."""
+    directory = get_reference_directory(db)
+    if directory is not None:
+        return directory.get_user(user_id, include_deleted=False)
+
     result = db.execute(
         text(
             "SELECT id, prenom, nom, email, role, couleur, metiers, photo_profil, "
@@ -68,6 +84,10 @@ def get_users_basic_info_by_ids(db: Session, user_ids: list[int]) -> dict[int, d
     if not user_ids:
         return {}
 
+    directory = get_reference_directory(db)
+    if directory is not None:
+        return directory.get_users(user_ids)
+
     rows = db.execute(
         text(
             "SELECT id, prenom, nom, email, role, couleur, metiers, photo_profil, "
@@ -108,6 +128,10 @@ def get_users_basic_info_by_ids(db: Session, user_ids: list[int]) -> dict[int, d
 
 def count_active_users(db: Session) -> int:
     """Count total active users without importing UserModel."""
+    directory = get_reference_directory(db)
+    if directory is not None:
+        return directory.count_active_users()
+
     result = db.execute(
         text("SELECT COUNT(id) FROM users WHERE is_active = true"),
     ).scalar()
@@ -122,6 +146,10 @@ def count_active_users_by_metier(db: Session) -> dict[str, int]:
     Returns:
         Dict mapping metier -> count (metier can be None).
     """
+    directory = get_reference_directory(db)
+    if directory is not None:
+        return directory.count_active_users_by_metier()
+
     # Since metiers is now a JSON array, we need to extract the first element
     # This query uses SQLite json_extract to get the first element
     rows = db.execute(
@@ -148,6 +176,10 @@ def count_active_users_not_in_ids(db: Session, exclude_user_ids: list[int]) -> i
     if not exclude_user_ids:
         return count_active_users(db)
 
+    directory = get_reference_directory(db)
+    if directory is not None:
+        return directory.count_active_users(exclude_user_ids)
+
     result = db.execute(
         text(
             "SELECT COUNT(id) FROM users "
@@ -158,6 +190,45 @@ def count_active_users_not_in_ids(db: Session, exclude_user_ids: list[int]) -> i
     return result or 0
 
 
+def count_users_by_presence_period(
+    db: Session, date_min: date
+) -> list[tuple[date, Optional[date], int]]:
+    """Count users grouped by presence period (entry date, exit date).
+
+    The entry date is the account creation date and the exit date the
+    soft-delete date. Users still active and users who left on or after
+    ``date_min`` are included, so that past weeks keep their headcount.
+
+    Args:
+        db: Database session.
+        date_min: First day of the period of interest.
+
+    Returns:
+        List of (date_entree, date_sortie or None, count) tuples.
+    """
+    rows = db.execute(
+        text(
+            "SELECT DATE(created_at) AS entree, DATE(deleted_at) AS sortie, COUNT(id) "
+            "FROM users "
+            "WHERE (is_active = true AND deleted_at IS NULL) OR deleted_at >= :date_min "
+            "GROUP BY DATE(created_at), DATE(deleted_at)"
+        ),
+        {"date_min": date_min},
+    ).fetchall()
+    return [(_as_date(row[0]), _as_date(row[1]), row[2]) for row in rows]
+
+
+def _as_date(value) -> Optional[date]:
+    """Normalize a DATE() result (date, datetime or ISO string on SQLite)."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
 def get_metier_for_user_ids(db: Session, user_ids: list[int]) -> dict[int, Optional[str]]:
     """Get metier for a list of user IDs.
 
@@ -169,6 +240,10 @@ def get_metier_for_user_ids(db: Session, user_ids: list[int]) -> dict[int, Optio
     if not user_ids:
         return {}
 
+    directory = get_reference_directory(db)
+    if directory is not None:
+        return directory.get_metiers(user_ids)
+
     rows = db.execute(
         text(
             "SELECT id, json_extract(metiers, '$[0]') FROM users WHERE id IN :ids"
@@ -0,0 +1,70 @@
+"""Support ETag / If-None-Match pour les endpoints de lecture.
+
+Permet aux clients qui rechargent souvent la meme ressource (ex: planning
+en drag & drop) de recevoir un 304 Not Modified sans corps lorsque rien
+n'a change.
+
+Usage:
+    from shared.infrastructure.web.etag import compute_etag, etag_matches
+
+    data = controller.get_planning(...)
+    etag = compute_etag(data)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return data
+"""
+
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi.encoders import jsonable_encoder
+
+# Les reponses dependent de l'utilisateur (perimetre par role) :
+# cache prive, toujours revalide aupres du serveur
+ETAG_CACHE_CONTROL = "private, no-cache"
+
+
+def compute_etag(payload: Any) -> str:
+    """Calcule un ETag faible a partir du contenu serialise de la reponse.
+
+    Args:
+        payload: Donnees de la reponse (serialisables par FastAPI).
+
+    Returns:
+        ETag faible, ex: W/"3f2a...".
+    """
+    canonical = json.dumps(
+        jsonable_encoder(payload),
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Indique si l'en-tete If-None-Match correspond a l'ETag courant.
+
+    Comparaison faible (RFC 9110) : le prefixe W/ est ignore.
+
+    Args:
+        if_none_match: Valeur de l'en-tete If-None-Match (ou None).
+        etag: ETag courant de la ressource.
+
+    Returns:
+        True si le client possede deja cette version.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    current = _opaque(etag)
+    return any(_opaque(tag) == current for tag in if_none_match.split(","))
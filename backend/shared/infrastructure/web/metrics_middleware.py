@@ -0,0 +1,71 @@
+"""Middleware de mesure des requêtes HTTP (métriques Prometheus).
+
+Chaque requête est chronométrée et étiquetée par son gabarit de route
+(``/api/devis/{devis_id}`` plutôt que ``/api/devis/42``), avec le nombre et
+la durée des requêtes SQL qu'elle a exécutées. Au-delà de SLOW_REQUEST_MS, la
+requête est journalisée avec ses requêtes SQL les plus lentes.
+
+Installé uniquement quand METRICS_ENABLED est actif.
+"""
+
+import logging
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from ..config import settings
+from ..metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUEST_SQL_DURATION,
+    HTTP_REQUEST_SQL_QUERIES,
+    begin_request,
+    end_request,
+)
+
+logger = logging.getLogger(__name__)
+
+UNMATCHED_ROUTE = "unmatched"
+SLOW_REQUEST_TOP_STATEMENTS = 5
+
+
+def _route_template(request: Request) -> str:
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """Mesure la durée et les requêtes SQL de chaque requête HTTP."""
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        stats, token = begin_request()
+        debut = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            duree = time.perf_counter() - debut
+            end_request(token)
+            route = _route_template(request)
+            HTTP_REQUEST_DURATION.observe(
+                duree, method=request.method, route=route, status=str(status),
+            )
+            HTTP_REQUEST_SQL_QUERIES.observe(stats.sql_count, method=request.method, route=route)
+            HTTP_REQUEST_SQL_DURATION.observe(stats.sql_seconds, method=request.method, route=route)
+            if settings.SLOW_REQUEST_MS and duree * 1000 >= settings.SLOW_REQUEST_MS:
+                self._log_slow_request(request.method, route, status, duree, stats)
+
+    @staticmethod
+    def _log_slow_request(method: str, route: str, status: int, duree: float, stats) -> None:
+        lignes = [
+            f"Requête lente {method} {route} ({status}) : {duree * 1000:.0f} ms, "
+            f"{stats.sql_count} requêtes SQL ({stats.sql_seconds * 1000:.1f} ms)"
+        ]
+        lignes.extend(
+            f"  [{s.duration_ms:7.1f} ms] {' '.join(s.sql.split())[:300]}"
+            for s in stats.top_statements(SLOW_REQUEST_TOP_STATEMENTS)
+        )
+        logger.warning("\n".join(lignes))
@@ -0,0 +1,29 @@
+"""Route d'exposition des métriques Prometheus.
+
+``GET /metrics`` rend le registre de shared/infrastructure/metrics.py au
+format texte. Si METRICS_TOKEN est défini, l'appelant doit présenter
+``Authorization: Bearer <METRICS_TOKEN>``. Hors DEBUG, la configuration
+refuse METRICS_ENABLED sans METRICS_TOKEN : la route n'est publique qu'en
+développement.
+"""
+
+import hmac
+
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import Response
+
+from ..config import settings
+from ..metrics import CONTENT_TYPE, registry
+
+router = APIRouter(tags=["monitoring"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics(request: Request) -> Response:
+    """Expose les métriques de performance au format Prometheus."""
+    if settings.METRICS_TOKEN:
+        attendu = f"Bearer {settings.METRICS_TOKEN}"
+        fourni = request.headers.get("Authorization", "")
+        if not hmac.compare_digest(fourni.encode(), attendu.encode()):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Non autorisé")
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
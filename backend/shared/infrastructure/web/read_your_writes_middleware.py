@@ -0,0 +1,47 @@
+"""Middleware read-your-writes pour le réplica de lecture.
+
+Après une écriture réussie (POST, PUT, PATCH, DELETE), pendant
+DB_READ_YOUR_WRITES_SECONDS, get_read_db sert les lectures de cet
+utilisateur depuis la base principale plutôt que depuis le réplica, qui
+peut être en retard. L'écriture est mémorisée de deux façons :
+
+- le cookie ``last_write_at``, qui marche quel que soit le worker qui traite
+  la requête suivante, pour les navigateurs ;
+- ``recent_writes``, table côté serveur indexée par l'ID de l'utilisateur
+  authentifié, pour les clients qui ne gardent pas les cookies (SDK en clé
+  API, application mobile en Bearer). Cette table est propre au processus :
+  avec plusieurs workers, un tel client peut encore lire le réplica s'il
+  tombe sur un autre worker que celui de l'écriture.
+"""
+
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from ..config import settings
+from ..database import LAST_WRITE_COOKIE, recent_writes, request_user_id
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """Marque les écritures réussies avec l'heure d'écriture (cookie et côté serveur)."""
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        response = await call_next(request)
+        if request.method in WRITE_METHODS and response.status_code < 400:
+            user_id = request_user_id(request)
+            if user_id is not None:
+                recent_writes.record(user_id)
+            response.set_cookie(
+                key=LAST_WRITE_COOKIE,
+                value=f"{time.time():.3f}",
+                max_age=settings.DB_READ_YOUR_WRITES_SECONDS,
+                httponly=True,
+                secure=settings.COOKIE_SECURE,
+                samesite=settings.COOKIE_SAMESITE,
+                domain=settings.COOKIE_DOMAIN,
+            )
+        return response
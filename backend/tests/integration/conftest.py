@@ -3,21 +3,26 @@
 Ces tests utilisent la vraie application FastAPI avec une base SQLite en memoire.
 """
 
+import asyncio
 import pytest
 import sys
 import os
+from contextlib import contextmanager
+from uuid import uuid4
 
 # Ajouter le dossier backend au path pour les imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 
 from main import app
-from shared.infrastructure.database import get_db
+from shared.infrastructure.database import get_async_db, get_db
+from shared.infrastructure.query_counter import QueryCounter
 from modules.auth.infrastructure.persistence import Base as AuthBase
 from modules.chantiers.infrastructure.persistence import Base as ChantiersBase
 from modules.taches.infrastructure.persistence import Base as TachesBase
@@ -36,12 +41,26 @@ def test_db():
     Cree une base de donnees SQLite en memoire pour les tests.
 
     Chaque test obtient une DB fraiche.
+
+    La base en memoire est nommee et partagee (cache=shared) : les routes
+    asynchrones (get_async_db) la lisent via aiosqlite, en read_uncommitted
+    pour voir les donnees de la session de test non encore commitees.
     """
+    database = f"file:hub_test_{uuid4().hex}?mode=memory&cache=shared&uri=true"
     engine = create_engine(
-        "sqlite:///:memory:",
+        f"sqlite:///{database}",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{database}", poolclass=StaticPool,
+    )
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _read_uncommitted(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA read_uncommitted = 1")
+        cursor.close()
     # Creer les tables des modules sans dependances croisees
     AuthBase.metadata.create_all(bind=engine)
     ChantiersBase.metadata.create_all(bind=engine)
@@ -80,12 +99,19 @@ def test_db():
             test_session.rollback()
             raise
 
+    async def override_get_async_db():
+        async with AsyncSession(async_engine) as session:
+            yield session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
     yield test_session
 
     test_session.close()
     app.dependency_overrides.clear()
+    asyncio.run(async_engine.dispose())
+    engine.dispose()
 
 
 @pytest.fixture(scope="function")
@@ -95,6 +121,27 @@ def client(test_db):
         yield c
 
 
+@pytest.fixture
+def count_queries():
+    """
+    Compte les requetes SQL executees dans un bloc, avec budget optionnel.
+
+    Usage:
+        with count_queries(max_queries=6) as counter:
+            client.get("/api/chantiers", headers=headers)
+    """
+    @contextmanager
+    def _count(max_queries=None):
+        with QueryCounter() as counter:
+            yield counter
+        if max_queries is not None:
+            assert counter.count <= max_queries, (
+                f"Budget de {max_queries} requetes depasse. {counter.report()}"
+            )
+
+    return _count
+
+
 @pytest.fixture
 def auth_headers(client):
     """
@@ -6,6 +6,15 @@ Selon CDC Section 9 - Gestion Documentaire (GED-01 a GED-17).
 
 import io
 
+import pytest
+
+from modules.auth.infrastructure.persistence import SQLAlchemyUserRepository, UserModel
+from modules.chantiers.infrastructure.persistence import ChantierModel
+from modules.documents.adapters.providers import LocalFileStorageService
+from modules.documents.infrastructure.persistence import DossierModel
+from modules.documents.infrastructure.web.dependencies import get_file_storage
+from shared.infrastructure.web.dependencies import get_token_service
+
 
 def to_int(value):
     """Convertit une valeur en int (utile car l'API chantiers retourne des IDs en string)."""
@@ -277,6 +286,134 @@ class TestDocumentUpload:
         assert data["dossier_id"] == dossier_id
 
 
+@pytest.fixture
+def ged(test_db, tmp_path):
+    """Administrateur authentifie, deux chantiers avec un dossier chacun, stockage isole."""
+    from main import app
+
+    admin = UserModel(
+        email="admin@ged.test", password_hash="!", nom="Admin", prenom="Ged",
+        role="admin", type_utilisateur="employe",
+    )
+    test_db.add(admin)
+    dossiers = []
+    for code in ("G001", "G002"):
+        chantier = ChantierModel(code=code, nom=f"Chantier {code}", adresse="1 rue du Test")
+        test_db.add(chantier)
+        test_db.flush()
+        dossier = DossierModel(
+            chantier_id=chantier.id, nom="Plans", type_dossier="01_plans",
+            niveau_acces="compagnon", ordre=0,
+        )
+        test_db.add(dossier)
+        test_db.flush()
+        dossiers.append((chantier.id, dossier.id))
+    test_db.commit()
+
+    app.dependency_overrides[get_file_storage] = (
+        lambda: LocalFileStorageService(base_path=str(tmp_path))
+    )
+    token = get_token_service().generate(SQLAlchemyUserRepository(test_db).find_by_id(admin.id))
+    return {
+        "headers": {
+            "Authorization": f"Bearer {token}",
+            # Double soumission CSRF : cookie et en-tete identiques
+            "Cookie": "csrf_token=ged-test",
+            "X-CSRF-Token": "ged-test",
+        },
+        "dossiers": dossiers,
+        "storage": tmp_path,
+    }
+
+
+class TestChunkedUpload:
+    """Tests d'integration pour l'upload decoupe et reprenable (GED-06, GED-07)."""
+
+    def _ouvrir(self, client, ged, chantier_id, dossier_id, taille):
+        response = client.post(
+            f"/api/documents/dossiers/{dossier_id}/uploads",
+            params={"chantier_id": chantier_id},
+            json={"nom_original": "plan.pdf", "taille": taille, "mime_type": "application/pdf"},
+            headers=ged["headers"],
+        )
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+
+    def test_upload_reprise_et_deduplication(self, client, ged):
+        """Test envoi par morceaux, reprise a l'offset et contenu partage entre chantiers."""
+        contenu = b"%PDF-1.4 plan du rez-de-chaussee"
+
+        documents = []
+        for chantier_id, dossier_id in ged["dossiers"]:
+            upload_id = self._ouvrir(client, ged, chantier_id, dossier_id, len(contenu))
+
+            response = client.put(
+                f"/api/documents/uploads/{upload_id}",
+                params={"offset": 0}, content=contenu[:10], headers=ged["headers"],
+            )
+            assert response.status_code == 200, response.text
+            assert response.json()["offset"] == 10
+
+            # Morceau renvoye apres une coupure : l'offset de reprise est indique
+            response = client.put(
+                f"/api/documents/uploads/{upload_id}",
+                params={"offset": 0}, content=contenu[:10], headers=ged["headers"],
+            )
+            assert response.status_code == 409
+            assert response.json()["detail"]["offset"] == 10
+
+            response = client.get(f"/api/documents/uploads/{upload_id}", headers=ged["headers"])
+            assert response.json()["offset"] == 10
+
+            response = client.put(
+                f"/api/documents/uploads/{upload_id}",
+                params={"offset": 10}, content=contenu[10:], headers=ged["headers"],
+            )
+            assert response.json()["complet"] is True
+
+            response = client.post(
+                f"/api/documents/uploads/{upload_id}/finalize", headers=ged["headers"]
+            )
+            assert response.status_code == 201, response.text
+            documents.append(response.json())
+
+        assert [d["chantier_id"] for d in documents] == [c for c, _ in ged["dossiers"]]
+        assert documents[0]["taille"] == len(contenu)
+        assert len(list((ged["storage"] / "blobs").rglob("*.pdf"))) == 1
+        response = client.get(
+            f"/api/documents/documents/{documents[1]['id']}/download", headers=ged["headers"]
+        )
+        assert response.content == contenu
+
+    def test_upload_multipart_deduplique(self, client, ged):
+        """Test upload classique : le meme fichier sur deux chantiers est stocke une fois."""
+        for chantier_id, dossier_id in ged["dossiers"]:
+            response = client.post(
+                f"/api/documents/dossiers/{dossier_id}/documents",
+                params={"chantier_id": chantier_id},
+                files={"file": ("plan.pdf", io.BytesIO(b"%PDF-1.4 plan"), "application/pdf")},
+                headers=ged["headers"],
+            )
+            assert response.status_code == 201, response.text
+
+        assert len(list((ged["storage"] / "blobs").rglob("*.pdf"))) == 1
+
+    def test_finalisation_incomplete(self, client, ged):
+        """Test finalisation refusee tant que tous les octets ne sont pas recus."""
+        chantier_id, dossier_id = ged["dossiers"][0]
+        upload_id = self._ouvrir(client, ged, chantier_id, dossier_id, 100)
+
+        response = client.post(
+            f"/api/documents/uploads/{upload_id}/finalize", headers=ged["headers"]
+        )
+        assert response.status_code == 409
+
+        response = client.delete(f"/api/documents/uploads/{upload_id}", headers=ged["headers"])
+        assert response.status_code == 204
+        response = client.get(f"/api/documents/uploads/{upload_id}", headers=ged["headers"])
+        assert response.status_code == 404
+
+
 class TestDocumentGet:
     """Tests d'integration pour la recuperation d'un document."""
 
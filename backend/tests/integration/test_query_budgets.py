@@ -0,0 +1,197 @@
+"""Budgets de requetes SQL des principales routes de lecture.
+
+Chaque route declare un nombre maximal de requetes par appel. La route est
+appelee deux fois, avec un petit puis un grand jeu de donnees : le nombre de
+requetes doit rester sous le budget et ne pas croitre avec la taille du
+resultat (detection des motifs N+1).
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable
+
+import pytest
+
+from modules.auth.infrastructure.persistence import SQLAlchemyUserRepository, UserModel
+from modules.chantiers.infrastructure.persistence import ChantierModel, ContactChantierModel
+from modules.chantiers.infrastructure.persistence.chantier_responsable_model import (
+    ChantierChefModel,
+    ChantierConducteurModel,
+    ChantierOuvrierModel,
+)
+from modules.dashboard.infrastructure.persistence import CommentModel, LikeModel, PostModel
+from modules.devis.infrastructure.persistence.models import (
+    DebourseDetailModel,
+    DevisModel,
+    LigneDevisModel,
+    LotDevisModel,
+)
+from modules.pointages.infrastructure.persistence import PointageModel
+from modules.signalements.infrastructure.persistence import ReponseModel, SignalementModel
+from shared.infrastructure.web.dependencies import get_token_service
+
+PETIT, GRAND = 3, 12
+MOIS_RECAP = date(2026, 3, 1)
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    """Budget de requetes d'une route et alimentation de ses donnees."""
+
+    route: str
+    max_queries: int
+    seed: Callable  # (db, ctx, n) -> None : ajoute n elements au resultat
+
+
+def _user(db, n, role="compagnon"):
+    user = UserModel(
+        email=f"{role}{n}@budget.test", password_hash="!", nom=f"Nom{n}",
+        prenom=f"Prenom{n}", role=role, type_utilisateur="employe",
+    )
+    db.add(user)
+    db.flush()
+    return user
+
+
+def _seed_chantiers(db, ctx, n):
+    for _ in range(n):
+        ctx["seq"] += 1
+        chantier = ChantierModel(
+            code=f"B{ctx['seq']:03d}", nom=f"Chantier {ctx['seq']}", adresse="1 rue du Test",
+            statut="en_cours",
+        )
+        db.add(chantier)
+        db.flush()
+        conducteur = _user(db, ctx["seq"], "conducteur")
+        chef = _user(db, ctx["seq"], "chef_chantier")
+        ouvrier = _user(db, ctx["seq"])
+        chantier.conducteur_ids = [conducteur.id]
+        chantier.chef_chantier_ids = [chef.id]
+        db.add_all([
+            ChantierConducteurModel(chantier_id=chantier.id, user_id=conducteur.id),
+            ChantierChefModel(chantier_id=chantier.id, user_id=chef.id),
+            ChantierOuvrierModel(chantier_id=chantier.id, user_id=ouvrier.id),
+            ContactChantierModel(chantier_id=chantier.id, nom="Client", telephone="0600000000"),
+        ])
+
+
+def _seed_feed(db, ctx, n):
+    for _ in range(n):
+        ctx["seq"] += 1
+        auteur = _user(db, ctx["seq"], "chef_chantier")
+        post = PostModel(author_id=auteur.id, content=f"Post {ctx['seq']}")
+        db.add(post)
+        db.flush()
+        db.add_all([
+            LikeModel(post_id=post.id, user_id=ctx["admin_id"]),
+            LikeModel(post_id=post.id, user_id=auteur.id),
+            CommentModel(post_id=post.id, author_id=ctx["admin_id"], content="Vu"),
+        ])
+
+
+def _seed_signalements(db, ctx, n):
+    for _ in range(n):
+        ctx["seq"] += 1
+        signalement = SignalementModel(
+            chantier_id=ctx["chantier_id"], titre=f"Signalement {ctx['seq']}",
+            description="Fuite", cree_par=_user(db, ctx["seq"]).id,
+            assigne_a=ctx["admin_id"],
+        )
+        db.add(signalement)
+        db.flush()
+        db.add_all([
+            ReponseModel(signalement_id=signalement.id, contenu="Pris en compte",
+                         auteur_id=ctx["admin_id"]),
+            ReponseModel(signalement_id=signalement.id, contenu="Corrige",
+                         auteur_id=signalement.cree_par),
+        ])
+
+
+def _seed_devis(db, ctx, n):
+    if "devis_id" not in ctx:
+        devis = DevisModel(
+            numero="DEV-BUDGET-001", client_nom="Client", statut="brouillon",
+            date_creation=MOIS_RECAP, created_by=ctx["admin_id"],
+        )
+        db.add(devis)
+        db.flush()
+        ctx["devis_id"] = devis.id
+    for _ in range(n):
+        ctx["seq"] += 1
+        lot = LotDevisModel(
+            devis_id=ctx["devis_id"], titre=f"Lot {ctx['seq']}", numero=str(ctx["seq"]),
+            ordre=ctx["seq"],
+        )
+        db.add(lot)
+        db.flush()
+        ligne = LigneDevisModel(
+            lot_devis_id=lot.id, designation=f"Ouvrage {ctx['seq']}", unite="m2",
+            quantite=10, prix_unitaire_ht=25,
+        )
+        db.add(ligne)
+        db.flush()
+        db.add(DebourseDetailModel(
+            ligne_devis_id=ligne.id, type_debourse="materiaux", designation="Beton",
+            quantite=1, prix_unitaire=12, unite="m3", montant=12,
+        ))
+
+
+def _seed_recap(db, ctx, n):
+    jours_ouvres = [
+        MOIS_RECAP + timedelta(days=i) for i in range(28)
+        if (MOIS_RECAP + timedelta(days=i)).weekday() < 5
+    ]
+    for jour in jours_ouvres[ctx.setdefault("jours_pointes", 0):][:n]:
+        db.add(PointageModel(
+            utilisateur_id=ctx["admin_id"], chantier_id=ctx["chantier_id"], date_pointage=jour,
+            heures_normales_minutes=420, statut="valide", created_by=ctx["admin_id"],
+        ))
+        ctx["jours_pointes"] += 1
+
+
+BUDGETS = [
+    QueryBudget("/api/chantiers?size=100", 6, _seed_chantiers),
+    QueryBudget("/api/dashboard/feed?size=50", 7, _seed_feed),
+    QueryBudget("/api/signalements?limit=100", 4, _seed_signalements),
+    QueryBudget("/api/devis/{devis_id}", 5, _seed_devis),
+    QueryBudget(
+        f"/api/pointages/recap/{{admin_id}}/{MOIS_RECAP.year}/{MOIS_RECAP.month}", 5, _seed_recap,
+    ),
+]
+
+
+@pytest.fixture
+def ctx(test_db):
+    """Administrateur authentifie et chantier de reference."""
+    admin = _user(test_db, 0, "admin")
+    chantier = ChantierModel(code="A001", nom="Chantier reference", adresse="1 rue du Test")
+    test_db.add(chantier)
+    test_db.commit()
+    token = get_token_service().generate(SQLAlchemyUserRepository(test_db).find_by_id(admin.id))
+    return {
+        "admin_id": admin.id,
+        "chantier_id": chantier.id,
+        "headers": {"Authorization": f"Bearer {token}"},
+        "seq": 0,
+    }
+
+
+@pytest.mark.parametrize("budget", BUDGETS, ids=lambda b: b.route.split("?")[0])
+def test_budget_de_requetes(budget, client, test_db, ctx, count_queries):
+    comptes = []
+    for n in (PETIT, GRAND - PETIT):
+        budget.seed(test_db, ctx, n)
+        test_db.commit()
+        url = budget.route.format(**ctx)
+
+        with count_queries(max_queries=budget.max_queries) as counter:
+            response = client.get(url, headers=ctx["headers"])
+
+        assert response.status_code == 200, response.text
+        comptes.append(counter)
+
+    petit, grand = comptes
+    assert grand.count == petit.count, (
+        f"{budget.route} : {petit.count} requetes pour {PETIT} elements, "
+        f"{grand.count} pour {GRAND}.\n{grand.report()}"
+    )
@@ -10,6 +10,20 @@ from shared.infrastructure.api_v1.middleware import (
     _verify_api_key,
     _verify_jwt_token,
 )
+from shared.infrastructure.api_v1.api_key_cache import (
+    get_api_key_cache,
+    get_api_key_usage_tracker,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_api_key_cache():
+    """Isole chaque test du cache des clés vérifiées et des compteurs d'usage."""
+    get_api_key_cache().invalidate()
+    get_api_key_usage_tracker().reset()
+    yield
+    get_api_key_cache().invalidate()
+    get_api_key_usage_tracker().reset()
 
 
 @pytest.mark.asyncio
@@ -22,6 +36,7 @@ async def test_middleware_accepts_valid_api_key():
     mock_key_record.is_active = True
     mock_key_record.expires_at = None
     mock_key_record.user_id = 1
+    mock_key_record.rate_limit_per_hour = 1000
     mock_key_record.last_used_at = None
 
     mock_user = Mock()
@@ -42,7 +57,7 @@ async def test_middleware_accepts_valid_api_key():
 
     # Assert
     assert result == mock_user, "Devrait retourner l'utilisateur"
-    assert mock_db.commit.called, "Devrait commit pour mettre à jour last_used_at"
+    assert not mock_db.commit.called, "last_used_at est écrit par lots, pas par requête"
 
 
 @pytest.mark.asyncio
@@ -73,6 +88,7 @@ async def test_middleware_rejects_expired_key():
     mock_key_record.is_active = True
     mock_key_record.expires_at = datetime.utcnow() - timedelta(days=1)  # Expirée
     mock_key_record.user_id = 1
+    mock_key_record.rate_limit_per_hour = 1000
 
     mock_query = Mock()
     mock_query.filter.return_value.first.return_value = mock_key_record
@@ -106,15 +122,17 @@ async def test_middleware_rejects_revoked_key():
 
 
 @pytest.mark.asyncio
-async def test_middleware_updates_last_used_at():
-    """Vérifie que le middleware met à jour last_used_at."""
+async def test_middleware_records_usage_without_db_write():
+    """Vérifie que l'usage est comptabilisé en mémoire, sans UPDATE par requête."""
     # Arrange
     valid_secret = "hbc_test_secret_12345678901234567890"
     mock_db = Mock()
     mock_key_record = Mock()
+    mock_key_record.id = "key-1"
     mock_key_record.is_active = True
     mock_key_record.expires_at = None
     mock_key_record.user_id = 1
+    mock_key_record.rate_limit_per_hour = 1000
     mock_key_record.last_used_at = None
 
     mock_user = Mock()
@@ -123,21 +141,197 @@ async def test_middleware_updates_last_used_at():
 
     mock_query = Mock()
     mock_query.filter.return_value.first.return_value = mock_key_record
-    mock_db.query.return_value = mock_query
 
     mock_user_query = Mock()
     mock_user_query.filter.return_value.first.return_value = mock_user
     mock_db.query.side_effect = [mock_query, mock_user_query]
 
     # Act
-    before = datetime.utcnow()
     await _verify_api_key(valid_secret, mock_db)
-    after = datetime.utcnow()
 
     # Assert
-    assert mock_key_record.last_used_at is not None, "last_used_at devrait être défini"
-    assert before <= mock_key_record.last_used_at <= after, "last_used_at devrait être l'heure actuelle"
-    mock_db.commit.assert_called_once()
+    tracker = get_api_key_usage_tracker()
+    assert tracker.requests_in_window("key-1") == 1
+    assert tracker.pending() == 1
+    assert mock_key_record.last_used_at is None
+    mock_db.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_middleware_serves_verified_key_from_cache():
+    """Vérifie qu'une clé déjà vérifiée n'est pas relue en base."""
+    # Arrange
+    valid_secret = "hbc_test_secret_12345678901234567890"
+    mock_db = Mock()
+    mock_key_record = Mock()
+    mock_key_record.id = "key-1"
+    mock_key_record.expires_at = None
+    mock_key_record.user_id = 1
+    mock_key_record.rate_limit_per_hour = 1000
+
+    mock_user = Mock()
+    mock_user.is_active = True
+
+    mock_query = Mock()
+    mock_query.filter.return_value.first.return_value = mock_key_record
+    mock_user_query = Mock()
+    mock_user_query.filter.return_value.first.return_value = mock_user
+    mock_db.query.side_effect = [mock_query, mock_user_query, mock_user_query]
+
+    # Act
+    await _verify_api_key(valid_secret, mock_db)
+    result = await _verify_api_key(valid_secret, mock_db)
+
+    # Assert : 1 lecture de la clé + 2 lectures utilisateur
+    assert result == mock_user
+    assert mock_db.query.call_count == 3
+    assert get_api_key_usage_tracker().requests_in_window("key-1") == 2
+
+
+@pytest.mark.asyncio
+async def test_middleware_revoked_key_rejected_after_invalidation():
+    """Vérifie qu'une clé révoquée n'est plus servie par le cache."""
+    # Arrange
+    valid_secret = "hbc_test_secret_12345678901234567890"
+    mock_db = Mock()
+    mock_key_record = Mock()
+    mock_key_record.id = "key-1"
+    mock_key_record.expires_at = None
+    mock_key_record.user_id = 1
+    mock_key_record.rate_limit_per_hour = 1000
+
+    mock_user = Mock()
+    mock_user.is_active = True
+
+    mock_query = Mock()
+    mock_query.filter.return_value.first.return_value = mock_key_record
+    mock_user_query = Mock()
+    mock_user_query.filter.return_value.first.return_value = mock_user
+    revoked_query = Mock()
+    revoked_query.filter.return_value.first.return_value = None
+    mock_db.query.side_effect = [mock_query, mock_user_query, revoked_query]
+
+    await _verify_api_key(valid_secret, mock_db)
+
+    # Act
+    assert get_api_key_cache().invalidate_key("key-1") is True
+
+    # Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await _verify_api_key(valid_secret, mock_db)
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_middleware_cached_key_rechecked_in_owner_query():
+    """Vérifie qu'une clé servie par le cache est revérifiée avec l'utilisateur."""
+    # Arrange
+    valid_secret = "hbc_test_secret_12345678901234567890"
+    mock_db = Mock()
+    mock_key_record = Mock()
+    mock_key_record.id = "key-1"
+    mock_key_record.expires_at = None
+    mock_key_record.user_id = 1
+    mock_key_record.rate_limit_per_hour = 1000
+
+    mock_user = Mock()
+    mock_user.is_active = True
+
+    mock_query = Mock()
+    mock_query.filter.return_value.first.return_value = mock_key_record
+    mock_user_query = Mock()
+    mock_user_query.filter.return_value.first.return_value = mock_user
+    revoked_user_query = Mock()
+    revoked_user_query.filter.return_value.first.return_value = None
+    mock_db.query.side_effect = [mock_query, mock_user_query, revoked_user_query]
+
+    await _verify_api_key(valid_secret, mock_db)
+
+    # Act : révoquée par un autre worker, le cache local la contient encore
+    with pytest.raises(HTTPException) as exc_info:
+        await _verify_api_key(valid_secret, mock_db)
+
+    # Assert : une seule requête (utilisateur + état de la clé), entrée retirée
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Invalid or revoked API key"
+    assert len(revoked_user_query.filter.call_args.args) == 2
+    assert get_api_key_cache().invalidate_key("key-1") is False
+
+
+@pytest.mark.asyncio
+async def test_middleware_revocation_by_other_worker_applies_immediately():
+    """Vérifie, en base, qu'une révocation hors du processus s'applique sans TTL."""
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    import hashlib
+
+    from modules.auth.infrastructure.persistence.api_key_model import APIKeyModel
+    from modules.auth.infrastructure.persistence.user_model import UserModel
+
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    UserModel.__table__.create(engine)
+    APIKeyModel.__table__.create(engine)
+    secret = "hbc_test_secret_12345678901234567890"
+    db = sessionmaker(bind=engine)()
+    db.add(UserModel(
+        id=1, email="erp@ex.fr", password_hash="x", prenom="E", nom="RP",
+        role="admin", type_utilisateur="employe", is_active=True,
+    ))
+    db.add(APIKeyModel(
+        id="key-1", key_hash=hashlib.sha256(secret.encode("utf-8")).hexdigest(),
+        key_prefix="hbc_test", user_id=1, nom="ERP", is_active=True,
+    ))
+    db.commit()
+
+    await _verify_api_key(secret, db)
+    assert (await _verify_api_key(secret, db)).id == 1  # servie par le cache
+
+    # Act : révocation écrite par un autre worker (cache local intact)
+    db.execute(text("UPDATE api_keys SET is_active = 0 WHERE id = 'key-1'"))
+    db.commit()
+
+    # Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await _verify_api_key(secret, db)
+    assert exc_info.value.status_code == 401
+    db.close()
+
+
+@pytest.mark.asyncio
+async def test_middleware_rejects_key_over_hourly_quota():
+    """Vérifie le 429 quand le quota horaire de la clé est atteint."""
+    # Arrange
+    valid_secret = "hbc_test_secret_12345678901234567890"
+    mock_db = Mock()
+    mock_key_record = Mock()
+    mock_key_record.id = "key-1"
+    mock_key_record.expires_at = None
+    mock_key_record.user_id = 1
+    mock_key_record.rate_limit_per_hour = 2
+
+    mock_user = Mock()
+    mock_user.is_active = True
+
+    mock_query = Mock()
+    mock_query.filter.return_value.first.return_value = mock_key_record
+    mock_user_query = Mock()
+    mock_user_query.filter.return_value.first.return_value = mock_user
+    mock_db.query.side_effect = [mock_query, mock_user_query, mock_user_query]
+
+    await _verify_api_key(valid_secret, mock_db)
+    await _verify_api_key(valid_secret, mock_db)
+
+    # Act & Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await _verify_api_key(valid_secret, mock_db)
+
+    assert exc_info.value.status_code == 429
+    assert int(exc_info.value.headers["Retry-After"]) > 0
 
 
 @pytest.mark.asyncio
@@ -254,6 +448,7 @@ async def test_middleware_routes_hbc_prefix_to_api_key_verification():
     mock_key_record.is_active = True
     mock_key_record.expires_at = None
     mock_key_record.user_id = 1
+    mock_key_record.rate_limit_per_hour = 1000
 
     mock_user = Mock()
     mock_user.id = 1
@@ -312,6 +507,7 @@ async def test_middleware_rejects_inactive_user():
     mock_key_record.is_active = True
     mock_key_record.expires_at = None
     mock_key_record.user_id = 1
+    mock_key_record.rate_limit_per_hour = 1000
 
     mock_user = Mock()
     mock_user.id = 1
@@ -343,6 +539,7 @@ async def test_middleware_rejects_missing_user():
     mock_key_record.is_active = True
     mock_key_record.expires_at = None
     mock_key_record.user_id = 999
+    mock_key_record.rate_limit_per_hour = 1000
 
     mock_query = Mock()
     mock_query.filter.return_value.first.return_value = mock_key_record
@@ -397,6 +594,7 @@ async def test_middleware_accepts_non_expiring_key():
     mock_key_record.is_active = True
     mock_key_record.expires_at = None  # Pas d'expiration
     mock_key_record.user_id = 1
+    mock_key_record.rate_limit_per_hour = 1000
 
     mock_user = Mock()
     mock_user.id = 1
@@ -427,6 +625,7 @@ async def test_middleware_accepts_not_yet_expired_key():
     mock_key_record.is_active = True
     mock_key_record.expires_at = datetime.utcnow() + timedelta(days=30)  # Expire dans 30 jours
     mock_key_record.user_id = 1
+    mock_key_record.rate_limit_per_hour = 1000
 
     mock_user = Mock()
     mock_user.id = 1
@@ -458,6 +657,7 @@ async def test_middleware_bearer_prefix_removed():
     mock_key_record.is_active = True
     mock_key_record.expires_at = None
     mock_key_record.user_id = 1
+    mock_key_record.rate_limit_per_hour = 1000
 
     mock_user = Mock()
     mock_user.id = 1
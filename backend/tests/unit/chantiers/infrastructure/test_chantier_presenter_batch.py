@@ -0,0 +1,297 @@
+"""Tests de l'assemblage par lots de la liste des chantiers."""
+
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from modules.auth.infrastructure.persistence import UserModel
+from modules.auth.infrastructure.persistence.sqlalchemy_user_repository import (
+    SQLAlchemyUserRepository,
+)
+from modules.chantiers.domain.entities import ContactChantierEntity
+from modules.chantiers.infrastructure.persistence import ChantierModel
+from modules.chantiers.infrastructure.persistence.chantier_responsable_model import (
+    ChantierChefModel,
+    ChantierConducteurModel,
+    ChantierOuvrierModel,
+)
+from modules.chantiers.infrastructure.persistence.contact_chantier_model import (
+    ContactChantierModel,
+)
+from modules.chantiers.infrastructure.persistence.sqlalchemy_chantier_repository import (
+    SQLAlchemyChantierRepository,
+)
+from modules.chantiers.infrastructure.web.chantier_presenter import (
+    transform_chantier_response,
+    transform_chantiers_list,
+)
+from modules.chantiers.infrastructure.web.chantier_routes import list_chantiers
+from modules.devis.infrastructure.persistence import models as _devis_models  # noqa: F401
+
+
+def _user(user_id, telephone="0600000000"):
+    user = Mock()
+    user.id = user_id
+    user.nom = f"Nom{user_id}"
+    user.prenom = f"Prenom{user_id}"
+    user.role.value = "compagnon"
+    user.type_utilisateur.value = "employe"
+    user.metier = None
+    user.couleur = None
+    user.telephone = telephone
+    user.is_active = True
+    return user
+
+
+def _chantier_dict(chantier_id, conducteur_ids=(), chef_ids=()):
+    return {
+        "id": chantier_id,
+        "code": f"A{chantier_id:03d}",
+        "nom": f"Chantier {chantier_id}",
+        "adresse": "1 rue du Port",
+        "statut": "ouvert",
+        "contact": {"nom": "Legacy", "telephone": "0100000000"},
+        "contacts": [],
+        "conducteur_ids": list(conducteur_ids),
+        "chef_chantier_ids": list(chef_ids),
+        "created_at": "2026-01-05T08:00:00",
+    }
+
+
+class TestTransformChantiersList:
+    """Tests de transform_chantiers_list."""
+
+    def setup_method(self):
+        self.user_repo = Mock()
+        self.user_repo.find_by_ids.side_effect = lambda ids: [_user(i) for i in ids]
+        self.chantier_repo = Mock()
+        self.chantier_repo.list_ouvrier_ids_by_chantier.return_value = {1: [5, 6], 2: [5]}
+        self.chantier_repo.list_contacts_by_chantier.return_value = {
+            2: [ContactChantierEntity(id=1, chantier_id=2, nom="MOA", telephone="0200000000")],
+        }
+        self.chantiers = [
+            _chantier_dict(1, conducteur_ids=[1], chef_ids=[3]),
+            _chantier_dict(2, conducteur_ids=[1, 2], chef_ids=[3, 4]),
+        ]
+
+    def test_une_requete_par_type_pour_toute_la_page(self):
+        """Test: utilisateurs, ouvriers et contacts chargés une seule fois."""
+        result = transform_chantiers_list(self.chantiers, self.user_repo, self.chantier_repo)
+
+        self.user_repo.find_by_ids.assert_called_once()
+        assert set(self.user_repo.find_by_ids.call_args.args[0]) == {1, 2, 3, 4, 5, 6}
+        self.user_repo.find_by_id.assert_not_called()
+        self.chantier_repo.list_ouvrier_ids_by_chantier.assert_called_once_with([1, 2])
+        self.chantier_repo.list_contacts_by_chantier.assert_called_once_with([1, 2])
+        self.chantier_repo.list_ouvrier_ids.assert_not_called()
+
+        assert [r.id for r in result] == ["1", "2"]
+        assert [c.id for c in result[1].conducteurs] == ["1", "2"]
+        assert [o.id for o in result[0].ouvriers] == ["5", "6"]
+
+    def test_telephone_reserve_aux_chefs(self):
+        """Test: RGPD, seul le téléphone des chefs est exposé."""
+        result = transform_chantiers_list(self.chantiers, self.user_repo, self.chantier_repo)
+
+        assert result[0].chefs[0].telephone == "0600000000"
+        assert result[0].conducteurs[0].telephone is None
+        assert result[0].ouvriers[0].telephone is None
+
+    def test_contacts(self):
+        """Test: contacts chargés, repli sur le contact legacy sinon."""
+        result = transform_chantiers_list(self.chantiers, self.user_repo, self.chantier_repo)
+
+        assert [c.nom for c in result[0].contacts] == ["Legacy"]
+        assert [c.nom for c in result[1].contacts] == ["MOA"]
+
+    def test_contacts_identiques_au_detail(self):
+        """Test: la liste et le détail d'un même chantier ont les mêmes contacts."""
+        self.chantier_repo.list_ouvrier_ids.return_value = [5]
+        liste = transform_chantiers_list(self.chantiers, self.user_repo, self.chantier_repo)
+
+        for chantier, de_la_liste in zip(self.chantiers, liste):
+            detail = transform_chantier_response(
+                chantier, None, self.user_repo, self.chantier_repo
+            )
+            assert detail.contacts == de_la_liste.contacts
+        self.chantier_repo.list_contacts_by_chantier.assert_called_with([2])
+
+    def test_utilisateur_introuvable_ignore(self):
+        """Test: un utilisateur absent (supprimé) n'apparaît pas."""
+        self.user_repo.find_by_ids.side_effect = lambda ids: [_user(i) for i in ids if i != 2]
+
+        result = transform_chantiers_list(self.chantiers, self.user_repo, self.chantier_repo)
+
+        assert [c.id for c in result[1].conducteurs] == ["1"]
+
+    def test_champs_partiels_sans_personnes(self):
+        """Test: sans listes de personnes demandées, aucune requête annexe."""
+        result = transform_chantiers_list(
+            self.chantiers, self.user_repo, self.chantier_repo,
+            fields={"id", "code", "nom", "statut"},
+        )
+
+        self.user_repo.find_by_ids.assert_not_called()
+        self.chantier_repo.list_ouvrier_ids_by_chantier.assert_not_called()
+        self.chantier_repo.list_contacts_by_chantier.assert_not_called()
+        assert result[0].conducteurs == []
+        assert result[0].ouvriers == []
+
+    def test_champs_partiels_chefs_uniquement(self):
+        """Test: seuls les utilisateurs des listes demandées sont chargés."""
+        result = transform_chantiers_list(
+            self.chantiers, self.user_repo, self.chantier_repo, fields={"id", "chefs"},
+        )
+
+        assert set(self.user_repo.find_by_ids.call_args.args[0]) == {3, 4}
+        self.chantier_repo.list_ouvrier_ids_by_chantier.assert_not_called()
+        assert [c.id for c in result[1].chefs] == ["3", "4"]
+
+    def test_page_vide(self):
+        """Test: une page vide ne déclenche aucune requête."""
+        assert transform_chantiers_list([], self.user_repo, self.chantier_repo) == []
+        self.user_repo.find_by_ids.assert_not_called()
+        self.chantier_repo.list_ouvrier_ids_by_chantier.assert_not_called()
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    UserModel.metadata.create_all(engine, tables=[
+        UserModel.__table__, ChantierModel.__table__, ChantierConducteurModel.__table__,
+        ChantierChefModel.__table__, ChantierOuvrierModel.__table__,
+        ContactChantierModel.__table__,
+    ])
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        UserModel(
+            id=i, email=f"u{i}@ex.fr", password_hash="x", prenom=f"P{i}", nom=f"N{i}",
+            role="compagnon", type_utilisateur="employe",
+        )
+        for i in (1, 2, 3)
+    ])
+    session.add_all([
+        ChantierModel(
+            id=i, code=f"A{i:03d}", nom=f"Chantier {i}", adresse="1 rue du Port",
+            statut="ouvert", couleur="#AA0000",
+        )
+        for i in (10, 11, 12)
+    ])
+    session.flush()
+    session.add_all([
+        ChantierConducteurModel(chantier_id=10, user_id=1),
+        ChantierConducteurModel(chantier_id=11, user_id=2),
+        ChantierChefModel(chantier_id=10, user_id=3),
+        ChantierOuvrierModel(chantier_id=10, user_id=2),
+        ChantierOuvrierModel(chantier_id=10, user_id=1),
+        ChantierOuvrierModel(chantier_id=11, user_id=3),
+        ContactChantierModel(chantier_id=11, nom="B", telephone="02", ordre=1),
+        ContactChantierModel(chantier_id=11, nom="A", telephone="01", ordre=0),
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _compter_requetes(session):
+    requetes = []
+    event.listen(
+        session.get_bind(), "before_cursor_execute",
+        lambda conn, cursor, statement, *args: requetes.append(statement),
+    )
+    return requetes
+
+
+class TestRepositoryParLots:
+    """Tests des lectures par lots du repository."""
+
+    def test_find_all_nombre_de_requetes_constant(self, session):
+        """Test: conducteurs et chefs préchargés pour toute la page."""
+        repo = SQLAlchemyChantierRepository(session)
+        requetes = _compter_requetes(session)
+
+        chantiers = repo.find_all(skip=0, limit=100)
+
+        # Chantiers, conducteurs, chefs : indépendant du nombre de chantiers
+        assert len(requetes) == 3
+        by_id = {c.id: c for c in chantiers}
+        assert by_id[10].conducteur_ids == [1]
+        assert by_id[10].chef_chantier_ids == [3]
+        assert by_id[11].conducteur_ids == [2]
+        assert by_id[12].conducteur_ids == []
+
+    def test_list_ouvrier_ids_by_chantier(self, session):
+        """Test: ouvriers de plusieurs chantiers en une requête."""
+        repo = SQLAlchemyChantierRepository(session)
+        requetes = _compter_requetes(session)
+
+        assert repo.list_ouvrier_ids_by_chantier([10, 11, 12]) == {10: [2, 1], 11: [3]}
+        assert len(requetes) == 1
+        assert repo.list_ouvrier_ids_by_chantier([]) == {}
+
+    def test_list_contacts_by_chantier(self, session):
+        """Test: contacts de plusieurs chantiers, dans l'ordre d'affichage."""
+        repo = SQLAlchemyChantierRepository(session)
+
+        contacts = repo.list_contacts_by_chantier([10, 11])
+
+        assert list(contacts) == [11]
+        assert [c.nom for c in contacts[11]] == ["A", "B"]
+
+    def test_find_by_ids_utilisateurs(self, session):
+        """Test: utilisateurs chargés en une requête, supprimés exclus."""
+        session.get(UserModel, 2).deleted_at = datetime(2026, 1, 5)
+        session.commit()
+        repo = SQLAlchemyUserRepository(session)
+        requetes = _compter_requetes(session)
+
+        users = repo.find_by_ids([1, 2, 3, 99])
+
+        assert sorted(u.id for u in users) == [1, 3]
+        assert len(requetes) == 1
+        assert repo.find_by_ids([]) == []
+
+
+class TestListChantiersFields:
+    """Tests du paramètre fields de GET /chantiers."""
+
+    def _list(self, fields):
+        controller = Mock()
+        controller.list.return_value = {
+            "total": 1, "chantiers": [_chantier_dict(1, conducteur_ids=[1])],
+        }
+        self.user_repo = Mock()
+        db = Mock()
+        db.run_sync = AsyncMock(side_effect=lambda fn: fn(Mock()))
+        routes = "modules.chantiers.infrastructure.web.chantier_routes"
+        with patch(f"{routes}.build_chantier_controller", return_value=controller), \
+                patch(f"{routes}.get_user_repository", return_value=self.user_repo), \
+                patch(f"{routes}.get_chantier_repository", return_value=Mock()):
+            return asyncio.run(list_chantiers(
+                page=1, size=10, statut=None, search=None, exclude_special=True,
+                fields=fields, db=db, current_user_id=1,
+            ))
+
+    def test_reponse_partielle(self):
+        """Test: seuls les champs demandés (et l'id) sont retournés."""
+        response = self._list("code, nom")
+
+        body = json.loads(response.body)
+        assert body["items"] == [{"id": "1", "code": "A001", "nom": "Chantier 1"}]
+        assert body["total"] == 1
+        self.user_repo.find_by_ids.assert_not_called()
+
+    def test_champ_inconnu(self):
+        """Test: un champ inconnu est refusé (400)."""
+        with pytest.raises(HTTPException) as exc_info:
+            self._list("code,inconnu")
+
+        assert exc_info.value.status_code == 400
+        assert "inconnu" in exc_info.value.detail
@@ -127,7 +127,8 @@ class TestFindByConducteurOptimization:
         mock_query.order_by.return_value = mock_query
         mock_query.offset.return_value = mock_query
         mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = [chantier_model]
+        # Chantiers, puis préchargement des conducteurs et des chefs
+        mock_query.all.side_effect = [[chantier_model], [(1, 42)], []]
 
         # Act
         result = repository.find_by_conducteur(conducteur_id=42)
@@ -218,7 +219,8 @@ class TestFindByChefChantierOptimization:
         mock_query.order_by.return_value = mock_query
         mock_query.offset.return_value = mock_query
         mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = [chantier_model]
+        # Chantiers, puis préchargement des conducteurs et des chefs
+        mock_query.all.side_effect = [[chantier_model], [], [(2, 99)]]
 
         # Act
         result = repository.find_by_chef_chantier(chef_id=99)
@@ -269,7 +271,8 @@ class TestFindByResponsableOptimization:
         mock_query.order_by.return_value = mock_query
         mock_query.offset.return_value = mock_query
         mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = [chantier1, chantier2]
+        # Chantiers, puis préchargement des conducteurs et des chefs
+        mock_query.all.side_effect = [[chantier1, chantier2], [], []]
 
         # Act
         result = repository.find_by_responsable(user_id=7)
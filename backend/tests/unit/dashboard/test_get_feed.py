@@ -48,8 +48,8 @@ class TestGetFeedUseCase:
         """Test: récupération du feed réussie."""
         # Arrange
         self.mock_post_repo.find_feed.return_value = self.test_posts
-        self.mock_like_repo.count_by_post.return_value = 5
-        self.mock_comment_repo.count_by_post.return_value = 2
+        self.mock_like_repo.count_by_posts.return_value = {1: 5, 2: 0}
+        self.mock_comment_repo.count_by_posts.return_value = {1: 2}
 
         # Act
         result = self.use_case.execute(user_id=1, limit=20, offset=0)
@@ -59,6 +59,9 @@ class TestGetFeedUseCase:
         assert result.posts[0].id == 1
         assert result.posts[0].likes_count == 5
         assert result.posts[0].comments_count == 2
+        assert result.posts[1].likes_count == 0
+        assert result.posts[1].comments_count == 0
+        self.mock_like_repo.count_by_posts.assert_called_once_with([1, 2])
         assert result.offset == 0
         assert result.limit == 20
 
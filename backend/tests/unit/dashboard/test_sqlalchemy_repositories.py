@@ -177,6 +177,18 @@ class TestSQLAlchemyCommentRepository:
 
         assert result == 5
 
+    def test_count_by_posts(self):
+        """Test comptage commentaires de plusieurs posts en une requête."""
+        query_mock = Mock()
+        query_mock.filter.return_value = query_mock
+        query_mock.group_by.return_value = query_mock
+        query_mock.all.return_value = [(11, 3)]
+        self.session.query.return_value = query_mock
+
+        result = self.repo.count_by_posts([10, 11])
+
+        assert result == {10: 0, 11: 3}
+
     def test_delete_success(self):
         """Test suppression commentaire réussie."""
         mock_model = self._create_mock_comment_model()
@@ -332,6 +344,24 @@ class TestSQLAlchemyLikeRepository:
 
         assert result == 10
 
+    def test_count_by_posts(self):
+        """Test comptage likes de plusieurs posts en une requête."""
+        query_mock = Mock()
+        query_mock.filter.return_value = query_mock
+        query_mock.group_by.return_value = query_mock
+        query_mock.all.return_value = [(10, 4), (12, 1)]
+        self.session.query.return_value = query_mock
+
+        result = self.repo.count_by_posts([10, 11, 12])
+
+        assert result == {10: 4, 11: 0, 12: 1}
+        self.session.query.assert_called_once()
+
+    def test_count_by_posts_vide(self):
+        """Test comptage sans post: aucune requête."""
+        assert self.repo.count_by_posts([]) == {}
+        self.session.query.assert_not_called()
+
     def test_delete_success(self):
         """Test suppression like réussie."""
         mock_model = self._create_mock_like_model()
@@ -12,7 +12,10 @@ from unittest.mock import Mock
 from modules.devis.domain.entities.devis import Devis
 from modules.devis.domain.value_objects.statut_devis import StatutDevis
 from modules.devis.domain.repositories.devis_repository import DevisRepository
-from modules.devis.application.use_cases.dashboard_use_cases import GetDashboardDevisUseCase
+from modules.devis.application.use_cases.dashboard_use_cases import (
+    GetDashboardDevisUseCase,
+    GetTendancesPipelineDevisUseCase,
+)
 from modules.devis.application.dtos.dashboard_dtos import DashboardDevisDTO, KPIDevisDTO
 
 
@@ -34,6 +37,29 @@ def _make_devis(**kwargs):
     return Devis(**defaults)
 
 
+def _stats(counts=None, totaux=None):
+    """Construit le retour de stats_by_statut a partir de counts et totaux."""
+    counts = counts or {}
+    totaux = totaux or {}
+    return {
+        statut: (counts.get(statut, 0), totaux.get(statut, Decimal("0")))
+        for statut in set(counts) | set(totaux)
+    }
+
+
+def _resume(devis):
+    """Construit le resume retourne par find_recents_resume."""
+    return {
+        "id": devis.id,
+        "numero": devis.numero,
+        "client_nom": devis.client_nom,
+        "objet": devis.objet,
+        "statut": devis.statut.value,
+        "montant_total_ht": devis.montant_total_ht,
+        "date_creation": devis.date_creation,
+    }
+
+
 class TestGetDashboardDevisUseCase:
     """Tests pour le calcul du dashboard KPI."""
 
@@ -45,9 +71,11 @@ class TestGetDashboardDevisUseCase:
 
     def test_dashboard_empty(self):
         """Test: dashboard avec aucun devis."""
-        self.mock_devis_repo.count_by_statut.return_value = {}
-        self.mock_devis_repo.somme_montant_by_statut.return_value = {}
-        self.mock_devis_repo.find_all.return_value = []
+        self.mock_devis_repo.stats_by_statut.return_value = _stats(
+            counts={},
+            totaux={},
+        )
+        self.mock_devis_repo.find_recents_resume.return_value = []
 
         result = self.use_case.execute()
 
@@ -59,7 +87,8 @@ class TestGetDashboardDevisUseCase:
 
     def test_dashboard_with_data(self):
         """Test: dashboard avec des donnees reelles."""
-        self.mock_devis_repo.count_by_statut.return_value = {
+        self.mock_devis_repo.stats_by_statut.return_value = _stats(
+            counts={
             "brouillon": 5,
             "en_validation": 2,
             "envoye": 3,
@@ -69,8 +98,8 @@ class TestGetDashboardDevisUseCase:
             "refuse": 3,
             "perdu": 2,
             "expire": 1,
-        }
-        self.mock_devis_repo.somme_montant_by_statut.return_value = {
+        },
+            totaux={
             "brouillon": Decimal("100000"),
             "en_validation": Decimal("50000"),
             "envoye": Decimal("150000"),
@@ -78,9 +107,10 @@ class TestGetDashboardDevisUseCase:
             "en_negociation": Decimal("80000"),
             "accepte": Decimal("500000"),
             "refuse": Decimal("75000"),
-        }
-        self.mock_devis_repo.find_all.return_value = [
-            _make_devis(id=i, numero=f"DEV-{i:03d}") for i in range(1, 4)
+        },
+        )
+        self.mock_devis_repo.find_recents_resume.return_value = [
+            _resume(_make_devis(id=i, numero=f"DEV-{i:03d}")) for i in range(1, 4)
         ]
 
         result = self.use_case.execute()
@@ -99,15 +129,17 @@ class TestGetDashboardDevisUseCase:
     def test_dashboard_taux_conversion(self):
         """Test: calcul du taux de conversion."""
         # 10 acceptes / (10 + 3 + 2) = 10/15 = 66.67%
-        self.mock_devis_repo.count_by_statut.return_value = {
+        self.mock_devis_repo.stats_by_statut.return_value = _stats(
+            counts={
             "accepte": 10,
             "refuse": 3,
             "perdu": 2,
-        }
-        self.mock_devis_repo.somme_montant_by_statut.return_value = {
+        },
+            totaux={
             "accepte": Decimal("500000"),
-        }
-        self.mock_devis_repo.find_all.return_value = []
+        },
+        )
+        self.mock_devis_repo.find_recents_resume.return_value = []
 
         result = self.use_case.execute()
 
@@ -115,12 +147,14 @@ class TestGetDashboardDevisUseCase:
 
     def test_dashboard_taux_conversion_zero_decides(self):
         """Test: taux conversion = 0 si aucun devis decide."""
-        self.mock_devis_repo.count_by_statut.return_value = {
+        self.mock_devis_repo.stats_by_statut.return_value = _stats(
+            counts={
             "brouillon": 5,
             "envoye": 3,
-        }
-        self.mock_devis_repo.somme_montant_by_statut.return_value = {}
-        self.mock_devis_repo.find_all.return_value = []
+        },
+            totaux={},
+        )
+        self.mock_devis_repo.find_recents_resume.return_value = []
 
         result = self.use_case.execute()
 
@@ -128,14 +162,16 @@ class TestGetDashboardDevisUseCase:
 
     def test_dashboard_pipeline_ht(self):
         """Test: calcul du total pipeline HT."""
-        self.mock_devis_repo.count_by_statut.return_value = {}
-        self.mock_devis_repo.somme_montant_by_statut.return_value = {
+        self.mock_devis_repo.stats_by_statut.return_value = _stats(
+            counts={},
+            totaux={
             "en_validation": Decimal("50000"),
             "envoye": Decimal("150000"),
             "vu": Decimal("30000"),
             "en_negociation": Decimal("80000"),
-        }
-        self.mock_devis_repo.find_all.return_value = []
+        },
+        )
+        self.mock_devis_repo.find_recents_resume.return_value = []
 
         result = self.use_case.execute()
 
@@ -144,11 +180,13 @@ class TestGetDashboardDevisUseCase:
 
     def test_dashboard_total_accepte(self):
         """Test: calcul du total accepte HT."""
-        self.mock_devis_repo.count_by_statut.return_value = {}
-        self.mock_devis_repo.somme_montant_by_statut.return_value = {
+        self.mock_devis_repo.stats_by_statut.return_value = _stats(
+            counts={},
+            totaux={
             "accepte": Decimal("500000"),
-        }
-        self.mock_devis_repo.find_all.return_value = []
+        },
+        )
+        self.mock_devis_repo.find_recents_resume.return_value = []
 
         result = self.use_case.execute()
 
@@ -157,25 +195,99 @@ class TestGetDashboardDevisUseCase:
     def test_dashboard_derniers_devis(self):
         """Test: les 10 derniers devis sont retournes."""
         devis_list = [_make_devis(id=i, numero=f"DEV-{i:03d}") for i in range(1, 6)]
-        self.mock_devis_repo.count_by_statut.return_value = {}
-        self.mock_devis_repo.somme_montant_by_statut.return_value = {}
-        self.mock_devis_repo.find_all.return_value = devis_list
+        self.mock_devis_repo.stats_by_statut.return_value = _stats(
+            counts={},
+            totaux={},
+        )
+        self.mock_devis_repo.find_recents_resume.return_value = [
+            _resume(d) for d in devis_list
+        ]
 
         result = self.use_case.execute()
 
         assert len(result.derniers_devis) == 5
-        self.mock_devis_repo.find_all.assert_called_once_with(limit=10, offset=0)
+        assert result.derniers_devis[0].date_creation == "2026-01-15"
+        self.mock_devis_repo.find_recents_resume.assert_called_once_with(limit=10)
+        self.mock_devis_repo.find_all.assert_not_called()
+
+    def test_dashboard_une_seule_requete_agregee(self):
+        """Test: les KPI viennent d'une seule requete groupee."""
+        self.mock_devis_repo.stats_by_statut.return_value = {}
+        self.mock_devis_repo.find_recents_resume.return_value = []
+
+        self.use_case.execute()
+
+        self.mock_devis_repo.stats_by_statut.assert_called_once_with()
+        self.mock_devis_repo.count_by_statut.assert_not_called()
+        self.mock_devis_repo.somme_montant_by_statut.assert_not_called()
 
     def test_dashboard_taux_conversion_100_percent(self):
         """Test: taux de conversion 100% (tous acceptes)."""
-        self.mock_devis_repo.count_by_statut.return_value = {
+        self.mock_devis_repo.stats_by_statut.return_value = _stats(
+            counts={
             "accepte": 5,
-        }
-        self.mock_devis_repo.somme_montant_by_statut.return_value = {
+        },
+            totaux={
             "accepte": Decimal("250000"),
-        }
-        self.mock_devis_repo.find_all.return_value = []
+        },
+        )
+        self.mock_devis_repo.find_recents_resume.return_value = []
 
         result = self.use_case.execute()
 
         assert result.kpi.taux_conversion == "100.00"
+
+
+class TestGetTendancesPipelineDevisUseCase:
+    """Tests pour les tendances du pipeline par periode."""
+
+    def setup_method(self):
+        self.mock_devis_repo = Mock(spec=DevisRepository)
+        self.use_case = GetTendancesPipelineDevisUseCase(
+            devis_repository=self.mock_devis_repo,
+        )
+        self.mock_devis_repo.stats_by_mois_et_statut.return_value = [
+            {"annee": 2026, "mois": 2, "statut": "accepte", "count": 2, "somme_montant_ht": Decimal("80000")},
+            {"annee": 2026, "mois": 1, "statut": "accepte", "count": 1, "somme_montant_ht": Decimal("50000")},
+            {"annee": 2026, "mois": 1, "statut": "refuse", "count": 1, "somme_montant_ht": Decimal("20000")},
+            {"annee": 2026, "mois": 1, "statut": "envoye", "count": 3, "somme_montant_ht": Decimal("90000")},
+            {"annee": 2026, "mois": 4, "statut": "perdu", "count": 1, "somme_montant_ht": Decimal("10000")},
+        ]
+
+    def test_tendances_par_mois(self):
+        """Test: une periode par mois, triee chronologiquement."""
+        result = self.use_case.execute()
+
+        assert [p.periode for p in result.periodes] == ["2026-01", "2026-02", "2026-04"]
+        janvier = result.periodes[0]
+        assert janvier.nb_crees == 5
+        assert janvier.montant_cree_ht == "160000"
+        assert janvier.nb_pipeline == 3
+        assert janvier.montant_pipeline_ht == "90000"
+        assert janvier.nb_accepte == 1
+        assert janvier.taux_conversion == "50.00"
+
+    def test_tendances_par_trimestre(self):
+        """Test: regroupement des mois par trimestre."""
+        result = self.use_case.execute(granularite="trimestre")
+
+        assert [p.periode for p in result.periodes] == ["2026-T1", "2026-T2"]
+        t1 = result.periodes[0]
+        assert t1.nb_crees == 7
+        assert t1.nb_accepte == 3
+        assert t1.montant_accepte_ht == "130000"
+        assert t1.taux_conversion == "75.00"
+        assert result.periodes[1].taux_conversion == "0.00"
+
+    def test_tendances_filtre_dates_transmis(self):
+        """Test: les bornes de dates sont transmises au repository."""
+        self.use_case.execute(date_min=date(2026, 1, 1), date_max=date(2026, 3, 31))
+
+        self.mock_devis_repo.stats_by_mois_et_statut.assert_called_once_with(
+            date_min=date(2026, 1, 1), date_max=date(2026, 3, 31)
+        )
+
+    def test_tendances_granularite_invalide(self):
+        """Test: granularite inconnue rejetee."""
+        with pytest.raises(ValueError, match="Granularite invalide"):
+            self.use_case.execute(granularite="semaine")
@@ -268,14 +268,43 @@ class TestGetDevisUseCase:
 
         self.mock_devis_repo.find_by_id.return_value = devis
         self.mock_lot_repo.find_by_devis.return_value = [lot]
-        self.mock_ligne_repo.find_by_lot.return_value = [ligne]
-        self.mock_debourse_repo.find_by_ligne.return_value = [debourse]
+        self.mock_ligne_repo.find_by_devis.return_value = [ligne]
+        self.mock_debourse_repo.find_by_lignes.return_value = [debourse]
 
         result = self.use_case.execute(devis_id=1)
 
         assert len(result.lots) == 1
         assert len(result.lots[0].lignes) == 1
         assert len(result.lots[0].lignes[0].debourses) == 1
+        self.mock_debourse_repo.find_by_lignes.assert_called_once_with([100])
+
+    def test_get_devis_regroupe_lignes_par_lot(self):
+        """Test: lignes et debourses charges une fois pour tout le devis."""
+        devis = _make_devis()
+        lots = [
+            LotDevis(id=10, devis_id=1, code_lot="LOT-001", libelle="Gros oeuvre"),
+            LotDevis(id=20, devis_id=1, code_lot="LOT-002", libelle="Second oeuvre"),
+        ]
+        lignes = [
+            LigneDevis(id=100, lot_devis_id=10, libelle="Beton", quantite=Decimal("1"), prix_unitaire_ht=Decimal("50")),
+            LigneDevis(id=200, lot_devis_id=20, libelle="Platre", quantite=Decimal("1"), prix_unitaire_ht=Decimal("20")),
+            LigneDevis(id=201, lot_devis_id=20, libelle="Peinture", quantite=Decimal("1"), prix_unitaire_ht=Decimal("30")),
+        ]
+        debourses = [
+            DebourseDetail(id=1, ligne_devis_id=201, libelle="Pot", quantite=Decimal("2"), prix_unitaire=Decimal("9")),
+            DebourseDetail(id=2, ligne_devis_id=100, libelle="Ciment", quantite=Decimal("5"), prix_unitaire=Decimal("12")),
+        ]
+        self.mock_devis_repo.find_by_id.return_value = devis
+        self.mock_lot_repo.find_by_devis.return_value = lots
+        self.mock_ligne_repo.find_by_devis.return_value = lignes
+        self.mock_debourse_repo.find_by_lignes.return_value = debourses
+
+        result = self.use_case.execute(devis_id=1)
+
+        assert [len(lot.lignes) for lot in result.lots] == [1, 2]
+        assert [len(ligne.debourses) for ligne in result.lots[1].lignes] == [0, 1]
+        self.mock_ligne_repo.find_by_lot.assert_not_called()
+        self.mock_debourse_repo.find_by_ligne.assert_not_called()
 
 
 class TestListDevisUseCase:
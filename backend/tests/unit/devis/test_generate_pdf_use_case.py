@@ -4,7 +4,7 @@ DEV-12: Generation PDF devis client.
 """
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from modules.devis.application.use_cases.generate_pdf_use_case import (
     GenerateDevisPDFUseCase,
@@ -215,3 +215,80 @@ class TestGenerateDevisPDFUseCase:
         # qui est responsable de ne pas afficher les debourses/marges dans le PDF.
         # On verifie simplement que l'appel est correct.
         pdf_gen.generate.assert_called_once()
+
+
+class TestGenerateDevisPDFAsync:
+    """Tests de la generation PDF depuis une route async."""
+
+    @pytest.mark.asyncio
+    async def test_execute_async_attend_le_generateur(self):
+        """Test: le rendu est attendu via generate_async."""
+        use_case, get_devis_uc, pdf_gen = _make_use_case()
+        devis_detail = _make_devis_detail_dto()
+        get_devis_uc.execute.return_value = devis_detail
+        pdf_gen.generate_async = AsyncMock(return_value=b"%PDF-async")
+
+        pdf_bytes, filename = await use_case.execute_async(1)
+
+        assert pdf_bytes == b"%PDF-async"
+        assert filename == f"{devis_detail.numero}.pdf"
+        pdf_gen.generate_async.assert_awaited_once_with(devis_detail)
+        pdf_gen.generate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_async_erreur_generation(self):
+        """Test: une erreur de rendu leve GenerateDevisPDFError."""
+        use_case, get_devis_uc, pdf_gen = _make_use_case()
+        get_devis_uc.execute.return_value = _make_devis_detail_dto()
+        pdf_gen.generate_async = AsyncMock(side_effect=TimeoutError("rendu trop long"))
+
+        with pytest.raises(GenerateDevisPDFError):
+            await use_case.execute_async(1)
+
+
+class TestPrerenderDevisPDF:
+    """Tests du pre-rendu et du generateur PDF avec cache."""
+
+    def test_prerender_delegue_au_generateur(self):
+        """Test: prerender transmet le DTO complet au generateur."""
+        use_case, get_devis_uc, pdf_gen = _make_use_case()
+        devis_detail = _make_devis_detail_dto()
+        get_devis_uc.execute.return_value = devis_detail
+
+        use_case.prerender(1)
+
+        pdf_gen.prerender.assert_called_once_with(devis_detail)
+        pdf_gen.generate.assert_not_called()
+
+    def test_generateur_cache_sert_le_pdf_depuis_le_disque(self, tmp_path):
+        """Test: un second telechargement du meme devis ne refait pas le rendu."""
+        from unittest.mock import patch
+
+        from modules.devis.infrastructure.pdf import CachedDevisPDFGenerator
+        from shared.infrastructure.pdf import PdfRenderCache
+
+        cache = PdfRenderCache(tmp_path, max_workers=0)
+        generator = CachedDevisPDFGenerator(cache)
+        devis = _make_devis_detail_dto()
+
+        with patch(
+            "modules.devis.infrastructure.pdf.cached_devis_pdf_generator.render_devis_pdf",
+            return_value=b"%PDF-devis",
+        ) as render:
+            assert generator.generate(devis) == b"%PDF-devis"
+            assert generator.generate(_make_devis_detail_dto()) == b"%PDF-devis"
+            generator.generate(_make_devis_detail_dto(objet="Extension garage"))
+
+        assert render.call_count == 2
+        assert cache.hits == 1
+
+    def test_render_devis_pdf_produit_un_pdf(self):
+        """Test: la fonction de rendu du pool produit un vrai PDF."""
+        from modules.devis.infrastructure.pdf.cached_devis_pdf_generator import (
+            render_devis_pdf,
+        )
+
+        pdf_bytes = render_devis_pdf(_make_devis_detail_dto())
+
+        assert isinstance(pdf_bytes, bytes)
+        assert pdf_bytes.startswith(b"%PDF")
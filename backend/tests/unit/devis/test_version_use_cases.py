@@ -94,7 +94,7 @@ class TestCreerRevisionUseCase:
         self.mock_devis_repo.find_by_id.return_value = devis_source
         self.mock_devis_repo.get_next_version_number.return_value = 2
         self.mock_devis_repo.save.return_value = nouveau_devis
-        self.mock_lot_repo.find_by_devis.return_value = []
+        self.mock_lot_repo.copier_arborescence.return_value = {}
         self.mock_journal_repo.save.return_value = Mock()
 
         dto = CreerRevisionDTO(commentaire="Revision apres negociation")
@@ -104,6 +104,28 @@ class TestCreerRevisionUseCase:
         assert self.mock_devis_repo.save.called
         assert self.mock_journal_repo.save.called
 
+    def test_creer_revision_copie_arborescence_en_masse(self):
+        """Test: lots, lignes et debourses copies en un appel au repository."""
+        devis_source = _make_devis(id=1, version_figee=True)
+        nouveau_devis = _make_devis(
+            id=2, numero="DEV-2026-001-R2", devis_parent_id=1,
+            numero_version=2, type_version=TypeVersion.REVISION,
+        )
+        self.mock_devis_repo.find_by_id.return_value = devis_source
+        self.mock_devis_repo.get_next_version_number.return_value = 2
+        self.mock_devis_repo.save.return_value = nouveau_devis
+        self.mock_lot_repo.copier_arborescence.return_value = {10: 20}
+        self.mock_journal_repo.save.return_value = Mock()
+
+        self.use_case.execute(devis_id=1, dto=CreerRevisionDTO(), created_by=7)
+
+        self.mock_lot_repo.copier_arborescence.assert_called_once_with(
+            1, 2, created_by=7
+        )
+        self.mock_lot_repo.save.assert_not_called()
+        self.mock_ligne_repo.save.assert_not_called()
+        self.mock_debourse_repo.save.assert_not_called()
+
     def test_creer_revision_not_found(self):
         """Test: erreur si devis source non trouve."""
         self.mock_devis_repo.find_by_id.return_value = None
@@ -326,7 +348,8 @@ class TestGenererComparatifUseCase:
         self.mock_devis_repo.find_by_id.side_effect = lambda did: (
             devis_source if did == 1 else devis_cible
         )
-        self.mock_lot_repo.find_by_devis.return_value = []
+        self.mock_lot_repo.find_all_by_devis.return_value = []
+        self.mock_ligne_repo.find_by_devis.return_value = []
         self.mock_comparatif_repo.save.return_value = comparatif
         self.mock_journal_repo.save.return_value = Mock()
 
@@ -339,6 +362,62 @@ class TestGenererComparatifUseCase:
         # Journal pour les deux devis
         assert self.mock_journal_repo.save.call_count == 2
 
+    def test_generer_comparatif_arborescence_chargee_en_masse(self):
+        """Test: matching sur les lignes chargees en une requete par devis."""
+        devis_source = _make_devis(id=1)
+        devis_cible = _make_devis(id=2, numero="DEV-2026-001-R2")
+
+        def _lot(lot_id, devis_id, libelle, parent_id=None):
+            return LotDevis(
+                id=lot_id, devis_id=devis_id, code_lot=str(lot_id),
+                libelle=libelle, parent_id=parent_id,
+            )
+
+        def _ligne(ligne_id, lot_id, libelle, quantite, article_id=None):
+            return LigneDevis(
+                id=ligne_id, lot_devis_id=lot_id, libelle=libelle,
+                quantite=Decimal(quantite), prix_unitaire_ht=Decimal("10"),
+                total_ht=Decimal(quantite) * 10, article_id=article_id,
+            )
+
+        lots = {
+            1: [_lot(10, 1, "Gros oeuvre"), _lot(11, 1, "Fondations", parent_id=10)],
+            2: [_lot(20, 2, "Gros oeuvre"), _lot(21, 2, "Fondations", parent_id=20)],
+        }
+        lignes = {
+            1: [
+                _ligne(100, 10, "Beton", "5"),
+                _ligne(101, 11, "Semelles", "2"),
+                _ligne(102, 10, "Parpaing", "1", article_id=7),
+            ],
+            2: [
+                _ligne(200, 20, "Beton", "5"),
+                _ligne(201, 21, "Semelles", "3"),
+                _ligne(202, 21, "Drainage", "1"),
+            ],
+        }
+        self.mock_devis_repo.find_by_id.side_effect = lambda did: (
+            devis_source if did == 1 else devis_cible
+        )
+        self.mock_lot_repo.find_all_by_devis.side_effect = lots.get
+        self.mock_ligne_repo.find_by_devis.side_effect = lignes.get
+        self.mock_comparatif_repo.save.side_effect = lambda c: c
+        self.mock_journal_repo.save.return_value = Mock()
+
+        self.use_case.execute(devis_source_id=1, devis_cible_id=2, genere_par=1)
+
+        comparatif = self.mock_comparatif_repo.save.call_args[0][0]
+        assert comparatif.nb_lignes_identiques == 1
+        assert comparatif.nb_lignes_modifiees == 1
+        assert comparatif.nb_lignes_supprimees == 1
+        assert comparatif.nb_lignes_ajoutees == 1
+        modifiee = next(
+            cl for cl in comparatif.lignes if cl.type_ecart == TypeEcart.MODIFICATION
+        )
+        assert modifiee.lot_titre == "Fondations"
+        assert self.mock_ligne_repo.find_by_devis.call_count == 2
+        self.mock_ligne_repo.find_by_lot.assert_not_called()
+
     def test_generer_comparatif_meme_devis(self):
         """Test: erreur si meme devis source et cible."""
         with pytest.raises(ValueError, match="differents"):
@@ -162,6 +162,31 @@ class TestSQLAlchemyDocumentRepository:
 
         assert result == 5
 
+    def test_count_by_chemin_stockage(self):
+        """Test comptage des documents partageant un fichier stocké."""
+        session = Mock()
+        session.query.return_value.filter_by.return_value.count.return_value = 2
+
+        repo = SQLAlchemyDocumentRepository(session)
+        result = repo.count_by_chemin_stockage("blobs/ab/cd/abcd.pdf")
+
+        assert result == 2
+        session.query.return_value.filter_by.assert_called_once_with(
+            chemin_stockage="blobs/ab/cd/abcd.pdf"
+        )
+
+    def test_get_stats_by_dossier(self):
+        """Test comptes et tailles par dossier en une requete groupee."""
+        session = Mock()
+        query = session.query.return_value.filter.return_value.group_by.return_value
+        query.all.return_value = [(3, 2, 5000), (4, 1, 200)]
+
+        repo = SQLAlchemyDocumentRepository(session)
+        result = repo.get_stats_by_dossier(2)
+
+        assert result == {3: (2, 5000), 4: (1, 200)}
+        session.query.assert_called_once()
+
     def test_count_by_chantier(self):
         """Test comptage documents par chantier."""
         session = Mock()
@@ -0,0 +1,447 @@
+"""Tests des uploads découpés et reprenables du module Documents (GED-06, GED-07)."""
+
+import hashlib
+import io
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from modules.documents.adapters.providers import LocalFileStorageService
+from modules.documents.domain.entities import Document, Dossier, UploadSession
+from modules.documents.domain.services import ChunkOffsetError
+from modules.documents.domain.value_objects import DossierType, TypeDocument
+from modules.documents.application.dtos import UploadInitDTO
+from modules.documents.application.use_cases.document_use_cases import (
+    DeleteDocumentUseCase,
+    PurgeOrphanBlobsUseCase,
+    FileTooLargeError,
+    InvalidFileTypeError,
+)
+from modules.documents.application.use_cases.dossier_use_cases import DossierNotFoundError
+from modules.documents.application.use_cases.upload_use_cases import (
+    AbortUploadUseCase,
+    AppendUploadChunkUseCase,
+    FinalizeUploadUseCase,
+    GetUploadStatusUseCase,
+    InitUploadUseCase,
+    PurgeExpiredUploadsUseCase,
+    UploadIncompleteError,
+    UploadOffsetMismatchError,
+    UploadSessionExpiredError,
+    UploadSessionNotFoundError,
+    UploadSizeExceededError,
+)
+
+
+def _session(**kwargs) -> UploadSession:
+    valeurs = dict(
+        chantier_id=1, dossier_id=2, uploaded_by=5, nom_original="plan.pdf",
+        taille=10, mime_type="application/pdf",
+    )
+    valeurs.update(kwargs)
+    return UploadSession(**valeurs)
+
+
+def _dossier() -> Dossier:
+    return Dossier(id=2, chantier_id=1, nom="Plans", type_dossier=DossierType.PLANS)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalFileStorageService(base_path=str(tmp_path))
+
+
+class TestUploadSession:
+    """Tests de l'entité UploadSession."""
+
+    def test_expiration_par_defaut(self):
+        session = _session()
+
+        assert session.expires_at == session.created_at + timedelta(hours=24)
+        assert not session.est_expiree()
+        assert session.est_expiree(session.expires_at)
+
+    def test_taille_negative(self):
+        with pytest.raises(ValueError):
+            _session(taille=-1)
+
+    def test_id_hexadecimal(self):
+        assert len(_session().id) == 32
+
+
+class TestInitUploadUseCase:
+    """Tests pour InitUploadUseCase."""
+
+    def _dto(self, **kwargs):
+        valeurs = dict(
+            chantier_id=1, dossier_id=2, nom_original="plan.pdf", taille=3_000_000_000,
+            mime_type="application/pdf",
+        )
+        valeurs.update(kwargs)
+        return UploadInitDTO(**valeurs)
+
+    def test_ouverture(self):
+        dossier_repo = Mock()
+        dossier_repo.find_by_id.return_value = _dossier()
+        session_repo = Mock()
+        session_repo.save.side_effect = lambda s: s
+
+        result = InitUploadUseCase(dossier_repo, session_repo).execute(self._dto(), uploaded_by=5)
+
+        assert result.offset == 0
+        assert result.taille == 3_000_000_000
+        assert not result.complet
+        assert session_repo.save.call_args[0][0].uploaded_by == 5
+
+    def test_dossier_d_un_autre_chantier(self):
+        dossier_repo = Mock()
+        dossier_repo.find_by_id.return_value = _dossier()
+
+        with pytest.raises(DossierNotFoundError):
+            InitUploadUseCase(dossier_repo, Mock()).execute(self._dto(chantier_id=9), 5)
+
+    def test_type_refuse_avant_envoi(self):
+        with pytest.raises(InvalidFileTypeError):
+            InitUploadUseCase(Mock(), Mock()).execute(
+                self._dto(nom_original="virus.exe", mime_type="application/x-msdownload"), 5
+            )
+
+    def test_taille_refusee_avant_envoi(self):
+        with pytest.raises(FileTooLargeError):
+            InitUploadUseCase(Mock(), Mock()).execute(self._dto(taille=11 * 1024 ** 3), 5)
+
+
+class TestAppendUploadChunkUseCase:
+    """Tests pour AppendUploadChunkUseCase."""
+
+    def _use_case(self, session, offset=0):
+        session_repo = Mock()
+        session_repo.find_by_id.return_value = session
+        storage = Mock()
+        storage.get_upload_offset.return_value = offset
+        storage.append_chunk.side_effect = lambda _id, debut, data: debut + len(data)
+        return AppendUploadChunkUseCase(session_repo, storage), storage
+
+    def test_ajout(self):
+        session = _session()
+        use_case, storage = self._use_case(session, offset=4)
+
+        result = use_case.execute(session.id, 4, b"abcdef", user_id=5)
+
+        assert result.offset == 10
+        assert result.complet
+        storage.append_chunk.assert_called_once_with(session.id, 4, b"abcdef")
+
+    def test_offset_incorrect_renvoie_l_offset_de_reprise(self):
+        session = _session()
+        use_case, storage = self._use_case(session, offset=4)
+
+        with pytest.raises(UploadOffsetMismatchError) as exc:
+            use_case.execute(session.id, 0, b"abcd", user_id=5)
+
+        assert exc.value.offset == 4
+        storage.append_chunk.assert_not_called()
+
+    def test_morceau_concurrent_refuse_par_le_stockage(self):
+        session = _session()
+        use_case, storage = self._use_case(session, offset=0)
+        storage.append_chunk.side_effect = ChunkOffsetError(4)
+
+        with pytest.raises(UploadOffsetMismatchError) as exc:
+            use_case.execute(session.id, 0, b"abcd", user_id=5)
+
+        assert exc.value.offset == 4
+
+    def test_depassement_de_la_taille_annoncee(self):
+        session = _session()
+        use_case, _ = self._use_case(session, offset=8)
+
+        with pytest.raises(UploadSizeExceededError):
+            use_case.execute(session.id, 8, b"abc", user_id=5)
+
+    def test_session_d_un_autre_utilisateur(self):
+        session = _session()
+        use_case, _ = self._use_case(session)
+
+        with pytest.raises(UploadSessionNotFoundError):
+            use_case.execute(session.id, 0, b"a", user_id=6)
+
+    def test_session_expiree(self):
+        session = _session(expires_at=datetime.now() - timedelta(seconds=1))
+        use_case, _ = self._use_case(session)
+
+        with pytest.raises(UploadSessionExpiredError):
+            use_case.execute(session.id, 0, b"a", user_id=5)
+
+
+class TestGetUploadStatusUseCase:
+    """Tests pour GetUploadStatusUseCase."""
+
+    def test_offset_de_reprise(self):
+        session = _session()
+        session_repo = Mock()
+        session_repo.find_by_id.return_value = session
+        storage = Mock()
+        storage.get_upload_offset.return_value = 6
+
+        result = GetUploadStatusUseCase(session_repo, storage).execute(session.id, 5)
+
+        assert result.offset == 6
+        assert not result.complet
+
+    def test_session_inconnue(self):
+        session_repo = Mock()
+        session_repo.find_by_id.return_value = None
+
+        with pytest.raises(UploadSessionNotFoundError):
+            GetUploadStatusUseCase(session_repo, Mock()).execute("0" * 32, 5)
+
+
+class TestFinalizeUploadUseCase:
+    """Tests pour FinalizeUploadUseCase."""
+
+    def _use_case(self, session, recu, references=1):
+        document_repo = Mock()
+        document_repo.exists_by_nom_in_dossier.return_value = False
+        document_repo.save.side_effect = lambda d: d
+        document_repo.count_by_chemin_stockage.return_value = references
+        dossier_repo = Mock()
+        dossier_repo.find_by_id.return_value = _dossier()
+        session_repo = Mock()
+        session_repo.find_by_id.return_value = session
+        storage = Mock()
+        storage.get_upload_offset.return_value = recu
+        storage.finalize_upload.return_value = ("blobs/ab/cd/abcd.pdf", "abcd")
+        use_case = FinalizeUploadUseCase(document_repo, dossier_repo, session_repo, storage)
+        return use_case, document_repo, session_repo, storage
+
+    def test_creation_du_document(self):
+        session = _session(description="RDC")
+        use_case, document_repo, session_repo, storage = self._use_case(session, recu=10)
+
+        result = use_case.execute(session.id, 5)
+
+        document = document_repo.save.call_args[0][0]
+        assert document.contenu_hash == "abcd"
+        assert document.chemin_stockage == "blobs/ab/cd/abcd.pdf"
+        assert document.type_document == TypeDocument.PDF
+        assert result.description == "RDC"
+        storage.finalize_upload.assert_called_once_with(session.id, "pdf")
+        session_repo.delete.assert_called_once_with(session.id)
+        storage.generate_webp_thumbnails.assert_called_once_with("blobs/ab/cd/abcd.pdf")
+
+    def test_contenu_deja_stocke_sans_nouvelles_miniatures(self):
+        session = _session()
+        use_case, _, _, storage = self._use_case(session, recu=10, references=2)
+
+        use_case.execute(session.id, 5)
+
+        storage.generate_webp_thumbnails.assert_not_called()
+
+    def test_upload_incomplet(self):
+        session = _session()
+        use_case, document_repo, _, storage = self._use_case(session, recu=7)
+
+        with pytest.raises(UploadIncompleteError):
+            use_case.execute(session.id, 5)
+
+        storage.finalize_upload.assert_not_called()
+        document_repo.save.assert_not_called()
+
+    def test_fichier_vide(self):
+        session = _session(taille=0)
+        use_case, _, _, storage = self._use_case(session, recu=0)
+
+        use_case.execute(session.id, 5)
+
+        storage.append_chunk.assert_called_once_with(session.id, 0, b"")
+
+
+class TestAbortEtPurge:
+    """Tests pour AbortUploadUseCase et PurgeExpiredUploadsUseCase."""
+
+    def test_abandon_d_une_session_expiree(self):
+        session = _session(expires_at=datetime.now() - timedelta(hours=1))
+        session_repo = Mock()
+        session_repo.find_by_id.return_value = session
+        storage = Mock()
+
+        AbortUploadUseCase(session_repo, storage).execute(session.id, 5)
+
+        storage.abort_upload.assert_called_once_with(session.id)
+        session_repo.delete.assert_called_once_with(session.id)
+
+    def test_purge(self):
+        sessions = [_session(), _session()]
+        session_repo = Mock()
+        session_repo.find_expired.return_value = sessions
+        storage = Mock()
+
+        nb = PurgeExpiredUploadsUseCase(session_repo, storage).execute()
+
+        assert nb == 2
+        assert storage.abort_upload.call_count == 2
+        assert session_repo.delete.call_count == 2
+
+
+class TestLocalFileStorageChunks:
+    """Tests du stockage local des uploads découpés."""
+
+    def test_reprise_et_empreinte(self, storage):
+        upload_id = _session().id
+
+        assert storage.get_upload_offset(upload_id) == 0
+        assert storage.append_chunk(upload_id, 0, b"hello ") == 6
+        assert storage.get_upload_offset(upload_id) == 6
+        assert storage.append_chunk(upload_id, 6, b"world") == 11
+
+        chemin, empreinte = storage.finalize_upload(upload_id, ".PDF")
+
+        assert empreinte == hashlib.sha256(b"hello world").hexdigest()
+        assert chemin.endswith(f"{empreinte}.pdf")
+        assert storage.get(chemin).read() == b"hello world"
+        assert storage.get_upload_offset(upload_id) == 0
+
+    def test_morceau_rejoue_ecrit_une_seule_fois(self, storage):
+        upload_id = _session().id
+        storage.append_chunk(upload_id, 0, b"abc")
+
+        with pytest.raises(ChunkOffsetError) as exc:
+            storage.append_chunk(upload_id, 0, b"abc")
+
+        assert exc.value.offset == 3
+        assert storage.append_chunk(upload_id, 3, b"def") == 6
+        _, empreinte = storage.finalize_upload(upload_id, "pdf")
+        assert empreinte == hashlib.sha256(b"abcdef").hexdigest()
+
+    def test_morceaux_paralleles_au_meme_offset(self, storage):
+        upload_id = _session().id
+        depart = threading.Barrier(8)
+        resultats = []
+
+        def envoyer():
+            depart.wait()
+            try:
+                resultats.append(storage.append_chunk(upload_id, 0, b"x" * 100_000))
+            except ChunkOffsetError as e:
+                resultats.append(e)
+
+        threads = [threading.Thread(target=envoyer) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert resultats.count(100_000) == 1
+        assert storage.get_upload_offset(upload_id) == 100_000
+
+    def test_empreinte_recalculee_apres_redemarrage(self, storage):
+        from modules.documents.adapters.providers import local_file_storage
+
+        upload_id = _session().id
+        storage.append_chunk(upload_id, 0, b"abc")
+        local_file_storage._upload_hashers.pop(upload_id)
+        storage.append_chunk(upload_id, 3, b"def")
+
+        _, empreinte = storage.finalize_upload(upload_id, "pdf")
+
+        assert empreinte == hashlib.sha256(b"abcdef").hexdigest()
+
+    def test_deduplication(self, storage):
+        premier, second = _session().id, _session().id
+        storage.append_chunk(premier, 0, b"plan")
+        storage.append_chunk(second, 0, b"plan")
+
+        chemin1, _ = storage.finalize_upload(premier, "pdf")
+        chemin2, _ = storage.finalize_upload(second, "pdf")
+
+        assert chemin1 == chemin2
+        assert storage.exists(chemin1)
+
+    def test_fichier_multipart_range_par_contenu(self, storage):
+        chemin1, empreinte = storage.save_by_content(io.BytesIO(b"plan"), "pdf")
+        chemin2, _ = storage.save_by_content(io.BytesIO(b"plan"), "pdf")
+
+        assert chemin1 == chemin2
+        assert empreinte == hashlib.sha256(b"plan").hexdigest()
+        assert storage.get(chemin1).read() == b"plan"
+        assert not list((storage._base_path / "incoming").iterdir())
+
+    def test_abandon(self, storage):
+        upload_id = _session().id
+        storage.append_chunk(upload_id, 0, b"abc")
+
+        storage.abort_upload(upload_id)
+
+        assert storage.get_upload_offset(upload_id) == 0
+
+    def test_identifiant_invalide(self, storage):
+        with pytest.raises(ValueError):
+            storage.append_chunk("../../etc/passwd", 0, b"x")
+
+
+class TestDeleteDocumentPartage:
+    """Suppression d'un document dont le contenu est partagé."""
+
+    def _document(self):
+        return Document(
+            id=1, chantier_id=1, dossier_id=1, nom="plan.pdf", nom_original="plan.pdf",
+            chemin_stockage="blobs/ab/cd/abcd.pdf", taille=4, mime_type="application/pdf",
+            uploaded_by=1, contenu_hash="abcd",
+        )
+
+    def test_contenu_partage_laisse_au_ramasse_miettes(self):
+        document_repo = Mock()
+        document_repo.find_by_id.return_value = self._document()
+        storage = Mock()
+
+        DeleteDocumentUseCase(document_repo, storage, Mock()).execute(1)
+
+        storage.delete.assert_not_called()
+        document_repo.delete.assert_called_once_with(1)
+
+
+class TestPurgeOrphanBlobsUseCase:
+    """Suppression des contenus plus référencés."""
+
+    def _vieillir(self, storage, chemin, heures=2):
+        import os
+
+        ancien = (datetime.now() - timedelta(hours=heures)).timestamp()
+        os.utime(storage.get_full_path(chemin), (ancien, ancien))
+
+    def test_seuls_les_contenus_orphelins_sont_supprimes(self, storage):
+        orphelin, _ = storage.save_by_content(io.BytesIO(b"ancien plan"), "pdf")
+        reference, _ = storage.save_by_content(io.BytesIO(b"plan actuel"), "pdf")
+        recent, _ = storage.save_by_content(io.BytesIO(b"plan du jour"), "pdf")
+        self._vieillir(storage, orphelin)
+        self._vieillir(storage, reference)
+        document_repo = Mock()
+        document_repo.count_by_chemin_stockage.side_effect = lambda c: int(c == reference)
+
+        nb = PurgeOrphanBlobsUseCase(document_repo, storage).execute()
+
+        assert nb == 1
+        assert not storage.exists(orphelin)
+        assert storage.exists(reference)
+        assert storage.exists(recent)
+
+    def test_contenu_refinalise_pendant_la_purge_conserve(self, storage):
+        chemin, _ = storage.save_by_content(io.BytesIO(b"plan"), "pdf")
+        self._vieillir(storage, chemin)
+        document_repo = Mock()
+
+        def recompte(c):
+            # Un upload identique est finalisé entre le comptage (document
+            # pas encore validé en base) et la suppression
+            storage.save_by_content(io.BytesIO(b"plan"), "pdf")
+            return 0
+
+        document_repo.count_by_chemin_stockage.side_effect = recompte
+
+        nb = PurgeOrphanBlobsUseCase(document_repo, storage).execute()
+
+        assert nb == 0
+        assert storage.get(chemin).read() == b"plan"
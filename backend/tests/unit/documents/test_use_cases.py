@@ -233,8 +233,10 @@ class TestGetArborescenceUseCase:
             Dossier(id=2, chantier_id=1, nom="Sous-dossier", parent_id=1, ordre=0),
         ]
         mock_dossier_repo.get_arborescence.return_value = dossiers
-        mock_document_repo.count_by_dossier.return_value = 3
-        mock_document_repo.get_total_size_by_chantier.return_value = 1024000
+        mock_document_repo.get_stats_by_dossier.return_value = {
+            1: (3, 1000000),
+            2: (3, 24000),
+        }
 
         use_case = GetArborescenceUseCase(
             dossier_repository=mock_dossier_repo,
@@ -245,9 +247,14 @@ class TestGetArborescenceUseCase:
 
         assert result.chantier_id == 1
         assert len(result.dossiers) == 1  # 1 dossier racine
-        # total_documents = sum of count_by_dossier for all folders (2 folders x 3 = 6)
+        # total_documents = somme des comptes de tous les dossiers (2 dossiers x 3 = 6)
         assert result.total_documents == 6
         assert result.total_taille == 1024000
+        assert result.dossiers[0].taille_documents == 1000000
+        assert result.dossiers[0].nombre_sous_dossiers == 1
+        # Une seule requete groupee, pas de comptage par dossier
+        mock_document_repo.get_stats_by_dossier.assert_called_once_with(1)
+        mock_document_repo.count_by_dossier.assert_not_called()
 
     def test_get_arborescence_nested(self):
         """Arborescence imbriquee."""
@@ -260,9 +267,7 @@ class TestGetArborescenceUseCase:
             Dossier(id=3, chantier_id=1, nom="Niveau 2", parent_id=2, ordre=0),
         ]
         mock_dossier_repo.get_arborescence.return_value = dossiers
-        mock_document_repo.count_by_dossier.return_value = 0
-        mock_document_repo.count_by_chantier.return_value = 0
-        mock_document_repo.get_total_size_by_chantier.return_value = 0
+        mock_document_repo.get_stats_by_dossier.return_value = {}
 
         use_case = GetArborescenceUseCase(
             dossier_repository=mock_dossier_repo,
@@ -275,6 +280,57 @@ class TestGetArborescenceUseCase:
         assert len(result.dossiers[0].children) == 1
         assert len(result.dossiers[0].children[0].children) == 1
 
+    def _use_case_arbre(self):
+        """Arbre: 1 -> (2 -> 4, 3), 5 ; un document par dossier."""
+        mock_dossier_repo = Mock()
+        mock_document_repo = Mock()
+        mock_dossier_repo.get_arborescence.return_value = [
+            Dossier(id=1, chantier_id=1, nom="Plans", parent_id=None, ordre=0),
+            Dossier(id=5, chantier_id=1, nom="Photos", parent_id=None, ordre=1),
+            Dossier(id=3, chantier_id=1, nom="Lot 2", parent_id=1, ordre=2),
+            Dossier(id=2, chantier_id=1, nom="Lot 1", parent_id=1, ordre=1),
+            Dossier(id=4, chantier_id=1, nom="Indices", parent_id=2, ordre=0),
+        ]
+        mock_document_repo.get_stats_by_dossier.return_value = {
+            i: (1, 100 * i) for i in range(1, 6)
+        }
+        return GetArborescenceUseCase(
+            dossier_repository=mock_dossier_repo,
+            document_repository=mock_document_repo,
+        )
+
+    def test_get_arborescence_tri_par_ordre(self):
+        """Enfants tries par ordre."""
+        result = self._use_case_arbre().execute(chantier_id=1)
+
+        assert [d.id for d in result.dossiers] == [1, 5]
+        assert [d.id for d in result.dossiers[0].children] == [2, 3]
+        assert result.total_documents == 5
+
+    def test_get_arborescence_sous_arbre(self):
+        """Sous-arbre seul, totaux limites au sous-arbre."""
+        result = self._use_case_arbre().execute(chantier_id=1, dossier_id=2)
+
+        assert [d.id for d in result.dossiers] == [2]
+        assert [d.id for d in result.dossiers[0].children] == [4]
+        assert result.total_documents == 2
+        assert result.total_taille == 600
+
+    def test_get_arborescence_profondeur(self):
+        """Profondeur limitee: enfants vides mais nombre de sous-dossiers conserve."""
+        result = self._use_case_arbre().execute(chantier_id=1, profondeur=2)
+
+        lot_1 = result.dossiers[0].children[0]
+        assert lot_1.children == []
+        assert lot_1.nombre_sous_dossiers == 1
+        # Les totaux couvrent tout l'arbre
+        assert result.total_documents == 5
+
+    def test_get_arborescence_sous_arbre_inconnu(self):
+        """Erreur si le dossier racine n'appartient pas au chantier."""
+        with pytest.raises(DossierNotFoundError):
+            self._use_case_arbre().execute(chantier_id=1, dossier_id=99)
+
 
 class TestUpdateDossierUseCase:
     """Tests pour UpdateDossierUseCase."""
@@ -467,7 +523,7 @@ class TestUploadDocumentUseCase:
 
         mock_dossier_repo.find_by_id.return_value = Dossier(id=1, chantier_id=1, nom="Plans")
         mock_document_repo.exists_by_nom_in_dossier.return_value = False
-        mock_file_storage.save.return_value = "/storage/1/1/rapport.pdf"
+        mock_file_storage.save_by_content.return_value = ("/storage/1/1/rapport.pdf", "ab" * 32)
 
         def save_side_effect(doc):
             doc.id = 1
@@ -495,6 +551,8 @@ class TestUploadDocumentUseCase:
         assert result.id == 1
         assert result.nom == "rapport.pdf"
         assert result.type_document == "pdf"
+        mock_file_storage.save_by_content.assert_called_once_with(file_content, "pdf")
+        assert mock_document_repo.save.call_args[0][0].contenu_hash == "ab" * 32
 
     def test_upload_document_file_too_large(self):
         """Erreur si fichier trop gros."""
@@ -580,7 +638,7 @@ class TestUploadDocumentUseCase:
 
         # Premier appel: existe, deuxieme: n'existe pas
         mock_document_repo.exists_by_nom_in_dossier.side_effect = [True, False]
-        mock_file_storage.save.return_value = "/storage/1/1/rapport_1.pdf"
+        mock_file_storage.save_by_content.return_value = ("/storage/1/1/rapport_1.pdf", "ab" * 32)
 
         def save_side_effect(doc):
             doc.id = 1
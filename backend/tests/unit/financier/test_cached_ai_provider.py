@@ -0,0 +1,205 @@
+"""Tests unitaires pour le cache des reponses IA.
+
+FIN-21: CachedAISuggestionProvider (empreinte, TTL, stale-while-revalidate,
+invalidation) teste hors-ligne avec le StubSuggestionProvider.
+"""
+
+import threading
+
+import pytest
+
+from modules.financier.infrastructure.ai.cached_provider import (
+    CachedAISuggestionProvider,
+    fingerprint_payload,
+)
+from modules.financier.infrastructure.ai.stub_provider import StubSuggestionProvider
+
+
+class FakeClock:
+    """Horloge controlable pour simuler l'ecoulement du temps."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _kpi(pct_engage: str = "50.00", chantier_id: int = 1) -> dict:
+    return {
+        "chantier_id": chantier_id,
+        "montant_revise": "200000.00",
+        "pct_engage": pct_engage,
+        "marge_budgetaire_pct": "12.00",
+    }
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def stub():
+    return StubSuggestionProvider()
+
+
+@pytest.fixture
+def cache(stub, clock):
+    provider = CachedAISuggestionProvider(
+        stub,
+        ttl_seconds=60,
+        stale_seconds=300,
+        attente_max_seconds=5,
+        clock=clock,
+    )
+    yield provider
+    provider.shutdown(wait=True)
+
+
+class TestFingerprint:
+    """Tests de l'empreinte canonique."""
+
+    def test_fingerprint_independant_de_l_ordre_des_cles(self):
+        a = {"x": "1", "y": "2"}
+        b = {"y": "2", "x": "1"}
+        assert fingerprint_payload("suggestions", a) == fingerprint_payload("suggestions", b)
+
+    def test_fingerprint_depend_des_valeurs_et_du_type(self):
+        base = fingerprint_payload("suggestions", {"x": "1"})
+        assert base != fingerprint_payload("suggestions", {"x": "2"})
+        assert base != fingerprint_payload("consolidation", {"x": "1"})
+
+
+class TestCachedSuggestions:
+    """Tests du cache des suggestions par chantier."""
+
+    def test_miss_puis_hit_sans_nouvel_appel(self, cache, stub):
+        first = cache.generate_suggestions(_kpi())
+        second = cache.generate_suggestions(_kpi())
+
+        assert first == second
+        assert len(first) >= 1
+        assert stub.nb_appels == 1
+        assert cache.misses == 1
+        assert cache.hits == 1
+
+    def test_stale_servi_et_rafraichi_en_arriere_plan(self, cache, stub, clock):
+        cache.generate_suggestions(_kpi())
+        clock.now += 120  # au-dela du TTL, dans la fenetre stale
+
+        result = cache.generate_suggestions(_kpi())
+        cache.shutdown(wait=True)
+
+        assert len(result) >= 1
+        assert cache.stale_hits == 1
+        assert stub.nb_appels == 2
+
+    def test_entree_expiree_au_dela_de_la_fenetre_stale(self, cache, stub, clock):
+        cache.generate_suggestions(_kpi())
+        clock.now += 1000
+
+        cache.generate_suggestions(_kpi())
+
+        assert cache.misses == 2
+        assert stub.nb_appels == 2
+
+    def test_invalidation_quand_les_kpi_changent(self, cache, stub):
+        cache.generate_suggestions(_kpi(pct_engage="50.00"))
+        result = cache.generate_suggestions(_kpi(pct_engage="120.00"))
+
+        assert result[0].severity == "CRITICAL"
+        assert stub.nb_appels == 2
+        # L'ancienne entree du chantier est supprimee
+        assert len(cache._entrees) == 1
+
+    def test_chantiers_distincts_ne_s_invalident_pas(self, cache):
+        cache.generate_suggestions(_kpi(chantier_id=1))
+        cache.generate_suggestions(_kpi(chantier_id=2))
+
+        assert len(cache._entrees) == 2
+
+    def test_miss_non_bloquant_retourne_vide(self, clock):
+        gate = threading.Event()
+
+        class SlowProvider(StubSuggestionProvider):
+            def generate_suggestions(self, kpi_data):
+                gate.wait(5)
+                return super().generate_suggestions(kpi_data)
+
+        slow = SlowProvider()
+        provider = CachedAISuggestionProvider(slow, attente_max_seconds=0, clock=clock)
+
+        assert provider.generate_suggestions(_kpi()) == []
+        # Un second appel pendant le calcul ne relance pas le provider
+        assert provider.generate_suggestions(_kpi()) == []
+
+        gate.set()
+        provider.shutdown(wait=True)
+
+        assert slow.nb_appels == 1
+        assert len(provider.generate_suggestions(_kpi())) >= 1
+
+    def test_reponse_vide_non_memorisee(self, clock):
+        class EmptyProvider(StubSuggestionProvider):
+            def generate_suggestions(self, kpi_data):
+                self.nb_appels += 1
+                return []
+
+        empty = EmptyProvider()
+        provider = CachedAISuggestionProvider(empty, clock=clock)
+
+        provider.generate_suggestions(_kpi())
+        provider.generate_suggestions(_kpi())
+        provider.shutdown(wait=True)
+
+        assert empty.nb_appels == 2
+
+    def test_erreur_provider_retourne_vide(self, clock):
+        class FailingProvider(StubSuggestionProvider):
+            def generate_suggestions(self, kpi_data):
+                raise RuntimeError("API down")
+
+        provider = CachedAISuggestionProvider(FailingProvider(), clock=clock)
+
+        assert provider.generate_suggestions(_kpi()) == []
+        provider.shutdown(wait=True)
+
+    def test_invalidate_vide_le_cache(self, cache, stub):
+        cache.generate_suggestions(_kpi())
+        assert cache.invalidate() == 1
+
+        cache.generate_suggestions(_kpi())
+        assert stub.nb_appels == 2
+
+
+class TestCachedConsolidation:
+    """Tests du cache de l'analyse consolidee."""
+
+    def _data(self, nb_depassement: int = 0) -> dict:
+        return {
+            "kpi_globaux": {
+                "nb_chantiers": 2,
+                "nb_chantiers_depassement": nb_depassement,
+                "marge_moyenne_pct": "8.0",
+            },
+            "chantiers": [{"chantier_id": 1}, {"chantier_id": 2}],
+            "top_rentables": [],
+            "top_derives": [],
+        }
+
+    def test_analyse_memorisee(self, cache, stub):
+        first = cache.generate_consolidated_analysis(self._data())
+        second = cache.generate_consolidated_analysis(self._data())
+
+        assert first["source"] == "stub"
+        assert first == second
+        assert stub.nb_appels == 1
+
+    def test_analyse_recalculee_si_kpi_modifies(self, cache, stub):
+        cache.generate_consolidated_analysis(self._data())
+        result = cache.generate_consolidated_analysis(self._data(nb_depassement=1))
+
+        assert stub.nb_appels == 2
+        assert result["alertes"] == ["1 chantier(s) en depassement"]
+        assert len(cache._entrees) == 1
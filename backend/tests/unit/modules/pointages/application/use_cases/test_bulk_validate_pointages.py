@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import date
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, patch
 
 from modules.pointages.application.use_cases.bulk_validate_pointages import (
     BulkValidatePointagesUseCase,
@@ -12,47 +12,54 @@ from modules.pointages.application.dtos.bulk_validate_dtos import (
     BulkValidatePointagesDTO,
 )
 from modules.pointages.domain.entities.pointage import Pointage
+from modules.pointages.domain.events import PointagesBulkValidatedEvent, PointageValide
 from modules.pointages.domain.value_objects import Duree, StatutPointage
 
 
+def _pointage(pointage_id, statut=StatutPointage.SOUMIS, date_pointage=date(2026, 2, 10),
+              utilisateur_id=7, chantier_id=1):
+    return Pointage(
+        id=pointage_id,
+        utilisateur_id=utilisateur_id,
+        chantier_id=chantier_id,
+        date_pointage=date_pointage,
+        heures_normales=Duree(7, 30),
+        heures_supplementaires=Duree(0, 0),
+        statut=statut,
+    )
+
+
 class TestBulkValidatePointagesUseCase:
     """Tests pour le use case de validation par lot."""
 
     def setup_method(self):
         """Configure les mocks pour chaque test."""
         self.pointage_repo = Mock()
+        # Le repository valide tous les IDs demandés
+        self.pointage_repo.bulk_validate.side_effect = lambda ids, *args: list(ids)
         self.event_bus = Mock()
         self.use_case = BulkValidatePointagesUseCase(
             pointage_repo=self.pointage_repo, event_bus=self.event_bus
         )
+        # Période de paie ouverte (voir TestBulkValidatePeriodeVerrouillee)
+        self._lock_patcher = patch(
+            "modules.pointages.application.use_cases.bulk_validate_pointages."
+            "PeriodePaie.is_locked",
+            return_value=False,
+        )
+        self.is_locked = self._lock_patcher.start()
+
+    def teardown_method(self):
+        self._lock_patcher.stop()
 
     def test_bulk_validate_success(self):
         """Test nominal: validation réussie de plusieurs pointages."""
         # Arrange
-        pointages = [
-            Pointage(
-                id=1,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 2, 10),
-                heures_normales=Duree(7, 30),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.SOUMIS,
-            ),
-            Pointage(
-                id=2,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 2, 11),
-                heures_normales=Duree(8, 0),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.SOUMIS,
-            ),
+        self.pointage_repo.find_by_ids.return_value = [
+            _pointage(1),
+            _pointage(2, date_pointage=date(2026, 2, 11), utilisateur_id=8, chantier_id=3),
         ]
 
-        self.pointage_repo.find_by_id.side_effect = pointages
-        self.pointage_repo.save.side_effect = pointages
-
         dto = BulkValidatePointagesDTO(pointage_ids=[1, 2], validateur_id=4)
 
         # Act
@@ -64,11 +71,31 @@ class TestBulkValidatePointagesUseCase:
         assert result.failure_count == 0
         assert result.validated == [1, 2]
         assert result.failed == []
-        assert self.pointage_repo.save.call_count == 2
-        assert self.event_bus.publish.call_count == 3  # 2 individuels + 1 bulk
+
+        # Une requête de chargement, une instruction de mise à jour
+        self.pointage_repo.find_by_ids.assert_called_once_with([1, 2])
+        self.pointage_repo.bulk_validate.assert_called_once()
+        ids, validateur_id, _, statuts_source = self.pointage_repo.bulk_validate.call_args.args
+        assert ids == [1, 2]
+        assert validateur_id == 4
+        assert statuts_source == [StatutPointage.SOUMIS]
+        self.pointage_repo.find_by_id.assert_not_called()
+        self.pointage_repo.save.assert_not_called()
+
+        # Un seul événement agrégé
+        self.event_bus.publish.assert_called_once()
+        event = self.event_bus.publish.call_args.args[0]
+        assert isinstance(event, PointagesBulkValidatedEvent)
+        assert event.pointage_ids == (1, 2)
+        assert event.pointages == (
+            PointageValide(1, 7, 1, date(2026, 2, 10)),
+            PointageValide(2, 8, 3, date(2026, 2, 11)),
+        )
+        assert event.chantier_ids == (1, 3)
+        assert event.utilisateur_ids == (7, 8)
 
     def test_bulk_validate_empty_list(self):
-        """Test: liste vide doit lever une erreur."""
+        """Test: erreur si liste vide."""
         # Arrange
         dto = BulkValidatePointagesDTO(pointage_ids=[], validateur_id=4)
 
@@ -80,20 +107,8 @@ class TestBulkValidatePointagesUseCase:
 
     def test_bulk_validate_partial_failure(self):
         """Test: validation partielle (certains pointages échouent)."""
-        # Arrange
-        pointage_valid = Pointage(
-            id=1,
-            utilisateur_id=7,
-            chantier_id=1,
-            date_pointage=date(2026, 2, 10),
-            heures_normales=Duree(7, 30),
-            heures_supplementaires=Duree(0, 0),
-            statut=StatutPointage.SOUMIS,
-        )
-
-        # Le pointage 2 n'existe pas
-        self.pointage_repo.find_by_id.side_effect = [pointage_valid, None]
-        self.pointage_repo.save.return_value = pointage_valid
+        # Arrange - Le pointage 2 n'existe pas
+        self.pointage_repo.find_by_ids.return_value = [_pointage(1)]
 
         dto = BulkValidatePointagesDTO(pointage_ids=[1, 2], validateur_id=4)
 
@@ -108,23 +123,31 @@ class TestBulkValidatePointagesUseCase:
         assert len(result.failed) == 1
         assert result.failed[0].pointage_id == 2
         assert "non trouvé" in result.failed[0].error
+        assert self.pointage_repo.bulk_validate.call_args.args[0] == [1]
 
-    def test_bulk_validate_periode_locked(self):
-        """Test: verrouillage mensuel empêche la validation."""
-        # Arrange
-        # Pointage de décembre 2025 (mois passé, donc verrouillé)
-        # Janvier 2026 étant le mois en cours, décembre 2025 est déjà verrouillé
-        pointage = Pointage(
-            id=1,
-            utilisateur_id=7,
-            chantier_id=1,
-            date_pointage=date(2025, 12, 5),  # Décembre 2025
-            heures_normales=Duree(7, 30),
-            heures_supplementaires=Duree(0, 0),
-            statut=StatutPointage.SOUMIS,
+        event = self.event_bus.publish.call_args.args[0]
+        assert event.success_count == 1
+        assert event.failure_count == 1
+
+    def test_bulk_validate_lock_checked_once_per_date(self):
+        """Test: le verrouillage est calculé une fois par date de pointage."""
+        self.pointage_repo.find_by_ids.return_value = [
+            _pointage(i, utilisateur_id=i) for i in range(1, 31)
+        ]
+
+        result = self.use_case.execute(
+            BulkValidatePointagesDTO(pointage_ids=list(range(1, 31)), validateur_id=4)
         )
 
-        self.pointage_repo.find_by_id.return_value = pointage
+        assert result.success_count == 30
+        self.is_locked.assert_called_once_with(date(2026, 2, 10))
+
+    def test_bulk_validate_invalid_status(self):
+        """Test: pointage avec statut incompatible (non SOUMIS)."""
+        # Arrange
+        self.pointage_repo.find_by_ids.return_value = [
+            _pointage(1, statut=StatutPointage.BROUILLON)
+        ]
 
         dto = BulkValidatePointagesDTO(pointage_ids=[1], validateur_id=4)
 
@@ -132,32 +155,87 @@ class TestBulkValidatePointagesUseCase:
         result = self.use_case.execute(dto)
 
         # Assert
-        # Le résultat devrait contenir une erreur de verrouillage
         assert result.success_count == 0
         assert result.failure_count == 1
-        assert "verrouillée" in result.failed[0].error.lower()
+        # Le message d'erreur devrait mentionner le statut incompatible
+        assert "brouillon" in result.failed[0].error.lower()
+        self.pointage_repo.bulk_validate.assert_not_called()
 
-    def test_bulk_validate_invalid_status(self):
-        """Test: pointage avec statut incompatible (non SOUMIS)."""
-        # Arrange
-        pointage = Pointage(
-            id=1,
-            utilisateur_id=7,
-            chantier_id=1,
-            date_pointage=date(2026, 2, 10),
-            heures_normales=Duree(7, 30),
-            heures_supplementaires=Duree(0, 0),
-            statut=StatutPointage.BROUILLON,  # Pas soumis
+    def test_bulk_validate_concurrent_status_change(self):
+        """Test: pointage modifié entre le chargement et la mise à jour."""
+        self.pointage_repo.find_by_ids.return_value = [_pointage(1), _pointage(2)]
+        self.pointage_repo.bulk_validate.side_effect = lambda ids, *args: [1]
+
+        result = self.use_case.execute(
+            BulkValidatePointagesDTO(pointage_ids=[1, 2], validateur_id=4)
+        )
+
+        assert result.validated == [1]
+        assert result.failed[0].pointage_id == 2
+        assert "changé" in result.failed[0].error
+        assert self.event_bus.publish.call_args.args[0].pointage_ids == (1,)
+
+    def test_bulk_validate_duplicate_ids(self):
+        """Test: un ID en double n'est validé et rapporté qu'une fois."""
+        self.pointage_repo.find_by_ids.return_value = [_pointage(1)]
+
+        result = self.use_case.execute(
+            BulkValidatePointagesDTO(pointage_ids=[1, 1], validateur_id=4)
+        )
+
+        assert result.validated == [1]
+        assert result.failed == []
+        assert result.total_count == 1
+        assert self.pointage_repo.find_by_ids.call_args.args[0] == [1]
+        assert self.pointage_repo.bulk_validate.call_args.args[0] == [1]
+
+    def test_bulk_validate_failed_request_order(self):
+        """Test: les échecs sont rapportés dans l'ordre de la requête."""
+        self.pointage_repo.find_by_ids.return_value = [_pointage(1), _pointage(3)]
+        self.pointage_repo.bulk_validate.side_effect = lambda ids, *args: []
+
+        result = self.use_case.execute(
+            BulkValidatePointagesDTO(pointage_ids=[1, 2, 3], validateur_id=4)
         )
 
-        self.pointage_repo.find_by_id.return_value = pointage
+        assert [r.pointage_id for r in result.failed] == [1, 2, 3]
+
+    def test_bulk_validate_repository_error(self):
+        """Test: une erreur de persistance fait échouer tout le lot."""
+        self.pointage_repo.find_by_ids.return_value = [_pointage(1), _pointage(2)]
+        self.pointage_repo.bulk_validate.side_effect = RuntimeError("DB down")
+
+        result = self.use_case.execute(
+            BulkValidatePointagesDTO(pointage_ids=[1, 2], validateur_id=4)
+        )
+
+        assert result.validated == []
+        assert result.failure_count == 2
+        assert all("Erreur inattendue" in f.error for f in result.failed)
+        self.event_bus.publish.assert_not_called()
+
+
+class TestBulkValidatePeriodeVerrouillee:
+    """Tests du verrouillage mensuel (PeriodePaie réelle)."""
+
+    def test_bulk_validate_periode_locked(self):
+        """Test: verrouillage mensuel empêche la validation."""
+        # Arrange - Pointage de décembre 2025 (période passée, verrouillée)
+        pointage_repo = Mock()
+        pointage_repo.find_by_ids.return_value = [
+            _pointage(1, date_pointage=date(2025, 12, 5))
+        ]
+        event_bus = Mock()
+        use_case = BulkValidatePointagesUseCase(pointage_repo, event_bus)
 
         dto = BulkValidatePointagesDTO(pointage_ids=[1], validateur_id=4)
 
         # Act
-        result = self.use_case.execute(dto)
+        result = use_case.execute(dto)
 
         # Assert
         assert result.success_count == 0
         assert result.failure_count == 1
-        # Le message d'erreur devrait mentionner le statut incompatible
+        assert "verrouillée" in result.failed[0].error.lower()
+        pointage_repo.bulk_validate.assert_not_called()
+        event_bus.publish.assert_not_called()
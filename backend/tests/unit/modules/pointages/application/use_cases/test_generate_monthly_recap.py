@@ -3,18 +3,44 @@
 import pytest
 from datetime import date
 from decimal import Decimal
-from unittest.mock import Mock, MagicMock, patch, PropertyMock
+from unittest.mock import Mock
 
 from modules.pointages.application.use_cases.generate_monthly_recap import (
     GenerateMonthlyRecapUseCase,
+    GenerateMonthlyRecapBatchUseCase,
     GenerateMonthlyRecapError,
 )
 from modules.pointages.application.dtos.monthly_recap_dtos import (
     GenerateMonthlyRecapDTO,
+    GenerateMonthlyRecapBatchDTO,
 )
-from modules.pointages.domain.entities.pointage import Pointage
-from modules.pointages.domain.entities.variable_paie import VariablePaie
-from modules.pointages.domain.value_objects import Duree, StatutPointage
+from shared.application.ports.entity_info_service import UserBasicInfo
+
+
+def _semaine(semaine_debut, statut, normales, sup=0, nombre=1, utilisateur_id=7):
+    """Ligne de PointageRepository.totaux_par_semaine (minutes)."""
+    return {
+        "utilisateur_id": utilisateur_id,
+        "semaine_debut": semaine_debut,
+        "statut": statut,
+        "nombre": nombre,
+        "heures_normales_minutes": normales,
+        "heures_supplementaires_minutes": sup,
+    }
+
+
+def _variable(type_variable, total, nombre=1, valeur_min=None, valeur_max=None, utilisateur_id=7):
+    """Ligne de VariablePaieRepository.totaux_par_type."""
+    valeur_min = valeur_min if valeur_min is not None else total / nombre
+    valeur_max = valeur_max if valeur_max is not None else valeur_min
+    return {
+        "utilisateur_id": utilisateur_id,
+        "type_variable": type_variable,
+        "nombre": nombre,
+        "total": total,
+        "valeur_min": valeur_min,
+        "valeur_max": valeur_max,
+    }
 
 
 class TestGenerateMonthlyRecapUseCase:
@@ -23,7 +49,9 @@ class TestGenerateMonthlyRecapUseCase:
     def setup_method(self):
         """Configure les mocks pour chaque test."""
         self.pointage_repo = Mock()
+        self.pointage_repo.totaux_par_semaine.return_value = []
         self.variable_paie_repo = Mock()
+        self.variable_paie_repo.totaux_par_type.return_value = []
         self.use_case = GenerateMonthlyRecapUseCase(
             pointage_repo=self.pointage_repo,
             variable_paie_repo=self.variable_paie_repo,
@@ -31,31 +59,11 @@ class TestGenerateMonthlyRecapUseCase:
 
     def test_generate_recap_success_simple(self):
         """Test nominal: génération réussie d'un récapitulatif simple."""
-        # Arrange
-        pointages = [
-            Pointage(
-                id=1,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 6),  # Lundi semaine 2
-                heures_normales=Duree(7, 30),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.VALIDE,
-            ),
-            Pointage(
-                id=2,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 7),  # Mardi semaine 2
-                heures_normales=Duree(8, 0),
-                heures_supplementaires=Duree(1, 0),
-                statut=StatutPointage.VALIDE,
-            ),
+        # Arrange - 2 pointages validés semaine 2 (7h30 + 8h00/1h sup)
+        self.pointage_repo.totaux_par_semaine.return_value = [
+            _semaine(date(2026, 1, 5), "valide", 930, 60, nombre=2),
         ]
 
-        self.pointage_repo.search.return_value = (pointages, 2)
-        self.variable_paie_repo.find_by_pointage.return_value = []
-
         dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=1)
 
         # Act
@@ -63,6 +71,7 @@ class TestGenerateMonthlyRecapUseCase:
 
         # Assert
         assert result.utilisateur_id == 7
+        assert result.utilisateur_nom == "Utilisateur 7"
         assert result.year == 2026
         assert result.month == 1
         assert result.month_label == "Janvier 2026"
@@ -74,14 +83,27 @@ class TestGenerateMonthlyRecapUseCase:
         assert result.weekly_summaries[0].numero_semaine == 2
         assert result.weekly_summaries[0].heures_normales == "15:30"
         assert result.weekly_summaries[0].statut == "valide"
-        assert result.pdf_path is None
+        assert result.pdf_content is None
+
+    def test_generate_recap_queries_month_aggregates_once(self):
+        """Test: une requête agrégée par source, bornée au mois."""
+        dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=2)
+
+        self.use_case.execute(dto)
+
+        self.pointage_repo.totaux_par_semaine.assert_called_once_with(
+            date(2026, 2, 1), date(2026, 2, 28), utilisateur_id=7
+        )
+        self.variable_paie_repo.totaux_par_type.assert_called_once_with(
+            date(2026, 2, 1), date(2026, 2, 28), utilisateur_id=7
+        )
+        self.pointage_repo.search.assert_not_called()
+        self.variable_paie_repo.find_by_pointage.assert_not_called()
 
     def test_generate_recap_invalid_month(self):
         """Test: erreur si mois invalide."""
-        # Arrange
         dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=13)
 
-        # Act & Assert
         with pytest.raises(GenerateMonthlyRecapError) as exc_info:
             self.use_case.execute(dto)
 
@@ -89,10 +111,8 @@ class TestGenerateMonthlyRecapUseCase:
 
     def test_generate_recap_invalid_year(self):
         """Test: erreur si année invalide."""
-        # Arrange
         dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=1999, month=1)
 
-        # Act & Assert
         with pytest.raises(GenerateMonthlyRecapError) as exc_info:
             self.use_case.execute(dto)
 
@@ -100,15 +120,10 @@ class TestGenerateMonthlyRecapUseCase:
 
     def test_generate_recap_no_pointages(self):
         """Test: récapitulatif vide si aucun pointage."""
-        # Arrange
-        self.pointage_repo.search.return_value = ([], 0)
-
         dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=1)
 
-        # Act
         result = self.use_case.execute(dto)
 
-        # Assert
         assert result.utilisateur_id == 7
         assert result.heures_normales_total == "00:00"
         assert result.heures_supplementaires_total == "00:00"
@@ -118,49 +133,16 @@ class TestGenerateMonthlyRecapUseCase:
 
     def test_generate_recap_multiple_weeks(self):
         """Test: récapitulatif avec plusieurs semaines."""
-        # Arrange
-        pointages = [
-            # Semaine 1 (5-11 janvier)
-            Pointage(
-                id=1,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 5),  # Lundi semaine 1
-                heures_normales=Duree(7, 0),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.VALIDE,
-            ),
-            # Semaine 2 (12-18 janvier)
-            Pointage(
-                id=2,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 13),  # Mardi semaine 2
-                heures_normales=Duree(8, 0),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.VALIDE,
-            ),
-            # Semaine 3 (19-25 janvier)
-            Pointage(
-                id=3,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 20),  # Mardi semaine 3
-                heures_normales=Duree(7, 30),
-                heures_supplementaires=Duree(1, 30),
-                statut=StatutPointage.VALIDE,
-            ),
+        self.pointage_repo.totaux_par_semaine.return_value = [
+            _semaine(date(2026, 1, 5), "valide", 420),
+            _semaine(date(2026, 1, 12), "valide", 480),
+            _semaine(date(2026, 1, 19), "valide", 450, 90),
         ]
 
-        self.pointage_repo.search.return_value = (pointages, 3)
-        self.variable_paie_repo.find_by_pointage.return_value = []
-
         dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=1)
 
-        # Act
         result = self.use_case.execute(dto)
 
-        # Assert
         assert len(result.weekly_summaries) == 3
         assert result.weekly_summaries[0].numero_semaine == 2
         assert result.weekly_summaries[1].numero_semaine == 3
@@ -171,274 +153,290 @@ class TestGenerateMonthlyRecapUseCase:
 
     def test_generate_recap_mixed_statuses(self):
         """Test: statut de semaine avec pointages de statuts différents."""
-        # Arrange
-        pointages = [
-            Pointage(
-                id=1,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 5),
-                heures_normales=Duree(7, 0),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.BROUILLON,
-            ),
-            Pointage(
-                id=2,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 6),
-                heures_normales=Duree(8, 0),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.VALIDE,
-            ),
+        self.pointage_repo.totaux_par_semaine.return_value = [
+            _semaine(date(2026, 1, 5), "brouillon", 420),
+            _semaine(date(2026, 1, 5), "valide", 480),
         ]
 
-        self.pointage_repo.search.return_value = (pointages, 2)
-        self.variable_paie_repo.find_by_pointage.return_value = []
-
         dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=1)
 
-        # Act
         result = self.use_case.execute(dto)
 
-        # Assert
         assert result.all_validated is False
-        # Statut de la semaine = brouillon (car has_brouillon)
+        # Statut de la semaine = brouillon, heures des deux statuts cumulées
+        assert len(result.weekly_summaries) == 1
         assert result.weekly_summaries[0].statut == "brouillon"
+        assert result.weekly_summaries[0].heures_normales == "15:00"
 
     def test_generate_recap_with_rejected_pointages(self):
         """Test: statut de semaine avec pointages rejetés."""
-        # Arrange
-        pointages = [
-            Pointage(
-                id=1,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 5),
-                heures_normales=Duree(7, 0),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.REJETE,
-            ),
-            Pointage(
-                id=2,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 6),
-                heures_normales=Duree(8, 0),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.VALIDE,
-            ),
+        self.pointage_repo.totaux_par_semaine.return_value = [
+            _semaine(date(2026, 1, 5), "rejete", 420),
+            _semaine(date(2026, 1, 5), "soumis", 480),
+            _semaine(date(2026, 1, 5), "valide", 480),
         ]
 
-        self.pointage_repo.search.return_value = (pointages, 2)
-        self.variable_paie_repo.find_by_pointage.return_value = []
-
         dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=1)
 
-        # Act
         result = self.use_case.execute(dto)
 
-        # Assert
         # Statut de la semaine = rejete (prioritaire)
         assert result.weekly_summaries[0].statut == "rejete"
 
-    @patch("modules.pointages.application.use_cases.generate_monthly_recap.TypeVariablePaie")
-    def test_generate_recap_with_variables_paie(self, mock_type_var_class):
-        """Test: récapitulatif avec variables de paie."""
-        # Mock TypeVariablePaie.from_string et la property is_amount
-        mock_type_instance = Mock()
-        mock_type_instance.is_amount = True
-        mock_type_instance.is_absence = False
-        mock_type_instance.libelle = "Panier repas"
-        mock_type_var_class.from_string.return_value = mock_type_instance
-
-        # Arrange
-        pointages = [
-            Pointage(
-                id=1,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 5),
-                heures_normales=Duree(7, 0),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.VALIDE,
-            ),
-            Pointage(
-                id=2,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 6),
-                heures_normales=Duree(8, 0),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.VALIDE,
-            ),
+    def test_generate_recap_with_variables_paie(self):
+        """Test: récapitulatif avec variables de paie (montants)."""
+        self.pointage_repo.totaux_par_semaine.return_value = [
+            _semaine(date(2026, 1, 5), "valide", 900, nombre=2),
         ]
-
-        # Variables de paie
-        variables = [
-            VariablePaie(
-                id=1,
-                pointage_id=1,
-                type_variable="panier_repas",
-                valeur=Decimal("10.00"),
-                date_application=date(2026, 1, 5),
-            ),
-            VariablePaie(
-                id=2,
-                pointage_id=2,
-                type_variable="panier_repas",
-                valeur=Decimal("10.00"),
-                date_application=date(2026, 1, 6),
+        self.variable_paie_repo.totaux_par_type.return_value = [
+            _variable("panier_repas", Decimal("20.00"), nombre=2),
+            _variable(
+                "indemnite_transport",
+                Decimal("15.00"),
+                nombre=2,
+                valeur_min=Decimal("5.00"),
+                valeur_max=Decimal("10.00"),
             ),
-        ]
-
-        self.pointage_repo.search.return_value = (pointages, 2)
-        # find_by_pointage est appelé 4 fois : 2 pour variables_paie, 2 pour absences
-        self.variable_paie_repo.find_by_pointage.side_effect = [
-            [variables[0]], [variables[1]],  # Pour _build_variables_paie_summaries
-            [variables[0]], [variables[1]],  # Pour _build_absences_summaries
+            _variable("heures_nuit", Decimal("3.00")),
         ]
 
         dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=1)
 
-        # Act
         result = self.use_case.execute(dto)
 
-        # Assert
-        assert len(result.variables_paie) == 1
-        assert result.variables_paie[0].type_variable == "panier_repas"
-        assert result.variables_paie[0].nombre_occurrences == 2
-        assert result.variables_paie[0].valeur_unitaire == Decimal("10.00")
-        assert result.variables_paie[0].montant_total == Decimal("20.00")
-        assert result.variables_paie_total == Decimal("20.00")
-
-    @patch("modules.pointages.application.use_cases.generate_monthly_recap.TypeVariablePaie")
-    def test_generate_recap_with_absences(self, mock_type_var_class):
+        # Les variables d'heures ne sont pas des montants
+        assert [v.type_variable for v in result.variables_paie] == [
+            "indemnite_transport",
+            "panier_repas",
+        ]
+        transport, panier = result.variables_paie
+        assert panier.type_variable_libelle == "Panier repas"
+        assert panier.nombre_occurrences == 2
+        assert panier.valeur_unitaire == Decimal("10.00")
+        assert panier.montant_total == Decimal("20.00")
+        assert transport.valeur_unitaire is None
+        assert result.variables_paie_total == Decimal("35.00")
+        assert result.absences == []
+
+    def test_generate_recap_with_absences(self):
         """Test: récapitulatif avec absences."""
-        # Mock TypeVariablePaie.from_string
-        mock_type_instance = Mock()
-        mock_type_instance.is_amount = False
-        mock_type_instance.is_absence = True
-        mock_type_instance.libelle = "Congés payés"
-        mock_type_var_class.from_string.return_value = mock_type_instance
-
-        # Arrange
-        pointages = [
-            Pointage(
-                id=1,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 5),
-                heures_normales=Duree(7, 0),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.VALIDE,
-            ),
+        self.pointage_repo.totaux_par_semaine.return_value = [
+            _semaine(date(2026, 1, 5), "valide", 420),
         ]
-
-        # Variable de paie de type absence
-        variables = [
-            VariablePaie(
-                id=1,
-                pointage_id=1,
-                type_variable="conges_payes",
-                valeur=Decimal("7.00"),  # 7 heures d'absence
-                date_application=date(2026, 1, 5),
-            ),
+        self.variable_paie_repo.totaux_par_type.return_value = [
+            _variable("conges_payes", Decimal("14.00"), nombre=2),
+            _variable("type_inconnu", Decimal("1.00")),
         ]
 
-        self.pointage_repo.search.return_value = (pointages, 1)
-        self.variable_paie_repo.find_by_pointage.return_value = variables
-
         dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=1)
 
-        # Act
         result = self.use_case.execute(dto)
 
-        # Assert
         assert len(result.absences) == 1
         assert result.absences[0].type_absence == "conges_payes"
-        assert result.absences[0].nombre_jours == 1
-        assert result.absences[0].total_heures == "07:00"
-        assert result.absences[0].total_heures_decimal == 7.0
+        assert result.absences[0].type_absence_libelle == "Congés payés"
+        assert result.absences[0].nombre_jours == 2
+        assert result.absences[0].total_heures == "14:00"
+        assert result.absences[0].total_heures_decimal == 14.0
+        assert result.variables_paie == []
+
+    def test_generate_recap_uses_entity_info_for_name(self):
+        """Test: nom de l'utilisateur via EntityInfoService."""
+        entity_info = Mock()
+        entity_info.get_users_info.return_value = {7: UserBasicInfo(id=7, nom="Jean Dupont")}
+        use_case = GenerateMonthlyRecapUseCase(
+            self.pointage_repo, self.variable_paie_repo, entity_info=entity_info
+        )
+
+        result = use_case.execute(GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=1))
+
+        assert result.utilisateur_nom == "Jean Dupont"
+        entity_info.get_users_info.assert_called_once_with([7])
 
     def test_generate_recap_export_pdf_false(self):
         """Test: export_pdf=False ne génère pas de PDF."""
-        # Arrange
-        self.pointage_repo.search.return_value = ([], 0)
+        pdf_generator = Mock()
+        use_case = GenerateMonthlyRecapUseCase(
+            self.pointage_repo, self.variable_paie_repo, pdf_generator=pdf_generator
+        )
 
         dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=1, export_pdf=False)
 
-        # Act
+        result = use_case.execute(dto)
+
+        assert result.pdf_content is None
+        pdf_generator.generate_recaps_mensuels_pdf.assert_not_called()
+
+    def test_generate_recap_export_pdf_without_generator(self):
+        """Test: export_pdf sans générateur configuré laisse pdf_content à None."""
+        dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=1, export_pdf=True)
+
         result = self.use_case.execute(dto)
 
-        # Assert
-        assert result.pdf_path is None
-
-    def test_generate_recap_weekly_grouping_across_months(self):
-        """Test: regroupement hebdomadaire correct pour semaines à cheval sur 2 mois."""
-        # Arrange - Janvier se termine un vendredi (31/01/2026)
-        # Semaine contenant le 31/01 commence le lundi 26/01
-        pointages = [
-            Pointage(
-                id=1,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 26),  # Lundi de la dernière semaine
-                heures_normales=Duree(8, 0),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.VALIDE,
-            ),
-            Pointage(
-                id=2,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 30),  # Vendredi
-                heures_normales=Duree(7, 0),
-                heures_supplementaires=Duree(0, 0),
-                statut=StatutPointage.VALIDE,
-            ),
-        ]
+        assert result.pdf_content is None
 
-        self.pointage_repo.search.return_value = (pointages, 2)
-        self.variable_paie_repo.find_by_pointage.return_value = []
+    def test_generate_recap_export_pdf_returns_content(self, tmp_path, monkeypatch):
+        """Test: export_pdf renvoie le PDF rendu sans rien écrire sur le disque."""
+        monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+        pdf_generator = Mock()
+        pdf_generator.generate_recaps_mensuels_pdf.return_value = [b"%PDF-recap"]
+        use_case = GenerateMonthlyRecapUseCase(
+            self.pointage_repo, self.variable_paie_repo, pdf_generator=pdf_generator
+        )
 
-        dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=1)
+        dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=1, export_pdf=True)
 
-        # Act
-        result = self.use_case.execute(dto)
+        result = use_case.execute(dto)
 
-        # Assert
-        # Les deux pointages doivent être dans la même semaine
-        assert len(result.weekly_summaries) == 1
-        assert result.weekly_summaries[0].heures_normales == "15:00"
+        assert result.pdf_content == b"%PDF-recap"
+        assert result.pdf_filename == "recap_mensuel_user7_2026_01.pdf"
+        assert list(tmp_path.iterdir()) == []
 
     def test_generate_recap_decimal_calculations(self):
         """Test: calculs décimaux corrects."""
-        # Arrange
-        pointages = [
-            Pointage(
-                id=1,
-                utilisateur_id=7,
-                chantier_id=1,
-                date_pointage=date(2026, 1, 5),
-                heures_normales=Duree(7, 30),  # 7.5h
-                heures_supplementaires=Duree(1, 15),  # 1.25h
-                statut=StatutPointage.VALIDE,
-            ),
+        self.pointage_repo.totaux_par_semaine.return_value = [
+            _semaine(date(2026, 1, 5), "valide", 450, 75),  # 7.5h + 1.25h
         ]
 
-        self.pointage_repo.search.return_value = (pointages, 1)
-        self.variable_paie_repo.find_by_pointage.return_value = []
-
         dto = GenerateMonthlyRecapDTO(utilisateur_id=7, year=2026, month=1)
 
-        # Act
         result = self.use_case.execute(dto)
 
-        # Assert
         assert result.heures_normales_total_decimal == 7.5
         assert result.heures_supplementaires_total_decimal == 1.25
         assert result.total_heures_month_decimal == 8.75
         assert result.weekly_summaries[0].heures_normales_decimal == 7.5
         assert result.weekly_summaries[0].heures_supplementaires_decimal == 1.25
         assert result.weekly_summaries[0].total_heures_decimal == 8.75
+
+
+class TestGenerateMonthlyRecapBatchUseCase:
+    """Tests pour la génération des récapitulatifs de toute l'entreprise."""
+
+    def setup_method(self):
+        """Configure les mocks pour chaque test."""
+        self.pointage_repo = Mock()
+        self.pointage_repo.totaux_par_semaine.return_value = [
+            _semaine(date(2026, 1, 5), "valide", 420, utilisateur_id=3),
+            _semaine(date(2026, 1, 5), "soumis", 480, utilisateur_id=9),
+            _semaine(date(2026, 1, 12), "valide", 480, utilisateur_id=3),
+        ]
+        self.variable_paie_repo = Mock()
+        self.variable_paie_repo.totaux_par_type.return_value = [
+            _variable("panier_repas", Decimal("10.00"), utilisateur_id=9),
+        ]
+        self.entity_info = Mock()
+        self.entity_info.get_users_info.return_value = {
+            3: UserBasicInfo(id=3, nom="Alice Martin"),
+        }
+        self.pdf_generator = Mock()
+
+    def _use_case(self):
+        return GenerateMonthlyRecapBatchUseCase(
+            GenerateMonthlyRecapUseCase(
+                self.pointage_repo,
+                self.variable_paie_repo,
+                entity_info=self.entity_info,
+                pdf_generator=self.pdf_generator,
+            )
+        )
+
+    def test_one_recap_per_user_in_one_pass(self):
+        """Test: un récapitulatif par utilisateur, deux requêtes au total."""
+        result = self._use_case().execute(GenerateMonthlyRecapBatchDTO(year=2026, month=1))
+
+        assert result.month_label == "Janvier 2026"
+        assert [r.utilisateur_id for r in result.recaps] == [3, 9]
+        alice, autre = result.recaps
+        assert alice.utilisateur_nom == "Alice Martin"
+        assert alice.heures_normales_total == "15:00"
+        assert len(alice.weekly_summaries) == 2
+        assert alice.all_validated is True
+        assert alice.variables_paie == []
+        assert autre.utilisateur_nom == "Utilisateur 9"
+        assert autre.all_validated is False
+        assert autre.variables_paie_total == Decimal("10.00")
+
+        self.pointage_repo.totaux_par_semaine.assert_called_once_with(
+            date(2026, 1, 1), date(2026, 1, 31), utilisateur_id=None
+        )
+        self.variable_paie_repo.totaux_par_type.assert_called_once_with(
+            date(2026, 1, 1), date(2026, 1, 31), utilisateur_id=None
+        )
+        self.entity_info.get_users_info.assert_called_once_with([3, 9])
+
+    def test_pdfs_rendered_in_one_batch(self):
+        """Test: les PDF sont demandés en un seul lot au générateur."""
+        self.pdf_generator.generate_recaps_mensuels_pdf.return_value = [b"pdf-3", b"pdf-9"]
+
+        result = self._use_case().execute(
+            GenerateMonthlyRecapBatchDTO(year=2026, month=1, export_pdf=True)
+        )
+
+        self.pdf_generator.generate_recaps_mensuels_pdf.assert_called_once_with(result.recaps)
+        assert [r.pdf_content for r in result.recaps] == [b"pdf-3", b"pdf-9"]
+
+    def test_empty_month(self):
+        """Test: aucun pointage sur le mois, aucun récapitulatif."""
+        self.pointage_repo.totaux_par_semaine.return_value = []
+        self.variable_paie_repo.totaux_par_type.return_value = []
+
+        result = self._use_case().execute(
+            GenerateMonthlyRecapBatchDTO(year=2026, month=1, export_pdf=True)
+        )
+
+        assert result.recaps == []
+        self.entity_info.get_users_info.assert_not_called()
+        self.pdf_generator.generate_recaps_mensuels_pdf.assert_not_called()
+
+    def test_invalid_month(self):
+        """Test: erreur si mois invalide."""
+        with pytest.raises(GenerateMonthlyRecapError):
+            self._use_case().execute(GenerateMonthlyRecapBatchDTO(year=2026, month=0))
+
+
+class TestMonthlyRecapsZipExport:
+    """Tests de l'export ZIP des récapitulatifs via le controller."""
+
+    def test_zip_contains_one_pdf_per_user(self):
+        """Test: l'archive contient un PDF par utilisateur, en mémoire."""
+        import io
+        import zipfile
+
+        from modules.pointages.adapters.controllers import PointageController
+
+        pointage_repo = Mock()
+        pointage_repo.totaux_par_semaine.return_value = [
+            _semaine(date(2026, 1, 5), "valide", 420, utilisateur_id=3),
+            _semaine(date(2026, 1, 5), "soumis", 480, utilisateur_id=9),
+        ]
+        variable_repo = Mock()
+        variable_repo.totaux_par_type.return_value = []
+        pdf_generator = Mock()
+        pdf_generator.generate_recaps_mensuels_pdf.return_value = [b"pdf-3", b"pdf-9"]
+        controller = PointageController(
+            pointage_repo, Mock(), variable_repo, pdf_generator=pdf_generator
+        )
+
+        contenu, filename = controller.export_monthly_recaps_zip(2026, 1)
+
+        assert filename == "recaps_mensuels_2026_01.zip"
+        with zipfile.ZipFile(io.BytesIO(contenu)) as archive:
+            assert archive.namelist() == [
+                "recap_mensuel_user3_2026_01.pdf",
+                "recap_mensuel_user9_2026_01.pdf",
+            ]
+            assert archive.read("recap_mensuel_user9_2026_01.pdf") == b"pdf-9"
+
+    def test_pdf_unavailable_without_generator(self):
+        """Test: sans générateur PDF, l'export est refusé."""
+        from modules.pointages.adapters.controllers import PointageController
+
+        pointage_repo = Mock()
+        pointage_repo.totaux_par_semaine.return_value = []
+        variable_repo = Mock()
+        variable_repo.totaux_par_type.return_value = []
+        controller = PointageController(pointage_repo, Mock(), variable_repo)
+
+        with pytest.raises(ValueError):
+            controller.export_monthly_recap_pdf(7, 2026, 1)
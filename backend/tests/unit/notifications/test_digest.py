@@ -0,0 +1,188 @@
+"""Tests unitaires du regroupement (digest) des notifications."""
+
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from modules.notifications.domain.entities import Notification
+from modules.notifications.domain.value_objects import NotificationType
+from modules.notifications.infrastructure.digest import (
+    DIGEST_POINTAGES_SOUMIS,
+    NotificationDigestBuffer,
+    build_digest,
+)
+from modules.notifications.infrastructure.persistence import NotificationModel
+from shared.infrastructure.scheduler.jobs import FlushNotificationDigestsJob
+
+
+class FakeClock:
+    """Horloge manuelle."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _soumission(user_id: int, compagnon_id: int, nom: str, chantier_id: int = 3) -> Notification:
+    return Notification(
+        user_id=user_id,
+        type=NotificationType.SYSTEM,
+        title="Heures soumises pour validation",
+        message=f"{nom} a soumis ses heures du 16/02/2026",
+        related_chantier_id=chantier_id,
+        triggered_by_user_id=compagnon_id,
+        metadata={"compagnon_nom": nom},
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def buffer(clock):
+    return NotificationDigestBuffer(window_seconds=60, clock=clock)
+
+
+@pytest.fixture
+def sqlite_session():
+    engine = create_engine("sqlite:///:memory:")
+    NotificationModel.metadata.create_all(engine, tables=[NotificationModel.__table__])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+class TestBuildDigest:
+    """Tests de build_digest."""
+
+    def test_single_notification_published_as_is(self):
+        notification = _soumission(10, 7, "Jean Dupont")
+
+        assert build_digest(DIGEST_POINTAGES_SOUMIS, [notification]) is notification
+
+    def test_digest_summarizes_group(self):
+        notifications = [
+            _soumission(10, i, nom)
+            for i, nom in enumerate(["A", "B", "C", "D", "E", "A"], start=1)
+        ]
+
+        digest = build_digest(DIGEST_POINTAGES_SOUMIS, notifications)
+
+        assert digest.user_id == 10
+        assert digest.related_chantier_id == 3
+        assert digest.triggered_by_user_id is None
+        assert digest.message == "6 saisies d'heures soumises par A, B, C et 2 autre(s)"
+        assert digest.metadata == {"digest": DIGEST_POINTAGES_SOUMIS, "count": 6}
+
+    def test_digest_keeps_single_trigger(self):
+        notifications = [_soumission(10, 7, "Jean"), _soumission(10, 7, "Jean")]
+
+        digest = build_digest(DIGEST_POINTAGES_SOUMIS, notifications)
+
+        assert digest.triggered_by_user_id == 7
+        assert digest.message == "2 saisies d'heures soumises par Jean"
+
+
+class TestNotificationDigestBuffer:
+    """Tests du tampon de regroupement."""
+
+    def test_disabled_with_zero_window(self):
+        assert not NotificationDigestBuffer(window_seconds=0).enabled
+
+    def test_groups_by_recipient_and_chantier(self, buffer, clock):
+        buffer.add(DIGEST_POINTAGES_SOUMIS, [_soumission(10, 1, "A"), _soumission(20, 1, "A")])
+        buffer.add(DIGEST_POINTAGES_SOUMIS, [_soumission(10, 2, "B"), _soumission(20, 2, "B")])
+        buffer.add(DIGEST_POINTAGES_SOUMIS, [_soumission(10, 3, "C", chantier_id=4)])
+
+        assert buffer.pending() == 3
+
+        clock.now += 60
+        digests = buffer.pop_due()
+
+        assert sorted((d.user_id, d.related_chantier_id, d.metadata.get("count")) for d in digests) == [
+            (10, 3, 2),
+            (10, 4, None),
+            (20, 3, 2),
+        ]
+        assert buffer.pending() == 0
+
+    def test_window_not_expired(self, buffer, clock):
+        buffer.add(DIGEST_POINTAGES_SOUMIS, [_soumission(10, 1, "A")])
+        clock.now += 59
+
+        assert buffer.pop_due() == []
+        assert buffer.pending() == 1
+
+    def test_force_pops_everything(self, buffer):
+        buffer.add(DIGEST_POINTAGES_SOUMIS, [_soumission(10, 1, "A")])
+
+        assert len(buffer.pop_due(force=True)) == 1
+
+    def test_burst_becomes_one_notification_per_validator(self, buffer, clock, sqlite_session):
+        for compagnon_id in range(1, 31):
+            buffer.add(
+                DIGEST_POINTAGES_SOUMIS,
+                [_soumission(10, compagnon_id, f"C{compagnon_id}"),
+                 _soumission(20, compagnon_id, f"C{compagnon_id}")],
+            )
+        clock.now += 60
+
+        assert buffer.flush(sqlite_session) == 2
+
+        rows = sqlite_session.query(NotificationModel).order_by(NotificationModel.user_id).all()
+        assert [(r.user_id, r.extra_data["count"]) for r in rows] == [(10, 30), (20, 30)]
+
+
+    def test_failed_insert_requeues_groups(self, buffer, clock, sqlite_session):
+        buffer.add(DIGEST_POINTAGES_SOUMIS, [_soumission(10, 1, "A")])
+        clock.now += 60
+        db = Mock()
+        db.commit.side_effect = RuntimeError("base indisponible")
+
+        with pytest.raises(RuntimeError):
+            buffer.flush(db)
+
+        db.rollback.assert_called_once()
+        assert buffer.pending() == 1
+        # Arrivee pendant l'echec : fusionnee dans le groupe remis en attente
+        buffer.add(DIGEST_POINTAGES_SOUMIS, [_soumission(10, 2, "B")])
+        assert buffer.flush(sqlite_session) == 1
+        row = sqlite_session.query(NotificationModel).one()
+        assert row.extra_data["count"] == 2
+
+
+class TestFlushNotificationDigestsJob:
+    """Tests du job de publication des digests."""
+
+    def test_execute_skips_session_when_empty(self, buffer):
+        factory = Mock()
+
+        job = FlushNotificationDigestsJob(factory, digest_buffer=buffer)
+
+        assert job.execute() == 0
+        factory.assert_not_called()
+
+    def test_execute_force_on_shutdown(self, buffer, sqlite_session):
+        buffer.add(DIGEST_POINTAGES_SOUMIS, [_soumission(10, 1, "A")])
+        job = FlushNotificationDigestsJob(lambda: sqlite_session, digest_buffer=buffer)
+
+        assert job.execute() == 0
+        assert job.execute(force=True) == 1
+        assert sqlite_session.query(NotificationModel).count() == 1
+
+    def test_execute_keeps_groups_on_db_error(self, buffer, clock):
+        buffer.add(DIGEST_POINTAGES_SOUMIS, [_soumission(10, 1, "A")])
+        clock.now += 60
+        session = Mock()
+        session.commit.side_effect = RuntimeError("base indisponible")
+        job = FlushNotificationDigestsJob(lambda: session, digest_buffer=buffer)
+
+        assert job.execute() == 0
+        assert buffer.pending() == 1
+        session.close.assert_called_once()
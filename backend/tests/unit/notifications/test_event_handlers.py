@@ -142,7 +142,8 @@ class TestHandleCommentAddedIntegration:
 
         handle_comment_added(event)
 
-        mock_repo.save.assert_called()
+        mock_repo.save_many.assert_called_once()
+        assert [n.user_id for n in mock_repo.save_many.call_args[0][0]] == [3]
         mock_db.close.assert_called_once()
 
     @patch("modules.notifications.infrastructure.event_handlers.SessionLocal")
@@ -315,7 +316,9 @@ class TestHandleChantierCreated:
         handle_chantier_created(event)
 
         # 3 destinataires (10, 11, 20) - le createur (5) n'est pas dedans
-        assert mock_repo.save.call_count == 3
+        # inseres en une seule transaction
+        mock_repo.save_many.assert_called_once()
+        assert len(mock_repo.save_many.call_args[0][0]) == 3
         mock_db.close.assert_called_once()
 
     @patch("modules.notifications.infrastructure.event_handlers.SQLAlchemyNotificationRepository")
@@ -343,7 +346,7 @@ class TestHandleChantierCreated:
 
         handle_chantier_created(event)
 
-        assert mock_repo.save.call_count == 0
+        mock_repo.save_many.assert_not_called()
 
     @patch("modules.notifications.infrastructure.event_handlers.SQLAlchemyNotificationRepository")
     @patch("modules.notifications.infrastructure.event_handlers.SessionLocal")
@@ -361,7 +364,7 @@ class TestHandleChantierCreated:
 
         handle_chantier_created(event)
 
-        assert mock_repo.save.call_count == 0
+        mock_repo.save_many.assert_not_called()
         mock_db.close.assert_called_once()
 
     @patch("modules.notifications.infrastructure.event_handlers.SQLAlchemyNotificationRepository")
@@ -409,7 +412,8 @@ class TestHandleChantierStatutChanged:
 
         handle_chantier_statut_changed(event)
 
-        assert mock_repo.save.call_count == 3
+        mock_repo.save_many.assert_called_once()
+        assert len(mock_repo.save_many.call_args[0][0]) == 3
         mock_db.close.assert_called_once()
 
     @patch("modules.notifications.infrastructure.event_handlers.SessionLocal")
@@ -447,7 +451,8 @@ class TestHandleChantierStatutChanged:
 
         handle_chantier_statut_changed(event)
 
-        assert mock_repo.save.call_count == 1
+        saved = mock_repo.save_many.call_args[0][0]
+        assert [n.user_id for n in saved] == [10]
 
     @patch("modules.notifications.infrastructure.event_handlers._get_chantier_users")
     @patch("modules.notifications.infrastructure.event_handlers.SQLAlchemyNotificationRepository")
@@ -473,28 +478,116 @@ class TestHandleChantierStatutChanged:
         handle_chantier_statut_changed(event)
 
         # Verifie que le message contient "En cours" (display_name) et pas "en_cours"
-        saved_notif = mock_repo.save.call_args[0][0]
+        saved_notif = mock_repo.save_many.call_args[0][0][0]
         assert "En cours" in saved_notif.message
 
 
 class TestGetChantierUsers:
     """Tests de _get_chantier_users."""
 
-    def test_returns_unique_user_ids(self):
-        """Test que les IDs retournes sont uniques."""
-        with patch(
-            "modules.chantiers.infrastructure.persistence.ChantierConducteurModel"
-        ), patch(
-            "modules.chantiers.infrastructure.persistence.ChantierChefModel"
-        ):
-            from modules.notifications.infrastructure.event_handlers import _get_chantier_users
+    @pytest.fixture
+    def sqlite_session(self):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from modules.chantiers.infrastructure.persistence import (
+            ChantierConducteurModel,
+            ChantierChefModel,
+        )
+
+        engine = create_engine("sqlite:///:memory:")
+        ChantierChefModel.metadata.create_all(
+            engine,
+            tables=[ChantierConducteurModel.__table__, ChantierChefModel.__table__],
+        )
+        session = sessionmaker(bind=engine)()
+        session.add_all([
+            ChantierConducteurModel(chantier_id=1, user_id=10),
+            ChantierConducteurModel(chantier_id=1, user_id=20),
+            ChantierConducteurModel(chantier_id=2, user_id=40),
+            ChantierChefModel(chantier_id=1, user_id=20),
+            ChantierChefModel(chantier_id=1, user_id=30),
+        ])
+        session.commit()
+        yield session
+        session.close()
+
+    def test_returns_unique_user_ids(self, sqlite_session):
+        """Test que les IDs retournes sont uniques (conducteurs + chefs)."""
+        from modules.notifications.infrastructure.event_handlers import _get_chantier_users
+
+        result = _get_chantier_users(sqlite_session, chantier_id=1)
+
+        assert sorted(result) == [10, 20, 30]
+
+    def test_single_query(self):
+        """Test que conducteurs et chefs sont lus en une seule requete."""
+        from modules.notifications.infrastructure.event_handlers import _get_chantier_users
+
+        mock_db = Mock()
+        mock_db.execute.return_value.scalars.return_value = [10]
+
+        assert _get_chantier_users(mock_db, chantier_id=1) == [10]
+        mock_db.execute.assert_called_once()
+
+
+class TestHandlePointageSubmitted:
+    """Tests du handler PointageSubmittedEvent (regroupement en digest)."""
+
+    @pytest.fixture
+    def event(self):
+        from datetime import date
+        from modules.pointages.domain.events import PointageSubmittedEvent
+
+        return PointageSubmittedEvent(
+            pointage_id=1,
+            utilisateur_id=7,
+            chantier_id=3,
+            date_pointage=date(2026, 2, 16),
+        )
+
+    @patch("modules.notifications.infrastructure.event_handlers.get_notification_digest_buffer")
+    @patch("modules.notifications.infrastructure.event_handlers._get_chantier_users")
+    @patch("modules.notifications.infrastructure.event_handlers.SQLAlchemyNotificationRepository")
+    @patch("modules.notifications.infrastructure.event_handlers.SessionLocal")
+    @patch("modules.notifications.infrastructure.event_handlers.get_user_name")
+    def test_queues_notifications_for_digest(
+        self, mock_get_name, mock_session_local, mock_repo_class, mock_get_users,
+        mock_get_buffer, event,
+    ):
+        """Test que les notifications sont mises en attente de regroupement."""
+        from modules.notifications.infrastructure.digest import DIGEST_POINTAGES_SOUMIS
+        from modules.notifications.infrastructure.event_handlers import handle_pointage_submitted
+
+        mock_get_name.return_value = "Jean Dupont"
+        mock_get_users.return_value = [7, 10, 20]  # 7 = le compagnon
+        mock_buffer = mock_get_buffer.return_value
+        mock_buffer.enabled = True
+
+        handle_pointage_submitted(event)
+
+        categorie, notifications = mock_buffer.add.call_args[0]
+        assert categorie == DIGEST_POINTAGES_SOUMIS
+        assert [n.user_id for n in notifications] == [10, 20]
+        assert notifications[0].metadata["compagnon_nom"] == "Jean Dupont"
+        mock_repo_class.return_value.save_many.assert_not_called()
 
-            mock_db = Mock()
-            mock_db.query.return_value.filter.return_value.all.side_effect = [
-                [(10,), (20,)],  # conducteurs
-                [(20,), (30,)],  # chefs (20 en double)
-            ]
+    @patch("modules.notifications.infrastructure.event_handlers.get_notification_digest_buffer")
+    @patch("modules.notifications.infrastructure.event_handlers._get_chantier_users")
+    @patch("modules.notifications.infrastructure.event_handlers.SQLAlchemyNotificationRepository")
+    @patch("modules.notifications.infrastructure.event_handlers.SessionLocal")
+    @patch("modules.notifications.infrastructure.event_handlers.get_user_name")
+    def test_inserts_directly_when_digest_disabled(
+        self, mock_get_name, mock_session_local, mock_repo_class, mock_get_users,
+        mock_get_buffer, event,
+    ):
+        """Test insertion groupee immediate si le regroupement est desactive."""
+        from modules.notifications.infrastructure.event_handlers import handle_pointage_submitted
+
+        mock_get_name.return_value = "Jean Dupont"
+        mock_get_users.return_value = [10, 20]
+        mock_get_buffer.return_value.enabled = False
 
-            result = _get_chantier_users(mock_db, chantier_id=1)
+        handle_pointage_submitted(event)
 
-            assert set(result) == {10, 20, 30}
+        mock_repo_class.return_value.save_many.assert_called_once()
+        assert len(mock_repo_class.return_value.save_many.call_args[0][0]) == 2
@@ -1,7 +1,8 @@
 """Tests unitaires pour les providers du module planning_charge."""
 
 import pytest
-from unittest.mock import Mock
+from datetime import date
+from unittest.mock import Mock, patch
 
 from modules.planning.infrastructure.providers import (
     SQLAlchemyChantierProvider,
@@ -142,6 +143,62 @@ class TestSQLAlchemyAffectationProvider:
         assert provider.HEURES_PAR_JOUR == 7.0
         assert provider.HEURES_PAR_SEMAINE == 35.0
 
+    def _mock_affectations(self, mock_session, rows):
+        """Configure la requete groupee des affectations par semaine."""
+        query = mock_session.query.return_value
+        query.outerjoin.return_value.filter.return_value.group_by.return_value.all.return_value = rows
+        return query
+
+    def test_occupation_par_semaine_requetes_constantes(self, provider, mock_session):
+        """Test une seule requete affectations quel que soit l'horizon."""
+        # index 0 = S02-2026 : 2 planifies dont 3 jours de conges
+        self._mock_affectations(mock_session, [(0, 2, 3), (2, 1, 0)])
+        presences = [
+            (date(2025, 1, 1), None, 3),
+            (date(2026, 1, 14), None, 1),  # Entree en S03
+            (date(2025, 1, 1), date(2026, 1, 7), 1),  # Sortie en S02
+        ]
+
+        with patch(
+            "modules.planning.infrastructure.providers.affectation_provider."
+            "count_users_by_presence_period",
+            return_value=presences,
+        ) as mock_presences:
+            result = provider.get_occupation_par_semaine(
+                Semaine(annee=2026, numero=2), Semaine(annee=2026, numero=5)
+            )
+
+        assert mock_session.query.call_count == 1
+        mock_presences.assert_called_once_with(mock_session, date(2026, 1, 5))
+        assert [o.semaine_code for o in result] == [
+            "S02-2026", "S03-2026", "S04-2026", "S05-2026",
+        ]
+        assert [o.effectif for o in result] == [4, 4, 4, 4]
+        assert result[0].utilisateurs_planifies == 2
+        assert result[0].absences_heures == 21.0
+        assert result[0].disponible_heures == 119.0
+        assert result[0].non_planifies == 2
+        assert result[1].utilisateurs_planifies == 0
+        assert result[2].non_planifies == 3
+
+    def test_capacite_et_non_planifies_partagent_la_serie(self, provider, mock_session):
+        """Test capacite et non planifies calcules depuis la meme serie."""
+        self._mock_affectations(mock_session, [(0, 1, 0)])
+        debut = Semaine(annee=2026, numero=2)
+        fin = Semaine(annee=2026, numero=3)
+
+        with patch(
+            "modules.planning.infrastructure.providers.affectation_provider."
+            "count_users_by_presence_period",
+            return_value=[(date(2025, 1, 1), None, 2)],
+        ):
+            capacites = provider.get_capacite_par_semaine(debut, fin)
+            non_planifies = provider.get_utilisateurs_non_planifies_par_semaine(debut, fin)
+
+        assert capacites == {"S02-2026": 70.0, "S03-2026": 70.0}
+        assert non_planifies == {"S02-2026": 1, "S03-2026": 2}
+        assert mock_session.query.call_count == 1
+
 
 class TestSQLAlchemyUtilisateurProvider:
     """Tests pour le provider des utilisateurs."""
@@ -6,6 +6,7 @@ from unittest.mock import Mock
 from modules.planning.application.use_cases.charge.get_occupation_details import (
     GetOccupationDetailsUseCase,
 )
+from modules.planning.application.dtos.charge import OccupationSemaineDTO
 from modules.planning.domain.value_objects import Semaine, TypeMetier
 
 
@@ -180,6 +181,7 @@ class TestGetOccupationDetailsUseCase:
         mock_affectation_provider.get_heures_planifiees_par_type_metier.return_value = {
             "macon": 70.0,  # Surplus de 105h
         }
+        mock_affectation_provider.get_occupation_semaine.return_value = None
 
         use_case = GetOccupationDetailsUseCase(
             besoin_repo=mock_repo,
@@ -279,3 +281,40 @@ class TestGetOccupationDetailsUseCase:
         assert elec_type is not None
         assert elec_type.type_metier_label == TypeMetier.ELECTRICIEN.label
         assert elec_type.type_metier_couleur == TypeMetier.ELECTRICIEN.couleur
+
+    def test_a_placer_depuis_serie_hebdomadaire(self):
+        """Test a_placer et absences issus de la série d'occupation."""
+        mock_repo = Mock()
+        mock_repo.find_by_semaine.return_value = []
+
+        mock_utilisateur_provider = Mock()
+        mock_utilisateur_provider.get_capacite_par_type_metier.return_value = {
+            "macon": 175.0,
+        }
+
+        mock_affectation_provider = Mock()
+        mock_affectation_provider.get_heures_planifiees_par_type_metier.return_value = {
+            "macon": 70.0,
+        }
+        mock_affectation_provider.get_occupation_semaine.return_value = OccupationSemaineDTO(
+            semaine_code="S01-2026",
+            effectif=5,
+            utilisateurs_planifies=4,
+            jours_absence=3,
+            capacite_heures=175.0,
+            absences_heures=21.0,
+        )
+
+        use_case = GetOccupationDetailsUseCase(
+            besoin_repo=mock_repo,
+            utilisateur_provider=mock_utilisateur_provider,
+            affectation_provider=mock_affectation_provider,
+        )
+
+        result = use_case.execute("S01-2026")
+
+        # Même définition que le footer du planning de charge (PDC-15)
+        assert result.a_placer == 1
+        assert result.effectif == 5
+        assert result.absences_heures == 21.0
+        assert result.disponible_heures == 154.0
@@ -8,9 +8,22 @@ from modules.planning.application.use_cases.charge.get_planning_charge import (
     GetPlanningChargeUseCase,
 )
 from modules.planning.application.dtos import PlanningChargeFiltersDTO
+from modules.planning.application.dtos.charge import OccupationSemaineDTO
 from modules.planning.domain.value_objects import Semaine
 
 
+def _occupation(code, effectif, planifies, jours_absence=0):
+    """Construit une semaine de la serie d'occupation (35h par personne)."""
+    return OccupationSemaineDTO(
+        semaine_code=code,
+        effectif=effectif,
+        utilisateurs_planifies=planifies,
+        jours_absence=jours_absence,
+        capacite_heures=effectif * 35.0,
+        absences_heures=jours_absence * 7.0,
+    )
+
+
 class TestGetPlanningChargeUseCase:
     """Tests pour GetPlanningChargeUseCase."""
 
@@ -142,12 +155,9 @@ class TestGetPlanningChargeUseCase:
         mock_affectation_provider.get_heures_planifiees_par_chantier_et_semaine.return_value = {
             (1, "S01-2026"): 20.0,
         }
-        mock_affectation_provider.get_capacite_par_semaine.return_value = {
-            "S01-2026": 175.0,  # 5 personnes * 35h
-        }
-        mock_affectation_provider.get_utilisateurs_non_planifies_par_semaine.return_value = {
-            "S01-2026": 2,
-        }
+        mock_affectation_provider.get_occupation_par_semaine.return_value = [
+            _occupation("S01-2026", effectif=5, planifies=3),  # 5 personnes * 35h
+        ]
 
         use_case = GetPlanningChargeUseCase(
             besoin_repo=mock_repo,
@@ -181,12 +191,9 @@ class TestGetPlanningChargeUseCase:
         mock_affectation_provider.get_heures_planifiees_par_chantier_et_semaine.return_value = {
             (1, "S01-2026"): 140.0,  # 80% de 175h
         }
-        mock_affectation_provider.get_capacite_par_semaine.return_value = {
-            "S01-2026": 175.0,
-        }
-        mock_affectation_provider.get_utilisateurs_non_planifies_par_semaine.return_value = {
-            "S01-2026": 1,
-        }
+        mock_affectation_provider.get_occupation_par_semaine.return_value = [
+            _occupation("S01-2026", effectif=5, planifies=4),
+        ]
 
         use_case = GetPlanningChargeUseCase(
             besoin_repo=mock_repo,
@@ -274,8 +281,9 @@ class TestGetPlanningChargeUseCase:
         mock_affectation_provider.get_heures_planifiees_par_chantier_et_semaine.return_value = {
             (1, "S01-2026"): 30.0,  # Besoin 50, planifié 30 = non couvert 20
         }
-        mock_affectation_provider.get_capacite_par_semaine.return_value = {"S01-2026": 175.0}
-        mock_affectation_provider.get_utilisateurs_non_planifies_par_semaine.return_value = {"S01-2026": 0}
+        mock_affectation_provider.get_occupation_par_semaine.return_value = [
+            _occupation("S01-2026", effectif=5, planifies=5),
+        ]
 
         use_case = GetPlanningChargeUseCase(
             besoin_repo=mock_repo,
@@ -312,10 +320,10 @@ class TestGetPlanningChargeUseCase:
 
         mock_affectation_provider = Mock()
         mock_affectation_provider.get_heures_planifiees_par_chantier_et_semaine.return_value = {}
-        mock_affectation_provider.get_capacite_par_semaine.return_value = {
-            "S01-2026": 175.0,  # Capacité 175h, besoin 250h -> déficit 75h -> 2 personnes
-        }
-        mock_affectation_provider.get_utilisateurs_non_planifies_par_semaine.return_value = {"S01-2026": 0}
+        mock_affectation_provider.get_occupation_par_semaine.return_value = [
+            # Capacité 175h, besoin 250h -> déficit 75h -> 2 personnes
+            _occupation("S01-2026", effectif=5, planifies=5),
+        ]
 
         use_case = GetPlanningChargeUseCase(
             besoin_repo=mock_repo,
@@ -333,3 +341,43 @@ class TestGetPlanningChargeUseCase:
 
         # Déficit = 250 - 175 = 75h -> 75/35 = 2.14 -> arrondi à 2
         assert result.footer[0].a_recruter == 2
+
+    def test_footer_capacite_nette_des_absences(self):
+        """Test la capacité du footer déduit les jours d'absence."""
+        mock_repo = Mock()
+        mock_repo.find_all_in_range.return_value = []
+
+        mock_chantier_provider = Mock()
+        mock_chantier_provider.get_chantiers_actifs.return_value = [
+            {"id": 1, "code": "CH001", "nom": "Chantier 1", "couleur": "#FF0000", "heures_estimees": 100.0},
+        ]
+
+        mock_affectation_provider = Mock()
+        mock_affectation_provider.get_heures_planifiees_par_chantier_et_semaine.return_value = {
+            (1, "S01-2026"): 70.0,
+        }
+        mock_affectation_provider.get_occupation_par_semaine.return_value = [
+            # 175h - 5 jours de congés (35h) = 140h disponibles
+            _occupation("S01-2026", effectif=5, planifies=3, jours_absence=5),
+            _occupation("S02-2026", effectif=4, planifies=1),
+        ]
+
+        use_case = GetPlanningChargeUseCase(
+            besoin_repo=mock_repo,
+            chantier_provider=mock_chantier_provider,
+            affectation_provider=mock_affectation_provider,
+        )
+
+        filters = PlanningChargeFiltersDTO(
+            semaine_debut="S01-2026",
+            semaine_fin="S02-2026",
+            unite="heures",
+        )
+
+        result = use_case.execute(filters)
+
+        assert result.footer[0].taux_occupation == 50.0  # 70 / 140
+        assert result.footer[0].a_placer == 2
+        assert result.footer[1].a_placer == 3
+        assert result.capacite_totale == 280.0  # 140 + 140
+        mock_affectation_provider.get_occupation_par_semaine.assert_called_once()
@@ -36,6 +36,14 @@ def mock_affectation_repository():
     """Fixture: mock du repository d'affectations."""
     mock = Mock(spec=AffectationRepository)
     mock.exists_for_utilisateur_and_date.return_value = False
+    mock.find_creneaux_occupes.return_value = set()
+
+    def save_many_with_ids(affectations):
+        for index, affectation in enumerate(affectations, start=1):
+            affectation.id = index
+        return affectations
+
+    mock.save_many.side_effect = save_many_with_ids
     return mock
 
 
@@ -336,16 +344,6 @@ class TestCreateAffectationRecurrente:
         self, use_case, mock_affectation_repository
     ):
         """Test: creation de plusieurs affectations pour recurrence."""
-        # Arrange
-        id_counter = [0]
-
-        def save_with_id(a):
-            id_counter[0] += 1
-            a.id = id_counter[0]
-            return a
-
-        mock_affectation_repository.save.side_effect = save_with_id
-
         # Lundi 19/01 -> Vendredi 23/01
         # 19=Lun(0), 20=Mar(1), 21=Mer(2), 22=Jeu(3), 23=Ven(4)
         dto = CreateAffectationDTO(
@@ -362,22 +360,14 @@ class TestCreateAffectationRecurrente:
 
         # Assert - 5 jours ouvrables
         assert len(result) == 5
-        assert mock_affectation_repository.save.call_count == 5
+        # Insertion en un seul lot
+        mock_affectation_repository.save_many.assert_called_once()
+        mock_affectation_repository.save.assert_not_called()
 
     def test_should_create_only_selected_days(
         self, use_case, mock_affectation_repository
     ):
         """Test: creation uniquement les jours selectionnes."""
-        # Arrange
-        id_counter = [0]
-
-        def save_with_id(a):
-            id_counter[0] += 1
-            a.id = id_counter[0]
-            return a
-
-        mock_affectation_repository.save.side_effect = save_with_id
-
         # Lundi 19/01 -> Dimanche 25/01
         # Jours: seulement Lun et Mer
         # 19=Lun(0), 21=Mer(2) = 2 jours
@@ -400,16 +390,6 @@ class TestCreateAffectationRecurrente:
         self, use_case, mock_affectation_repository, mock_event_bus
     ):
         """Test: publication d'un event bulk pour recurrence."""
-        # Arrange
-        id_counter = [0]
-
-        def save_with_id(a):
-            id_counter[0] += 1
-            a.id = id_counter[0]
-            return a
-
-        mock_affectation_repository.save.side_effect = save_with_id
-
         # 19=Lun(0) et 26=Lun(0) = 2 lundis
         dto = CreateAffectationDTO(
             utilisateur_id=1,
@@ -432,17 +412,7 @@ class TestCreateAffectationRecurrente:
     def test_should_check_conflict_for_each_date(
         self, use_case, mock_affectation_repository
     ):
-        """Test: verification de conflit pour chaque date."""
-        # Arrange
-        id_counter = [0]
-
-        def save_with_id(a):
-            id_counter[0] += 1
-            a.id = id_counter[0]
-            return a
-
-        mock_affectation_repository.save.side_effect = save_with_id
-
+        """Test: verification de conflit pour toutes les dates en une requete."""
         # 19=Lun(0), 20=Mar(1) = 2 jours
         dto = CreateAffectationDTO(
             utilisateur_id=1,
@@ -456,8 +426,11 @@ class TestCreateAffectationRecurrente:
         # Act
         use_case.execute(dto, created_by=3)
 
-        # Assert - 2 verifications de conflit
-        assert mock_affectation_repository.exists_for_utilisateur_and_date.call_count == 2
+        # Assert - une seule verification sur la plage de la recurrence
+        mock_affectation_repository.find_creneaux_occupes.assert_called_once_with(
+            [1], date(2026, 1, 19), date(2026, 1, 20)
+        )
+        mock_affectation_repository.exists_for_utilisateur_and_date.assert_not_called()
 
     def test_should_raise_on_conflict_during_recurrence(
         self, use_case, mock_affectation_repository
@@ -465,10 +438,9 @@ class TestCreateAffectationRecurrente:
         """Test: echec si conflit sur une des dates de recurrence."""
         # Arrange
         # Conflict sur la 2eme date
-        mock_affectation_repository.exists_for_utilisateur_and_date.side_effect = [
-            False,  # Premiere date OK
-            True,   # Deuxieme date en conflit
-        ]
+        mock_affectation_repository.find_creneaux_occupes.return_value = {
+            (1, date(2026, 1, 20)),
+        }
 
         # 19=Lun(0), 20=Mar(1) = 2 jours
         dto = CreateAffectationDTO(
@@ -485,7 +457,7 @@ class TestCreateAffectationRecurrente:
             use_case.execute(dto, created_by=3)
 
         # Pas de sauvegarde effectuee
-        mock_affectation_repository.save.assert_not_called()
+        mock_affectation_repository.save_many.assert_not_called()
 
     def test_should_raise_when_no_dates_match_recurrence(
         self, use_case, mock_affectation_repository
@@ -511,16 +483,6 @@ class TestCreateAffectationRecurrente:
         self, use_case, mock_affectation_repository
     ):
         """Test: les horaires sont preserves pour chaque affectation recurrente."""
-        # Arrange
-        id_counter = [0]
-
-        def save_with_id(a):
-            id_counter[0] += 1
-            a.id = id_counter[0]
-            return a
-
-        mock_affectation_repository.save.side_effect = save_with_id
-
         # 19=Lun(0), 26=Lun(0) = 2 lundis
         dto = CreateAffectationDTO(
             utilisateur_id=1,
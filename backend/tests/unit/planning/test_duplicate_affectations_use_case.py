@@ -12,8 +12,20 @@ from modules.planning.application.use_cases.duplicate_affectations import (
 )
 from modules.planning.application.use_cases.exceptions import (
     AffectationConflictError,
+    NoAffectationsToDuplicateError,
 )
-from modules.planning.application.dtos import DuplicateAffectationsDTO
+from modules.planning.application.dtos import (
+    DuplicateAffectationsDTO,
+    DuplicateAffectationsEquipeDTO,
+)
+from modules.planning.domain.events import AffectationBulkDuplicatedEvent
+
+
+def _save_many_with_ids(affectations):
+    """Simule l'insertion groupee en attribuant des IDs."""
+    for index, affectation in enumerate(affectations, start=100):
+        affectation.id = index
+    return affectations
 
 
 class TestDuplicateAffectationsUseCase:
@@ -49,19 +61,8 @@ class TestDuplicateAffectationsUseCase:
         self.mock_affectation_repo.find_by_utilisateur.return_value = [
             self.affectation_source
         ]
-        self.mock_affectation_repo.exists_for_utilisateur_and_date.return_value = False
-
-        # Mock save pour retourner l'affectation avec un nouvel ID
-        saved_affectation = Affectation(
-            id=2,
-            utilisateur_id=10,
-            chantier_id=100,
-            date=self.source_debut + timedelta(days=7),
-            heure_debut=time(8, 0),
-            heure_fin=time(17, 0),
-            created_by=1,
-        )
-        self.mock_affectation_repo.save.return_value = saved_affectation
+        self.mock_affectation_repo.find_creneaux_occupes.return_value = set()
+        self.mock_affectation_repo.save_many.side_effect = _save_many_with_ids
 
         dto = DuplicateAffectationsDTO(
             utilisateur_id=10,
@@ -73,7 +74,10 @@ class TestDuplicateAffectationsUseCase:
         result = self.use_case.execute(dto, created_by=1)
 
         assert len(result) == 1
-        self.mock_affectation_repo.save.assert_called_once()
+        assert result[0].date == self.source_debut + timedelta(days=7)
+        assert result[0].created_by == 1
+        self.mock_affectation_repo.save_many.assert_called_once()
+        self.mock_affectation_repo.save.assert_not_called()
 
     def test_duplicate_no_affectations(self):
         """Test: échec si aucune affectation source."""
@@ -95,7 +99,9 @@ class TestDuplicateAffectationsUseCase:
         self.mock_affectation_repo.find_by_utilisateur.return_value = [
             self.affectation_source
         ]
-        self.mock_affectation_repo.exists_for_utilisateur_and_date.return_value = True
+        self.mock_affectation_repo.find_creneaux_occupes.return_value = {
+            (10, self.source_debut + timedelta(days=7)),
+        }
 
         dto = DuplicateAffectationsDTO(
             utilisateur_id=10,
@@ -106,6 +112,7 @@ class TestDuplicateAffectationsUseCase:
 
         with pytest.raises(AffectationConflictError):
             self.use_case.execute(dto, created_by=1)
+        self.mock_affectation_repo.save_many.assert_not_called()
 
     def test_duplicate_multiple_affectations(self):
         """Test: duplication de plusieurs affectations."""
@@ -123,13 +130,8 @@ class TestDuplicateAffectationsUseCase:
             self.affectation_source,
             affectation2,
         ]
-        self.mock_affectation_repo.exists_for_utilisateur_and_date.return_value = False
-
-        saved_affectation = Mock()
-        saved_affectation.id = 10
-        saved_affectation.chantier_id = 100
-        saved_affectation.date = self.source_debut + timedelta(days=7)
-        self.mock_affectation_repo.save.return_value = saved_affectation
+        self.mock_affectation_repo.find_creneaux_occupes.return_value = set()
+        self.mock_affectation_repo.save_many.side_effect = _save_many_with_ids
 
         dto = DuplicateAffectationsDTO(
             utilisateur_id=10,
@@ -141,20 +143,21 @@ class TestDuplicateAffectationsUseCase:
         result = self.use_case.execute(dto, created_by=1)
 
         assert len(result) == 2
-        assert self.mock_affectation_repo.save.call_count == 2
+        # Une seule verification de conflits et une seule insertion
+        self.mock_affectation_repo.find_creneaux_occupes.assert_called_once_with(
+            [10],
+            self.source_debut + timedelta(days=7),
+            self.source_debut + timedelta(days=8),
+        )
+        self.mock_affectation_repo.save_many.assert_called_once()
 
     def test_duplicate_publishes_event(self):
         """Test: publication d'un event bulk après duplication."""
         self.mock_affectation_repo.find_by_utilisateur.return_value = [
             self.affectation_source
         ]
-        self.mock_affectation_repo.exists_for_utilisateur_and_date.return_value = False
-
-        saved = Mock()
-        saved.id = 10
-        saved.chantier_id = 100
-        saved.date = self.source_debut + timedelta(days=7)
-        self.mock_affectation_repo.save.return_value = saved
+        self.mock_affectation_repo.find_creneaux_occupes.return_value = set()
+        self.mock_affectation_repo.save_many.side_effect = _save_many_with_ids
 
         dto = DuplicateAffectationsDTO(
             utilisateur_id=10,
@@ -166,3 +169,119 @@ class TestDuplicateAffectationsUseCase:
         self.use_case.execute(dto, created_by=1)
 
         self.mock_event_bus.publish.assert_called_once()
+
+
+class TestDuplicateAffectationsEquipe:
+    """Tests pour la duplication en masse d'une equipe."""
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.mock_affectation_repo = Mock(spec=AffectationRepository)
+        self.mock_event_bus = Mock()
+        self.use_case = DuplicateAffectationsUseCase(
+            affectation_repo=self.mock_affectation_repo,
+            event_bus=self.mock_event_bus,
+        )
+        self.source_debut = date(2026, 1, 5)
+        self.source_fin = date(2026, 1, 30)
+        self.target_debut = date(2026, 2, 2)  # +28 jours
+
+        self.sources = [
+            Affectation(id=1, utilisateur_id=10, chantier_id=100, date=date(2026, 1, 5), created_by=1),
+            Affectation(id=2, utilisateur_id=10, chantier_id=100, date=date(2026, 1, 6), created_by=1),
+            Affectation(id=3, utilisateur_id=11, chantier_id=200, date=date(2026, 1, 5), created_by=1),
+        ]
+        self.mock_affectation_repo.find_filtered.return_value = self.sources
+        self.mock_affectation_repo.find_creneaux_occupes.return_value = set()
+        self.mock_affectation_repo.save_many.side_effect = _save_many_with_ids
+
+    def _dto(self, **kwargs):
+        return DuplicateAffectationsEquipeDTO(
+            utilisateur_ids=(11, 10),
+            source_date_debut=self.source_debut,
+            source_date_fin=self.source_fin,
+            target_date_debut=self.target_debut,
+            **kwargs,
+        )
+
+    def test_duplication_equipe_en_un_lot(self):
+        """Test: une requete source, une requete conflits, une insertion."""
+        result = self.use_case.execute_equipe(self._dto(), created_by=5)
+
+        assert result.nb_affectations == 3
+        assert result.conflits == []
+        assert {a.date for a in result.affectations} == {date(2026, 2, 2), date(2026, 2, 3)}
+        self.mock_affectation_repo.find_filtered.assert_called_once_with(
+            self.source_debut, self.source_fin, utilisateur_ids=[10, 11], chantier_ids=None,
+        )
+        self.mock_affectation_repo.find_creneaux_occupes.assert_called_once_with(
+            [10, 11], date(2026, 2, 2), date(2026, 2, 3),
+        )
+        self.mock_affectation_repo.save_many.assert_called_once()
+
+    def test_un_seul_evenement_agrege(self):
+        """Test: un evenement pour toute l'equipe."""
+        self.use_case.execute_equipe(self._dto(), created_by=5)
+
+        self.mock_event_bus.publish.assert_called_once()
+        event = self.mock_event_bus.publish.call_args[0][0]
+        assert isinstance(event, AffectationBulkDuplicatedEvent)
+        assert event.count == 3
+        assert event.utilisateur_ids == (10, 11)
+        assert event.chantier_ids == (100, 200)
+        assert event.created_by == 5
+
+    def test_dry_run_n_ecrit_rien(self):
+        """Test: l'apercu liste copies et conflits sans enregistrer."""
+        self.mock_affectation_repo.find_creneaux_occupes.return_value = {
+            (10, date(2026, 2, 3)),
+        }
+
+        result = self.use_case.execute_equipe(self._dto(dry_run=True), created_by=5)
+
+        assert result.dry_run is True
+        assert result.nb_affectations == 2
+        assert all(a.id is None for a in result.affectations)
+        assert result.conflits == [(10, date(2026, 2, 3))]
+        self.mock_affectation_repo.save_many.assert_not_called()
+        self.mock_event_bus.publish.assert_not_called()
+
+    def test_conflit_leve_une_erreur_par_defaut(self):
+        """Test: un conflit bloque la duplication sans ignorer_conflits."""
+        self.mock_affectation_repo.find_creneaux_occupes.return_value = {
+            (11, date(2026, 2, 2)),
+        }
+
+        with pytest.raises(AffectationConflictError):
+            self.use_case.execute_equipe(self._dto(), created_by=5)
+        self.mock_affectation_repo.save_many.assert_not_called()
+
+    def test_ignorer_conflits(self):
+        """Test: les dates occupees sont ignorees, le reste est copie."""
+        self.mock_affectation_repo.find_creneaux_occupes.return_value = {
+            (11, date(2026, 2, 2)),
+        }
+
+        result = self.use_case.execute_equipe(self._dto(ignorer_conflits=True), created_by=5)
+
+        assert result.nb_affectations == 2
+        assert all(a.utilisateur_id == 10 for a in result.affectations)
+        event = self.mock_event_bus.publish.call_args[0][0]
+        assert event.nb_conflits == 1
+
+    def test_equipe_sans_affectation_source(self):
+        """Test: echec si aucune affectation source."""
+        self.mock_affectation_repo.find_filtered.return_value = []
+
+        with pytest.raises(NoAffectationsToDuplicateError):
+            self.use_case.execute_equipe(self._dto(), created_by=5)
+
+    def test_dto_equipe_vide_invalide(self):
+        """Test: une equipe vide est refusee."""
+        with pytest.raises(ValueError):
+            DuplicateAffectationsEquipeDTO(
+                utilisateur_ids=(),
+                source_date_debut=self.source_debut,
+                source_date_fin=self.source_fin,
+                target_date_debut=self.target_debut,
+            )
@@ -10,6 +10,17 @@ from modules.planning.application.use_cases import GetPlanningUseCase
 from modules.planning.application.dtos import PlanningFiltersDTO
 
 
+def _filtering(affectations):
+    """Simule find_filtered : applique en memoire les filtres passes a la base."""
+    def find_filtered(date_debut, date_fin, utilisateur_ids=None, chantier_ids=None):
+        return [
+            a for a in affectations
+            if (utilisateur_ids is None or a.utilisateur_id in utilisateur_ids)
+            and (chantier_ids is None or a.chantier_id in chantier_ids)
+        ]
+    return find_filtered
+
+
 class TestGetPlanningMetiersFilter:
     """Tests pour le filtrage du planning par metiers (intersection)."""
 
@@ -66,10 +77,10 @@ class TestGetPlanningMetiersFilter:
     def test_filter_by_single_metier_matches(self):
         """Test: filtre par metier unique - trouve les utilisateurs avec ce metier."""
         # Arrange
-        self.mock_affectation_repo.find_by_date_range.return_value = [
+        self.mock_affectation_repo.find_filtered.side_effect = _filtering([
             self.affectation_user1,
             self.affectation_user2,
-        ]
+        ])
 
         # User 1: macon + coffreur
         # User 2: electricien
@@ -106,11 +117,11 @@ class TestGetPlanningMetiersFilter:
     def test_filter_by_multiple_metiers_union(self):
         """Test: filtre par plusieurs metiers - union (OR)."""
         # Arrange
-        self.mock_affectation_repo.find_by_date_range.return_value = [
+        self.mock_affectation_repo.find_filtered.side_effect = _filtering([
             self.affectation_user1,
             self.affectation_user2,
             self.affectation_user3,
-        ]
+        ])
 
         # User 1: macon + coffreur
         # User 2: electricien
@@ -147,10 +158,10 @@ class TestGetPlanningMetiersFilter:
     def test_filter_by_metier_intersection_with_user_metiers(self):
         """Test: intersection entre filtre metiers et user.metiers."""
         # Arrange
-        self.mock_affectation_repo.find_by_date_range.return_value = [
+        self.mock_affectation_repo.find_filtered.side_effect = _filtering([
             self.affectation_user1,
             self.affectation_user2,
-        ]
+        ])
 
         # User 1: macon + coffreur (a "coffreur" dans le filtre)
         # User 2: electricien (n'a pas de metier dans le filtre)
@@ -182,10 +193,10 @@ class TestGetPlanningMetiersFilter:
     def test_filter_metiers_handles_none_user_metiers(self):
         """Test: filtre metiers ignore les users avec metiers=None."""
         # Arrange
-        self.mock_affectation_repo.find_by_date_range.return_value = [
+        self.mock_affectation_repo.find_filtered.side_effect = _filtering([
             self.affectation_user1,
             self.affectation_user2,
-        ]
+        ])
 
         # User 1: metiers=None
         # User 2: electricien
@@ -217,10 +228,10 @@ class TestGetPlanningMetiersFilter:
     def test_filter_metiers_handles_empty_user_metiers(self):
         """Test: filtre metiers ignore les users avec metiers=[]."""
         # Arrange
-        self.mock_affectation_repo.find_by_date_range.return_value = [
+        self.mock_affectation_repo.find_filtered.side_effect = _filtering([
             self.affectation_user1,
             self.affectation_user2,
-        ]
+        ])
 
         # User 1: metiers=[]
         # User 2: macon
@@ -252,10 +263,10 @@ class TestGetPlanningMetiersFilter:
     def test_no_metier_filter_returns_all_users(self):
         """Test: sans filtre metier, tous les utilisateurs sont retournes."""
         # Arrange
-        self.mock_affectation_repo.find_by_date_range.return_value = [
+        self.mock_affectation_repo.find_filtered.side_effect = _filtering([
             self.affectation_user1,
             self.affectation_user2,
-        ]
+        ])
 
         self.mock_get_user_info.side_effect = lambda uid: {
             1: {"nom": "User 1", "couleur": "#3498DB", "metiers": ["macon"]},
@@ -304,10 +315,10 @@ class TestGetPlanningMetiersFilter:
             created_at=datetime.now(),
         )
 
-        self.mock_affectation_repo.find_by_date_range.return_value = [
+        self.mock_affectation_repo.find_filtered.side_effect = _filtering([
             affectation_chantier1,
             affectation_chantier2,
-        ]
+        ])
 
         # User 1 chantier 1: macon
         # User 2 chantier 2: macon (exclu par filtre chantier)
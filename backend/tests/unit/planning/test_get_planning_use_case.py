@@ -17,6 +17,17 @@ from modules.planning.application.use_cases.get_planning import GetPlanningUseCa
 from modules.planning.application.dtos.planning_filters_dto import PlanningFiltersDTO
 
 
+def _filtering(affectations):
+    """Simule find_filtered : applique en memoire les filtres passes a la base."""
+    def find_filtered(date_debut, date_fin, utilisateur_ids=None, chantier_ids=None):
+        return [
+            a for a in affectations
+            if (utilisateur_ids is None or a.utilisateur_id in utilisateur_ids)
+            and (chantier_ids is None or a.chantier_id in chantier_ids)
+        ]
+    return find_filtered
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
@@ -130,7 +141,7 @@ class TestGetPlanningAdmin:
     ):
         """Test: admin voit toutes les affectations."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations)
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -151,7 +162,7 @@ class TestGetPlanningAdmin:
     ):
         """Test: administrateur (variante) voit tout."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations)
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -180,7 +191,7 @@ class TestGetPlanningConducteur:
     ):
         """Test: conducteur voit toutes les affectations."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations)
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -201,7 +212,7 @@ class TestGetPlanningConducteur:
     ):
         """Test: conducteur_travaux (variante) voit tout."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations)
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -230,7 +241,7 @@ class TestGetPlanningChefChantier:
     ):
         """Test: chef de chantier voit seulement ses chantiers."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations)
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -267,7 +278,7 @@ class TestGetPlanningChefChantier:
                 created_by=3,
             ),
         ]
-        mock_affectation_repository.find_by_date_range.return_value = affectations
+        mock_affectation_repository.find_filtered.side_effect = _filtering(affectations)
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -297,7 +308,7 @@ class TestGetPlanningCompagnon:
     ):
         """Test: compagnon voit uniquement ses affectations."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations)
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -320,7 +331,7 @@ class TestGetPlanningCompagnon:
     ):
         """Test: ouvrier (variante) voit uniquement ses affectations."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations)
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -350,7 +361,7 @@ class TestGetPlanningUnknownRole:
     ):
         """Test: role inconnu = securite minimale (voir que soi)."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations)
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -381,7 +392,7 @@ class TestGetPlanningFilters:
     ):
         """Test: filtre par IDs utilisateurs."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations)
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -405,7 +416,7 @@ class TestGetPlanningFilters:
     ):
         """Test: filtre par IDs chantiers."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations)
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -429,7 +440,7 @@ class TestGetPlanningFilters:
     ):
         """Test: filtre par metiers."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations)
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -453,7 +464,7 @@ class TestGetPlanningFilters:
     ):
         """Test: appel du repository avec la plage de dates."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = []
+        mock_affectation_repository.find_filtered.side_effect = _filtering([])
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -467,10 +478,13 @@ class TestGetPlanningFilters:
         )
 
         # Assert
-        mock_affectation_repository.find_by_date_range.assert_called_once_with(
+        mock_affectation_repository.find_filtered.assert_called_once_with(
             date(2026, 1, 20),
             date(2026, 1, 26),
+            utilisateur_ids=None,
+            chantier_ids=None,
         )
+        mock_affectation_repository.find_by_date_range.assert_not_called()
 
 
 # =============================================================================
@@ -485,7 +499,7 @@ class TestGetPlanningEnrichment:
     ):
         """Test: enrichissement avec les infos utilisateur."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations[:1]
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations[:1])
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -508,7 +522,7 @@ class TestGetPlanningEnrichment:
     ):
         """Test: enrichissement avec les infos chantier."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations[:1]
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations[:1])
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -530,7 +544,7 @@ class TestGetPlanningEnrichment:
     ):
         """Test: fonctionne sans fonctions d'enrichissement."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = sample_affectations[:1]
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations[:1])
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -653,7 +667,7 @@ class TestGetPlanningEdgeCases:
     ):
         """Test: retourne liste vide si pas d'affectations."""
         # Arrange
-        mock_affectation_repository.find_by_date_range.return_value = []
+        mock_affectation_repository.find_filtered.side_effect = _filtering([])
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -681,7 +695,7 @@ class TestGetPlanningEdgeCases:
             date=date(2026, 1, 22),
             created_by=3,
         )
-        mock_affectation_repository.find_by_date_range.return_value = [affectation]
+        mock_affectation_repository.find_filtered.side_effect = _filtering([affectation])
         filters = PlanningFiltersDTO(
             date_debut=date(2026, 1, 20),
             date_fin=date(2026, 1, 26),
@@ -697,3 +711,77 @@ class TestGetPlanningEdgeCases:
         # Assert
         assert len(result) == 1
         assert result[0].utilisateur_nom is None  # Pas d'info trouvee
+
+
+# =============================================================================
+# Tests Filtres pousses en base
+# =============================================================================
+
+class TestGetPlanningSqlPredicates:
+    """Tests du perimetre role + filtres transmis au repository."""
+
+    def test_should_push_chef_scope_intersected_with_filter(
+        self, use_case, mock_affectation_repository
+    ):
+        """Test: chef -> ses chantiers, intersectes avec le filtre demande."""
+        mock_affectation_repository.find_filtered.return_value = []
+        filters = PlanningFiltersDTO(
+            date_debut=date(2026, 1, 1),
+            date_fin=date(2026, 1, 31),
+            chantier_ids=[20, 30],
+        )
+
+        use_case.execute(filters=filters, current_user_id=3, current_user_role="chef_chantier")
+
+        mock_affectation_repository.find_filtered.assert_called_once_with(
+            date(2026, 1, 1),
+            date(2026, 1, 31),
+            utilisateur_ids=None,
+            chantier_ids=[20],
+        )
+
+    def test_should_push_compagnon_scope_as_utilisateur_ids(
+        self, use_case, mock_affectation_repository
+    ):
+        """Test: compagnon -> uniquement son ID, meme si d'autres sont demandes."""
+        mock_affectation_repository.find_filtered.return_value = []
+        filters = PlanningFiltersDTO(
+            date_debut=date(2026, 1, 1),
+            date_fin=date(2026, 1, 31),
+            utilisateur_ids=[2, 5],
+        )
+
+        use_case.execute(filters=filters, current_user_id=5, current_user_role="compagnon")
+
+        call_kwargs = mock_affectation_repository.find_filtered.call_args[1]
+        assert call_kwargs["utilisateur_ids"] == [5]
+        assert call_kwargs["chantier_ids"] is None
+
+    def test_should_enrich_in_batch_when_available(
+        self, mock_affectation_repository, sample_affectations
+    ):
+        """Test: une seule recuperation par lot pour users et chantiers."""
+        get_user_info = Mock()
+        get_chantier_info = Mock()
+        get_users_info = Mock(return_value={1: {"nom": "Jean Dupont"}})
+        get_chantiers_info = Mock(return_value={10: {"nom": "Villa Lyon"}})
+        use_case = GetPlanningUseCase(
+            affectation_repo=mock_affectation_repository,
+            get_user_info=get_user_info,
+            get_chantier_info=get_chantier_info,
+            get_users_info=get_users_info,
+            get_chantiers_info=get_chantiers_info,
+        )
+        mock_affectation_repository.find_filtered.side_effect = _filtering(sample_affectations)
+        filters = PlanningFiltersDTO(date_debut=date(2026, 1, 20), date_fin=date(2026, 1, 26))
+
+        result = use_case.execute(filters=filters, current_user_id=99, current_user_role="admin")
+
+        get_users_info.assert_called_once_with([1, 2])
+        get_chantiers_info.assert_called_once_with([10, 20])
+        get_user_info.assert_not_called()
+        get_chantier_info.assert_not_called()
+        assert result[0].utilisateur_nom == "Jean Dupont"
+        assert result[0].chantier_nom == "Villa Lyon"
+        # Utilisateur absent du lot : pas d'infos, sans appel unitaire
+        assert result[1].utilisateur_nom is None
@@ -131,6 +131,18 @@ class TestBulkCreateFromPlanningUseCase:
         assert result.utilisateur_id == 1
 
 
+def _total_chantier(chantier_id, total_minutes, nombre_utilisateurs):
+    """Ligne retournée par PointageRepository.totaux groupé par chantier."""
+    return {
+        "chantier_id": chantier_id,
+        "nombre": nombre_utilisateurs,
+        "nombre_utilisateurs": nombre_utilisateurs,
+        "heures_normales_minutes": total_minutes,
+        "heures_supplementaires_minutes": 0,
+        "total_minutes": total_minutes,
+    }
+
+
 class TestCompareEquipesUseCase:
     """Tests pour CompareEquipesUseCase (FDH-15)."""
 
@@ -141,47 +153,30 @@ class TestCompareEquipesUseCase:
 
     def test_compare_equipes_success(self):
         """Test comparaison réussie."""
-        # Mock pointages avec total_heures - utilise Mock pour total_heures
-        total_heures1 = Mock()
-        total_heures1.total_minutes = 480
-
-        pointage1 = Mock()
-        pointage1.chantier_id = 10
-        pointage1.chantier_nom = "Chantier A"
-        pointage1.utilisateur_id = 1
-        pointage1.total_heures = total_heures1
-
-        total_heures2 = Mock()
-        total_heures2.total_minutes = 450
-
-        pointage2 = Mock()
-        pointage2.chantier_id = 10
-        pointage2.chantier_nom = "Chantier A"
-        pointage2.utilisateur_id = 2
-        pointage2.total_heures = total_heures2
-
-        self.pointage_repo.search.return_value = ([pointage1, pointage2], 2)
+        # 2 compagnons, 480 + 450 minutes sur le chantier 10
+        self.pointage_repo.totaux.return_value = [_total_chantier(10, 930, 2)]
 
         result = self.use_case.execute(
-            semaine_debut=date(2026, 1, 19),
+            semaine_debut=date(2026, 1, 21),
         )
 
         assert "Semaine" in result.semaine
         assert len(result.equipes) == 1
         assert result.equipes[0].chantier_id == 10
+        assert result.equipes[0].total_heures_realisees == 15.5
+        assert result.equipes[0].total_heures_planifiees == 70.0
+        assert result.equipes[0].nombre_utilisateurs == 2
+        # Agrégat SQL de la semaine (lundi -> dimanche), pas de chargement d'entités
+        self.pointage_repo.totaux.assert_called_once_with(
+            date_debut=date(2026, 1, 19),
+            date_fin=date(2026, 1, 25),
+            grouper_par=("chantier_id",),
+        )
+        self.pointage_repo.search.assert_not_called()
 
     def test_compare_equipes_with_ecarts(self):
         """Test détection des écarts."""
-        total_heures = Mock()
-        total_heures.total_minutes = 600  # 10h
-
-        pointage = Mock()
-        pointage.chantier_id = 10
-        pointage.chantier_nom = "Chantier A"
-        pointage.utilisateur_id = 1
-        pointage.total_heures = total_heures
-
-        self.pointage_repo.search.return_value = ([pointage], 1)
+        self.pointage_repo.totaux.return_value = [_total_chantier(10, 600, 1)]  # 10h
 
         result = self.use_case.execute(
             semaine_debut=date(2026, 1, 19),
@@ -195,7 +190,7 @@ class TestCompareEquipesUseCase:
 
     def test_compare_equipes_empty(self):
         """Test sans pointages."""
-        self.pointage_repo.search.return_value = ([], 0)
+        self.pointage_repo.totaux.return_value = []
 
         result = self.use_case.execute(semaine_debut=date(2026, 1, 19))
 
@@ -203,6 +198,17 @@ class TestCompareEquipesUseCase:
         assert result.ecarts_detectes == []
 
 
+def _total_semaine(total_minutes):
+    """Ligne retournée par PointageRepository.totaux sans regroupement."""
+    return [{
+        "nombre": 5,
+        "nombre_utilisateurs": 1,
+        "heures_normales_minutes": total_minutes,
+        "heures_supplementaires_minutes": 0,
+        "total_minutes": total_minutes,
+    }]
+
+
 class TestGetJaugeAvancementUseCase:
     """Tests pour GetJaugeAvancementUseCase (FDH-14)."""
 
@@ -213,13 +219,7 @@ class TestGetJaugeAvancementUseCase:
 
     def test_jauge_normal(self):
         """Test jauge dans la normale (90-110%)."""
-        total_heures = Mock()
-        total_heures.total_minutes = 35 * 60  # 35h = 2100 minutes
-
-        pointage = Mock()
-        pointage.total_heures = total_heures
-
-        self.pointage_repo.find_by_utilisateur_and_semaine.return_value = [pointage]
+        self.pointage_repo.totaux.return_value = _total_semaine(35 * 60)  # 35h
 
         result = self.use_case.execute(
             utilisateur_id=1,
@@ -229,16 +229,16 @@ class TestGetJaugeAvancementUseCase:
 
         assert result.status == "normal"
         assert result.taux_completion == 100.0
+        self.pointage_repo.totaux.assert_called_once_with(
+            date_debut=date(2026, 1, 19),
+            date_fin=date(2026, 1, 25),
+            utilisateur_id=1,
+        )
+        self.pointage_repo.find_by_utilisateur_and_semaine.assert_not_called()
 
     def test_jauge_en_retard(self):
         """Test jauge en retard (<90%)."""
-        total_heures = Mock()
-        total_heures.total_minutes = 25 * 60  # 25h = 1500 minutes
-
-        pointage = Mock()
-        pointage.total_heures = total_heures
-
-        self.pointage_repo.find_by_utilisateur_and_semaine.return_value = [pointage]
+        self.pointage_repo.totaux.return_value = _total_semaine(25 * 60)  # 25h
 
         result = self.use_case.execute(
             utilisateur_id=1,
@@ -251,13 +251,7 @@ class TestGetJaugeAvancementUseCase:
 
     def test_jauge_en_avance(self):
         """Test jauge en avance (>110%)."""
-        total_heures = Mock()
-        total_heures.total_minutes = 40 * 60  # 40h = 2400 minutes
-
-        pointage = Mock()
-        pointage.total_heures = total_heures
-
-        self.pointage_repo.find_by_utilisateur_and_semaine.return_value = [pointage]
+        self.pointage_repo.totaux.return_value = _total_semaine(40 * 60)  # 40h
 
         result = self.use_case.execute(
             utilisateur_id=1,
@@ -270,7 +264,7 @@ class TestGetJaugeAvancementUseCase:
 
     def test_jauge_default_planifie(self):
         """Test jauge avec heures planifiées par défaut (35h)."""
-        self.pointage_repo.find_by_utilisateur_and_semaine.return_value = []
+        self.pointage_repo.totaux.return_value = []
 
         result = self.use_case.execute(
             utilisateur_id=1,
@@ -278,6 +272,7 @@ class TestGetJaugeAvancementUseCase:
         )
 
         assert result.heures_planifiees == 35.0
+        assert result.heures_realisees == 0
 
 
 class TestListPointagesUseCase:
@@ -0,0 +1,88 @@
+"""Tests de la validation par lot au niveau SQL (SQLite en mémoire)."""
+
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from modules.pointages.domain.value_objects import StatutPointage
+from modules.pointages.infrastructure.persistence.models import PointageModel
+from modules.pointages.infrastructure.persistence.sqlalchemy_pointage_repository import (
+    SQLAlchemyPointageRepository,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    PointageModel.metadata.create_all(engine, tables=[PointageModel.__table__])
+    return engine
+
+
+@pytest.fixture
+def session(engine):
+    session = sessionmaker(bind=engine)()
+    for i, statut in enumerate(["soumis", "soumis", "brouillon", "valide"], start=1):
+        session.add(
+            PointageModel(
+                id=i,
+                utilisateur_id=7,
+                chantier_id=i,
+                date_pointage=date(2026, 2, 10),
+                heures_normales_minutes=420,
+                heures_supplementaires_minutes=0,
+                statut=statut,
+                motif_rejet="ancien motif",
+            )
+        )
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def statements(engine):
+    """Instructions SQL exécutées pendant le test."""
+    executed = []
+    event.listen(
+        engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: executed.append(statement),
+    )
+    return executed
+
+
+class TestFindByIds:
+    """Tests de SQLAlchemyPointageRepository.find_by_ids."""
+
+    def test_une_requete_ids_inconnus_ignores(self, session, statements):
+        pointages = SQLAlchemyPointageRepository(session).find_by_ids([1, 3, 99, 1])
+
+        assert sorted(p.id for p in pointages) == [1, 3]
+        assert len(statements) == 1
+
+    def test_liste_vide(self, session, statements):
+        assert SQLAlchemyPointageRepository(session).find_by_ids([]) == []
+        assert statements == []
+
+
+class TestBulkValidate:
+    """Tests de SQLAlchemyPointageRepository.bulk_validate."""
+
+    def test_un_update_garde_par_statut(self, session, statements):
+        quand = datetime(2026, 2, 12, 18, 0)
+
+        validated = SQLAlchemyPointageRepository(session).bulk_validate(
+            [1, 2, 3, 4], 42, quand, [StatutPointage.SOUMIS]
+        )
+
+        assert sorted(validated) == [1, 2]
+        assert [s.split()[0] for s in statements] == ["UPDATE"]
+
+        rows = {m.id: m for m in session.query(PointageModel).all()}
+        assert rows[1].statut == "valide"
+        assert rows[1].validateur_id == 42
+        assert rows[1].validation_date == quand
+        assert rows[1].motif_rejet is None
+        assert rows[3].statut == "brouillon"
+        assert rows[4].validateur_id is None
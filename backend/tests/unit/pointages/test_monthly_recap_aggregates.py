@@ -0,0 +1,187 @@
+"""Tests des agrégats SQL des pointages (SQLite en mémoire)."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from modules.pointages.infrastructure.persistence.models import (
+    PointageModel,
+    VariablePaieModel,
+)
+from modules.pointages.infrastructure.persistence.sqlalchemy_pointage_repository import (
+    SQLAlchemyPointageRepository,
+)
+from modules.pointages.infrastructure.persistence.sqlalchemy_variable_paie_repository import (
+    SQLAlchemyVariablePaieRepository,
+)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    PointageModel.metadata.create_all(
+        engine, tables=[PointageModel.__table__, VariablePaieModel.__table__]
+    )
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _pointage(session, utilisateur_id, jour, normales, sup=0, statut="valide", chantier_id=1):
+    model = PointageModel(
+        utilisateur_id=utilisateur_id,
+        chantier_id=chantier_id,
+        date_pointage=jour,
+        heures_normales_minutes=normales,
+        heures_supplementaires_minutes=sup,
+        statut=statut,
+    )
+    session.add(model)
+    session.flush()
+    return model
+
+
+def _variable(session, pointage, type_variable, valeur):
+    session.add(
+        VariablePaieModel(
+            pointage_id=pointage.id,
+            type_variable=type_variable,
+            valeur=Decimal(valeur),
+            date_application=pointage.date_pointage,
+        )
+    )
+
+
+@pytest.fixture
+def janvier(session):
+    """Pointages de janvier 2026 (+ un pointage hors mois)."""
+    p1 = _pointage(session, 7, date(2026, 1, 5), 420)
+    p2 = _pointage(session, 7, date(2026, 1, 6), 480, 60)
+    _pointage(session, 7, date(2026, 1, 6), 60, statut="brouillon", chantier_id=2)
+    p4 = _pointage(session, 7, date(2026, 1, 12), 450)
+    p5 = _pointage(session, 9, date(2026, 1, 7), 480, statut="soumis")
+    hors_mois = _pointage(session, 7, date(2026, 2, 2), 480)
+
+    _variable(session, p1, "panier_repas", "10.00")
+    _variable(session, p2, "panier_repas", "10.00")
+    _variable(session, p4, "panier_repas", "12.50")
+    _variable(session, p2, "conges_payes", "3.50")
+    _variable(session, p5, "panier_repas", "10.00")
+    _variable(session, hors_mois, "panier_repas", "10.00")
+    session.commit()
+
+
+class TestTotaux:
+    """Tests de SQLAlchemyPointageRepository.totaux."""
+
+    def test_par_chantier(self, session, janvier):
+        totaux = SQLAlchemyPointageRepository(session).totaux(
+            date(2026, 1, 5), date(2026, 1, 11), grouper_par=("chantier_id",)
+        )
+
+        assert totaux == [
+            {"chantier_id": 1, "nombre": 3, "nombre_utilisateurs": 2,
+             "heures_normales_minutes": 1380, "heures_supplementaires_minutes": 60,
+             "total_minutes": 1440},
+            {"chantier_id": 2, "nombre": 1, "nombre_utilisateurs": 1,
+             "heures_normales_minutes": 60, "heures_supplementaires_minutes": 0,
+             "total_minutes": 60},
+        ]
+
+    def test_sans_regroupement(self, session, janvier):
+        repo = SQLAlchemyPointageRepository(session)
+
+        totaux = repo.totaux(date(2026, 1, 5), date(2026, 1, 11), utilisateur_id=7)
+
+        assert totaux == [
+            {"nombre": 3, "nombre_utilisateurs": 1, "heures_normales_minutes": 960,
+             "heures_supplementaires_minutes": 60, "total_minutes": 1020},
+        ]
+        assert repo.totaux(date(2025, 1, 5), date(2025, 1, 11)) == []
+
+    def test_utilisateurs_distincts_par_semaine(self, session, janvier):
+        totaux = SQLAlchemyPointageRepository(session).totaux(
+            date(2026, 1, 1), date(2026, 1, 31),
+            grouper_par=("semaine_debut",), chantier_id=1,
+        )
+
+        assert [
+            (t["semaine_debut"], t["nombre"], t["nombre_utilisateurs"]) for t in totaux
+        ] == [
+            (date(2026, 1, 5), 3, 2),
+            (date(2026, 1, 12), 1, 1),
+        ]
+
+    def test_axe_inconnu(self, session):
+        with pytest.raises(ValueError):
+            SQLAlchemyPointageRepository(session).totaux(
+                date(2026, 1, 1), date(2026, 1, 31), grouper_par=("date_pointage",)
+            )
+
+
+class TestTotauxParSemaine:
+    """Tests de SQLAlchemyPointageRepository.totaux_par_semaine."""
+
+    def test_totaux_par_utilisateur_semaine_statut(self, session, janvier):
+        totaux = SQLAlchemyPointageRepository(session).totaux_par_semaine(
+            date(2026, 1, 1), date(2026, 1, 31)
+        )
+
+        assert [
+            (t["utilisateur_id"], t["semaine_debut"], t["statut"], t["nombre"],
+             t["heures_normales_minutes"], t["heures_supplementaires_minutes"])
+            for t in totaux
+        ] == [
+            (7, date(2026, 1, 5), "brouillon", 1, 60, 0),
+            (7, date(2026, 1, 5), "valide", 2, 900, 60),
+            (7, date(2026, 1, 12), "valide", 1, 450, 0),
+            (9, date(2026, 1, 5), "soumis", 1, 480, 0),
+        ]
+
+    def test_filtre_utilisateur(self, session, janvier):
+        totaux = SQLAlchemyPointageRepository(session).totaux_par_semaine(
+            date(2026, 1, 1), date(2026, 1, 31), utilisateur_id=9
+        )
+
+        assert [t["utilisateur_id"] for t in totaux] == [9]
+
+    def test_semaine_a_cheval_rattachee_au_lundi(self, session):
+        _pointage(session, 7, date(2026, 3, 1), 420)  # dimanche
+        session.commit()
+
+        totaux = SQLAlchemyPointageRepository(session).totaux_par_semaine(
+            date(2026, 3, 1), date(2026, 3, 31)
+        )
+
+        assert totaux[0]["semaine_debut"] == date(2026, 2, 23)
+
+
+class TestTotauxParType:
+    """Tests de SQLAlchemyVariablePaieRepository.totaux_par_type."""
+
+    def test_totaux_par_utilisateur_et_type(self, session, janvier):
+        totaux = SQLAlchemyVariablePaieRepository(session).totaux_par_type(
+            date(2026, 1, 1), date(2026, 1, 31)
+        )
+
+        assert [
+            (t["utilisateur_id"], t["type_variable"], t["nombre"], t["total"],
+             t["valeur_min"], t["valeur_max"])
+            for t in totaux
+        ] == [
+            (7, "conges_payes", 1, Decimal("3.50"), Decimal("3.50"), Decimal("3.50")),
+            (7, "panier_repas", 3, Decimal("32.50"), Decimal("10.00"), Decimal("12.50")),
+            (9, "panier_repas", 1, Decimal("10.00"), Decimal("10.00"), Decimal("10.00")),
+        ]
+
+    def test_filtre_utilisateur(self, session, janvier):
+        totaux = SQLAlchemyVariablePaieRepository(session).totaux_par_type(
+            date(2026, 1, 1), date(2026, 1, 31), utilisateur_id=9
+        )
+
+        assert [(t["utilisateur_id"], t["type_variable"]) for t in totaux] == [
+            (9, "panier_repas")
+        ]
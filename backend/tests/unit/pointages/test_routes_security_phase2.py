@@ -55,8 +55,8 @@ class TestBulkValidateSecurityP2_001:
         # _get_chef_chantier_ids uses fetchall(), not scalars().all()
         db.execute.return_value.fetchall.return_value = [(1,), (2,), (3,)]
 
-        # controller.get_pointage is called for each pointage_id to check chantier
-        controller.get_pointage.return_value = {"chantier_id": 1}
+        # Chantier de chaque pointage, chargé en une requête
+        controller.get_pointages_chantier_ids.return_value = {1: 1, 2: 1, 3: 1}
 
         controller.bulk_validate_pointages.return_value = {
             "success_count": 3,
@@ -173,7 +173,7 @@ class TestMonthlyRecapSecurityP2_002:
         )
 
         # Assert
-        controller.generate_monthly_recap.assert_called_once_with(7, 2026, 1, False)
+        controller.generate_monthly_recap.assert_called_once_with(7, 2026, 1)
         assert result["utilisateur_id"] == 7
 
     def test_monthly_recap_compagnon_other_data_forbidden(self):
@@ -286,6 +286,30 @@ class TestMonthlyRecapSecurityP2_002:
         # Assert
         controller.generate_monthly_recap.assert_called_once()
 
+    def test_monthly_recap_pdf_streamed_back(self):
+        """L'export PDF est renvoyé dans la réponse, sans chemin sur le serveur."""
+        controller = MagicMock()
+        controller.export_monthly_recap_pdf.return_value = (
+            b"%PDF-recap",
+            "recap_mensuel_user7_2026_01.pdf",
+        )
+
+        response = get_monthly_recap(
+            utilisateur_id=7,
+            year=2026,
+            month=1,
+            export_pdf=True,
+            current_user_id=7,
+            current_user_role="compagnon",
+            controller=controller,
+        )
+
+        controller.export_monthly_recap_pdf.assert_called_once_with(7, 2026, 1)
+        controller.generate_monthly_recap.assert_not_called()
+        assert response.body == b"%PDF-recap"
+        assert response.media_type == "application/pdf"
+        assert "recap_mensuel_user7_2026_01.pdf" in response.headers["content-disposition"]
+
 
 class TestLockPeriodSecurityP2_006:
     """
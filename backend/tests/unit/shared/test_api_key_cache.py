@@ -0,0 +1,209 @@
+"""Tests unitaires du cache des clés API vérifiées et du tracker d'usage."""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.auth.infrastructure.persistence import UserModel  # noqa: F401 (FK users)
+from modules.auth.infrastructure.persistence.api_key_model import APIKeyModel
+from shared.infrastructure.api_v1.api_key_cache import (
+    APIKeyUsageTracker,
+    APIKeyVerificationCache,
+    VerifiedAPIKey,
+)
+from shared.infrastructure.scheduler.jobs import FlushAPIKeyUsageJob
+
+
+class FakeClock:
+    """Horloge controlable pour simuler l'ecoulement du temps."""
+
+    def __init__(self, now: float = 1_800_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cle(key_id: str = "key-1", limite: int = 1000, expires_at=None) -> VerifiedAPIKey:
+    return VerifiedAPIKey(
+        key_id=key_id, user_id=1, rate_limit_per_hour=limite, expires_at=expires_at
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def db_session():
+    """Session SQLite en memoire avec la table api_keys."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    APIKeyModel.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    for key_id in ("key-1", "key-2"):
+        session.execute(
+            text(
+                "INSERT INTO api_keys (id, key_hash, key_prefix, user_id, nom) "
+                "VALUES (:id, :hash, 'hbc_xxxx', 1, 'ERP')"
+            ),
+            {"id": key_id, "hash": key_id * 8},
+        )
+    session.commit()
+    yield session
+    session.close()
+
+
+class TestAPIKeyVerificationCache:
+    """Tests du cache des clés vérifiées."""
+
+    def test_hit_avant_ttl_puis_expiration(self, clock):
+        cache = APIKeyVerificationCache(ttl_seconds=30, clock=clock)
+        cache.put("h1", _cle())
+
+        assert cache.get("h1") == _cle()
+        clock.now += 31
+        assert cache.get("h1") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_invalidate_key_retire_la_cle_revoquee(self, clock):
+        cache = APIKeyVerificationCache(clock=clock)
+        cache.put("h1", _cle("key-1"))
+        cache.put("h2", _cle("key-2"))
+
+        assert cache.invalidate_key("key-1") is True
+        assert cache.get("h1") is None
+        assert cache.get("h2") is not None
+        assert cache.invalidate_key("key-1") is False
+
+    def test_ttl_nul_desactive_le_cache(self, clock):
+        cache = APIKeyVerificationCache(ttl_seconds=0, clock=clock)
+        cache.put("h1", _cle())
+
+        assert cache.get("h1") is None
+
+    def test_taille_bornee(self, clock):
+        cache = APIKeyVerificationCache(max_entries=2, clock=clock)
+        cache.put("h1", _cle("key-1"))
+        cache.put("h2", _cle("key-2"))
+        cache.put("h3", _cle("key-3"))
+
+        assert cache.get("h1") is None
+        assert cache.get("h3") is not None
+
+    def test_expiration_de_la_cle(self):
+        cle = _cle(expires_at=datetime.utcnow() - timedelta(minutes=1))
+        assert cle.is_expired() is True
+        assert _cle().is_expired() is False
+
+
+class TestAPIKeyUsageTracker:
+    """Tests du tracker d'usage et du quota horaire."""
+
+    def test_quota_horaire(self, clock):
+        tracker = APIKeyUsageTracker(clock=clock)
+
+        assert tracker.record("key-1", 2) == (True, 0)
+        assert tracker.record("key-1", 2) == (True, 0)
+        autorise, retry_after = tracker.record("key-1", 2)
+
+        assert autorise is False
+        assert 0 < retry_after <= 3601
+        assert tracker.requests_in_window("key-1") == 2
+
+    def test_nouvelle_fenetre_reinitialise_le_quota(self, clock):
+        tracker = APIKeyUsageTracker(clock=clock)
+        tracker.record("key-1", 1)
+        assert tracker.record("key-1", 1)[0] is False
+
+        clock.now += 3600
+
+        assert tracker.record("key-1", 1)[0] is True
+
+    def test_quota_nul_illimite(self, clock):
+        tracker = APIKeyUsageTracker(clock=clock)
+        for _ in range(50):
+            assert tracker.record("key-1", 0)[0] is True
+
+    def test_flush_ecrit_toutes_les_cles_en_un_lot(self, clock, db_session):
+        tracker = APIKeyUsageTracker(clock=clock)
+        for _ in range(3):
+            tracker.record("key-1", 1000)
+        tracker.record("key-2", 1000)
+
+        assert tracker.flush(db_session) == 2
+        assert tracker.pending() == 0
+
+        rows = dict(
+            db_session.execute(
+                text("SELECT id, request_count FROM api_keys ORDER BY id")
+            ).fetchall()
+        )
+        assert rows == {"key-1": 3, "key-2": 1}
+        last_used = db_session.execute(
+            text("SELECT last_used_at FROM api_keys WHERE id = 'key-1'")
+        ).scalar()
+        assert last_used is not None
+
+        # Les compteurs s'ajoutent au flush suivant
+        tracker.record("key-1", 1000)
+        tracker.flush(db_session)
+        assert db_session.execute(
+            text("SELECT request_count FROM api_keys WHERE id = 'key-1'")
+        ).scalar() == 4
+
+    def test_flush_sans_usage_ne_touche_pas_la_base(self, clock):
+        tracker = APIKeyUsageTracker(clock=clock)
+        session = Mock()
+
+        assert tracker.flush(session) == 0
+        session.execute.assert_not_called()
+
+    def test_flush_en_echec_restitue_les_compteurs(self, clock):
+        tracker = APIKeyUsageTracker(clock=clock)
+        tracker.record("key-1", 1000)
+        session = Mock()
+        session.execute.side_effect = RuntimeError("DB down")
+
+        with pytest.raises(RuntimeError):
+            tracker.flush(session)
+
+        session.rollback.assert_called_once()
+        assert tracker.pending() == 1
+
+
+class TestFlushAPIKeyUsageJob:
+    """Tests du job planifie d'ecriture de l'usage."""
+
+    def test_execute_flush_et_ferme_la_session(self, clock, db_session):
+        tracker = APIKeyUsageTracker(clock=clock)
+        tracker.record("key-1", 1000)
+        db_session.close = Mock()
+
+        job = FlushAPIKeyUsageJob(lambda: db_session, tracker=tracker)
+
+        assert job.execute() == 1
+        db_session.close.assert_called_once()
+
+    def test_execute_sans_usage_n_ouvre_pas_de_session(self, clock):
+        factory = Mock()
+        job = FlushAPIKeyUsageJob(factory, tracker=APIKeyUsageTracker(clock=clock))
+
+        assert job.execute() == 0
+        factory.assert_not_called()
+
+    def test_register_ajoute_un_job_intervalle(self):
+        scheduler = Mock()
+
+        FlushAPIKeyUsageJob.register(scheduler, Mock())
+
+        scheduler.add_interval_job.assert_called_once()
+        assert scheduler.add_interval_job.call_args.kwargs["job_id"] == "flush_api_key_usage"
@@ -0,0 +1,145 @@
+"""Tests de la couche de sessions asynchrones (get_async_db / run_in_session)."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from modules.auth.infrastructure.persistence import UserModel
+from modules.auth.infrastructure.persistence.sqlalchemy_user_repository import (
+    SQLAlchemyUserRepository,
+)
+from modules.chantiers.infrastructure.persistence import ChantierModel
+from modules.devis.infrastructure.persistence import models as _devis_models  # noqa: F401
+from shared.infrastructure.database import (
+    async_database_url,
+    create_async_database_engine,
+    run_in_session,
+)
+from shared.infrastructure.reference_directory import (
+    get_reference_directory,
+    refresh_reference_source,
+    register_reference_source,
+)
+
+
+class TestAsyncDatabaseUrl:
+    """Conversion des URLs vers les pilotes asynchrones."""
+
+    @pytest.mark.parametrize("url, attendu", [
+        ("sqlite:///./data/hub.db", "sqlite+aiosqlite:///./data/hub.db"),
+        (
+            "postgresql://hub:secret@db:5432/hub",
+            "postgresql+asyncpg://hub:secret@db:5432/hub",
+        ),
+        (
+            "postgresql+psycopg2://hub:secret@db/hub",
+            "postgresql+asyncpg://hub:secret@db/hub",
+        ),
+        ("sqlite+aiosqlite:///hub.db", "sqlite+aiosqlite:///hub.db"),
+    ])
+    def test_conversion(self, url, attendu):
+        assert async_database_url(url) == attendu
+
+    def test_backend_sans_pilote_asynchrone(self):
+        with pytest.raises(ValueError):
+            async_database_url("mssql+pyodbc://hub@dsn")
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    engine = create_engine(url)
+    UserModel.metadata.create_all(
+        engine, tables=[UserModel.__table__, ChantierModel.__table__]
+    )
+    with sessionmaker(bind=engine)() as session:
+        session.add_all([
+            UserModel(
+                id=i, email=f"u{i}@ex.fr", password_hash="x", prenom=f"P{i}",
+                nom=f"N{i}", role="compagnon", type_utilisateur="employe",
+            )
+            for i in (1, 2)
+        ])
+        session.commit()
+    yield url, engine
+    engine.dispose()
+
+
+class TestRunInSession:
+    """Exécution du code ORM synchrone sur une session asynchrone."""
+
+    def test_repository_synchrone(self, database_url):
+        url, _ = database_url
+
+        async def lire():
+            async_engine = create_async_database_engine(url)
+            try:
+                async with AsyncSession(async_engine) as db:
+                    return await run_in_session(
+                        db, lambda session: SQLAlchemyUserRepository(session).find_by_ids([1, 2])
+                    )
+            finally:
+                await async_engine.dispose()
+
+        users = asyncio.run(lire())
+
+        assert sorted(u.nom for u in users) == ["N1", "N2"]
+
+    def test_annuaire_charge_par_le_moteur_synchrone(self, database_url):
+        url, engine = database_url
+
+        async def lire():
+            async_engine = create_async_database_engine(url)
+            register_reference_source(async_engine.sync_engine, engine)
+            try:
+                await refresh_reference_source(async_engine.sync_engine)
+                async with AsyncSession(async_engine) as db:
+                    return await run_in_session(db, get_reference_directory)
+            finally:
+                await async_engine.dispose()
+
+        directory = asyncio.run(lire())
+
+        assert directory is not None
+        assert directory.get_user(2)["nom"] == "N2"
+
+    def test_annuaire_jamais_charge_dans_la_boucle(self, database_url):
+        url, _ = database_url
+        # Moteur source dédié : aucun annuaire déjà chargé pour lui
+        source = create_engine(url)
+        requetes = []
+        event.listen(
+            source, "before_cursor_execute",
+            lambda conn, cursor, statement, *args: requetes.append(statement),
+        )
+
+        async def lire():
+            async_engine = create_async_database_engine(url)
+            register_reference_source(async_engine.sync_engine, source)
+            try:
+                async with AsyncSession(async_engine) as db:
+                    return await run_in_session(db, get_reference_directory)
+            finally:
+                await async_engine.dispose()
+
+        # Sans refresh_reference_source préalable : repli sur la base, sans
+        # requête bloquante sur le moteur synchrone
+        assert asyncio.run(lire()) is None
+        assert requetes == []
+        source.dispose()
+
+    def test_sans_source_pas_d_annuaire(self, database_url):
+        url, _ = database_url
+
+        async def lire():
+            async_engine = create_async_database_engine(url)
+            try:
+                async with AsyncSession(async_engine) as db:
+                    return await run_in_session(db, get_reference_directory)
+            finally:
+                await async_engine.dispose()
+
+        assert asyncio.run(lire()) is None
@@ -0,0 +1,44 @@
+"""Tests unitaires pour le support ETag / If-None-Match."""
+
+from datetime import date
+
+from shared.infrastructure.web.etag import compute_etag, etag_matches
+
+
+class TestComputeEtag:
+    """Tests du calcul de l'ETag."""
+
+    def test_etag_stable_pour_un_meme_contenu(self):
+        payload = [{"id": 1, "date": date(2026, 1, 5), "nom": "A"}]
+        assert compute_etag(payload) == compute_etag(list(payload))
+
+    def test_etag_independant_de_l_ordre_des_cles(self):
+        assert compute_etag({"a": 1, "b": 2}) == compute_etag({"b": 2, "a": 1})
+
+    def test_etag_change_avec_le_contenu(self):
+        assert compute_etag([{"id": 1}]) != compute_etag([{"id": 2}])
+
+    def test_etag_faible(self):
+        assert compute_etag([]).startswith('W/"')
+
+
+class TestEtagMatches:
+    """Tests de la comparaison If-None-Match."""
+
+    def test_sans_en_tete(self):
+        assert etag_matches(None, 'W/"abc"') is False
+
+    def test_correspondance_exacte(self):
+        assert etag_matches('W/"abc"', 'W/"abc"') is True
+
+    def test_comparaison_faible(self):
+        assert etag_matches('"abc"', 'W/"abc"') is True
+
+    def test_liste_d_etags(self):
+        assert etag_matches('"xyz", W/"abc"', 'W/"abc"') is True
+
+    def test_etoile(self):
+        assert etag_matches("*", 'W/"abc"') is True
+
+    def test_etag_different(self):
+        assert etag_matches('W/"xyz"', 'W/"abc"') is False
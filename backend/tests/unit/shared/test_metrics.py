@@ -0,0 +1,230 @@
+"""Tests des métriques de performance (registre, middleware, /metrics)."""
+
+import asyncio
+import logging
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from shared.application.instrumentation import timed
+from shared.infrastructure import metrics
+from shared.infrastructure.cache import TTLCache
+from shared.infrastructure.config import Settings
+from shared.infrastructure.event_bus import DomainEvent
+from shared.infrastructure.event_bus.event_bus import EventBus
+from shared.infrastructure.metrics import (
+    EVENT_HANDLER_DURATION,
+    EVENT_HANDLER_ERRORS,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUEST_SQL_QUERIES,
+    SCHEDULER_JOB_DURATION,
+    SCHEDULER_JOB_ERRORS,
+    USE_CASE_DURATION,
+    Histogram,
+    MetricsRegistry,
+    registry,
+    timed_job,
+)
+from shared.infrastructure.web.metrics_middleware import MetricsMiddleware
+from shared.infrastructure.web.metrics_routes import router as metrics_router
+
+
+@pytest.fixture
+def actives():
+    """Active les métriques le temps d'un test."""
+    registry.reset()
+    metrics.enable_metrics()
+    yield
+    metrics.disable_metrics()
+    registry.reset()
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
+
+    @app.get("/api/devis/{devis_id}")
+    def get_devis(devis_id: int):
+        with engine.connect() as conn:
+            for _ in range(devis_id):
+                conn.execute(text("SELECT 1"))
+        return {"id": devis_id}
+
+    return TestClient(app)
+
+
+class TestRegistry:
+    """Rendu au format d'exposition Prometheus."""
+
+    def test_histogramme_cumule(self):
+        reg = MetricsRegistry()
+        histo = reg.histogram("duree_seconds", "Durée.", ("route",), buckets=(0.1, 1.0))
+        histo.observe(0.05, route="/a")
+        histo.observe(0.5, route="/a")
+        histo.observe(3, route="/a")
+
+        rendu = reg.render()
+
+        assert "# TYPE duree_seconds histogram" in rendu
+        assert 'duree_seconds_bucket{route="/a",le="0.1"} 1' in rendu
+        assert 'duree_seconds_bucket{route="/a",le="1"} 2' in rendu
+        assert 'duree_seconds_bucket{route="/a",le="+Inf"} 3' in rendu
+        assert 'duree_seconds_sum{route="/a"} 3.55' in rendu
+        assert 'duree_seconds_count{route="/a"} 3' in rendu
+
+    def test_echappement_des_labels(self):
+        reg = MetricsRegistry()
+        reg.counter("erreurs_total", "Erreurs.", ("handler",)).inc(handler='a"b')
+
+        assert 'erreurs_total{handler="a\\"b"} 1' in reg.render()
+
+    def test_collecteur_du_cache(self):
+        rendu = registry.render()
+
+        assert "# TYPE cache_requests_total counter" in rendu
+        assert "# TYPE cache_entries gauge" in rendu
+
+    def test_histogramme_sans_labels(self):
+        histo = Histogram("h", "H.", buckets=(1,))
+        histo.observe(2)
+
+        assert 'h_bucket{le="+Inf"} 1' in histo.render()
+
+
+class TestMiddleware:
+    """Mesure par gabarit de route et requêtes SQL."""
+
+    def test_gabarit_de_route_et_requetes_sql(self, client, actives):
+        assert client.get("/api/devis/3").status_code == 200
+        client.get("/api/devis/1")
+
+        labels = {"method": "GET", "route": "/api/devis/{devis_id}"}
+        assert HTTP_REQUEST_DURATION.count(status="200", **labels) == 2
+        assert HTTP_REQUEST_SQL_QUERIES.sum(**labels) == 4
+
+    def test_route_inconnue(self, client, actives):
+        client.get("/inconnue")
+
+        assert HTTP_REQUEST_DURATION.count(method="GET", route="unmatched", status="404") == 1
+
+    def test_requete_lente_journalisee_avec_sql(self, client, actives, caplog):
+        with patch("shared.infrastructure.web.metrics_middleware.settings") as settings:
+            settings.SLOW_REQUEST_MS = 0.0001
+            with caplog.at_level(logging.WARNING):
+                client.get("/api/devis/2")
+
+        message = next(r.getMessage() for r in caplog.records if "Requête lente" in r.getMessage())
+        assert "GET /api/devis/{devis_id} (200)" in message
+        assert "2 requêtes SQL" in message
+        assert "SELECT 1" in message
+
+    def test_sql_hors_requete_ignore(self, engine, actives):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert HTTP_REQUEST_SQL_QUERIES.count(method="GET", route="unmatched") == 0
+
+
+class TestMetricsRoute:
+    """Exposition et protection par jeton."""
+
+    def test_exposition(self, client, actives):
+        client.get("/api/devis/1")
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'route="/api/devis/{devis_id}"' in response.text
+
+    def test_jeton_exige(self, client, actives):
+        with patch("shared.infrastructure.web.metrics_routes.settings") as settings:
+            settings.METRICS_TOKEN = "secret"
+            assert client.get("/metrics").status_code == 401
+            autorise = client.get("/metrics", headers={"Authorization": "Bearer secret"})
+
+        assert autorise.status_code == 200
+
+    def test_jeton_obligatoire_hors_debug(self, monkeypatch):
+        monkeypatch.setenv("DEBUG", "false")
+        monkeypatch.setenv("SECRET_KEY", "x" * 32)
+        monkeypatch.setenv("ENCRYPTION_KEY", "y" * 32)
+        monkeypatch.setenv("METRICS_ENABLED", "true")
+        monkeypatch.delenv("METRICS_TOKEN", raising=False)
+
+        with pytest.raises(RuntimeError, match="METRICS_TOKEN"):
+            Settings()
+
+        monkeypatch.setenv("METRICS_TOKEN", "secret")
+        assert Settings().METRICS_TOKEN == "secret"
+
+
+class _UseCase:
+    @timed
+    def execute(self, valeur):
+        return valeur * 2
+
+
+class TestInstrumentation:
+    """Use cases, handlers d'événements et jobs planifiés."""
+
+    def test_use_case_chronometre(self, actives):
+        assert _UseCase().execute(21) == 42
+
+        assert USE_CASE_DURATION.count(use_case="_UseCase") == 1
+
+    def test_use_case_sans_metriques(self):
+        registry.reset()
+        assert _UseCase().execute(1) == 2
+
+        assert USE_CASE_DURATION.count(use_case="_UseCase") == 0
+
+    def test_handlers_event_bus(self, actives):
+        bus = EventBus()
+
+        async def handler_ok(event):
+            pass
+
+        def handler_ko(event):
+            raise ValueError("boom")
+
+        bus.subscribe("devis.*", handler_ok)
+        bus.subscribe("devis.*", handler_ko)
+        asyncio.run(bus.publish(DomainEvent(event_type="devis.created", data={})))
+
+        assert EVENT_HANDLER_DURATION.count(event_type="devis.created", handler="handler_ok") == 1
+        assert EVENT_HANDLER_ERRORS.value(event_type="devis.created", handler="handler_ko") == 1
+
+    def test_job_planifie(self, actives):
+        def echoue():
+            raise RuntimeError("boom")
+
+        timed_job("ok", lambda: None)()
+        with pytest.raises(RuntimeError):
+            timed_job("ko", echoue)()
+
+        assert SCHEDULER_JOB_DURATION.count(job="ok") == 1
+        assert SCHEDULER_JOB_ERRORS.value(job="ko") == 1
+
+
+class TestCacheStats:
+    """Compteurs de succès/échecs du cache."""
+
+    def test_hits_misses(self):
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
@@ -254,6 +254,29 @@ class TestNotificationServiceSendToTokens:
 
             assert all(not success for success in result.values())
 
+    def test_send_to_tokens_chunks_of_500(self):
+        """Test decoupage en lots multicast de 500 tokens (limite FCM)."""
+        mock_messaging = MagicMock()
+        mock_messaging.Notification = Mock(return_value=Mock())
+        mock_messaging.MulticastMessage = Mock(
+            side_effect=lambda **kwargs: Mock(tokens=kwargs["tokens"])
+        )
+        mock_messaging.send_multicast.side_effect = lambda message: Mock(
+            success_count=len(message.tokens),
+            responses=[Mock(success=True) for _ in message.tokens],
+        )
+
+        with patch.dict(sys.modules, {"firebase_admin.messaging": mock_messaging}):
+            service = NotificationService()
+            service._initialized = True
+
+            tokens = [f"token{i}" for i in range(1100)]
+            result = service.send_to_tokens(tokens, NotificationPayload(title="T", body="B"))
+
+        tailles = [len(c.args[0].tokens) for c in mock_messaging.send_multicast.call_args_list]
+        assert tailles == [500, 500, 100]
+        assert len(result) == 1100
+
 
 class TestNotificationServiceSendToTopic:
     """Tests d'envoi a un topic."""
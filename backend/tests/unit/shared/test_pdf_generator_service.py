@@ -285,3 +285,82 @@ class TestGetMacro:
         macro = service._get_macro('macros.html', 'render_tache_row')
         assert macro is not None
         assert callable(macro)
+
+
+class TestGenerateRecapsMensuelsPdf:
+    """Tests pour les PDF de récapitulatifs mensuels (GAP-FDH-008)."""
+
+    @pytest.fixture
+    def recaps(self):
+        from decimal import Decimal
+        from modules.pointages.application.dtos import (
+            MonthlyRecapDTO,
+            VariablePaieSummary,
+            WeeklySummary,
+        )
+
+        def recap(utilisateur_id, nom):
+            return MonthlyRecapDTO(
+                utilisateur_id=utilisateur_id,
+                utilisateur_nom=nom,
+                year=2026,
+                month=1,
+                month_label="Janvier 2026",
+                weekly_summaries=[
+                    WeeklySummary(
+                        semaine_debut=date(2026, 1, 5),
+                        numero_semaine=2,
+                        heures_normales="15:00",
+                        heures_supplementaires="01:00",
+                        total_heures="16:00",
+                        heures_normales_decimal=15.0,
+                        heures_supplementaires_decimal=1.0,
+                        total_heures_decimal=16.0,
+                        statut="valide",
+                    )
+                ],
+                heures_normales_total="15:00",
+                heures_supplementaires_total="01:00",
+                total_heures_month="16:00",
+                heures_normales_total_decimal=15.0,
+                heures_supplementaires_total_decimal=1.0,
+                total_heures_month_decimal=16.0,
+                variables_paie=[
+                    VariablePaieSummary(
+                        type_variable="panier_repas",
+                        type_variable_libelle="Panier repas",
+                        nombre_occurrences=2,
+                        valeur_unitaire=Decimal("10.00"),
+                        montant_total=Decimal("20.00"),
+                    )
+                ],
+                variables_paie_total=Decimal("20.00"),
+                absences=[],
+                all_validated=True,
+            )
+
+        return [recap(uid, f"Compagnon {uid}") for uid in range(1, 6)]
+
+    def test_should_render_each_recap_in_order(self, recaps):
+        """Doit rendre le template réel pour chaque récapitulatif, dans l'ordre."""
+        service = PdfGeneratorService()
+
+        with patch.object(
+            service, "_html_to_pdf", side_effect=lambda html: html.encode("utf-8")
+        ):
+            contenus = service.generate_recaps_mensuels_pdf(recaps)
+
+        assert len(contenus) == 5
+        for recap, contenu in zip(recaps, contenus):
+            html = contenu.decode("utf-8")
+            assert recap.utilisateur_nom in html
+            assert "Janvier 2026" in html
+            assert "05/01/2026" in html
+            assert "Panier repas" in html
+
+    def test_should_render_single_recap(self, recaps):
+        """Doit rendre un récapitulatif seul sans pool de threads."""
+        service = PdfGeneratorService()
+
+        with patch.object(service, "_html_to_pdf", return_value=b"PDF"):
+            assert service.generate_recaps_mensuels_pdf(recaps[:1]) == [b"PDF"]
@@ -0,0 +1,257 @@
+"""Tests unitaires pour PdfRenderCache (cache disque des PDF rendus)."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from shared.infrastructure.pdf import render_cache
+from shared.infrastructure.pdf.pdf_generator_service import PdfGeneratorService
+from shared.infrastructure.pdf.render_cache import (
+    PdfRenderCache,
+    canonical_payload,
+    fingerprint_render,
+    get_pdf_render_cache,
+)
+
+
+@dataclass
+class _Dto:
+    numero: str
+    montant: Decimal
+    date_emission: date
+
+
+class _Renderer:
+    """Fonction de rendu comptant ses appels."""
+
+    def __init__(self, contenu: bytes = b"%PDF-test"):
+        self.contenu = contenu
+        self.appels = 0
+
+    def __call__(self, *args) -> bytes:
+        self.appels += 1
+        return self.contenu
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PdfRenderCache(tmp_path / "pdf", max_workers=0)
+
+
+class TestFingerprint:
+    """Tests de l'empreinte de rendu."""
+
+    def test_dataclass_et_objet_equivalents(self):
+        dto = _Dto("DEV-1", Decimal("10.50"), date(2026, 1, 5))
+        payload = canonical_payload(dto)
+
+        assert payload == {"numero": "DEV-1", "montant": "10.50", "date_emission": "2026-01-05"}
+        assert canonical_payload(SimpleNamespace(**vars(dto))) == payload
+
+    def test_empreinte_depend_des_donnees_et_de_la_version(self):
+        dto = _Dto("DEV-1", Decimal("10"), date(2026, 1, 5))
+        base = fingerprint_render("devis", "v1", dto)
+
+        assert base == fingerprint_render("devis", "v1", _Dto("DEV-1", Decimal("10"), date(2026, 1, 5)))
+        assert base != fingerprint_render("devis", "v2", dto)
+        assert base != fingerprint_render("devis", "v1", _Dto("DEV-1", Decimal("11"), date(2026, 1, 5)))
+        assert base != fingerprint_render("intervention", "v1", dto)
+
+
+class TestPdfRenderCache:
+    """Tests du cache disque."""
+
+    def test_miss_puis_hit_depuis_le_disque(self, cache):
+        renderer = _Renderer()
+        cle = cache.cle("devis", "v1", {"id": 1})
+
+        assert cache.get(cle) is None
+        assert cache.render(cle, renderer, "html") == b"%PDF-test"
+        assert cache.get(cle) == b"%PDF-test"
+        assert renderer.appels == 1
+        assert (cache.cache_dir / f"{cle}.pdf").exists()
+
+    def test_rendu_vide_non_memorise(self, cache):
+        cle = cache.cle("devis", "v1", {"id": 1})
+
+        cache.render(cle, _Renderer(b""))
+
+        assert cache.get(cle) is None
+
+    def test_prerender_dans_le_pool(self, tmp_path):
+        executor = ThreadPoolExecutor(max_workers=1)
+        cache = PdfRenderCache(tmp_path, executor=executor)
+        renderer = _Renderer()
+        cle = cache.cle("devis", "v1", {"id": 1})
+
+        assert cache.prerender(cle, renderer) is True
+        executor.shutdown(wait=True)
+
+        assert cache.get(cle) == b"%PDF-test"
+        assert renderer.appels == 1
+        # Deja disponible : pas de nouveau rendu
+        assert cache.prerender(cle, renderer) is True
+
+    @pytest.mark.asyncio
+    async def test_render_async_ne_bloque_pas_la_boucle(self, tmp_path):
+        demarre, libere = threading.Event(), threading.Event()
+
+        def renderer(*args):
+            demarre.set()
+            libere.wait(5)
+            return b"%PDF-async"
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        cache = PdfRenderCache(tmp_path, executor=executor)
+        cle = cache.cle("devis", "v1", {"id": 1})
+
+        tache = asyncio.create_task(cache.render_async(cle, renderer))
+        # La boucle reste disponible pendant le rendu
+        await asyncio.to_thread(demarre.wait, 5)
+        assert not tache.done()
+        libere.set()
+
+        assert await tache == b"%PDF-async"
+        executor.shutdown(wait=True)
+        assert cache.get(cle) == b"%PDF-async"
+
+    @pytest.mark.asyncio
+    async def test_render_async_timeout_n_annule_pas_le_rendu(self, tmp_path):
+        libere = threading.Event()
+
+        def renderer(*args):
+            libere.wait(5)
+            return b"%PDF-lent"
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        cache = PdfRenderCache(tmp_path, executor=executor, render_timeout_seconds=0.05)
+        cle = cache.cle("devis", "v1", {"id": 1})
+
+        with pytest.raises(TimeoutError):
+            await cache.render_async(cle, renderer)
+        libere.set()
+        executor.shutdown(wait=True)
+
+        # Le rendu partagé a abouti et sert les requêtes suivantes
+        assert cache.get(cle) == b"%PDF-lent"
+
+    @pytest.mark.asyncio
+    async def test_render_async_sans_pool(self, cache):
+        renderer = _Renderer()
+        cle = cache.cle("devis", "v1", {"id": 1})
+
+        assert await cache.render_async(cle, renderer) == b"%PDF-test"
+        assert cache.get(cle) == b"%PDF-test"
+
+    def test_prerender_sans_pool_ne_fait_rien(self, cache):
+        renderer = _Renderer()
+
+        assert cache.prerender(cache.cle("devis", "v1", {}), renderer) is False
+        assert renderer.appels == 0
+
+    def test_eviction_des_plus_anciens(self, tmp_path):
+        cache = PdfRenderCache(tmp_path, max_workers=0, max_fichiers=3)
+        for i in range(5):
+            cache.render(cache.cle("devis", "v1", {"id": i}), _Renderer())
+
+        assert len(list(tmp_path.glob("*.pdf"))) <= 3
+
+    def test_invalidate(self, cache):
+        cache.render(cache.cle("devis", "v1", {}), _Renderer())
+
+        assert cache.invalidate() == 1
+        assert list(cache.cache_dir.glob("*.pdf")) == []
+
+
+class TestGetPdfRenderCache:
+    """Tests de l'instance partagée du cache."""
+
+    @pytest.fixture(autouse=True)
+    def instance_isolee(self, monkeypatch):
+        monkeypatch.setattr(render_cache, "_render_cache_instance", None)
+        monkeypatch.delenv("PDF_CACHE_DIR", raising=False)
+        monkeypatch.setenv("PDF_RENDER_WORKERS", "0")
+
+    def test_repertoire_sous_le_stockage(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("UPLOAD_DIR", str(tmp_path / "uploads"))
+
+        cache = get_pdf_render_cache()
+
+        assert cache.cache_dir == tmp_path / "uploads" / "cache" / "pdf"
+        assert cache.cache_dir.is_dir()
+
+    def test_repertoire_explicite(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PDF_CACHE_DIR", str(tmp_path / "pdf"))
+
+        assert get_pdf_render_cache().cache_dir == tmp_path / "pdf"
+
+
+class TestPdfGeneratorServiceAvecCache:
+    """Tests du service PDF branche sur le cache de rendu."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        templates = tmp_path / "templates"
+        templates.mkdir()
+        (templates / "macros.html").write_text(
+            "{% macro render_tache_row(tache, level) %}{{ tache.titre }}{% endmacro %}"
+        )
+        (templates / "formulaire_rapport.html").write_text(
+            "<h1>{{ titre }}</h1><p>{{ generation_date }}</p>"
+        )
+        cache = PdfRenderCache(tmp_path / "cache", max_workers=0)
+        return PdfGeneratorService(template_dir=templates, render_cache=cache)
+
+    def _generer(self, service, titre="Formulaire securite"):
+        return service.generate_formulaire_pdf(
+            titre=titre,
+            chantier_nom="Villa Lyon",
+            categorie="securite",
+            statut="valide",
+            version=1,
+            user_nom="Jean Dupont",
+            created_at=None,
+            soumis_at=None,
+            valide_at=None,
+            valideur_nom=None,
+            champs=[{"label": "Casque", "valeur": "oui"}],
+        )
+
+    @patch(
+        "shared.infrastructure.pdf.pdf_generator_service.html_to_pdf_bytes",
+        return_value=b"%PDF-form",
+    )
+    def test_rendu_unique(self, mock_html, service):
+        assert self._generer(service) == b"%PDF-form"
+        assert self._generer(service) == b"%PDF-form"
+        assert mock_html.call_count == 1
+
+        self._generer(service, titre="Autre formulaire")
+        assert mock_html.call_count == 2
+
+    @patch(
+        "shared.infrastructure.pdf.pdf_generator_service.html_to_pdf_bytes",
+        return_value=b"%PDF-form",
+    )
+    def test_horodatage_complet_hors_cle(self, mock_html, service):
+        with patch("shared.infrastructure.pdf.pdf_generator_service.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime(2026, 3, 2, 9, 15)
+            self._generer(service)
+            mock_dt.now.return_value = datetime(2026, 3, 3, 17, 40)
+            self._generer(service)
+
+        assert mock_html.call_count == 1
+        assert "<p>02/03/2026 à 09:15</p>" in mock_html.call_args[0][0]
+
+    def test_version_change_avec_les_templates(self, service):
+        version = service._get_template_version()
+        (service.template_dir / "formulaire_rapport.html").write_text("<h2>{{ titre }}</h2>")
+
+        assert PdfGeneratorService(template_dir=service.template_dir)._get_template_version() != version
@@ -0,0 +1,131 @@
+"""Tests unitaires de la file d'envoi push groupé."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from shared.infrastructure.notifications import NotificationPayload
+from shared.infrastructure.notifications import push_queue
+from shared.infrastructure.notifications.push_queue import (
+    FCM_MULTICAST_MAX_TOKENS,
+    FakePushTransport,
+    FCMPushTransport,
+    PushBatchQueue,
+    stop_push_queue,
+)
+
+
+@pytest.fixture
+def transport():
+    return FakePushTransport()
+
+
+@pytest.fixture
+def queue(transport):
+    return PushBatchQueue(transport)
+
+
+def _payload(title: str = "Réservation confirmée", **data) -> NotificationPayload:
+    return NotificationPayload(title=title, body="Corps", data=data)
+
+
+class TestPushBatchQueue:
+    """Tests de PushBatchQueue."""
+
+    def test_same_payload_merged_into_one_multicast(self, queue, transport):
+        queue.enqueue(["t1"], _payload(type="x"))
+        queue.enqueue(["t2", "t1"], _payload(type="x"))
+
+        assert queue.flush() == 1
+        assert transport.sent[0][0] == ["t1", "t2"]
+
+    def test_different_payloads_sent_separately(self, queue, transport):
+        queue.enqueue(["t1"], _payload(type="x"))
+        queue.enqueue(["t1"], _payload(type="y"))
+
+        assert queue.flush() == 2
+        assert {p.data["type"] for _, p in transport.sent} == {"x", "y"}
+
+    def test_chunks_of_500_tokens(self, queue, transport):
+        queue.enqueue([f"t{i}" for i in range(1201)], _payload())
+
+        assert queue.flush() == 3
+        assert [len(tokens) for tokens, _ in transport.sent] == [500, 500, 201]
+
+    def test_empty_tokens_ignored(self, queue):
+        queue.enqueue(["", None], _payload())
+
+        assert queue.pending() == 0
+        assert queue.flush() == 0
+
+    def test_transport_error_does_not_stop_flush(self, transport):
+        failing = Mock()
+        failing.send_multicast.side_effect = [Exception("FCM down"), {"t": True}]
+        queue = PushBatchQueue(failing)
+        queue.enqueue(["a"], _payload(type="x"))
+        queue.enqueue(["b"], _payload(type="y"))
+
+        assert queue.flush() == 2
+        assert queue.pending() == 0
+
+    def test_invalid_batch_size(self, transport):
+        with pytest.raises(ValueError):
+            PushBatchQueue(transport, max_batch_tokens=FCM_MULTICAST_MAX_TOKENS + 1)
+
+    def test_worker_flushes_on_stop(self, transport):
+        queue = PushBatchQueue(transport, flush_interval_seconds=60)
+        queue.start()
+        queue.enqueue(["t1"], _payload())
+
+        queue.stop()
+
+        assert transport.sent == [(["t1"], _payload())]
+
+    def test_worker_woken_by_full_batch(self, transport):
+        queue = PushBatchQueue(transport, max_batch_tokens=2, flush_interval_seconds=60)
+        queue.start()
+        try:
+            queue.enqueue(["t1", "t2"], _payload())
+            for _ in range(100):
+                if transport.sent:
+                    break
+                time.sleep(0.01)
+            assert transport.sent == [(["t1", "t2"], _payload())]
+        finally:
+            queue.stop()
+
+    def test_stop_sans_file_creee(self, monkeypatch):
+        monkeypatch.setattr(push_queue, "_push_queue", None)
+        creation = Mock()
+        monkeypatch.setattr(push_queue, "PushBatchQueue", creation)
+
+        stop_push_queue()
+
+        creation.assert_not_called()
+        assert push_queue._push_queue is None
+
+    def test_stop_file_creee(self, transport, monkeypatch):
+        queue = PushBatchQueue(transport, flush_interval_seconds=60)
+        queue.start()
+        queue.enqueue(["t1"], _payload())
+        monkeypatch.setattr(push_queue, "_push_queue", queue)
+
+        stop_push_queue()
+
+        assert transport.sent == [(["t1"], _payload())]
+        assert push_queue._push_queue is None
+
+
+class TestFCMPushTransport:
+    """Tests du transport FCM."""
+
+    def test_delegates_to_notification_service(self):
+        service = Mock()
+        service.send_to_tokens.return_value = {"t1": True}
+        payload = _payload()
+
+        result = FCMPushTransport(service).send_multicast(["t1"], payload)
+
+        assert result == {"t1": True}
+        service.send_to_tokens.assert_called_once_with(["t1"], payload)
@@ -0,0 +1,59 @@
+"""Tests du compteur de requêtes SQL (budgets de requêtes)."""
+
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from shared.infrastructure.query_counter import QueryCounter
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def _executer(engine, *requetes):
+    with engine.connect() as conn:
+        for requete in requetes:
+            conn.execute(text(requete))
+
+
+class TestQueryCounter:
+    """Comptage et chronométrage via les événements du moteur."""
+
+    def test_compte_et_chronometre(self, engine):
+        horloge = Mock(side_effect=[1.0, 1.002, 2.0, 2.005])
+        with QueryCounter(engine, clock=horloge) as counter:
+            _executer(engine, "SELECT 1", "SELECT 2")
+
+        assert counter.count == 2
+        assert [s.sql for s in counter.statements] == ["SELECT 1", "SELECT 2"]
+        assert counter.total_ms == pytest.approx(7.0)
+        assert "2 requêtes SQL" in counter.report()
+
+    def test_ecoute_arretee_a_la_sortie(self, engine):
+        with QueryCounter(engine) as counter:
+            _executer(engine, "SELECT 1")
+        _executer(engine, "SELECT 2")
+
+        assert counter.count == 1
+
+    def test_tous_les_moteurs_par_defaut(self, engine):
+        autre = create_engine("sqlite://")
+        with QueryCounter() as counter:
+            _executer(engine, "SELECT 1")
+            _executer(autre, "SELECT 2")
+        autre.dispose()
+
+        assert counter.count == 2
+
+    def test_reset(self, engine):
+        with QueryCounter(engine) as counter:
+            _executer(engine, "SELECT 1")
+            counter.reset()
+            _executer(engine, "SELECT 2")
+
+        assert [s.sql for s in counter.statements] == ["SELECT 2"]
@@ -17,17 +17,17 @@ class TestRappelReservationJob:
         self.mock_session = Mock()
         self.mock_session_factory.return_value = self.mock_session
 
-    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_notification_service")
-    def test_init(self, mock_get_notif):
+    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_push_queue")
+    def test_init(self, mock_get_queue):
         """Initialisation du job."""
-        mock_get_notif.return_value = Mock()
+        mock_get_queue.return_value = Mock()
         job = RappelReservationJob(self.mock_session_factory)
         assert job._db_session_factory is self.mock_session_factory
 
-    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_notification_service")
-    def test_execute_no_reservations(self, mock_get_notif):
+    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_push_queue")
+    def test_execute_no_reservations(self, mock_get_queue):
         """Exécution sans réservations retourne stats vides."""
-        mock_get_notif.return_value = Mock()
+        mock_get_queue.return_value = Mock()
         mock_query = Mock()
         self.mock_session.query.return_value = mock_query
         mock_query.join.return_value = mock_query
@@ -42,12 +42,10 @@ class TestRappelReservationJob:
         assert stats["erreurs"] == 0
         self.mock_session.close.assert_called_once()
 
-    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_notification_service")
-    def test_execute_with_reservations(self, mock_get_notif):
+    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_push_queue")
+    def test_execute_with_reservations(self, mock_get_queue):
         """Exécution avec réservations envoie des notifications."""
-        mock_notif = Mock()
-        mock_notif.send_to_token.return_value = True
-        mock_get_notif.return_value = mock_notif
+        mock_get_queue.return_value = Mock()
 
         # Créer une réservation mock
         mock_reservation = Mock()
@@ -79,10 +77,10 @@ class TestRappelReservationJob:
         assert stats["reservations_trouvees"] == 1
         assert stats["notifications_envoyees"] == 1
 
-    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_notification_service")
-    def test_execute_db_error(self, mock_get_notif):
+    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_push_queue")
+    def test_execute_db_error(self, mock_get_queue):
         """Exécution avec erreur DB loggée."""
-        mock_get_notif.return_value = Mock()
+        mock_get_queue.return_value = Mock()
         self.mock_session_factory.side_effect = Exception("DB down")
 
         job = RappelReservationJob(self.mock_session_factory)
@@ -90,10 +88,10 @@ class TestRappelReservationJob:
 
         assert stats["erreurs"] > 0
 
-    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_notification_service")
-    def test_send_rappel_user_not_found(self, mock_get_notif):
+    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_push_queue")
+    def test_send_rappel_user_not_found(self, mock_get_queue):
         """_send_rappel retourne False si utilisateur non trouvé."""
-        mock_get_notif.return_value = Mock()
+        mock_get_queue.return_value = Mock()
 
         mock_reservation = Mock()
         mock_reservation.demandeur_id = 99
@@ -108,10 +106,10 @@ class TestRappelReservationJob:
 
         assert result is False
 
-    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_notification_service")
-    def test_send_rappel_simulated(self, mock_get_notif):
+    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_push_queue")
+    def test_send_rappel_simulated(self, mock_get_queue):
         """_send_rappel en mode simulé (pas de push_token)."""
-        mock_get_notif.return_value = Mock()
+        mock_get_queue.return_value = Mock()
 
         mock_reservation = Mock()
         mock_reservation.id = 1
@@ -137,10 +135,44 @@ class TestRappelReservationJob:
 
         assert result is True
 
-    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_notification_service")
-    def test_register(self, mock_get_notif):
+    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_push_queue")
+    def test_send_rappel_enqueues_push(self, mock_get_queue):
+        """_send_rappel dépose le push dans la file d'envoi groupé."""
+        mock_queue = Mock()
+        mock_get_queue.return_value = mock_queue
+
+        mock_reservation = Mock()
+        mock_reservation.id = 1
+        mock_reservation.demandeur_id = 10
+        mock_reservation.ressource_id = 5
+        mock_reservation.date_reservation = date.today()
+        mock_reservation.heure_debut = dt_time(8, 0)
+        mock_reservation.heure_fin = dt_time(12, 0)
+        mock_reservation.ressource = Mock()
+        mock_reservation.ressource.nom = "Grue"
+
+        mock_user = Mock()
+        mock_user.id = 10
+        mock_user.push_token = "token-10"
+
+        mock_query = Mock()
+        self.mock_session.query.return_value = mock_query
+        mock_query.filter.return_value = mock_query
+        mock_query.first.return_value = mock_user
+
+        job = RappelReservationJob(self.mock_session_factory)
+        result = job._send_rappel(mock_reservation, self.mock_session)
+
+        assert result is True
+        mock_queue.enqueue.assert_called_once()
+        tokens, payload = mock_queue.enqueue.call_args.args
+        assert tokens == ["token-10"]
+        assert payload.data["reservation_id"] == "1"
+
+    @patch("shared.infrastructure.scheduler.jobs.rappel_reservation_job.get_push_queue")
+    def test_register(self, mock_get_queue):
         """register() enregistre le job dans le scheduler."""
-        mock_get_notif.return_value = Mock()
+        mock_get_queue.return_value = Mock()
         mock_scheduler = Mock()
 
         RappelReservationJob.register(mock_scheduler, self.mock_session_factory)
@@ -0,0 +1,194 @@
+"""Tests du routage des lectures vers le réplica (get_read_db / session_for)."""
+
+from unittest.mock import Mock
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from modules.auth.infrastructure.persistence import UserModel
+from modules.financier.application.use_cases import (
+    CreateBudgetUseCase,
+    GetDashboardFinancierUseCase,
+)
+from modules.planning.application.use_cases.charge import GetPlanningChargeUseCase
+from shared.application.read_only import is_read_only, read_only
+from shared.infrastructure import database
+from shared.infrastructure.database import (
+    LAST_WRITE_COOKIE,
+    ReadOnlySessionError,
+    ReadRouting,
+    RecentWrites,
+    get_db,
+    get_read_db,
+    session_for,
+)
+from shared.infrastructure.web import read_your_writes_middleware
+from shared.infrastructure.web.dependencies import get_token_service
+from shared.infrastructure.web.read_your_writes_middleware import ReadYourWritesMiddleware
+
+
+def _base(path, origine):
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE origine (nom VARCHAR(20))"))
+        conn.execute(text("INSERT INTO origine VALUES (:nom)"), {"nom": origine})
+    return engine
+
+
+@pytest.fixture
+def engines(tmp_path):
+    """Deux bases SQLite locales : principale et réplica."""
+    primary = _base(tmp_path / "primary.db", "principale")
+    replica = _base(tmp_path / "replica.db", "replica")
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def _origine(session: Session) -> str:
+    return session.execute(text("SELECT nom FROM origine")).scalar_one()
+
+
+class TestReadRouting:
+    """Choix de la base pour les sessions de lecture."""
+
+    def test_lecture_sur_le_replica(self, engines):
+        routing = ReadRouting(*engines)
+
+        with routing.session() as session:
+            assert _origine(session) == "replica"
+
+    def test_sans_replica_base_principale(self, engines):
+        routing = ReadRouting(engines[0])
+
+        assert not routing.has_replica
+        with routing.session() as session:
+            assert _origine(session) == "principale"
+
+    def test_read_your_writes(self, engines):
+        horloge = Mock(return_value=1000.0)
+        routing = ReadRouting(*engines, read_your_writes_seconds=10, clock=horloge)
+
+        with routing.session(last_write_at=995.0) as session:
+            assert _origine(session) == "principale"
+
+        horloge.return_value = 1005.0
+        with routing.session(last_write_at=995.0) as session:
+            assert _origine(session) == "replica"
+
+    def test_ecriture_refusee(self, engines):
+        routing = ReadRouting(*engines)
+        with routing.session() as session:
+            session.add(UserModel(email="a@ex.fr", password_hash="x", prenom="A", nom="B"))
+            with pytest.raises(ReadOnlySessionError):
+                session.flush()
+
+
+class TestSessionFor:
+    """Sélection de la dépendance de session selon le marqueur @read_only."""
+
+    def test_use_cases_marques(self):
+        assert session_for(GetDashboardFinancierUseCase) is get_read_db
+        assert session_for(GetPlanningChargeUseCase) is get_read_db
+
+    def test_use_case_d_ecriture(self):
+        assert not is_read_only(CreateBudgetUseCase)
+        assert session_for(CreateBudgetUseCase) is get_db
+
+    def test_marqueur(self):
+        @read_only
+        class LectureUseCase:
+            pass
+
+        assert is_read_only(LectureUseCase)
+        assert is_read_only(LectureUseCase())
+
+
+class TestRecentWrites:
+    """Écritures récentes mémorisées côté serveur."""
+
+    def test_fenetre(self):
+        horloge = Mock(return_value=1000.0)
+        ecritures = RecentWrites(ttl_seconds=10, clock=horloge)
+
+        ecritures.record(7)
+        assert ecritures.last_write_at(7) == 1000.0
+        assert ecritures.last_write_at(8) is None
+
+        horloge.return_value = 1010.0
+        assert ecritures.last_write_at(7) is None
+
+    def test_purge_des_entrees_expirees(self):
+        horloge = Mock(return_value=1000.0)
+        ecritures = RecentWrites(ttl_seconds=10, clock=horloge)
+        ecritures.record(7)
+
+        horloge.return_value = 1020.0
+        ecritures.record(8)
+
+        assert list(ecritures._writes) == [8]
+
+
+@pytest.fixture
+def client(engines, monkeypatch):
+    monkeypatch.setattr(database, "read_routing", ReadRouting(*engines))
+    ecritures = RecentWrites(ttl_seconds=10)
+    monkeypatch.setattr(database, "recent_writes", ecritures)
+    monkeypatch.setattr(read_your_writes_middleware, "recent_writes", ecritures)
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    @app.get("/origine")
+    def lire(db: Session = Depends(get_read_db)):
+        return {"origine": _origine(db)}
+
+    @app.post("/ecriture")
+    def ecrire():
+        return {}
+
+    @app.post("/refus")
+    def refuser():
+        raise HTTPException(status_code=400)
+
+    return TestClient(app, base_url="https://testserver")
+
+
+class TestGetReadDb:
+    """Dépendance FastAPI et cookie read-your-writes."""
+
+    def test_lecture_puis_ecriture(self, client):
+        assert client.get("/origine").json() == {"origine": "replica"}
+
+        response = client.post("/ecriture")
+        assert LAST_WRITE_COOKIE in response.cookies
+
+        # L'utilisateur relit ses propres écritures sur la base principale
+        assert client.get("/origine").json() == {"origine": "principale"}
+
+    def test_ecriture_en_echec_sans_cookie(self, client):
+        response = client.post("/refus")
+
+        assert LAST_WRITE_COOKIE not in response.cookies
+        assert client.get("/origine").json() == {"origine": "replica"}
+
+    def test_cookie_invalide_ignore(self, client):
+        client.cookies.set(LAST_WRITE_COOKIE, "pas-un-nombre")
+
+        assert client.get("/origine").json() == {"origine": "replica"}
+
+    def test_client_bearer_sans_cookie(self, client):
+        """Un client Bearer qui ne garde pas les cookies relit aussi ses écritures."""
+        user = Mock(id=7, email="a@ex.fr", role=Mock(value="compagnon"))
+        entetes = {"Authorization": f"Bearer {get_token_service().generate(user)}"}
+
+        client.post("/ecriture", headers=entetes)
+        client.cookies.clear()
+
+        assert client.get("/origine", headers=entetes).json() == {"origine": "principale"}
+        # Un autre utilisateur continue de lire le réplica
+        autre = Mock(id=8, email="b@ex.fr", role=Mock(value="compagnon"))
+        autres_entetes = {"Authorization": f"Bearer {get_token_service().generate(autre)}"}
+        assert client.get("/origine", headers=autres_entetes).json() == {"origine": "replica"}
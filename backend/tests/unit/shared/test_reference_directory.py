@@ -0,0 +1,269 @@
+"""Tests de l'annuaire en mémoire des données de référence."""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from modules.auth.infrastructure.persistence import UserModel
+from modules.chantiers.infrastructure.persistence import ChantierModel
+from modules.devis.infrastructure.persistence import models as _devis_models  # noqa: F401
+from shared.infrastructure.chantier_queries import (
+    get_chantier_by_id_dict,
+    get_chantiers_actifs,
+    get_chantiers_by_ids_full,
+)
+from shared.infrastructure.reference_directory import (
+    ReferenceDirectory,
+    get_reference_directory,
+)
+from shared.infrastructure.user_queries import (
+    count_active_users,
+    count_active_users_by_metier,
+    count_active_users_not_in_ids,
+    get_metier_for_user_ids,
+    get_user_basic_info,
+    get_user_display_name,
+    get_users_basic_info_by_ids,
+)
+
+
+def _user(user_id, prenom, nom, role, metiers=None, is_active=True, deleted_at=None):
+    return UserModel(
+        id=user_id, email=f"{prenom.lower()}@ex.fr", password_hash="x", prenom=prenom,
+        nom=nom, role=role, type_utilisateur="employe", couleur=f"#{user_id:06d}",
+        metiers=metiers, is_active=is_active, deleted_at=deleted_at,
+    )
+
+
+def _chantier(chantier_id, code, nom, statut, heures_estimees=None, deleted_at=None):
+    return ChantierModel(
+        id=chantier_id, code=code, nom=nom, adresse="1 rue du Port", statut=statut,
+        couleur="#AA0000", heures_estimees=heures_estimees, deleted_at=deleted_at,
+    )
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # Base fichier : l'annuaire utilise sa propre connexion (pas de SQLite en mémoire)
+    engine = create_engine(f"sqlite:///{tmp_path / 'reference.db'}")
+    UserModel.metadata.create_all(
+        engine, tables=[UserModel.__table__, ChantierModel.__table__]
+    )
+    supprime_le = datetime(2026, 1, 5)
+    with sessionmaker(bind=engine)() as session:
+        session.add_all([
+            _user(1, "Jean", "Dupont", "compagnon", metiers=["macon", "coffreur"]),
+            _user(2, "Anne", "Martin", "chef_chantier", metiers=["macon"]),
+            _user(3, "Paul", "Durand", "compagnon", is_active=False, deleted_at=supprime_le),
+            _chantier(10, "B002", "Ecole Jaures", "en_cours", heures_estimees=120.0),
+            _chantier(11, "A001", "Residence Les Pins", "ouvert"),
+            _chantier(12, "C003", "Gymnase", "receptionne", heures_estimees=50.0),
+            _chantier(13, "D004", "Ancien depot", "en_cours", deleted_at=supprime_le),
+        ])
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def requetes(engine):
+    """Compte les requêtes SQL émises sur le moteur."""
+    compteur = []
+    event.listen(
+        engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: compteur.append(statement),
+    )
+    return compteur
+
+
+class TestHelpersServisParLAnnuaire:
+    """Les helpers de user_queries / chantier_queries lisent l'annuaire."""
+
+    def test_un_seul_chargement_pour_plusieurs_lectures(self, session, requetes):
+        assert get_user_display_name(session, 1) == "Jean Dupont"
+        nb_requetes = len(requetes)
+
+        assert get_user_display_name(session, 2) == "Anne Martin"
+        assert get_user_basic_info(session, 1)["metier"] == "macon"
+        assert count_active_users(session) == 2
+        assert [c["id"] for c in get_chantiers_actifs(session)] == [11, 10]
+
+        assert len(requetes) == nb_requetes
+
+    def test_utilisateurs(self, session):
+        assert get_user_display_name(session, 3) == "Paul Durand"
+        assert get_user_display_name(session, 99) is None
+        # get_user_basic_info exclut les utilisateurs supprimés
+        assert get_user_basic_info(session, 3) is None
+        assert get_user_basic_info(session, 2) == {
+            "id": 2, "prenom": "Anne", "nom": "Martin", "email": "anne@ex.fr",
+            "role": "chef_chantier", "couleur": "#000002", "metier": "macon",
+            "photo_profil": None, "type_utilisateur": "employe", "is_active": True,
+        }
+        assert set(get_users_basic_info_by_ids(session, [1, 3, 99])) == {1, 3}
+        assert get_metier_for_user_ids(session, [1, 3]) == {1: "macon", 3: None}
+
+    def test_comptages(self, session):
+        assert count_active_users(session) == 2
+        assert count_active_users_not_in_ids(session, [1]) == 1
+        assert count_active_users_by_metier(session) == {"macon": 2}
+
+    def test_chantiers(self, session):
+        actifs = get_chantiers_actifs(session)
+        assert actifs == [
+            {"id": 11, "code": "A001", "nom": "Residence Les Pins",
+             "couleur": "#AA0000", "heures_estimees": 0.0},
+            {"id": 10, "code": "B002", "nom": "Ecole Jaures",
+             "couleur": "#AA0000", "heures_estimees": 120.0},
+        ]
+        assert [c["id"] for c in get_chantiers_actifs(session, search="jaur")] == [10]
+        assert [c["id"] for c in get_chantiers_actifs(session, search="a00")] == [11]
+        assert get_chantier_by_id_dict(session, 13) is None
+        assert get_chantier_by_id_dict(session, 12)["code"] == "C003"
+        assert [c["id"] for c in get_chantiers_by_ids_full(session, [13, 12, 10])] == [10, 12]
+
+    def test_copies_retournees(self, session):
+        get_user_basic_info(session, 1)["nom"] = "Modifie"
+        get_chantiers_actifs(session)[0]["nom"] = "Modifie"
+
+        assert get_user_display_name(session, 1) == "Jean Dupont"
+        assert get_chantiers_actifs(session)[0]["nom"] == "Residence Les Pins"
+
+
+class TestInvalidation:
+    """Rechargement de l'annuaire après modification."""
+
+    def test_commit_orm_invalide_l_annuaire(self, session):
+        assert get_user_display_name(session, 1) == "Jean Dupont"
+
+        user = session.get(UserModel, 1)
+        user.prenom = "Jeanne"
+        session.commit()
+
+        assert get_user_display_name(session, 1) == "Jeanne Dupont"
+
+    def test_colonne_non_servie_n_invalide_pas(self, session, requetes):
+        assert get_user_display_name(session, 1) == "Jean Dupont"
+
+        user = session.get(UserModel, 1)
+        user.failed_login_attempts = 3
+        session.commit()
+        nb_requetes = len(requetes)
+
+        assert get_user_display_name(session, 1) == "Jean Dupont"
+        assert len(requetes) == nb_requetes
+
+    def test_rollback_n_invalide_pas(self, session, requetes):
+        get_chantiers_actifs(session)
+
+        chantier = session.get(ChantierModel, 10)
+        chantier.nom = "Renomme"
+        session.flush()
+        session.rollback()
+        nb_requetes = len(requetes)
+
+        assert get_chantiers_actifs(session)[1]["nom"] == "Ecole Jaures"
+        assert len(requetes) == nb_requetes
+
+    def test_compteur_de_versions(self, engine):
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE reference_data_versions "
+                "(nom VARCHAR(50) PRIMARY KEY, version BIGINT NOT NULL)"
+            ))
+            conn.execute(text(
+                "INSERT INTO reference_data_versions VALUES ('chantiers', 0), ('users', 0)"
+            ))
+        horloge = Mock(return_value=100.0)
+        # Compteur maintenu à la main ici : les triggers n'existent que sur PostgreSQL
+        directory = ReferenceDirectory(
+            engine, check_interval_seconds=5, clock=horloge, compteur_versions=True
+        )
+        assert directory.refresh()
+
+        # Écriture d'un autre worker (SQL brut + trigger)
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE users SET nom = 'Dupond' WHERE id = 1"))
+            conn.execute(text(
+                "UPDATE reference_data_versions SET version = version + 1 WHERE nom = 'users'"
+            ))
+
+        # Avant le délai de vérification : état en mémoire
+        horloge.return_value = 103.0
+        assert directory.refresh()
+        assert directory.get_user(1)["nom"] == "Dupont"
+
+        horloge.return_value = 106.0
+        assert directory.refresh()
+        assert directory.get_user(1)["nom"] == "Dupond"
+
+    def test_sans_compteur_rechargement_apres_age_maximal(self, engine):
+        horloge = Mock(return_value=0.0)
+        directory = ReferenceDirectory(
+            engine, check_interval_seconds=5, max_age_seconds=60, clock=horloge
+        )
+        assert directory.refresh()
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE chantiers SET statut = 'ouvert' WHERE id = 12"))
+
+        horloge.return_value = 30.0
+        directory.refresh()
+        assert [c["id"] for c in directory.get_chantiers_actifs()] == [11, 10]
+
+        horloge.return_value = 61.0
+        directory.refresh()
+        assert [c["id"] for c in directory.get_chantiers_actifs()] == [11, 10, 12]
+
+
+    def test_compteur_sans_trigger_ignore_hors_postgresql(self, engine):
+        # Table présente mais jamais incrémentée (SQLite) : l'âge maximal s'applique
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE reference_data_versions "
+                "(nom VARCHAR(50) PRIMARY KEY, version BIGINT NOT NULL)"
+            ))
+            conn.execute(text(
+                "INSERT INTO reference_data_versions VALUES ('chantiers', 0), ('users', 0)"
+            ))
+        horloge = Mock(return_value=0.0)
+        directory = ReferenceDirectory(
+            engine, check_interval_seconds=5, max_age_seconds=60, clock=horloge
+        )
+        assert directory.refresh()
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE users SET nom = 'Dupond' WHERE id = 1"))
+
+        horloge.return_value = 61.0
+        directory.refresh()
+        assert directory.get_user(1)["nom"] == "Dupond"
+
+
+class TestRepliSurLaBase:
+    """Cas où les helpers interrogent directement la base."""
+
+    def test_session_mockee(self):
+        db = Mock(spec=Session)
+        assert get_reference_directory(db) is None
+
+    def test_sqlite_en_memoire(self):
+        engine = create_engine("sqlite:///:memory:")
+        assert get_reference_directory(sessionmaker(bind=engine)()) is None
+
+    def test_desactive_par_variable_d_environnement(self, session, monkeypatch):
+        monkeypatch.setenv("REFERENCE_DIRECTORY_ENABLED", "false")
+        assert get_reference_directory(session) is None
+        assert get_user_display_name(session, 1) == "Jean Dupont"
+
+    def test_tables_absentes(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'vide.db'}")
+        assert get_reference_directory(sessionmaker(bind=engine)()) is None
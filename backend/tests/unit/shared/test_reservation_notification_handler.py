@@ -11,6 +11,15 @@ from shared.infrastructure.notifications.handlers.reservation_notification_handl
 )
 
 
+@pytest.fixture(autouse=True)
+def push_queue():
+    """File d'envoi push mockee (pas de worker en arriere-plan)."""
+    with patch(
+        "shared.infrastructure.notifications.handlers.reservation_notification_handler.get_push_queue"
+    ) as mock_get_queue:
+        yield mock_get_queue.return_value
+
+
 class MockReservationCreatedEvent:
     """Mock event de creation de reservation."""
 
@@ -147,10 +156,9 @@ class TestHandleReservationValidee:
     """Tests de handle_reservation_validee."""
 
     @patch("shared.infrastructure.notifications.handlers.reservation_notification_handler.get_notification_service")
-    def test_sends_notification_to_user_with_token(self, mock_get_service):
+    def test_sends_notification_to_user_with_token(self, mock_get_service, push_queue):
         """Test envoie notification avec token utilisateur."""
         mock_service = Mock()
-        mock_service.send_to_token.return_value = True
         mock_get_service.return_value = mock_service
 
         mock_user = Mock()
@@ -163,12 +171,12 @@ class TestHandleReservationValidee:
 
         handler.handle_reservation_validee(event)
 
-        mock_service.send_to_token.assert_called_once()
-        args = mock_service.send_to_token.call_args
-        assert args[0][0] == "user_push_token_123"
+        push_queue.enqueue.assert_called_once()
+        args = push_queue.enqueue.call_args
+        assert args[0][0] == ["user_push_token_123"]
 
     @patch("shared.infrastructure.notifications.handlers.reservation_notification_handler.get_notification_service")
-    def test_simulates_notification_without_token(self, mock_get_service, caplog):
+    def test_simulates_notification_without_token(self, mock_get_service, caplog, push_queue):
         """Test simule notification sans token."""
         mock_service = Mock()
         mock_get_service.return_value = mock_service
@@ -179,14 +187,13 @@ class TestHandleReservationValidee:
         with caplog.at_level(logging.INFO):
             handler.handle_reservation_validee(event)
 
-        mock_service.send_to_token.assert_not_called()
+        push_queue.enqueue.assert_not_called()
         assert "SIMULATED" in caplog.text
 
     @patch("shared.infrastructure.notifications.handlers.reservation_notification_handler.get_notification_service")
-    def test_notification_payload_content(self, mock_get_service):
+    def test_notification_payload_content(self, mock_get_service, push_queue):
         """Test contenu du payload de validation."""
         mock_service = Mock()
-        mock_service.send_to_token.return_value = True
         mock_get_service.return_value = mock_service
 
         mock_user = Mock()
@@ -203,7 +210,7 @@ class TestHandleReservationValidee:
 
         handler.handle_reservation_validee(event)
 
-        args = mock_service.send_to_token.call_args
+        args = push_queue.enqueue.call_args
         payload = args[0][1]
         assert "confirmée" in payload.title
         assert "Mini-pelle" in payload.body
@@ -214,10 +221,9 @@ class TestHandleReservationRefusee:
     """Tests de handle_reservation_refusee."""
 
     @patch("shared.infrastructure.notifications.handlers.reservation_notification_handler.get_notification_service")
-    def test_sends_notification_with_motif(self, mock_get_service):
+    def test_sends_notification_with_motif(self, mock_get_service, push_queue):
         """Test envoie notification avec motif de refus."""
         mock_service = Mock()
-        mock_service.send_to_token.return_value = True
         mock_get_service.return_value = mock_service
 
         mock_user = Mock()
@@ -233,17 +239,16 @@ class TestHandleReservationRefusee:
 
         handler.handle_reservation_refusee(event)
 
-        args = mock_service.send_to_token.call_args
+        args = push_queue.enqueue.call_args
         payload = args[0][1]
         assert "refusée" in payload.title
         assert "Chargeuse" in payload.body
         assert "Ressource déjà réservée" in payload.body
 
     @patch("shared.infrastructure.notifications.handlers.reservation_notification_handler.get_notification_service")
-    def test_sends_notification_without_motif(self, mock_get_service):
+    def test_sends_notification_without_motif(self, mock_get_service, push_queue):
         """Test envoie notification sans motif."""
         mock_service = Mock()
-        mock_service.send_to_token.return_value = True
         mock_get_service.return_value = mock_service
 
         mock_user = Mock()
@@ -256,7 +261,7 @@ class TestHandleReservationRefusee:
 
         handler.handle_reservation_refusee(event)
 
-        args = mock_service.send_to_token.call_args
+        args = push_queue.enqueue.call_args
         payload = args[0][1]
         assert "Motif" not in payload.body
         assert payload.data["motif"] == ""
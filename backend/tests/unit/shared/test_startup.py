@@ -0,0 +1,174 @@
+"""Tests du démarrage rapide : état du schéma, init_db et chronométrage."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from shared.infrastructure import database
+from shared.infrastructure.schema_state import (
+    current_revisions,
+    head_revisions,
+    schema_is_at_head,
+)
+from shared.infrastructure.startup_timing import StartupTimer
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+
+def _migration(dossier, nom, revision, down_revision):
+    (dossier / f"{nom}.py").write_text(
+        f'"""Migration {nom}."""\n'
+        "from typing import Union\n\n"
+        f"revision: str = {revision!r}\n"
+        f"down_revision: Union[str, None] = {down_revision!r}  # parent\n"
+    )
+
+
+@pytest.fixture
+def versions(tmp_path):
+    dossier = tmp_path / "versions"
+    dossier.mkdir()
+    _migration(dossier, "0001_init", "0001", None)
+    _migration(dossier, "0002_users", "0002", "0001")
+    _migration(dossier, "0003_chantiers", "0003", "0002")
+    return dossier
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    yield engine
+    engine.dispose()
+
+
+def _stamp(engine, *revisions):
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) PRIMARY KEY)"))
+        for revision in revisions:
+            conn.execute(text("INSERT INTO alembic_version VALUES (:r)"), {"r": revision})
+
+
+class TestSchemaState:
+    """Comparaison de la révision de la base avec la tête des migrations."""
+
+    def test_tete_du_graphe(self, versions):
+        assert head_revisions(versions) == {"0003"}
+
+    def test_plusieurs_tetes_et_fusion(self, versions):
+        _migration(versions, "0004_branche", "0004", "0002")
+        assert head_revisions(versions) == {"0003", "0004"}
+
+        _migration(versions, "0005_merge", "0005", ("0003", "0004"))
+        assert head_revisions(versions) == {"0005"}
+
+    def test_migrations_du_projet_une_seule_tete(self):
+        assert len(head_revisions()) == 1
+
+    def test_base_sans_alembic(self, engine, versions):
+        assert current_revisions(engine) == frozenset()
+        assert not schema_is_at_head(engine, versions)
+
+    def test_base_a_jour(self, engine, versions):
+        _stamp(engine, "0003")
+        assert schema_is_at_head(engine, versions)
+
+    def test_base_en_retard(self, engine, versions):
+        _stamp(engine, "0002")
+        assert not schema_is_at_head(engine, versions)
+
+
+class TestInitDb:
+    """Modes d'initialisation du schéma (DB_SCHEMA_INIT)."""
+
+    def _init(self, mode, a_jour):
+        with patch.object(database, "_create_schema") as create_schema, \
+                patch(
+                    "shared.infrastructure.schema_state.schema_is_at_head",
+                    return_value=a_jour,
+                ) as at_head:
+            cree = database.init_db(mode)
+        return cree, create_schema, at_head
+
+    def test_auto_base_a_jour(self):
+        cree, create_schema, _ = self._init("auto", a_jour=True)
+
+        assert cree is False
+        create_schema.assert_not_called()
+
+    def test_auto_base_non_migree(self):
+        cree, create_schema, _ = self._init("auto", a_jour=False)
+
+        assert cree is True
+        create_schema.assert_called_once()
+
+    def test_create_sans_verification(self):
+        cree, create_schema, at_head = self._init("create", a_jour=True)
+
+        assert cree is True
+        create_schema.assert_called_once()
+        at_head.assert_not_called()
+
+    def test_skip(self):
+        cree, create_schema, at_head = self._init("skip", a_jour=False)
+
+        assert cree is False
+        create_schema.assert_not_called()
+        at_head.assert_not_called()
+
+    def test_mode_inconnu(self):
+        with pytest.raises(ValueError):
+            database.init_db("toujours")
+
+
+class TestStartupTimer:
+    """Chronométrage des phases de démarrage."""
+
+    def test_phases(self):
+        horloge = Mock(side_effect=[10.0, 10.25, 20.0, 20.5])
+        timer = StartupTimer(clock=horloge)
+        timer.record("imports", 1.0)
+
+        with timer.phase("schema"):
+            pass
+        with timer.phase("scheduler"):
+            pass
+
+        assert timer.phases == {"imports": 1.0, "schema": 0.25, "scheduler": 0.5}
+        assert timer.total_s == 1.75
+        assert timer.summary() == (
+            "Démarrage terminé en 1750 ms "
+            "(imports 1000 ms, scheduler 500 ms, schema 250 ms)"
+        )
+
+    def test_phase_mesuree_meme_en_cas_d_erreur(self):
+        timer = StartupTimer(clock=Mock(side_effect=[0.0, 2.0]))
+
+        with pytest.raises(RuntimeError):
+            with timer.phase("schema"):
+                raise RuntimeError("boom")
+
+        assert timer.phases == {"schema": 2.0}
+
+
+def test_dependances_lourdes_non_chargees_a_l_import():
+    """Les routers n'importent ni fpdf2 ni Pillow : chargés au premier usage."""
+    code = (
+        "import sys\n"
+        "import modules.devis.infrastructure.web\n"
+        "import modules.documents.infrastructure.web\n"
+        "import shared.infrastructure.web.upload_routes\n"
+        "lourds = [m for m in ('fpdf', 'PIL', 'openpyxl', 'weasyprint', 'firebase_admin')"
+        " if m in sys.modules]\n"
+        "assert not lourds, lourds\n"
+    )
+    env = {**os.environ, "DEBUG": "true"}
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, env=env,
+        capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,35 @@
+"""Fixtures partagées des tests du module Signalements."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.auth.infrastructure.persistence import UserModel
+from modules.signalements.infrastructure.persistence import (
+    EscaladeHistoriqueModel,
+    ReponseModel,
+    SignalementModel,
+)
+
+
+@pytest.fixture
+def sqlite_session():
+    """Session SQLite en mémoire avec les tables users et signalements."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SignalementModel.metadata.create_all(
+        engine,
+        tables=[
+            UserModel.__table__,
+            SignalementModel.__table__,
+            ReponseModel.__table__,
+            EscaladeHistoriqueModel.__table__,
+        ],
+    )
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
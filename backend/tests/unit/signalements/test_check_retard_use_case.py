@@ -82,7 +82,7 @@ class TestCheckSignalementsRetardUseCase:
         )
         self.escalade_service.determiner_escalades.return_value = [escalade_info]
         self.escalade_service.generer_message_escalade.return_value = "Message test"
-        self.escalade_repo.find_last_by_signalement.return_value = None
+        self.escalade_repo.find_last_by_signalements.return_value = {}
 
         result = self.use_case.execute()
 
@@ -111,7 +111,7 @@ class TestCheckSignalementsRetardUseCase:
             niveau="chef_chantier",
             pourcentage_temps=51.0,
         )
-        self.escalade_repo.find_last_by_signalement.return_value = last
+        self.escalade_repo.find_last_by_signalements.return_value = {1: last}
 
         result = self.use_case.execute()
 
@@ -138,7 +138,7 @@ class TestCheckSignalementsRetardUseCase:
             niveau="chef_chantier",
             pourcentage_temps=51.0,
         )
-        self.escalade_repo.find_last_by_signalement.return_value = last
+        self.escalade_repo.find_last_by_signalements.return_value = {1: last}
 
         result = self.use_case.execute()
 
@@ -172,13 +172,35 @@ class TestCheckSignalementsRetardUseCase:
             escalade_info1, escalade_info2,
         ]
         self.escalade_service.generer_message_escalade.return_value = "Message"
-        self.escalade_repo.find_last_by_signalement.return_value = None
+        self.escalade_repo.find_last_by_signalements.return_value = {}
 
         result = self.use_case.execute()
 
         assert result.signalements_verifies == 2
         assert result.escalades_effectuees == 2
 
+    def test_execute_charge_les_dernieres_escalades_en_une_requete(self):
+        """Test: une seule requête pour les dernières escalades de tous les candidats."""
+        sigs = [_make_signalement(id=i) for i in (1, 2, 3)]
+        self.signalement_repo.find_a_escalader.return_value = sigs
+        self.escalade_service.determiner_escalades.return_value = [
+            EscaladeInfo(
+                signalement=s, niveau="chef_chantier",
+                pourcentage_temps=60.0, destinataires_roles=["chef_chantier"],
+            )
+            for s in sigs
+        ]
+        self.escalade_service.generer_message_escalade.return_value = "Message"
+        self.escalade_repo.find_last_by_signalements.return_value = {
+            2: EscaladeHistorique(signalement_id=2, niveau="chef_chantier", pourcentage_temps=51.0),
+        }
+
+        result = self.use_case.execute()
+
+        self.escalade_repo.find_last_by_signalements.assert_called_once_with([1, 2, 3])
+        self.escalade_repo.find_last_by_signalement.assert_not_called()
+        assert result.escalades_effectuees == 2
+
 
 class TestEscaladeHistorique:
     """Tests pour l'entité EscaladeHistorique."""
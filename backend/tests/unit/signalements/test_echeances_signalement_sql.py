@@ -0,0 +1,144 @@
+"""Tests des filtres de retard et d'escalade appliqués en SQL (échéances persistées)."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from modules.signalements.domain.entities import Signalement, EscaladeHistorique
+from modules.signalements.domain.value_objects import Priorite, StatutSignalement
+from modules.signalements.infrastructure.persistence import SignalementModel
+from modules.signalements.infrastructure.persistence.sqlalchemy_signalement_repository import (
+    SQLAlchemySignalementRepository,
+)
+from modules.signalements.infrastructure.persistence.sqlalchemy_escalade_repository import (
+    SQLAlchemyEscaladeRepository,
+)
+
+
+def _signalement(
+    titre: str,
+    age: timedelta,
+    priorite: Priorite = Priorite.HAUTE,
+    statut: StatutSignalement = StatutSignalement.OUVERT,
+) -> Signalement:
+    """Signalement créé il y a `age` (délai HAUTE = 24h)."""
+    sig = Signalement(
+        chantier_id=1,
+        titre=titre,
+        description="Description",
+        cree_par=10,
+        priorite=priorite,
+        statut=statut,
+    )
+    sig.created_at = datetime.now() - age
+    return sig
+
+
+@pytest.fixture
+def repository(sqlite_session):
+    return SQLAlchemySignalementRepository(sqlite_session)
+
+
+@pytest.fixture
+def escalade_repository(sqlite_session):
+    return SQLAlchemyEscaladeRepository(sqlite_session)
+
+
+class TestEcheancesPersistees:
+    """Les échéances sont stockées et recalculées à chaque sauvegarde."""
+
+    def test_save_persiste_les_echeances(self, repository, sqlite_session):
+        sig = repository.save(_signalement("Fuite", timedelta(hours=1)))
+
+        model = sqlite_session.get(SignalementModel, sig.id)
+        assert model.date_limite_resolution == sig.created_at + timedelta(hours=24)
+        assert model.date_alerte_escalade == sig.created_at + timedelta(hours=12)
+
+    def test_changement_priorite_recalcule_les_echeances(self, repository, sqlite_session):
+        sig = repository.save(_signalement("Fuite", timedelta(hours=1)))
+
+        sig.priorite = Priorite.CRITIQUE
+        repository.save(sig)
+
+        model = sqlite_session.get(SignalementModel, sig.id)
+        assert model.date_limite_resolution == sig.created_at + timedelta(hours=4)
+        assert model.date_alerte_escalade == sig.created_at + timedelta(hours=2)
+
+
+class TestFiltresSQL:
+    """Retards et escalades filtrés par prédicats SQL."""
+
+    @pytest.fixture
+    def signalements(self, repository):
+        return {
+            "recent": repository.save(_signalement("Recent", timedelta(hours=2))),
+            "mi_delai": repository.save(_signalement("Mi-delai", timedelta(hours=15))),
+            "retard": repository.save(_signalement("Retard", timedelta(hours=30))),
+            "traite": repository.save(
+                _signalement("Traite", timedelta(hours=30), statut=StatutSignalement.TRAITE)
+            ),
+        }
+
+    def test_find_en_retard(self, repository, signalements):
+        result = repository.find_en_retard()
+
+        assert [s.titre for s in result] == ["Retard"]
+
+    def test_find_all_en_retard_only_total_exact(self, repository, signalements):
+        result, total = repository.find_all(en_retard_only=True, limit=10)
+
+        assert total == 1
+        assert [s.titre for s in result] == ["Retard"]
+
+    def test_search_en_retard_only(self, repository, signalements):
+        result, total = repository.search("e", en_retard_only=True)
+
+        assert total == 1
+        assert result[0].titre == "Retard"
+
+    @pytest.mark.parametrize(
+        "seuil, attendus",
+        [
+            (50.0, {"Mi-delai", "Retard"}),
+            (100.0, {"Retard"}),
+            (75.0, {"Retard"}),
+            (5.0, {"Recent", "Mi-delai", "Retard"}),
+        ],
+    )
+    def test_find_a_escalader(self, repository, signalements, seuil, attendus):
+        result = repository.find_a_escalader(seuil_pourcentage=seuil)
+
+        assert {s.titre for s in result} == attendus
+
+
+class TestDernieresEscalades:
+    """Dernière escalade de plusieurs signalements en une requête."""
+
+    def test_find_last_by_signalements(self, repository, escalade_repository):
+        sig1 = repository.save(_signalement("A", timedelta(hours=30)))
+        sig2 = repository.save(_signalement("B", timedelta(hours=30)))
+        sig3 = repository.save(_signalement("C", timedelta(hours=30)))
+        now = datetime.now()
+        for sig_id, niveau, age in [
+            (sig1.id, "chef_chantier", 3),
+            (sig1.id, "conducteur", 1),
+            (sig2.id, "chef_chantier", 2),
+        ]:
+            escalade_repository.save(
+                EscaladeHistorique(
+                    signalement_id=sig_id,
+                    niveau=niveau,
+                    pourcentage_temps=60.0,
+                    created_at=now - timedelta(hours=age),
+                )
+            )
+
+        result = escalade_repository.find_last_by_signalements([sig1.id, sig2.id, sig3.id])
+
+        assert {k: v.niveau for k, v in result.items()} == {
+            sig1.id: "conducteur",
+            sig2.id: "chef_chantier",
+        }
+
+    def test_liste_vide(self, escalade_repository):
+        assert escalade_repository.find_last_by_signalements([]) == {}
@@ -42,8 +42,8 @@ class TestGetSignalementUseCase:
     def test_get_signalement_success(self):
         """Test: recuperation reussie d'un signalement."""
         signalement = self._create_signalement(id=1)
+        signalement.nb_reponses = 5
         self.mock_signalement_repo.find_by_id.return_value = signalement
-        self.mock_reponse_repo.count_by_signalement.return_value = 5
 
         result = self.use_case.execute(signalement_id=1)
 
@@ -51,7 +51,8 @@ class TestGetSignalementUseCase:
         assert result.titre == "Test signalement"
         assert result.nb_reponses == 5
         self.mock_signalement_repo.find_by_id.assert_called_once_with(1)
-        self.mock_reponse_repo.count_by_signalement.assert_called_once_with(1)
+        # Compteur denormalise : pas de comptage des reponses
+        self.mock_reponse_repo.count_by_signalement.assert_not_called()
 
     def test_get_signalement_not_found(self):
         """Test: erreur si signalement non trouve."""
@@ -90,8 +91,8 @@ class TestGetSignalementUseCase:
         signalement.priorite = Priorite.CRITIQUE
         signalement.localisation = "Zone A"
         signalement.photo_url = "https://example.com/photo.jpg"
+        signalement.nb_reponses = 3
         self.mock_signalement_repo.find_by_id.return_value = signalement
-        self.mock_reponse_repo.count_by_signalement.return_value = 3
 
         result = self.use_case.execute(signalement_id=1)
 
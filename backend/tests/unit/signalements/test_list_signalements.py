@@ -109,12 +109,32 @@ class TestListSignalementsUseCase:
             self._create_signalement(1, "Sig 1"),
             self._create_signalement(2, "Sig 2"),
         ]
+        # Les nombres de reponses sont charges par le repository avec la liste
+        signalements[0].nb_reponses = 3
+        signalements[1].nb_reponses = 7
         self.mock_signalement_repo.find_by_chantier.return_value = signalements
         self.mock_signalement_repo.count_by_chantier.return_value = 2
-        # Retourner des counts differents pour chaque signalement
-        self.mock_reponse_repo.count_by_signalement.side_effect = [3, 7]
 
         result = self.use_case.execute(chantier_id=1)
 
         assert result.signalements[0].nb_reponses == 3
         assert result.signalements[1].nb_reponses == 7
+        self.mock_reponse_repo.count_by_signalement.assert_not_called()
+
+    def test_list_signalements_utilise_les_noms_charges(self):
+        """Test: les noms charges avec la liste evitent le resolver."""
+        signalement = self._create_signalement(1, "Sig 1")
+        signalement.cree_par_nom = "Paul Martin"
+        self.mock_signalement_repo.find_by_chantier.return_value = [signalement]
+        self.mock_signalement_repo.count_by_chantier.return_value = 1
+        resolver = Mock(return_value="Autre")
+        use_case = ListSignalementsUseCase(
+            signalement_repository=self.mock_signalement_repo,
+            reponse_repository=self.mock_reponse_repo,
+            get_user_name=resolver,
+        )
+
+        result = use_case.execute(chantier_id=1)
+
+        assert result.signalements[0].cree_par_nom == "Paul Martin"
+        resolver.assert_not_called()
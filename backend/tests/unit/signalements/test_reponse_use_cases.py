@@ -78,6 +78,7 @@ class TestCreateReponseUseCase:
         result = self.use_case.execute(dto)
 
         assert result.id == 1
+        self.mock_signalement_repo.update_compteur_reponses.assert_called_once_with(1)
         assert result.contenu == "Ma reponse au signalement"
         assert result.signalement_id == 1
         assert result.auteur_id == 20
@@ -314,6 +315,20 @@ class TestDeleteReponseUseCase:
         assert result is True
         self.mock_reponse_repo.delete.assert_called_once_with(1)
 
+    def test_delete_reponse_met_a_jour_le_compteur(self):
+        """Test: le compteur de reponses du signalement est recalcule."""
+        mock_signalement_repo = Mock(spec=SignalementRepository)
+        use_case = DeleteReponseUseCase(
+            reponse_repository=self.mock_reponse_repo,
+            signalement_repository=mock_signalement_repo,
+        )
+        self.mock_reponse_repo.find_by_id.return_value = self._create_reponse()
+        self.mock_reponse_repo.delete.return_value = True
+
+        use_case.execute(reponse_id=1, user_id=20, user_role="compagnon")
+
+        mock_signalement_repo.update_compteur_reponses.assert_called_once_with(1)
+
     def test_delete_reponse_success_as_admin(self):
         """Test: suppression reussie par admin."""
         reponse = self._create_reponse(auteur_id=20)
@@ -4,6 +4,8 @@ import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, MagicMock, patch
 
+from modules.auth.infrastructure.persistence import UserModel
+from modules.signalements.infrastructure.persistence import ReponseModel, SignalementModel
 from modules.signalements.infrastructure.persistence.sqlalchemy_signalement_repository import (
     SQLAlchemySignalementRepository,
 )
@@ -186,126 +188,170 @@ class TestDelete:
         assert result is False
 
 
+def _inserer(
+    session,
+    titre: str,
+    chantier_id: int = 10,
+    priorite: Priorite = Priorite.MOYENNE,
+    statut: StatutSignalement = StatutSignalement.OUVERT,
+    age: timedelta = timedelta(hours=1),
+    cree_par: int = 5,
+    assigne_a=None,
+) -> Signalement:
+    """Persiste un signalement de test via le repository."""
+    sig = Signalement(
+        chantier_id=chantier_id,
+        titre=titre,
+        description="Desc",
+        cree_par=cree_par,
+        priorite=priorite,
+        statut=statut,
+        assigne_a=assigne_a,
+    )
+    sig.created_at = datetime.now() - age
+    return SQLAlchemySignalementRepository(session).save(sig)
+
+
 class TestFindByChantier:
     """Tests pour find_by_chantier."""
 
     @pytest.fixture
-    def mock_session(self):
-        session = MagicMock()
-        session.query.return_value = session
-        session.filter.return_value = session
-        session.order_by.return_value = session
-        session.offset.return_value = session
-        session.limit.return_value = session
-        return session
+    def repository(self, sqlite_session):
+        return SQLAlchemySignalementRepository(sqlite_session)
 
-    @pytest.fixture
-    def repository(self, mock_session):
-        return SQLAlchemySignalementRepository(mock_session)
-
-    def test_trouve_signalements_chantier(self, repository, mock_session):
+    def test_trouve_signalements_chantier(self, repository, sqlite_session):
         """Trouve les signalements d'un chantier."""
-        mock_model = Mock()
-        mock_model.id = 1
-        mock_model.chantier_id = 10
-        mock_model.titre = "Test"
-        mock_model.description = "Desc"
-        mock_model.priorite = "moyenne"
-        mock_model.statut = "ouvert"
-        mock_model.cree_par = 5
-        mock_model.assigne_a = None
-        mock_model.date_resolution_souhaitee = None
-        mock_model.date_traitement = None
-        mock_model.date_cloture = None
-        mock_model.commentaire_traitement = None
-        mock_model.photo_url = None
-        mock_model.localisation = None
-        mock_model.nb_escalades = 0
-        mock_model.derniere_escalade_at = None
-        mock_model.created_at = datetime.now()
-        mock_model.updated_at = datetime.now()
-
-        mock_session.all.return_value = [mock_model]
+        _inserer(sqlite_session, "Test")
+        _inserer(sqlite_session, "Autre chantier", chantier_id=11)
 
         result = repository.find_by_chantier(10)
 
-        assert len(result) == 1
+        assert [s.titre for s in result] == ["Test"]
 
-    def test_filtre_par_statut(self, repository, mock_session):
+    def test_filtre_par_statut(self, repository, sqlite_session):
         """Filtre par statut."""
-        mock_session.all.return_value = []
+        _inserer(sqlite_session, "Ouvert")
+        _inserer(sqlite_session, "En cours", statut=StatutSignalement.EN_COURS)
 
         result = repository.find_by_chantier(10, statut=StatutSignalement.EN_COURS)
 
-        # Verifie que le filtre est applique
-        mock_session.filter.assert_called()
+        assert [s.titre for s in result] == ["En cours"]
 
-    def test_filtre_par_priorite(self, repository, mock_session):
+    def test_filtre_par_priorite(self, repository, sqlite_session):
         """Filtre par priorite."""
-        mock_session.all.return_value = []
+        _inserer(sqlite_session, "Basse", priorite=Priorite.BASSE)
+        _inserer(sqlite_session, "Critique", priorite=Priorite.CRITIQUE)
 
         result = repository.find_by_chantier(10, priorite=Priorite.CRITIQUE)
 
-        mock_session.filter.assert_called()
+        assert [s.titre for s in result] == ["Critique"]
+
+    def test_tri_par_priorite_puis_date(self, repository, sqlite_session):
+        """Tri par priorite puis du plus recent au plus ancien."""
+        _inserer(sqlite_session, "Basse", priorite=Priorite.BASSE)
+        _inserer(sqlite_session, "Haute ancienne", priorite=Priorite.HAUTE, age=timedelta(hours=5))
+        _inserer(sqlite_session, "Haute recente", priorite=Priorite.HAUTE)
+
+        result = repository.find_by_chantier(10)
 
-    def test_pagination(self, repository, mock_session):
+        assert [s.titre for s in result] == ["Haute recente", "Haute ancienne", "Basse"]
+
+    def test_pagination(self, repository, sqlite_session):
         """Gere la pagination."""
-        mock_session.all.return_value = []
+        for i in range(5):
+            _inserer(sqlite_session, f"Sig {i}", age=timedelta(hours=i))
+
+        result = repository.find_by_chantier(10, skip=1, limit=2)
 
-        result = repository.find_by_chantier(10, skip=20, limit=10)
+        assert [s.titre for s in result] == ["Sig 1", "Sig 2"]
 
-        mock_session.offset.assert_called_with(20)
-        mock_session.limit.assert_called_with(10)
+
+class TestChargementListe:
+    """Les listes chargent reponses et noms en une seule requete."""
+
+    def test_charge_reponses_et_noms(self, sqlite_session):
+        sqlite_session.execute(
+            UserModel.__table__.insert(),
+            [
+                {"id": 5, "email": "a@x.fr", "password_hash": "x", "nom": "Martin", "prenom": "Paul"},
+                {"id": 6, "email": "b@x.fr", "password_hash": "x", "nom": "Durand", "prenom": "Lea"},
+            ],
+        )
+        sig = _inserer(sqlite_session, "Avec reponses", assigne_a=6)
+        _inserer(sqlite_session, "Sans reponse", cree_par=99)
+        derniere = datetime.now().replace(microsecond=0)
+        for age in (2, 0):
+            sqlite_session.add(
+                ReponseModel(
+                    signalement_id=sig.id, contenu="ok", auteur_id=6,
+                    created_at=derniere - timedelta(hours=age),
+                )
+            )
+        sqlite_session.commit()
+
+        result = {s.titre: s for s in SQLAlchemySignalementRepository(sqlite_session).find_by_chantier(10)}
+
+        avec = result["Avec reponses"]
+        assert avec.nb_reponses == 2
+        assert avec.derniere_reponse_at == derniere
+        assert (avec.cree_par_nom, avec.assigne_a_nom) == ("Paul Martin", "Lea Durand")
+        sans = result["Sans reponse"]
+        assert (sans.nb_reponses, sans.derniere_reponse_at, sans.cree_par_nom) == (0, None, None)
+
+    def test_update_compteur_reponses(self, sqlite_session):
+        repository = SQLAlchemySignalementRepository(sqlite_session)
+        sig = _inserer(sqlite_session, "Compteur")
+        updated_at = sqlite_session.get(SignalementModel, sig.id).updated_at
+        sqlite_session.add(ReponseModel(signalement_id=sig.id, contenu="ok", auteur_id=5))
+        sqlite_session.commit()
+
+        repository.update_compteur_reponses(sig.id)
+
+        recharge = repository.find_by_id(sig.id)
+        assert recharge.nb_reponses == 1
+        assert recharge.derniere_reponse_at is not None
+        assert recharge.updated_at == updated_at
 
 
 class TestFindAll:
     """Tests pour find_all."""
 
     @pytest.fixture
-    def mock_session(self):
-        session = MagicMock()
-        session.query.return_value = session
-        session.filter.return_value = session
-        session.order_by.return_value = session
-        session.offset.return_value = session
-        session.limit.return_value = session
-        return session
+    def repository(self, sqlite_session):
+        return SQLAlchemySignalementRepository(sqlite_session)
 
-    @pytest.fixture
-    def repository(self, mock_session):
-        return SQLAlchemySignalementRepository(mock_session)
-
-    def test_trouve_tous_signalements(self, repository, mock_session):
+    def test_trouve_tous_signalements(self, repository, sqlite_session):
         """Trouve tous les signalements avec total."""
-        mock_session.count.return_value = 50
-        mock_session.all.return_value = []
+        for i in range(3):
+            _inserer(sqlite_session, f"Sig {i}", age=timedelta(hours=i))
 
-        signalements, total = repository.find_all()
+        signalements, total = repository.find_all(limit=2)
 
-        assert total == 50
+        assert total == 3
+        assert [s.titre for s in signalements] == ["Sig 0", "Sig 1"]
 
-    def test_filtre_par_chantier_ids(self, repository, mock_session):
+    def test_filtre_par_chantier_ids(self, repository, sqlite_session):
         """Filtre par liste de chantier_ids."""
-        mock_session.count.return_value = 10
-        mock_session.all.return_value = []
+        _inserer(sqlite_session, "C1", chantier_id=1)
+        _inserer(sqlite_session, "C2", chantier_id=2)
+        _inserer(sqlite_session, "C3", chantier_id=3)
 
-        signalements, total = repository.find_all(chantier_ids=[1, 2, 3])
+        signalements, total = repository.find_all(chantier_ids=[1, 3])
 
-        mock_session.filter.assert_called()
+        assert total == 2
+        assert {s.titre for s in signalements} == {"C1", "C3"}
 
-    def test_filtre_par_dates(self, repository, mock_session):
+    def test_filtre_par_dates(self, repository, sqlite_session):
         """Filtre par plage de dates."""
-        mock_session.count.return_value = 5
-        mock_session.all.return_value = []
-
-        date_debut = datetime.now() - timedelta(days=30)
-        date_fin = datetime.now()
+        _inserer(sqlite_session, "Ancien", age=timedelta(days=60))
+        _inserer(sqlite_session, "Recent", age=timedelta(days=1))
 
         signalements, total = repository.find_all(
-            date_debut=date_debut, date_fin=date_fin
+            date_debut=datetime.now() - timedelta(days=30), date_fin=datetime.now()
         )
 
-        assert mock_session.filter.call_count >= 1
+        assert total == 1
+        assert signalements[0].titre == "Recent"
 
 
 class TestFindByCreateur:
@@ -468,48 +514,15 @@ class TestCountByPriorite:
 class TestFindEnRetard:
     """Tests pour find_en_retard."""
 
-    @pytest.fixture
-    def mock_session(self):
-        session = MagicMock()
-        session.query.return_value = session
-        session.filter.return_value = session
-        session.order_by.return_value = session
-        return session
-
-    @pytest.fixture
-    def repository(self, mock_session):
-        return SQLAlchemySignalementRepository(mock_session)
-
-    def test_trouve_signalements_en_retard(self, repository, mock_session):
-        """Trouve les signalements en retard."""
-        mock_model = Mock()
-        mock_model.id = 1
-        mock_model.chantier_id = 10
-        mock_model.titre = "Test"
-        mock_model.description = "Desc"
-        mock_model.priorite = "haute"
-        mock_model.statut = "ouvert"
-        mock_model.cree_par = 5
-        mock_model.assigne_a = None
-        mock_model.date_resolution_souhaitee = datetime.now() - timedelta(days=1)  # Passe
-        mock_model.date_traitement = None
-        mock_model.date_cloture = None
-        mock_model.commentaire_traitement = None
-        mock_model.photo_url = None
-        mock_model.localisation = None
-        mock_model.nb_escalades = 0
-        mock_model.derniere_escalade_at = None
-        mock_model.created_at = datetime.now() - timedelta(days=5)
-        mock_model.updated_at = datetime.now()
-
-        mock_session.all.return_value = [mock_model]
+    def test_trouve_signalements_en_retard(self, sqlite_session):
+        """Trouve les signalements en retard du chantier."""
+        _inserer(sqlite_session, "Retard", priorite=Priorite.HAUTE, age=timedelta(days=2))
+        _inserer(sqlite_session, "A l'heure", priorite=Priorite.HAUTE)
+        _inserer(sqlite_session, "Autre chantier", chantier_id=11, age=timedelta(days=5))
 
-        # Mock est_en_retard sur l'entite
-        with patch.object(Signalement, "est_en_retard", True):
-            result = repository.find_en_retard(chantier_id=10)
+        result = SQLAlchemySignalementRepository(sqlite_session).find_en_retard(chantier_id=10)
 
-        # Le filtre statut in est applique
-        mock_session.filter.assert_called()
+        assert [s.titre for s in result] == ["Retard"]
 
 
 class TestFindAEscalader:
@@ -560,37 +573,28 @@ class TestSearch:
     """Tests pour search."""
 
     @pytest.fixture
-    def mock_session(self):
-        session = MagicMock()
-        session.query.return_value = session
-        session.filter.return_value = session
-        session.order_by.return_value = session
-        session.offset.return_value = session
-        session.limit.return_value = session
-        return session
-
-    @pytest.fixture
-    def repository(self, mock_session):
-        return SQLAlchemySignalementRepository(mock_session)
+    def repository(self, sqlite_session):
+        return SQLAlchemySignalementRepository(sqlite_session)
 
-    def test_recherche_par_texte(self, repository, mock_session):
+    def test_recherche_par_texte(self, repository, sqlite_session):
         """Recherche par texte dans titre, description, localisation."""
-        mock_session.count.return_value = 5
-        mock_session.all.return_value = []
+        _inserer(sqlite_session, "Probleme de securite")
+        _inserer(sqlite_session, "Panne grue")
 
         signalements, total = repository.search("securite")
 
-        assert total == 5
-        mock_session.filter.assert_called()
+        assert total == 1
+        assert signalements[0].titre == "Probleme de securite"
 
-    def test_recherche_avec_chantier_id(self, repository, mock_session):
+    def test_recherche_avec_chantier_id(self, repository, sqlite_session):
         """Recherche limitee a un chantier."""
-        mock_session.count.return_value = 2
-        mock_session.all.return_value = []
+        _inserer(sqlite_session, "Panne grue", chantier_id=10)
+        _inserer(sqlite_session, "Panne betonniere", chantier_id=11)
 
         signalements, total = repository.search("panne", chantier_id=10)
 
-        assert total == 2
+        assert total == 1
+        assert signalements[0].chantier_id == 10
 
 
 class TestGetStatistiques:
@@ -208,9 +208,10 @@ class TestGetSignalementsEnRetardUseCase:
             self._create_signalement_en_retard(1, "Test 1"),
             self._create_signalement_en_retard(2, "Test 2"),
         ]
+        # Nombres de reponses charges par le repository avec la liste
+        signalements[0].nb_reponses = 3
+        signalements[1].nb_reponses = 7
         self.mock_signalement_repo.find_en_retard.return_value = signalements
-        # Differents nombres de reponses
-        self.mock_reponse_repo.count_by_signalement.side_effect = [3, 7]
 
         result = self.use_case.execute()
 
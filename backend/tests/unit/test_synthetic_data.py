@@ -0,0 +1,87 @@
+"""Tests du générateur de données synthétiques et de la suite de benchmarks."""
+
+from dataclasses import replace
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from modules.chantiers.infrastructure.persistence import ChantierModel
+from modules.chantiers.infrastructure.persistence.sqlalchemy_chantier_repository import (
+    SQLAlchemyChantierRepository,
+)
+from modules.pointages.infrastructure.persistence import PointageModel
+from scripts.benchmark_suite import compare
+from scripts.synthetic_data import SCALES, SyntheticDataSpec, generate_synthetic_data
+from shared.infrastructure.database_base import Base
+
+SPEC = SyntheticDataSpec(
+    chantiers=4, employes=20, semaines=2, semaines_charge=2,
+    achats=30, devis=2, lignes_par_devis=40, posts=10,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'synthetic.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+class TestGenerateSyntheticData:
+    """Génération en masse du jeu de données."""
+
+    def test_volumes(self, engine):
+        counts = generate_synthetic_data(engine, SPEC)
+
+        assert counts["users"] == SPEC.employes + 1
+        assert counts["chantiers"] == SPEC.chantiers
+        assert counts["achats"] == SPEC.achats
+        assert counts["devis"] == SPEC.devis
+        assert counts["lignes_devis"] == SPEC.devis * SPEC.lignes_par_devis
+        assert counts["posts"] == SPEC.posts
+        assert counts["pointages"] > 0
+        assert counts["besoins_charge"] > 0
+
+    def test_pointages_avant_la_date_de_reference(self, engine):
+        generate_synthetic_data(engine, SPEC)
+
+        with engine.connect() as conn:
+            derniere = conn.execute(select(func.max(PointageModel.date_pointage))).scalar()
+        assert derniere < SPEC.date_reference
+
+    def test_deterministe_et_cumulable(self, engine):
+        premier = generate_synthetic_data(engine, SPEC)
+        second = generate_synthetic_data(engine, replace(SPEC, seed=SPEC.seed))
+
+        assert premier == second
+        with engine.connect() as conn:
+            assert conn.execute(select(func.count(ChantierModel.id))).scalar() == 2 * SPEC.chantiers
+
+    def test_chantiers_valides_pour_le_domaine(self, engine):
+        generate_synthetic_data(engine, SPEC)
+
+        with Session(engine) as db:
+            chantiers = SQLAlchemyChantierRepository(db).find_all(skip=0, limit=10)
+        assert len(chantiers) == SPEC.chantiers
+
+    def test_echelles(self):
+        assert SCALES["small"].chantiers < SCALES["medium"].chantiers < SCALES["large"].chantiers
+
+
+class TestCompare:
+    """Comparaison des résultats à une référence."""
+
+    def test_regression_au_dela_de_la_tolerance(self):
+        baseline = {"feed": {"median_ms": 10.0}, "devis_recalcul": {"median_ms": 100.0}}
+        results = {"feed": {"median_ms": 13.0}, "devis_recalcul": {"median_ms": 120.0}}
+
+        comparaison = {c["scenario"]: c for c in compare(results, baseline, tolerance=0.25)}
+
+        assert comparaison["feed"]["regression"] is True
+        assert comparaison["feed"]["ratio"] == 1.3
+        assert comparaison["devis_recalcul"]["regression"] is False
+
+    def test_scenario_absent_de_la_reference(self):
+        assert compare({"feed": {"median_ms": 10.0}}, {}) == []
@@ -34,6 +34,7 @@ export interface Dossier {
 
 export interface DossierTree extends Dossier {
   children: DossierTree[];
+  taille_documents?: number;
 }
 
 export interface Document {
@@ -1,13 +1,15 @@
 """SDK Python officiel pour Hub Chantier API."""
 
 from .client import HubChantierClient
+from .async_client import AsyncHubChantierClient
 from .exceptions import HubChantierError, APIError, AuthenticationError, RateLimitError
 from .webhooks import verify_webhook_signature
 
-__version__ = "1.0.0"
+__version__ = "1.1.0"
 
 __all__ = [
     "HubChantierClient",
+    "AsyncHubChantierClient",
     "HubChantierError",
     "APIError",
     "AuthenticationError",
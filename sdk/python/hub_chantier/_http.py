@@ -0,0 +1,198 @@
+"""Logique HTTP commune aux clients synchrone et asynchrone.
+
+- Traduction des réponses en erreurs du SDK.
+- Calcul du délai d'attente avant une nouvelle tentative, en respectant
+  les en-têtes ``Retry-After`` et ``X-RateLimit-Reset`` du serveur.
+- Pagination : extraction des éléments d'une page de résultats et
+  découpage d'une période en tranches de dates.
+"""
+
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, List, Mapping, Optional, Tuple
+
+from .exceptions import APIError, AuthenticationError, RateLimitError
+
+USER_AGENT = "hub-chantier-python/1.1.0"
+
+# Statuts pour lesquels une nouvelle tentative a un sens
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Seules ces méthodes sont rejouées après une erreur serveur ou réseau ;
+# un 429 est rejoué quelle que soit la méthode (la requête n'a pas été traitée)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_MAX_BACKOFF = 60.0
+
+
+def should_retry(method: str, status_code: int) -> bool:
+    """
+    Indique si une réponse justifie une nouvelle tentative.
+
+    Args:
+        method: Méthode HTTP de la requête
+        status_code: Code HTTP de la réponse
+
+    Returns:
+        True si la requête peut être rejouée
+    """
+    if status_code == 429:
+        return True
+    return status_code in RETRY_STATUSES and method.upper() in IDEMPOTENT_METHODS
+
+
+def retry_delay(
+    headers: Mapping[str, str],
+    attempt: int,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    max_backoff: float = DEFAULT_MAX_BACKOFF,
+    now: Callable[[], float] = time.time,
+) -> float:
+    """
+    Calcule l'attente avant la tentative suivante.
+
+    Ordre de priorité :
+    1. ``Retry-After`` (secondes ou date HTTP)
+    2. ``X-RateLimit-Reset`` (timestamp epoch ou date ISO 8601)
+    3. Backoff exponentiel avec jitter : backoff_factor * 2^attempt
+
+    Args:
+        headers: En-têtes de la réponse
+        attempt: Numéro de la tentative échouée (0 pour la première)
+        backoff_factor: Base du backoff exponentiel (secondes)
+        max_backoff: Attente maximale (secondes)
+        now: Horloge (timestamp epoch)
+
+    Returns:
+        Délai en secondes (borné par max_backoff)
+    """
+    delai = _delai_serveur(headers, now())
+    if delai is None:
+        delai = backoff_factor * (2 ** attempt)
+        delai += random.uniform(0, delai / 2)
+    return max(0.0, min(delai, max_backoff))
+
+
+def _delai_serveur(headers: Mapping[str, str], maintenant: float) -> Optional[float]:
+    """Délai imposé par le serveur (Retry-After puis X-RateLimit-Reset)."""
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            try:
+                return parsedate_to_datetime(retry_after).timestamp() - maintenant
+            except (TypeError, ValueError):
+                pass
+
+    reset = headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            valeur = float(reset)
+            # Timestamp absolu ou nombre de secondes restantes
+            return valeur - maintenant if valeur > 1e9 else valeur
+        except ValueError:
+            try:
+                echeance = datetime.fromisoformat(reset.replace("Z", "+00:00"))
+                if echeance.tzinfo is None:
+                    echeance = echeance.replace(tzinfo=timezone.utc)
+                return echeance.timestamp() - maintenant
+            except ValueError:
+                pass
+    return None
+
+
+def raise_for_status(
+    status_code: int,
+    headers: Mapping[str, str],
+    json_body: Callable[[], Any],
+) -> None:
+    """
+    Lève l'exception du SDK correspondant à une réponse en erreur.
+
+    Args:
+        status_code: Code HTTP de la réponse
+        headers: En-têtes de la réponse
+        json_body: Fonction retournant le corps JSON de la réponse
+
+    Raises:
+        AuthenticationError: Si API key invalide (401)
+        RateLimitError: Si rate limit dépassé (429)
+        APIError: Autre erreur API (>= 400)
+    """
+    if status_code == 401:
+        raise AuthenticationError("Invalid or expired API key")
+
+    if status_code == 429:
+        reset_at = headers.get("X-RateLimit-Reset") or headers.get("Retry-After")
+        raise RateLimitError(
+            f"Rate limit exceeded. Resets at {reset_at}", reset_at=reset_at
+        )
+
+    if status_code >= 400:
+        try:
+            body = json_body()
+        except ValueError:
+            body = None
+        error_detail = (
+            body.get("detail", "Unknown error") if isinstance(body, dict) else "Unknown error"
+        )
+        raise APIError(
+            f"API Error ({status_code}): {error_detail}",
+            status_code=status_code,
+            response=body if isinstance(body, dict) else None,
+        )
+
+
+def page_items(response: Any) -> Tuple[List[Any], Optional[int]]:
+    """
+    Extrait les éléments d'une page de résultats.
+
+    Accepte une réponse paginée (``{"items": [...], "total": N}``) ou une
+    liste directe.
+
+    Args:
+        response: Réponse JSON d'un endpoint de liste
+
+    Returns:
+        (éléments de la page, total annoncé ou None)
+    """
+    if isinstance(response, dict) and "items" in response:
+        total = response.get("total")
+        return list(response["items"]), total if isinstance(total, int) else None
+    if isinstance(response, list):
+        return response, None
+    return [], None
+
+
+def split_date_range(date_debut: str, date_fin: str, chunk_days: int) -> List[Tuple[str, str]]:
+    """
+    Découpe une période en tranches consécutives, bornes incluses.
+
+    Args:
+        date_debut: Date de début (ISO 8601)
+        date_fin: Date de fin (ISO 8601)
+        chunk_days: Taille des tranches en jours (>= 1)
+
+    Returns:
+        Liste de (début, fin) au format ISO 8601
+
+    Example:
+        >>> split_date_range("2026-01-01", "2026-01-10", 7)
+        [('2026-01-01', '2026-01-07'), ('2026-01-08', '2026-01-10')]
+    """
+    if chunk_days < 1:
+        raise ValueError("chunk_days must be >= 1")
+
+    debut = date.fromisoformat(date_debut)
+    fin = date.fromisoformat(date_fin)
+    tranches = []
+    while debut <= fin:
+        fin_tranche = min(debut + timedelta(days=chunk_days - 1), fin)
+        tranches.append((debut.isoformat(), fin_tranche.isoformat()))
+        debut = fin_tranche + timedelta(days=1)
+    return tranches
@@ -0,0 +1,390 @@
+"""Client asynchrone Hub Chantier API (httpx).
+
+Destiné aux extractions en masse (synchronisation ERP, entrepôt de
+données) : les pages de chantiers et les tranches de dates des heures et
+affectations sont demandées en parallèle, avec une concurrence bornée et
+un pool de connexions partagé.
+
+Nécessite httpx : ``pip install hub-chantier[async]``.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from .exceptions import APIError
+from ._http import (
+    USER_AGENT,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_BACKOFF_FACTOR,
+    IDEMPOTENT_METHODS,
+    page_items,
+    raise_for_status,
+    retry_delay,
+    should_retry,
+    split_date_range,
+)
+
+
+class AsyncHubChantierClient:
+    """
+    Client asynchrone Hub Chantier API.
+
+    Usage:
+        >>> async with AsyncHubChantierClient(api_key="hbc_your_key") as client:
+        ...     chantiers = await client.fetch_all_chantiers(status="en_cours")
+        ...     heures = await client.fetch_heures("2026-01-01", "2026-03-31")
+
+    Args:
+        api_key: Clé API Hub Chantier (depuis Paramètres > Clés API)
+        base_url: URL de base de l'API (par défaut: production)
+        timeout: Timeout requêtes HTTP (secondes)
+        max_concurrency: Nombre maximal de requêtes simultanées
+        max_retries: Nombre maximal de nouvelles tentatives (0 = aucune)
+        backoff_factor: Base du backoff exponentiel (secondes)
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.hub-chantier.fr",
+        timeout: int = 30,
+        max_concurrency: int = 8,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        transport: Optional[Any] = None,
+    ):
+        """
+        Initialize async Hub Chantier client.
+
+        Args:
+            api_key: Clé API (format: hbc_...)
+            base_url: URL de base de l'API
+            timeout: Timeout en secondes
+            max_concurrency: Requêtes simultanées maximales (>= 1)
+            max_retries: Nombre maximal de nouvelles tentatives
+            backoff_factor: Base du backoff exponentiel (secondes)
+            transport: Transport httpx (optionnel, ex: tests)
+
+        Raises:
+            ValueError: Si api_key invalide
+            ImportError: Si httpx n'est pas installé
+        """
+        if not api_key:
+            raise ValueError("api_key is required")
+
+        if not api_key.startswith("hbc_"):
+            raise ValueError("Invalid API key format (must start with 'hbc_')")
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+        try:
+            import httpx
+        except ImportError as e:  # pragma: no cover - dépend de l'environnement
+            raise ImportError(
+                "AsyncHubChantierClient requires httpx: pip install hub-chantier[async]"
+            ) from e
+
+        self._httpx = httpx
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "User-Agent": USER_AGENT,
+            },
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        """Ferme les connexions du pool."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncHubChantierClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Effectue une requête HTTP vers l'API (concurrence bornée).
+
+        L'attente avant une nouvelle tentative se fait hors du sémaphore,
+        pour ne pas bloquer les autres requêtes.
+
+        Args:
+            method: Méthode HTTP (GET, POST, PUT, DELETE)
+            path: Chemin endpoint (ex: '/api/chantiers')
+            params: Query parameters
+            json: Body JSON
+
+        Returns:
+            Réponse JSON parsée
+
+        Raises:
+            AuthenticationError: Si API key invalide
+            RateLimitError: Si rate limit dépassé (après les nouvelles tentatives)
+            APIError: Autre erreur API
+        """
+        attempt = 0
+
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await self._http.request(
+                        method, path, params=params, json=json
+                    )
+            except self._httpx.HTTPError as e:
+                if attempt < self.max_retries and method.upper() in IDEMPOTENT_METHODS:
+                    await asyncio.sleep(retry_delay({}, attempt, self.backoff_factor))
+                    attempt += 1
+                    continue
+                raise APIError(f"Network error: {e}")
+
+            if attempt < self.max_retries and should_retry(method, response.status_code):
+                await asyncio.sleep(
+                    retry_delay(response.headers, attempt, self.backoff_factor)
+                )
+                attempt += 1
+                continue
+
+            raise_for_status(response.status_code, response.headers, response.json)
+
+            if response.status_code == 204 or not response.content:
+                return None
+            return response.json()
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Effectue un GET (ex: ``await client.get("/api/chantiers/42")``)."""
+        return await self._request("GET", path, params=params)
+
+    # =========================================================================
+    # Extractions en masse
+    # =========================================================================
+
+    async def fetch_all_chantiers(
+        self,
+        status: Optional[str] = None,
+        conducteur_id: Optional[int] = None,
+        page_size: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Récupère tous les chantiers.
+
+        La première page donne le total ; les pages restantes sont
+        demandées en parallèle. Sans total annoncé, les pages sont
+        parcourues séquentiellement jusqu'à une page incomplète.
+
+        Args:
+            status: Filtrer par statut
+            conducteur_id: Filtrer par conducteur
+            page_size: Nombre de chantiers par page (1-100)
+
+        Returns:
+            Liste de chantiers, dans l'ordre des pages
+        """
+        params: Dict[str, Any] = {}
+        if status:
+            params["status"] = status
+        if conducteur_id:
+            params["conducteur_id"] = conducteur_id
+
+        async def page(offset: int) -> Tuple[List[Any], Optional[int]]:
+            response = await self.get(
+                "/api/chantiers", {**params, "limit": page_size, "offset": offset}
+            )
+            return page_items(response)
+
+        items, total = await page(0)
+        chantiers = list(items)
+
+        if total is not None:
+            offsets = range(len(items), total, page_size) if len(items) == page_size else []
+            for suite, _ in await asyncio.gather(*(page(o) for o in offsets)):
+                chantiers.extend(suite)
+            return chantiers
+
+        while len(items) == page_size:
+            items, _ = await page(len(chantiers))
+            chantiers.extend(items)
+        return chantiers
+
+    async def fetch_heures(
+        self, date_debut: str, date_fin: str, chunk_days: int = 7, page_size: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Récupère les feuilles d'heures d'une période, par tranches parallèles.
+
+        Args:
+            date_debut: Date de début (ISO 8601)
+            date_fin: Date de fin (ISO 8601)
+            chunk_days: Taille des tranches en jours
+            page_size: Nombre d'éléments par page, dans une tranche
+
+        Returns:
+            Feuilles d'heures, dans l'ordre chronologique des tranches
+        """
+        return await self._fetch_par_tranches(
+            "/api/feuilles-heures", date_debut, date_fin, chunk_days, page_size=page_size
+        )
+
+    async def fetch_affectations(
+        self,
+        date_debut: str,
+        date_fin: str,
+        utilisateur_ids: Optional[List[int]] = None,
+        chunk_days: int = 7,
+        page_size: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Récupère les affectations d'une période, par tranches parallèles.
+
+        Args:
+            date_debut: Date de début (ISO 8601)
+            date_fin: Date de fin (ISO 8601)
+            utilisateur_ids: Filtrer par utilisateurs
+            chunk_days: Taille des tranches en jours
+            page_size: Nombre d'éléments par page, dans une tranche
+
+        Returns:
+            Affectations, dans l'ordre chronologique des tranches
+        """
+        extra: Dict[str, Any] = {}
+        if utilisateur_ids:
+            extra["utilisateur_ids"] = ",".join(map(str, utilisateur_ids))
+        return await self._fetch_par_tranches(
+            "/api/affectations", date_debut, date_fin, chunk_days, extra, page_size
+        )
+
+    async def iter_heures(
+        self, date_debut: str, date_fin: str, chunk_days: int = 7, page_size: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parcourt les feuilles d'heures d'une période, tranche par tranche.
+
+        Contrairement à fetch_heures, les tranches sont demandées à la
+        demande, une à la fois : la mémoire reste bornée à une tranche et
+        interrompre l'itération évite de télécharger les suivantes.
+
+        Args:
+            date_debut: Date de début (ISO 8601)
+            date_fin: Date de fin (ISO 8601)
+            chunk_days: Taille des tranches en jours
+            page_size: Nombre d'éléments par page, dans une tranche
+
+        Yields:
+            Feuilles d'heures, dans l'ordre chronologique des tranches
+
+        Example:
+            >>> async for feuille in client.iter_heures("2026-01-01", "2026-12-31"):
+            ...     print(feuille['id'])
+        """
+        async for item in self._iter_par_tranches(
+            "/api/feuilles-heures", date_debut, date_fin, chunk_days, page_size=page_size
+        ):
+            yield item
+
+    async def iter_affectations(
+        self,
+        date_debut: str,
+        date_fin: str,
+        utilisateur_ids: Optional[List[int]] = None,
+        chunk_days: int = 7,
+        page_size: int = 100,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parcourt les affectations d'une période, tranche par tranche.
+
+        Args:
+            date_debut: Date de début (ISO 8601)
+            date_fin: Date de fin (ISO 8601)
+            utilisateur_ids: Filtrer par utilisateurs
+            chunk_days: Taille des tranches en jours
+            page_size: Nombre d'éléments par page, dans une tranche
+
+        Yields:
+            Affectations, dans l'ordre chronologique des tranches
+        """
+        extra: Dict[str, Any] = {}
+        if utilisateur_ids:
+            extra["utilisateur_ids"] = ",".join(map(str, utilisateur_ids))
+        async for item in self._iter_par_tranches(
+            "/api/affectations", date_debut, date_fin, chunk_days, extra, page_size
+        ):
+            yield item
+
+    async def _iter_par_tranches(
+        self,
+        path: str,
+        date_debut: str,
+        date_fin: str,
+        chunk_days: int,
+        extra: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Découpe [date_debut, date_fin] en tranches et les charge une à une."""
+        for debut, fin in split_date_range(date_debut, date_fin, chunk_days):
+            async for item in self._iter_pages(
+                path, {**(extra or {}), "date_debut": debut, "date_fin": fin}, page_size
+            ):
+                yield item
+
+    async def _fetch_par_tranches(
+        self,
+        path: str,
+        date_debut: str,
+        date_fin: str,
+        chunk_days: int,
+        extra: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Découpe [date_debut, date_fin] en tranches et les charge en parallèle."""
+        tranches = split_date_range(date_debut, date_fin, chunk_days)
+
+        async def tranche(debut: str, fin: str) -> List[Any]:
+            params = {**(extra or {}), "date_debut": debut, "date_fin": fin}
+            return [item async for item in self._iter_pages(path, params, page_size)]
+
+        # gather conserve l'ordre ; le sémaphore borne la concurrence
+        resultats = await asyncio.gather(*(tranche(d, f) for d, f in tranches))
+        return [item for items in resultats for item in items]
+
+    async def _iter_pages(
+        self, path: str, params: Dict[str, Any], page_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parcourt les pages (limit/offset) d'un endpoint de liste, une à une.
+
+        S'arrête sur une page incomplète ou quand le total annoncé par le
+        serveur est atteint, comme ``BaseResource._paginate``.
+        """
+        offset = 0
+        while True:
+            items, total = page_items(
+                await self.get(path, {**params, "limit": page_size, "offset": offset})
+            )
+            for item in items:
+                yield item
+
+            offset += len(items)
+            if len(items) < page_size or (total is not None and offset >= total):
+                return
@@ -1,24 +1,45 @@
 """Client principal Hub Chantier API."""
 
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any
-from .exceptions import APIError, AuthenticationError, RateLimitError
+from .exceptions import APIError
+from ._http import (
+    USER_AGENT,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_BACKOFF_FACTOR,
+    IDEMPOTENT_METHODS,
+    raise_for_status,
+    retry_delay,
+    should_retry,
+)
 
 
 class HubChantierClient:
     """
     Client Hub Chantier API.
 
+    Les requêtes passent par une ``requests.Session`` unique : les
+    connexions TCP/TLS sont réutilisées d'un appel à l'autre. Les réponses
+    429 (et 502/503/504 sur les méthodes idempotentes) sont rejouées
+    automatiquement en respectant ``Retry-After`` / ``X-RateLimit-Reset``.
+
     Usage:
         >>> client = HubChantierClient(api_key="hbc_your_key")
         >>> chantiers = client.chantiers.list()
         >>> for chantier in chantiers:
         ...     print(chantier['nom'])
+        >>> for chantier in client.chantiers.iter_all():  # toutes les pages
+        ...     print(chantier['nom'])
 
     Args:
         api_key: Clé API Hub Chantier (depuis Paramètres > Clés API)
         base_url: URL de base de l'API (par défaut: production)
         timeout: Timeout requêtes HTTP (secondes)
+        max_retries: Nombre maximal de nouvelles tentatives (0 = aucune)
+        backoff_factor: Base du backoff exponentiel (secondes)
+        pool_maxsize: Nombre de connexions conservées par hôte
     """
 
     def __init__(
@@ -26,6 +47,10 @@ class HubChantierClient:
         api_key: str,
         base_url: str = "https://api.hub-chantier.fr",
         timeout: int = 30,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        pool_maxsize: int = 10,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize Hub Chantier client.
@@ -34,6 +59,10 @@ class HubChantierClient:
             api_key: Clé API (format: hbc_...)
             base_url: URL de base de l'API
             timeout: Timeout en secondes
+            max_retries: Nombre maximal de nouvelles tentatives
+            backoff_factor: Base du backoff exponentiel (secondes)
+            pool_maxsize: Taille du pool de connexions par hôte
+            session: Session requests à utiliser (optionnel)
 
         Raises:
             ValueError: Si api_key invalide
@@ -47,6 +76,21 @@ class HubChantierClient:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        session.headers.update(
+            {
+                "Authorization": f"Bearer {self.api_key}",
+                "User-Agent": USER_AGENT,
+            }
+        )
+        self.session = session
 
         # Initialiser ressources (lazy import pour éviter circular imports)
         from .resources import Chantiers, Affectations, Heures, Documents, Webhooks
@@ -57,6 +101,16 @@ class HubChantierClient:
         self.documents = Documents(self)
         self.webhooks = Webhooks(self)
 
+    def close(self) -> None:
+        """Ferme les connexions du pool."""
+        self.session.close()
+
+    def __enter__(self) -> "HubChantierClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def _request(
         self,
         method: str,
@@ -78,45 +132,36 @@ class HubChantierClient:
 
         Raises:
             AuthenticationError: Si API key invalide
-            RateLimitError: Si rate limit dépassé
+            RateLimitError: Si rate limit dépassé (après les nouvelles tentatives)
             APIError: Autre erreur API
         """
         url = f"{self.base_url}{path}"
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "User-Agent": "hub-chantier-python/1.0.0",
-        }
-
-        try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                json=json,
-                timeout=self.timeout,
-            )
-
-            # Gestion erreurs HTTP
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid or expired API key")
-
-            elif response.status_code == 429:
-                reset_at = response.headers.get("X-RateLimit-Reset")
-                raise RateLimitError(
-                    f"Rate limit exceeded. Resets at {reset_at}", reset_at=reset_at
+        attempt = 0
+
+        while True:
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json,
+                    timeout=self.timeout,
                 )
+            except requests.RequestException as e:
+                if attempt < self.max_retries and method.upper() in IDEMPOTENT_METHODS:
+                    time.sleep(retry_delay({}, attempt, self.backoff_factor))
+                    attempt += 1
+                    continue
+                raise APIError(f"Network error: {e}")
+
+            if attempt < self.max_retries and should_retry(method, response.status_code):
+                time.sleep(retry_delay(response.headers, attempt, self.backoff_factor))
+                attempt += 1
+                continue
 
-            elif response.status_code >= 400:
-                error_detail = response.json().get("detail", "Unknown error")
-                raise APIError(
-                    f"API Error ({response.status_code}): {error_detail}",
-                    status_code=response.status_code,
-                    response=response.json(),
-                )
+            # Gestion erreurs HTTP
+            raise_for_status(response.status_code, response.headers, response.json)
 
+            if response.status_code == 204 or not response.content:
+                return None  # type: ignore
             return response.json()
-
-        except requests.RequestException as e:
-            raise APIError(f"Network error: {e}")
@@ -1,6 +1,6 @@
 """Ressource Affectations (Planning)."""
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Iterator, Optional, Any
 from .base import BaseResource
 
 
@@ -10,6 +10,8 @@ class Affectations(BaseResource):
 
     Usage:
         >>> affectations = client.affectations.list("2026-01-20", "2026-01-26")
+        >>> for affectation in client.affectations.iter_all("2026-01-01", "2026-06-30"):
+        ...     print(affectation['id'])
         >>> affectation = client.affectations.create(
         ...     utilisateur_id=5,
         ...     chantier_id=42,
@@ -37,6 +39,38 @@ class Affectations(BaseResource):
 
         return self.client._request("GET", "/api/affectations", params=params)  # type: ignore
 
+    def iter_all(
+        self,
+        date_debut: str,
+        date_fin: str,
+        utilisateur_ids: Optional[List[int]] = None,
+        chunk_days: int = 7,
+        page_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les affectations d'une période, par tranches de dates.
+
+        Les tranches sont chargées à la demande : interrompre l'itération
+        évite de télécharger les suivantes.
+
+        Args:
+            date_debut: Date de début (ISO 8601)
+            date_fin: Date de fin (ISO 8601)
+            utilisateur_ids: Filtrer par utilisateurs
+            chunk_days: Taille des tranches en jours
+            page_size: Nombre d'affectations par page, dans une tranche
+
+        Yields:
+            Affectations, dans l'ordre chronologique
+        """
+        params: Dict[str, Any] = {}
+        if utilisateur_ids:
+            params["utilisateur_ids"] = ",".join(map(str, utilisateur_ids))
+
+        return self._iter_par_tranches(
+            "/api/affectations", date_debut, date_fin, params, chunk_days, page_size
+        )
+
     def create(
         self,
         utilisateur_id: int,
@@ -1,6 +1,8 @@
 """Classe de base pour les ressources API."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+from .._http import page_items, split_date_range
 
 if TYPE_CHECKING:
     from ..client import HubChantierClient
@@ -17,3 +19,65 @@ class BaseResource:
             client: Instance du client Hub Chantier
         """
         self.client = client
+
+    def _paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt toutes les pages d'un endpoint de liste (limit/offset).
+
+        Les pages sont demandées à la volée, au fil de l'itération. Le
+        parcours s'arrête sur une page incomplète ou quand le total annoncé
+        par le serveur est atteint.
+
+        Args:
+            path: Chemin endpoint
+            params: Filtres (hors limit/offset)
+            page_size: Nombre d'éléments par page
+
+        Yields:
+            Éléments, dans l'ordre des pages
+        """
+        offset = 0
+        while True:
+            page_params = {**(params or {}), "limit": page_size, "offset": offset}
+            items, total = page_items(self.client._request("GET", path, params=page_params))
+            yield from items
+
+            offset += len(items)
+            if len(items) < page_size or (total is not None and offset >= total):
+                return
+
+    def _iter_par_tranches(
+        self,
+        path: str,
+        date_debut: str,
+        date_fin: str,
+        params: Optional[Dict[str, Any]] = None,
+        chunk_days: int = 7,
+        page_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt un endpoint filtré par période, tranche de dates par tranche.
+
+        Les tranches sont demandées à la volée, au fil de l'itération : la
+        mémoire reste bornée à une page, même sur une année complète. Chaque
+        tranche est elle-même paginée (limit/offset), comme ``_paginate``.
+
+        Args:
+            path: Chemin endpoint
+            date_debut: Date de début (ISO 8601)
+            date_fin: Date de fin (ISO 8601)
+            params: Filtres (hors date_debut/date_fin)
+            chunk_days: Taille des tranches en jours
+            page_size: Nombre d'éléments par page
+
+        Yields:
+            Éléments, dans l'ordre chronologique des tranches
+        """
+        for debut, fin in split_date_range(date_debut, date_fin, chunk_days):
+            tranche_params = {**(params or {}), "date_debut": debut, "date_fin": fin}
+            yield from self._paginate(path, tranche_params, page_size)
@@ -1,7 +1,8 @@
 """Ressource Chantiers."""
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Iterator, Optional, Any
 from .base import BaseResource
+from .._http import page_items
 
 
 class Chantiers(BaseResource):
@@ -10,6 +11,8 @@ class Chantiers(BaseResource):
 
     Usage:
         >>> chantiers = client.chantiers.list()
+        >>> for chantier in client.chantiers.iter_all(status="en_cours"):
+        ...     print(chantier['nom'])
         >>> chantier = client.chantiers.create(nom="Villa Lyon", adresse="...")
         >>> chantier = client.chantiers.get(42)
         >>> client.chantiers.update(42, statut="en_cours")
@@ -48,9 +51,40 @@ class Chantiers(BaseResource):
 
         response = self.client._request("GET", "/api/chantiers", params=params)
         # Handle both paginated response (with "items") and direct list
-        if isinstance(response, dict) and "items" in response:
-            return response["items"]  # type: ignore
-        return response  # type: ignore
+        items, _ = page_items(response)
+        return items
+
+    def iter_all(
+        self,
+        status: Optional[str] = None,
+        conducteur_id: Optional[int] = None,
+        page_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt tous les chantiers, page par page.
+
+        Les pages sont chargées à la demande : interrompre l'itération
+        évite de télécharger les suivantes.
+
+        Args:
+            status: Filtrer par statut (ouvert, en_cours, receptionne, ferme)
+            conducteur_id: Filtrer par conducteur
+            page_size: Nombre de chantiers par page (1-100)
+
+        Yields:
+            Chantiers
+
+        Example:
+            >>> for chantier in client.chantiers.iter_all(status="en_cours"):
+            ...     print(chantier['nom'])
+        """
+        params: Dict[str, Any] = {}
+        if status:
+            params["status"] = status
+        if conducteur_id:
+            params["conducteur_id"] = conducteur_id
+
+        return self._paginate("/api/chantiers", params=params, page_size=page_size)
 
     def get(self, chantier_id: int) -> Dict[str, Any]:
         """
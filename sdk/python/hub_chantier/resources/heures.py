@@ -1,11 +1,18 @@
 """Ressource Feuilles d'Heures."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from .base import BaseResource
 
 
 class Heures(BaseResource):
-    """Gestion des feuilles d'heures."""
+    """
+    Gestion des feuilles d'heures.
+
+    Usage:
+        >>> feuilles = client.heures.list("2026-01-01", "2026-01-31")
+        >>> for feuille in client.heures.iter_all("2026-01-01", "2026-12-31"):
+        ...     print(feuille['id'])
+    """
 
     def list(self, date_debut: str, date_fin: str) -> List[Dict[str, Any]]:
         """
@@ -21,6 +28,36 @@ class Heures(BaseResource):
         params: Dict[str, str] = {"date_debut": date_debut, "date_fin": date_fin}
         return self.client._request("GET", "/api/feuilles-heures", params=params)  # type: ignore
 
+    def iter_all(
+        self, date_debut: str, date_fin: str, chunk_days: int = 7, page_size: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt les feuilles d'heures d'une période, par tranches de dates.
+
+        Les tranches sont chargées à la demande : interrompre l'itération
+        évite de télécharger les suivantes.
+
+        Args:
+            date_debut: Date de début (ISO 8601)
+            date_fin: Date de fin (ISO 8601)
+            chunk_days: Taille des tranches en jours
+            page_size: Nombre de feuilles par page, dans une tranche
+
+        Yields:
+            Feuilles d'heures, dans l'ordre chronologique
+
+        Example:
+            >>> for feuille in client.heures.iter_all("2026-01-01", "2026-12-31"):
+            ...     print(feuille['id'])
+        """
+        return self._iter_par_tranches(
+            "/api/feuilles-heures",
+            date_debut,
+            date_fin,
+            chunk_days=chunk_days,
+            page_size=page_size,
+        )
+
     def create(
         self, utilisateur_id: int, chantier_id: int, date: str, heures: float
     ) -> Dict[str, Any]:
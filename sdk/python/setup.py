@@ -13,7 +13,7 @@ except FileNotFoundError:
 
 setup(
     name="hub-chantier",
-    version="1.0.0",
+    version="1.1.0",
     author="Hub Chantier",
     author_email="support@hub-chantier.fr",
     description="SDK Python officiel pour Hub Chantier API",
@@ -37,6 +37,9 @@ setup(
         "requests>=2.28.0",
     ],
     extras_require={
+        "async": [
+            "httpx>=0.24.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -0,0 +1,192 @@
+"""Tests unitaires pour le client asynchrone Hub Chantier."""
+
+import asyncio
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from hub_chantier import AsyncHubChantierClient
+from hub_chantier.async_client import split_date_range
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _client(handler, **kwargs):
+    return AsyncHubChantierClient(
+        api_key="hbc_test_key",
+        base_url="https://test.local",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def _params(request):
+    return {k: v[0] for k, v in parse_qs(request.url.query.decode()).items()}
+
+
+def test_async_client_invalid_key():
+    """Test initialisation avec format de clé invalide."""
+    with pytest.raises(ValueError, match="Invalid API key format"):
+        AsyncHubChantierClient(api_key="invalid_key")
+
+
+def test_split_date_range():
+    """Test du découpage d'une période en tranches."""
+    assert split_date_range("2026-01-01", "2026-01-10", 7) == [
+        ("2026-01-01", "2026-01-07"),
+        ("2026-01-08", "2026-01-10"),
+    ]
+    assert split_date_range("2026-01-05", "2026-01-05", 7) == [("2026-01-05", "2026-01-05")]
+
+
+def test_fetch_all_chantiers_pages_in_parallel_with_bounded_concurrency():
+    """Test que les pages sont chargées en parallèle, sans dépasser la limite."""
+    en_cours = 0
+    pic = 0
+
+    async def handler(request):
+        nonlocal en_cours, pic
+        en_cours += 1
+        pic = max(pic, en_cours)
+        await asyncio.sleep(0.01)
+        en_cours -= 1
+        offset = int(_params(request)["offset"])
+        items = [{"id": i} for i in range(offset, min(offset + 10, 95))]
+        return httpx.Response(200, json={"items": items, "total": 95})
+
+    async def scenario():
+        async with _client(handler, max_concurrency=3) as client:
+            return await client.fetch_all_chantiers(page_size=10)
+
+    chantiers = _run(scenario())
+
+    assert [c["id"] for c in chantiers] == list(range(95))
+    assert 1 < pic <= 3
+
+
+def test_fetch_all_chantiers_without_total():
+    """Test du parcours séquentiel quand le serveur renvoie une liste simple."""
+    async def handler(request):
+        offset = int(_params(request)["offset"])
+        return httpx.Response(200, json=[{"id": i} for i in range(offset, min(offset + 2, 5))])
+
+    async def scenario():
+        async with _client(handler) as client:
+            return await client.fetch_all_chantiers(page_size=2)
+
+    assert [c["id"] for c in _run(scenario())] == [0, 1, 2, 3, 4]
+
+
+def test_fetch_heures_by_date_chunks():
+    """Test que les heures sont chargées par tranches, dans l'ordre."""
+    async def handler(request):
+        params = _params(request)
+        return httpx.Response(200, json=[{"debut": params["date_debut"]}])
+
+    async def scenario():
+        async with _client(handler) as client:
+            return await client.fetch_heures("2026-01-01", "2026-01-20", chunk_days=7)
+
+    assert [h["debut"] for h in _run(scenario())] == ["2026-01-01", "2026-01-08", "2026-01-15"]
+
+
+def test_fetch_affectations_forwards_user_filter():
+    """Test que le filtre utilisateurs est transmis à chaque tranche."""
+    vus = []
+
+    async def handler(request):
+        vus.append(_params(request)["utilisateur_ids"])
+        return httpx.Response(200, json=[])
+
+    async def scenario():
+        async with _client(handler) as client:
+            return await client.fetch_affectations(
+                "2026-01-01", "2026-01-14", utilisateur_ids=[1, 2]
+            )
+
+    assert _run(scenario()) == []
+    assert vus == ["1,2", "1,2"]
+
+
+def test_iter_heures_yields_chunks_in_order():
+    """Test que iter_heures renvoie les tranches dans l'ordre chronologique."""
+    async def handler(request):
+        params = _params(request)
+        return httpx.Response(200, json=[{"debut": params["date_debut"]}])
+
+    async def scenario():
+        async with _client(handler) as client:
+            return [h async for h in client.iter_heures("2026-01-01", "2026-01-20")]
+
+    assert [h["debut"] for h in _run(scenario())] == ["2026-01-01", "2026-01-08", "2026-01-15"]
+
+
+def test_iter_affectations_stops_early_without_extra_requests():
+    """Test qu'interrompre iter_affectations évite les tranches suivantes."""
+    vus = []
+
+    async def handler(request):
+        params = _params(request)
+        vus.append(params)
+        return httpx.Response(200, json=[{"debut": params["date_debut"]}])
+
+    async def scenario():
+        async with _client(handler) as client:
+            async for affectation in client.iter_affectations(
+                "2026-01-01", "2026-03-31", utilisateur_ids=[3]
+            ):
+                return affectation
+
+    assert _run(scenario()) == {"debut": "2026-01-01"}
+    assert len(vus) == 1
+    assert vus[0]["utilisateur_ids"] == "3"
+
+
+def test_fetch_and_iter_heures_page_within_each_chunk():
+    """Test que chaque tranche est lue page par page (limit/offset)."""
+    async def handler(request):
+        params = _params(request)
+        offset, limit = int(params["offset"]), int(params["limit"])
+        # 3 feuilles par tranche, plafonnées à `limit` par réponse
+        feuilles = [f"{params['date_debut']}#{i}" for i in range(3)]
+        return httpx.Response(200, json=[{"id": f} for f in feuilles[offset:offset + limit]])
+
+    async def scenario():
+        async with _client(handler) as client:
+            fetched = await client.fetch_heures("2026-01-01", "2026-01-14", page_size=2)
+            iterated = [h async for h in client.iter_heures(
+                "2026-01-01", "2026-01-14", page_size=2
+            )]
+            return fetched, iterated
+
+    attendu = [f"{d}#{i}" for d in ("2026-01-01", "2026-01-08") for i in range(3)]
+    fetched, iterated = _run(scenario())
+    assert [h["id"] for h in fetched] == attendu
+    assert [h["id"] for h in iterated] == attendu
+
+
+def test_async_client_retries_429(monkeypatch):
+    """Test qu'un 429 est rejoué en respectant Retry-After."""
+    attentes = []
+
+    async def fake_sleep(delai):
+        attentes.append(delai)
+
+    monkeypatch.setattr("hub_chantier.async_client.asyncio.sleep", fake_sleep)
+    reponses = [
+        httpx.Response(429, json={}, headers={"Retry-After": "1"}),
+        httpx.Response(200, json={"id": 42}),
+    ]
+
+    async def handler(request):
+        return reponses.pop(0)
+
+    async def scenario():
+        async with _client(handler) as client:
+            return await client.get("/api/chantiers/42")
+
+    assert _run(scenario()) == {"id": 42}
+    assert attentes == [1.0]
@@ -1,7 +1,10 @@
 """Tests unitaires pour le client Hub Chantier."""
 
+from unittest.mock import Mock, patch
+
 import pytest
-from hub_chantier import HubChantierClient, AuthenticationError
+from hub_chantier import HubChantierClient, AuthenticationError, RateLimitError
+from hub_chantier._http import retry_delay
 
 
 def test_client_init_valid_key():
@@ -46,3 +49,193 @@ def test_client_resources_initialized():
     assert client.heures is not None
     assert client.documents is not None
     assert client.webhooks is not None
+
+
+def _response(status_code=200, body=None, headers=None):
+    """Construit une réponse requests factice."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = b"{}" if body is not None else b""
+    response.json.return_value = body
+    return response
+
+
+def _client(*responses, **kwargs):
+    """Client dont la session renvoie les réponses fournies, dans l'ordre."""
+    session = Mock()
+    session.headers = {}
+    session.request.side_effect = list(responses)
+    client = HubChantierClient(api_key="hbc_test_key", session=session, **kwargs)
+    return client, session
+
+
+def test_client_uses_pooled_session_with_auth_headers():
+    """Test que toutes les requêtes passent par la même session authentifiée."""
+    client, session = _client(_response(body={"id": 1}), _response(body={"id": 2}))
+
+    client.chantiers.get(1)
+    client.chantiers.get(2)
+
+    assert session.request.call_count == 2
+    assert session.headers["Authorization"] == "Bearer hbc_test_key"
+
+
+def test_client_default_session_mounts_pool_adapter():
+    """Test que la session par défaut réutilise les connexions."""
+    with HubChantierClient(api_key="hbc_test_key", pool_maxsize=4) as client:
+        adapter = client.session.get_adapter("https://api.hub-chantier.fr")
+        assert adapter._pool_maxsize == 4
+
+
+@patch("hub_chantier.client.time.sleep")
+def test_client_retries_429_honouring_retry_after(mock_sleep):
+    """Test qu'un 429 est rejoué après le délai indiqué par le serveur."""
+    client, session = _client(
+        _response(429, body={}, headers={"Retry-After": "2"}),
+        _response(body={"id": 42}),
+    )
+
+    assert client.chantiers.get(42) == {"id": 42}
+    mock_sleep.assert_called_once_with(2.0)
+
+
+@patch("hub_chantier.client.time.sleep")
+def test_client_raises_rate_limit_after_max_retries(mock_sleep):
+    """Test que RateLimitError est levée une fois les tentatives épuisées."""
+    limited = _response(429, body={}, headers={"X-RateLimit-Reset": "1"})
+    client, session = _client(limited, limited, max_retries=1)
+
+    with pytest.raises(RateLimitError):
+        client.chantiers.get(42)
+    assert session.request.call_count == 2
+
+
+@patch("hub_chantier.client.time.sleep")
+def test_client_does_not_retry_post_on_503(mock_sleep):
+    """Test qu'une création n'est pas rejouée après une erreur serveur."""
+    client, session = _client(_response(503, body={"detail": "indisponible"}))
+
+    with pytest.raises(Exception, match="503"):
+        client.chantiers.create(nom="Villa", adresse="Lyon")
+    assert session.request.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_client_authentication_error():
+    """Test qu'un 401 lève AuthenticationError sans nouvelle tentative."""
+    client, session = _client(_response(401, body={}))
+
+    with pytest.raises(AuthenticationError):
+        client.chantiers.get(1)
+    assert session.request.call_count == 1
+
+
+def test_client_delete_no_content():
+    """Test qu'une réponse 204 sans corps ne provoque pas d'erreur."""
+    client, _ = _client(_response(204))
+
+    assert client.chantiers.delete(42) is None
+
+
+def test_iter_all_pages_lazily():
+    """Test que iter_all enchaîne les pages à la demande."""
+    client, session = _client(
+        _response(body={"items": [{"id": 1}, {"id": 2}], "total": 5}),
+        _response(body={"items": [{"id": 3}, {"id": 4}], "total": 5}),
+        _response(body={"items": [{"id": 5}], "total": 5}),
+    )
+
+    iterator = client.chantiers.iter_all(status="en_cours", page_size=2)
+    assert session.request.call_count == 0
+
+    assert [c["id"] for c in iterator] == [1, 2, 3, 4, 5]
+    offsets = [c.kwargs["params"]["offset"] for c in session.request.call_args_list]
+    assert offsets == [0, 2, 4]
+    assert session.request.call_args.kwargs["params"]["status"] == "en_cours"
+
+
+def test_iter_all_stops_on_total_without_extra_request():
+    """Test qu'aucune page vide n'est demandée quand le total est atteint."""
+    client, session = _client(
+        _response(body={"items": [{"id": 1}, {"id": 2}], "total": 2}),
+    )
+
+    assert len(list(client.chantiers.iter_all(page_size=2))) == 2
+    assert session.request.call_count == 1
+
+
+def test_heures_iter_all_by_date_chunks_lazily():
+    """Test que heures.iter_all charge les tranches de dates à la demande."""
+    client, session = _client(
+        _response(body=[{"id": 1}, {"id": 2}]),
+        _response(body=[{"id": 3}]),
+        _response(body=[]),
+    )
+
+    iterator = client.heures.iter_all("2026-01-01", "2026-01-20", chunk_days=7)
+    assert session.request.call_count == 0
+
+    assert [h["id"] for h in iterator] == [1, 2, 3]
+    debuts = [c.kwargs["params"]["date_debut"] for c in session.request.call_args_list]
+    assert debuts == ["2026-01-01", "2026-01-08", "2026-01-15"]
+    assert session.request.call_args.kwargs["params"]["date_fin"] == "2026-01-20"
+
+
+def test_affectations_iter_all_forwards_user_filter():
+    """Test que le filtre utilisateurs est transmis à chaque tranche."""
+    client, session = _client(
+        _response(body=[{"id": 1}]),
+        _response(body=[{"id": 2}]),
+    )
+
+    affectations = client.affectations.iter_all(
+        "2026-01-01", "2026-01-14", utilisateur_ids=[1, 2]
+    )
+
+    assert [a["id"] for a in affectations] == [1, 2]
+    filtres = [c.kwargs["params"]["utilisateur_ids"] for c in session.request.call_args_list]
+    assert filtres == ["1,2", "1,2"]
+
+
+def test_iter_all_by_date_chunks_stops_early():
+    """Test qu'interrompre l'itération évite de charger les tranches suivantes."""
+    client, session = _client(_response(body=[{"id": 1}, {"id": 2}]))
+
+    iterator = client.heures.iter_all("2026-01-01", "2026-03-31")
+    assert next(iterator) == {"id": 1}
+    assert session.request.call_count == 1
+
+
+def test_iter_all_pages_within_each_date_chunk():
+    """Test qu'une tranche plafonnée par le serveur est lue page par page."""
+    client, session = _client(
+        _response(body={"items": [{"id": 1}, {"id": 2}], "total": 3}),
+        _response(body={"items": [{"id": 3}], "total": 3}),
+        _response(body={"items": [{"id": 4}], "total": 1}),
+    )
+
+    heures = client.heures.iter_all("2026-01-01", "2026-01-14", page_size=2)
+
+    assert [h["id"] for h in heures] == [1, 2, 3, 4]
+    appels = [
+        (c.kwargs["params"]["date_debut"], c.kwargs["params"]["offset"])
+        for c in session.request.call_args_list
+    ]
+    assert appels == [("2026-01-01", 0), ("2026-01-01", 2), ("2026-01-08", 0)]
+
+
+def test_retry_delay_prefers_server_headers():
+    """Test du calcul du délai : Retry-After, X-RateLimit-Reset puis backoff."""
+    assert retry_delay({"Retry-After": "3"}, attempt=0) == 3.0
+    assert retry_delay(
+        {"X-RateLimit-Reset": "1800000010"}, attempt=0, now=lambda: 1800000000.0
+    ) == 10.0
+    assert retry_delay({"X-RateLimit-Reset": "5"}, attempt=0) == 5.0
+    assert retry_delay(
+        {"X-RateLimit-Reset": "2026-01-01T00:00:30Z"},
+        attempt=0,
+        now=lambda: 1767225600.0,
+    ) == 30.0
+    assert 1.0 <= retry_delay({}, attempt=1, backoff_factor=0.5) <= 1.5
+    assert retry_delay({"Retry-After": "3600"}, attempt=0, max_backoff=60) == 60